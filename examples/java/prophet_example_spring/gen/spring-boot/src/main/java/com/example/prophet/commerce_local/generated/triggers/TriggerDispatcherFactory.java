@@ -0,0 +1,92 @@
+package com.example.prophet.commerce_local.generated.triggers;
+
+import javax.annotation.processing.Generated;
+import com.example.prophet.commerce_local.generated.actions.ApproveOrderCommand;
+import com.example.prophet.commerce_local.generated.actions.ShipOrderCommand;
+import com.example.prophet.commerce_local.generated.actions.handlers.ApproveOrderActionHandler;
+import com.example.prophet.commerce_local.generated.actions.handlers.ShipOrderActionHandler;
+import com.example.prophet.commerce_local.generated.actions.services.ApproveOrderActionService;
+import com.example.prophet.commerce_local.generated.actions.services.ShipOrderActionService;
+import com.example.prophet.commerce_local.generated.actions.services.defaults.ApproveOrderActionServiceDefault;
+import com.example.prophet.commerce_local.generated.actions.services.defaults.ShipOrderActionServiceDefault;
+import io.prophet.events.runtime.EventPublisher;
+import io.prophet.events.runtime.TriggerBatchException;
+import io.prophet.events.runtime.TriggerBinding;
+import io.prophet.events.runtime.TriggerDispatcher;
+import io.prophet.events.runtime.TriggerPolicy;
+import java.util.List;
+import java.util.Map;
+import org.springframework.beans.factory.ObjectProvider;
+import org.springframework.stereotype.Component;
+
+/**
+ * Builds a {@link TriggerDispatcher} for the ontology's triggers.
+ *
+ * <p>Triggered actions run through their default action service with the dispatcher as event publisher, so
+ * chains continue in-process; every envelope is also forwarded to {@code downstream}. A failed envelope is
+ * retried on its own; the rest of its batch is not re-run. Register the returned dispatcher as the
+ * {@code @Primary} {@link EventPublisher} bean to start chains from request-driven actions.
+ */
+@Component
+@Generated("prophet-cli")
+public class TriggerDispatcherFactory {
+    public static final Map<String, String> TRIGGER_EVENT_TYPES = Map.ofEntries(
+        Map.entry("onOrderApproved", "OrderApproveTransition"),
+        Map.entry("onPaymentCaptured", "PaymentCaptured")
+    );
+
+    private final ObjectProvider<ShipOrderActionHandler> shipOrderHandlerProvider;
+    private final ObjectProvider<ApproveOrderActionHandler> approveOrderHandlerProvider;
+
+    public TriggerDispatcherFactory(
+        ObjectProvider<ShipOrderActionHandler> shipOrderHandlerProvider,
+        ObjectProvider<ApproveOrderActionHandler> approveOrderHandlerProvider
+    ) {
+        this.shipOrderHandlerProvider = shipOrderHandlerProvider;
+        this.approveOrderHandlerProvider = approveOrderHandlerProvider;
+    }
+
+    public TriggerDispatcher build(TriggerInputMappers inputs, EventPublisher downstream) {
+        return build(inputs, downstream, 4, 10_000, Map.of());
+    }
+
+    public TriggerDispatcher build(
+        TriggerInputMappers inputs,
+        EventPublisher downstream,
+        int concurrency,
+        int maxQueueSize,
+        Map<String, TriggerPolicy> policies
+    ) {
+        List<TriggerBinding> bindings = List.of(
+            new TriggerBinding(
+                "onOrderApproved",
+                TRIGGER_EVENT_TYPES.get("onOrderApproved"),
+                (envelopes, dispatcher) -> {
+                    ShipOrderActionService service = new ShipOrderActionServiceDefault(shipOrderHandlerProvider, dispatcher);
+                    TriggerBatchException.runEach(envelopes, envelope -> {
+                        ShipOrderCommand request = inputs.onOrderApproved(envelope);
+                        if (request != null) {
+                            service.execute(request);
+                        }
+                    });
+                },
+                policies.getOrDefault("onOrderApproved", TriggerPolicy.defaults())
+            ),
+            new TriggerBinding(
+                "onPaymentCaptured",
+                TRIGGER_EVENT_TYPES.get("onPaymentCaptured"),
+                (envelopes, dispatcher) -> {
+                    ApproveOrderActionService service = new ApproveOrderActionServiceDefault(approveOrderHandlerProvider, dispatcher);
+                    TriggerBatchException.runEach(envelopes, envelope -> {
+                        ApproveOrderCommand request = inputs.onPaymentCaptured(envelope);
+                        if (request != null) {
+                            service.execute(request);
+                        }
+                    });
+                },
+                policies.getOrDefault("onPaymentCaptured", TriggerPolicy.defaults())
+            )
+        );
+        return new TriggerDispatcher(bindings, concurrency, maxQueueSize, downstream, null);
+    }
+}
@@ -0,0 +1,16 @@
+package com.example.prophet.commerce_local.generated.triggers;
+
+import javax.annotation.processing.Generated;
+import com.example.prophet.commerce_local.generated.actions.ApproveOrderCommand;
+import com.example.prophet.commerce_local.generated.actions.ShipOrderCommand;
+import io.prophet.events.runtime.EventWireEnvelope;
+
+/**
+ * Builds each triggered action's request from the triggering envelope; returning null skips the envelope.
+ */
+@Generated("prophet-cli")
+public interface TriggerInputMappers {
+    ShipOrderCommand onOrderApproved(EventWireEnvelope envelope);
+
+    ApproveOrderCommand onPaymentCaptured(EventWireEnvelope envelope);
+}
@@ -173,6 +173,19 @@ class OrderMongooseRepository implements Persistence.OrderRepository {
     return row ? orderDocumentToDomain(row) : null;
   }
 
+  async getByIds(ids: Persistence.OrderId[]): Promise<(Domain.Order | null)[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    const rows = await this.model.find({ orderId: { $in: ids.map((id) => id.orderId) } }).lean().exec();
+    const found = new Map<string, Domain.Order>();
+    for (const row of rows) {
+      const item = orderDocumentToDomain(row);
+      found.set(JSON.stringify(orderPrimaryFilter(orderIdFromDomain(item))), item);
+    }
+    return ids.map((id) => found.get(JSON.stringify(orderPrimaryFilter(id))) ?? null);
+  }
+
   async query(filter: Filters.OrderQueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.Order>> {
     const normalized = normalizePage(page, size);
     const where = orderWhere(filter);
@@ -197,6 +210,23 @@ class OrderMongooseRepository implements Persistence.OrderRepository {
     return orderDocumentToDomain(persisted);
   }
 
+  async saveMany(items: Domain.Order[]): Promise<Domain.Order[]> {
+    if (items.length === 0) {
+      return [];
+    }
+    await this.model.bulkWrite(
+      items.map((item) => ({
+        updateOne: {
+          filter: orderPrimaryFilter(orderIdFromDomain(item)),
+          update: { $set: orderDomainToDocument(item) },
+          upsert: true,
+        },
+      })),
+      { ordered: false },
+    );
+    return items;
+  }
+
   async applyTransition(
     id: Persistence.OrderId,
     expectedState: Domain.OrderState,
@@ -223,6 +253,47 @@ class OrderMongooseRepository implements Persistence.OrderRepository {
     });
     return orderDocumentToDomain(persisted);
   }
+
+  async applyTransitionMany(
+    ids: Persistence.OrderId[],
+    expectedState: Domain.OrderState,
+    nextState: Domain.OrderState,
+    transitionId: string,
+  ): Promise<Domain.Order[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    const candidates = await this.model
+      .find({ $or: ids.map(orderPrimaryFilter), __prophet_state: expectedState })
+      .lean()
+      .exec();
+    if (candidates.length === 0) {
+      return [];
+    }
+    const candidateIds = candidates.map((row: any) => row._id);
+    const updateResult = await this.model
+      .updateMany({ _id: { $in: candidateIds }, __prophet_state: expectedState }, { $set: { __prophet_state: nextState } })
+      .exec();
+    let rows: any[] = candidates.map((row: any) => ({ ...row, __prophet_state: nextState }));
+    if (updateResult.modifiedCount !== candidates.length) {
+      // A concurrent writer moved some rows first; keep only those that now carry the next state.
+      rows = await this.model.find({ _id: { $in: candidateIds }, __prophet_state: nextState }).lean().exec();
+    }
+    const transitioned = rows.map((row: any) => orderDocumentToDomain(row));
+    if (transitioned.length > 0) {
+      const occurredAt = new Date().toISOString();
+      await this.historyModel.insertMany(
+        transitioned.map((item) => ({
+          ...orderIdFromDomain(item),
+          transitionId,
+          fromState: expectedState,
+          toState: nextState,
+          occurredAt,
+        })),
+      );
+    }
+    return transitioned;
+  }
 }
 
 function userWhere(filter: Filters.UserQueryFilter | undefined): FilterQuery<UserDocument> {
@@ -295,6 +366,19 @@ class UserMongooseRepository implements Persistence.UserRepository {
     return row ? userDocumentToDomain(row) : null;
   }
 
+  async getByIds(ids: Persistence.UserId[]): Promise<(Domain.User | null)[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    const rows = await this.model.find({ userId: { $in: ids.map((id) => id.userId) } }).lean().exec();
+    const found = new Map<string, Domain.User>();
+    for (const row of rows) {
+      const item = userDocumentToDomain(row);
+      found.set(JSON.stringify(userPrimaryFilter(userIdFromDomain(item))), item);
+    }
+    return ids.map((id) => found.get(JSON.stringify(userPrimaryFilter(id))) ?? null);
+  }
+
   async query(filter: Filters.UserQueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.User>> {
     const normalized = normalizePage(page, size);
     const where = userWhere(filter);
@@ -318,4 +402,21 @@ class UserMongooseRepository implements Persistence.UserRepository {
     if (!persisted) return userDocumentToDomain(payload);
     return userDocumentToDomain(persisted);
   }
+
+  async saveMany(items: Domain.User[]): Promise<Domain.User[]> {
+    if (items.length === 0) {
+      return [];
+    }
+    await this.model.bulkWrite(
+      items.map((item) => ({
+        updateOne: {
+          filter: userPrimaryFilter(userIdFromDomain(item)),
+          update: { $set: userDomainToDocument(item) },
+          upsert: true,
+        },
+      })),
+      { ordered: false },
+    );
+    return items;
+  }
 }
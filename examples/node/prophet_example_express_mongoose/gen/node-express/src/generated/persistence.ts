@@ -18,14 +18,22 @@ export interface OrderId {
 export interface OrderRepository {
   list(page: number, size: number): Promise<Page<Domain.Order>>;
   getById(id: OrderId): Promise<Domain.Order | null>;
+  getByIds(ids: OrderId[]): Promise<(Domain.Order | null)[]>;
   query(filter: Filters.OrderQueryFilter, page: number, size: number): Promise<Page<Domain.Order>>;
   save(item: Domain.Order): Promise<Domain.Order>;
+  saveMany(items: Domain.Order[]): Promise<Domain.Order[]>;
   applyTransition(
     id: OrderId,
     expectedState: Domain.OrderState,
     nextState: Domain.OrderState,
     transitionId: string,
   ): Promise<Domain.Order | null>;
+  applyTransitionMany(
+    ids: OrderId[],
+    expectedState: Domain.OrderState,
+    nextState: Domain.OrderState,
+    transitionId: string,
+  ): Promise<Domain.Order[]>;
 }
 
 export interface UserId {
@@ -35,8 +43,10 @@ export interface UserId {
 export interface UserRepository {
   list(page: number, size: number): Promise<Page<Domain.User>>;
   getById(id: UserId): Promise<Domain.User | null>;
+  getByIds(ids: UserId[]): Promise<(Domain.User | null)[]>;
   query(filter: Filters.UserQueryFilter, page: number, size: number): Promise<Page<Domain.User>>;
   save(item: Domain.User): Promise<Domain.User>;
+  saveMany(items: Domain.User[]): Promise<Domain.User[]>;
 }
 
 export interface Repositories {
@@ -0,0 +1,100 @@
+// Code generated by prophet-cli. DO NOT EDIT.
+
+import {
+  TriggerBatchError,
+  TriggerDispatcher,
+  type EventPublisher,
+  type EventWireEnvelope,
+  type TriggerFailure,
+  type TriggerPolicy,
+} from '@prophet-ontology/events-runtime';
+import type * as Actions from './actions.js';
+import type { ActionContext, ActionHandlers } from './action-handlers.js';
+import { ActionExecutionService } from './action-service.js';
+
+export const TRIGGER_EVENT_TYPES = {
+  onOrderApproved: 'OrderApproveTransition',
+  onPaymentCaptured: 'PaymentCaptured',
+} as const;
+
+export type TriggerName = keyof typeof TRIGGER_EVENT_TYPES;
+
+// Builds each triggered action's input from the triggering envelope; returning null or undefined skips it.
+export interface TriggerInputMappers {
+  onOrderApproved(envelope: EventWireEnvelope): Actions.ShipOrderCommand | null | undefined;
+  onPaymentCaptured(envelope: EventWireEnvelope): Actions.ApproveOrderCommand | null | undefined;
+}
+
+export interface TriggerDispatcherOptions {
+  concurrency?: number;
+  maxQueueSize?: number;
+  policies?: Partial<Record<TriggerName, TriggerPolicy>>;
+  downstream?: EventPublisher;
+}
+
+async function runEach(envelopes: EventWireEnvelope[], run: (envelope: EventWireEnvelope) => Promise<void>): Promise<void> {
+  const failures: TriggerFailure[] = [];
+  for (const envelope of envelopes) {
+    try {
+      await run(envelope);
+    } catch (error) {
+      failures.push({ envelope, error });
+    }
+  }
+  if (failures.length > 0) {
+    throw new TriggerBatchError(failures);
+  }
+}
+
+// Triggered actions publish through the dispatcher, so chains continue in-process and keep the
+// triggering trace id; every envelope is also forwarded to `downstream` (default: context.eventPublisher).
+// A failed envelope is retried on its own; the rest of its batch is not re-run.
+// Pass the returned dispatcher as MountDependencies.eventPublisher to start chains from requests.
+export function buildTriggerDispatcher(
+  handlers: ActionHandlers,
+  context: ActionContext,
+  inputs: TriggerInputMappers,
+  options: TriggerDispatcherOptions = {},
+): TriggerDispatcher {
+  const policies = options.policies ?? {};
+  const dispatcher = new TriggerDispatcher(
+    [
+      {
+        name: 'onOrderApproved',
+        eventType: TRIGGER_EVENT_TYPES.onOrderApproved,
+        invoke: (envelopes) =>
+          runEach(envelopes, async (envelope) => {
+            const input = inputs.onOrderApproved(envelope);
+            if (input != null) {
+              await service.shipOrder(input, triggerContext(envelope));
+            }
+          }),
+        policy: policies.onOrderApproved,
+      },
+      {
+        name: 'onPaymentCaptured',
+        eventType: TRIGGER_EVENT_TYPES.onPaymentCaptured,
+        invoke: (envelopes) =>
+          runEach(envelopes, async (envelope) => {
+            const input = inputs.onPaymentCaptured(envelope);
+            if (input != null) {
+              await service.approveOrder(input, triggerContext(envelope));
+            }
+          }),
+        policy: policies.onPaymentCaptured,
+      },
+    ],
+    {
+      concurrency: options.concurrency,
+      maxQueueSize: options.maxQueueSize,
+      downstream: options.downstream ?? context.eventPublisher,
+    },
+  );
+  const service = new ActionExecutionService(handlers, dispatcher);
+  const triggerContext = (envelope: EventWireEnvelope): ActionContext => ({
+    ...context,
+    eventPublisher: dispatcher,
+    traceId: envelope.trace_id,
+  });
+  return dispatcher;
+}
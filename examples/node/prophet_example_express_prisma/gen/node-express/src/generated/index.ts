@@ -34,3 +34,5 @@ export function mountProphet(app: Application, deps: MountDependencies): void {
 
 export { TransitionServices } from './transitions.js';
 export type { TransitionHandlers, TransitionValidators } from './transitions.js';
+export { BatchLoader, IdentityMapRepositories, createRepositoryLoaders } from './loaders.js';
+export type { RepositoryLoaders } from './loaders.js';
@@ -0,0 +1,219 @@
+// Code generated by prophet-cli. DO NOT EDIT.
+
+import type * as Domain from './domain.js';
+import type * as Persistence from './persistence.js';
+
+export class BatchLoader<K, V> {
+  private readonly promises = new Map<string, Promise<V | null>>();
+  private pending: Array<{ key: string; ref: K; resolve: (value: V | null) => void; reject: (error: unknown) => void }> = [];
+
+  constructor(
+    private readonly batchFn: (refs: K[]) => Promise<(V | null)[]>,
+    private readonly keyFn: (ref: K) => string,
+  ) {}
+
+  load(ref: K): Promise<V | null> {
+    const key = this.keyFn(ref);
+    const existing = this.promises.get(key);
+    if (existing) {
+      return existing;
+    }
+    const promise = new Promise<V | null>((resolve, reject) => {
+      if (this.pending.length === 0) {
+        Promise.resolve().then(() => process.nextTick(() => void this.dispatch()));
+      }
+      this.pending.push({ key, ref, resolve, reject });
+    });
+    this.promises.set(key, promise);
+    return promise;
+  }
+
+  loadMany(refs: K[]): Promise<(V | null)[]> {
+    return Promise.all(refs.map((ref) => this.load(ref)));
+  }
+
+  prime(ref: K, value: V | null): void {
+    const key = this.keyFn(ref);
+    if (!this.promises.has(key)) {
+      this.promises.set(key, Promise.resolve(value));
+    }
+  }
+
+  clear(ref: K): void {
+    this.promises.delete(this.keyFn(ref));
+  }
+
+  clearAll(): void {
+    this.promises.clear();
+  }
+
+  private async dispatch(): Promise<void> {
+    const batch = this.pending;
+    this.pending = [];
+    try {
+      const values = await this.batchFn(batch.map((entry) => entry.ref));
+      batch.forEach((entry, index) => entry.resolve(values[index] ?? null));
+    } catch (error) {
+      for (const entry of batch) {
+        this.promises.delete(entry.key);
+        entry.reject(error);
+      }
+    }
+  }
+}
+
+interface CachedRepository<K, V> {
+  getById(id: K): Promise<V | null>;
+  getByIds(ids: K[]): Promise<(V | null)[]>;
+  save(item: V): Promise<V>;
+  saveMany(items: V[]): Promise<V[]>;
+}
+
+export class IdentityMapRepository<K, V, R extends CachedRepository<K, V>> {
+  protected readonly entries = new Map<string, V | null>();
+
+  constructor(
+    protected readonly repository: R,
+    protected readonly keyFn: (ref: K | V) => string,
+  ) {}
+
+  async getById(id: K): Promise<V | null> {
+    const key = this.keyFn(id);
+    if (!this.entries.has(key)) {
+      this.entries.set(key, await this.repository.getById(id));
+    }
+    return this.entries.get(key) ?? null;
+  }
+
+  async getByIds(ids: K[]): Promise<(V | null)[]> {
+    const missing = new Map<string, K>();
+    for (const id of ids) {
+      const key = this.keyFn(id);
+      if (!this.entries.has(key) && !missing.has(key)) {
+        missing.set(key, id);
+      }
+    }
+    if (missing.size > 0) {
+      const values = await this.repository.getByIds([...missing.values()]);
+      [...missing.keys()].forEach((key, index) => this.entries.set(key, values[index] ?? null));
+    }
+    return ids.map((id) => this.entries.get(this.keyFn(id)) ?? null);
+  }
+
+  async save(item: V): Promise<V> {
+    const saved = await this.repository.save(item);
+    this.entries.set(this.keyFn(saved), saved);
+    return saved;
+  }
+
+  async saveMany(items: V[]): Promise<V[]> {
+    const saved = await this.repository.saveMany(items);
+    for (const item of saved) {
+      this.entries.set(this.keyFn(item), item);
+    }
+    return saved;
+  }
+
+  clear(ref: K): void {
+    this.entries.delete(this.keyFn(ref));
+  }
+
+  clearAll(): void {
+    this.entries.clear();
+  }
+}
+
+export interface RepositoryLoaders {
+  order: BatchLoader<Persistence.OrderId, Domain.Order>;
+  user: BatchLoader<Persistence.UserId, Domain.User>;
+}
+
+export function createRepositoryLoaders(repositories: Persistence.Repositories): RepositoryLoaders {
+  return {
+    order: new BatchLoader(
+      (ids) => repositories.order.getByIds(ids),
+      (id) => JSON.stringify([id.orderId]),
+    ),
+    user: new BatchLoader(
+      (ids) => repositories.user.getByIds(ids),
+      (id) => JSON.stringify([id.userId]),
+    ),
+  };
+}
+
+export class OrderIdentityMapRepository
+  extends IdentityMapRepository<Persistence.OrderId, Domain.Order, Persistence.OrderRepository>
+  implements Persistence.OrderRepository
+{
+  constructor(repository: Persistence.OrderRepository) {
+    super(repository, (id) => JSON.stringify([id.orderId]));
+  }
+
+  list(...args: Parameters<Persistence.OrderRepository['list']>): ReturnType<Persistence.OrderRepository['list']> {
+    return this.repository.list(...args);
+  }
+
+  query(...args: Parameters<Persistence.OrderRepository['query']>): ReturnType<Persistence.OrderRepository['query']> {
+    return this.repository.query(...args);
+  }
+
+  async applyTransition(
+    id: Persistence.OrderId,
+    expectedState: Domain.OrderState,
+    nextState: Domain.OrderState,
+    transitionId: string,
+  ): Promise<Domain.Order | null> {
+    this.clear(id);
+    const transitioned = await this.repository.applyTransition(id, expectedState, nextState, transitionId);
+    if (transitioned) {
+      this.entries.set(this.keyFn(transitioned), transitioned);
+    }
+    return transitioned;
+  }
+
+  async applyTransitionMany(
+    ids: Persistence.OrderId[],
+    expectedState: Domain.OrderState,
+    nextState: Domain.OrderState,
+    transitionId: string,
+  ): Promise<Domain.Order[]> {
+    ids.forEach((id) => this.clear(id));
+    const transitioned = await this.repository.applyTransitionMany(ids, expectedState, nextState, transitionId);
+    for (const item of transitioned) {
+      this.entries.set(this.keyFn(item), item);
+    }
+    return transitioned;
+  }
+}
+
+export class UserIdentityMapRepository
+  extends IdentityMapRepository<Persistence.UserId, Domain.User, Persistence.UserRepository>
+  implements Persistence.UserRepository
+{
+  constructor(repository: Persistence.UserRepository) {
+    super(repository, (id) => JSON.stringify([id.userId]));
+  }
+
+  list(...args: Parameters<Persistence.UserRepository['list']>): ReturnType<Persistence.UserRepository['list']> {
+    return this.repository.list(...args);
+  }
+
+  query(...args: Parameters<Persistence.UserRepository['query']>): ReturnType<Persistence.UserRepository['query']> {
+    return this.repository.query(...args);
+  }
+}
+
+export class IdentityMapRepositories implements Persistence.Repositories {
+  readonly order: OrderIdentityMapRepository;
+  readonly user: UserIdentityMapRepository;
+
+  constructor(repositories: Persistence.Repositories) {
+    this.order = new OrderIdentityMapRepository(repositories.order);
+    this.user = new UserIdentityMapRepository(repositories.user);
+  }
+
+  clearAll(): void {
+    this.order.clearAll();
+    this.user.clearAll();
+  }
+}
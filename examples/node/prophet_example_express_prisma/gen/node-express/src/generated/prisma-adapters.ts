@@ -5,6 +5,8 @@ import type * as Domain from './domain.js';
 import type * as Filters from './query.js';
 import type * as Persistence from './persistence.js';
 
+const SAVE_MANY_CHUNK_SIZE = 500;
+
 function normalizePage(page: number, size: number): { page: number; size: number } {
   const normalizedPage = Number.isFinite(page) && page >= 0 ? Math.trunc(page) : 0;
   const normalizedSize = Number.isFinite(size) && size > 0 ? Math.trunc(size) : 20;
@@ -104,6 +106,10 @@ function orderPrimaryWhere(id: Persistence.OrderId): any {
   };
 }
 
+function orderRowKey(row: any): string {
+  return JSON.stringify([row.order_id]);
+}
+
 function orderRowToDomain(row: any): Domain.Order {
   return {
     orderId: row.order_id,
@@ -175,6 +181,19 @@ class OrderPrismaRepository implements Persistence.OrderRepository {
     return row ? orderRowToDomain(row) : null;
   }
 
+  async getByIds(ids: Persistence.OrderId[]): Promise<(Domain.Order | null)[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    const rows = await this.delegate.findMany({ where: { order_id: { in: ids.map((id) => id.orderId) } } });
+    const found = new Map<string, Domain.Order>();
+    for (const row of rows) {
+      const item = orderRowToDomain(row);
+      found.set(JSON.stringify(orderPrimaryWhere(orderIdFromDomain(item))), item);
+    }
+    return ids.map((id) => found.get(JSON.stringify(orderPrimaryWhere(id))) ?? null);
+  }
+
   async query(filter: Filters.OrderQueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.Order>> {
     const normalized = normalizePage(page, size);
     const where = orderWhere(filter);
@@ -204,6 +223,34 @@ class OrderPrismaRepository implements Persistence.OrderRepository {
     return orderRowToDomain(persisted);
   }
 
+  async saveMany(items: Domain.Order[]): Promise<Domain.Order[]> {
+    const persisted: Domain.Order[] = [];
+    for (let start = 0; start < items.length; start += SAVE_MANY_CHUNK_SIZE) {
+      const chunk = items.slice(start, start + SAVE_MANY_CHUNK_SIZE);
+      const existing = await this.delegate.findMany({
+        where: { OR: chunk.map((item) => orderPrimaryWhere(orderIdFromDomain(item))) },
+        select: { order_id: true },
+      });
+      const existingKeys = new Set(existing.map(orderRowKey));
+      const created: Domain.Order[] = [];
+      const writes: any[] = [];
+      for (const item of chunk) {
+        const payload = orderDomainToRow(item);
+        if (existingKeys.has(orderRowKey(payload))) {
+          writes.push(this.delegate.update({ where: orderUniqueWhere(orderIdFromDomain(item)), data: payload }));
+        } else {
+          created.push(item);
+        }
+        persisted.push(orderRowToDomain(payload));
+      }
+      if (created.length > 0) {
+        writes.unshift(this.delegate.createMany({ data: created.map(orderDomainToRow) }));
+      }
+      await this.client.$transaction(writes);
+    }
+    return persisted;
+  }
+
   async applyTransition(
     id: Persistence.OrderId,
     expectedState: Domain.OrderState,
@@ -236,6 +283,42 @@ class OrderPrismaRepository implements Persistence.OrderRepository {
     });
     return persisted ? orderRowToDomain(persisted) : null;
   }
+
+  async applyTransitionMany(
+    ids: Persistence.OrderId[],
+    expectedState: Domain.OrderState,
+    nextState: Domain.OrderState,
+    transitionId: string,
+  ): Promise<Domain.Order[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    const persisted = await this.client.$transaction(async (tx) => {
+      const objDelegate = (tx as any).order;
+      const rows = await objDelegate.findMany({ where: { OR: ids.map(orderPrimaryWhere), state: expectedState } });
+      if (rows.length === 0) {
+        return [];
+      }
+      const matched = rows.map((row: any) => orderPrimaryWhere(orderIdFromDomain(orderRowToDomain(row))));
+      const updateResult = await objDelegate.updateMany({
+        where: { OR: matched, state: expectedState },
+        data: { state: nextState },
+      });
+      if (Number(updateResult?.count ?? 0) !== rows.length) {
+        throw new Error('Order transition conflict: rows changed state concurrently');
+      }
+      await (tx as any).orderStateHistory.createMany({
+        data: matched.map((primaryWhere: any) => ({
+          ...primaryWhere,
+          transition_id: transitionId,
+          from_state: expectedState,
+          to_state: nextState,
+        })),
+      });
+      return rows.map((row: any) => ({ ...row, state: nextState }));
+    });
+    return persisted.map(orderRowToDomain);
+  }
 }
 
 function userWhere(filter: Filters.UserQueryFilter | undefined): any {
@@ -269,6 +352,10 @@ function userPrimaryWhere(id: Persistence.UserId): any {
   };
 }
 
+function userRowKey(row: any): string {
+  return JSON.stringify([row.user_id]);
+}
+
 function userRowToDomain(row: any): Domain.User {
   return {
     userId: row.user_id,
@@ -316,6 +403,19 @@ class UserPrismaRepository implements Persistence.UserRepository {
     return row ? userRowToDomain(row) : null;
   }
 
+  async getByIds(ids: Persistence.UserId[]): Promise<(Domain.User | null)[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    const rows = await this.delegate.findMany({ where: { user_id: { in: ids.map((id) => id.userId) } } });
+    const found = new Map<string, Domain.User>();
+    for (const row of rows) {
+      const item = userRowToDomain(row);
+      found.set(JSON.stringify(userPrimaryWhere(userIdFromDomain(item))), item);
+    }
+    return ids.map((id) => found.get(JSON.stringify(userPrimaryWhere(id))) ?? null);
+  }
+
   async query(filter: Filters.UserQueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.User>> {
     const normalized = normalizePage(page, size);
     const where = userWhere(filter);
@@ -344,4 +444,32 @@ class UserPrismaRepository implements Persistence.UserRepository {
     const persisted = await this.delegate.upsert({ where: userUniqueWhere(userIdFromDomain(item)), create: payload, update: payload });
     return userRowToDomain(persisted);
   }
+
+  async saveMany(items: Domain.User[]): Promise<Domain.User[]> {
+    const persisted: Domain.User[] = [];
+    for (let start = 0; start < items.length; start += SAVE_MANY_CHUNK_SIZE) {
+      const chunk = items.slice(start, start + SAVE_MANY_CHUNK_SIZE);
+      const existing = await this.delegate.findMany({
+        where: { OR: chunk.map((item) => userPrimaryWhere(userIdFromDomain(item))) },
+        select: { user_id: true },
+      });
+      const existingKeys = new Set(existing.map(userRowKey));
+      const created: Domain.User[] = [];
+      const writes: any[] = [];
+      for (const item of chunk) {
+        const payload = userDomainToRow(item);
+        if (existingKeys.has(userRowKey(payload))) {
+          writes.push(this.delegate.update({ where: userUniqueWhere(userIdFromDomain(item)), data: payload }));
+        } else {
+          created.push(item);
+        }
+        persisted.push(userRowToDomain(payload));
+      }
+      if (created.length > 0) {
+        writes.unshift(this.delegate.createMany({ data: created.map(userDomainToRow) }));
+      }
+      await this.client.$transaction(writes);
+    }
+    return persisted;
+  }
 }
@@ -1,6 +1,6 @@
 // Code generated by prophet-cli. DO NOT EDIT.
 
-import { DataSource, type Repository, type SelectQueryBuilder } from 'typeorm';
+import { DataSource, In, type Repository, type SelectQueryBuilder } from 'typeorm';
 import type * as Domain from './domain.js';
 import type * as Filters from './query.js';
 import type * as Persistence from './persistence.js';
@@ -159,6 +159,19 @@ class OrderTypeOrmRepository implements Persistence.OrderRepository {
     return row ? orderEntityToDomain(row) : null;
   }
 
+  async getByIds(ids: Persistence.OrderId[]): Promise<(Domain.Order | null)[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    const rows = await this.repo.findBy({ orderId: In(ids.map((id) => id.orderId)) } as any);
+    const found = new Map<string, Domain.Order>();
+    for (const row of rows) {
+      const item = orderEntityToDomain(row);
+      found.set(JSON.stringify(orderPrimaryWhere(item as unknown as Persistence.OrderId)), item);
+    }
+    return ids.map((id) => found.get(JSON.stringify(orderPrimaryWhere(id))) ?? null);
+  }
+
   async query(filter: Filters.OrderQueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.Order>> {
     const normalized = normalizePage(page, size);
     const qb = this.repo.createQueryBuilder('record');
@@ -181,6 +194,20 @@ class OrderTypeOrmRepository implements Persistence.OrderRepository {
     return orderEntityToDomain(saved);
   }
 
+  async saveMany(items: Domain.Order[]): Promise<Domain.Order[]> {
+    if (items.length === 0) {
+      return [];
+    }
+    const entities = items.map((item) => orderDomainToEntity(item));
+    if (this.dataSource.driver.supportedUpsertTypes.length === 0) {
+      await this.repo.save(entities as any[], { chunk: 500 });
+    } else {
+      const conflictPaths = this.repo.metadata.primaryColumns.map((column) => column.propertyPath);
+      await this.repo.upsert(entities as any[], conflictPaths);
+    }
+    return items;
+  }
+
   async applyTransition(
     id: Persistence.OrderId,
     expectedState: Domain.OrderState,
@@ -210,6 +237,43 @@ class OrderTypeOrmRepository implements Persistence.OrderRepository {
     await this.historyRepo.save(history as any);
     return orderEntityToDomain(updated);
   }
+
+  async applyTransitionMany(
+    ids: Persistence.OrderId[],
+    expectedState: Domain.OrderState,
+    nextState: Domain.OrderState,
+    transitionId: string,
+  ): Promise<Domain.Order[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    return this.dataSource.transaction(async (manager) => {
+      const repo = manager.getRepository(OrderEntity);
+      const rows = await repo.find({ where: ids.map((id) => ({ ...orderPrimaryWhere(id), state: expectedState })) as any });
+      if (rows.length === 0) {
+        return [];
+      }
+      const matched = rows.map((row) => repo.metadata.getEntityIdMap(row) as Record<string, unknown>);
+      const transitionResult = await repo
+        .createQueryBuilder()
+        .update(OrderEntity)
+        .set({ state: nextState as string } as any)
+        .where(matched.map((key) => ({ ...key, state: expectedState })) as any)
+        .execute();
+      if (Number(transitionResult.affected ?? rows.length) !== rows.length) {
+        throw new Error('Order transition conflict: rows changed state concurrently');
+      }
+      await manager.getRepository(OrderStateHistoryEntity).insert(
+        matched.map((key) => ({
+          ...key,
+          transitionId,
+          fromState: expectedState,
+          toState: nextState,
+        })) as any[],
+      );
+      return rows.map((row) => orderEntityToDomain({ ...row, state: nextState }));
+    });
+  }
 }
 
 function userEntityToDomain(entity: any): Domain.User {
@@ -275,6 +339,19 @@ class UserTypeOrmRepository implements Persistence.UserRepository {
     return row ? userEntityToDomain(row) : null;
   }
 
+  async getByIds(ids: Persistence.UserId[]): Promise<(Domain.User | null)[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    const rows = await this.repo.findBy({ userId: In(ids.map((id) => id.userId)) } as any);
+    const found = new Map<string, Domain.User>();
+    for (const row of rows) {
+      const item = userEntityToDomain(row);
+      found.set(JSON.stringify(userPrimaryWhere(item as unknown as Persistence.UserId)), item);
+    }
+    return ids.map((id) => found.get(JSON.stringify(userPrimaryWhere(id))) ?? null);
+  }
+
   async query(filter: Filters.UserQueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.User>> {
     const normalized = normalizePage(page, size);
     const qb = this.repo.createQueryBuilder('record');
@@ -296,4 +373,18 @@ class UserTypeOrmRepository implements Persistence.UserRepository {
     const saved = await this.repo.save(entity as any);
     return userEntityToDomain(saved);
   }
+
+  async saveMany(items: Domain.User[]): Promise<Domain.User[]> {
+    if (items.length === 0) {
+      return [];
+    }
+    const entities = items.map((item) => userDomainToEntity(item));
+    if (this.dataSource.driver.supportedUpsertTypes.length === 0) {
+      await this.repo.save(entities as any[], { chunk: 500 });
+    } else {
+      const conflictPaths = this.repo.metadata.primaryColumns.map((column) => column.propertyPath);
+      await this.repo.upsert(entities as any[], conflictPaths);
+    }
+    return items;
+  }
 }
@@ -3,13 +3,18 @@ from __future__ import annotations
 
 import dataclasses
 
-from typing import Optional
+from typing import List, Optional, Union
+
+from django.db import connections, router, transaction
+from django.db.models import Q
 
 from . import django_models as Models
 from . import domain as Domain
 from . import persistence as Persistence
 from . import query as Filters
 
+_SAVE_MANY_CHUNK_SIZE = 500
+
 def _serialize(value):
     if dataclasses.is_dataclass(value):
         return dataclasses.asdict(value)
@@ -17,6 +22,27 @@ def _serialize(value):
         return [_serialize(item) for item in value]
     return value
 
+def _update_state_returning(model, lookups: List[dict], expected_state: str, next_state: str) -> tuple:
+    alias = router.db_for_write(model)
+    connection = connections[alias]
+    if connection.vendor not in ('postgresql', 'sqlite') or not connection.features.can_return_columns_from_insert:
+        return False, []
+    meta = model._meta
+    quote = connection.ops.quote_name
+    state_column = quote(meta.get_field('state').column)
+    key_conditions = []
+    params = [next_state]
+    for lookup in lookups:
+        key_conditions.append('(' + ' AND '.join(f'{quote(meta.get_field(name).column)} = %s' for name in lookup) + ')')
+        params.extend(lookup.values())
+    params.append(expected_state)
+    returning = ', '.join(quote(field.column) for field in meta.concrete_fields)
+    sql = (
+        f'UPDATE {quote(meta.db_table)} SET {state_column} = %s '
+        f"WHERE ({' OR '.join(key_conditions)}) AND {state_column} = %s RETURNING {returning}"
+    )
+    return True, list(model.objects.db_manager(alias).raw(sql, params))
+
 def _order_payload(item: Domain.Order) -> dict:
     return {
         'orderId': _serialize(item.orderId),
@@ -181,21 +207,59 @@ class OrderDjangoRepository:
             return None
         return _order_to_domain(row)
 
+    def get_by_ids(self, ids: List[Domain.OrderRef]) -> List[Optional[Domain.Order]]:
+        if not ids:
+            return []
+        rows = self._model.objects.filter(orderId__in=[id.orderId for id in ids])
+        found = {(row.orderId,): _order_to_domain(row) for row in rows}
+        return [found.get((id.orderId,)) for id in ids]
+
+    def _bulk_upsert(self, records: List[Models.OrderModel]) -> bool:
+        features = connections[router.db_for_write(self._model)].features
+        if not features.supports_update_conflicts:
+            return False
+        self._model.objects.bulk_create(
+            records,
+            batch_size=_SAVE_MANY_CHUNK_SIZE,
+            update_conflicts=True,
+            unique_fields=['orderId'] if features.supports_update_conflicts_with_target else None,
+            update_fields=['customer', 'totalAmount', 'discountCode', 'tags', 'shippingAddress', 'approvedByUserId', 'approvalNotes', 'approvalReason', 'shippingCarrier', 'shippingTrackingNumber', 'shippingPackageIds', 'state'],
+        )
+        return True
+
     def save(self, item: Domain.Order) -> Domain.Order:
         payload = _order_payload(item)
+        if self._bulk_upsert([self._model(**payload)]):
+            return item
         lookup = {
             'orderId': payload['orderId'],
         }
         self._model.objects.update_or_create(defaults=payload, **lookup)
         return item
 
-    def apply_transition(self, id: Domain.OrderRef, expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> Optional[Domain.Order]:
+    def save_many(self, items: List[Domain.Order]) -> List[Domain.Order]:
+        if not items:
+            return []
+        records = [self._model(**_order_payload(item)) for item in items]
+        if not self._bulk_upsert(records):
+            with transaction.atomic(using=router.db_for_write(self._model)):
+                for item in items:
+                    self.save(item)
+        return list(items)
+
+    def apply_transition(self, id: Domain.OrderRef, expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> Union[Domain.Order, Persistence.TransitionRejected]:
         lookup = {
             'orderId': id.orderId,
         }
-        updated = self._model.objects.filter(**lookup, state=expected_state).update(state=next_state)
-        if int(updated or 0) < 1:
-            return None
+        returned, records = _update_state_returning(self._model, [lookup], expected_state, next_state)
+        if returned:
+            applied = bool(records)
+        else:
+            updated = self._model.objects.filter(**lookup, state=expected_state).update(state=next_state)
+            applied = int(updated or 0) > 0
+        if not applied:
+            current_state = self._model.objects.filter(**lookup).values_list('state', flat=True).first()
+            return Persistence.TransitionRejected(current_state=current_state)
         history_payload = {
             'orderId': id.orderId,
             'transitionId': transition_id,
@@ -203,11 +267,41 @@ class OrderDjangoRepository:
             'toState': next_state,
         }
         Models.OrderStateHistoryModel.objects.create(**history_payload)
+        if records:
+            return _order_to_domain(records[0])
         row = self._model.objects.filter(**lookup).first()
         if row is None:
-            return None
+            return Persistence.TransitionRejected()
         return _order_to_domain(row)
 
+    def apply_transition_many(self, ids: List[Domain.OrderRef], expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> List[Domain.Order]:
+        if not ids:
+            return []
+        lookups = [{'orderId': id.orderId} for id in ids]
+        returned, records = _update_state_returning(self._model, lookups, expected_state, next_state)
+        if not returned:
+            key_condition = Q()
+            for lookup in lookups:
+                key_condition |= Q(**lookup)
+            with transaction.atomic(using=router.db_for_write(self._model)):
+                records = list(self._model.objects.select_for_update().filter(key_condition, state=expected_state))
+                if records:
+                    self._model.objects.filter(pk__in=[record.pk for record in records], state=expected_state).update(state=next_state)
+            for record in records:
+                record.state = next_state
+        Models.OrderStateHistoryModel.objects.bulk_create(
+            [
+                Models.OrderStateHistoryModel(
+                    orderId=record.orderId,
+                    transitionId=transition_id,
+                    fromState=expected_state,
+                    toState=next_state,
+                )
+                for record in records
+            ]
+        )
+        return [_order_to_domain(record) for record in records]
+
 def _user_payload(item: Domain.User) -> dict:
     return {
         'userId': _serialize(item.userId),
@@ -273,14 +367,46 @@ class UserDjangoRepository:
             return None
         return _user_to_domain(row)
 
+    def get_by_ids(self, ids: List[Domain.UserRef]) -> List[Optional[Domain.User]]:
+        if not ids:
+            return []
+        rows = self._model.objects.filter(userId__in=[id.userId for id in ids])
+        found = {(row.userId,): _user_to_domain(row) for row in rows}
+        return [found.get((id.userId,)) for id in ids]
+
+    def _bulk_upsert(self, records: List[Models.UserModel]) -> bool:
+        features = connections[router.db_for_write(self._model)].features
+        if not features.supports_update_conflicts:
+            return False
+        self._model.objects.bulk_create(
+            records,
+            batch_size=_SAVE_MANY_CHUNK_SIZE,
+            update_conflicts=True,
+            unique_fields=['userId'] if features.supports_update_conflicts_with_target else None,
+            update_fields=['email'],
+        )
+        return True
+
     def save(self, item: Domain.User) -> Domain.User:
         payload = _user_payload(item)
+        if self._bulk_upsert([self._model(**payload)]):
+            return item
         lookup = {
             'userId': payload['userId'],
         }
         self._model.objects.update_or_create(defaults=payload, **lookup)
         return item
 
+    def save_many(self, items: List[Domain.User]) -> List[Domain.User]:
+        if not items:
+            return []
+        records = [self._model(**_user_payload(item)) for item in items]
+        if not self._bulk_upsert(records):
+            with transaction.atomic(using=router.db_for_write(self._model)):
+                for item in items:
+                    self.save(item)
+        return list(items)
+
 class DjangoRepositories:
     def __init__(self):
         self.order = OrderDjangoRepository()
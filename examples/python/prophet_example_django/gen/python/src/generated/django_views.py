@@ -1,11 +1,7 @@
 # Code generated by prophet-cli. DO NOT EDIT.
 from __future__ import annotations
 
-import dataclasses
 import json
-import types
-
-from typing import Any, Union, get_args, get_origin, get_type_hints
 
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
@@ -15,51 +11,13 @@ from .action_service import ActionExecutionService
 from .actions import *
 from .persistence import Repositories
 from .query import *
+from .request_decoders import *
+from .response_encoders import *
 
 _service: ActionExecutionService | None = None
 _context: ActionContext | None = None
 _repositories: Repositories | None = None
 
-_TYPE_HINT_CACHE: dict[type, dict[str, Any]] = {}
-
-def _coerce_value(expected_type: Any, value: Any) -> Any:
-    if value is None:
-        return None
-    origin = get_origin(expected_type)
-    if origin is list:
-        (item_type,) = get_args(expected_type) or (Any,)
-        if not isinstance(value, list):
-            return value
-        return [_coerce_value(item_type, item) for item in value]
-    if origin is dict:
-        return value
-    if origin in (types.UnionType, Union):
-        args = [item for item in get_args(expected_type) if item is not type(None)]
-        if len(args) == 1:
-            return _coerce_value(args[0], value)
-        for arg in args:
-            try:
-                return _coerce_value(arg, value)
-            except Exception:
-                continue
-        return value
-    if isinstance(expected_type, type) and dataclasses.is_dataclass(expected_type):
-        if isinstance(value, expected_type):
-            return value
-        if not isinstance(value, dict):
-            return value
-        hints = _TYPE_HINT_CACHE.get(expected_type)
-        if hints is None:
-            hints = get_type_hints(expected_type, globalns=globals(), localns=globals())
-            _TYPE_HINT_CACHE[expected_type] = hints
-        kwargs: dict[str, Any] = {}
-        for field in dataclasses.fields(expected_type):
-            if field.name in value:
-                field_type = hints.get(field.name, Any)
-                kwargs[field.name] = _coerce_value(field_type, value[field.name])
-        return expected_type(**kwargs)
-    return value
-
 def configure_generated_views(service: ActionExecutionService, context: ActionContext, repositories: Repositories) -> None:
     global _service, _context, _repositories
     _service = service
@@ -71,33 +29,33 @@ def action_approveOrder(request: HttpRequest) -> HttpResponse:
     if request.method != 'POST':
         return JsonResponse({'error': 'method_not_allowed'}, status=405)
     payload = json.loads(request.body.decode('utf-8') or '{}')
-    input_model = _coerce_value(ApproveOrderCommand, payload)
+    input_model = decode_approve_order_command(payload)
     if _service is None or _context is None:
         return JsonResponse({'error': 'generated_views_not_configured'}, status=500)
     result = _service.execute_approveOrder(input_model, _context)
-    return JsonResponse(dataclasses.asdict(result))
+    return HttpResponse(order_approve_transition_to_json_bytes(result), content_type='application/json')
 
 @csrf_exempt
 def action_createOrder(request: HttpRequest) -> HttpResponse:
     if request.method != 'POST':
         return JsonResponse({'error': 'method_not_allowed'}, status=405)
     payload = json.loads(request.body.decode('utf-8') or '{}')
-    input_model = _coerce_value(CreateOrderCommand, payload)
+    input_model = decode_create_order_command(payload)
     if _service is None or _context is None:
         return JsonResponse({'error': 'generated_views_not_configured'}, status=500)
     result = _service.execute_createOrder(input_model, _context)
-    return JsonResponse(dataclasses.asdict(result))
+    return HttpResponse(create_order_result_to_json_bytes(result), content_type='application/json')
 
 @csrf_exempt
 def action_shipOrder(request: HttpRequest) -> HttpResponse:
     if request.method != 'POST':
         return JsonResponse({'error': 'method_not_allowed'}, status=405)
     payload = json.loads(request.body.decode('utf-8') or '{}')
-    input_model = _coerce_value(ShipOrderCommand, payload)
+    input_model = decode_ship_order_command(payload)
     if _service is None or _context is None:
         return JsonResponse({'error': 'generated_views_not_configured'}, status=500)
     result = _service.execute_shipOrder(input_model, _context)
-    return JsonResponse(dataclasses.asdict(result))
+    return HttpResponse(order_ship_transition_to_json_bytes(result), content_type='application/json')
 
 def list_order(request: HttpRequest) -> HttpResponse:
     page = int(request.GET.get('page', '0'))
@@ -105,7 +63,7 @@ def list_order(request: HttpRequest) -> HttpResponse:
     if _repositories is None:
         return JsonResponse({'error': 'generated_views_not_configured'}, status=500)
     result = _repositories.order.list(page, size)
-    return JsonResponse(dataclasses.asdict(result))
+    return HttpResponse(order_page_to_json_bytes(result), content_type='application/json')
 
 def get_order(request: HttpRequest, id: str) -> HttpResponse:
     if _repositories is None:
@@ -113,7 +71,7 @@ def get_order(request: HttpRequest, id: str) -> HttpResponse:
     item = _repositories.order.get_by_id(OrderRef(orderId=id))
     if item is None:
         return JsonResponse({'error': 'not_found'}, status=404)
-    return JsonResponse(dataclasses.asdict(item))
+    return HttpResponse(order_to_json_bytes(item), content_type='application/json')
 
 @csrf_exempt
 def query_order(request: HttpRequest) -> HttpResponse:
@@ -122,11 +80,11 @@ def query_order(request: HttpRequest) -> HttpResponse:
     page = int(request.GET.get('page', '0'))
     size = int(request.GET.get('size', '20'))
     payload = json.loads(request.body.decode('utf-8') or '{}')
-    filter_model = _coerce_value(OrderQueryFilter, payload)
+    filter_model = decode_order_query_filter(payload)
     if _repositories is None:
         return JsonResponse({'error': 'generated_views_not_configured'}, status=500)
     result = _repositories.order.query(filter_model, page, size)
-    return JsonResponse(dataclasses.asdict(result))
+    return HttpResponse(order_page_to_json_bytes(result), content_type='application/json')
 
 def list_user(request: HttpRequest) -> HttpResponse:
     page = int(request.GET.get('page', '0'))
@@ -134,7 +92,7 @@ def list_user(request: HttpRequest) -> HttpResponse:
     if _repositories is None:
         return JsonResponse({'error': 'generated_views_not_configured'}, status=500)
     result = _repositories.user.list(page, size)
-    return JsonResponse(dataclasses.asdict(result))
+    return HttpResponse(user_page_to_json_bytes(result), content_type='application/json')
 
 def get_user(request: HttpRequest, id: str) -> HttpResponse:
     if _repositories is None:
@@ -142,7 +100,7 @@ def get_user(request: HttpRequest, id: str) -> HttpResponse:
     item = _repositories.user.get_by_id(UserRef(userId=id))
     if item is None:
         return JsonResponse({'error': 'not_found'}, status=404)
-    return JsonResponse(dataclasses.asdict(item))
+    return HttpResponse(user_to_json_bytes(item), content_type='application/json')
 
 @csrf_exempt
 def query_user(request: HttpRequest) -> HttpResponse:
@@ -151,8 +109,8 @@ def query_user(request: HttpRequest) -> HttpResponse:
     page = int(request.GET.get('page', '0'))
     size = int(request.GET.get('size', '20'))
     payload = json.loads(request.body.decode('utf-8') or '{}')
-    filter_model = _coerce_value(UserQueryFilter, payload)
+    filter_model = decode_user_query_filter(payload)
     if _repositories is None:
         return JsonResponse({'error': 'generated_views_not_configured'}, status=500)
     result = _repositories.user.query(filter_model, page, size)
-    return JsonResponse(dataclasses.asdict(result))
+    return HttpResponse(user_page_to_json_bytes(result), content_type='application/json')
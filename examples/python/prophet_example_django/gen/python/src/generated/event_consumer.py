@@ -0,0 +1,148 @@
+# Code generated by prophet-cli. DO NOT EDIT.
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from prophet_events_runtime import EventConsumer
+from prophet_events_runtime import EventWireEnvelope
+from prophet_events_runtime import SNAPSHOT_MODE_ATTRIBUTE
+from prophet_events_runtime import default_ordering_key
+from prophet_events_runtime import object_ordering_key
+
+from . import event_contracts as EventContracts
+from . import request_decoders as RequestDecoders
+from .events import DomainEvent
+from .events import CreateOrderResultDomainEvent
+from .events import PaymentCapturedDomainEvent
+from .events import OrderApproveTransitionDomainEvent
+from .events import OrderShipTransitionDomainEvent
+
+def _updated_object_for(object_type: str, object_ref: dict[str, object], updated_objects: List[dict[str, object]]) -> Optional[dict[str, object]]:
+    for updated in updated_objects:
+        if updated.get('object_type') == object_type and updated.get('object_ref') == object_ref:
+            candidate = updated.get('object')
+            return candidate if isinstance(candidate, dict) else None
+    return None
+
+# A ref whose object has a snapshot in updated_objects decodes to the full object, otherwise to the ref.
+def _decode_order_ref_or_object(value: Any, updated_objects: List[dict[str, object]]) -> Any:
+    if not isinstance(value, dict):
+        return value
+    snapshot = _updated_object_for('Order', value, updated_objects)
+    if snapshot is not None:
+        return RequestDecoders.decode_order(snapshot)
+    return RequestDecoders.decode_order_ref(value)
+
+def _decode_create_order_result_payload(value: Any, updated_objects: List[dict[str, object]]) -> EventContracts.CreateOrderResult:
+    if not isinstance(value, dict):
+        raise TypeError('Expected an object for CreateOrderResult')
+    kwargs: dict[str, Any] = {}
+    if 'order' in value:
+        kwargs['order'] = _decode_order_ref_or_object(value['order'], updated_objects)
+    return EventContracts.CreateOrderResult(**kwargs)
+
+def _decode_payment_captured_payload(value: Any, updated_objects: List[dict[str, object]]) -> EventContracts.PaymentCaptured:
+    if not isinstance(value, dict):
+        raise TypeError('Expected an object for PaymentCaptured')
+    kwargs: dict[str, Any] = {}
+    if 'order' in value:
+        kwargs['order'] = _decode_order_ref_or_object(value['order'], updated_objects)
+    return EventContracts.PaymentCaptured(**kwargs)
+
+def _decode_order_approve_transition_payload(value: Any, updated_objects: List[dict[str, object]]) -> EventContracts.OrderApproveTransition:
+    if not isinstance(value, dict):
+        raise TypeError('Expected an object for OrderApproveTransition')
+    kwargs: dict[str, Any] = {}
+    if 'orderId' in value:
+        kwargs['orderId'] = value['orderId']
+    if 'fromState' in value:
+        kwargs['fromState'] = value['fromState']
+    if 'toState' in value:
+        kwargs['toState'] = value['toState']
+    if 'approvedByUserId' in value:
+        kwargs['approvedByUserId'] = value['approvedByUserId']
+    if 'noteCount' in value:
+        kwargs['noteCount'] = value['noteCount']
+    if 'approvalReason' in value:
+        kwargs['approvalReason'] = value['approvalReason']
+    return EventContracts.OrderApproveTransition(**kwargs)
+
+def _decode_order_ship_transition_payload(value: Any, updated_objects: List[dict[str, object]]) -> EventContracts.OrderShipTransition:
+    if not isinstance(value, dict):
+        raise TypeError('Expected an object for OrderShipTransition')
+    kwargs: dict[str, Any] = {}
+    if 'orderId' in value:
+        kwargs['orderId'] = value['orderId']
+    if 'fromState' in value:
+        kwargs['fromState'] = value['fromState']
+    if 'toState' in value:
+        kwargs['toState'] = value['toState']
+    if 'carrier' in value:
+        kwargs['carrier'] = value['carrier']
+    if 'trackingNumber' in value:
+        kwargs['trackingNumber'] = value['trackingNumber']
+    if 'packageIds' in value:
+        kwargs['packageIds'] = value['packageIds']
+    return EventContracts.OrderShipTransition(**kwargs)
+
+_DOMAIN_EVENT_TYPES: Dict[str, Tuple[type, Callable[[Any, List[dict[str, object]]], Any]]] = {
+    'CreateOrderResult': (CreateOrderResultDomainEvent, _decode_create_order_result_payload),
+    'PaymentCaptured': (PaymentCapturedDomainEvent, _decode_payment_captured_payload),
+    'OrderApproveTransition': (OrderApproveTransitionDomainEvent, _decode_order_approve_transition_payload),
+    'OrderShipTransition': (OrderShipTransitionDomainEvent, _decode_order_ship_transition_payload),
+}
+
+def decode_domain_event(envelope: EventWireEnvelope) -> DomainEvent:
+    entry = _DOMAIN_EVENT_TYPES.get(envelope.event_type)
+    if entry is None:
+        raise ValueError(f'Unknown event type: {envelope.event_type}')
+    event_type, decode_payload = entry
+    updated_objects = envelope.updated_objects or []
+    if envelope.attributes and envelope.attributes.get(SNAPSHOT_MODE_ATTRIBUTE) == 'changed':
+        # Changed-field snapshots are partial objects, so refs decode as refs.
+        updated_objects = []
+    return event_type(payload=decode_payload(envelope.payload, updated_objects))
+
+def event_ordering_key(envelope: EventWireEnvelope) -> Optional[str]:
+    payload = envelope.payload
+    if envelope.event_type == 'CreateOrderResult':
+        return object_ordering_key('Order', payload.get('order'))
+    if envelope.event_type == 'PaymentCaptured':
+        return object_ordering_key('Order', payload.get('order'))
+    if envelope.event_type == 'OrderApproveTransition':
+        return object_ordering_key('Order', {'orderId': payload.get('orderId')})
+    if envelope.event_type == 'OrderShipTransition':
+        return object_ordering_key('Order', {'orderId': payload.get('orderId')})
+    return default_ordering_key(envelope)
+
+@dataclass(kw_only=True)
+class DomainEventHandlers:
+    createOrderResult: Optional[Callable[[CreateOrderResultDomainEvent, EventWireEnvelope], None]] = None
+    paymentCaptured: Optional[Callable[[PaymentCapturedDomainEvent, EventWireEnvelope], None]] = None
+    orderApproveTransition: Optional[Callable[[OrderApproveTransitionDomainEvent, EventWireEnvelope], None]] = None
+    orderShipTransition: Optional[Callable[[OrderShipTransitionDomainEvent, EventWireEnvelope], None]] = None
+
+def build_event_consumer(
+    handlers: DomainEventHandlers,
+    *,
+    concurrency: int = 8,
+    max_pending: int = 10000,
+    dedup_window: int = 10000,
+) -> EventConsumer:
+    consumer = EventConsumer(
+        decode=decode_domain_event,
+        ordering_key=event_ordering_key,
+        concurrency=concurrency,
+        max_pending=max_pending,
+        dedup_window=dedup_window,
+    )
+    if handlers.createOrderResult is not None:
+        consumer.on('CreateOrderResult', handlers.createOrderResult, blocking=True)
+    if handlers.paymentCaptured is not None:
+        consumer.on('PaymentCaptured', handlers.paymentCaptured, blocking=True)
+    if handlers.orderApproveTransition is not None:
+        consumer.on('OrderApproveTransition', handlers.orderApproveTransition, blocking=True)
+    if handlers.orderShipTransition is not None:
+        consumer.on('OrderShipTransition', handlers.orderShipTransition, blocking=True)
+    return consumer
@@ -10,6 +10,7 @@ from prophet_events_runtime import TransitionValidationResult
 from .domain import *
 from .event_contracts import *
 from .persistence import Repositories
+from .persistence import TransitionRejected
 
 @dataclass
 class OrderApproveTransitionDraft:
@@ -61,24 +62,26 @@ class OrderTransitionValidatorDefault:
 class OrderTransitionHandlerDefault:
     def __init__(self, repository: OrderRepository, validator: Optional[OrderTransitionValidator] = None):
         self._repository = repository
-        self._validator = validator if validator is not None else OrderTransitionValidatorDefault()
+        self._validator = validator if type(validator) is not OrderTransitionValidatorDefault else None
 
     def approveOrder(self, target: OrderRefOrObject) -> OrderApproveTransitionDraft:
         id = OrderRef(
             orderId=target.orderId,
         )
-        current = self._repository.get_by_id(id)
-        if current is None:
-            raise RuntimeError("Order not found for transition 'approve'")
-        validation = self._validator.validateApproveOrder(current)
-        if not validation.passesValidation:
-            raise RuntimeError(validation.failureReason or "Transition validation failed for Order.approve")
+        if self._validator is not None:
+            current = self._repository.get_by_id(id)
+            if current is None:
+                raise RuntimeError("Order not found for transition 'approve'")
+            validation = self._validator.validateApproveOrder(current)
+            if not validation.passesValidation:
+                raise RuntimeError(validation.failureReason or "Transition validation failed for Order.approve")
+            if current.state != 'created':
+                raise RuntimeError(f"Invalid state transition Order.approve: expected created but was {current.state}")
         transitioned = self._repository.apply_transition(id, 'created', 'approved', 'trans_order_approve')
-        if transitioned is None:
-            latest = self._repository.get_by_id(id)
-            if latest is None:
+        if isinstance(transitioned, TransitionRejected):
+            if transitioned.missing:
                 raise RuntimeError("Order not found for transition 'approve'")
-            raise RuntimeError(f"Invalid state transition Order.approve: expected created but was {latest.state}")
+            raise RuntimeError(f"Invalid state transition Order.approve: expected created but was {transitioned.current_state}")
         seed: Dict[str, object] = {}
         seed['orderId'] = transitioned.orderId
         seed['fromState'] = 'created'
@@ -89,18 +92,20 @@ class OrderTransitionHandlerDefault:
         id = OrderRef(
             orderId=target.orderId,
         )
-        current = self._repository.get_by_id(id)
-        if current is None:
-            raise RuntimeError("Order not found for transition 'ship'")
-        validation = self._validator.validateShipOrder(current)
-        if not validation.passesValidation:
-            raise RuntimeError(validation.failureReason or "Transition validation failed for Order.ship")
+        if self._validator is not None:
+            current = self._repository.get_by_id(id)
+            if current is None:
+                raise RuntimeError("Order not found for transition 'ship'")
+            validation = self._validator.validateShipOrder(current)
+            if not validation.passesValidation:
+                raise RuntimeError(validation.failureReason or "Transition validation failed for Order.ship")
+            if current.state != 'approved':
+                raise RuntimeError(f"Invalid state transition Order.ship: expected approved but was {current.state}")
         transitioned = self._repository.apply_transition(id, 'approved', 'shipped', 'trans_order_ship')
-        if transitioned is None:
-            latest = self._repository.get_by_id(id)
-            if latest is None:
+        if isinstance(transitioned, TransitionRejected):
+            if transitioned.missing:
                 raise RuntimeError("Order not found for transition 'ship'")
-            raise RuntimeError(f"Invalid state transition Order.ship: expected approved but was {latest.state}")
+            raise RuntimeError(f"Invalid state transition Order.ship: expected approved but was {transitioned.current_state}")
         seed: Dict[str, object] = {}
         seed['orderId'] = transitioned.orderId
         seed['fromState'] = 'approved'
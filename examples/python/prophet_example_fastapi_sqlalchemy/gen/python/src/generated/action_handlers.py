@@ -9,6 +9,7 @@ from .event_contracts import *
 from .events import ActionOutcome
 from .events import ActionOutcomeValue
 from .events import EventPublisher
+from .events import SnapshotBaselines
 from .persistence import Repositories
 
 @dataclass
@@ -18,6 +19,7 @@ class ActionContext:
     traceId: Optional[str] = None
     eventSource: Optional[str] = None
     eventAttributes: Optional[dict[str, str]] = None
+    snapshotBaselines: Optional[SnapshotBaselines] = None
 
 class ApproveOrderActionHandler(Protocol):
     async def handle(self, input: ApproveOrderCommand, context: ActionContext) -> ActionOutcomeValue[OrderApproveTransition]: ...
@@ -1,114 +1,71 @@
 # Code generated by prophet-cli. DO NOT EDIT.
 from __future__ import annotations
 
-import dataclasses
-import types
-
-from typing import Any, Union, get_args, get_origin, get_type_hints
-
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from .action_handlers import ActionContext
 from .action_service import ActionExecutionService
 from .actions import *
 from .persistence import Repositories
 from .query import *
-
-_TYPE_HINT_CACHE: dict[type, dict[str, Any]] = {}
-
-def _coerce_value(expected_type: Any, value: Any) -> Any:
-    if value is None:
-        return None
-    origin = get_origin(expected_type)
-    if origin is list:
-        (item_type,) = get_args(expected_type) or (Any,)
-        if not isinstance(value, list):
-            return value
-        return [_coerce_value(item_type, item) for item in value]
-    if origin is dict:
-        return value
-    if origin in (types.UnionType, Union):
-        args = [item for item in get_args(expected_type) if item is not type(None)]
-        if len(args) == 1:
-            return _coerce_value(args[0], value)
-        for arg in args:
-            try:
-                return _coerce_value(arg, value)
-            except Exception:
-                continue
-        return value
-    if isinstance(expected_type, type) and dataclasses.is_dataclass(expected_type):
-        if isinstance(value, expected_type):
-            return value
-        if not isinstance(value, dict):
-            return value
-        hints = _TYPE_HINT_CACHE.get(expected_type)
-        if hints is None:
-            hints = get_type_hints(expected_type, globalns=globals(), localns=globals())
-            _TYPE_HINT_CACHE[expected_type] = hints
-        kwargs: dict[str, Any] = {}
-        for field in dataclasses.fields(expected_type):
-            if field.name in value:
-                field_type = hints.get(field.name, Any)
-                kwargs[field.name] = _coerce_value(field_type, value[field.name])
-        return expected_type(**kwargs)
-    return value
+from .request_decoders import *
+from .response_encoders import *
 
 def build_generated_router(service: ActionExecutionService, context: ActionContext, repositories: Repositories) -> APIRouter:
     router = APIRouter()
 
     @router.post('/actions/approveOrder')
     async def action_approveOrder(payload: dict):
-        input_model = _coerce_value(ApproveOrderCommand, payload or {})
+        input_model = decode_approve_order_command(payload or {})
         result = await service.execute_approveOrder(input_model, context)
-        return dataclasses.asdict(result)
+        return Response(content=order_approve_transition_to_json_bytes(result), media_type='application/json')
 
     @router.post('/actions/createOrder')
     async def action_createOrder(payload: dict):
-        input_model = _coerce_value(CreateOrderCommand, payload or {})
+        input_model = decode_create_order_command(payload or {})
         result = await service.execute_createOrder(input_model, context)
-        return dataclasses.asdict(result)
+        return Response(content=create_order_result_to_json_bytes(result), media_type='application/json')
 
     @router.post('/actions/shipOrder')
     async def action_shipOrder(payload: dict):
-        input_model = _coerce_value(ShipOrderCommand, payload or {})
+        input_model = decode_ship_order_command(payload or {})
         result = await service.execute_shipOrder(input_model, context)
-        return dataclasses.asdict(result)
+        return Response(content=order_ship_transition_to_json_bytes(result), media_type='application/json')
 
     @router.get('/orders')
     async def list_order(page: int = Query(default=0), size: int = Query(default=20)):
         result = await repositories.order.list(page, size)
-        return dataclasses.asdict(result)
+        return Response(content=order_page_to_json_bytes(result), media_type='application/json')
 
     @router.get('/orders/{id}')
     async def get_order(id: str):
         item = await repositories.order.get_by_id(OrderRef(orderId=id))
         if item is None:
             raise HTTPException(status_code=404, detail='not_found')
-        return dataclasses.asdict(item)
+        return Response(content=order_to_json_bytes(item), media_type='application/json')
 
     @router.post('/orders/query')
     async def query_order(payload: dict, page: int = Query(default=0), size: int = Query(default=20)):
-        filter_model = _coerce_value(OrderQueryFilter, payload or {})
+        filter_model = decode_order_query_filter(payload or {})
         result = await repositories.order.query(filter_model, page, size)
-        return dataclasses.asdict(result)
+        return Response(content=order_page_to_json_bytes(result), media_type='application/json')
 
     @router.get('/users')
     async def list_user(page: int = Query(default=0), size: int = Query(default=20)):
         result = await repositories.user.list(page, size)
-        return dataclasses.asdict(result)
+        return Response(content=user_page_to_json_bytes(result), media_type='application/json')
 
     @router.get('/users/{id}')
     async def get_user(id: str):
         item = await repositories.user.get_by_id(UserRef(userId=id))
         if item is None:
             raise HTTPException(status_code=404, detail='not_found')
-        return dataclasses.asdict(item)
+        return Response(content=user_to_json_bytes(item), media_type='application/json')
 
     @router.post('/users/query')
     async def query_user(payload: dict, page: int = Query(default=0), size: int = Query(default=20)):
-        filter_model = _coerce_value(UserQueryFilter, payload or {})
+        filter_model = decode_user_query_filter(payload or {})
         result = await repositories.user.query(filter_model, page, size)
-        return dataclasses.asdict(result)
+        return Response(content=user_page_to_json_bytes(result), media_type='application/json')
 
     return router
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Protocol
+from typing import List, Optional, Protocol, Union
 
 from .domain import *
 from .query import *
@@ -15,18 +15,31 @@ class PagedResult:
     totalElements: int
     totalPages: int
 
+@dataclass(frozen=True)
+class TransitionRejected:
+    current_state: Optional[str] = None
+
+    @property
+    def missing(self) -> bool:
+        return self.current_state is None
+
 class OrderRepository(Protocol):
     async def list(self, page: int, size: int) -> PagedResult: ...
     async def query(self, filter: OrderQueryFilter, page: int, size: int) -> PagedResult: ...
     async def get_by_id(self, id: OrderRef) -> Optional[Order]: ...
+    async def get_by_ids(self, ids: List[OrderRef]) -> List[Optional[Order]]: ...
     async def save(self, item: Order) -> Order: ...
-    async def apply_transition(self, id: OrderRef, expected_state: OrderState, next_state: OrderState, transition_id: str) -> Optional[Order]: ...
+    async def save_many(self, items: List[Order]) -> List[Order]: ...
+    async def apply_transition(self, id: OrderRef, expected_state: OrderState, next_state: OrderState, transition_id: str) -> Union[Order, TransitionRejected]: ...
+    async def apply_transition_many(self, ids: List[OrderRef], expected_state: OrderState, next_state: OrderState, transition_id: str) -> List[Order]: ...
 
 class UserRepository(Protocol):
     async def list(self, page: int, size: int) -> PagedResult: ...
     async def query(self, filter: UserQueryFilter, page: int, size: int) -> PagedResult: ...
     async def get_by_id(self, id: UserRef) -> Optional[User]: ...
+    async def get_by_ids(self, ids: List[UserRef]) -> List[Optional[User]]: ...
     async def save(self, item: User) -> User: ...
+    async def save_many(self, items: List[User]) -> List[User]: ...
 
 class Repositories(Protocol):
     order: OrderRepository
@@ -24,6 +24,7 @@ class ActionExecutionService:
             trace_id=context.traceId or create_event_id(),
             source=context.eventSource or 'commerce_local',
             attributes=context.eventAttributes,
+            snapshot_baselines=context.snapshotBaselines,
         )
         events = [create_order_approve_transition_event(outcome.output), *outcome.additional_events]
         await publish_domain_events(context.eventPublisher, events, metadata)
@@ -36,6 +37,7 @@ class ActionExecutionService:
             trace_id=context.traceId or create_event_id(),
             source=context.eventSource or 'commerce_local',
             attributes=context.eventAttributes,
+            snapshot_baselines=context.snapshotBaselines,
         )
         events = [create_create_order_result_event(outcome.output), *outcome.additional_events]
         await publish_domain_events(context.eventPublisher, events, metadata)
@@ -48,6 +50,7 @@ class ActionExecutionService:
             trace_id=context.traceId or create_event_id(),
             source=context.eventSource or 'commerce_local',
             attributes=context.eventAttributes,
+            snapshot_baselines=context.snapshotBaselines,
         )
         events = [create_order_ship_transition_event(outcome.output), *outcome.additional_events]
         await publish_domain_events(context.eventPublisher, events, metadata)
@@ -0,0 +1,146 @@
+# Code generated by prophet-cli. DO NOT EDIT.
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar, Union
+
+from . import domain as Domain
+from . import persistence as Persistence
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+class BatchLoader(Generic[K, V]):
+    def __init__(self, batch_fn: Callable[[List[K]], Awaitable[List[Optional[V]]]], key_fn: Callable[[K], Hashable]):
+        self._batch_fn = batch_fn
+        self._key_fn = key_fn
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._pending: List[Tuple[Hashable, K]] = []
+
+    def load(self, ref: K) -> Awaitable[Optional[V]]:
+        key = self._key_fn(ref)
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        if not self._pending:
+            loop.call_soon(lambda: loop.create_task(self._dispatch()))
+        self._pending.append((key, ref))
+        return future
+
+    async def load_many(self, refs: List[K]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*[self.load(ref) for ref in refs]))
+
+    def prime(self, ref: K, value: Optional[V]) -> None:
+        key = self._key_fn(ref)
+        if key in self._futures:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def clear(self, ref: K) -> None:
+        self._futures.pop(self._key_fn(ref), None)
+
+    def clear_all(self) -> None:
+        self._futures.clear()
+
+    async def _dispatch(self) -> None:
+        batch, self._pending = self._pending, []
+        try:
+            values = await self._batch_fn([ref for _, ref in batch])
+        except Exception as exc:
+            for key, _ in batch:
+                future = self._futures.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            return
+        for (key, _), value in zip(batch, values):
+            future = self._futures.get(key)
+            if future is not None and not future.done():
+                future.set_result(value)
+
+class IdentityMapRepository(Generic[K, V]):
+    def __init__(self, repository: Any, key_fn: Callable[[Any], Hashable]):
+        self._repository = repository
+        self._key_fn = key_fn
+        self._entries: Dict[Hashable, Optional[V]] = {}
+
+    async def list(self, *args: Any, **kwargs: Any) -> Persistence.PagedResult:
+        return await self._repository.list(*args, **kwargs)
+
+    async def query(self, *args: Any, **kwargs: Any) -> Persistence.PagedResult:
+        return await self._repository.query(*args, **kwargs)
+
+    async def get_by_id(self, id: K) -> Optional[V]:
+        key = self._key_fn(id)
+        if key not in self._entries:
+            self._entries[key] = await self._repository.get_by_id(id)
+        return self._entries[key]
+
+    async def get_by_ids(self, ids: List[K]) -> List[Optional[V]]:
+        keys = [self._key_fn(id) for id in ids]
+        missing: Dict[Hashable, K] = {}
+        for key, id in zip(keys, ids):
+            if key not in self._entries and key not in missing:
+                missing[key] = id
+        if missing:
+            values = await self._repository.get_by_ids(list(missing.values()))
+            self._entries.update(zip(missing.keys(), values))
+        return [self._entries[key] for key in keys]
+
+    async def save(self, item: V) -> V:
+        saved = await self._repository.save(item)
+        self._entries[self._key_fn(saved)] = saved
+        return saved
+
+    async def save_many(self, items: List[V]) -> List[V]:
+        saved = await self._repository.save_many(items)
+        for item in saved:
+            self._entries[self._key_fn(item)] = item
+        return saved
+
+    def clear(self, ref: K) -> None:
+        self._entries.pop(self._key_fn(ref), None)
+
+    def clear_all(self) -> None:
+        self._entries.clear()
+
+class StatefulIdentityMapRepository(IdentityMapRepository[K, V]):
+    async def apply_transition(self, id: K, expected_state: str, next_state: str, transition_id: str) -> Union[V, Persistence.TransitionRejected]:
+        self.clear(id)
+        transitioned = await self._repository.apply_transition(id, expected_state, next_state, transition_id)
+        if not isinstance(transitioned, Persistence.TransitionRejected):
+            self._entries[self._key_fn(transitioned)] = transitioned
+        return transitioned
+
+    async def apply_transition_many(self, ids: List[K], expected_state: str, next_state: str, transition_id: str) -> List[V]:
+        for id in ids:
+            self.clear(id)
+        transitioned = await self._repository.apply_transition_many(ids, expected_state, next_state, transition_id)
+        for item in transitioned:
+            self._entries[self._key_fn(item)] = item
+        return transitioned
+
+def _order_key(ref: Domain.OrderRef | Domain.Order) -> tuple:
+    return (ref.orderId,)
+
+def _user_key(ref: Domain.UserRef | Domain.User) -> tuple:
+    return (ref.userId,)
+
+class RepositoryLoaders:
+    def __init__(self, repositories: Persistence.Repositories):
+        self.order: BatchLoader[Domain.OrderRef, Domain.Order] = BatchLoader(repositories.order.get_by_ids, _order_key)
+        self.user: BatchLoader[Domain.UserRef, Domain.User] = BatchLoader(repositories.user.get_by_ids, _user_key)
+
+class IdentityMapRepositories:
+    def __init__(self, repositories: Persistence.Repositories):
+        self.order: StatefulIdentityMapRepository[Domain.OrderRef, Domain.Order] = StatefulIdentityMapRepository(repositories.order, _order_key)
+        self.user: IdentityMapRepository[Domain.UserRef, Domain.User] = IdentityMapRepository(repositories.user, _user_key)
+
+    def clear_all(self) -> None:
+        self.order.clear_all()
+        self.user.clear_all()
@@ -0,0 +1,294 @@
+# Code generated by prophet-cli. DO NOT EDIT.
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, List, Optional, Protocol, Tuple, TypeVar, Union
+
+from . import domain as Domain
+from . import persistence as Persistence
+from . import request_decoders as Decoders
+from . import response_encoders as Encoders
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+def _ttl_ms(ttl_seconds: Optional[float]) -> Optional[int]:
+    return None if ttl_seconds is None else max(1, int(ttl_seconds * 1000))
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+# Backends hold JSON bytes from the generated response encoders and every hit is rebuilt by the
+# generated decoders, so callers never share (or mutate) a cached domain object.
+# `delete(keys, hold_seconds)` replaces entries with unique tombstones. `fill` is the read-path
+# write-back: it only stores when the key still holds what the read observed (nothing, or the
+# same tombstone), so a read that raced a save cannot put the pre-save value back.
+class CacheBackend(Protocol):
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]: ...
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float]) -> None: ...
+    def fill(self, key: str, observed: Optional[Any], value: Any, ttl_seconds: Optional[float]) -> bool: ...
+    def delete(self, keys: List[str], hold_seconds: Optional[float] = None) -> None: ...
+    def clear(self) -> None: ...
+
+class _Tombstone:
+    __slots__ = ()
+
+_TOMBSTONE_PREFIX = b'\x00'
+
+def _is_tombstone(value: Any) -> bool:
+    return isinstance(value, _Tombstone) or (isinstance(value, bytes) and value[:1] == _TOMBSTONE_PREFIX)
+
+class InMemoryCacheBackend:
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        stats: Optional[CacheStats] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, Tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = stats if stats is not None else CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        with self._lock:
+            return [self._current(key) for key in keys]
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float]) -> None:
+        with self._lock:
+            self._store(key, value, ttl_seconds)
+
+    def fill(self, key: str, observed: Optional[Any], value: Any, ttl_seconds: Optional[float]) -> bool:
+        with self._lock:
+            current = self._current(key)
+            if current is not None and current is not observed:
+                return False
+            self._store(key, value, ttl_seconds)
+            return True
+
+    def delete(self, keys: List[str], hold_seconds: Optional[float] = None) -> None:
+        with self._lock:
+            for key in keys:
+                if hold_seconds:
+                    self._store(key, _Tombstone(), hold_seconds)
+                else:
+                    self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _current(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._entries[key]
+            if not isinstance(value, _Tombstone):
+                self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any, ttl_seconds: Optional[float]) -> None:
+        expires_at = self._clock() + ttl_seconds if ttl_seconds is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            if not isinstance(evicted, _Tombstone):
+                self.stats.evictions += 1
+
+# Stores ARGV[2] only while the key is missing or still holds the observed value ARGV[1].
+_REDIS_FILL_SCRIPT = (
+    "local current = redis.call('GET', KEYS[1]) "
+    "if current and current ~= ARGV[1] then return 0 end "
+    "if ARGV[3] == '' then redis.call('SET', KEYS[1], ARGV[2]) "
+    "else redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3]) end "
+    "return 1"
+)
+
+class RedisCacheBackend:
+    def __init__(self, client: Any, prefix: str = 'prophet:'):
+        self._client = client
+        self._prefix = prefix
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        return list(self._client.mget([self._prefix + key for key in keys]))
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float]) -> None:
+        self._client.set(self._prefix + key, value, px=_ttl_ms(ttl_seconds))
+
+    def fill(self, key: str, observed: Optional[Any], value: Any, ttl_seconds: Optional[float]) -> bool:
+        ttl_ms = _ttl_ms(ttl_seconds)
+        args = (observed or b'', value, '' if ttl_ms is None else ttl_ms)
+        return bool(self._client.eval(_REDIS_FILL_SCRIPT, 1, self._prefix + key, *args))
+
+    def delete(self, keys: List[str], hold_seconds: Optional[float] = None) -> None:
+        if not keys:
+            return
+        if not hold_seconds:
+            self._client.delete(*[self._prefix + key for key in keys])
+            return
+        pipeline = self._client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.set(self._prefix + key, _TOMBSTONE_PREFIX + os.urandom(16), px=_ttl_ms(hold_seconds))
+        pipeline.execute()
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=f'{self._prefix}*'))
+        if keys:
+            self._client.delete(*keys)
+
+class EntityCache:
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttl_seconds: Optional[float] = 300.0,
+        max_entries: int = 10000,
+        invalidation_hold_seconds: Optional[float] = 30.0,
+    ):
+        self.stats = CacheStats()
+        self.backend = backend if backend is not None else InMemoryCacheBackend(max_entries, stats=self.stats)
+        self.ttl_seconds = ttl_seconds
+        self.invalidation_hold_seconds = invalidation_hold_seconds
+
+    def invalidate(self, keys: List[str]) -> None:
+        self.stats.invalidations += len(keys)
+        self.backend.delete(keys, self.invalidation_hold_seconds)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+class CachedRepository(Generic[K, V]):
+    def __init__(
+        self,
+        repository: Any,
+        cache: EntityCache,
+        namespace: str,
+        key_fn: Callable[[Any], tuple],
+        encode: Callable[[V], bytes],
+        decode: Callable[[Any], V],
+    ):
+        self._repository = repository
+        self._cache = cache
+        self._namespace = namespace
+        self._key_fn = key_fn
+        self._encode = encode
+        self._decode = decode
+
+    def _cache_key(self, ref: Any) -> str:
+        return f'{self._namespace}:{json.dumps(list(self._key_fn(ref)), default=str)}'
+
+    def _load(self, cached: Any) -> Optional[V]:
+        if cached is None or _is_tombstone(cached):
+            return None
+        return self._decode(json.loads(cached))
+
+    def _dump(self, value: V) -> bytes:
+        return self._encode(value)
+
+    def list(self, *args: Any, **kwargs: Any) -> Persistence.PagedResult:
+        return self._repository.list(*args, **kwargs)
+
+    def query(self, *args: Any, **kwargs: Any) -> Persistence.PagedResult:
+        return self._repository.query(*args, **kwargs)
+
+    def get_by_id(self, id: K) -> Optional[V]:
+        key = self._cache_key(id)
+        observed = (self._cache.backend.get_many([key]))[0]
+        cached = self._load(observed)
+        if cached is not None:
+            self._cache.stats.hits += 1
+            return cached
+        self._cache.stats.misses += 1
+        value = self._repository.get_by_id(id)
+        if value is not None:
+            self._cache.backend.fill(key, observed, self._dump(value), self._cache.ttl_seconds)
+        return value
+
+    def get_by_ids(self, ids: List[K]) -> List[Optional[V]]:
+        keys = [self._cache_key(id) for id in ids]
+        observed = self._cache.backend.get_many(keys)
+        values = [self._load(value) for value in observed]
+        missing = [index for index, value in enumerate(values) if value is None]
+        self._cache.stats.hits += len(ids) - len(missing)
+        self._cache.stats.misses += len(missing)
+        if missing:
+            loaded = self._repository.get_by_ids([ids[index] for index in missing])
+            for index, value in zip(missing, loaded):
+                values[index] = value
+                if value is not None:
+                    self._cache.backend.fill(keys[index], observed[index], self._dump(value), self._cache.ttl_seconds)
+        return values
+
+    def save(self, item: V) -> V:
+        saved = self._repository.save(item)
+        self._cache.invalidate([self._cache_key(saved)])
+        return saved
+
+    def save_many(self, items: List[V]) -> List[V]:
+        saved = self._repository.save_many(items)
+        self._cache.invalidate([self._cache_key(item) for item in saved])
+        return saved
+
+class StatefulCachedRepository(CachedRepository[K, V]):
+    def apply_transition(self, id: K, expected_state: str, next_state: str, transition_id: str) -> Union[V, Persistence.TransitionRejected]:
+        transitioned = self._repository.apply_transition(id, expected_state, next_state, transition_id)
+        self._cache.invalidate([self._cache_key(id)])
+        return transitioned
+
+    def apply_transition_many(self, ids: List[K], expected_state: str, next_state: str, transition_id: str) -> List[V]:
+        transitioned = self._repository.apply_transition_many(ids, expected_state, next_state, transition_id)
+        self._cache.invalidate([self._cache_key(id) for id in ids])
+        return transitioned
+
+def _order_key(ref: Domain.OrderRef | Domain.Order) -> tuple:
+    return (ref.orderId,)
+
+def _user_key(ref: Domain.UserRef | Domain.User) -> tuple:
+    return (ref.userId,)
+
+class CachedRepositories:
+    def __init__(self, repositories: Persistence.Repositories, cache: Optional[EntityCache] = None):
+        self.cache = cache if cache is not None else EntityCache()
+        self.order: StatefulCachedRepository[Domain.OrderRef, Domain.Order] = StatefulCachedRepository(
+            repositories.order,
+            self.cache,
+            'Order',
+            _order_key,
+            Encoders.order_to_json_bytes,
+            Decoders.decode_order,
+        )
+        self.user: CachedRepository[Domain.UserRef, Domain.User] = CachedRepository(
+            repositories.user,
+            self.cache,
+            'User',
+            _user_key,
+            Encoders.user_to_json_bytes,
+            Decoders.decode_user,
+        )
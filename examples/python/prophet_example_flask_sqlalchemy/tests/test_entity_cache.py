@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import fnmatch
+import sys
+import unittest
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+ROOT = Path(__file__).resolve().parents[1]
+GEN_SRC = ROOT / "gen" / "python" / "src"
+if str(GEN_SRC) not in sys.path:
+    sys.path.insert(0, str(GEN_SRC))
+
+from generated import domain as Domain
+from generated import sqlalchemy_models as SqlAlchemyModels
+from generated.cache import CachedRepositories
+from generated.cache import EntityCache
+from generated.cache import InMemoryCacheBackend
+from generated.cache import RedisCacheBackend
+from generated.sqlalchemy_adapters import SqlAlchemyRepositories
+
+
+class LocalRedis:
+    """Minimal in-process stand-in for the redis-py commands the cache backend uses."""
+
+    def __init__(self) -> None:
+        self.values: dict = {}
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def set(self, key, value, px=None):
+        self.values[key] = value
+
+    def eval(self, script, numkeys, key, observed, value, px):
+        # Mirrors the backend's fill script: store while missing or still holding `observed`.
+        current = self.values.get(key)
+        if current is not None and current != observed:
+            return 0
+        self.values[key] = value
+        return 1
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in list(self.values) if fnmatch.fnmatch(key, match)]
+
+
+def _order(order_id: str, total: float = 10.0) -> Domain.Order:
+    return Domain.Order(
+        orderId=order_id,
+        customer=Domain.UserRef(userId="user-1"),
+        totalAmount=total,
+        discountCode=None,
+        tags=[],
+        shippingAddress=None,
+        approvedByUserId=None,
+        approvalNotes=None,
+        approvalReason=None,
+        shippingCarrier=None,
+        shippingTrackingNumber=None,
+        shippingPackageIds=None,
+        state="created",
+    )
+
+
+class EntityCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://", future=True)
+        SqlAlchemyModels.Base.metadata.create_all(engine)
+        self.selects = 0
+
+        def count_selects(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                self.selects += 1
+
+        event.listen(engine, "before_cursor_execute", count_selects)
+        self.repositories = SqlAlchemyRepositories(sessionmaker(bind=engine, expire_on_commit=False))
+
+    def test_reads_are_cached_and_invalidated_on_save_and_transition(self) -> None:
+        cached = CachedRepositories(self.repositories)
+        ref = Domain.OrderRef(orderId="order-1")
+        cached.order.save(_order("order-1"))
+
+        self.selects = 0
+        self.assertEqual(cached.order.get_by_id(ref).totalAmount, 10.0)
+        self.assertEqual(cached.order.get_by_id(ref).totalAmount, 10.0)
+        self.assertEqual(self.selects, 1)
+
+        cached.order.save(_order("order-1", total=25.0))
+        self.assertEqual(cached.order.get_by_id(ref).totalAmount, 25.0)
+
+        cached.order.apply_transition(ref, "created", "approved", "approveOrder")
+        self.assertEqual(cached.order.get_by_id(ref).state, "approved")
+        self.assertEqual(cached.cache.stats.hits, 1)
+        self.assertEqual(cached.cache.stats.misses, 3)
+        self.assertEqual(cached.cache.stats.invalidations, 3)
+
+    def test_in_memory_backend_returns_copies_callers_can_mutate(self) -> None:
+        cached = CachedRepositories(self.repositories)
+        ref = Domain.OrderRef(orderId="order-1")
+        cached.order.save(_order("order-1"))
+
+        first = cached.order.get_by_id(ref)
+        first.totalAmount = 99.0
+        first.tags.append("draft")
+        second = cached.order.get_by_id(ref)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.totalAmount, 10.0)
+        self.assertEqual(second.tags, [])
+        self.assertEqual(cached.cache.stats.hits, 1)
+
+    def test_in_memory_backend_evicts_lru_and_expires_entries(self) -> None:
+        now = [0.0]
+        cache = EntityCache(ttl_seconds=5.0)
+        cache.backend = InMemoryCacheBackend(max_entries=2, stats=cache.stats, clock=lambda: now[0])
+        cached = CachedRepositories(self.repositories, cache)
+        cached.order.save_many([_order("order-1"), _order("order-2"), _order("order-3")])
+
+        cached.order.get_by_ids([Domain.OrderRef(orderId=f"order-{index}") for index in (1, 2, 3)])
+        self.assertEqual(len(cache.backend), 2)
+        self.assertEqual(cache.stats.evictions, 1)
+
+        now[0] = 10.0
+        cached.order.get_by_id(Domain.OrderRef(orderId="order-3"))
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual(cache.stats.hit_rate, 0.0)
+
+    def test_redis_backend_round_trips_domain_objects(self) -> None:
+        redis = LocalRedis()
+        cached = CachedRepositories(self.repositories, EntityCache(RedisCacheBackend(redis)))
+        ref = Domain.OrderRef(orderId="order-1")
+        cached.order.save(_order("order-1"))
+
+        self.assertEqual(cached.order.get_by_id(ref), cached.order.get_by_id(ref))
+        self.assertEqual(list(redis.values), ['prophet:Order:["order-1"]'])
+        self.assertEqual(cached.cache.stats.hits, 1)
+
+        self.assertTrue(redis.values['prophet:Order:["order-1"]'].startswith(b'{"orderId":"order-1"'))
+
+        cached.order.apply_transition(ref, "created", "approved", "approveOrder")
+        self.assertTrue(redis.values['prophet:Order:["order-1"]'].startswith(b"\x00"))
+        self.assertEqual(cached.order.get_by_id(ref).state, "approved")
+        cached.cache.clear()
+        self.assertEqual(redis.values, {})
+
+    def test_read_that_raced_a_save_does_not_cache_the_stale_row(self) -> None:
+        cached = CachedRepositories(self.repositories)
+        ref = Domain.OrderRef(orderId="order-1")
+        cached.order.save(_order("order-1"))
+        cached.order.get_by_id(ref)
+        cached.order.save(_order("order-1", total=25.0))
+
+        stale = _order("order-1", total=10.0)
+        original_get_by_id = self.repositories.order.get_by_id
+
+        def get_by_id_racing_a_save(id):
+            cached.order.save(_order("order-1", total=40.0))
+            return stale
+
+        self.repositories.order.get_by_id = get_by_id_racing_a_save
+        self.assertEqual(cached.order.get_by_id(ref).totalAmount, 10.0)
+        self.repositories.order.get_by_id = original_get_by_id
+        self.assertEqual(cached.order.get_by_id(ref).totalAmount, 40.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+ROOT = Path(__file__).resolve().parents[1]
+GEN_SRC = ROOT / "gen" / "python" / "src"
+if str(GEN_SRC) not in sys.path:
+    sys.path.insert(0, str(GEN_SRC))
+
+from generated import domain as Domain
+from generated import sqlalchemy_models as SqlAlchemyModels
+from generated.persistence import TransitionRejected
+from generated.sqlalchemy_adapters import SqlAlchemyRepositories
+from generated.transitions import TransitionServices
+
+
+class TransitionHandlerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://", future=True)
+        SqlAlchemyModels.Base.metadata.create_all(engine)
+        self.statements: list = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+            self.statements.append(statement.lstrip().split(None, 1)[0].upper())
+
+        event.listen(engine, "before_cursor_execute", record_statement)
+        self.repositories = SqlAlchemyRepositories(sessionmaker(bind=engine, expire_on_commit=False))
+        self.services = TransitionServices(self.repositories)
+        self.repositories.order.save(
+            Domain.Order(
+                orderId="order-1",
+                customer=Domain.UserRef(userId="user-1"),
+                totalAmount=10.0,
+                discountCode=None,
+                tags=[],
+                shippingAddress=None,
+                approvedByUserId=None,
+                approvalNotes=None,
+                approvalReason=None,
+                shippingCarrier=None,
+                shippingTrackingNumber=None,
+                shippingPackageIds=None,
+                state="created",
+            )
+        )
+
+    def test_rejected_transitions_report_missing_and_wrong_state_without_reloading(self) -> None:
+        ref = Domain.OrderRef(orderId="order-1")
+        self.statements.clear()
+        self.services.order.approveOrder(ref)
+        self.assertEqual(self.statements.count("SELECT"), 0)
+
+        self.statements.clear()
+        with self.assertRaisesRegex(RuntimeError, "expected created but was approved"):
+            self.services.order.approveOrder(ref)
+        self.assertEqual(self.statements.count("SELECT"), 1)
+
+        rejected = self.repositories.order.apply_transition(
+            Domain.OrderRef(orderId="order-2"), "created", "approved", "trans_order_approve"
+        )
+        self.assertEqual(rejected, TransitionRejected())
+        self.assertTrue(rejected.missing)
+        with self.assertRaisesRegex(RuntimeError, "Order not found for transition 'approve'"):
+            self.services.order.approveOrder(Domain.OrderRef(orderId="order-2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,14 +5,19 @@ import dataclasses
 
 from dataclasses import dataclass
 from dataclasses import field
-from typing import Dict, Generic, List, Literal, Optional, Protocol, TypeVar, Union
+from typing import Callable, Dict, Generic, List, Literal, Optional, Protocol, Tuple, TypeVar, Union
 
 from prophet_events_runtime import EventPublisher
 from prophet_events_runtime import EventWireEnvelope
 from prophet_events_runtime import NoOpEventPublisher
+from prophet_events_runtime import SnapshotBaselines
+from prophet_events_runtime import SnapshotPolicy
+from prophet_events_runtime import SnapshotStats
+from prophet_events_runtime import apply_snapshot_policy
 from prophet_events_runtime import create_event_id
 from prophet_events_runtime import now_iso
 from prophet_events_runtime import publish_batch_sync
+from prophet_events_runtime import with_snapshot_mode
 
 from . import event_contracts as EventContracts
 
@@ -23,6 +28,7 @@ class EventPublishMetadata:
     trace_id: str
     source: str
     attributes: Optional[dict[str, str]] = None
+    snapshot_baselines: Optional[SnapshotBaselines] = None
 
 @dataclass(kw_only=True)
 class ActionOutcome(Generic[TOutput]):
@@ -143,32 +149,180 @@ def _normalize_payload_refs(payload: dict[str, object], bindings: List[_RefPathB
         _apply_binding_at_path(payload, binding, 0, updated_objects)
     return updated_objects
 
+def _plain(value: object) -> object:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+def _serialize_payload_with_bindings(payload: object, bindings: List[_RefPathBinding], updated_objects: List[dict[str, object]]) -> dict[str, object]:
+    serialized = _serialize_payload(_clone_json_like(payload))
+    updated_objects.extend(_normalize_payload_refs(serialized, bindings))
+    return serialized
+
+def _serialize_unbound_payload(payload: object, updated_objects: List[dict[str, object]]) -> dict[str, object]:
+    return _serialize_payload(_clone_json_like(payload))
+
+def _order_ref_to_wire(value: object, updated_objects: List[dict[str, object]]) -> object:
+    value_type = type(value)
+    if value_type is EventContracts.OrderRef:
+        return {'orderId': value.orderId}
+    if value_type is EventContracts.Order:
+        candidate = _order_to_dict(value)
+        if candidate['orderId'] is None:
+            return candidate
+        object_ref: dict[str, object] = {'orderId': candidate['orderId']}
+        updated_objects.append({'object_type': 'Order', 'object_ref': object_ref, 'object': candidate})
+        return object_ref
+    return _normalize_ref_value(_plain(value), _ORDER_REF_BINDING, updated_objects)
+
+_ORDER_REF_BINDING = _RefPathBinding(object_type='Order', path=[], primary_keys=['orderId'])
+
+def _order_to_dict(value: EventContracts.Order) -> dict[str, object]:
+    return {
+        'orderId': value.orderId,
+        'customer': _user_ref_to_dict(value.customer),
+        'totalAmount': value.totalAmount,
+        'discountCode': value.discountCode,
+        'tags': None if value.tags is None else list(value.tags),
+        'shippingAddress': _address_to_dict(value.shippingAddress),
+        'approvedByUserId': value.approvedByUserId,
+        'approvalNotes': None if value.approvalNotes is None else list(value.approvalNotes),
+        'approvalReason': value.approvalReason,
+        'shippingCarrier': value.shippingCarrier,
+        'shippingTrackingNumber': value.shippingTrackingNumber,
+        'shippingPackageIds': None if value.shippingPackageIds is None else list(value.shippingPackageIds),
+        'state': value.state,
+    }
+
+def _user_ref_to_dict(value: object) -> object:
+    value_type = type(value)
+    if value_type is EventContracts.UserRef:
+        return {'userId': value.userId}
+    if value_type is EventContracts.User:
+        return _user_to_dict(value)
+    return _plain(value)
+
+def _address_to_dict(value: object) -> object:
+    if type(value) is not EventContracts.Address:
+        return _plain(value)
+    return {
+        'line1': value.line1,
+        'city': value.city,
+        'countryCode': value.countryCode,
+    }
+
+def _user_to_dict(value: EventContracts.User) -> dict[str, object]:
+    return {
+        'userId': value.userId,
+        'email': value.email,
+    }
+
+_CREATE_ORDER_RESULT_REF_BINDINGS: List[_RefPathBinding] = [
+    _RefPathBinding(object_type='Order', path=['order'], primary_keys=['orderId']),
+]
+
+def _serialize_create_order_result_payload(payload: object, updated_objects: List[dict[str, object]]) -> dict[str, object]:
+    if type(payload) is not EventContracts.CreateOrderResult:
+        return _serialize_payload_with_bindings(payload, _CREATE_ORDER_RESULT_REF_BINDINGS, updated_objects)
+    return {
+        'order': _order_ref_to_wire(payload.order, updated_objects),
+    }
+
+_PAYMENT_CAPTURED_REF_BINDINGS: List[_RefPathBinding] = [
+    _RefPathBinding(object_type='Order', path=['order'], primary_keys=['orderId']),
+]
+
+def _serialize_payment_captured_payload(payload: object, updated_objects: List[dict[str, object]]) -> dict[str, object]:
+    if type(payload) is not EventContracts.PaymentCaptured:
+        return _serialize_payload_with_bindings(payload, _PAYMENT_CAPTURED_REF_BINDINGS, updated_objects)
+    return {
+        'order': _order_ref_to_wire(payload.order, updated_objects),
+    }
+
+def _serialize_order_approve_transition_payload(payload: object, updated_objects: List[dict[str, object]]) -> dict[str, object]:
+    if type(payload) is not EventContracts.OrderApproveTransition:
+        return _serialize_payload_with_bindings(payload, [], updated_objects)
+    return {
+        'orderId': payload.orderId,
+        'fromState': payload.fromState,
+        'toState': payload.toState,
+        'approvedByUserId': payload.approvedByUserId,
+        'noteCount': payload.noteCount,
+        'approvalReason': payload.approvalReason,
+    }
+
+def _serialize_order_ship_transition_payload(payload: object, updated_objects: List[dict[str, object]]) -> dict[str, object]:
+    if type(payload) is not EventContracts.OrderShipTransition:
+        return _serialize_payload_with_bindings(payload, [], updated_objects)
+    return {
+        'orderId': payload.orderId,
+        'fromState': payload.fromState,
+        'toState': payload.toState,
+        'carrier': payload.carrier,
+        'trackingNumber': payload.trackingNumber,
+        'packageIds': None if payload.packageIds is None else list(payload.packageIds),
+    }
+
+_SNAPSHOT_OBJECTS: Dict[type, Tuple[str, List[str], Callable[..., dict[str, object]]]] = {
+    EventContracts.Order: ('Order', ['orderId'], _order_to_dict),
+}
+
+# Records `value`'s pre-action state for `changed` snapshots; a no-op when baselines is None.
+def record_snapshot_baseline(baselines: Optional[SnapshotBaselines], value: object) -> None:
+    if baselines is None:
+        return
+    entry = _SNAPSHOT_OBJECTS.get(type(value))
+    if entry is None:
+        raise TypeError(f'Events do not extract snapshots of {type(value).__name__}')
+    object_type, primary_keys, to_dict = entry
+    state = to_dict(value)
+    baselines.record(object_type, {key: state[key] for key in primary_keys}, state)
+
+SNAPSHOT_STATS = SnapshotStats()
+_DEFAULT_SNAPSHOT_POLICY = SnapshotPolicy()
+_SNAPSHOT_POLICIES: Dict[str, SnapshotPolicy] = {
+}
+
+_PAYLOAD_SERIALIZERS: Dict[type, Callable[[object, List[dict[str, object]]], dict[str, object]]] = {
+    CreateOrderResultDomainEvent: _serialize_create_order_result_payload,
+    PaymentCapturedDomainEvent: _serialize_payment_captured_payload,
+    OrderApproveTransitionDomainEvent: _serialize_order_approve_transition_payload,
+    OrderShipTransitionDomainEvent: _serialize_order_ship_transition_payload,
+}
+
+def _payload_serializer_for(event: DomainEvent) -> Callable[[object, List[dict[str, object]]], dict[str, object]]:
+    serializer = _PAYLOAD_SERIALIZERS.get(type(event))
+    if serializer is not None:
+        return serializer
+    for event_type, candidate in _PAYLOAD_SERIALIZERS.items():
+        if isinstance(event, event_type):
+            return candidate
+    return _serialize_unbound_payload
+
 def _to_event_wire_envelope(event: DomainEvent, metadata: EventPublishMetadata) -> EventWireEnvelope:
-    ref_bindings: List[_RefPathBinding] = []
-    if isinstance(event, CreateOrderResultDomainEvent):
-        ref_bindings = [
-            _RefPathBinding(object_type='Order', path=['order'], primary_keys=['orderId']),
-        ]
-    elif isinstance(event, PaymentCapturedDomainEvent):
-        ref_bindings = [
-            _RefPathBinding(object_type='Order', path=['order'], primary_keys=['orderId']),
-        ]
-    elif isinstance(event, OrderApproveTransitionDomainEvent):
-        ref_bindings = []
-    elif isinstance(event, OrderShipTransitionDomainEvent):
-        ref_bindings = []
-    payload = _serialize_payload(_clone_json_like(getattr(event, 'payload', {})))
-    updated_objects = _normalize_payload_refs(payload, ref_bindings)
+    updated_objects: List[dict[str, object]] = []
+    payload = _payload_serializer_for(event)(getattr(event, 'payload', {}), updated_objects)
+    event_type = getattr(event, 'type', 'unknown')
+    policy = _SNAPSHOT_POLICIES.get(event_type, _DEFAULT_SNAPSHOT_POLICY)
     return EventWireEnvelope(
         event_id=create_event_id(),
         trace_id=metadata.trace_id,
-        event_type=getattr(event, 'type', 'unknown'),
+        event_type=event_type,
         schema_version='2.0.0',
         occurred_at=now_iso(),
         source=metadata.source,
         payload=payload,
-        attributes=metadata.attributes,
-        updated_objects=updated_objects or None,
+        attributes=with_snapshot_mode(metadata.attributes, policy),
+        updated_objects=apply_snapshot_policy(
+            updated_objects,
+            policy,
+            baselines=metadata.snapshot_baselines,
+            stats=SNAPSHOT_STATS,
+        ),
     )
 
 async def publish_domain_events(
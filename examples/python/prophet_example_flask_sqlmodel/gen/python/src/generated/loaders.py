@@ -0,0 +1,121 @@
+# Code generated by prophet-cli. DO NOT EDIT.
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, TypeVar, Union
+
+from . import domain as Domain
+from . import persistence as Persistence
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+class BatchLoader(Generic[K, V]):
+    def __init__(self, batch_fn: Callable[[List[K]], List[Optional[V]]], key_fn: Callable[[K], Hashable]):
+        self._batch_fn = batch_fn
+        self._key_fn = key_fn
+        self._values: Dict[Hashable, Optional[V]] = {}
+
+    def load(self, ref: K) -> Optional[V]:
+        return self.load_many([ref])[0]
+
+    def load_many(self, refs: List[K]) -> List[Optional[V]]:
+        keys = [self._key_fn(ref) for ref in refs]
+        missing: Dict[Hashable, K] = {}
+        for key, ref in zip(keys, refs):
+            if key not in self._values and key not in missing:
+                missing[key] = ref
+        if missing:
+            values = self._batch_fn(list(missing.values()))
+            self._values.update(zip(missing.keys(), values))
+        return [self._values[key] for key in keys]
+
+    def prime(self, ref: K, value: Optional[V]) -> None:
+        self._values.setdefault(self._key_fn(ref), value)
+
+    def clear(self, ref: K) -> None:
+        self._values.pop(self._key_fn(ref), None)
+
+    def clear_all(self) -> None:
+        self._values.clear()
+
+class IdentityMapRepository(Generic[K, V]):
+    def __init__(self, repository: Any, key_fn: Callable[[Any], Hashable]):
+        self._repository = repository
+        self._key_fn = key_fn
+        self._entries: Dict[Hashable, Optional[V]] = {}
+
+    def list(self, *args: Any, **kwargs: Any) -> Persistence.PagedResult:
+        return self._repository.list(*args, **kwargs)
+
+    def query(self, *args: Any, **kwargs: Any) -> Persistence.PagedResult:
+        return self._repository.query(*args, **kwargs)
+
+    def get_by_id(self, id: K) -> Optional[V]:
+        key = self._key_fn(id)
+        if key not in self._entries:
+            self._entries[key] = self._repository.get_by_id(id)
+        return self._entries[key]
+
+    def get_by_ids(self, ids: List[K]) -> List[Optional[V]]:
+        keys = [self._key_fn(id) for id in ids]
+        missing: Dict[Hashable, K] = {}
+        for key, id in zip(keys, ids):
+            if key not in self._entries and key not in missing:
+                missing[key] = id
+        if missing:
+            values = self._repository.get_by_ids(list(missing.values()))
+            self._entries.update(zip(missing.keys(), values))
+        return [self._entries[key] for key in keys]
+
+    def save(self, item: V) -> V:
+        saved = self._repository.save(item)
+        self._entries[self._key_fn(saved)] = saved
+        return saved
+
+    def save_many(self, items: List[V]) -> List[V]:
+        saved = self._repository.save_many(items)
+        for item in saved:
+            self._entries[self._key_fn(item)] = item
+        return saved
+
+    def clear(self, ref: K) -> None:
+        self._entries.pop(self._key_fn(ref), None)
+
+    def clear_all(self) -> None:
+        self._entries.clear()
+
+class StatefulIdentityMapRepository(IdentityMapRepository[K, V]):
+    def apply_transition(self, id: K, expected_state: str, next_state: str, transition_id: str) -> Union[V, Persistence.TransitionRejected]:
+        self.clear(id)
+        transitioned = self._repository.apply_transition(id, expected_state, next_state, transition_id)
+        if not isinstance(transitioned, Persistence.TransitionRejected):
+            self._entries[self._key_fn(transitioned)] = transitioned
+        return transitioned
+
+    def apply_transition_many(self, ids: List[K], expected_state: str, next_state: str, transition_id: str) -> List[V]:
+        for id in ids:
+            self.clear(id)
+        transitioned = self._repository.apply_transition_many(ids, expected_state, next_state, transition_id)
+        for item in transitioned:
+            self._entries[self._key_fn(item)] = item
+        return transitioned
+
+def _order_key(ref: Domain.OrderRef | Domain.Order) -> tuple:
+    return (ref.orderId,)
+
+def _user_key(ref: Domain.UserRef | Domain.User) -> tuple:
+    return (ref.userId,)
+
+class RepositoryLoaders:
+    def __init__(self, repositories: Persistence.Repositories):
+        self.order: BatchLoader[Domain.OrderRef, Domain.Order] = BatchLoader(repositories.order.get_by_ids, _order_key)
+        self.user: BatchLoader[Domain.UserRef, Domain.User] = BatchLoader(repositories.user.get_by_ids, _user_key)
+
+class IdentityMapRepositories:
+    def __init__(self, repositories: Persistence.Repositories):
+        self.order: StatefulIdentityMapRepository[Domain.OrderRef, Domain.Order] = StatefulIdentityMapRepository(repositories.order, _order_key)
+        self.user: IdentityMapRepository[Domain.UserRef, Domain.User] = IdentityMapRepository(repositories.user, _user_key)
+
+    def clear_all(self) -> None:
+        self.order.clear_all()
+        self.user.clear_all()
@@ -0,0 +1,304 @@
+# Code generated by prophet-cli. DO NOT EDIT.
+from __future__ import annotations
+
+from typing import Any
+
+from .actions import *
+from .domain import *
+from .query import *
+
+# Straight-line decoders from JSON to action inputs, query filters, domain objects, refs, and structs,
+# compiled from the IR field types. Known keys are decoded; nested refs and structs become their
+# dataclasses, and values that are not JSON objects pass through unchanged.
+
+def decode_order_ref(value: Any) -> OrderRef:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'orderId' in value:
+        kwargs['orderId'] = value['orderId']
+    return OrderRef(**kwargs)
+
+def decode_user_ref(value: Any) -> UserRef:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'userId' in value:
+        kwargs['userId'] = value['userId']
+    return UserRef(**kwargs)
+
+def decode_address(value: Any) -> Address:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'line1' in value:
+        kwargs['line1'] = value['line1']
+    if 'city' in value:
+        kwargs['city'] = value['city']
+    if 'countryCode' in value:
+        kwargs['countryCode'] = value['countryCode']
+    return Address(**kwargs)
+
+def decode_approval_context(value: Any) -> ApprovalContext:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'approver' in value:
+        kwargs['approver'] = decode_user_ref(value['approver'])
+    if 'watchers' in value:
+        field_value = value['watchers']
+        kwargs['watchers'] = [decode_user_ref(item0) for item0 in field_value] if isinstance(field_value, list) else field_value
+    if 'reason' in value:
+        kwargs['reason'] = value['reason']
+    return ApprovalContext(**kwargs)
+
+def decode_approve_order_command(value: Any) -> ApproveOrderCommand:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'order' in value:
+        kwargs['order'] = decode_order_ref(value['order'])
+    if 'approvedBy' in value:
+        kwargs['approvedBy'] = decode_user_ref(value['approvedBy'])
+    if 'notes' in value:
+        kwargs['notes'] = value['notes']
+    if 'context' in value:
+        kwargs['context'] = decode_approval_context(value['context'])
+    return ApproveOrderCommand(**kwargs)
+
+def decode_create_order_command(value: Any) -> CreateOrderCommand:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'customer' in value:
+        kwargs['customer'] = decode_user_ref(value['customer'])
+    if 'totalAmount' in value:
+        kwargs['totalAmount'] = value['totalAmount']
+    if 'discountCode' in value:
+        kwargs['discountCode'] = value['discountCode']
+    if 'tags' in value:
+        kwargs['tags'] = value['tags']
+    if 'shippingAddress' in value:
+        kwargs['shippingAddress'] = decode_address(value['shippingAddress'])
+    return CreateOrderCommand(**kwargs)
+
+def decode_ship_order_command(value: Any) -> ShipOrderCommand:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'order' in value:
+        kwargs['order'] = decode_order_ref(value['order'])
+    if 'carrier' in value:
+        kwargs['carrier'] = value['carrier']
+    if 'trackingNumber' in value:
+        kwargs['trackingNumber'] = value['trackingNumber']
+    if 'packageIds' in value:
+        kwargs['packageIds'] = value['packageIds']
+    return ShipOrderCommand(**kwargs)
+
+def decode_order(value: Any) -> Order:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'orderId' in value:
+        kwargs['orderId'] = value['orderId']
+    if 'customer' in value:
+        kwargs['customer'] = decode_user_ref(value['customer'])
+    if 'totalAmount' in value:
+        kwargs['totalAmount'] = value['totalAmount']
+    if 'discountCode' in value:
+        kwargs['discountCode'] = value['discountCode']
+    if 'tags' in value:
+        kwargs['tags'] = value['tags']
+    if 'shippingAddress' in value:
+        kwargs['shippingAddress'] = decode_address(value['shippingAddress'])
+    if 'approvedByUserId' in value:
+        kwargs['approvedByUserId'] = value['approvedByUserId']
+    if 'approvalNotes' in value:
+        kwargs['approvalNotes'] = value['approvalNotes']
+    if 'approvalReason' in value:
+        kwargs['approvalReason'] = value['approvalReason']
+    if 'shippingCarrier' in value:
+        kwargs['shippingCarrier'] = value['shippingCarrier']
+    if 'shippingTrackingNumber' in value:
+        kwargs['shippingTrackingNumber'] = value['shippingTrackingNumber']
+    if 'shippingPackageIds' in value:
+        kwargs['shippingPackageIds'] = value['shippingPackageIds']
+    if 'state' in value:
+        kwargs['state'] = value['state']
+    return Order(**kwargs)
+
+def decode_user(value: Any) -> User:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'userId' in value:
+        kwargs['userId'] = value['userId']
+    if 'email' in value:
+        kwargs['email'] = value['email']
+    return User(**kwargs)
+
+def _decode_order_approval_reason_filter(value: Any) -> OrderApprovalReasonFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'contains' in value:
+        kwargs['contains'] = value['contains']
+    return OrderApprovalReasonFilter(**kwargs)
+
+def _decode_order_approved_by_user_id_filter(value: Any) -> OrderApprovedByUserIdFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'contains' in value:
+        kwargs['contains'] = value['contains']
+    return OrderApprovedByUserIdFilter(**kwargs)
+
+def _decode_order_customer_filter(value: Any) -> OrderCustomerFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = decode_user_ref(value['eq'])
+    if 'inValues' in value:
+        field_value = value['inValues']
+        kwargs['inValues'] = [decode_user_ref(item0) for item0 in field_value] if isinstance(field_value, list) else field_value
+    return OrderCustomerFilter(**kwargs)
+
+def _decode_order_discount_code_filter(value: Any) -> OrderDiscountCodeFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'contains' in value:
+        kwargs['contains'] = value['contains']
+    return OrderDiscountCodeFilter(**kwargs)
+
+def _decode_order_order_id_filter(value: Any) -> OrderOrderIdFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'contains' in value:
+        kwargs['contains'] = value['contains']
+    return OrderOrderIdFilter(**kwargs)
+
+def _decode_order_shipping_carrier_filter(value: Any) -> OrderShippingCarrierFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'contains' in value:
+        kwargs['contains'] = value['contains']
+    return OrderShippingCarrierFilter(**kwargs)
+
+def _decode_order_shipping_tracking_number_filter(value: Any) -> OrderShippingTrackingNumberFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'contains' in value:
+        kwargs['contains'] = value['contains']
+    return OrderShippingTrackingNumberFilter(**kwargs)
+
+def _decode_order_state_filter(value: Any) -> OrderStateFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    return OrderStateFilter(**kwargs)
+
+def _decode_order_total_amount_filter(value: Any) -> OrderTotalAmountFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'gte' in value:
+        kwargs['gte'] = value['gte']
+    if 'lte' in value:
+        kwargs['lte'] = value['lte']
+    return OrderTotalAmountFilter(**kwargs)
+
+def decode_order_query_filter(value: Any) -> OrderQueryFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'approvalReason' in value:
+        kwargs['approvalReason'] = _decode_order_approval_reason_filter(value['approvalReason'])
+    if 'approvedByUserId' in value:
+        kwargs['approvedByUserId'] = _decode_order_approved_by_user_id_filter(value['approvedByUserId'])
+    if 'customer' in value:
+        kwargs['customer'] = _decode_order_customer_filter(value['customer'])
+    if 'discountCode' in value:
+        kwargs['discountCode'] = _decode_order_discount_code_filter(value['discountCode'])
+    if 'orderId' in value:
+        kwargs['orderId'] = _decode_order_order_id_filter(value['orderId'])
+    if 'shippingCarrier' in value:
+        kwargs['shippingCarrier'] = _decode_order_shipping_carrier_filter(value['shippingCarrier'])
+    if 'shippingTrackingNumber' in value:
+        kwargs['shippingTrackingNumber'] = _decode_order_shipping_tracking_number_filter(value['shippingTrackingNumber'])
+    if 'state' in value:
+        kwargs['state'] = _decode_order_state_filter(value['state'])
+    if 'totalAmount' in value:
+        kwargs['totalAmount'] = _decode_order_total_amount_filter(value['totalAmount'])
+    return OrderQueryFilter(**kwargs)
+
+def _decode_user_email_filter(value: Any) -> UserEmailFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'contains' in value:
+        kwargs['contains'] = value['contains']
+    return UserEmailFilter(**kwargs)
+
+def _decode_user_user_id_filter(value: Any) -> UserUserIdFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'eq' in value:
+        kwargs['eq'] = value['eq']
+    if 'inValues' in value:
+        kwargs['inValues'] = value['inValues']
+    if 'contains' in value:
+        kwargs['contains'] = value['contains']
+    return UserUserIdFilter(**kwargs)
+
+def decode_user_query_filter(value: Any) -> UserQueryFilter:
+    if not isinstance(value, dict):
+        return value
+    kwargs: dict[str, Any] = {}
+    if 'email' in value:
+        kwargs['email'] = _decode_user_email_filter(value['email'])
+    if 'userId' in value:
+        kwargs['userId'] = _decode_user_user_id_filter(value['userId'])
+    return UserQueryFilter(**kwargs)
@@ -0,0 +1,127 @@
+# Code generated by prophet-cli. DO NOT EDIT.
+from __future__ import annotations
+
+import dataclasses
+
+from prophet_events_runtime import dumps_json_bytes
+
+from .domain import *
+from .event_contracts import *
+from .persistence import PagedResult
+
+# Per-type response encoders: `<type>_to_json_dict` builds the JSON-ready dict in one pass over
+# the dataclass fields (ref fields holding a full object encode the object), and `<type>_to_json_bytes`
+# encodes it with dumps_json_bytes (orjson or msgspec when installed, else the stdlib).
+
+def _plain(value: object) -> object:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return value
+
+def _encode_order_ref(value: object) -> object:
+    if isinstance(value, OrderRef):
+        return {'orderId': value.orderId}
+    if isinstance(value, Order):
+        return order_to_json_dict(value)
+    return _plain(value)
+
+def _encode_user_ref(value: object) -> object:
+    if isinstance(value, UserRef):
+        return {'userId': value.userId}
+    if isinstance(value, User):
+        return user_to_json_dict(value)
+    return _plain(value)
+
+def _encode_address(value: Address) -> dict[str, object]:
+    return {
+        'line1': value.line1,
+        'city': value.city,
+        'countryCode': value.countryCode,
+    }
+
+def order_to_json_dict(value: Order) -> dict[str, object]:
+    return {
+        'orderId': value.orderId,
+        'customer': _encode_user_ref(value.customer),
+        'totalAmount': value.totalAmount,
+        'discountCode': value.discountCode,
+        'tags': None if value.tags is None else list(value.tags),
+        'shippingAddress': None if value.shippingAddress is None else _encode_address(value.shippingAddress),
+        'approvedByUserId': value.approvedByUserId,
+        'approvalNotes': None if value.approvalNotes is None else list(value.approvalNotes),
+        'approvalReason': value.approvalReason,
+        'shippingCarrier': value.shippingCarrier,
+        'shippingTrackingNumber': value.shippingTrackingNumber,
+        'shippingPackageIds': None if value.shippingPackageIds is None else list(value.shippingPackageIds),
+        'state': value.state,
+    }
+
+def order_to_json_bytes(value: Order) -> bytes:
+    return dumps_json_bytes(order_to_json_dict(value))
+
+def user_to_json_dict(value: User) -> dict[str, object]:
+    return {
+        'userId': value.userId,
+        'email': value.email,
+    }
+
+def user_to_json_bytes(value: User) -> bytes:
+    return dumps_json_bytes(user_to_json_dict(value))
+
+def order_page_to_json_dict(value: PagedResult) -> dict[str, object]:
+    return {
+        'content': [order_to_json_dict(item) for item in value.content],
+        'page': value.page,
+        'size': value.size,
+        'totalElements': value.totalElements,
+        'totalPages': value.totalPages,
+    }
+
+def order_page_to_json_bytes(value: PagedResult) -> bytes:
+    return dumps_json_bytes(order_page_to_json_dict(value))
+
+def user_page_to_json_dict(value: PagedResult) -> dict[str, object]:
+    return {
+        'content': [user_to_json_dict(item) for item in value.content],
+        'page': value.page,
+        'size': value.size,
+        'totalElements': value.totalElements,
+        'totalPages': value.totalPages,
+    }
+
+def user_page_to_json_bytes(value: PagedResult) -> bytes:
+    return dumps_json_bytes(user_page_to_json_dict(value))
+
+def create_order_result_to_json_dict(value: CreateOrderResult) -> dict[str, object]:
+    return {
+        'order': _encode_order_ref(value.order),
+    }
+
+def create_order_result_to_json_bytes(value: CreateOrderResult) -> bytes:
+    return dumps_json_bytes(create_order_result_to_json_dict(value))
+
+def order_approve_transition_to_json_dict(value: OrderApproveTransition) -> dict[str, object]:
+    return {
+        'orderId': value.orderId,
+        'fromState': value.fromState,
+        'toState': value.toState,
+        'approvedByUserId': value.approvedByUserId,
+        'noteCount': value.noteCount,
+        'approvalReason': value.approvalReason,
+    }
+
+def order_approve_transition_to_json_bytes(value: OrderApproveTransition) -> bytes:
+    return dumps_json_bytes(order_approve_transition_to_json_dict(value))
+
+def order_ship_transition_to_json_dict(value: OrderShipTransition) -> dict[str, object]:
+    return {
+        'orderId': value.orderId,
+        'fromState': value.fromState,
+        'toState': value.toState,
+        'carrier': value.carrier,
+        'trackingNumber': value.trackingNumber,
+        'packageIds': None if value.packageIds is None else list(value.packageIds),
+    }
+
+def order_ship_transition_to_json_bytes(value: OrderShipTransition) -> bytes:
+    return dumps_json_bytes(order_ship_transition_to_json_dict(value))
@@ -4,9 +4,12 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Union
 
-from sqlalchemy import func, update
+from sqlalchemy import func, inspect, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select
 
 from . import domain as Domain
@@ -21,6 +24,29 @@ def _serialize(value):
         return [_serialize(item) for item in value]
     return value
 
+_SAVE_MANY_CHUNK_SIZE = 500
+
+def _column_values(record) -> dict:
+    mapper = inspect(type(record))
+    return {attr.columns[0].name: getattr(record, attr.key) for attr in mapper.column_attrs}
+
+def _upsert_statement(session, model):
+    table = model.__table__
+    key_names = [column.name for column in table.primary_key.columns]
+    dialect = session.get_bind().dialect.name
+    if not key_names:
+        return None
+    if dialect in ('postgresql', 'sqlite'):
+        stmt = (postgresql_insert if dialect == 'postgresql' else sqlite_insert)(table)
+        updates = {column.name: stmt.excluded[column.name] for column in table.columns if column.name not in key_names}
+        if not updates:
+            return stmt.on_conflict_do_nothing(index_elements=key_names)
+        return stmt.on_conflict_do_update(index_elements=key_names, set_=updates)
+    if dialect in ('mysql', 'mariadb'):
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update({column.name: stmt.inserted[column.name] for column in table.columns})
+    return None
+
 def _order_to_model(item: Domain.Order) -> Models.OrderModel:
     return Models.OrderModel(
         orderId=_serialize(item.orderId),
@@ -191,21 +217,59 @@ class OrderSqlModelRepository:
                 return None
             return _order_to_domain(record)
 
+    def _get_by_ids_sync(self, ids: List[Domain.OrderRef]) -> List[Optional[Domain.Order]]:
+        if not ids:
+            return []
+        with self._session_factory() as session:
+            stmt = select(Models.OrderModel).where(Models.OrderModel.orderId.in_([id.orderId for id in ids]))
+            records = session.exec(stmt).all()
+            found = {(record.orderId,): _order_to_domain(record) for record in records}
+            return [found.get((id.orderId,)) for id in ids]
+
     def _save_sync(self, item: Domain.Order) -> Domain.Order:
         with self._session_factory() as session:
             model = _order_to_model(item)
-            session.merge(model)
+            stmt = _upsert_statement(session, Models.OrderModel)
+            if stmt is None:
+                session.merge(model)
+            else:
+                session.exec(stmt, params=_column_values(model))
             session.commit()
         return item
 
-    def _apply_transition_sync(self, id: Domain.OrderRef, expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> Optional[Domain.Order]:
+    def _save_many_sync(self, items: List[Domain.Order]) -> List[Domain.Order]:
+        if not items:
+            return []
+        with self._session_factory() as session:
+            stmt = _upsert_statement(session, Models.OrderModel)
+            if stmt is None:
+                for item in items:
+                    session.merge(_order_to_model(item))
+            else:
+                for start in range(0, len(items), _SAVE_MANY_CHUNK_SIZE):
+                    chunk = items[start : start + _SAVE_MANY_CHUNK_SIZE]
+                    session.exec(stmt, params=[_column_values(_order_to_model(item)) for item in chunk])
+            session.commit()
+        return list(items)
+
+    def _apply_transition_sync(self, id: Domain.OrderRef, expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> Union[Domain.Order, Persistence.TransitionRejected]:
         with self._session_factory() as session:
             stmt = update(Models.OrderModel).where(Models.OrderModel.state == expected_state)
             stmt = stmt.where(Models.OrderModel.orderId == id.orderId)
             stmt = stmt.values(state=next_state)
-            result = session.exec(stmt)
-            if int(getattr(result, 'rowcount', 0) or 0) < 1:
-                return None
+            transitioned = None
+            if session.get_bind().dialect.update_returning:
+                record = session.scalars(stmt.returning(Models.OrderModel)).first()
+                if record is not None:
+                    transitioned = _order_to_domain(record)
+                applied = record is not None
+            else:
+                result = session.exec(stmt)
+                applied = int(getattr(result, 'rowcount', 0) or 0) > 0
+            if not applied:
+                probe = select(Models.OrderModel.state)
+                probe = probe.where(Models.OrderModel.orderId == id.orderId)
+                return Persistence.TransitionRejected(current_state=session.exec(probe.limit(1)).first())
             history = Models.OrderStateHistoryModel(
                 orderId=id.orderId,
                 transitionId=transition_id,
@@ -214,13 +278,43 @@ class OrderSqlModelRepository:
             )
             session.add(history)
             session.commit()
+            if transitioned is not None:
+                return transitioned
             refreshed_stmt = select(Models.OrderModel)
             refreshed_stmt = refreshed_stmt.where(Models.OrderModel.orderId == id.orderId)
             refreshed = session.exec(refreshed_stmt.limit(1)).first()
             if refreshed is None:
-                return None
+                return Persistence.TransitionRejected()
             return _order_to_domain(refreshed)
 
+    def _apply_transition_many_sync(self, ids: List[Domain.OrderRef], expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> List[Domain.Order]:
+        if not ids:
+            return []
+        with self._session_factory() as session:
+            key_condition = Models.OrderModel.orderId.in_([id.orderId for id in ids])
+            if session.get_bind().dialect.update_returning:
+                stmt = update(Models.OrderModel).where(key_condition, Models.OrderModel.state == expected_state).values(state=next_state)
+                records = session.scalars(stmt.returning(Models.OrderModel)).all()
+            else:
+                stmt = select(Models.OrderModel).where(key_condition, Models.OrderModel.state == expected_state).with_for_update()
+                records = session.exec(stmt).all()
+                for record in records:
+                    record.state = next_state
+                session.flush()
+            transitioned = [_order_to_domain(record) for record in records]
+            history = [
+                Models.OrderStateHistoryModel(
+                    orderId=record.orderId,
+                    transitionId=transition_id,
+                    fromState=expected_state,
+                    toState=next_state,
+                )
+                for record in records
+            ]
+            session.bulk_save_objects(history)
+            session.commit()
+        return transitioned
+
     def list(self, page: int, size: int) -> Persistence.PagedResult:
         return self._list_sync(page, size)
 
@@ -230,12 +324,21 @@ class OrderSqlModelRepository:
     def get_by_id(self, id: Domain.OrderRef) -> Optional[Domain.Order]:
         return self._get_by_id_sync(id)
 
+    def get_by_ids(self, ids: List[Domain.OrderRef]) -> List[Optional[Domain.Order]]:
+        return self._get_by_ids_sync(ids)
+
     def save(self, item: Domain.Order) -> Domain.Order:
         return self._save_sync(item)
 
-    def apply_transition(self, id: Domain.OrderRef, expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> Optional[Domain.Order]:
+    def save_many(self, items: List[Domain.Order]) -> List[Domain.Order]:
+        return self._save_many_sync(items)
+
+    def apply_transition(self, id: Domain.OrderRef, expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> Union[Domain.Order, Persistence.TransitionRejected]:
         return self._apply_transition_sync(id, expected_state, next_state, transition_id)
 
+    def apply_transition_many(self, ids: List[Domain.OrderRef], expected_state: Domain.OrderState, next_state: Domain.OrderState, transition_id: str) -> List[Domain.Order]:
+        return self._apply_transition_many_sync(ids, expected_state, next_state, transition_id)
+
 def _user_to_model(item: Domain.User) -> Models.UserModel:
     return Models.UserModel(
         userId=_serialize(item.userId),
@@ -307,13 +410,41 @@ class UserSqlModelRepository:
                 return None
             return _user_to_domain(record)
 
+    def _get_by_ids_sync(self, ids: List[Domain.UserRef]) -> List[Optional[Domain.User]]:
+        if not ids:
+            return []
+        with self._session_factory() as session:
+            stmt = select(Models.UserModel).where(Models.UserModel.userId.in_([id.userId for id in ids]))
+            records = session.exec(stmt).all()
+            found = {(record.userId,): _user_to_domain(record) for record in records}
+            return [found.get((id.userId,)) for id in ids]
+
     def _save_sync(self, item: Domain.User) -> Domain.User:
         with self._session_factory() as session:
             model = _user_to_model(item)
-            session.merge(model)
+            stmt = _upsert_statement(session, Models.UserModel)
+            if stmt is None:
+                session.merge(model)
+            else:
+                session.exec(stmt, params=_column_values(model))
             session.commit()
         return item
 
+    def _save_many_sync(self, items: List[Domain.User]) -> List[Domain.User]:
+        if not items:
+            return []
+        with self._session_factory() as session:
+            stmt = _upsert_statement(session, Models.UserModel)
+            if stmt is None:
+                for item in items:
+                    session.merge(_user_to_model(item))
+            else:
+                for start in range(0, len(items), _SAVE_MANY_CHUNK_SIZE):
+                    chunk = items[start : start + _SAVE_MANY_CHUNK_SIZE]
+                    session.exec(stmt, params=[_column_values(_user_to_model(item)) for item in chunk])
+            session.commit()
+        return list(items)
+
     def list(self, page: int, size: int) -> Persistence.PagedResult:
         return self._list_sync(page, size)
 
@@ -323,9 +454,15 @@ class UserSqlModelRepository:
     def get_by_id(self, id: Domain.UserRef) -> Optional[Domain.User]:
         return self._get_by_id_sync(id)
 
+    def get_by_ids(self, ids: List[Domain.UserRef]) -> List[Optional[Domain.User]]:
+        return self._get_by_ids_sync(ids)
+
     def save(self, item: Domain.User) -> Domain.User:
         return self._save_sync(item)
 
+    def save_many(self, items: List[Domain.User]) -> List[Domain.User]:
+        return self._save_many_sync(items)
+
 class SqlModelRepositories:
     def __init__(self, session_factory: Callable[[], Session]):
         self.order = OrderSqlModelRepository(session_factory)
@@ -0,0 +1,94 @@
+# Code generated by prophet-cli. DO NOT EDIT.
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import List, Mapping, Optional, Protocol, Tuple
+
+from prophet_events_runtime import EventPublisher
+from prophet_events_runtime import EventWireEnvelope
+from prophet_events_runtime import TriggerBatchError
+from prophet_events_runtime import TriggerBinding
+from prophet_events_runtime import TriggerDispatcher
+from prophet_events_runtime import TriggerPolicy
+
+from .action_handlers import ActionContext
+from .action_service import ActionExecutionService
+from .actions import *
+
+TRIGGER_EVENT_TYPES: dict[str, str] = {
+    'onOrderApproved': 'OrderApproveTransition',
+    'onPaymentCaptured': 'PaymentCaptured',
+}
+
+# Builds each triggered action's input from the triggering envelope; returning None skips it.
+class TriggerInputMappers(Protocol):
+    def onOrderApproved(self, envelope: EventWireEnvelope) -> Optional[ShipOrderCommand]: ...
+
+    def onPaymentCaptured(self, envelope: EventWireEnvelope) -> Optional[ApproveOrderCommand]: ...
+
+# Triggered actions publish through the dispatcher, so chains continue in-process and keep the
+# triggering trace id; every envelope is also forwarded to `downstream` (default: context.eventPublisher).
+# A failed envelope is retried on its own; the rest of its batch is not re-run.
+# Use the returned dispatcher as the request ActionContext.eventPublisher to start chains.
+def build_trigger_dispatcher(
+    service: ActionExecutionService,
+    context: ActionContext,
+    inputs: TriggerInputMappers,
+    *,
+    concurrency: int = 4,
+    max_queue_size: int = 10000,
+    policies: Optional[Mapping[str, TriggerPolicy]] = None,
+    downstream: Optional[EventPublisher] = None,
+) -> TriggerDispatcher:
+    configured_policies = dict(policies or {})
+    dispatcher: TriggerDispatcher
+
+    def trigger_context(envelope: EventWireEnvelope) -> ActionContext:
+        return replace(context, eventPublisher=dispatcher, traceId=envelope.trace_id)
+
+    def run_on_order_approved(envelopes: List[EventWireEnvelope]) -> None:
+        failures: List[Tuple[EventWireEnvelope, BaseException]] = []
+        for envelope in envelopes:
+            try:
+                action_input = inputs.onOrderApproved(envelope)
+                if action_input is not None:
+                    service.execute_shipOrder(action_input, trigger_context(envelope))
+            except Exception as error:
+                failures.append((envelope, error))
+        if failures:
+            raise TriggerBatchError(failures)
+
+    def run_on_payment_captured(envelopes: List[EventWireEnvelope]) -> None:
+        failures: List[Tuple[EventWireEnvelope, BaseException]] = []
+        for envelope in envelopes:
+            try:
+                action_input = inputs.onPaymentCaptured(envelope)
+                if action_input is not None:
+                    service.execute_approveOrder(action_input, trigger_context(envelope))
+            except Exception as error:
+                failures.append((envelope, error))
+        if failures:
+            raise TriggerBatchError(failures)
+
+    dispatcher = TriggerDispatcher(
+        [
+            TriggerBinding(
+                name='onOrderApproved',
+                event_type=TRIGGER_EVENT_TYPES['onOrderApproved'],
+                invoke=run_on_order_approved,
+                policy=configured_policies.get('onOrderApproved', TriggerPolicy()),
+                blocking=True,
+            ),
+            TriggerBinding(
+                name='onPaymentCaptured',
+                event_type=TRIGGER_EVENT_TYPES['onPaymentCaptured'],
+                invoke=run_on_payment_captured,
+                policy=configured_policies.get('onPaymentCaptured', TriggerPolicy()),
+                blocking=True,
+            ),
+        ],
+        concurrency=concurrency,
+        max_queue_size=max_queue_size,
+        downstream=downstream if downstream is not None else context.eventPublisher,
+    )
+    return dispatcher
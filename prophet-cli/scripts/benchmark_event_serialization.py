@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "prophet-lib" / "python" / "scripts"))
+
+from benchmark_stats import summarize  # noqa: E402
+
+
+def _bindings_constant(event: Any) -> str:
+    event_name = type(event).__name__.removesuffix("DomainEvent")
+    return "_" + re.sub(r"(?<!^)(?=[A-Z])", "_", event_name).upper() + "_REF_BINDINGS"
+
+
+def _legacy_serialize(events: Any, event: Any) -> Tuple[Dict[str, object], List[Dict[str, object]]]:
+    # Mirrors the pre-compiled path: clone, dataclasses.asdict, then walk ref binding paths.
+    bindings = getattr(events, _bindings_constant(event), [])
+    payload = events._serialize_payload(events._clone_json_like(getattr(event, "payload", {})))
+    return payload, events._normalize_payload_refs(payload, bindings)
+
+
+def _compiled_serialize(events: Any, event: Any) -> Tuple[Dict[str, object], List[Dict[str, object]]]:
+    updated_objects: List[Dict[str, object]] = []
+    payload = events._payload_serializer_for(event)(getattr(event, "payload", {}), updated_objects)
+    return payload, updated_objects
+
+
+def _sample_events(events: Any, domain: Any, contracts: Any) -> List[Any]:
+    order = domain.Order(
+        orderId="order-1",
+        customer=domain.UserRef(userId="user-1"),
+        totalAmount=125.5,
+        discountCode="WELCOME",
+        tags=["priority", "gift"],
+        shippingAddress=domain.Address(line1="1 Main St", city="Springfield", countryCode="US"),
+        approvedByUserId=None,
+        approvalNotes=["looks good"],
+        approvalReason=None,
+        shippingCarrier=None,
+        shippingTrackingNumber=None,
+        shippingPackageIds=None,
+        state="created",
+    )
+    return [
+        events.create_create_order_result_event(contracts.CreateOrderResult(order=order)),
+        events.create_payment_captured_event(contracts.PaymentCaptured(order=domain.OrderRef(orderId="order-1"))),
+        events.create_order_approve_transition_event(
+            contracts.OrderApproveTransition(
+                orderId="order-1",
+                fromState="created",
+                toState="approved",
+                approvedByUserId="user-2",
+                noteCount=1,
+                approvalReason="ok",
+            )
+        ),
+        events.create_order_ship_transition_event(
+            contracts.OrderShipTransition(
+                orderId="order-1",
+                fromState="approved",
+                toState="shipped",
+                carrier="UPS",
+                trackingNumber="1Z999",
+                packageIds=["pkg-1", "pkg-2"],
+            )
+        ),
+    ]
+
+
+def _time_batches(fn: Callable[[Any, Any], object], events: Any, batch: List[Any], iterations: int) -> List[float]:
+    durations: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for event in batch:
+            fn(events, event)
+        durations.append((time.perf_counter() - start) / len(batch))
+    return durations
+
+
+def main() -> int:
+    iterations = 20000
+    if len(sys.argv) > 1:
+        iterations = int(sys.argv[1])
+        if iterations < 1:
+            raise ValueError("iterations must be >= 1")
+
+    repo_root = Path(__file__).resolve().parents[2]
+    example_root = repo_root / "examples" / "python" / "prophet_example_flask_sqlalchemy"
+    sys.path.insert(0, str(repo_root / "prophet-lib" / "python" / "src"))
+    sys.path.insert(0, str(example_root / "gen" / "python" / "src"))
+    events = importlib.import_module("generated.events")
+    domain = importlib.import_module("generated.domain")
+    contracts = importlib.import_module("generated.event_contracts")
+
+    batch = _sample_events(events, domain, contracts)
+    for event in batch:
+        if _legacy_serialize(events, event) != _compiled_serialize(events, event):
+            raise RuntimeError(f"Compiled serializer output differs for {type(event).__name__}")
+
+    legacy = summarize(_time_batches(_legacy_serialize, events, batch, iterations))
+    compiled = summarize(_time_batches(_compiled_serialize, events, batch, iterations))
+    speedup = legacy["mean_us"] / compiled["mean_us"] if compiled["mean_us"] else 0.0
+
+    payload = {
+        "benchmark": "event_payload_serialization",
+        "iterations": iterations,
+        "events_per_iteration": len(batch),
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+        },
+        "results": {
+            "legacy_asdict": legacy,
+            "compiled": compiled,
+            "speedup_factor_mean": speedup,
+        },
+    }
+    print(json.dumps(payload, indent=2, sort_keys=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
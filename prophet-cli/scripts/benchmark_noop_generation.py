@@ -4,13 +4,15 @@ from __future__ import annotations
 import json
 import os
 import shutil
-import statistics
 import subprocess
 import sys
 import tempfile
 import time
 from pathlib import Path
-from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "prophet-lib" / "python" / "scripts"))
+
+from benchmark_stats import summarize  # noqa: E402
 
 
 def _run_cli(repo_root: Path, cwd: Path, *args: str) -> float:
@@ -35,30 +37,6 @@ def _run_cli(repo_root: Path, cwd: Path, *args: str) -> float:
     return end - start
 
 
-def _percentile(values: List[float], pct: float) -> float:
-    if not values:
-        return 0.0
-    if len(values) == 1:
-        return values[0]
-    ordered = sorted(values)
-    rank = (len(ordered) - 1) * pct
-    lower = int(rank)
-    upper = min(lower + 1, len(ordered) - 1)
-    weight = rank - lower
-    return ordered[lower] * (1.0 - weight) + ordered[upper] * weight
-
-
-def _summarize(values: List[float]) -> Dict[str, float]:
-    return {
-        "count": float(len(values)),
-        "mean_ms": statistics.mean(values) * 1000.0,
-        "median_ms": statistics.median(values) * 1000.0,
-        "p95_ms": _percentile(values, 0.95) * 1000.0,
-        "min_ms": min(values) * 1000.0,
-        "max_ms": max(values) * 1000.0,
-    }
-
-
 def main() -> int:
     iterations = 10
     if len(sys.argv) > 1:
@@ -95,8 +73,8 @@ def main() -> int:
         for _ in range(iterations):
             skip_durations.append(_run_cli(repo_root, work_root, "gen", "--skip-unchanged"))
 
-    gen_summary = _summarize(gen_durations)
-    skip_summary = _summarize(skip_durations)
+    gen_summary = summarize(gen_durations, "ms")
+    skip_summary = summarize(skip_durations, "ms")
     speedup = gen_summary["mean_ms"] / skip_summary["mean_ms"] if skip_summary["mean_ms"] else 0.0
 
     payload = {
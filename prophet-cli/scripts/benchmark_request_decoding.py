@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import json
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Union, get_args, get_origin, get_type_hints
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "prophet-lib" / "python" / "scripts"))
+
+from benchmark_stats import summarize  # noqa: E402
+
+
+_TYPE_HINT_CACHE: Dict[type, Dict[str, Any]] = {}
+_HINT_NAMESPACE: Dict[str, Any] = {}
+
+
+def _legacy_coerce(expected_type: Any, value: Any) -> Any:
+    # Mirrors the reflective `_coerce_value` the route modules used before request decoders were generated.
+    if value is None:
+        return None
+    origin = get_origin(expected_type)
+    if origin is list:
+        (item_type,) = get_args(expected_type) or (Any,)
+        if not isinstance(value, list):
+            return value
+        return [_legacy_coerce(item_type, item) for item in value]
+    if origin is dict:
+        return value
+    if origin in (types.UnionType, Union):
+        args = [item for item in get_args(expected_type) if item is not type(None)]
+        if len(args) == 1:
+            return _legacy_coerce(args[0], value)
+        for arg in args:
+            try:
+                return _legacy_coerce(arg, value)
+            except Exception:
+                continue
+        return value
+    if isinstance(expected_type, type) and dataclasses.is_dataclass(expected_type):
+        if isinstance(value, expected_type):
+            return value
+        if not isinstance(value, dict):
+            return value
+        hints = _TYPE_HINT_CACHE.get(expected_type)
+        if hints is None:
+            hints = get_type_hints(expected_type, globalns=_HINT_NAMESPACE, localns=_HINT_NAMESPACE)
+            _TYPE_HINT_CACHE[expected_type] = hints
+        kwargs: Dict[str, Any] = {}
+        for field in dataclasses.fields(expected_type):
+            if field.name in value:
+                kwargs[field.name] = _legacy_coerce(hints.get(field.name, Any), value[field.name])
+        return expected_type(**kwargs)
+    return value
+
+
+def _sample_requests(decoders: Any) -> List[Tuple[str, Callable[[Any], Any], Dict[str, Any]]]:
+    return [
+        (
+            "CreateOrderCommand",
+            decoders.decode_create_order_command,
+            {
+                "customer": {"userId": "user-1"},
+                "totalAmount": 125.5,
+                "discountCode": "WELCOME",
+                "tags": ["priority", "gift"],
+                "shippingAddress": {"line1": "1 Main St", "city": "Springfield", "countryCode": "US"},
+            },
+        ),
+        (
+            "ApproveOrderCommand",
+            decoders.decode_approve_order_command,
+            {
+                "order": {"orderId": "order-1"},
+                "approvedBy": {"userId": "user-2"},
+                "notes": ["looks good"],
+                "context": {
+                    "approver": {"userId": "user-2"},
+                    "watchers": [{"userId": "user-3"}, {"userId": "user-4"}],
+                    "reason": "ok",
+                },
+            },
+        ),
+        (
+            "OrderQueryFilter",
+            decoders.decode_order_query_filter,
+            {
+                "customer": {"inValues": [{"userId": "user-1"}, {"userId": "user-2"}]},
+                "totalAmount": {"gte": 10, "lte": 500},
+                "state": {"eq": "created"},
+                "discountCode": {"contains": "WEL"},
+            },
+        ),
+    ]
+
+
+def _time_batches(
+    batch: List[Tuple[Callable[[Any], Any], Dict[str, Any]]],
+    iterations: int,
+) -> List[float]:
+    durations: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        for decode, payload in batch:
+            decode(payload)
+        durations.append((time.perf_counter() - start) / len(batch))
+    return durations
+
+
+def main() -> int:
+    iterations = 20000
+    if len(sys.argv) > 1:
+        iterations = int(sys.argv[1])
+        if iterations < 1:
+            raise ValueError("iterations must be >= 1")
+
+    repo_root = Path(__file__).resolve().parents[2]
+    example_root = repo_root / "examples" / "python" / "prophet_example_flask_sqlalchemy"
+    sys.path.insert(0, str(repo_root / "prophet-lib" / "python" / "src"))
+    sys.path.insert(0, str(example_root / "gen" / "python" / "src"))
+    decoders = importlib.import_module("generated.request_decoders")
+    for module_name in ("generated.domain", "generated.actions", "generated.query"):
+        _HINT_NAMESPACE.update(vars(importlib.import_module(module_name)))
+
+    samples = _sample_requests(decoders)
+    legacy_batch: List[Tuple[Callable[[Any], Any], Dict[str, Any]]] = []
+    generated_batch: List[Tuple[Callable[[Any], Any], Dict[str, Any]]] = []
+    for class_name, decode, payload in samples:
+        expected_type = _HINT_NAMESPACE[class_name]
+        if _legacy_coerce(expected_type, payload) != decode(payload):
+            raise RuntimeError(f"Generated decoder output differs for {class_name}")
+        legacy_batch.append((lambda value, expected_type=expected_type: _legacy_coerce(expected_type, value), payload))
+        generated_batch.append((decode, payload))
+
+    legacy = summarize(_time_batches(legacy_batch, iterations))
+    generated = summarize(_time_batches(generated_batch, iterations))
+    speedup = legacy["mean_us"] / generated["mean_us"] if generated["mean_us"] else 0.0
+
+    payload = {
+        "benchmark": "request_decoding",
+        "iterations": iterations,
+        "requests_per_iteration": len(samples),
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+        },
+        "results": {
+            "legacy_reflective": legacy,
+            "generated": generated,
+            "speedup_factor_mean": speedup,
+        },
+    }
+    print(json.dumps(payload, indent=2, sort_keys=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
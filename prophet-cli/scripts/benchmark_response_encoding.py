@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "prophet-lib" / "python" / "scripts"))
+
+from benchmark_stats import summarize  # noqa: E402
+
+
+def _legacy_encode(value: Any) -> bytes:
+    # Mirrors the previous route path: dataclasses.asdict, then a stdlib JSON encode of the copy.
+    return json.dumps(dataclasses.asdict(value)).encode("utf-8")
+
+
+def _sample_page(domain: Any, persistence: Any, size: int) -> Any:
+    orders = [
+        domain.Order(
+            orderId=f"order-{index}",
+            customer=domain.UserRef(userId=f"user-{index % 17}"),
+            totalAmount=125.5 + index,
+            discountCode="WELCOME" if index % 3 == 0 else None,
+            tags=["priority", "gift"],
+            shippingAddress=domain.Address(line1=f"{index} Main St", city="Springfield", countryCode="US"),
+            approvedByUserId=None,
+            approvalNotes=["looks good"],
+            approvalReason=None,
+            shippingCarrier=None,
+            shippingTrackingNumber=None,
+            shippingPackageIds=None,
+            state="created",
+        )
+        for index in range(size)
+    ]
+    return persistence.PagedResult(content=orders, page=0, size=size, totalElements=size, totalPages=1)
+
+
+def _time_runs(fn: Callable[[Any], bytes], value: Any, iterations: int) -> List[float]:
+    durations: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(value)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main() -> int:
+    iterations = 2000
+    if len(sys.argv) > 1:
+        iterations = int(sys.argv[1])
+        if iterations < 1:
+            raise ValueError("iterations must be >= 1")
+    page_size = 200
+
+    repo_root = Path(__file__).resolve().parents[2]
+    example_root = repo_root / "examples" / "python" / "prophet_example_flask_sqlalchemy"
+    sys.path.insert(0, str(repo_root / "prophet-lib" / "python" / "src"))
+    sys.path.insert(0, str(example_root / "gen" / "python" / "src"))
+    runtime = importlib.import_module("prophet_events_runtime")
+    encoders = importlib.import_module("generated.response_encoders")
+    domain = importlib.import_module("generated.domain")
+    persistence = importlib.import_module("generated.persistence")
+
+    page = _sample_page(domain, persistence, page_size)
+    if json.loads(_legacy_encode(page)) != json.loads(encoders.order_page_to_json_bytes(page)):
+        raise RuntimeError("Generated response encoder output differs from dataclasses.asdict")
+
+    legacy = summarize(_time_runs(_legacy_encode, page, iterations))
+    generated = summarize(_time_runs(encoders.order_page_to_json_bytes, page, iterations))
+    speedup = legacy["mean_us"] / generated["mean_us"] if generated["mean_us"] else 0.0
+
+    payload = {
+        "benchmark": "response_encoding",
+        "iterations": iterations,
+        "page_size": page_size,
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "json_backend": runtime.JSON_BACKEND,
+        },
+        "results": {
+            "legacy_asdict_json": legacy,
+            "generated": generated,
+            "speedup_factor_mean": speedup,
+        },
+    }
+    print(json.dumps(payload, indent=2, sort_keys=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
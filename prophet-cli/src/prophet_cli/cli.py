@@ -1579,7 +1579,7 @@ def _generate_outputs_for_python(context: GenerationContext) -> Dict[str, str]:
     deps = PythonDeps(
         cfg_get=cfg_get,
         resolve_stack_spec=resolve_stack_spec,
-        render_sql=lambda reader: render_sql(reader.as_dict()),
+        render_sql=lambda reader, **kwargs: render_sql(reader.as_dict(), **kwargs),
         render_openapi=lambda reader: render_openapi(reader.as_dict()),
         render_turtle=lambda reader: render_turtle(reader.as_dict()),
         toolchain_version=TOOLCHAIN_VERSION,
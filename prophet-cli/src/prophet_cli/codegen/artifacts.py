@@ -34,6 +34,7 @@ def managed_existing_files(root: Path, out_dir: str) -> List[str]:
         root / out_dir / "sql",
         root / out_dir / "migrations",
         root / out_dir / "openapi",
+        root / out_dir / "wire",
         root / out_dir / "spring-boot",
         root / out_dir / "manifest",
     ]
@@ -114,7 +114,26 @@ def yaml_dump_stable(value: Any) -> str:
     return yaml.safe_dump(value, sort_keys=False, default_flow_style=False).rstrip() + "\n"
 
 
-def render_sql(ir: Dict[str, Any]) -> str:
+def render_event_outbox_sql() -> List[str]:
+    return [
+        "create table if not exists prophet_event_outbox (",
+        "  event_id text primary key,",
+        "  event_type text not null,",
+        "  trace_id text not null,",
+        "  envelope text not null,",
+        "  attempts integer not null default 0,",
+        "  last_error text,",
+        "  created_at timestamptz not null default now(),",
+        "  published_at timestamptz,",
+        "  locked_until timestamptz,",
+        "  parked_at timestamptz",
+        ");",
+        "create index if not exists idx_prophet_outbox_pending on prophet_event_outbox (published_at, created_at);",
+        "",
+    ]
+
+
+def render_sql(ir: Dict[str, Any], *, event_outbox: bool = False) -> str:
     lines: List[str] = []
     lines.append("-- GENERATED FILE: do not edit directly.")
     lines.append("-- Source: configured ontology file (project.ontology_file)")
@@ -280,6 +299,12 @@ def render_sql(ir: Dict[str, Any]) -> str:
 
         lines.append("")
 
+    if event_outbox:
+        while lines and not lines[-1]:
+            lines.pop()
+        lines.append("")
+        lines.extend(render_event_outbox_sql())
+
     return "\n".join(lines).rstrip() + "\n"
 
 
@@ -779,6 +804,26 @@ def render_openapi(ir: Dict[str, Any]) -> str:
     struct_by_id = {s["id"]: s for s in structs}
     action_input_by_id = {s["id"]: s for s in action_inputs}
     event_by_id = {e["id"]: e for e in events if isinstance(e, dict) and "id" in e}
+    cursor_object_ids = {
+        str(c.get("object_id", ""))
+        for c in ir.get("query_contracts", [])
+        if isinstance(c, dict) and isinstance(c.get("pageable", {}).get("cursor"), dict)
+    }
+    optional_total_object_ids = {
+        str(c.get("object_id", ""))
+        for c in ir.get("query_contracts", [])
+        if isinstance(c, dict) and isinstance(c.get("pageable", {}).get("total"), dict)
+    }
+    export_by_object_id = {
+        str(c.get("object_id", "")): c["export"]
+        for c in ir.get("query_contracts", [])
+        if isinstance(c, dict) and isinstance(c.get("export"), dict) and c["export"].get("formats")
+    }
+    projection_by_object_id = {
+        str(c.get("object_id", "")): c["projection"]
+        for c in ir.get("query_contracts", [])
+        if isinstance(c, dict) and isinstance(c.get("projection"), dict) and c["projection"].get("fields")
+    }
 
     def _resolved_display_name(item: Dict[str, Any]) -> str:
         explicit = str(item.get("display_name", "")).strip()
@@ -876,6 +921,32 @@ def render_openapi(ir: Dict[str, Any]) -> str:
                 "totalPages": {"type": "integer"},
             },
         }
+        if obj["id"] in optional_total_object_ids:
+            components_schemas[f"{obj['name']}ListResponse"]["required"] = ["items", "page", "size"]
+        if obj["id"] in cursor_object_ids:
+            components_schemas[f"{obj['name']}ListResponse"]["properties"]["nextCursor"] = {
+                "type": "string",
+                "description": "Opaque keyset cursor for the next page; absent on the last page",
+            }
+        projection = projection_by_object_id.get(obj["id"])
+        if projection is not None:
+            fields_by_id = {f["id"]: f for f in obj.get("fields", [])}
+            components_schemas[f"{obj['name']}Projection"] = {
+                "type": "object",
+                "description": f"{obj['name']} restricted to the requested fields; key fields are always present",
+                "required": [
+                    camel_case(fields_by_id[field_id]["name"])
+                    for field_id in projection.get("always_field_ids", [])
+                    if field_id in fields_by_id
+                ],
+                "properties": dict(properties),
+            }
+            components_schemas[f"{obj['name']}ListResponse"]["properties"]["items"]["items"] = {
+                "anyOf": [
+                    {"$ref": f"#/components/schemas/{obj['name']}"},
+                    {"$ref": f"#/components/schemas/{obj['name']}Projection"},
+                ]
+            }
 
     for shape in action_inputs:
         required_props: List[str] = []
@@ -950,6 +1021,51 @@ def render_openapi(ir: Dict[str, Any]) -> str:
                 "description": "Sort expression, for example field,asc",
             },
         ]
+        if obj["id"] in cursor_object_ids:
+            list_parameters.append(
+                {
+                    "name": "cursor",
+                    "in": "query",
+                    "required": False,
+                    "schema": {"type": "string"},
+                    "description": "Opaque keyset cursor returned as nextCursor; when set, page is ignored",
+                }
+            )
+        if obj["id"] in optional_total_object_ids:
+            list_parameters.append(
+                {
+                    "name": "includeTotal",
+                    "in": "query",
+                    "required": False,
+                    "schema": {"type": "boolean"},
+                    "description": "Whether to compute totalElements and totalPages for this page",
+                }
+            )
+        fields_parameters: List[Dict[str, Any]] = []
+        projection = projection_by_object_id.get(obj["id"])
+        if projection is not None:
+            fields_parameters.append(
+                {
+                    "name": str(projection.get("param", "fields")),
+                    "in": "query",
+                    "required": False,
+                    "style": "form",
+                    "explode": False,
+                    "schema": {
+                        "type": "array",
+                        "items": {
+                            "type": "string",
+                            "enum": [
+                                camel_case(str(item.get("field_name", "")))
+                                for item in projection.get("fields", [])
+                                if isinstance(item, dict)
+                            ],
+                        },
+                    },
+                    "description": "Comma-separated fields to return; key fields are always included and unknown names are rejected",
+                }
+            )
+            list_parameters.extend(fields_parameters)
 
         def field_base_type(field_type: Dict[str, Any]) -> Optional[str]:
             if field_type["kind"] == "base":
@@ -1027,7 +1143,7 @@ def render_openapi(ir: Dict[str, Any]) -> str:
         paths[f"/{table}/query"] = {
             "post": {
                 "operationId": f"query{obj['name']}",
-                "parameters": list_parameters[:3],
+                "parameters": list(list_parameters),
                 "requestBody": {
                     "required": False,
                     "content": {
@@ -1048,6 +1164,43 @@ def render_openapi(ir: Dict[str, Any]) -> str:
                 },
             }
         }
+        export = export_by_object_id.get(obj["id"])
+        if export is not None:
+            export_formats = [str(item) for item in export.get("formats", [])]
+            export_content: Dict[str, Any] = {}
+            if "ndjson" in export_formats:
+                export_content["application/x-ndjson"] = {"schema": {"$ref": f"#/components/schemas/{obj['name']}"}}
+            if "csv" in export_formats:
+                export_content["text/csv"] = {"schema": {"type": "string"}}
+            paths[f"/{table}/export"] = {
+                "post": {
+                    "operationId": f"export{obj['name']}",
+                    "parameters": [
+                        {
+                            "name": "format",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "enum": export_formats, "default": export_formats[0]},
+                            "description": "Streaming format: one JSON object per line (ndjson) or a CSV table with a header row",
+                        }
+                    ],
+                    "requestBody": {
+                        "required": False,
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/{query_filter_name}"}
+                            }
+                        },
+                    },
+                    "responses": {
+                        "200": {
+                            "description": f"Every {obj['name']} matching the filter, streamed without pagination",
+                            "content": export_content,
+                        },
+                        "400": {"description": "Unsupported export format"},
+                    },
+                }
+            }
         pk_path_parts: List[str] = []
         pk_params: List[Dict[str, Any]] = []
         for key_field in pk_fields:
@@ -1086,6 +1239,18 @@ def render_openapi(ir: Dict[str, Any]) -> str:
                 },
             }
         }
+        if projection is not None:
+            get_operation = paths[f"/{table}/{pk_path}"]["get"]
+            get_operation["parameters"] = [*get_operation["parameters"], *fields_parameters]
+            get_operation["responses"]["200"]["content"]["application/json"]["schema"] = {
+                "anyOf": [
+                    {"$ref": f"#/components/schemas/{obj['name']}"},
+                    {"$ref": f"#/components/schemas/{obj['name']}Projection"},
+                ]
+            }
+            get_operation["responses"]["400"] = {"description": "Unknown field in fields"}
+            for operation in (paths[f"/{table}"]["get"], paths[f"/{table}/query"]["post"]):
+                operation["responses"]["400"] = {"description": "Unknown field in fields"}
 
     for action in actions:
         req_name = action_input_by_id[action["input_shape_id"]]["name"]
@@ -24,6 +24,7 @@ KNOWN_GENERATION_TARGETS = (
     "flyway",
     "liquibase",
     "manifest",
+    "wire_schema",
     "node_express",
     "python",
     "fastapi",
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List
+
+from prophet_cli.codegen.rendering import camel_case
+from prophet_cli.codegen.rendering import pascal_case
+from prophet_cli.core.compatibility import wire_field_tags
+
+WIRE_CODEC_VERSION = 1
+
+
+def render_wire_schema(ir: Dict[str, Any], *, event_type_name: Callable[[str], str] = pascal_case) -> str:
+    """Event codec schema for the compact wire codec (prophet-lib/specs/wire-compact-codec.md).
+
+    Tags come from `wire_field_tags` over the event's IR field ids, so reordering fields keeps
+    them; `compare_irs` flags the rare collision that moves one. `event_type_name` must match
+    how the stack names events in published envelopes.
+    """
+    events: List[Dict[str, Any]] = []
+    seen_event_types: set[str] = set()
+    for event in sorted([item for item in ir.get("events", []) if isinstance(item, dict)], key=lambda item: str(item.get("id", ""))):
+        event_type = event_type_name(str(event.get("name", "Event")))
+        if event_type in seen_event_types:
+            continue
+        seen_event_types.add(event_type)
+        fields = [field for field in event.get("fields", []) if isinstance(field, dict)]
+        tags = wire_field_tags([str(field.get("id", "")) for field in fields])
+        events.append(
+            {
+                "event_type": event_type,
+                "id": str(event.get("id", "")),
+                "fields": [
+                    {
+                        "tag": tags[str(field.get("id", ""))],
+                        "name": camel_case(str(field.get("name", "field"))),
+                        "field_id": str(field.get("id", "")),
+                    }
+                    for field in fields
+                ],
+            }
+        )
+    ontology = ir.get("ontology", {})
+    document = {
+        "codec_version": WIRE_CODEC_VERSION,
+        "ontology": str(ontology.get("name", "")),
+        "schema_version": str(ontology.get("version", "1.0.0")),
+        "events": events,
+    }
+    return json.dumps(document, indent=2, sort_keys=False) + "\n"
@@ -38,6 +38,27 @@ def parse_semver(version: str) -> Tuple[int, int, int]:
     return int(m.group(1)), int(m.group(2)), int(m.group(3))
 
 
+WIRE_TAG_LIMIT = 0xFFFF
+
+
+def wire_field_tags(field_ids: List[str]) -> Dict[str, int]:
+    """Compact-codec payload tags for one event, keyed by IR field id.
+
+    Each tag is the first four bytes of the id's SHA-256 folded into 1..65535, so it does not
+    depend on declaration order. On a collision the id that sorts later takes the next free tag.
+    """
+    tags: Dict[str, int] = {}
+    taken: set[int] = set()
+    for field_id in sorted(set(field_ids)):
+        digest = hashlib.sha256(field_id.encode("utf-8")).digest()
+        tag = int.from_bytes(digest[:4], "big") % WIRE_TAG_LIMIT + 1
+        while tag in taken:
+            tag = tag % WIRE_TAG_LIMIT + 1
+        taken.add(tag)
+        tags[field_id] = tag
+    return tags
+
+
 def required_level_to_bump(level: str) -> str:
     if level == "breaking":
         return "major"
@@ -134,9 +155,53 @@ def query_filter_operators_for_field(
     return ["eq", "in"]
 
 
-def build_query_contracts(ir: Dict[str, Any]) -> List[Dict[str, Any]]:
+def cursor_key_field_ids_for_object(
+    obj: Dict[str, Any],
+    key_field_ids: List[Any],
+    sort_field: Optional[str] = None,
+) -> List[str]:
+    fields_by_id = {f.get("id"): f for f in obj.get("fields", []) if isinstance(f, dict)}
+    fields_by_name = {f.get("name"): f for f in obj.get("fields", []) if isinstance(f, dict)}
+
+    def _is_seekable(field: Optional[Dict[str, Any]]) -> bool:
+        if not isinstance(field, dict):
+            return False
+        if field.get("type", {}).get("kind") in {"list", "struct", "object_ref"}:
+            return False
+        return int(field.get("cardinality", {}).get("min", 0)) > 0
+
+    key_fields = [fields_by_id.get(field_id) for field_id in key_field_ids]
+    if not key_fields or not all(_is_seekable(field) for field in key_fields):
+        return []
+    resolved: List[str] = []
+    if sort_field:
+        field = fields_by_id.get(sort_field) or fields_by_name.get(sort_field)
+        if _is_seekable(field) and field["id"] not in key_field_ids:
+            resolved.append(str(field["id"]))
+    resolved.extend(str(field["id"]) for field in key_fields)
+    return resolved
+
+
+def _exact_total_by_default(total: Any) -> bool:
+    if not isinstance(total, dict):
+        return True
+    return total.get("mode") == "exact" and bool(total.get("include_by_default", True))
+
+
+def build_query_contracts(
+    ir: Dict[str, Any],
+    *,
+    cursor_pagination: bool = False,
+    cursor_sort_fields: Optional[Dict[str, str]] = None,
+    total_count_mode: str = "always",
+    include_total_by_default: bool = True,
+    export_formats: Optional[List[str]] = None,
+    export_chunk_size: int = 1000,
+    field_projection: bool = False,
+) -> List[Dict[str, Any]]:
     type_by_id = {t["id"]: t for t in ir.get("types", [])}
     contracts: List[Dict[str, Any]] = []
+    sort_fields = cursor_sort_fields if isinstance(cursor_sort_fields, dict) else {}
 
     for obj in sorted(ir.get("objects", []), key=lambda item: item.get("id", "")):
         path_table = pluralize(snake_case(obj["name"]))
@@ -181,6 +246,24 @@ def build_query_contracts(ir: Dict[str, Any]) -> List[Dict[str, Any]]:
                 }
             )
 
+        pageable: Dict[str, Any] = {
+            "supported": True,
+            "default_size": 20,
+        }
+        if cursor_pagination and isinstance(key_field_ids, list):
+            sort_field = sort_fields.get(obj["name"]) or sort_fields.get(obj["id"])
+            cursor_field_ids = cursor_key_field_ids_for_object(obj, key_field_ids, str(sort_field) if sort_field else None)
+            if cursor_field_ids:
+                pageable["cursor"] = {
+                    "supported": True,
+                    "key_field_ids": cursor_field_ids,
+                }
+        if total_count_mode in {"exact", "estimated"}:
+            pageable["total"] = {
+                "mode": total_count_mode,
+                "include_by_default": bool(include_total_by_default),
+            }
+
         contract = {
             "object_id": obj["id"],
             "object_name": obj["name"],
@@ -189,12 +272,33 @@ def build_query_contracts(ir: Dict[str, Any]) -> List[Dict[str, Any]]:
                 "get_by_id": get_by_id_path,
                 "typed_query": f"/{path_table}/query",
             },
-            "pageable": {
-                "supported": True,
-                "default_size": 20,
-            },
+            "pageable": pageable,
             "filters": filters,
         }
+        if export_formats:
+            contract["paths"]["export"] = f"/{path_table}/export"
+            contract["export"] = {
+                "formats": list(export_formats),
+                "chunk_size": int(export_chunk_size),
+            }
+        if field_projection:
+            projectable = [
+                {"field_id": field["id"], "field_name": field["name"]}
+                for field in obj.get("fields", [])
+                if isinstance(field, dict) and field.get("id")
+            ]
+            if obj.get("states"):
+                projectable.append({"field_id": "__state__", "field_name": "state"})
+            always_field_ids: List[str] = []
+            cursor_field_ids = pageable.get("cursor", {}).get("key_field_ids", [])
+            for field_id in [*(key_field_ids if isinstance(key_field_ids, list) else []), *cursor_field_ids]:
+                if field_id in fields_by_id and field_id not in always_field_ids:
+                    always_field_ids.append(str(field_id))
+            contract["projection"] = {
+                "param": "fields",
+                "fields": projectable,
+                "always_field_ids": always_field_ids,
+            }
         canonical = json.dumps(contract, sort_keys=True, separators=(",", ":")).encode("utf-8")
         contract["contract_hash"] = hashlib.sha256(canonical).hexdigest()
         contracts.append(contract)
@@ -358,6 +462,15 @@ def compare_irs(old_ir: Dict[str, Any], new_ir: Dict[str, Any]) -> Tuple[str, Li
     compare_named_list("event", old_ir.get("events", []), new_ir.get("events", []))
     compare_named_list("trigger", old_ir.get("triggers", []), new_ir.get("triggers", []))
 
+    old_events = {e["id"]: e for e in old_ir.get("events", [])}
+    new_events = {e["id"]: e for e in new_ir.get("events", [])}
+    for eid in sorted(set(old_events) & set(new_events)):
+        old_tags = wire_field_tags([f["id"] for f in old_events[eid].get("fields", [])])
+        new_tags = wire_field_tags([f["id"] for f in new_events[eid].get("fields", [])])
+        for fid in sorted(set(old_tags) & set(new_tags)):
+            if old_tags[fid] != new_tags[fid]:
+                add("breaking", f"event wire tag changed: event={eid} field_id={fid} {old_tags[fid]} -> {new_tags[fid]}")
+
     old_query_contracts = query_contract_map(old_ir)
     new_query_contracts = query_contract_map(new_ir)
     for oid in sorted(set(old_query_contracts) - set(new_query_contracts)):
@@ -381,6 +494,53 @@ def compare_irs(old_ir: Dict[str, Any], new_ir: Dict[str, Any]) -> Tuple[str, Li
             elif new_path and not old_path:
                 add("additive", f"query path added: object={oid} {path_key} {new_path}")
 
+        old_cursor = old_c.get("pageable", {}).get("cursor", {})
+        new_cursor = new_c.get("pageable", {}).get("cursor", {})
+        old_cursor_keys = list(old_cursor.get("key_field_ids", [])) if isinstance(old_cursor, dict) else []
+        new_cursor_keys = list(new_cursor.get("key_field_ids", [])) if isinstance(new_cursor, dict) else []
+        if old_cursor_keys and not new_cursor_keys:
+            add("breaking", f"query cursor pagination removed: object={oid}")
+        elif new_cursor_keys and not old_cursor_keys:
+            add("additive", f"query cursor pagination added: object={oid}")
+        elif old_cursor_keys != new_cursor_keys:
+            add("breaking", f"query cursor keys changed: object={oid} {old_cursor_keys} -> {new_cursor_keys}")
+
+        old_total = old_c.get("pageable", {}).get("total")
+        new_total = new_c.get("pageable", {}).get("total")
+        if old_total != new_total:
+            if _exact_total_by_default(old_total) and not _exact_total_by_default(new_total):
+                add("breaking", f"query total count no longer exact by default: object={oid}")
+            else:
+                add("additive", f"query total count contract changed: object={oid}")
+
+        old_export = old_c.get("export", {}) if isinstance(old_c.get("export"), dict) else {}
+        new_export = new_c.get("export", {}) if isinstance(new_c.get("export"), dict) else {}
+        if old_export and new_export:
+            old_formats = set(old_export.get("formats", []))
+            new_formats = set(new_export.get("formats", []))
+            for export_format in sorted(old_formats - new_formats):
+                add("breaking", f"query export format removed: object={oid} format={export_format}")
+            for export_format in sorted(new_formats - old_formats):
+                add("additive", f"query export format added: object={oid} format={export_format}")
+            if old_export.get("chunk_size") != new_export.get("chunk_size"):
+                add("non_functional", f"query export chunk size changed: object={oid}")
+
+        old_projection = old_c.get("projection", {}) if isinstance(old_c.get("projection"), dict) else {}
+        new_projection = new_c.get("projection", {}) if isinstance(new_c.get("projection"), dict) else {}
+        if old_projection and not new_projection:
+            add("breaking", f"query field projection removed: object={oid}")
+        elif new_projection and not old_projection:
+            add("additive", f"query field projection added: object={oid}")
+        elif old_projection != new_projection:
+            old_projected = {f.get("field_id") for f in old_projection.get("fields", []) if isinstance(f, dict)}
+            new_projected = {f.get("field_id") for f in new_projection.get("fields", []) if isinstance(f, dict)}
+            for fid in sorted(old_projected - new_projected):
+                add("breaking", f"query projection field removed: object={oid} field_id={fid}")
+            for fid in sorted(new_projected - old_projected):
+                add("additive", f"query projection field added: object={oid} field_id={fid}")
+            if old_projection.get("always_field_ids") != new_projection.get("always_field_ids"):
+                add("additive", f"query projection key fields changed: object={oid}")
+
         old_filters = {f["field_id"]: f for f in old_c.get("filters", []) if f.get("field_id")}
         new_filters = {f["field_id"]: f for f in new_c.get("filters", []) if f.get("field_id")}
         for fid in sorted(set(old_filters) - set(new_filters)):
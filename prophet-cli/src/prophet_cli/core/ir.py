@@ -375,7 +375,50 @@ def build_ir(
     if ont.description:
         ir["ontology"]["description"] = ont.description
 
-    ir["query_contracts"] = build_query_contracts(ir)
+    cursor_cfg = cfg_get(cfg, ["generation", "query", "cursor_pagination"], False)
+    if isinstance(cursor_cfg, dict):
+        cursor_enabled = bool(cursor_cfg.get("enabled", True))
+        cursor_sort_fields = cursor_cfg.get("sort_fields", {})
+    else:
+        cursor_enabled = bool(cursor_cfg)
+        cursor_sort_fields = {}
+    total_cfg = cfg_get(cfg, ["generation", "query", "total_count"], "always")
+    if isinstance(total_cfg, dict):
+        total_mode = str(total_cfg.get("mode", "exact"))
+        include_total_by_default = bool(total_cfg.get("include_by_default", True))
+    else:
+        total_mode = str(total_cfg)
+        include_total_by_default = True
+    export_cfg = cfg_get(cfg, ["generation", "query", "export"], False)
+    if isinstance(export_cfg, dict):
+        export_enabled = bool(export_cfg.get("enabled", True))
+        export_formats_cfg = export_cfg.get("formats", ["ndjson", "csv"])
+        export_chunk_size_cfg = export_cfg.get("chunk_size", 1000)
+    else:
+        export_enabled = bool(export_cfg)
+        export_formats_cfg = ["ndjson", "csv"]
+        export_chunk_size_cfg = 1000
+    export_formats = (
+        [item for item in ("ndjson", "csv") if isinstance(export_formats_cfg, list) and item in export_formats_cfg]
+        if export_enabled
+        else []
+    )
+    export_chunk_size = export_chunk_size_cfg if isinstance(export_chunk_size_cfg, int) and export_chunk_size_cfg > 0 else 1000
+    projection_cfg = cfg_get(cfg, ["generation", "query", "field_projection"], False)
+    if isinstance(projection_cfg, dict):
+        projection_enabled = bool(projection_cfg.get("enabled", True))
+    else:
+        projection_enabled = bool(projection_cfg)
+    ir["query_contracts"] = build_query_contracts(
+        ir,
+        cursor_pagination=cursor_enabled,
+        cursor_sort_fields=cursor_sort_fields if isinstance(cursor_sort_fields, dict) else {},
+        total_count_mode=total_mode if total_mode in {"exact", "estimated"} else "always",
+        include_total_by_default=include_total_by_default,
+        export_formats=export_formats,
+        export_chunk_size=export_chunk_size,
+        field_projection=projection_enabled,
+    )
     contract_canonical = json.dumps(ir["query_contracts"], sort_keys=True, separators=(",", ":")).encode("utf-8")
     ir["query_contracts_version"] = hashlib.sha256(contract_canonical).hexdigest()
     canonical = json.dumps(ir, sort_keys=True, separators=(",", ":")).encode("utf-8")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
 from typing import Any, Dict, Iterable, List
 
 from .errors import ProphetError
@@ -46,6 +47,14 @@ class QueryContractView:
     pageable_supported: bool
     default_page_size: int
     filters: List[QueryFilterView]
+    cursor_key_field_ids: List[str] = field(default_factory=list)
+    total_count_mode: str = "always"
+    include_total_by_default: bool = True
+    export_path: str = ""
+    export_formats: List[str] = field(default_factory=list)
+    export_chunk_size: int = 0
+    projection_field_ids: List[str] = field(default_factory=list)
+    projection_always_field_ids: List[str] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -141,6 +150,10 @@ class IRReader:
         for contract in self.query_contracts():
             paths = contract.get("paths", {}) if isinstance(contract.get("paths"), dict) else {}
             pageable = contract.get("pageable", {}) if isinstance(contract.get("pageable"), dict) else {}
+            cursor = pageable.get("cursor", {}) if isinstance(pageable.get("cursor"), dict) else {}
+            total = pageable.get("total", {}) if isinstance(pageable.get("total"), dict) else {}
+            export = contract.get("export", {}) if isinstance(contract.get("export"), dict) else {}
+            projection = contract.get("projection", {}) if isinstance(contract.get("projection"), dict) else {}
             filters: List[QueryFilterView] = []
             for item in contract.get("filters", []):
                 if not isinstance(item, dict):
@@ -165,6 +178,18 @@ class IRReader:
                     pageable_supported=bool(pageable.get("supported", False)),
                     default_page_size=int(pageable.get("default_size", 0)),
                     filters=filters,
+                    cursor_key_field_ids=[str(item) for item in cursor.get("key_field_ids", []) if isinstance(item, str)],
+                    total_count_mode=str(total.get("mode", "always")),
+                    include_total_by_default=bool(total.get("include_by_default", True)),
+                    export_path=str(paths.get("export", "")),
+                    export_formats=[str(item) for item in export.get("formats", []) if isinstance(item, str)],
+                    export_chunk_size=int(export.get("chunk_size", 0)),
+                    projection_field_ids=[
+                        str(item.get("field_id", "")) for item in projection.get("fields", []) if isinstance(item, dict)
+                    ],
+                    projection_always_field_ids=[
+                        str(item) for item in projection.get("always_field_ids", []) if isinstance(item, str)
+                    ],
                 )
             )
         return views
@@ -8,6 +8,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from prophet_cli.codegen.contracts import GenerationContext
 from prophet_cli.codegen.stacks import StackSpec
+from prophet_cli.codegen.wire_schema import render_wire_schema
 from prophet_cli.core.ir_reader import IRReader
 from prophet_cli.targets.java_common.render.support import effective_base_package
 from prophet_cli.targets.java_spring_jpa.render.spring import render_liquibase_prophet_changelog
@@ -75,6 +76,8 @@ def generate_outputs(context: GenerationContext, deps: JavaSpringJpaDeps) -> Dic
         outputs[f"{out_dir}/openapi/openapi.yaml"] = deps.render_openapi(context.ir_reader)
     if "turtle" in targets:
         outputs[f"{out_dir}/turtle/ontology.ttl"] = deps.render_turtle(context.ir_reader)
+    if "wire_schema" in targets:
+        outputs[f"{out_dir}/wire/event-codec.json"] = render_wire_schema(context.ir_reader.as_dict(), event_type_name=str)
     if "spring_boot" in targets:
         spring_files = render_spring_files(
             context.ir_reader.as_dict(),
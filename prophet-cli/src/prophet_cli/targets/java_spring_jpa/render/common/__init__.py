@@ -4,10 +4,12 @@ from .actions_runtime import render_action_runtime_artifacts
 from .contracts import render_contract_artifacts
 from .domain import render_domain_artifacts
 from .transitions_runtime import render_transition_runtime_artifacts
+from .triggers_runtime import render_trigger_runtime_artifacts
 
 __all__ = [
     "render_action_runtime_artifacts",
     "render_contract_artifacts",
     "render_domain_artifacts",
     "render_transition_runtime_artifacts",
+    "render_trigger_runtime_artifacts",
 ]
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from prophet_cli.codegen.rendering import camel_case
+from prophet_cli.codegen.rendering import pascal_case
+
+
+def _trigger_bindings(state: Dict[str, Any]) -> List[Tuple[str, str, Dict[str, Any], str]]:
+    """(trigger name, envelope event type, bound action, action request class) per trigger."""
+    action_by_id = {item["id"]: item for item in state["actions"] if isinstance(item, dict) and "id" in item}
+    action_input_by_id = state["action_input_by_id"]
+    event_by_id = state["event_by_id"]
+    bindings: List[Tuple[str, str, Dict[str, Any], str]] = []
+    for trigger in sorted(
+        [item for item in state.get("triggers", []) if isinstance(item, dict)],
+        key=lambda item: str(item.get("id", "")),
+    ):
+        action = action_by_id.get(str(trigger.get("action_id", "")))
+        event = event_by_id.get(str(trigger.get("event_id", "")))
+        if action is None or event is None:
+            continue
+        req_name = pascal_case(str(action_input_by_id[action["input_shape_id"]]["name"])) or "ActionInput"
+        bindings.append((camel_case(str(trigger.get("name", "trigger"))), str(event["name"]), action, req_name))
+    return bindings
+
+
+def render_trigger_runtime_artifacts(files: Dict[str, str], state: Dict[str, Any]) -> None:
+    bindings = _trigger_bindings(state)
+    if not bindings:
+        return
+    base_package = state["base_package"]
+    package_path = state["package_path"]
+
+    mapper_imports = {"import io.prophet.events.runtime.EventWireEnvelope;"}
+    mapper_methods: List[str] = []
+    for trigger_name, _, _, req_name in bindings:
+        mapper_imports.add(f"import {base_package}.generated.actions.{req_name};")
+        mapper_methods.append(f"    {req_name} {trigger_name}(EventWireEnvelope envelope);")
+    files[f"src/main/java/{package_path}/generated/triggers/TriggerInputMappers.java"] = (
+        f"package {base_package}.generated.triggers;\n\n"
+        + "\n".join(sorted(mapper_imports))
+        + "\n\n"
+        + "/**\n"
+        + " * Builds each triggered action's request from the triggering envelope; returning null skips the envelope.\n"
+        + " */\n"
+        + "public interface TriggerInputMappers {\n"
+        + "\n\n".join(mapper_methods)
+        + "\n}\n"
+    )
+
+    factory_imports = {
+        "import io.prophet.events.runtime.EventPublisher;",
+        "import io.prophet.events.runtime.TriggerBatchException;",
+        "import io.prophet.events.runtime.TriggerBinding;",
+        "import io.prophet.events.runtime.TriggerDispatcher;",
+        "import io.prophet.events.runtime.TriggerPolicy;",
+        "import java.util.List;",
+        "import java.util.Map;",
+        "import org.springframework.beans.factory.ObjectProvider;",
+        "import org.springframework.stereotype.Component;",
+    }
+    handler_fields: List[str] = []
+    ctor_args: List[str] = []
+    ctor_assigns: List[str] = []
+    seen_actions: set[str] = set()
+    for _, _, action, req_name in bindings:
+        action_pascal = pascal_case(action["name"])
+        factory_imports.add(f"import {base_package}.generated.actions.{req_name};")
+        factory_imports.add(f"import {base_package}.generated.actions.handlers.{action_pascal}ActionHandler;")
+        factory_imports.add(f"import {base_package}.generated.actions.services.{action_pascal}ActionService;")
+        factory_imports.add(
+            f"import {base_package}.generated.actions.services.defaults.{action_pascal}ActionServiceDefault;"
+        )
+        if action["id"] in seen_actions:
+            continue
+        seen_actions.add(action["id"])
+        provider_var = f"{camel_case(action['name'])}HandlerProvider"
+        handler_fields.append(f"    private final ObjectProvider<{action_pascal}ActionHandler> {provider_var};")
+        ctor_args.append(f"        ObjectProvider<{action_pascal}ActionHandler> {provider_var}")
+        ctor_assigns.append(f"        this.{provider_var} = {provider_var};")
+
+    event_type_entries = ",\n".join(
+        f"        Map.entry(\"{trigger_name}\", \"{event_type}\")" for trigger_name, event_type, _, _ in bindings
+    )
+    binding_blocks: List[str] = []
+    for trigger_name, _, action, req_name in bindings:
+        action_pascal = pascal_case(action["name"])
+        provider_var = f"{camel_case(action['name'])}HandlerProvider"
+        binding_blocks.append(
+            "\n".join(
+                [
+                    "            new TriggerBinding(",
+                    f"                \"{trigger_name}\",",
+                    f"                TRIGGER_EVENT_TYPES.get(\"{trigger_name}\"),",
+                    "                (envelopes, dispatcher) -> {",
+                    f"                    {action_pascal}ActionService service = new {action_pascal}ActionServiceDefault({provider_var}, dispatcher);",
+                    "                    TriggerBatchException.runEach(envelopes, envelope -> {",
+                    f"                        {req_name} request = inputs.{trigger_name}(envelope);",
+                    "                        if (request != null) {",
+                    "                            service.execute(request);",
+                    "                        }",
+                    "                    });",
+                    "                },",
+                    f"                policies.getOrDefault(\"{trigger_name}\", TriggerPolicy.defaults())",
+                    "            )",
+                ]
+            )
+        )
+
+    files[f"src/main/java/{package_path}/generated/triggers/TriggerDispatcherFactory.java"] = (
+        f"package {base_package}.generated.triggers;\n\n"
+        + "\n".join(sorted(factory_imports))
+        + "\n\n"
+        + "/**\n"
+        + " * Builds a {@link TriggerDispatcher} for the ontology's triggers.\n"
+        + " *\n"
+        + " * <p>Triggered actions run through their default action service with the dispatcher as event publisher, so\n"
+        + " * chains continue in-process; every envelope is also forwarded to {@code downstream}. A failed envelope is\n"
+        + " * retried on its own; the rest of its batch is not re-run. Register the returned dispatcher as the\n"
+        + " * {@code @Primary} {@link EventPublisher} bean to start chains from request-driven actions.\n"
+        + " */\n"
+        + "@Component\n"
+        + "public class TriggerDispatcherFactory {\n"
+        + "    public static final Map<String, String> TRIGGER_EVENT_TYPES = Map.ofEntries(\n"
+        + event_type_entries
+        + "\n    );\n\n"
+        + "\n".join(handler_fields)
+        + "\n\n"
+        + "    public TriggerDispatcherFactory(\n"
+        + ",\n".join(ctor_args)
+        + "\n    ) {\n"
+        + "\n".join(ctor_assigns)
+        + "\n    }\n\n"
+        + "    public TriggerDispatcher build(TriggerInputMappers inputs, EventPublisher downstream) {\n"
+        + "        return build(inputs, downstream, 4, 10_000, Map.of());\n"
+        + "    }\n\n"
+        + "    public TriggerDispatcher build(\n"
+        + "        TriggerInputMappers inputs,\n"
+        + "        EventPublisher downstream,\n"
+        + "        int concurrency,\n"
+        + "        int maxQueueSize,\n"
+        + "        Map<String, TriggerPolicy> policies\n"
+        + "    ) {\n"
+        + "        List<TriggerBinding> bindings = List.of(\n"
+        + ",\n".join(binding_blocks)
+        + "\n        );\n"
+        + "        return new TriggerDispatcher(bindings, concurrency, maxQueueSize, downstream, null);\n"
+        + "    }\n"
+        + "}\n"
+    )
@@ -13,11 +13,40 @@ from prophet_cli.targets.java_common.render.support import java_type_for_field
 from prophet_cli.targets.java_common.render.support import object_has_composite_primary_key
 from prophet_cli.targets.java_common.render.support import render_java_record_with_builder
 
+def _cursor_key_fields(obj: Dict[str, Any], query_contract: Dict[str, Any]) -> List[Dict[str, Any]]:
+    pageable = query_contract.get("pageable", {}) if isinstance(query_contract.get("pageable"), dict) else {}
+    cursor = pageable.get("cursor", {}) if isinstance(pageable.get("cursor"), dict) else {}
+    fields_by_id = {f["id"]: f for f in obj.get("fields", [])}
+    return [fields_by_id[fid] for fid in cursor.get("key_field_ids", []) if fid in fields_by_id]
+
+
+def _total_count_contract(query_contract: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    pageable = query_contract.get("pageable", {}) if isinstance(query_contract.get("pageable"), dict) else {}
+    total = pageable.get("total")
+    if not isinstance(total, dict) or total.get("mode") not in {"exact", "estimated"}:
+        return None
+    return {"mode": str(total["mode"]), "include_by_default": bool(total.get("include_by_default", True))}
+
+
+def _projection_contract(obj: Dict[str, Any], query_contract: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    projection = query_contract.get("projection")
+    if not isinstance(projection, dict) or not projection.get("fields"):
+        return None
+    fields_by_id = {f["id"]: f for f in obj.get("fields", [])}
+    return {
+        "fields": [camel_case(str(item["field_name"])) for item in projection["fields"] if isinstance(item, dict)],
+        "key_fields": [
+            camel_case(fields_by_id[fid]["name"]) for fid in projection.get("always_field_ids", []) if fid in fields_by_id
+        ],
+    }
+
+
 def render_jpa_query_artifacts(files: Dict[str, str], state: Dict[str, Any]) -> None:
     objects = state["objects"]
     type_by_id = state["type_by_id"]
     object_by_id = state["object_by_id"]
     struct_by_id = state["struct_by_id"]
+    query_contract_by_object_id = state.get("query_contract_by_object_id", {})
     base_package = state["base_package"]
     package_path = state["package_path"]
 
@@ -280,6 +309,285 @@ def render_jpa_query_artifacts(files: Dict[str, str], state: Dict[str, Any]) ->
         imports.add("import org.springframework.web.bind.annotation.RequestBody;")
         imports.add(f"import {base_package}.generated.api.filters.{typed_query_name};")
 
+        cursor_fields = _cursor_key_fields(obj, query_contract_by_object_id.get(obj["id"], {}))
+        cursor_block = ""
+        if cursor_fields:
+            list_method_params.append("        @RequestParam(value = \"cursor\", required = false) String cursor")
+            imports.update(
+                {
+                    "import com.fasterxml.jackson.core.JsonProcessingException;",
+                    "import com.fasterxml.jackson.databind.JsonNode;",
+                    "import com.fasterxml.jackson.databind.ObjectMapper;",
+                    "import java.io.IOException;",
+                    "import java.util.Arrays;",
+                    "import java.util.Base64;",
+                    "import org.springframework.data.domain.PageRequest;",
+                    "import org.springframework.data.domain.Sort;",
+                    "import org.springframework.http.HttpStatus;",
+                    "import org.springframework.web.bind.annotation.RequestParam;",
+                    "import org.springframework.web.server.ResponseStatusException;",
+                }
+            )
+            cursor_props = [camel_case(f["name"]) for f in cursor_fields]
+            cursor_types = [java_type_for_field(f, type_by_id, object_by_id, struct_by_id) for f in cursor_fields]
+            for cursor_java in cursor_types:
+                add_java_imports_for_type(cursor_java, imports)
+            seek_terms: List[str] = []
+            for idx, (prop, java_t) in enumerate(zip(cursor_props, cursor_types)):
+                parts = [f"cb.equal(root.get(\"{cursor_props[prev]}\"), {cursor_props[prev]})" for prev in range(idx)]
+                parts.append(f"cb.greaterThan(root.<{java_t}>get(\"{prop}\"), {prop})")
+                seek_terms.append(parts[0] if len(parts) == 1 else f"cb.and({', '.join(parts)})")
+            seek_expr = seek_terms[0] if len(seek_terms) == 1 else "cb.or(\n            " + ",\n            ".join(seek_terms) + "\n        )"
+            sort_orders = ", ".join(f"Sort.Order.asc(\"{prop}\")" for prop in cursor_props)
+            getters = ", ".join(f"last.get{prop[:1].upper()}{prop[1:]}()" for prop in cursor_props)
+            cursor_block = (
+                f"    private static final Sort CURSOR_SORT = Sort.by({sort_orders});\n\n"
+                "    private Pageable cursorPageable(Pageable pageable, String cursor) {\n"
+                "        return PageRequest.of(cursor == null ? pageable.getPageNumber() : 0, pageable.getPageSize(), CURSOR_SORT);\n"
+                "    }\n\n"
+                f"    private Specification<{entity_name}> cursorSpec(String cursor) {{\n"
+                "        if (cursor == null) {\n"
+                "            return (root, query, cb) -> cb.conjunction();\n"
+                "        }\n"
+                + "".join(f"        final {java_t} {prop};\n" for prop, java_t in zip(cursor_props, cursor_types))
+                + "        try {\n"
+                "            JsonNode values = objectMapper.readTree(Base64.getUrlDecoder().decode(cursor));\n"
+                f"            if (values == null || !values.isArray() || values.size() != {len(cursor_props)}) {{\n"
+                "                throw new IllegalArgumentException(\"cursor width mismatch\");\n"
+                "            }\n"
+                + "".join(
+                    f"            {prop} = objectMapper.treeToValue(values.get({idx}), {java_t}.class);\n"
+                    for idx, (prop, java_t) in enumerate(zip(cursor_props, cursor_types))
+                )
+                + "        } catch (IOException | IllegalArgumentException ex) {\n"
+                "            throw new ResponseStatusException(HttpStatus.BAD_REQUEST, \"invalid_cursor\", ex);\n"
+                "        }\n"
+                f"        return (root, query, cb) -> {seek_expr};\n"
+                "    }\n\n"
+                f"    private String nextCursor(List<{entity_name}> rows, int size) {{\n"
+                "        if (rows.size() < size) {\n"
+                "            return null;\n"
+                "        }\n"
+                f"        {entity_name} last = rows.get(rows.size() - 1);\n"
+                "        try {\n"
+                f"            byte[] payload = objectMapper.writeValueAsBytes(Arrays.asList({getters}));\n"
+                "            return Base64.getUrlEncoder().withoutPadding().encodeToString(payload);\n"
+                "        } catch (JsonProcessingException ex) {\n"
+                "            throw new IllegalStateException(ex);\n"
+                "        }\n"
+                "    }\n\n"
+            )
+
+        total_contract = _total_count_contract(query_contract_by_object_id.get(obj["id"], {}))
+        total_block = ""
+        if total_contract is not None:
+            list_method_params.append("        @RequestParam(value = \"includeTotal\", required = false) Boolean includeTotal")
+            imports.update(
+                {
+                    "import jakarta.persistence.EntityManager;",
+                    "import jakarta.persistence.criteria.CriteriaBuilder;",
+                    "import jakarta.persistence.criteria.CriteriaQuery;",
+                    "import jakarta.persistence.criteria.Predicate;",
+                    "import jakarta.persistence.criteria.Root;",
+                    "import org.springframework.data.jpa.repository.query.QueryUtils;",
+                    "import org.springframework.web.bind.annotation.RequestParam;",
+                }
+            )
+            total_block = (
+                f"    private List<{entity_name}> fetchPage(Specification<{entity_name}> spec, Pageable pageable) {{\n"
+                "        CriteriaBuilder cb = entityManager.getCriteriaBuilder();\n"
+                f"        CriteriaQuery<{entity_name}> criteria = cb.createQuery({entity_name}.class);\n"
+                f"        Root<{entity_name}> root = criteria.from({entity_name}.class);\n"
+                "        Predicate predicate = spec.toPredicate(root, criteria, cb);\n"
+                "        if (predicate != null) {\n"
+                "            criteria.where(predicate);\n"
+                "        }\n"
+                "        criteria.orderBy(QueryUtils.toOrders(pageable.getSort(), root, cb));\n"
+                "        return entityManager.createQuery(criteria)\n"
+                "            .setFirstResult((int) pageable.getOffset())\n"
+                "            .setMaxResults(pageable.getPageSize())\n"
+                "            .getResultList();\n"
+                "    }\n\n"
+                "    private static Integer totalPages(Long totalElements, int size) {\n"
+                "        if (totalElements == null) {\n"
+                "            return null;\n"
+                "        }\n"
+                "        return size > 0 ? (int) ((totalElements + size - 1) / size) : 0;\n"
+                "    }\n\n"
+            )
+            if total_contract["mode"] == "estimated":
+                imports.add("import jakarta.persistence.PersistenceException;")
+                total_block += (
+                    f"    private long estimatedTotal(Specification<{entity_name}> spec) {{\n"
+                    "        try {\n"
+                    "            Object estimate = entityManager\n"
+                    "                .createNativeQuery(\"SELECT CAST(reltuples AS BIGINT) FROM pg_class WHERE oid = to_regclass(CAST(:table AS TEXT))\")\n"
+                    f"                .setParameter(\"table\", \"{path_table}\")\n"
+                    "                .getSingleResult();\n"
+                    "            if (estimate instanceof Number number && number.longValue() >= 0) {\n"
+                    "                return number.longValue();\n"
+                    "            }\n"
+                    "        } catch (PersistenceException ex) {\n"
+                    "            // Planner statistics are Postgres-only; fall back to an exact count elsewhere.\n"
+                    "        }\n"
+                    "        return repository.count(spec);\n"
+                    "    }\n\n"
+                )
+
+        projection = _projection_contract(obj, query_contract_by_object_id.get(obj["id"], {}))
+        projection_block = ""
+        projection_response_name = f"{obj['name']}ProjectionListResponse"
+        if projection is not None:
+            list_method_params.append("        @RequestParam(value = \"fields\", required = false) String fields")
+            imports.update(
+                {
+                    "import jakarta.persistence.EntityManager;",
+                    "import jakarta.persistence.Tuple;",
+                    "import jakarta.persistence.criteria.CriteriaBuilder;",
+                    "import jakarta.persistence.criteria.CriteriaQuery;",
+                    "import jakarta.persistence.criteria.Path;",
+                    "import jakarta.persistence.criteria.Predicate;",
+                    "import jakarta.persistence.criteria.Root;",
+                    "import jakarta.persistence.criteria.Selection;",
+                    "import java.util.LinkedHashMap;",
+                    "import java.util.LinkedHashSet;",
+                    "import java.util.Map;",
+                    "import java.util.Set;",
+                    "import org.springframework.data.domain.PageRequest;",
+                    "import org.springframework.data.jpa.repository.query.QueryUtils;",
+                    "import org.springframework.http.HttpStatus;",
+                    "import org.springframework.web.bind.annotation.RequestParam;",
+                    "import org.springframework.web.server.ResponseStatusException;",
+                }
+            )
+            # Object refs select only the target key (the FK column) and are rebuilt as <Target>Ref records.
+            ref_paths: List[str] = []
+            ref_values: List[str] = []
+            for f in fields:
+                if f["type"]["kind"] != "object_ref":
+                    continue
+                prop = camel_case(f["name"])
+                target = object_by_id[f["type"]["target_object_id"]]
+                target_pk = primary_key_field_for_object(target)
+                target_pk_prop = camel_case(target_pk["name"])
+                target_pk_java = java_type_for_field(target_pk, type_by_id, object_by_id, struct_by_id)
+                add_java_imports_for_type(target_pk_java, imports)
+                ref_cls = f"{target['name']}Ref"
+                imports.add(f"import {base_package}.generated.domain.{ref_cls};")
+                ref_paths.append(f"            case \"{prop}\" -> root.get(\"{prop}\").get(\"{target_pk_prop}\");\n")
+                ref_values.append(
+                    f"            case \"{prop}\" -> value == null ? null : {ref_cls}.builder().{target_pk_prop}(({target_pk_java}) value).build();\n"
+                )
+            if ref_paths:
+                path_method = (
+                    f"    private static Path<?> projectedPath(Root<{entity_name}> root, String name) {{\n"
+                    "        return switch (name) {\n"
+                    + "".join(ref_paths)
+                    + "            default -> root.get(name);\n"
+                    "        };\n"
+                    "    }\n\n"
+                    "    private static Object projectedValue(String name, Object value) {\n"
+                    "        return switch (name) {\n"
+                    + "".join(ref_values)
+                    + "            default -> value;\n"
+                    "        };\n"
+                    "    }\n\n"
+                )
+                row_value_expr = "projectedValue(name, tuple.get(name))"
+            else:
+                path_method = (
+                    f"    private static Path<?> projectedPath(Root<{entity_name}> root, String name) {{\n"
+                    "        return root.get(name);\n"
+                    "    }\n\n"
+                )
+                row_value_expr = "tuple.get(name)"
+            projection_block = (
+                "    private static final List<String> PROJECTION_FIELDS = List.of("
+                + ", ".join(f"\"{name}\"" for name in projection["fields"])
+                + ");\n"
+                "    private static final List<String> PROJECTION_KEY_FIELDS = List.of("
+                + ", ".join(f"\"{name}\"" for name in projection["key_fields"])
+                + ");\n\n"
+                "    private List<String> selectFields(String fields) {\n"
+                "        if (fields == null || fields.isBlank()) {\n"
+                "            return null;\n"
+                "        }\n"
+                "        Set<String> requested = new LinkedHashSet<>();\n"
+                "        for (String name : fields.split(\",\")) {\n"
+                "            String trimmed = name.trim();\n"
+                "            if (trimmed.isEmpty()) {\n"
+                "                continue;\n"
+                "            }\n"
+                "            if (!PROJECTION_FIELDS.contains(trimmed)) {\n"
+                "                throw new ResponseStatusException(HttpStatus.BAD_REQUEST, \"invalid_fields\");\n"
+                "            }\n"
+                "            requested.add(trimmed);\n"
+                "        }\n"
+                "        requested.addAll(PROJECTION_KEY_FIELDS);\n"
+                "        return PROJECTION_FIELDS.stream().filter(requested::contains).toList();\n"
+                "    }\n\n"
+                f"    private List<Map<String, Object>> fetchProjected(Specification<{entity_name}> spec, Pageable pageable, List<String> fields) {{\n"
+                "        CriteriaBuilder cb = entityManager.getCriteriaBuilder();\n"
+                "        CriteriaQuery<Tuple> criteria = cb.createTupleQuery();\n"
+                f"        Root<{entity_name}> root = criteria.from({entity_name}.class);\n"
+                "        Predicate predicate = spec.toPredicate(root, criteria, cb);\n"
+                "        if (predicate != null) {\n"
+                "            criteria.where(predicate);\n"
+                "        }\n"
+                "        criteria.multiselect(fields.stream().<Selection<?>>map(name -> projectedPath(root, name).alias(name)).toList());\n"
+                "        criteria.orderBy(QueryUtils.toOrders(pageable.getSort(), root, cb));\n"
+                "        return entityManager.createQuery(criteria)\n"
+                "            .setFirstResult((int) pageable.getOffset())\n"
+                "            .setMaxResults(pageable.getPageSize())\n"
+                "            .getResultList()\n"
+                "            .stream()\n"
+                "            .map(tuple -> {\n"
+                "                Map<String, Object> row = new LinkedHashMap<>();\n"
+                "                for (String name : fields) {\n"
+                f"                    row.put(name, {row_value_expr});\n"
+                "                }\n"
+                "                return row;\n"
+                "            })\n"
+                "            .toList();\n"
+                "    }\n\n"
+                + path_method
+            )
+            if cursor_fields:
+                cursor_values = ", ".join(f"last.get(\"{camel_case(f['name'])}\")" for f in cursor_fields)
+                projection_block += (
+                    "    private String nextProjectedCursor(List<Map<String, Object>> rows, int size) {\n"
+                    "        if (rows.size() < size) {\n"
+                    "            return null;\n"
+                    "        }\n"
+                    "        Map<String, Object> last = rows.get(rows.size() - 1);\n"
+                    "        try {\n"
+                    f"            byte[] payload = objectMapper.writeValueAsBytes(Arrays.asList({cursor_values}));\n"
+                    "            return Base64.getUrlEncoder().withoutPadding().encodeToString(payload);\n"
+                    "        } catch (JsonProcessingException ex) {\n"
+                    "            throw new IllegalStateException(ex);\n"
+                    "        }\n"
+                    "    }\n\n"
+                )
+            files[f"src/main/java/{package_path}/generated/api/{projection_response_name}.java"] = render_java_record_with_builder(
+                f"{base_package}.generated.api",
+                {
+                    "import java.util.List;",
+                    "import java.util.Map;",
+                },
+                projection_response_name,
+                [
+                    ("List<Map<String, Object>>", "items", True),
+                    ("int", "page", True),
+                    ("int", "size", True),
+                ]
+                + (
+                    [("Long", "totalElements", False), ("Integer", "totalPages", False)]
+                    if total_contract is not None
+                    else [("long", "totalElements", True), ("int", "totalPages", True)]
+                )
+                + ([("String", "nextCursor", False)] if cursor_fields else []),
+            )
+
         list_method_signature = ",\n".join(list_method_params)
 
         if needs_join_type_import:
@@ -296,36 +604,160 @@ def render_jpa_query_artifacts(files: Dict[str, str], state: Dict[str, Any]) ->
                 (f"List<{domain_name}>", "items", True),
                 ("int", "page", True),
                 ("int", "size", True),
-                ("long", "totalElements", True),
-                ("int", "totalPages", True),
-            ],
+            ]
+            + (
+                [("Long", "totalElements", False), ("Integer", "totalPages", False)]
+                if total_contract is not None
+                else [("long", "totalElements", True), ("int", "totalPages", True)]
+            )
+            + ([("String", "nextCursor", False)] if cursor_fields else []),
         )
         files[f"src/main/java/{package_path}/generated/api/{list_response_name}.java"] = list_response_src
 
+        if cursor_fields:
+            page_result_block = (
+                f"        Page<{entity_name}> entityPage = repository.findAll(spec.and(cursorSpec(cursor)), cursorPageable(pageable, cursor));\n"
+                "        long totalElements = cursor == null ? entityPage.getTotalElements() : repository.count(spec);\n"
+                "        int size = entityPage.getSize();\n"
+                f"        List<{domain_name}> items = entityPage.stream().map(mapper::toDomain).toList();\n"
+                f"        {list_response_name} result = {list_response_name}.builder()\n"
+                "            .items(items)\n"
+                "            .page(entityPage.getNumber())\n"
+                "            .size(size)\n"
+                "            .totalElements(totalElements)\n"
+                "            .totalPages(size > 0 ? (int) ((totalElements + size - 1) / size) : 0)\n"
+                "            .nextCursor(nextCursor(entityPage.getContent(), size))\n"
+                "            .build();\n"
+                "        return ResponseEntity.ok(result);\n"
+            )
+        else:
+            page_result_block = (
+                f"        Page<{entity_name}> entityPage = repository.findAll(spec, pageable);\n"
+                f"        List<{domain_name}> items = entityPage.stream().map(mapper::toDomain).toList();\n"
+                f"        {list_response_name} result = {list_response_name}.builder()\n"
+                "            .items(items)\n"
+                "            .page(entityPage.getNumber())\n"
+                "            .size(entityPage.getSize())\n"
+                "            .totalElements(entityPage.getTotalElements())\n"
+                "            .totalPages(entityPage.getTotalPages())\n"
+                "            .build();\n"
+                "        return ResponseEntity.ok(result);\n"
+            )
+
+        list_page_result_block = page_result_block
+        if total_contract is not None:
+            include_default = "true" if total_contract["include_by_default"] else "false"
+            page_request_expr = "cursorPageable(pageable, cursor)" if cursor_fields else "pageable"
+            page_spec_expr = "spec.and(cursorSpec(cursor))" if cursor_fields else "spec"
+
+            def _optional_total_block(count_expr: str) -> str:
+                return (
+                    f"        boolean withTotal = includeTotal == null ? {include_default} : includeTotal;\n"
+                    f"        Pageable pageRequest = {page_request_expr};\n"
+                    f"        List<{entity_name}> rows = fetchPage({page_spec_expr}, pageRequest);\n"
+                    f"        Long totalElements = withTotal ? {count_expr} : null;\n"
+                    "        int size = pageRequest.getPageSize();\n"
+                    f"        List<{domain_name}> items = rows.stream().map(mapper::toDomain).toList();\n"
+                    f"        {list_response_name} result = {list_response_name}.builder()\n"
+                    "            .items(items)\n"
+                    "            .page(pageRequest.getPageNumber())\n"
+                    "            .size(size)\n"
+                    "            .totalElements(totalElements)\n"
+                    "            .totalPages(totalPages(totalElements, size))\n"
+                    + ("            .nextCursor(nextCursor(rows, size))\n" if cursor_fields else "")
+                    + "            .build();\n"
+                    "        return ResponseEntity.ok(result);\n"
+                )
+
+            page_result_block = _optional_total_block("repository.count(spec)")
+            list_page_result_block = _optional_total_block(
+                "estimatedTotal(spec)" if total_contract["mode"] == "estimated" else "repository.count(spec)"
+            )
+
+        if projection is not None:
+            projected_page_request = "cursorPageable(pageable, cursor)" if cursor_fields else "pageable"
+            projected_spec = "spec.and(cursorSpec(cursor))" if cursor_fields else "spec"
+
+            def _projected_page_block(count_expr: str) -> str:
+                if total_contract is not None:
+                    include_default = "true" if total_contract["include_by_default"] else "false"
+                    total_lines = (
+                        f"            Long totalElements = (includeTotal == null ? {include_default} : includeTotal) ? {count_expr} : null;\n"
+                    )
+                    total_pages_expr = "totalPages(totalElements, size)"
+                else:
+                    total_lines = f"            long totalElements = {count_expr};\n"
+                    total_pages_expr = "size > 0 ? (int) ((totalElements + size - 1) / size) : 0"
+                return (
+                    "        List<String> selected = selectFields(fields);\n"
+                    "        if (selected != null) {\n"
+                    f"            Pageable projectedRequest = {projected_page_request};\n"
+                    f"            List<Map<String, Object>> projectedRows = fetchProjected({projected_spec}, projectedRequest, selected);\n"
+                    + total_lines
+                    + "            int size = projectedRequest.getPageSize();\n"
+                    f"            return ResponseEntity.ok({projection_response_name}.builder()\n"
+                    "                .items(projectedRows)\n"
+                    "                .page(projectedRequest.getPageNumber())\n"
+                    "                .size(size)\n"
+                    "                .totalElements(totalElements)\n"
+                    f"                .totalPages({total_pages_expr})\n"
+                    + ("                .nextCursor(nextProjectedCursor(projectedRows, size))\n" if cursor_fields else "")
+                    + "                .build());\n"
+                    "        }\n"
+                )
+
+            list_count_expr = (
+                "estimatedTotal(spec)"
+                if total_contract is not None and total_contract["mode"] == "estimated"
+                else "repository.count(spec)"
+            )
+            page_result_block = _projected_page_block("repository.count(spec)") + page_result_block
+            list_page_result_block = _projected_page_block(list_count_expr) + list_page_result_block
+
+        list_response_type = "?" if projection is not None else list_response_name
+        get_response_type = "?" if projection is not None else domain_name
         typed_filter_block = "\n".join(typed_filter_conditions)
         typed_query_method = (
             "    @PostMapping(\"/query\")\n"
-            f"    public ResponseEntity<{list_response_name}> query(\n"
+            f"    public ResponseEntity<{list_response_type}> query(\n"
             f"        @RequestBody(required = false) {typed_query_name} filter,\n"
-            "        @PageableDefault(size = 20) Pageable pageable\n"
+            + ",\n".join(list_method_params)
+            + "\n"
             "    ) {\n"
             f"        Specification<{entity_name}> spec = (root, query, cb) -> cb.conjunction();\n"
             "        if (filter != null) {\n"
             + (typed_filter_block + "\n" if typed_filter_block else "")
             + "        }\n"
-            + f"        Page<{entity_name}> entityPage = repository.findAll(spec, pageable);\n"
-            + f"        List<{domain_name}> items = entityPage.stream().map(mapper::toDomain).toList();\n"
-            + f"        {list_response_name} result = {list_response_name}.builder()\n"
-            + "            .items(items)\n"
-            + "            .page(entityPage.getNumber())\n"
-            + "            .size(entityPage.getSize())\n"
-            + "            .totalElements(entityPage.getTotalElements())\n"
-            + "            .totalPages(entityPage.getTotalPages())\n"
-            + "            .build();\n"
-            + "        return ResponseEntity.ok(result);\n"
+            + page_result_block
             + "    }\n\n"
         )
 
+        fields_param = ""
+        projected_get_block = ""
+        if projection is not None:
+            fields_param = ", @RequestParam(value = \"fields\", required = false) String fields"
+            key_terms: List[str] = []
+            for key_field in pk_fields:
+                key_name = camel_case(key_field["name"])
+                if key_field["type"]["kind"] == "object_ref":
+                    target = object_by_id[key_field["type"]["target_object_id"]]
+                    target_pk_prop = camel_case(primary_key_field_for_object(target)["name"])
+                    key_terms.append(f"cb.equal(root.get(\"{key_name}\").get(\"{target_pk_prop}\"), {key_name})")
+                else:
+                    key_terms.append(f"cb.equal(root.get(\"{key_name}\"), {key_name})")
+            key_predicate = key_terms[0] if len(key_terms) == 1 else f"cb.and({', '.join(key_terms)})"
+            projected_get_block = (
+                "        List<String> selected = selectFields(fields);\n"
+                "        if (selected != null) {\n"
+                f"            Specification<{entity_name}> spec = (root, query, cb) -> {key_predicate};\n"
+                "            List<Map<String, Object>> projectedRows = fetchProjected(spec, PageRequest.of(0, 1), selected);\n"
+                "            if (projectedRows.isEmpty()) {\n"
+                "                return ResponseEntity.notFound().build();\n"
+                "            }\n"
+                "            return ResponseEntity.ok(projectedRows.get(0));\n"
+                "        }\n\n"
+            )
+
         get_by_id_method = ""
         if composite_pk:
             key_path_parts: List[str] = []
@@ -343,8 +775,9 @@ def render_jpa_query_artifacts(files: Dict[str, str], state: Dict[str, Any]) ->
             key_ctor = ", ".join(key_ctor_args)
             get_by_id_method = (
                 f"    @GetMapping(\"/{key_path}\")\n"
-                f"    public ResponseEntity<{domain_name}> getById({key_params}) {{\n"
-                f"        {obj['name']}Key key = new {obj['name']}Key({key_ctor});\n"
+                f"    public ResponseEntity<{get_response_type}> getById({key_params}{fields_param}) {{\n"
+                + projected_get_block
+                + f"        {obj['name']}Key key = new {obj['name']}Key({key_ctor});\n"
                 f"        Optional<{entity_name}> maybeEntity = repository.findById(key);\n"
                 "        if (maybeEntity.isEmpty()) {\n"
                 "            return ResponseEntity.notFound().build();\n"
@@ -356,8 +789,9 @@ def render_jpa_query_artifacts(files: Dict[str, str], state: Dict[str, Any]) ->
         else:
             get_by_id_method = (
                 f"    @GetMapping(\"/{{{pk_prop}}}\")\n"
-                f"    public ResponseEntity<{domain_name}> getById(@PathVariable(\"{pk_prop}\") {pk_java} {pk_prop}) {{\n"
-                f"        Optional<{entity_name}> maybeEntity = repository.findById({pk_prop});\n"
+                f"    public ResponseEntity<{get_response_type}> getById(@PathVariable(\"{pk_prop}\") {pk_java} {pk_prop}{fields_param}) {{\n"
+                + projected_get_block
+                + f"        Optional<{entity_name}> maybeEntity = repository.findById({pk_prop});\n"
                 "        if (maybeEntity.isEmpty()) {\n"
                 "            return ResponseEntity.notFound().build();\n"
                 "        }\n\n"
@@ -366,6 +800,13 @@ def render_jpa_query_artifacts(files: Dict[str, str], state: Dict[str, Any]) ->
                 "    }\n"
             )
 
+        extra_dependencies: List[Tuple[str, str]] = []
+        if cursor_fields:
+            extra_dependencies.append(("ObjectMapper", "objectMapper"))
+        if total_contract is not None or projection is not None:
+            extra_dependencies.append(("EntityManager", "entityManager"))
+        controller_dependencies = [(repo_name, "repository"), (mapper_name, "mapper")] + extra_dependencies
+
         imports_block = "\n".join(sorted(imports))
         query_src = (
             f"package {base_package}.generated.api;\n\n"
@@ -374,29 +815,24 @@ def render_jpa_query_artifacts(files: Dict[str, str], state: Dict[str, Any]) ->
             f"@RequestMapping(\"/{path_table}\")\n"
             f"public class {obj['name']}QueryController {{\n\n"
             f"    private final {repo_name} repository;\n"
-            f"    private final {mapper_name} mapper;\n\n"
-            f"    public {obj['name']}QueryController({repo_name} repository, {mapper_name} mapper) {{\n"
-            "        this.repository = repository;\n"
-            "        this.mapper = mapper;\n"
-            "    }\n\n"
+            f"    private final {mapper_name} mapper;\n"
+            + "".join(f"    private final {java_t} {name};\n" for java_t, name in extra_dependencies)
+            + "\n"
+            + f"    public {obj['name']}QueryController({', '.join(f'{java_t} {name}' for java_t, name in controller_dependencies)}) {{\n"
+            + "".join(f"        this.{name} = {name};\n" for _, name in controller_dependencies)
+            + "    }\n\n"
             "    @GetMapping\n"
-            f"    public ResponseEntity<{list_response_name}> list(\n"
+            f"    public ResponseEntity<{list_response_type}> list(\n"
             f"{list_method_signature}\n"
             "    ) {\n"
             f"        Specification<{entity_name}> spec = (root, query, cb) -> cb.conjunction();\n"
-            + f"        Page<{entity_name}> entityPage = repository.findAll(spec, pageable);\n"
-            + f"        List<{domain_name}> items = entityPage.stream().map(mapper::toDomain).toList();\n"
-            + f"        {list_response_name} result = {list_response_name}.builder()\n"
-            + "            .items(items)\n"
-            + "            .page(entityPage.getNumber())\n"
-            + "            .size(entityPage.getSize())\n"
-            + "            .totalElements(entityPage.getTotalElements())\n"
-            + "            .totalPages(entityPage.getTotalPages())\n"
-            + "            .build();\n"
-            + "        return ResponseEntity.ok(result);\n"
+            + list_page_result_block
             + "    }\n\n"
             + typed_query_method
             + get_by_id_method
+            + ("\n" + cursor_block.rstrip("\n") + "\n" if cursor_block else "")
+            + ("\n" + total_block.rstrip("\n") + "\n" if total_block else "")
+            + ("\n" + projection_block.rstrip("\n") + "\n" if projection_block else "")
             + "}\n"
         )
 
@@ -12,6 +12,7 @@ from prophet_cli.targets.java_spring_jpa.render.common import render_action_runt
 from prophet_cli.targets.java_spring_jpa.render.common import render_contract_artifacts
 from prophet_cli.targets.java_spring_jpa.render.common import render_domain_artifacts
 from prophet_cli.targets.java_spring_jpa.render.common import render_transition_runtime_artifacts
+from prophet_cli.targets.java_spring_jpa.render.common import render_trigger_runtime_artifacts
 from prophet_cli.targets.java_spring_jpa.render.orm import render_jpa_persistence_artifacts
 from prophet_cli.targets.java_spring_jpa.render.orm import render_jpa_query_artifacts
 from prophet_cli.targets.runtime_versions import resolve_java_runtime_group
@@ -226,6 +227,9 @@ def render_spring_files(
     struct_by_id = {s["id"]: s for s in structs}
     action_input_by_id = {s["id"]: s for s in action_inputs}
     event_by_id = {e["id"]: e for e in events if isinstance(e, dict) and "id" in e}
+    query_contract_by_object_id = {
+        str(c.get("object_id", "")): c for c in ir.get("query_contracts", []) if isinstance(c, dict)
+    }
 
     files["build.gradle.kts"] = render_gradle_file(
         boot_version,
@@ -274,6 +278,8 @@ def render_spring_files(
         "struct_by_id": struct_by_id,
         "action_input_by_id": action_input_by_id,
         "event_by_id": event_by_id,
+        "triggers": ir.get("triggers", []),
+        "query_contract_by_object_id": query_contract_by_object_id,
         "base_package": base_package,
         "package_path": package_path,
         "ontology_name": str(ir.get("ontology", {}).get("name", "prophet")),
@@ -285,6 +291,7 @@ def render_spring_files(
     render_contract_artifacts(files, state)
     render_action_runtime_artifacts(files, state)
     render_transition_runtime_artifacts(files, state)
+    render_trigger_runtime_artifacts(files, state)
     render_jpa_query_artifacts(files, state)
 
     annotate_generated_java_files(files)
@@ -7,6 +7,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from prophet_cli.codegen.contracts import GenerationContext
 from prophet_cli.codegen.stacks import StackSpec
+from prophet_cli.codegen.wire_schema import render_wire_schema
 from prophet_cli.core.ir_reader import IRReader
 from prophet_cli.targets.node_express.render.common.action_handlers import _render_action_handlers
 from prophet_cli.targets.node_express.render.common.action_routes import _render_action_routes
@@ -16,12 +17,15 @@ from prophet_cli.targets.node_express.render.common.domain import _render_domain
 from prophet_cli.targets.node_express.render.common.event_contracts import _render_event_contracts
 from prophet_cli.targets.node_express.render.common.events import _render_event_emitter
 from prophet_cli.targets.node_express.render.common.index_file import _render_index_file
+from prophet_cli.targets.node_express.render.common.loaders import _render_repository_loaders
 from prophet_cli.targets.node_express.render.common.package_files import _render_node_package_json
 from prophet_cli.targets.node_express.render.common.package_files import _render_node_tsconfig
 from prophet_cli.targets.node_express.render.common.persistence import _render_persistence_contracts
 from prophet_cli.targets.node_express.render.common.query import _render_query_filters
 from prophet_cli.targets.node_express.render.common.query import _render_query_routes
 from prophet_cli.targets.node_express.render.common.transitions import _render_transition_services
+from prophet_cli.targets.node_express.render.common.triggers import _has_triggers
+from prophet_cli.targets.node_express.render.common.triggers import _render_trigger_dispatcher
 from prophet_cli.targets.node_express.render.common.validation import _render_validation
 from prophet_cli.targets.node_express.render.orm.mongoose import _render_mongoose_adapter
 from prophet_cli.targets.node_express.render.orm.mongoose import _render_mongoose_models
@@ -70,6 +74,8 @@ def generate_outputs(context: GenerationContext, deps: NodeExpressDeps) -> Dict[
         outputs[f"{out_dir}/openapi/openapi.yaml"] = deps.render_openapi(context.ir_reader)
     if "turtle" in targets:
         outputs[f"{out_dir}/turtle/ontology.ttl"] = deps.render_turtle(context.ir_reader)
+    if "wire_schema" in targets:
+        outputs[f"{out_dir}/wire/event-codec.json"] = render_wire_schema(context.ir_reader.as_dict())
 
     node_prefix = f"{out_dir}/node-express"
     if "node_express" in targets:
@@ -81,10 +87,13 @@ def generate_outputs(context: GenerationContext, deps: NodeExpressDeps) -> Dict[
         outputs[f"{node_prefix}/src/generated/validation.ts"] = _render_validation(ir)
         outputs[f"{node_prefix}/src/generated/query.ts"] = _render_query_filters(ir)
         outputs[f"{node_prefix}/src/generated/persistence.ts"] = _render_persistence_contracts(ir)
+        outputs[f"{node_prefix}/src/generated/loaders.ts"] = _render_repository_loaders(ir)
         outputs[f"{node_prefix}/src/generated/action-handlers.ts"] = _render_action_handlers(ir)
         outputs[f"{node_prefix}/src/generated/events.ts"] = _render_event_emitter(ir)
         outputs[f"{node_prefix}/src/generated/action-service.ts"] = _render_action_service(ir)
         outputs[f"{node_prefix}/src/generated/transitions.ts"] = _render_transition_services(ir)
+        if _has_triggers(ir):
+            outputs[f"{node_prefix}/src/generated/triggers.ts"] = _render_trigger_dispatcher(ir)
         outputs[f"{node_prefix}/src/generated/action-routes.ts"] = _render_action_routes(ir)
         outputs[f"{node_prefix}/src/generated/query-routes.ts"] = _render_query_routes(ir)
         outputs[f"{node_prefix}/src/generated/index.ts"] = _render_index_file(ir)
@@ -40,6 +40,8 @@ def _render_index_file(ir: Dict[str, Any]) -> str:
         "",
         "export { TransitionServices } from './transitions';",
         "export type { TransitionHandlers, TransitionValidators } from './transitions';",
+        "export { BatchLoader, IdentityMapRepositories, createRepositoryLoaders } from './loaders';",
+        "export type { RepositoryLoaders } from './loaders';",
         "",
     ]
     return "\n".join(lines)
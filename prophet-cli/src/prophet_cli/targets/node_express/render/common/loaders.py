@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from ..support import _camel_case
+from ..support import _export_contract
+from ..support import _object_primary_key_fields
+from ..support import _pascal_case
+
+
+def _batch_loader_lines() -> List[str]:
+    return [
+        "export class BatchLoader<K, V> {",
+        "  private readonly promises = new Map<string, Promise<V | null>>();",
+        "  private pending: Array<{ key: string; ref: K; resolve: (value: V | null) => void; reject: (error: unknown) => void }> = [];",
+        "",
+        "  constructor(",
+        "    private readonly batchFn: (refs: K[]) => Promise<(V | null)[]>,",
+        "    private readonly keyFn: (ref: K) => string,",
+        "  ) {}",
+        "",
+        "  load(ref: K): Promise<V | null> {",
+        "    const key = this.keyFn(ref);",
+        "    const existing = this.promises.get(key);",
+        "    if (existing) {",
+        "      return existing;",
+        "    }",
+        "    const promise = new Promise<V | null>((resolve, reject) => {",
+        "      if (this.pending.length === 0) {",
+        "        Promise.resolve().then(() => process.nextTick(() => void this.dispatch()));",
+        "      }",
+        "      this.pending.push({ key, ref, resolve, reject });",
+        "    });",
+        "    this.promises.set(key, promise);",
+        "    return promise;",
+        "  }",
+        "",
+        "  loadMany(refs: K[]): Promise<(V | null)[]> {",
+        "    return Promise.all(refs.map((ref) => this.load(ref)));",
+        "  }",
+        "",
+        "  prime(ref: K, value: V | null): void {",
+        "    const key = this.keyFn(ref);",
+        "    if (!this.promises.has(key)) {",
+        "      this.promises.set(key, Promise.resolve(value));",
+        "    }",
+        "  }",
+        "",
+        "  clear(ref: K): void {",
+        "    this.promises.delete(this.keyFn(ref));",
+        "  }",
+        "",
+        "  clearAll(): void {",
+        "    this.promises.clear();",
+        "  }",
+        "",
+        "  private async dispatch(): Promise<void> {",
+        "    const batch = this.pending;",
+        "    this.pending = [];",
+        "    try {",
+        "      const values = await this.batchFn(batch.map((entry) => entry.ref));",
+        "      batch.forEach((entry, index) => entry.resolve(values[index] ?? null));",
+        "    } catch (error) {",
+        "      for (const entry of batch) {",
+        "        this.promises.delete(entry.key);",
+        "        entry.reject(error);",
+        "      }",
+        "    }",
+        "  }",
+        "}",
+        "",
+    ]
+
+
+def _identity_map_lines() -> List[str]:
+    return [
+        "interface CachedRepository<K, V> {",
+        "  getById(id: K): Promise<V | null>;",
+        "  getByIds(ids: K[]): Promise<(V | null)[]>;",
+        "  save(item: V): Promise<V>;",
+        "  saveMany(items: V[]): Promise<V[]>;",
+        "}",
+        "",
+        "export class IdentityMapRepository<K, V, R extends CachedRepository<K, V>> {",
+        "  protected readonly entries = new Map<string, V | null>();",
+        "",
+        "  constructor(",
+        "    protected readonly repository: R,",
+        "    protected readonly keyFn: (ref: K | V) => string,",
+        "  ) {}",
+        "",
+        "  async getById(id: K): Promise<V | null> {",
+        "    const key = this.keyFn(id);",
+        "    if (!this.entries.has(key)) {",
+        "      this.entries.set(key, await this.repository.getById(id));",
+        "    }",
+        "    return this.entries.get(key) ?? null;",
+        "  }",
+        "",
+        "  async getByIds(ids: K[]): Promise<(V | null)[]> {",
+        "    const missing = new Map<string, K>();",
+        "    for (const id of ids) {",
+        "      const key = this.keyFn(id);",
+        "      if (!this.entries.has(key) && !missing.has(key)) {",
+        "        missing.set(key, id);",
+        "      }",
+        "    }",
+        "    if (missing.size > 0) {",
+        "      const values = await this.repository.getByIds([...missing.values()]);",
+        "      [...missing.keys()].forEach((key, index) => this.entries.set(key, values[index] ?? null));",
+        "    }",
+        "    return ids.map((id) => this.entries.get(this.keyFn(id)) ?? null);",
+        "  }",
+        "",
+        "  async save(item: V): Promise<V> {",
+        "    const saved = await this.repository.save(item);",
+        "    this.entries.set(this.keyFn(saved), saved);",
+        "    return saved;",
+        "  }",
+        "",
+        "  async saveMany(items: V[]): Promise<V[]> {",
+        "    const saved = await this.repository.saveMany(items);",
+        "    for (const item of saved) {",
+        "      this.entries.set(this.keyFn(item), item);",
+        "    }",
+        "    return saved;",
+        "  }",
+        "",
+        "  clear(ref: K): void {",
+        "    this.entries.delete(this.keyFn(ref));",
+        "  }",
+        "",
+        "  clearAll(): void {",
+        "    this.entries.clear();",
+        "  }",
+        "}",
+        "",
+    ]
+
+
+def _object_identity_map_lines(obj: Dict[str, Any], *, export: bool, projection: bool = False) -> List[str]:
+    obj_name = _pascal_case(str(obj.get("name", "Object")))
+    id_name = f"Persistence.{obj_name}Id"
+    repo_name = f"Persistence.{obj_name}Repository"
+    key_values = ", ".join(f"id.{_camel_case(str(pk.get('name', 'id')))}" for pk in _object_primary_key_fields(obj))
+    lines = [
+        f"export class {obj_name}IdentityMapRepository",
+        f"  extends IdentityMapRepository<{id_name}, Domain.{obj_name}, {repo_name}>",
+        f"  implements {repo_name}",
+        "{",
+        f"  constructor(repository: {repo_name}) {{",
+        f"    super(repository, (id) => JSON.stringify([{key_values}]));",
+        "  }",
+        "",
+        f"  list(...args: Parameters<{repo_name}['list']>): ReturnType<{repo_name}['list']> {{",
+        "    return this.repository.list(...args);",
+        "  }",
+        "",
+        f"  query(...args: Parameters<{repo_name}['query']>): ReturnType<{repo_name}['query']> {{",
+        "    return this.repository.query(...args);",
+        "  }",
+    ]
+    if projection:
+        lines.extend(
+            [
+                "",
+                f"  getById(id: {id_name}, fields?: string[]): Promise<Domain.{obj_name} | null> {{",
+                "    // Projected reads return partial objects, so they bypass the identity map.",
+                "    return fields === undefined ? super.getById(id) : this.repository.getById(id, fields);",
+                "  }",
+            ]
+        )
+    if export:
+        lines.extend(
+            [
+                "",
+                f"  export(...args: Parameters<{repo_name}['export']>): ReturnType<{repo_name}['export']> {{",
+                "    return this.repository.export(...args);",
+                "  }",
+            ]
+        )
+    if obj.get("states"):
+        lines.extend(
+            [
+                "",
+                "  async applyTransition(",
+                f"    id: {id_name},",
+                f"    expectedState: Domain.{obj_name}State,",
+                f"    nextState: Domain.{obj_name}State,",
+                "    transitionId: string,",
+                f"  ): Promise<Domain.{obj_name} | null> {{",
+                "    this.clear(id);",
+                "    const transitioned = await this.repository.applyTransition(id, expectedState, nextState, transitionId);",
+                "    if (transitioned) {",
+                "      this.entries.set(this.keyFn(transitioned), transitioned);",
+                "    }",
+                "    return transitioned;",
+                "  }",
+                "",
+                "  async applyTransitionMany(",
+                f"    ids: {id_name}[],",
+                f"    expectedState: Domain.{obj_name}State,",
+                f"    nextState: Domain.{obj_name}State,",
+                "    transitionId: string,",
+                f"  ): Promise<Domain.{obj_name}[]> {{",
+                "    ids.forEach((id) => this.clear(id));",
+                "    const transitioned = await this.repository.applyTransitionMany(ids, expectedState, nextState, transitionId);",
+                "    for (const item of transitioned) {",
+                "      this.entries.set(this.keyFn(item), item);",
+                "    }",
+                "    return transitioned;",
+                "  }",
+            ]
+        )
+    lines.extend(["}", ""])
+    return lines
+
+
+def _render_repository_loaders(ir: Dict[str, Any]) -> str:
+    objects = sorted(
+        [item for item in ir.get("objects", []) if isinstance(item, dict)],
+        key=lambda item: str(item.get("id", "")),
+    )
+    lines: List[str] = [
+        "// Code generated by prophet-cli. DO NOT EDIT.",
+        "",
+        "import type * as Domain from './domain';",
+        "import type * as Persistence from './persistence';",
+        "",
+    ]
+    lines.extend(_batch_loader_lines())
+    lines.extend(_identity_map_lines())
+
+    lines.append("export interface RepositoryLoaders {")
+    for obj in objects:
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        lines.append(f"  {_camel_case(obj_name)}: BatchLoader<Persistence.{obj_name}Id, Domain.{obj_name}>;")
+    lines.append("}")
+    lines.append("")
+
+    lines.append("export function createRepositoryLoaders(repositories: Persistence.Repositories): RepositoryLoaders {")
+    lines.append("  return {")
+    for obj in objects:
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        repo_var = _camel_case(obj_name)
+        key_values = ", ".join(
+            f"id.{_camel_case(str(pk.get('name', 'id')))}" for pk in _object_primary_key_fields(obj)
+        )
+        lines.append(f"    {repo_var}: new BatchLoader(")
+        lines.append(f"      (ids) => repositories.{repo_var}.getByIds(ids),")
+        lines.append(f"      (id) => JSON.stringify([{key_values}]),")
+        lines.append("    ),")
+    lines.append("  };")
+    lines.append("}")
+    lines.append("")
+
+    export_object_ids = {
+        str(contract.get("object_id", ""))
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict) and _export_contract(contract) is not None
+    }
+    projection_object_ids = {
+        str(contract.get("object_id", ""))
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict) and isinstance(contract.get("projection"), dict)
+    }
+    for obj in objects:
+        obj_id = str(obj.get("id", ""))
+        lines.extend(
+            _object_identity_map_lines(
+                obj,
+                export=obj_id in export_object_ids,
+                projection=obj_id in projection_object_ids,
+            )
+        )
+
+    lines.append("export class IdentityMapRepositories implements Persistence.Repositories {")
+    for obj in objects:
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        lines.append(f"  readonly {_camel_case(obj_name)}: {obj_name}IdentityMapRepository;")
+    lines.append("")
+    lines.append("  constructor(repositories: Persistence.Repositories) {")
+    for obj in objects:
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        repo_var = _camel_case(obj_name)
+        lines.append(f"    this.{repo_var} = new {obj_name}IdentityMapRepository(repositories.{repo_var});")
+    lines.append("  }")
+    lines.append("")
+    lines.append("  clearAll(): void {")
+    for obj in objects:
+        lines.append(f"    this.{_camel_case(_pascal_case(str(obj.get('name', 'Object'))))}.clearAll();")
+    lines.append("  }")
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
@@ -3,14 +3,28 @@ from __future__ import annotations
 from typing import Any, Dict, List, Tuple
 
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _export_contract
+from ..support import _has_cursor_pagination
+from ..support import _has_optional_totals
+from ..support import _has_projection
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
+from ..support import _projection_contract
+from ..support import _snake_case
+from ..support import _total_count_contract
 from ..support import _ts_type_for_descriptor
 
 def _render_persistence_contracts(ir: Dict[str, Any]) -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
     struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
+    query_contract_by_object_id = {
+        str(item.get("object_id", "")): item
+        for item in ir.get("query_contracts", [])
+        if isinstance(item, dict)
+    }
+    cursor_enabled = _has_cursor_pagination(ir)
 
     lines: List[str] = [
         "// Code generated by prophet-cli. DO NOT EDIT.",
@@ -22,11 +36,75 @@ def _render_persistence_contracts(ir: Dict[str, Any]) -> str:
         "  items: T[];",
         "  page: number;",
         "  size: number;",
-        "  totalElements: number;",
-        "  totalPages: number;",
-        "}",
-        "",
     ]
+    if _has_optional_totals(ir):
+        lines.extend(["  totalElements?: number;", "  totalPages?: number;"])
+    else:
+        lines.extend(["  totalElements: number;", "  totalPages: number;"])
+    if cursor_enabled:
+        lines.append("  nextCursor?: string;")
+    lines.extend(["}", ""])
+    if cursor_enabled:
+        lines.extend(
+            [
+                "export class InvalidCursorError extends Error {",
+                "  constructor() {",
+                "    super('invalid_cursor');",
+                "    this.name = 'InvalidCursorError';",
+                "  }",
+                "}",
+                "",
+                "export function encodeCursor(values: unknown[]): string {",
+                "  return Buffer.from(JSON.stringify(values), 'utf8').toString('base64url');",
+                "}",
+                "",
+                "export function decodeCursor(cursor: string, width: number): unknown[] {",
+                "  let values: unknown;",
+                "  try {",
+                "    values = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));",
+                "  } catch {",
+                "    throw new InvalidCursorError();",
+                "  }",
+                "  if (!Array.isArray(values) || values.length !== width) {",
+                "    throw new InvalidCursorError();",
+                "  }",
+                "  return values;",
+                "}",
+                "",
+            ]
+        )
+
+    if _has_projection(ir):
+        lines.extend(
+            [
+                "export class InvalidFieldsError extends Error {",
+                "  constructor() {",
+                "    super('invalid_fields');",
+                "    this.name = 'InvalidFieldsError';",
+                "  }",
+                "}",
+                "",
+                "export function selectFields(value: unknown, allowed: readonly string[], keyFields: readonly string[]): string[] | undefined {",
+                "  if (typeof value !== 'string' || value.trim().length === 0) return undefined;",
+                "  const requested = new Set(value.split(',').map((name) => name.trim()).filter((name) => name.length > 0));",
+                "  for (const name of requested) {",
+                "    if (!allowed.includes(name)) throw new InvalidFieldsError();",
+                "  }",
+                "  keyFields.forEach((name) => requested.add(name));",
+                "  return allowed.filter((name) => requested.has(name));",
+                "}",
+                "",
+                "export function pickFields<T extends object>(item: T, fields: readonly string[] | undefined): T {",
+                "  if (fields === undefined) return item;",
+                "  const picked: Record<string, unknown> = {};",
+                "  for (const name of fields) {",
+                "    picked[name] = (item as Record<string, unknown>)[name];",
+                "  }",
+                "  return picked as T;",
+                "}",
+                "",
+            ]
+        )
 
     object_contracts: List[Tuple[str, str]] = []
     for obj in sorted(ir.get("objects", []), key=lambda item: str(item.get("id", ""))):
@@ -51,11 +129,28 @@ def _render_persistence_contracts(ir: Dict[str, Any]) -> str:
         lines.append("}")
         lines.append("")
 
+        contract = query_contract_by_object_id.get(str(obj.get("id", "")), {})
+        page_param = ", cursor?: string" if _cursor_key_fields(contract, obj) else ""
+        if _total_count_contract(contract) is not None:
+            page_param += ", includeTotal?: boolean"
+        projection = _projection_contract(contract, obj)
+        fields_param = ""
+        if projection is not None:
+            fields_param = "fields?: string[]"
+            page_param += f", {fields_param}"
+            constant = _snake_case(obj_name).upper()
+            lines.append(f"export const {constant}_FIELDS: readonly string[] = [{', '.join(repr(name) for name in projection['fields'])}];")
+            lines.append(f"export const {constant}_KEY_FIELDS: readonly string[] = [{', '.join(repr(name) for name in projection['key_fields'])}];")
+            lines.append("")
         lines.append(f"export interface {repo_name} {{")
-        lines.append(f"  list(page: number, size: number): Promise<Page<Domain.{obj_name}>>;")
-        lines.append(f"  getById(id: {id_name}): Promise<Domain.{obj_name} | null>;")
-        lines.append(f"  query(filter: Filters.{obj_name}QueryFilter, page: number, size: number): Promise<Page<Domain.{obj_name}>>;")
+        lines.append(f"  list(page: number, size: number{page_param}): Promise<Page<Domain.{obj_name}>>;")
+        lines.append(f"  getById(id: {id_name}{', ' + fields_param if fields_param else ''}): Promise<Domain.{obj_name} | null>;")
+        lines.append(f"  getByIds(ids: {id_name}[]): Promise<(Domain.{obj_name} | null)[]>;")
+        lines.append(f"  query(filter: Filters.{obj_name}QueryFilter, page: number, size: number{page_param}): Promise<Page<Domain.{obj_name}>>;")
+        if _export_contract(contract) is not None:
+            lines.append(f"  export(filter: Filters.{obj_name}QueryFilter, chunkSize?: number): AsyncIterable<Domain.{obj_name}[]>;")
         lines.append(f"  save(item: Domain.{obj_name}): Promise<Domain.{obj_name}>;")
+        lines.append(f"  saveMany(items: Domain.{obj_name}[]): Promise<Domain.{obj_name}[]>;")
         if obj.get("states"):
             lines.append("  applyTransition(")
             lines.append(f"    id: {id_name},")
@@ -63,6 +158,12 @@ def _render_persistence_contracts(ir: Dict[str, Any]) -> str:
             lines.append(f"    nextState: Domain.{obj_name}State,")
             lines.append("    transitionId: string,")
             lines.append(f"  ): Promise<Domain.{obj_name} | null>;")
+            lines.append("  applyTransitionMany(")
+            lines.append(f"    ids: {id_name}[],")
+            lines.append(f"    expectedState: Domain.{obj_name}State,")
+            lines.append(f"    nextState: Domain.{obj_name}State,")
+            lines.append("    transitionId: string,")
+            lines.append(f"  ): Promise<Domain.{obj_name}[]>;")
         lines.append("}")
         lines.append("")
 
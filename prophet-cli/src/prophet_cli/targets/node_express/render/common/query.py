@@ -3,14 +3,22 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _export_contract
 from ..support import _express_path
 from ..support import _extract_path_params
 from ..support import _field_index
+from ..support import _has_export
+from ..support import _has_cursor_pagination
+from ..support import _has_optional_totals
+from ..support import _has_projection
 from ..support import _is_required
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
+from ..support import _projection_contract
 from ..support import _render_property
 from ..support import _snake_case
+from ..support import _total_count_contract
 from ..support import _ts_type_for_descriptor
 from ..support import _pluralize
 
@@ -89,19 +97,96 @@ def _render_query_routes(ir: Dict[str, Any]) -> str:
         "// Code generated by prophet-cli. DO NOT EDIT.",
         "",
         "import { Router, type Request, type Response, type NextFunction } from 'express';",
-        "import type { Repositories } from './persistence';",
-        "import type * as Filters from './query';",
-        "",
-        "function parsePage(value: unknown, fallback: number): number {",
-        "  const n = Number(value);",
-        "  if (!Number.isFinite(n) || n < 0) return fallback;",
-        "  return Math.trunc(n);",
-        "}",
-        "",
-        "export function buildQueryRouter(repositories: Repositories): Router {",
-        "  const router = Router();",
-        "",
     ]
+    persistence_names: List[str] = []
+    if _has_cursor_pagination(ir):
+        persistence_names.append("InvalidCursorError")
+    if _has_projection(ir):
+        persistence_names.append("InvalidFieldsError")
+        for contract in sorted(ir.get("query_contracts", []), key=lambda item: str(item.get("object_id", ""))):
+            if not isinstance(contract, dict):
+                continue
+            obj = object_by_id.get(str(contract.get("object_id", "")), {})
+            if _projection_contract(contract, obj) is not None:
+                constant = _snake_case(_pascal_case(str(obj.get("name", "Object")))).upper()
+                persistence_names.extend([f"{constant}_FIELDS", f"{constant}_KEY_FIELDS"])
+        persistence_names.append("selectFields")
+    if persistence_names:
+        lines.append(f"import {{ {', '.join(persistence_names)}, type Repositories }} from './persistence';")
+    else:
+        lines.append("import type { Repositories } from './persistence';")
+    lines.extend(
+        [
+            "import type * as Filters from './query';",
+            "",
+            "function parsePage(value: unknown, fallback: number): number {",
+            "  const n = Number(value);",
+            "  if (!Number.isFinite(n) || n < 0) return fallback;",
+            "  return Math.trunc(n);",
+            "}",
+            "",
+        ]
+    )
+    if _has_cursor_pagination(ir):
+        lines.extend(
+            [
+                "function parseCursor(value: unknown): string | undefined {",
+                "  return typeof value === 'string' && value.length > 0 ? value : undefined;",
+                "}",
+                "",
+            ]
+        )
+    if _has_optional_totals(ir):
+        lines.extend(
+            [
+                "function parseFlag(value: unknown, fallback: boolean): boolean {",
+                "  if (typeof value !== 'string') return fallback;",
+                "  return !['0', 'false', 'no', 'off'].includes(value.trim().toLowerCase());",
+                "}",
+                "",
+            ]
+        )
+    if _has_export(ir):
+        lines.extend(
+            [
+                "function parseExportFormat(value: unknown, formats: string[]): string | undefined {",
+                "  const format = typeof value === 'string' && value.length > 0 ? value : formats[0];",
+                "  return formats.includes(format) ? format : undefined;",
+                "}",
+                "",
+                "function csvCell(value: unknown): string {",
+                "  if (value === undefined || value === null) return '';",
+                "  const text = value instanceof Date ? value.toISOString() : typeof value === 'object' ? JSON.stringify(value) : String(value);",
+                "  return /[\",\\r\\n]/.test(text) ? `\"${text.replace(/\"/g, '\"\"')}\"` : text;",
+                "}",
+                "",
+                "function csvRow(values: unknown[]): string {",
+                "  return values.map(csvCell).join(',') + '\\n';",
+                "}",
+                "",
+                "async function writeExportChunk(res: Response, body: string): Promise<boolean> {",
+                "  if (res.write(body)) return true;",
+                "  await new Promise<void>((resolve) => {",
+                "    const done = () => {",
+                "      res.off('drain', done);",
+                "      res.off('close', done);",
+                "      resolve();",
+                "    };",
+                "    res.on('drain', done);",
+                "    res.on('close', done);",
+                "  });",
+                "  return !res.destroyed;",
+                "}",
+                "",
+            ]
+        )
+    lines.extend(
+        [
+            "export function buildQueryRouter(repositories: Repositories): Router {",
+            "  const router = Router();",
+            "",
+        ]
+    )
 
     for contract in sorted(ir.get("query_contracts", []), key=lambda item: str(item.get("object_id", ""))):
         if not isinstance(contract, dict):
@@ -120,16 +205,53 @@ def _render_query_routes(ir: Dict[str, Any]) -> str:
         typed_query_path = str(paths.get("typed_query", f"/{_pluralize(_snake_case(obj_name))}/query"))
 
         default_size = int(contract.get("pageable", {}).get("default_size", 20))
+        has_cursor = bool(_cursor_key_fields(contract, obj))
+        page_arg = ", parseCursor(req.query.cursor)" if has_cursor else ""
+        total_contract = _total_count_contract(contract)
+        if total_contract is not None:
+            include_default = "true" if total_contract["include_by_default"] else "false"
+            page_arg += f", parseFlag(req.query.includeTotal, {include_default})"
+        projection = _projection_contract(contract, obj)
+        fields_lines: List[str] = []
+        fields_arg = ""
+        if projection is not None:
+            constant = _snake_case(obj_name).upper()
+            fields_lines.append(
+                f"      const fields = selectFields(req.query.{projection['param']}, {constant}_FIELDS, {constant}_KEY_FIELDS);"
+            )
+            fields_arg = ", fields"
+            page_arg += fields_arg
+        fields_catch_lines: List[str] = []
+        if projection is not None:
+            fields_catch_lines.extend(
+                [
+                    "      if (error instanceof InvalidFieldsError) {",
+                    "        res.status(400).json({ error: 'invalid_fields' });",
+                    "        return;",
+                    "      }",
+                ]
+            )
+        catch_lines = ["    } catch (error) {"]
+        if has_cursor:
+            catch_lines.extend(
+                [
+                    "      if (error instanceof InvalidCursorError) {",
+                    "        res.status(400).json({ error: 'invalid_cursor' });",
+                    "        return;",
+                    "      }",
+                ]
+            )
+        catch_lines.extend(fields_catch_lines)
+        catch_lines.extend(["      next(error);", "    }"])
 
         lines.append(f"  router.get('{_express_path(list_path)}', async (req: Request, res: Response, next: NextFunction) => {{")
         lines.append("    try {")
         lines.append("      const page = parsePage(req.query.page, 0);")
         lines.append(f"      const size = parsePage(req.query.size, {default_size});")
-        lines.append(f"      const result = await repositories.{repo_prop}.list(page, size);")
+        lines.extend(fields_lines)
+        lines.append(f"      const result = await repositories.{repo_prop}.list(page, size{page_arg});")
         lines.append("      res.json(result);")
-        lines.append("    } catch (error) {")
-        lines.append("      next(error);")
-        lines.append("    }")
+        lines.extend(catch_lines)
         lines.append("  });")
         lines.append("")
 
@@ -155,13 +277,15 @@ def _render_query_routes(ir: Dict[str, Any]) -> str:
                 lines.append("      };")
             else:
                 lines.append("      const id = { id: String(req.params.id) };")
-        lines.append(f"      const item = await repositories.{repo_prop}.getById(id);")
+        lines.extend(fields_lines)
+        lines.append(f"      const item = await repositories.{repo_prop}.getById(id{fields_arg});")
         lines.append("      if (!item) {")
         lines.append("        res.status(404).json({ error: 'not_found' });")
         lines.append("        return;")
         lines.append("      }")
         lines.append("      res.json(item);")
         lines.append("    } catch (error) {")
+        lines.extend(fields_catch_lines)
         lines.append("      next(error);")
         lines.append("    }")
         lines.append("  });")
@@ -172,13 +296,55 @@ def _render_query_routes(ir: Dict[str, Any]) -> str:
         lines.append("      const page = parsePage(req.query.page, 0);")
         lines.append(f"      const size = parsePage(req.query.size, {default_size});")
         lines.append(f"      const filter = (req.body ?? {{}}) as {filter_type};")
-        lines.append(f"      const result = await repositories.{repo_prop}.query(filter, page, size);")
+        lines.extend(fields_lines)
+        lines.append(f"      const result = await repositories.{repo_prop}.query(filter, page, size{page_arg});")
         lines.append("      res.json(result);")
-        lines.append("    } catch (error) {")
-        lines.append("      next(error);")
-        lines.append("    }")
+        lines.extend(catch_lines)
         lines.append("  });")
         lines.append("")
 
+        export_contract = _export_contract(contract)
+        if export_contract is not None:
+            formats = export_contract["formats"]
+            columns = [_camel_case(str(field.get("name", "field"))) for field in obj.get("fields", []) if isinstance(field, dict)]
+            if obj.get("states"):
+                columns.append("state")
+            lines.append(f"  router.post('{_express_path(export_contract['path'])}', async (req: Request, res: Response, next: NextFunction) => {{")
+            lines.append(f"    const format = parseExportFormat(req.query.format, [{', '.join(repr(item) for item in formats)}]);")
+            lines.append("    if (format === undefined) {")
+            lines.append("      res.status(400).json({ error: 'unsupported_export_format' });")
+            lines.append("      return;")
+            lines.append("    }")
+            lines.append("    try {")
+            lines.append(f"      const filter = (req.body ?? {{}}) as {filter_type};")
+            if "csv" in formats:
+                lines.append(f"      const columns = [{', '.join(repr(column) for column in columns)}];")
+                lines.append("      res.status(200).type(format === 'csv' ? 'text/csv; charset=utf-8' : 'application/x-ndjson');")
+                lines.append("      if (format === 'csv' && !(await writeExportChunk(res, csvRow(columns)))) return;")
+            else:
+                lines.append("      res.status(200).type('application/x-ndjson');")
+            lines.append(f"      for await (const chunk of repositories.{repo_prop}.export(filter)) {{")
+            if "csv" in formats and "ndjson" in formats:
+                lines.append("        const body =")
+                lines.append("          format === 'csv'")
+                lines.append("            ? chunk.map((item) => csvRow(columns.map((column) => (item as any)[column]))).join('')")
+                lines.append("            : chunk.map((item) => JSON.stringify(item) + '\\n').join('');")
+            elif "csv" in formats:
+                lines.append("        const body = chunk.map((item) => csvRow(columns.map((column) => (item as any)[column]))).join('');")
+            else:
+                lines.append("        const body = chunk.map((item) => JSON.stringify(item) + '\\n').join('');")
+            lines.append("        if (!(await writeExportChunk(res, body))) return;")
+            lines.append("      }")
+            lines.append("      res.end();")
+            lines.append("    } catch (error) {")
+            lines.append("      if (res.headersSent) {")
+            lines.append("        res.destroy(error as Error);")
+            lines.append("        return;")
+            lines.append("      }")
+            lines.append("      next(error);")
+            lines.append("    }")
+            lines.append("  });")
+            lines.append("")
+
     lines.extend(["  return router;", "}", ""])
     return "\n".join(lines).rstrip() + "\n"
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from ..support import _camel_case
+from ..support import _pascal_case
+
+
+def _trigger_bindings(ir: Dict[str, Any]) -> List[Tuple[str, str, str, str]]:
+    """(trigger name, envelope event type, action method name, action input type) per trigger."""
+    action_by_id = {item["id"]: item for item in ir.get("actions", []) if isinstance(item, dict) and "id" in item}
+    action_input_by_id = {item["id"]: item for item in ir.get("action_inputs", []) if isinstance(item, dict) and "id" in item}
+    event_by_id = {item["id"]: item for item in ir.get("events", []) if isinstance(item, dict) and "id" in item}
+    bindings: List[Tuple[str, str, str, str]] = []
+    for trigger in sorted(
+        [item for item in ir.get("triggers", []) if isinstance(item, dict)],
+        key=lambda item: str(item.get("id", "")),
+    ):
+        action = action_by_id.get(str(trigger.get("action_id", "")))
+        event = event_by_id.get(str(trigger.get("event_id", "")))
+        if action is None or event is None:
+            continue
+        input_shape = action_input_by_id.get(str(action.get("input_shape_id", "")), {})
+        bindings.append(
+            (
+                _camel_case(str(trigger.get("name", "trigger"))),
+                _pascal_case(str(event.get("name", "Event"))),
+                _camel_case(str(action.get("name", "action"))),
+                _pascal_case(str(input_shape.get("name", "Input"))),
+            )
+        )
+    return bindings
+
+
+def _has_triggers(ir: Dict[str, Any]) -> bool:
+    return bool(_trigger_bindings(ir))
+
+
+def _render_trigger_dispatcher(ir: Dict[str, Any]) -> str:
+    bindings = _trigger_bindings(ir)
+    lines: List[str] = [
+        "// Code generated by prophet-cli. DO NOT EDIT.",
+        "",
+        "import {",
+        "  TriggerBatchError,",
+        "  TriggerDispatcher,",
+        "  type EventPublisher,",
+        "  type EventWireEnvelope,",
+        "  type TriggerFailure,",
+        "  type TriggerPolicy,",
+        "} from '@prophet-ontology/events-runtime';",
+        "import type * as Actions from './actions';",
+        "import type { ActionContext, ActionHandlers } from './action-handlers';",
+        "import { ActionExecutionService } from './action-service';",
+        "",
+        "export const TRIGGER_EVENT_TYPES = {",
+    ]
+    for trigger_name, event_type, _, _ in bindings:
+        lines.append(f"  {trigger_name}: '{event_type}',")
+    lines.extend(
+        [
+            "} as const;",
+            "",
+            "export type TriggerName = keyof typeof TRIGGER_EVENT_TYPES;",
+            "",
+            "// Builds each triggered action's input from the triggering envelope; returning null or undefined skips it.",
+            "export interface TriggerInputMappers {",
+        ]
+    )
+    for trigger_name, _, _, input_name in bindings:
+        lines.append(f"  {trigger_name}(envelope: EventWireEnvelope): Actions.{input_name} | null | undefined;")
+    lines.extend(
+        [
+            "}",
+            "",
+            "export interface TriggerDispatcherOptions {",
+            "  concurrency?: number;",
+            "  maxQueueSize?: number;",
+            "  policies?: Partial<Record<TriggerName, TriggerPolicy>>;",
+            "  downstream?: EventPublisher;",
+            "}",
+            "",
+            "async function runEach(envelopes: EventWireEnvelope[], run: (envelope: EventWireEnvelope) => Promise<void>): Promise<void> {",
+            "  const failures: TriggerFailure[] = [];",
+            "  for (const envelope of envelopes) {",
+            "    try {",
+            "      await run(envelope);",
+            "    } catch (error) {",
+            "      failures.push({ envelope, error });",
+            "    }",
+            "  }",
+            "  if (failures.length > 0) {",
+            "    throw new TriggerBatchError(failures);",
+            "  }",
+            "}",
+            "",
+            "// Triggered actions publish through the dispatcher, so chains continue in-process and keep the",
+            "// triggering trace id; every envelope is also forwarded to `downstream` (default: context.eventPublisher).",
+            "// A failed envelope is retried on its own; the rest of its batch is not re-run.",
+            "// Pass the returned dispatcher as MountDependencies.eventPublisher to start chains from requests.",
+            "export function buildTriggerDispatcher(",
+            "  handlers: ActionHandlers,",
+            "  context: ActionContext,",
+            "  inputs: TriggerInputMappers,",
+            "  options: TriggerDispatcherOptions = {},",
+            "): TriggerDispatcher {",
+            "  const policies = options.policies ?? {};",
+            "  const dispatcher = new TriggerDispatcher(",
+            "    [",
+        ]
+    )
+    for trigger_name, _, action_method, _ in bindings:
+        lines.extend(
+            [
+                "      {",
+                f"        name: '{trigger_name}',",
+                f"        eventType: TRIGGER_EVENT_TYPES.{trigger_name},",
+                "        invoke: (envelopes) =>",
+                "          runEach(envelopes, async (envelope) => {",
+                f"            const input = inputs.{trigger_name}(envelope);",
+                "            if (input != null) {",
+                f"              await service.{action_method}(input, triggerContext(envelope));",
+                "            }",
+                "          }),",
+                f"        policy: policies.{trigger_name},",
+                "      },",
+            ]
+        )
+    lines.extend(
+        [
+            "    ],",
+            "    {",
+            "      concurrency: options.concurrency,",
+            "      maxQueueSize: options.maxQueueSize,",
+            "      downstream: options.downstream ?? context.eventPublisher,",
+            "    },",
+            "  );",
+            "  const service = new ActionExecutionService(handlers, dispatcher);",
+            "  const triggerContext = (envelope: EventWireEnvelope): ActionContext => ({",
+            "    ...context,",
+            "    eventPublisher: dispatcher,",
+            "    traceId: envelope.trace_id,",
+            "  });",
+            "  return dispatcher;",
+            "}",
+        ]
+    )
+    return "\n".join(lines).rstrip() + "\n"
@@ -4,13 +4,21 @@ import re
 from typing import Any, Dict, List, Tuple
 
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _export_contract
 from ..support import _field_index
+from ..support import _has_cursor_pagination
+from ..support import _has_projection
 from ..support import _is_required
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
 from ..support import _pluralize
+from ..support import _projection_contract
 from ..support import _resolve_custom_base
+from ..support import _single_scalar_primary_key
 from ..support import _snake_case
+from ..support import _total_count_contract
+from ..support import _total_pages_helper_lines
 from ..support import _ts_base_type
 
 def _js_object_key(name: str) -> str:
@@ -285,6 +293,13 @@ def _render_mongoose_adapter(ir: Dict[str, Any]) -> str:
         "import type * as Domain from './domain';",
         "import type * as Filters from './query';",
         "import type * as Persistence from './persistence';",
+    ]
+    persistence_helpers = (["decodeCursor", "encodeCursor"] if _has_cursor_pagination(ir) else []) + (
+        ["pickFields"] if _has_projection(ir) else []
+    )
+    if persistence_helpers:
+        lines.append(f"import {{ {', '.join(persistence_helpers)} }} from './persistence';")
+    lines += [
         "import {",
         "  " + ",\n  ".join(model_imports),
         "} from './mongoose-models';",
@@ -298,11 +313,7 @@ def _render_mongoose_adapter(ir: Dict[str, Any]) -> str:
         "  return { page: normalizedPage, size: normalizedSize };",
         "}",
         "",
-        "function totalPages(totalElements: number, size: number): number {",
-        "  if (size <= 0) return 0;",
-        "  return Math.ceil(totalElements / size);",
-        "}",
-        "",
+        *_total_pages_helper_lines(ir),
         "function escapeRegex(value: string): string {",
         "  return value.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');",
         "}",
@@ -441,9 +452,46 @@ def _render_mongoose_adapter(ir: Dict[str, Any]) -> str:
         lines.append("}")
         lines.append("")
 
+        cursor_props = [_camel_case(str(field.get("name", "field"))) for field in _cursor_key_fields(query_contract, obj)]
+        page_param = ", cursor?: string" if cursor_props else ""
+        total_contract = _total_count_contract(query_contract)
+        list_count_expr = "this.model.countDocuments({}).exec()"
+        query_count_expr = "this.model.countDocuments(where).exec()"
+        if total_contract is not None:
+            page_param += f", includeTotal = {'true' if total_contract['include_by_default'] else 'false'}"
+            if total_contract["mode"] == "estimated":
+                list_count_expr = "this.model.estimatedDocumentCount().exec()"
+            list_count_expr = f"includeTotal ? {list_count_expr} : undefined"
+            query_count_expr = f"includeTotal ? {query_count_expr} : undefined"
+        skip_expr = "cursor === undefined ? normalized.page * normalized.size : 0" if cursor_props else "normalized.page * normalized.size"
+        if cursor_props:
+            seek_terms: List[str] = []
+            for idx, prop in enumerate(cursor_props):
+                parts = [f"{cursor_props[prev]}: values[{prev}]" for prev in range(idx)] + [f"{prop}: {{ $gt: values[{idx}] }}"]
+                seek_terms.append(f"{{ {', '.join(parts)} }}")
+            lines.append(f"function {repo_var}Seek(cursor: string | undefined): FilterQuery<{doc_type}> {{")
+            lines.append("  if (cursor === undefined) return {};")
+            lines.append(f"  const values = decodeCursor(cursor, {len(cursor_props)}) as any[];")
+            lines.append("  return {")
+            lines.append("    $or: [")
+            for term in seek_terms:
+                lines.append(f"      {term},")
+            lines.append("    ],")
+            lines.append(f"  }} as FilterQuery<{doc_type}>;")
+            lines.append("}")
+            lines.append("")
+            lines.append(f"function {repo_var}NextCursor(rows: any[], size: number): string | undefined {{")
+            lines.append("  if (rows.length < size) return undefined;")
+            lines.append("  const last = rows[rows.length - 1];")
+            lines.append(f"  return encodeCursor([{', '.join(f'last.{prop}' for prop in cursor_props)}]);")
+            lines.append("}")
+            lines.append("")
+
         lines.append(f"function {repo_var}Sort(): Record<string, 1> {{")
         lines.append("  return {")
-        for pk_field in pk_fields:
+        for prop in cursor_props:
+            lines.append(f"    {prop}: 1,")
+        for pk_field in ([] if cursor_props else pk_fields):
             pk_prop = _camel_case(str(pk_field.get("name", "id")))
             pk_desc = pk_field.get("type", {}) if isinstance(pk_field.get("type"), dict) else {}
             if str(pk_desc.get("kind", "")) == "object_ref":
@@ -488,6 +536,23 @@ def _render_mongoose_adapter(ir: Dict[str, Any]) -> str:
         lines.append("}")
         lines.append("")
 
+        projection = _projection_contract(query_contract, obj)
+        fields_param = ", fields?: string[]" if projection is not None else ""
+        projection_arg = ""
+        items_expr = f"rows.map({repo_var}DocumentToDomain)"
+        if projection is not None:
+            page_param += fields_param
+            projection_arg = f", {repo_var}Projection(fields)"
+            items_expr = f"rows.map((row: any) => pickFields({repo_var}DocumentToDomain(row), fields))"
+            lines.append(f"function {repo_var}Projection(fields: string[] | undefined): Record<string, 1> | undefined {{")
+            lines.append("  if (fields === undefined) return undefined;")
+            if obj.get("states"):
+                lines.append("  return Object.fromEntries(fields.map((name) => [name === 'state' ? '__prophet_state' : name, 1]));")
+            else:
+                lines.append("  return Object.fromEntries(fields.map((name) => [name, 1]));")
+            lines.append("}")
+            lines.append("")
+
         lines.append(f"class {obj_name}MongooseRepository implements Persistence.{obj_name}Repository {{")
         if obj.get("states"):
             lines.append(
@@ -496,42 +561,92 @@ def _render_mongoose_adapter(ir: Dict[str, Any]) -> str:
         else:
             lines.append(f"  constructor(private readonly model: Model<{doc_type}>) {{}}")
         lines.append("")
-        lines.append(f"  async list(page: number, size: number): Promise<Persistence.Page<Domain.{obj_name}>> {{")
+        list_where = f"{repo_var}Seek(cursor)" if cursor_props else "{}"
+        lines.append(f"  async list(page: number, size: number{page_param}): Promise<Persistence.Page<Domain.{obj_name}>> {{")
         lines.append("    const normalized = normalizePage(page, size);")
         lines.append("    const [rows, totalElements] = await Promise.all([")
-        lines.append(f"      this.model.find({{}}).sort({repo_var}Sort()).skip(normalized.page * normalized.size).limit(normalized.size).lean().exec(),")
-        lines.append("      this.model.countDocuments({}).exec(),")
+        lines.append(f"      this.model.find({list_where}{projection_arg}).sort({repo_var}Sort()).skip({skip_expr}).limit(normalized.size).lean().exec(),")
+        lines.append(f"      {list_count_expr},")
         lines.append("    ]);")
         lines.append("    return {")
-        lines.append(f"      items: rows.map({repo_var}DocumentToDomain),")
+        lines.append(f"      items: {items_expr},")
         lines.append("      page: normalized.page,")
         lines.append("      size: normalized.size,")
         lines.append("      totalElements,")
         lines.append("      totalPages: totalPages(totalElements, normalized.size),")
+        if cursor_props:
+            lines.append(f"      nextCursor: {repo_var}NextCursor(rows, normalized.size),")
         lines.append("    };")
         lines.append("  }")
         lines.append("")
-        lines.append(f"  async getById(id: Persistence.{obj_name}Id): Promise<Domain.{obj_name} | null> {{")
-        lines.append(f"    const row = await this.model.findOne({repo_var}PrimaryFilter(id)).lean().exec();")
-        lines.append(f"    return row ? {repo_var}DocumentToDomain(row) : null;")
+        lines.append(f"  async getById(id: Persistence.{obj_name}Id{fields_param}): Promise<Domain.{obj_name} | null> {{")
+        lines.append(f"    const row = await this.model.findOne({repo_var}PrimaryFilter(id){projection_arg}).lean().exec();")
+        if projection is not None:
+            lines.append(f"    return row ? pickFields({repo_var}DocumentToDomain(row), fields) : null;")
+        else:
+            lines.append(f"    return row ? {repo_var}DocumentToDomain(row) : null;")
+        lines.append("  }")
+        lines.append("")
+        scalar_pk = _single_scalar_primary_key(pk_fields)
+        lines.append(f"  async getByIds(ids: Persistence.{obj_name}Id[]): Promise<(Domain.{obj_name} | null)[]> {{")
+        lines.append("    if (ids.length === 0) {")
+        lines.append("      return [];")
+        lines.append("    }")
+        if scalar_pk is not None:
+            pk_name = _camel_case(str(scalar_pk.get("name", "id")))
+            lines.append(f"    const rows = await this.model.find({{ {_js_object_key(pk_name)}: {{ $in: ids.map((id) => id.{pk_name}) }} }}).lean().exec();")
+        else:
+            lines.append(f"    const rows = await this.model.find({{ $or: ids.map({repo_var}PrimaryFilter) }}).lean().exec();")
+        lines.append(f"    const found = new Map<string, Domain.{obj_name}>();")
+        lines.append("    for (const row of rows) {")
+        lines.append(f"      const item = {repo_var}DocumentToDomain(row);")
+        lines.append(f"      found.set(JSON.stringify({repo_var}PrimaryFilter({repo_var}IdFromDomain(item))), item);")
+        lines.append("    }")
+        lines.append(f"    return ids.map((id) => found.get(JSON.stringify({repo_var}PrimaryFilter(id))) ?? null);")
         lines.append("  }")
         lines.append("")
-        lines.append(f"  async query(filter: Filters.{obj_name}QueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.{obj_name}>> {{")
+        query_where = f"{{ $and: [where, {repo_var}Seek(cursor)] }}" if cursor_props else "where"
+        lines.append(f"  async query(filter: Filters.{obj_name}QueryFilter, page: number, size: number{page_param}): Promise<Persistence.Page<Domain.{obj_name}>> {{")
         lines.append("    const normalized = normalizePage(page, size);")
         lines.append(f"    const where = {repo_var}Where(filter);")
         lines.append("    const [rows, totalElements] = await Promise.all([")
-        lines.append(f"      this.model.find(where).sort({repo_var}Sort()).skip(normalized.page * normalized.size).limit(normalized.size).lean().exec(),")
-        lines.append("      this.model.countDocuments(where).exec(),")
+        lines.append(f"      this.model.find({query_where}{projection_arg}).sort({repo_var}Sort()).skip({skip_expr}).limit(normalized.size).lean().exec(),")
+        lines.append(f"      {query_count_expr},")
         lines.append("    ]);")
         lines.append("    return {")
-        lines.append(f"      items: rows.map({repo_var}DocumentToDomain),")
+        lines.append(f"      items: {items_expr},")
         lines.append("      page: normalized.page,")
         lines.append("      size: normalized.size,")
         lines.append("      totalElements,")
         lines.append("      totalPages: totalPages(totalElements, normalized.size),")
+        if cursor_props:
+            lines.append(f"      nextCursor: {repo_var}NextCursor(rows, normalized.size),")
         lines.append("    };")
         lines.append("  }")
         lines.append("")
+        export_contract = _export_contract(query_contract)
+        if export_contract is not None:
+            lines.append(
+                f"  async *export(filter: Filters.{obj_name}QueryFilter, chunkSize = {export_contract['chunk_size']}): AsyncIterable<Domain.{obj_name}[]> {{"
+            )
+            lines.append(f"    const cursor = this.model.find({repo_var}Where(filter)).sort({repo_var}Sort()).lean().batchSize(chunkSize).cursor();")
+            lines.append(f"    let chunk: Domain.{obj_name}[] = [];")
+            lines.append("    try {")
+            lines.append("      for await (const doc of cursor) {")
+            lines.append(f"        chunk.push({repo_var}DocumentToDomain(doc));")
+            lines.append("        if (chunk.length >= chunkSize) {")
+            lines.append("          yield chunk;")
+            lines.append("          chunk = [];")
+            lines.append("        }")
+            lines.append("      }")
+            lines.append("      if (chunk.length > 0) {")
+            lines.append("        yield chunk;")
+            lines.append("      }")
+            lines.append("    } finally {")
+            lines.append("      await cursor.close();")
+            lines.append("    }")
+            lines.append("  }")
+            lines.append("")
         lines.append(f"  async save(item: Domain.{obj_name}): Promise<Domain.{obj_name}> {{")
         lines.append(f"    const id = {repo_var}IdFromDomain(item);")
         lines.append(f"    const payload = {repo_var}DomainToDocument(item);")
@@ -541,6 +656,23 @@ def _render_mongoose_adapter(ir: Dict[str, Any]) -> str:
         lines.append(f"    if (!persisted) return {repo_var}DocumentToDomain(payload);")
         lines.append(f"    return {repo_var}DocumentToDomain(persisted);")
         lines.append("  }")
+        lines.append("")
+        lines.append(f"  async saveMany(items: Domain.{obj_name}[]): Promise<Domain.{obj_name}[]> {{")
+        lines.append("    if (items.length === 0) {")
+        lines.append("      return [];")
+        lines.append("    }")
+        lines.append("    await this.model.bulkWrite(")
+        lines.append("      items.map((item) => ({")
+        lines.append("        updateOne: {")
+        lines.append(f"          filter: {repo_var}PrimaryFilter({repo_var}IdFromDomain(item)),")
+        lines.append(f"          update: {{ $set: {repo_var}DomainToDocument(item) }},")
+        lines.append("          upsert: true,")
+        lines.append("        },")
+        lines.append("      })),")
+        lines.append("      { ordered: false },")
+        lines.append("    );")
+        lines.append("    return items;")
+        lines.append("  }")
         if obj.get("states"):
             lines.append("")
             lines.append("  async applyTransition(")
@@ -569,6 +701,47 @@ def _render_mongoose_adapter(ir: Dict[str, Any]) -> str:
             lines.append("    });")
             lines.append(f"    return {repo_var}DocumentToDomain(persisted);")
             lines.append("  }")
+            lines.append("")
+            lines.append("  async applyTransitionMany(")
+            lines.append(f"    ids: Persistence.{obj_name}Id[],")
+            lines.append(f"    expectedState: Domain.{obj_name}State,")
+            lines.append(f"    nextState: Domain.{obj_name}State,")
+            lines.append("    transitionId: string,")
+            lines.append(f"  ): Promise<Domain.{obj_name}[]> {{")
+            lines.append("    if (ids.length === 0) {")
+            lines.append("      return [];")
+            lines.append("    }")
+            lines.append("    const candidates = await this.model")
+            lines.append(f"      .find({{ $or: ids.map({repo_var}PrimaryFilter), __prophet_state: expectedState }})")
+            lines.append("      .lean()")
+            lines.append("      .exec();")
+            lines.append("    if (candidates.length === 0) {")
+            lines.append("      return [];")
+            lines.append("    }")
+            lines.append("    const candidateIds = candidates.map((row: any) => row._id);")
+            lines.append("    const updateResult = await this.model")
+            lines.append("      .updateMany({ _id: { $in: candidateIds }, __prophet_state: expectedState }, { $set: { __prophet_state: nextState } })")
+            lines.append("      .exec();")
+            lines.append("    let rows: any[] = candidates.map((row: any) => ({ ...row, __prophet_state: nextState }));")
+            lines.append("    if (updateResult.modifiedCount !== candidates.length) {")
+            lines.append("      // A concurrent writer moved some rows first; keep only those that now carry the next state.")
+            lines.append("      rows = await this.model.find({ _id: { $in: candidateIds }, __prophet_state: nextState }).lean().exec();")
+            lines.append("    }")
+            lines.append(f"    const transitioned = rows.map((row: any) => {repo_var}DocumentToDomain(row));")
+            lines.append("    if (transitioned.length > 0) {")
+            lines.append("      const occurredAt = new Date().toISOString();")
+            lines.append("      await this.historyModel.insertMany(")
+            lines.append("        transitioned.map((item) => ({")
+            lines.append(f"          ...{repo_var}IdFromDomain(item),")
+            lines.append("          transitionId,")
+            lines.append("          fromState: expectedState,")
+            lines.append("          toState: nextState,")
+            lines.append("          occurredAt,")
+            lines.append("        })),")
+            lines.append("      );")
+            lines.append("    }")
+            lines.append("    return transitioned;")
+            lines.append("  }")
         lines.append("}")
         lines.append("")
 
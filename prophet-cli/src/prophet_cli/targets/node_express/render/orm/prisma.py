@@ -3,15 +3,28 @@ from __future__ import annotations
 from typing import Any, Dict, List, Tuple
 
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _estimate_number_helper_lines
+from ..support import _export_contract
 from ..support import _field_index
+from ..support import _has_cursor_pagination
+from ..support import _has_estimated_totals
+from ..support import _has_projection
 from ..support import _is_required
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
 from ..support import _pluralize
+from ..support import _projection_contract
 from ..support import _resolve_custom_base
+from ..support import _single_scalar_primary_key
 from ..support import _snake_case
+from ..support import _total_count_contract
+from ..support import _total_pages_helper_lines
 from ..support import _ts_type_for_descriptor
 
+PRISMA_SKIP_DUPLICATES_PROVIDERS = ("cockroachdb", "mysql", "postgresql")
+
+
 def _prisma_scalar_type_for_descriptor(type_desc: Dict[str, Any], type_by_id: Dict[str, Dict[str, Any]]) -> str:
     kind = str(type_desc.get("kind", ""))
     if kind == "base":
@@ -246,6 +259,7 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
         for item in ir.get("query_contracts", [])
         if isinstance(item, dict)
     }
+    skip_duplicates = provider in PRISMA_SKIP_DUPLICATES_PROVIDERS
 
     lines = [
         "// Code generated by prophet-cli. DO NOT EDIT.",
@@ -254,6 +268,15 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
         "import type * as Domain from './domain';",
         "import type * as Filters from './query';",
         "import type * as Persistence from './persistence';",
+    ]
+    persistence_helpers = (["decodeCursor", "encodeCursor"] if _has_cursor_pagination(ir) else []) + (
+        ["pickFields"] if _has_projection(ir) else []
+    )
+    if persistence_helpers:
+        lines.append(f"import {{ {', '.join(persistence_helpers)} }} from './persistence';")
+    lines += [
+        "",
+        "const SAVE_MANY_CHUNK_SIZE = 500;",
         "",
         "function normalizePage(page: number, size: number): { page: number; size: number } {",
         "  const normalizedPage = Number.isFinite(page) && page >= 0 ? Math.trunc(page) : 0;",
@@ -261,11 +284,7 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
         "  return { page: normalizedPage, size: normalizedSize };",
         "}",
         "",
-        "function totalPages(totalElements: number, size: number): number {",
-        "  if (size <= 0) return 0;",
-        "  return Math.ceil(totalElements / size);",
-        "}",
-        "",
+        *_total_pages_helper_lines(ir),
         "function parseJsonValue<T>(value: unknown): T | undefined {",
         "  if (value === null || value === undefined) return undefined;",
         "  if (typeof value === 'string') {",
@@ -278,6 +297,20 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
         "  return value as T;",
         "}",
         "",
+    ]
+    if _has_estimated_totals(ir) and provider == "postgresql":
+        lines += _estimate_number_helper_lines()
+        lines += [
+            "async function estimatedTableTotal(client: PrismaClient, table: string): Promise<number | undefined> {",
+            "  const rows = await (client as any).$queryRawUnsafe(",
+            "    'SELECT CAST(reltuples AS BIGINT) AS estimate FROM pg_class WHERE oid = to_regclass(CAST($1 AS TEXT))',",
+            "    table,",
+            "  );",
+            "  return toEstimate(rows?.[0]?.estimate);",
+            "}",
+            "",
+        ]
+    lines += [
         "export class PrismaRepositories implements Persistence.Repositories {",
     ]
     for obj in sorted(ir.get("objects", []), key=lambda item: str(item.get("id", ""))):
@@ -413,6 +446,51 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
         lines.append("}")
         lines.append("")
 
+        lines.append(f"function {repo_var}RowKey(row: any): string {{")
+        lines.append(f"  return JSON.stringify([{', '.join(f'row.{col}' for col, _ in unique_parts)}]);")
+        lines.append("}")
+        lines.append("")
+
+        cursor_columns = [str(field.get("name", "field")) for field in _cursor_key_fields(query_contract, obj)]
+        if cursor_columns:
+            seek_terms: List[str] = []
+            for idx, col in enumerate(cursor_columns):
+                parts = [f"{cursor_columns[prev]}: values[{prev}]" for prev in range(idx)] + [f"{col}: {{ gt: values[{idx}] }}"]
+                seek_terms.append(f"{{ {', '.join(parts)} }}")
+            lines.append(f"function {repo_var}Seek(cursor: string | undefined): any {{")
+            lines.append("  if (cursor === undefined) return {};")
+            lines.append(f"  const values = decodeCursor(cursor, {len(cursor_columns)}) as any[];")
+            lines.append("  return {")
+            lines.append("    OR: [")
+            for term in seek_terms:
+                lines.append(f"      {term},")
+            lines.append("    ],")
+            lines.append("  };")
+            lines.append("}")
+            lines.append("")
+            lines.append(f"function {repo_var}NextCursor(rows: any[], size: number): string | undefined {{")
+            lines.append("  if (rows.length < size) return undefined;")
+            lines.append("  const last = rows[rows.length - 1];")
+            lines.append(f"  return encodeCursor([{', '.join(f'last.{col}' for col in cursor_columns)}]);")
+            lines.append("}")
+            lines.append("")
+        order_columns = cursor_columns or [col for col, _ in unique_parts]
+        page_param = ", cursor?: string" if cursor_columns else ""
+        total_contract = _total_count_contract(query_contract)
+        if total_contract is not None:
+            page_param += f", includeTotal = {'true' if total_contract['include_by_default'] else 'false'}"
+        list_count_expr = "this.delegate.count()"
+        if total_contract is not None and total_contract["mode"] == "estimated" and provider == "postgresql":
+            list_count_expr = (
+                f"estimatedTableTotal(this.client, '\"{obj_name}\"').then((estimate) => estimate ?? this.delegate.count())"
+            )
+        if total_contract is not None:
+            list_count_expr = f"includeTotal ? {list_count_expr} : undefined"
+        query_count_expr = "this.delegate.count({ where })"
+        if total_contract is not None:
+            query_count_expr = f"includeTotal ? {query_count_expr} : undefined"
+        skip_expr = "cursor === undefined ? normalized.page * normalized.size : 0" if cursor_columns else "normalized.page * normalized.size"
+
         lines.append(f"function {repo_var}RowToDomain(row: any): Domain.{obj_name} {{")
         lines.append("  return {")
         for field in list(obj.get("fields", [])):
@@ -496,6 +574,35 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
         lines.append("}")
         lines.append("")
 
+        projection = _projection_contract(query_contract, obj)
+        fields_param = ", fields?: string[]" if projection is not None else ""
+        items_expr = f"rows.map({repo_var}RowToDomain)"
+        if projection is not None:
+            page_param += fields_param
+            items_expr = f"rows.map((row: any) => pickFields({repo_var}RowToDomain(row), fields))"
+            constant = _snake_case(obj_name).upper()
+            lines.append(f"const {constant}_FIELD_COLUMNS: Record<string, string[]> = {{")
+            for field in list(obj.get("fields", [])):
+                if not isinstance(field, dict):
+                    continue
+                type_desc = field.get("type", {}) if isinstance(field.get("type"), dict) else {}
+                if str(type_desc.get("kind", "")) == "object_ref":
+                    columns = [col for col, _, _ in _prisma_ref_columns(field, object_by_id=object_by_id, type_by_id=type_by_id)]
+                else:
+                    columns = [str(field.get("name", "field"))]
+                lines.append(f"  {_camel_case(str(field.get('name', 'field')))}: [{', '.join(repr(col) for col in columns)}],")
+            if obj.get("states"):
+                lines.append("  state: ['state'],")
+            lines.append("};")
+            lines.append("")
+            lines.append(f"function {repo_var}Select(fields: string[] | undefined): any {{")
+            lines.append("  if (fields === undefined) return undefined;")
+            lines.append(
+                f"  return Object.fromEntries(fields.flatMap((name) => {constant}_FIELD_COLUMNS[name] ?? []).map((column) => [column, true]));"
+            )
+            lines.append("}")
+            lines.append("")
+
         lines.append(f"class {obj_name}PrismaRepository implements Persistence.{obj_name}Repository {{")
         lines.append("  private readonly delegate: any;")
         lines.append("")
@@ -503,59 +610,121 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
         lines.append(f"    this.delegate = (client as any).{repo_var};")
         lines.append("  }")
         lines.append("")
-        lines.append(f"  async list(page: number, size: number): Promise<Persistence.Page<Domain.{obj_name}>> {{")
+        lines.append(f"  async list(page: number, size: number{page_param}): Promise<Persistence.Page<Domain.{obj_name}>> {{")
         lines.append("    const normalized = normalizePage(page, size);")
         lines.append("    const [rows, totalElements] = await Promise.all([")
         lines.append("      this.delegate.findMany({")
-        lines.append("        skip: normalized.page * normalized.size,")
+        if projection is not None:
+            lines.append(f"        select: {repo_var}Select(fields),")
+        if cursor_columns:
+            lines.append(f"        where: {repo_var}Seek(cursor),")
+        lines.append(f"        skip: {skip_expr},")
         lines.append("        take: normalized.size,")
-        if unique_parts:
+        if order_columns:
             lines.append("        orderBy: [")
-            for col, _ in unique_parts:
+            for col in order_columns:
                 lines.append(f"          {{ {col}: 'asc' }},")
             lines.append("        ],")
         lines.append("      }),")
-        lines.append("      this.delegate.count(),")
+        lines.append(f"      {list_count_expr},")
         lines.append("    ]);")
         lines.append("    return {")
-        lines.append(f"      items: rows.map({repo_var}RowToDomain),")
+        lines.append(f"      items: {items_expr},")
         lines.append("      page: normalized.page,")
         lines.append("      size: normalized.size,")
         lines.append("      totalElements,")
         lines.append("      totalPages: totalPages(totalElements, normalized.size),")
+        if cursor_columns:
+            lines.append(f"      nextCursor: {repo_var}NextCursor(rows, normalized.size),")
         lines.append("    };")
         lines.append("  }")
         lines.append("")
-        lines.append(f"  async getById(id: Persistence.{obj_name}Id): Promise<Domain.{obj_name} | null> {{")
-        lines.append(f"    const row = await this.delegate.findUnique({{ where: {repo_var}UniqueWhere(id) }});")
-        lines.append(f"    return row ? {repo_var}RowToDomain(row) : null;")
+        lines.append(f"  async getById(id: Persistence.{obj_name}Id{fields_param}): Promise<Domain.{obj_name} | null> {{")
+        if projection is not None:
+            lines.append(f"    const row = await this.delegate.findUnique({{ where: {repo_var}UniqueWhere(id), select: {repo_var}Select(fields) }});")
+            lines.append(f"    return row ? pickFields({repo_var}RowToDomain(row), fields) : null;")
+        else:
+            lines.append(f"    const row = await this.delegate.findUnique({{ where: {repo_var}UniqueWhere(id) }});")
+            lines.append(f"    return row ? {repo_var}RowToDomain(row) : null;")
+        lines.append("  }")
+        lines.append("")
+        scalar_pk = _single_scalar_primary_key(pk_fields)
+        lines.append(f"  async getByIds(ids: Persistence.{obj_name}Id[]): Promise<(Domain.{obj_name} | null)[]> {{")
+        lines.append("    if (ids.length === 0) {")
+        lines.append("      return [];")
+        lines.append("    }")
+        if scalar_pk is not None:
+            pk_name = _camel_case(str(scalar_pk.get("name", "id")))
+            lines.append(
+                f"    const rows = await this.delegate.findMany({{ where: {{ {str(scalar_pk.get('name', 'id'))}: {{ in: ids.map((id) => id.{pk_name}) }} }} }});"
+            )
+        else:
+            lines.append(f"    const rows = await this.delegate.findMany({{ where: {{ OR: ids.map({repo_var}PrimaryWhere) }} }});")
+        lines.append(f"    const found = new Map<string, Domain.{obj_name}>();")
+        lines.append("    for (const row of rows) {")
+        lines.append(f"      const item = {repo_var}RowToDomain(row);")
+        lines.append(f"      found.set(JSON.stringify({repo_var}PrimaryWhere({repo_var}IdFromDomain(item))), item);")
+        lines.append("    }")
+        lines.append(f"    return ids.map((id) => found.get(JSON.stringify({repo_var}PrimaryWhere(id))) ?? null);")
         lines.append("  }")
         lines.append("")
-        lines.append(f"  async query(filter: Filters.{obj_name}QueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.{obj_name}>> {{")
+        lines.append(f"  async query(filter: Filters.{obj_name}QueryFilter, page: number, size: number{page_param}): Promise<Persistence.Page<Domain.{obj_name}>> {{")
         lines.append("    const normalized = normalizePage(page, size);")
         lines.append(f"    const where = {repo_var}Where(filter);")
         lines.append("    const [rows, totalElements] = await Promise.all([")
         lines.append("      this.delegate.findMany({")
-        lines.append("        where,")
-        lines.append("        skip: normalized.page * normalized.size,")
+        if projection is not None:
+            lines.append(f"        select: {repo_var}Select(fields),")
+        if cursor_columns:
+            lines.append(f"        where: {{ AND: [where, {repo_var}Seek(cursor)] }},")
+        else:
+            lines.append("        where,")
+        lines.append(f"        skip: {skip_expr},")
         lines.append("        take: normalized.size,")
-        if unique_parts:
+        if order_columns:
             lines.append("        orderBy: [")
-            for col, _ in unique_parts:
+            for col in order_columns:
                 lines.append(f"          {{ {col}: 'asc' }},")
             lines.append("        ],")
         lines.append("      }),")
-        lines.append("      this.delegate.count({ where }),")
+        lines.append(f"      {query_count_expr},")
         lines.append("    ]);")
         lines.append("    return {")
-        lines.append(f"      items: rows.map({repo_var}RowToDomain),")
+        lines.append(f"      items: {items_expr},")
         lines.append("      page: normalized.page,")
         lines.append("      size: normalized.size,")
         lines.append("      totalElements,")
         lines.append("      totalPages: totalPages(totalElements, normalized.size),")
+        if cursor_columns:
+            lines.append(f"      nextCursor: {repo_var}NextCursor(rows, normalized.size),")
         lines.append("    };")
         lines.append("  }")
         lines.append("")
+        export_contract = _export_contract(query_contract)
+        if export_contract is not None:
+            lines.append(
+                f"  async *export(filter: Filters.{obj_name}QueryFilter, chunkSize = {export_contract['chunk_size']}): AsyncIterable<Domain.{obj_name}[]> {{"
+            )
+            lines.append(f"    const where = {repo_var}Where(filter);")
+            lines.append("    let cursor: any = undefined;")
+            lines.append("    while (true) {")
+            lines.append("      const rows = await this.delegate.findMany({")
+            lines.append("        where,")
+            lines.append("        take: chunkSize,")
+            lines.append("        ...(cursor === undefined ? {} : { cursor, skip: 1 }),")
+            lines.append("        orderBy: [")
+            for col, _ in unique_parts:
+                lines.append(f"          {{ {col}: 'asc' }},")
+            lines.append("        ],")
+            lines.append("      });")
+            lines.append("      if (rows.length === 0) return;")
+            lines.append(f"      const items: Domain.{obj_name}[] = rows.map({repo_var}RowToDomain);")
+            lines.append("      yield items;")
+            lines.append("      if (rows.length < chunkSize) return;")
+            lines.append(f"      cursor = {repo_var}UniqueWhere({repo_var}IdFromDomain(items[items.length - 1]));")
+            lines.append("    }")
+            lines.append("  }")
+            lines.append("")
         lines.append(f"  async save(item: Domain.{obj_name}): Promise<Domain.{obj_name}> {{")
         lines.append(f"    const payload = {repo_var}DomainToRow(item);")
         lines.append(
@@ -563,6 +732,51 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
         )
         lines.append(f"    return {repo_var}RowToDomain(persisted);")
         lines.append("  }")
+        lines.append("")
+        lines.append(f"  async saveMany(items: Domain.{obj_name}[]): Promise<Domain.{obj_name}[]> {{")
+        lines.append(f"    const persisted: Domain.{obj_name}[] = [];")
+        lines.append("    for (let start = 0; start < items.length; start += SAVE_MANY_CHUNK_SIZE) {")
+        lines.append("      const chunk = items.slice(start, start + SAVE_MANY_CHUNK_SIZE);")
+        lines.append("      const existing = await this.delegate.findMany({")
+        lines.append(f"        where: {{ OR: chunk.map((item) => {repo_var}PrimaryWhere({repo_var}IdFromDomain(item))) }},")
+        lines.append(f"        select: {{ {', '.join(f'{col}: true' for col, _ in unique_parts)} }},")
+        lines.append("      });")
+        lines.append(f"      const existingKeys = new Set(existing.map({repo_var}RowKey));")
+        lines.append(f"      const created: Domain.{obj_name}[] = [];")
+        lines.append("      const writes: any[] = [];")
+        lines.append("      for (const item of chunk) {")
+        lines.append(f"        const payload = {repo_var}DomainToRow(item);")
+        lines.append(f"        if (existingKeys.has({repo_var}RowKey(payload))) {{")
+        lines.append(f"          writes.push(this.delegate.update({{ where: {repo_var}UniqueWhere({repo_var}IdFromDomain(item)), data: payload }}));")
+        lines.append("        } else {")
+        lines.append("          created.push(item);")
+        lines.append("        }")
+        lines.append(f"        persisted.push({repo_var}RowToDomain(payload));")
+        lines.append("      }")
+        lines.append("      if (created.length > 0) {")
+        if skip_duplicates:
+            lines.append(f"        writes.unshift(this.delegate.createMany({{ data: created.map({repo_var}DomainToRow), skipDuplicates: true }}));")
+        else:
+            lines.append(f"        writes.unshift(this.delegate.createMany({{ data: created.map({repo_var}DomainToRow) }}));")
+        lines.append("      }")
+        if skip_duplicates:
+            lines.append("      const results = await this.client.$transaction(writes);")
+            lines.append("      if (created.length > 0 && Number(results[0]?.count ?? 0) < created.length) {")
+            lines.append("        // Rows inserted concurrently since the lookup were skipped; upsert them so this write still lands.")
+            lines.append("        await this.client.$transaction(")
+            lines.append("          created.map((item) => {")
+            lines.append(f"            const payload = {repo_var}DomainToRow(item);")
+            lines.append(
+                f"            return this.delegate.upsert({{ where: {repo_var}UniqueWhere({repo_var}IdFromDomain(item)), create: payload, update: payload }});"
+            )
+            lines.append("          }),")
+            lines.append("        );")
+            lines.append("      }")
+        else:
+            lines.append("      await this.client.$transaction(writes);")
+        lines.append("    }")
+        lines.append("    return persisted;")
+        lines.append("  }")
         if obj.get("states"):
             lines.append("")
             lines.append("  async applyTransition(")
@@ -597,6 +811,42 @@ def _render_prisma_adapter(ir: Dict[str, Any], *, provider: str) -> str:
             lines.append("    });")
             lines.append(f"    return persisted ? {repo_var}RowToDomain(persisted) : null;")
             lines.append("  }")
+            lines.append("")
+            lines.append("  async applyTransitionMany(")
+            lines.append(f"    ids: Persistence.{obj_name}Id[],")
+            lines.append(f"    expectedState: Domain.{obj_name}State,")
+            lines.append(f"    nextState: Domain.{obj_name}State,")
+            lines.append("    transitionId: string,")
+            lines.append(f"  ): Promise<Domain.{obj_name}[]> {{")
+            lines.append("    if (ids.length === 0) {")
+            lines.append("      return [];")
+            lines.append("    }")
+            lines.append("    const persisted = await this.client.$transaction(async (tx) => {")
+            lines.append(f"      const objDelegate = (tx as any).{repo_var};")
+            lines.append(f"      const rows = await objDelegate.findMany({{ where: {{ OR: ids.map({repo_var}PrimaryWhere), state: expectedState }} }});")
+            lines.append("      if (rows.length === 0) {")
+            lines.append("        return [];")
+            lines.append("      }")
+            lines.append(f"      const matched = rows.map((row: any) => {repo_var}PrimaryWhere({repo_var}IdFromDomain({repo_var}RowToDomain(row))));")
+            lines.append("      const updateResult = await objDelegate.updateMany({")
+            lines.append("        where: { OR: matched, state: expectedState },")
+            lines.append("        data: { state: nextState },")
+            lines.append("      });")
+            lines.append("      if (Number(updateResult?.count ?? 0) !== rows.length) {")
+            lines.append(f"        throw new Error('{obj_name} transition conflict: rows changed state concurrently');")
+            lines.append("      }")
+            lines.append(f"      await (tx as any).{_camel_case(f'{obj_name}StateHistory')}.createMany({{")
+            lines.append("        data: matched.map((primaryWhere: any) => ({")
+            lines.append("          ...primaryWhere,")
+            lines.append("          transition_id: transitionId,")
+            lines.append("          from_state: expectedState,")
+            lines.append("          to_state: nextState,")
+            lines.append("        })),")
+            lines.append("      });")
+            lines.append("      return rows.map((row: any) => ({ ...row, state: nextState }));")
+            lines.append("    });")
+            lines.append(f"    return persisted.map({repo_var}RowToDomain);")
+            lines.append("  }")
         lines.append("}")
         lines.append("")
 
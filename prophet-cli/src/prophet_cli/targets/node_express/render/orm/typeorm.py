@@ -3,13 +3,23 @@ from __future__ import annotations
 from typing import Any, Dict, List, Tuple
 
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _estimate_number_helper_lines
+from ..support import _export_contract
 from ..support import _field_index
+from ..support import _has_cursor_pagination
+from ..support import _has_estimated_totals
+from ..support import _has_projection
 from ..support import _is_required
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
 from ..support import _pluralize
+from ..support import _projection_contract
 from ..support import _resolve_custom_base
+from ..support import _single_scalar_primary_key
 from ..support import _snake_case
+from ..support import _total_count_contract
+from ..support import _total_pages_helper_lines
 from ..support import _ts_base_type
 from ..support import _ts_type_for_descriptor
 
@@ -197,10 +207,17 @@ def _render_typeorm_adapter(ir: Dict[str, Any]) -> str:
     lines = [
         "// Code generated by prophet-cli. DO NOT EDIT.",
         "",
-        "import { DataSource, type Repository, type SelectQueryBuilder } from 'typeorm';",
+        "import { DataSource, In, type Repository, type SelectQueryBuilder } from 'typeorm';",
         "import type * as Domain from './domain';",
         "import type * as Filters from './query';",
         "import type * as Persistence from './persistence';",
+    ]
+    persistence_helpers = (["decodeCursor", "encodeCursor"] if _has_cursor_pagination(ir) else []) + (
+        ["pickFields"] if _has_projection(ir) else []
+    )
+    if persistence_helpers:
+        lines.append(f"import {{ {', '.join(persistence_helpers)} }} from './persistence';")
+    lines += [
         "import {",
         "  " + ",\n  ".join(entity_imports),
         "} from './typeorm-entities';",
@@ -211,11 +228,29 @@ def _render_typeorm_adapter(ir: Dict[str, Any]) -> str:
         "  return { page: normalizedPage, size: normalizedSize };",
         "}",
         "",
-        "function totalPages(totalElements: number, size: number): number {",
-        "  if (size <= 0) return 0;",
-        "  return Math.ceil(totalElements / size);",
-        "}",
-        "",
+        *_total_pages_helper_lines(ir),
+    ]
+    if _has_estimated_totals(ir):
+        lines += _estimate_number_helper_lines()
+        lines += [
+            "async function estimatedTableTotal(dataSource: DataSource, table: string): Promise<number | undefined> {",
+            "  if (dataSource.options.type !== 'postgres') return undefined;",
+            "  const rows = await dataSource.query(",
+            "    'SELECT CAST(reltuples AS BIGINT) AS estimate FROM pg_class WHERE oid = to_regclass(CAST($1 AS TEXT))',",
+            "    [table],",
+            "  );",
+            "  return toEstimate(rows?.[0]?.estimate);",
+            "}",
+            "",
+            "async function estimatedQueryTotal(dataSource: DataSource, qb: SelectQueryBuilder<any>): Promise<number | undefined> {",
+            "  if (dataSource.options.type !== 'postgres') return undefined;",
+            "  const [sql, parameters] = qb.getQueryAndParameters();",
+            "  const rows = await dataSource.query(`EXPLAIN (FORMAT JSON) ${sql}`, parameters);",
+            "  return toEstimate(rows?.[0]?.['QUERY PLAN']?.[0]?.Plan?.['Plan Rows']);",
+            "}",
+            "",
+        ]
+    lines += [
         "export class TypeOrmRepositories implements Persistence.Repositories {",
     ]
     for obj in sorted(ir.get("objects", []), key=lambda item: str(item.get("id", ""))):
@@ -409,8 +444,37 @@ def _render_typeorm_adapter(ir: Dict[str, Any]) -> str:
         lines.append("}")
         lines.append("")
 
+        cursor_fields = _cursor_key_fields(query_contract, obj)
+        cursor_columns = [str(field.get("name", "field")) for field in cursor_fields]
+        page_param = ", cursor?: string" if cursor_fields else ""
+        total_contract = _total_count_contract(query_contract)
+        if total_contract is not None:
+            page_param += f", includeTotal = {'true' if total_contract['include_by_default'] else 'false'}"
+        skip_expr = "cursor === undefined ? normalized.page * normalized.size : 0" if cursor_fields else "normalized.page * normalized.size"
+        if cursor_fields:
+            seek_terms: List[str] = []
+            for idx, col in enumerate(cursor_columns):
+                parts = [f"record.{cursor_columns[prev]} = :cursor_{prev}" for prev in range(idx)] + [f"record.{col} > :cursor_{idx}"]
+                seek_terms.append(parts[0] if len(parts) == 1 else f"({' AND '.join(parts)})")
+            cursor_params = ", ".join(f"cursor_{idx}: values[{idx}]" for idx in range(len(cursor_columns)))
+            lines.append(f"function {repo_var}ApplyCursor(qb: SelectQueryBuilder<{entity_name}>, cursor: string | undefined): void {{")
+            lines.append("  if (cursor === undefined) return;")
+            lines.append(f"  const values = decodeCursor(cursor, {len(cursor_columns)});")
+            lines.append(f"  qb.andWhere('({' OR '.join(seek_terms)})', {{ {cursor_params} }});")
+            lines.append("}")
+            lines.append("")
+            lines.append(f"function {repo_var}NextCursor(rows: {entity_name}[], size: number): string | undefined {{")
+            lines.append("  if (rows.length < size) return undefined;")
+            lines.append("  const last = rows[rows.length - 1] as any;")
+            cursor_values = ", ".join(f"last.{_camel_case(col)}" for col in cursor_columns)
+            lines.append(f"  return encodeCursor([{cursor_values}]);")
+            lines.append("}")
+            lines.append("")
+
         lines.append(f"function {repo_var}ApplyOrderBy(qb: SelectQueryBuilder<{entity_name}>): void {{")
-        for pk_field in pk_fields:
+        for col in cursor_columns:
+            lines.append(f"  qb.addOrderBy('record.{col}', 'ASC');")
+        for pk_field in ([] if cursor_fields else pk_fields):
             pk_name = str(pk_field.get("name", "id"))
             pk_desc = pk_field.get("type", {}) if isinstance(pk_field.get("type"), dict) else {}
             if str(pk_desc.get("kind", "")) == "object_ref":
@@ -423,6 +487,65 @@ def _render_typeorm_adapter(ir: Dict[str, Any]) -> str:
         lines.append("}")
         lines.append("")
 
+        def _page_rows_lines(*, filtered: bool) -> List[str]:
+            page_lines: List[str] = []
+            if total_contract is None:
+                if cursor_fields:
+                    page_lines.append("    const totalElements = await qb.getCount();")
+            elif total_contract["mode"] == "estimated":
+                estimate_expr = (
+                    "estimatedQueryTotal(this.dataSource, qb)"
+                    if filtered
+                    else f"estimatedTableTotal(this.dataSource, '{_pluralize(_snake_case(str(obj.get('name', 'object'))))}')"
+                )
+                page_lines.append(f"    const totalElements = includeTotal ? (await {estimate_expr}) ?? (await qb.getCount()) : undefined;")
+            else:
+                page_lines.append("    const totalElements = includeTotal ? await qb.getCount() : undefined;")
+            if cursor_fields:
+                page_lines.append(f"    {repo_var}ApplyCursor(qb, cursor);")
+            page_lines.append(f"    {repo_var}ApplyOrderBy(qb);")
+            page_lines.append(f"    qb.skip({skip_expr}).take(normalized.size);")
+            if cursor_fields or total_contract is not None:
+                page_lines.append("    const rows = await qb.getMany();")
+            else:
+                page_lines.append("    const [rows, totalElements] = await qb.getManyAndCount();")
+            return page_lines
+
+        projection = _projection_contract(query_contract, obj)
+        fields_param = ", fields?: string[]" if projection is not None else ""
+        items_expr = f"rows.map({repo_var}EntityToDomain)"
+        select_lines: List[str] = []
+        if projection is not None:
+            page_param += fields_param
+            items_expr = f"rows.map((row) => pickFields({repo_var}EntityToDomain(row), fields))"
+            select_lines = [
+                f"    const select = {repo_var}Properties(fields);",
+                "    if (select !== undefined) qb.select(select.map((property) => `record.${property}`));",
+            ]
+            constant = _snake_case(obj_name).upper()
+            lines.append(f"const {constant}_FIELD_PROPERTIES: Record<string, string[]> = {{")
+            for field in list(obj.get("fields", [])):
+                if not isinstance(field, dict):
+                    continue
+                field_name = str(field.get("name", "field"))
+                type_desc = field.get("type", {}) if isinstance(field.get("type"), dict) else {}
+                if str(type_desc.get("kind", "")) == "object_ref":
+                    target_obj = object_by_id.get(str(type_desc.get("target_object_id", "")), {})
+                    properties = [
+                        _camel_case(f"{field_name}_{str(pk.get('name', 'id'))}") for pk in _object_primary_key_fields(target_obj)
+                    ]
+                else:
+                    properties = [_camel_case(field_name)]
+                lines.append(f"  {_camel_case(field_name)}: [{', '.join(repr(prop) for prop in properties)}],")
+            if obj.get("states"):
+                lines.append("  state: ['state'],")
+            lines.append("};")
+            lines.append("")
+            lines.append(f"function {repo_var}Properties(fields: string[] | undefined): string[] | undefined {{")
+            lines.append(f"  return fields?.flatMap((name) => {constant}_FIELD_PROPERTIES[name] ?? []);")
+            lines.append("}")
+            lines.append("")
+
         lines.append(f"class {obj_name}TypeOrmRepository implements Persistence.{obj_name}Repository {{")
         lines.append(f"  private readonly repo: Repository<{entity_name}>;")
         if obj.get("states"):
@@ -434,47 +557,124 @@ def _render_typeorm_adapter(ir: Dict[str, Any]) -> str:
             lines.append(f"    this.historyRepo = dataSource.getRepository({obj_name}StateHistoryEntity);")
         lines.append("  }")
         lines.append("")
-        lines.append(f"  async list(page: number, size: number): Promise<Persistence.Page<Domain.{obj_name}>> {{")
+        lines.append(f"  async list(page: number, size: number{page_param}): Promise<Persistence.Page<Domain.{obj_name}>> {{")
         lines.append("    const normalized = normalizePage(page, size);")
         lines.append("    const qb = this.repo.createQueryBuilder('record');")
-        lines.append(f"    {repo_var}ApplyOrderBy(qb);")
-        lines.append("    qb.skip(normalized.page * normalized.size).take(normalized.size);")
-        lines.append("    const [rows, totalElements] = await qb.getManyAndCount();")
+        lines.extend(select_lines)
+        lines.extend(_page_rows_lines(filtered=False))
         lines.append("    return {")
-        lines.append(f"      items: rows.map({repo_var}EntityToDomain),")
+        lines.append(f"      items: {items_expr},")
         lines.append("      page: normalized.page,")
         lines.append("      size: normalized.size,")
         lines.append("      totalElements,")
         lines.append("      totalPages: totalPages(totalElements, normalized.size),")
+        if cursor_fields:
+            lines.append(f"      nextCursor: {repo_var}NextCursor(rows, normalized.size),")
         lines.append("    };")
         lines.append("  }")
         lines.append("")
-        lines.append(f"  async getById(id: Persistence.{obj_name}Id): Promise<Domain.{obj_name} | null> {{")
-        lines.append(f"    const row = await this.repo.findOneBy({repo_var}PrimaryWhere(id) as any);")
-        lines.append(f"    return row ? {repo_var}EntityToDomain(row) : null;")
+        lines.append(f"  async getById(id: Persistence.{obj_name}Id{fields_param}): Promise<Domain.{obj_name} | null> {{")
+        if projection is not None:
+            lines.append(
+                f"    const row = await this.repo.findOne({{ where: {repo_var}PrimaryWhere(id) as any, select: {repo_var}Properties(fields) as any }});"
+            )
+            lines.append(f"    return row ? pickFields({repo_var}EntityToDomain(row), fields) : null;")
+        else:
+            lines.append(f"    const row = await this.repo.findOneBy({repo_var}PrimaryWhere(id) as any);")
+            lines.append(f"    return row ? {repo_var}EntityToDomain(row) : null;")
         lines.append("  }")
         lines.append("")
-        lines.append(f"  async query(filter: Filters.{obj_name}QueryFilter, page: number, size: number): Promise<Persistence.Page<Domain.{obj_name}>> {{")
+        scalar_pk = _single_scalar_primary_key(pk_fields)
+        lines.append(f"  async getByIds(ids: Persistence.{obj_name}Id[]): Promise<(Domain.{obj_name} | null)[]> {{")
+        lines.append("    if (ids.length === 0) {")
+        lines.append("      return [];")
+        lines.append("    }")
+        if scalar_pk is not None:
+            pk_name = _camel_case(str(scalar_pk.get("name", "id")))
+            lines.append(f"    const rows = await this.repo.findBy({{ {pk_name}: In(ids.map((id) => id.{pk_name})) }} as any);")
+        else:
+            lines.append(f"    const rows = await this.repo.findBy(ids.map((id) => {repo_var}PrimaryWhere(id)) as any);")
+        lines.append(f"    const found = new Map<string, Domain.{obj_name}>();")
+        lines.append("    for (const row of rows) {")
+        lines.append(f"      const item = {repo_var}EntityToDomain(row);")
+        lines.append(f"      found.set(JSON.stringify({repo_var}PrimaryWhere(item as unknown as Persistence.{obj_name}Id)), item);")
+        lines.append("    }")
+        lines.append(f"    return ids.map((id) => found.get(JSON.stringify({repo_var}PrimaryWhere(id))) ?? null);")
+        lines.append("  }")
+        lines.append("")
+        lines.append(f"  async query(filter: Filters.{obj_name}QueryFilter, page: number, size: number{page_param}): Promise<Persistence.Page<Domain.{obj_name}>> {{")
         lines.append("    const normalized = normalizePage(page, size);")
         lines.append("    const qb = this.repo.createQueryBuilder('record');")
+        lines.extend(select_lines)
         lines.append(f"    {repo_var}ApplyFilter(qb, filter);")
-        lines.append(f"    {repo_var}ApplyOrderBy(qb);")
-        lines.append("    qb.skip(normalized.page * normalized.size).take(normalized.size);")
-        lines.append("    const [rows, totalElements] = await qb.getManyAndCount();")
+        lines.extend(_page_rows_lines(filtered=True))
         lines.append("    return {")
-        lines.append(f"      items: rows.map({repo_var}EntityToDomain),")
+        lines.append(f"      items: {items_expr},")
         lines.append("      page: normalized.page,")
         lines.append("      size: normalized.size,")
         lines.append("      totalElements,")
         lines.append("      totalPages: totalPages(totalElements, normalized.size),")
+        if cursor_fields:
+            lines.append(f"      nextCursor: {repo_var}NextCursor(rows, normalized.size),")
         lines.append("    };")
         lines.append("  }")
         lines.append("")
+        export_contract = _export_contract(query_contract)
+        if export_contract is not None:
+            key_columns: List[str] = []
+            for pk_field in pk_fields:
+                pk_name = str(pk_field.get("name", "id"))
+                pk_desc = pk_field.get("type", {}) if isinstance(pk_field.get("type"), dict) else {}
+                if str(pk_desc.get("kind", "")) == "object_ref":
+                    target_obj = object_by_id.get(str(pk_desc.get("target_object_id", "")), {})
+                    for target_pk in _object_primary_key_fields(target_obj):
+                        key_columns.append(f"{pk_name}_{str(target_pk.get('name', 'id'))}")
+                else:
+                    key_columns.append(pk_name)
+            seek_terms = []
+            for idx, col in enumerate(key_columns):
+                parts = [f"record.{key_columns[prev]} = :export_{prev}" for prev in range(idx)] + [f"record.{col} > :export_{idx}"]
+                seek_terms.append(parts[0] if len(parts) == 1 else f"({' AND '.join(parts)})")
+            seek_params = ", ".join(f"export_{idx}: last.{_camel_case(col)}" for idx, col in enumerate(key_columns))
+            lines.append(
+                f"  async *export(filter: Filters.{obj_name}QueryFilter, chunkSize = {export_contract['chunk_size']}): AsyncIterable<Domain.{obj_name}[]> {{"
+            )
+            lines.append("    let last: any = undefined;")
+            lines.append("    while (true) {")
+            lines.append("      const qb = this.repo.createQueryBuilder('record');")
+            lines.append(f"      {repo_var}ApplyFilter(qb, filter);")
+            lines.append("      if (last !== undefined) {")
+            lines.append(f"        qb.andWhere('({' OR '.join(seek_terms)})', {{ {seek_params} }});")
+            lines.append("      }")
+            for col in key_columns:
+                lines.append(f"      qb.addOrderBy('record.{col}', 'ASC');")
+            lines.append("      const rows = await qb.take(chunkSize).getMany();")
+            lines.append("      if (rows.length === 0) return;")
+            lines.append(f"      yield rows.map({repo_var}EntityToDomain);")
+            lines.append("      if (rows.length < chunkSize) return;")
+            lines.append("      last = rows[rows.length - 1];")
+            lines.append("    }")
+            lines.append("  }")
+            lines.append("")
         lines.append(f"  async save(item: Domain.{obj_name}): Promise<Domain.{obj_name}> {{")
         lines.append(f"    const entity = {repo_var}DomainToEntity(item);")
         lines.append("    const saved = await this.repo.save(entity as any);")
         lines.append(f"    return {repo_var}EntityToDomain(saved);")
         lines.append("  }")
+        lines.append("")
+        lines.append(f"  async saveMany(items: Domain.{obj_name}[]): Promise<Domain.{obj_name}[]> {{")
+        lines.append("    if (items.length === 0) {")
+        lines.append("      return [];")
+        lines.append("    }")
+        lines.append(f"    const entities = items.map((item) => {repo_var}DomainToEntity(item));")
+        lines.append("    if (this.dataSource.driver.supportedUpsertTypes.length === 0) {")
+        lines.append("      await this.repo.save(entities as any[], { chunk: 500 });")
+        lines.append("    } else {")
+        lines.append("      const conflictPaths = this.repo.metadata.primaryColumns.map((column) => column.propertyPath);")
+        lines.append("      await this.repo.upsert(entities as any[], conflictPaths);")
+        lines.append("    }")
+        lines.append("    return items;")
+        lines.append("  }")
         if obj.get("states"):
             lines.append("")
             lines.append("  async applyTransition(")
@@ -506,6 +706,45 @@ def _render_typeorm_adapter(ir: Dict[str, Any]) -> str:
             lines.append("    await this.historyRepo.save(history as any);")
             lines.append(f"    return {repo_var}EntityToDomain(updated);")
             lines.append("  }")
+            lines.append("")
+            lines.append("  async applyTransitionMany(")
+            lines.append(f"    ids: Persistence.{obj_name}Id[],")
+            lines.append(f"    expectedState: Domain.{obj_name}State,")
+            lines.append(f"    nextState: Domain.{obj_name}State,")
+            lines.append("    transitionId: string,")
+            lines.append(f"  ): Promise<Domain.{obj_name}[]> {{")
+            lines.append("    if (ids.length === 0) {")
+            lines.append("      return [];")
+            lines.append("    }")
+            lines.append("    return this.dataSource.transaction(async (manager) => {")
+            lines.append(f"      const repo = manager.getRepository({entity_name});")
+            lines.append(
+                f"      const rows = await repo.find({{ where: ids.map((id) => ({{ ...{repo_var}PrimaryWhere(id), state: expectedState }})) as any }});"
+            )
+            lines.append("      if (rows.length === 0) {")
+            lines.append("        return [];")
+            lines.append("      }")
+            lines.append("      const matched = rows.map((row) => repo.metadata.getEntityIdMap(row) as Record<string, unknown>);")
+            lines.append("      const transitionResult = await repo")
+            lines.append("        .createQueryBuilder()")
+            lines.append(f"        .update({entity_name})")
+            lines.append("        .set({ state: nextState as string } as any)")
+            lines.append("        .where(matched.map((key) => ({ ...key, state: expectedState })) as any)")
+            lines.append("        .execute();")
+            lines.append("      if (Number(transitionResult.affected ?? rows.length) !== rows.length) {")
+            lines.append(f"        throw new Error('{obj_name} transition conflict: rows changed state concurrently');")
+            lines.append("      }")
+            lines.append(f"      await manager.getRepository({obj_name}StateHistoryEntity).insert(")
+            lines.append("        matched.map((key) => ({")
+            lines.append("          ...key,")
+            lines.append("          transitionId,")
+            lines.append("          fromState: expectedState,")
+            lines.append("          toState: nextState,")
+            lines.append("        })) as any[],")
+            lines.append("      );")
+            lines.append(f"      return rows.map((row) => {repo_var}EntityToDomain({{ ...row, state: nextState }}));")
+            lines.append("    });")
+            lines.append("  }")
         lines.append("}")
         lines.append("")
 
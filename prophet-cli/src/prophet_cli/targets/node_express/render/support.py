@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 _TS_FROM_SPEC_RE = re.compile(r"(from\s+['\"])(\.\.?/[^'\"]+)(['\"])")
 
@@ -94,6 +94,15 @@ def _object_primary_key_fields(obj: Dict[str, Any]) -> List[Dict[str, Any]]:
     return resolved
 
 
+def _single_scalar_primary_key(pk_fields: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if len(pk_fields) != 1:
+        return None
+    pk_desc = pk_fields[0].get("type", {}) if isinstance(pk_fields[0].get("type"), dict) else {}
+    if str(pk_desc.get("kind", "")) == "object_ref":
+        return None
+    return pk_fields[0]
+
+
 def _resolve_custom_base(type_by_id: Dict[str, Dict[str, Any]], type_desc: Dict[str, Any]) -> str:
     current = type_desc
     seen: set[str] = set()
@@ -206,3 +215,114 @@ def _express_path(path: str) -> str:
     return re.sub(r"\{([^{}]+)\}", r":\1", path)
 
 
+
+
+def _cursor_key_fields(contract: Dict[str, Any], obj: Dict[str, Any]) -> List[Dict[str, Any]]:
+    pageable = contract.get("pageable", {}) if isinstance(contract.get("pageable"), dict) else {}
+    cursor = pageable.get("cursor", {}) if isinstance(pageable.get("cursor"), dict) else {}
+    by_id = _field_index(list(obj.get("fields", [])))
+    return [by_id[fid] for fid in cursor.get("key_field_ids", []) if fid in by_id]
+
+
+def _has_cursor_pagination(ir: Dict[str, Any]) -> bool:
+    for contract in ir.get("query_contracts", []):
+        if isinstance(contract, dict) and isinstance(contract.get("pageable", {}).get("cursor"), dict):
+            return True
+    return False
+
+
+def _total_count_contract(contract: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    pageable = contract.get("pageable", {}) if isinstance(contract.get("pageable"), dict) else {}
+    total = pageable.get("total")
+    if not isinstance(total, dict) or total.get("mode") not in {"exact", "estimated"}:
+        return None
+    return {"mode": str(total["mode"]), "include_by_default": bool(total.get("include_by_default", True))}
+
+
+def _has_optional_totals(ir: Dict[str, Any]) -> bool:
+    return any(
+        _total_count_contract(contract) is not None
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+    )
+
+
+def _has_estimated_totals(ir: Dict[str, Any]) -> bool:
+    return any(
+        (_total_count_contract(contract) or {}).get("mode") == "estimated"
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+    )
+
+
+def _export_contract(contract: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    export = contract.get("export")
+    paths = contract.get("paths", {}) if isinstance(contract.get("paths"), dict) else {}
+    if not isinstance(export, dict) or not export.get("formats") or not paths.get("export"):
+        return None
+    return {
+        "path": str(paths["export"]),
+        "formats": [str(item) for item in export["formats"]],
+        "chunk_size": int(export.get("chunk_size", 1000)),
+    }
+
+
+def _has_export(ir: Dict[str, Any]) -> bool:
+    return any(
+        _export_contract(contract) is not None
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+    )
+
+
+def _projection_contract(contract: Dict[str, Any], obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    projection = contract.get("projection")
+    if not isinstance(projection, dict) or not projection.get("fields"):
+        return None
+    by_id = _field_index(list(obj.get("fields", [])))
+    return {
+        "param": str(projection.get("param", "fields")),
+        "fields": [_camel_case(str(item.get("field_name", ""))) for item in projection["fields"] if isinstance(item, dict)],
+        "key_fields": [
+            _camel_case(str(by_id[field_id].get("name", "")))
+            for field_id in projection.get("always_field_ids", [])
+            if field_id in by_id
+        ],
+    }
+
+
+def _has_projection(ir: Dict[str, Any]) -> bool:
+    return any(
+        isinstance(contract.get("projection"), dict) and bool(contract["projection"].get("fields"))
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+    )
+
+
+def _total_pages_helper_lines(ir: Dict[str, Any]) -> List[str]:
+    if not _has_optional_totals(ir):
+        return [
+            "function totalPages(totalElements: number, size: number): number {",
+            "  if (size <= 0) return 0;",
+            "  return Math.ceil(totalElements / size);",
+            "}",
+            "",
+        ]
+    return [
+        "function totalPages(totalElements: number | undefined, size: number): number | undefined {",
+        "  if (totalElements === undefined) return undefined;",
+        "  if (size <= 0) return 0;",
+        "  return Math.ceil(totalElements / size);",
+        "}",
+        "",
+    ]
+
+
+def _estimate_number_helper_lines() -> List[str]:
+    return [
+        "function toEstimate(value: unknown): number | undefined {",
+        "  const estimate = Number(value);",
+        "  return value !== null && value !== undefined && Number.isFinite(estimate) && estimate >= 0 ? estimate : undefined;",
+        "}",
+        "",
+    ]
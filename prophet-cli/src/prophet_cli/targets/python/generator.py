@@ -3,20 +3,29 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from prophet_cli.codegen.contracts import GenerationContext
 from prophet_cli.codegen.stacks import StackSpec
+from prophet_cli.codegen.wire_schema import render_wire_schema
+from prophet_cli.core.errors import ProphetError
 from prophet_cli.core.ir_reader import IRReader
 from prophet_cli.targets.python.render.common.action_handlers import render_action_handlers
 from prophet_cli.targets.python.render.common.action_service import render_action_service
 from prophet_cli.targets.python.render.common.actions import render_action_contracts
+from prophet_cli.targets.python.render.common.cache import render_entity_cache
 from prophet_cli.targets.python.render.common.domain import render_domain_types
+from prophet_cli.targets.python.render.common.event_consumer import render_event_consumer
 from prophet_cli.targets.python.render.common.event_contracts import render_event_contracts
 from prophet_cli.targets.python.render.common.events import render_event_emitter
+from prophet_cli.targets.python.render.common.loaders import render_repository_loaders
 from prophet_cli.targets.python.render.common.persistence import render_persistence_contracts
 from prophet_cli.targets.python.render.common.query import render_query_contracts
+from prophet_cli.targets.python.render.common.request_decoders import render_request_decoders
+from prophet_cli.targets.python.render.common.response_encoders import render_response_encoders
 from prophet_cli.targets.python.render.common.transitions import render_transition_services
+from prophet_cli.targets.python.render.common.triggers import has_triggers
+from prophet_cli.targets.python.render.common.triggers import render_trigger_dispatcher
 from prophet_cli.targets.python.render.framework.django import render_django_urls
 from prophet_cli.targets.python.render.framework.django import render_django_views
 from prophet_cli.targets.python.render.framework.fastapi import render_fastapi_routes
@@ -35,7 +44,7 @@ from prophet_cli.targets.runtime_versions import resolve_runtime_version
 class PythonDeps:
     cfg_get: Callable[[Dict[str, Any], List[str], Any], Any]
     resolve_stack_spec: Callable[[Dict[str, Any]], StackSpec]
-    render_sql: Callable[[IRReader], str]
+    render_sql: Callable[..., str]
     render_openapi: Callable[[IRReader], str]
     render_turtle: Callable[[IRReader], str]
     toolchain_version: str
@@ -48,8 +57,84 @@ def _render_detection_report(cfg: Dict[str, Any]) -> Optional[str]:
     return json.dumps(autodetect_payload, indent=2, sort_keys=False) + "\n"
 
 
-def _render_pyproject_toml(stack: StackSpec, runtime_version: str) -> str:
+REPOSITORY_IO_STACKS: Dict[str, Tuple[str, ...]] = {
+    "inline": (),
+    "async_session": ("python_fastapi_sqlalchemy",),
+    "thread_offload": ("python_fastapi_sqlalchemy", "python_fastapi_sqlmodel"),
+}
+
+
+def _resolve_repository_io(cfg: Dict[str, Any], stack: StackSpec, deps: PythonDeps) -> str:
+    configured = str(deps.cfg_get(cfg, ["generation", "python", "repository_io"], "inline"))
+    if configured not in REPOSITORY_IO_STACKS:
+        raise ProphetError(
+            f"Invalid config: generation.python.repository_io='{configured}'. "
+            f"Supported values: {', '.join(REPOSITORY_IO_STACKS)}."
+        )
+    supported_stacks = REPOSITORY_IO_STACKS[configured]
+    if supported_stacks and stack.id not in supported_stacks:
+        raise ProphetError(
+            f"generation.python.repository_io='{configured}' is not supported by stack '{stack.id}' "
+            f"(supported stacks: {', '.join(supported_stacks)})."
+        )
+    return configured
+
+
+def _resolve_save_strategy(cfg: Dict[str, Any], deps: PythonDeps) -> str:
+    configured = str(deps.cfg_get(cfg, ["generation", "python", "save_strategy"], "upsert"))
+    return configured if configured in {"upsert", "merge"} else "upsert"
+
+
+def _resolve_model_style(cfg: Dict[str, Any], deps: PythonDeps) -> str:
+    configured = str(deps.cfg_get(cfg, ["generation", "python", "model_style"], "dataclass"))
+    return configured if configured in {"dataclass", "slots", "msgspec"} else "dataclass"
+
+
+def _resolve_event_outbox(cfg: Dict[str, Any], deps: PythonDeps) -> bool:
+    return deps.cfg_get(cfg, ["generation", "python", "event_outbox"], False) is True
+
+
+SnapshotPolicySpec = Tuple[str, Optional[int]]
+
+
+def _snapshot_policy_spec(value: Any, fallback: SnapshotPolicySpec) -> SnapshotPolicySpec:
+    if isinstance(value, str):
+        value = {"mode": value}
+    if not isinstance(value, dict):
+        return fallback
+    mode = str(value.get("mode", fallback[0]))
+    if mode not in {"full", "changed", "ref_only"}:
+        mode = fallback[0]
+    max_bytes = value.get("max_bytes", fallback[1])
+    if isinstance(max_bytes, bool) or not isinstance(max_bytes, int) or max_bytes < 0:
+        max_bytes = None
+    return mode, max_bytes
+
+
+def _resolve_event_snapshots(
+    cfg: Dict[str, Any], ir: Dict[str, Any], deps: PythonDeps
+) -> Tuple[SnapshotPolicySpec, Dict[str, SnapshotPolicySpec]]:
+    configured = deps.cfg_get(cfg, ["generation", "python", "event_snapshots"], None)
+    default = _snapshot_policy_spec(configured, ("full", None))
+    overrides = configured.get("events", {}) if isinstance(configured, dict) else {}
+    if not isinstance(overrides, dict):
+        overrides = {}
+    event_types = {_pascal_case(str(event.get("name", "Event"))) for event in ir.get("events", []) if isinstance(event, dict)}
+    per_event: Dict[str, SnapshotPolicySpec] = {}
+    for name, value in overrides.items():
+        event_type = _pascal_case(str(name))
+        policy = _snapshot_policy_spec(value, default)
+        if event_type in event_types and policy != default:
+            per_event[event_type] = policy
+    return default, per_event
+
+
+def _render_pyproject_toml(
+    stack: StackSpec, runtime_version: str, *, repository_io: str = "inline", model_style: str = "dataclass"
+) -> str:
     deps: List[str] = [f"prophet-events-runtime=={runtime_version}"]
+    if model_style == "msgspec":
+        deps.append("msgspec>=0.18.6")
     if stack.framework == "fastapi":
         deps.extend(["fastapi>=0.112,<1.0", "uvicorn>=0.30,<1.0"])
     elif stack.framework == "flask":
@@ -58,7 +143,7 @@ def _render_pyproject_toml(stack: StackSpec, runtime_version: str) -> str:
         deps.append("django>=5.0,<6.0")
 
     if stack.orm == "sqlalchemy":
-        deps.append("sqlalchemy>=2.0,<3.0")
+        deps.append("sqlalchemy[asyncio]>=2.0,<3.0" if repository_io == "async_session" else "sqlalchemy>=2.0,<3.0")
     elif stack.orm == "sqlmodel":
         deps.extend(["sqlmodel>=0.0.22,<1.0", "sqlalchemy>=2.0,<3.0"])
     elif stack.orm == "django_orm":
@@ -107,29 +192,61 @@ def generate_outputs(context: GenerationContext, deps: PythonDeps) -> Dict[str,
     outputs: Dict[str, str] = {}
     runtime_version = resolve_runtime_version(context.root)
 
+    event_outbox = _resolve_event_outbox(cfg, deps)
+    snapshot_policy, event_snapshot_policies = _resolve_event_snapshots(cfg, ir, deps)
+    snapshot_baselines = any(mode == "changed" for mode, _ in [snapshot_policy, *event_snapshot_policies.values()])
+
     if "sql" in targets:
-        outputs[f"{out_dir}/sql/schema.sql"] = deps.render_sql(context.ir_reader)
+        if event_outbox:
+            outputs[f"{out_dir}/sql/schema.sql"] = deps.render_sql(context.ir_reader, event_outbox=True)
+        else:
+            outputs[f"{out_dir}/sql/schema.sql"] = deps.render_sql(context.ir_reader)
     if "openapi" in targets:
         outputs[f"{out_dir}/openapi/openapi.yaml"] = deps.render_openapi(context.ir_reader)
     if "turtle" in targets:
         outputs[f"{out_dir}/turtle/ontology.ttl"] = deps.render_turtle(context.ir_reader)
+    if "wire_schema" in targets:
+        outputs[f"{out_dir}/wire/event-codec.json"] = render_wire_schema(context.ir_reader.as_dict())
 
     py_prefix = f"{out_dir}/python"
     generated_prefix = f"{py_prefix}/src/generated"
     async_mode = stack.framework == "fastapi"
+    repository_io = _resolve_repository_io(cfg, stack, deps)
+    save_strategy = _resolve_save_strategy(cfg, deps)
+    model_style = _resolve_model_style(cfg, deps)
 
     if "python" in targets:
-        outputs[f"{py_prefix}/pyproject.toml"] = _render_pyproject_toml(stack, runtime_version)
+        outputs[f"{py_prefix}/pyproject.toml"] = _render_pyproject_toml(
+            stack, runtime_version, repository_io=repository_io, model_style=model_style
+        )
         outputs[f"{generated_prefix}/__init__.py"] = _render_package_init()
-        outputs[f"{generated_prefix}/domain.py"] = render_domain_types(ir)
-        outputs[f"{generated_prefix}/actions.py"] = render_action_contracts(ir)
-        outputs[f"{generated_prefix}/event_contracts.py"] = render_event_contracts(ir)
-        outputs[f"{generated_prefix}/events.py"] = render_event_emitter(ir, async_mode=async_mode)
-        outputs[f"{generated_prefix}/query.py"] = render_query_contracts(ir)
+        outputs[f"{generated_prefix}/domain.py"] = render_domain_types(ir, model_style=model_style)
+        outputs[f"{generated_prefix}/actions.py"] = render_action_contracts(ir, model_style=model_style)
+        outputs[f"{generated_prefix}/event_contracts.py"] = render_event_contracts(ir, model_style=model_style)
+        outputs[f"{generated_prefix}/events.py"] = render_event_emitter(
+            ir,
+            async_mode=async_mode,
+            snapshot_policy=snapshot_policy,
+            event_snapshot_policies=event_snapshot_policies,
+            model_style=model_style,
+        )
+        outputs[f"{generated_prefix}/event_consumer.py"] = render_event_consumer(ir, async_mode=async_mode)
+        outputs[f"{generated_prefix}/query.py"] = render_query_contracts(ir, model_style=model_style)
+        outputs[f"{generated_prefix}/request_decoders.py"] = render_request_decoders(ir)
         outputs[f"{generated_prefix}/persistence.py"] = render_persistence_contracts(ir, async_mode=async_mode)
+        outputs[f"{generated_prefix}/response_encoders.py"] = render_response_encoders(ir, model_style=model_style)
+        outputs[f"{generated_prefix}/loaders.py"] = render_repository_loaders(ir, async_mode=async_mode)
+        outputs[f"{generated_prefix}/cache.py"] = render_entity_cache(ir, async_mode=async_mode)
         outputs[f"{generated_prefix}/action_handlers.py"] = render_action_handlers(ir, async_mode=async_mode)
-        outputs[f"{generated_prefix}/action_service.py"] = render_action_service(ir, async_mode=async_mode)
+        outputs[f"{generated_prefix}/action_service.py"] = render_action_service(
+            ir,
+            async_mode=async_mode,
+            event_outbox=event_outbox,
+            snapshot_baselines=snapshot_baselines,
+        )
         outputs[f"{generated_prefix}/transitions.py"] = render_transition_services(ir, async_mode=async_mode)
+        if has_triggers(ir):
+            outputs[f"{generated_prefix}/triggers.py"] = render_trigger_dispatcher(ir, async_mode=async_mode)
 
     if stack.framework == "fastapi" and "fastapi" in targets:
         outputs[f"{generated_prefix}/fastapi_routes.py"] = render_fastapi_routes(ir)
@@ -140,14 +257,33 @@ def generate_outputs(context: GenerationContext, deps: PythonDeps) -> Dict[str,
         outputs[f"{generated_prefix}/django_urls.py"] = render_django_urls(ir)
 
     if stack.orm == "sqlalchemy" and "sqlalchemy" in targets:
-        outputs[f"{generated_prefix}/sqlalchemy_models.py"] = render_sqlalchemy_models(ir)
-        outputs[f"{generated_prefix}/sqlalchemy_adapters.py"] = render_sqlalchemy_adapters(ir, async_mode=async_mode)
+        outputs[f"{generated_prefix}/sqlalchemy_models.py"] = render_sqlalchemy_models(ir, event_outbox=event_outbox)
+        outputs[f"{generated_prefix}/sqlalchemy_adapters.py"] = render_sqlalchemy_adapters(
+            ir,
+            async_mode=async_mode,
+            repository_io=repository_io,
+            save_strategy=save_strategy,
+            event_outbox=event_outbox,
+            model_style=model_style,
+        )
     if stack.orm == "sqlmodel" and "sqlmodel" in targets:
-        outputs[f"{generated_prefix}/sqlmodel_models.py"] = render_sqlmodel_models(ir)
-        outputs[f"{generated_prefix}/sqlmodel_adapters.py"] = render_sqlmodel_adapters(ir, async_mode=async_mode)
+        outputs[f"{generated_prefix}/sqlmodel_models.py"] = render_sqlmodel_models(ir, event_outbox=event_outbox)
+        outputs[f"{generated_prefix}/sqlmodel_adapters.py"] = render_sqlmodel_adapters(
+            ir,
+            async_mode=async_mode,
+            repository_io=repository_io,
+            save_strategy=save_strategy,
+            event_outbox=event_outbox,
+            model_style=model_style,
+        )
     if stack.orm == "django_orm" and "django_orm" in targets:
-        outputs[f"{generated_prefix}/django_models.py"] = render_django_models(ir)
-        outputs[f"{generated_prefix}/django_adapters.py"] = render_django_adapters(ir)
+        outputs[f"{generated_prefix}/django_models.py"] = render_django_models(ir, event_outbox=event_outbox)
+        outputs[f"{generated_prefix}/django_adapters.py"] = render_django_adapters(
+            ir,
+            save_strategy=save_strategy,
+            event_outbox=event_outbox,
+            model_style=model_style,
+        )
 
     extension_hooks = []
     for action in sorted(context.ir_reader.action_contracts(), key=lambda item: item.name):
@@ -23,6 +23,7 @@ def render_action_handlers(ir: Dict[str, Any], *, async_mode: bool) -> str:
         "from .events import ActionOutcome",
         "from .events import ActionOutcomeValue",
         "from .events import EventPublisher",
+        "from .events import SnapshotBaselines",
         "from .persistence import Repositories",
         "",
         "@dataclass",
@@ -32,6 +33,7 @@ def render_action_handlers(ir: Dict[str, Any], *, async_mode: bool) -> str:
         "    traceId: Optional[str] = None",
         "    eventSource: Optional[str] = None",
         "    eventAttributes: Optional[dict[str, str]] = None",
+        "    snapshotBaselines: Optional[SnapshotBaselines] = None",
         "",
     ]
 
@@ -8,7 +8,13 @@ from ..support import _snake_case
 from ..support import _sort_dict_entries
 
 
-def render_action_service(ir: Dict[str, Any], *, async_mode: bool) -> str:
+def render_action_service(
+    ir: Dict[str, Any],
+    *,
+    async_mode: bool,
+    event_outbox: bool = False,
+    snapshot_baselines: bool = False,
+) -> str:
     action_input_by_id = {item["id"]: item for item in ir.get("action_inputs", []) if isinstance(item, dict) and "id" in item}
     event_by_id = {item["id"]: item for item in ir.get("events", []) if isinstance(item, dict) and "id" in item}
     output_event_helpers = sorted(
@@ -18,29 +24,53 @@ def render_action_service(ir: Dict[str, Any], *, async_mode: bool) -> str:
             if isinstance(action, dict)
         }
     )
+    context_manager = "AsyncContextManager" if async_mode else "ContextManager"
 
     lines: List[str] = [
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "from prophet_events_runtime import create_event_id",
-        "",
-        "from .action_handlers import ActionContext",
-        "from .action_handlers import ActionHandlers",
-        "from .actions import *",
-        "from .event_contracts import *",
-        "from .events import EventPublishMetadata",
-        "from .events import publish_domain_events",
-        "from .events import publish_domain_events_sync",
-        "from .events import to_action_outcome",
-        "from .events import " + ", ".join(output_event_helpers),
-        "",
-        "class ActionExecutionService:",
-        "    def __init__(self, handlers: ActionHandlers):",
-        "        self.handlers = handlers",
-        "",
     ]
+    stdlib_imports: List[str] = []
+    if event_outbox:
+        stdlib_imports.append("from contextlib import nullcontext")
+    if snapshot_baselines:
+        stdlib_imports.append("from dataclasses import replace")
+    if event_outbox:
+        stdlib_imports.append(f"from typing import Callable, {context_manager}, Optional")
+    if stdlib_imports:
+        lines.extend([*stdlib_imports, ""])
+    lines.extend(
+        [
+            "from prophet_events_runtime import create_event_id",
+            "",
+            "from .action_handlers import ActionContext",
+            "from .action_handlers import ActionHandlers",
+            "from .actions import *",
+            "from .event_contracts import *",
+            "from .events import EventPublishMetadata",
+            *(["from .events import SnapshotBaselines"] if snapshot_baselines else []),
+            "from .events import publish_domain_events",
+            "from .events import publish_domain_events_sync",
+            "from .events import to_action_outcome",
+            "from .events import " + ", ".join(output_event_helpers),
+            "",
+            "class ActionExecutionService:",
+        ]
+    )
+    if event_outbox:
+        # Handler writes and outbox rows share one transaction when the caller supplies a transaction factory.
+        lines.append(
+            f"    def __init__(self, handlers: ActionHandlers, transaction: Optional[Callable[[], {context_manager}[object]]] = None):"
+        )
+        lines.append("        self.handlers = handlers")
+        lines.append("        self.transaction = transaction if transaction is not None else nullcontext")
+    else:
+        lines.append("    def __init__(self, handlers: ActionHandlers):")
+        lines.append("        self.handlers = handlers")
+    lines.append("")
 
+    body_indent = "            " if event_outbox else "        "
     for action in _sort_dict_entries([item for item in ir.get("actions", []) if isinstance(item, dict)]):
         action_name = str(action.get("name", "action"))
         camel = _camel_case(action_name)
@@ -51,28 +81,32 @@ def render_action_service(ir: Dict[str, Any], *, async_mode: bool) -> str:
 
         if async_mode:
             lines.append(f"    async def execute_{camel}(self, input: {input_name}, context: ActionContext) -> {output_name}:")
-            lines.append(f"        result = await self.handlers.{camel}.handle(input, context)")
-            lines.append("        outcome = to_action_outcome(result)")
-            lines.append("        metadata = EventPublishMetadata(")
-            lines.append("            trace_id=context.traceId or create_event_id(),")
-            lines.append(f"            source=context.eventSource or '{str(ir.get('ontology', {}).get('name', 'prophet'))}',")
-            lines.append("            attributes=context.eventAttributes,")
-            lines.append("        )")
-            lines.append(f"        events = [{output_event_helper}(outcome.output), *outcome.additional_events]")
-            lines.append("        await publish_domain_events(context.eventPublisher, events, metadata)")
-            lines.append("        return outcome.output")
+            handle_expr = f"await self.handlers.{camel}.handle(input, context)"
+            publish_stmt = "await publish_domain_events(context.eventPublisher, events, metadata)"
         else:
             lines.append(f"    def execute_{camel}(self, input: {input_name}, context: ActionContext) -> {output_name}:")
-            lines.append(f"        result = self.handlers.{camel}.handle(input, context)")
-            lines.append("        outcome = to_action_outcome(result)")
-            lines.append("        metadata = EventPublishMetadata(")
-            lines.append("            trace_id=context.traceId or create_event_id(),")
-            lines.append(f"            source=context.eventSource or '{str(ir.get('ontology', {}).get('name', 'prophet'))}',")
-            lines.append("            attributes=context.eventAttributes,")
-            lines.append("        )")
-            lines.append(f"        events = [{output_event_helper}(outcome.output), *outcome.additional_events]")
-            lines.append("        publish_domain_events_sync(context.eventPublisher, events, metadata)")
-            lines.append("        return outcome.output")
+            handle_expr = f"self.handlers.{camel}.handle(input, context)"
+            publish_stmt = "publish_domain_events_sync(context.eventPublisher, events, metadata)"
+        if event_outbox:
+            lines.append(f"        {'async with' if async_mode else 'with'} self.transaction():")
+        body: List[str] = []
+        if snapshot_baselines:
+            # Fresh per execution so `changed` snapshots only diff against this action's recorded baselines.
+            body.append("context = replace(context, snapshotBaselines=SnapshotBaselines())")
+        body += [
+            f"result = {handle_expr}",
+            "outcome = to_action_outcome(result)",
+            "metadata = EventPublishMetadata(",
+            "    trace_id=context.traceId or create_event_id(),",
+            f"    source=context.eventSource or '{str(ir.get('ontology', {}).get('name', 'prophet'))}',",
+            "    attributes=context.eventAttributes,",
+            "    snapshot_baselines=context.snapshotBaselines,",
+            ")",
+            f"events = [{output_event_helper}(outcome.output), *outcome.additional_events]",
+            publish_stmt,
+        ]
+        lines.extend(body_indent + line for line in body)
+        lines.append("        return outcome.output")
         lines.append("")
 
     return "\n".join(lines).rstrip() + "\n"
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from ..support import _model_class_header_lines
+from ..support import _model_import_line
 from ..support import _pascal_case
 from ..support import _render_dataclass_field
 from ..support import _sort_dict_entries
 
 
-def render_action_contracts(ir: Dict[str, Any]) -> str:
+def render_action_contracts(ir: Dict[str, Any], *, model_style: str = "dataclass") -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
     struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
@@ -16,7 +18,7 @@ def render_action_contracts(ir: Dict[str, Any]) -> str:
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "from dataclasses import dataclass",
+        _model_import_line(model_style),
         "from typing import Optional, List",
         "",
         "from .domain import *",
@@ -25,8 +27,7 @@ def render_action_contracts(ir: Dict[str, Any]) -> str:
 
     for shape in _sort_dict_entries(list(ir.get("action_inputs", []))):
         name = _pascal_case(str(shape.get("name", "ActionInput")))
-        lines.append("@dataclass(kw_only=True)")
-        lines.append(f"class {name}:")
+        lines.extend(_model_class_header_lines(name, model_style))
         fields = [field for field in shape.get("fields", []) if isinstance(field, dict)]
         if not fields:
             lines.append("    pass")
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from ..support import _model_class_header_lines
+from ..support import _model_import_line
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
 from ..support import _py_base_type
@@ -9,7 +11,7 @@ from ..support import _render_dataclass_field
 from ..support import _sort_dict_entries
 
 
-def render_domain_types(ir: Dict[str, Any]) -> str:
+def render_domain_types(ir: Dict[str, Any], *, model_style: str = "dataclass") -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
     struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
@@ -18,7 +20,7 @@ def render_domain_types(ir: Dict[str, Any]) -> str:
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "from dataclasses import dataclass",
+        _model_import_line(model_style),
         "from typing import Any, Dict, List, Literal, Optional",
         "",
     ]
@@ -33,8 +35,7 @@ def render_domain_types(ir: Dict[str, Any]) -> str:
     for obj in _sort_dict_entries(list(ir.get("objects", []))):
         obj_name = _pascal_case(str(obj.get("name", "Object")))
         pk_fields = _object_primary_key_fields(obj)
-        lines.append("@dataclass(kw_only=True)")
-        lines.append(f"class {obj_name}Ref:")
+        lines.extend(_model_class_header_lines(f"{obj_name}Ref", model_style))
         if not pk_fields:
             lines.append("    value: str")
         else:
@@ -51,8 +52,7 @@ def render_domain_types(ir: Dict[str, Any]) -> str:
 
     for struct in _sort_dict_entries(list(ir.get("structs", []))):
         struct_name = _pascal_case(str(struct.get("name", "Struct")))
-        lines.append("@dataclass(kw_only=True)")
-        lines.append(f"class {struct_name}:")
+        lines.extend(_model_class_header_lines(struct_name, model_style))
         fields = [field for field in struct.get("fields", []) if isinstance(field, dict)]
         if not fields:
             lines.append("    pass")
@@ -76,8 +76,7 @@ def render_domain_types(ir: Dict[str, Any]) -> str:
             lines.append(f"{obj_name}State = Literal[{members}]")
             lines.append("")
 
-        lines.append("@dataclass(kw_only=True)")
-        lines.append(f"class {obj_name}:")
+        lines.extend(_model_class_header_lines(obj_name, model_style))
         fields = [field for field in obj.get("fields", []) if isinstance(field, dict)]
         if not fields and not states:
             lines.append("    pass")
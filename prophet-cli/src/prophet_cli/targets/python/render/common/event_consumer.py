@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from ..support import _camel_case
+from ..support import _object_primary_key_fields
+from ..support import _pascal_case
+from ..support import _snake_case
+from .request_decoders import object_decoder_name
+from .request_decoders import object_ref_decoder_name
+from .request_decoders import struct_decoder_name
+
+
+def _ordering_key_expr(event: Dict[str, Any], fields: List[Dict[str, Any]], object_by_id: Dict[str, Dict[str, Any]]) -> Optional[str]:
+    # Transition payloads carry the object's primary key fields; other events order by their first top-level ref.
+    field_names = [_camel_case(str(field.get("name", "field"))) for field in fields]
+    target = object_by_id.get(str(event.get("object_id", "")))
+    if str(event.get("kind", "")) == "transition" and isinstance(target, dict):
+        pk_names = [_camel_case(str(pk.get("name", "id"))) for pk in _object_primary_key_fields(target)]
+        if pk_names and all(name in field_names for name in pk_names):
+            ref = ", ".join(f"{name!r}: payload.get({name!r})" for name in pk_names)
+            return f"object_ordering_key({_pascal_case(str(target.get('name', 'Object')))!r}, {{{ref}}})"
+    for field, name in zip(fields, field_names):
+        field_type = field.get("type", {}) if isinstance(field.get("type"), dict) else {}
+        if str(field_type.get("kind", "")) != "object_ref":
+            continue
+        ref_target = object_by_id.get(str(field_type.get("target_object_id", "")))
+        if isinstance(ref_target, dict) and _object_primary_key_fields(ref_target):
+            return f"object_ordering_key({_pascal_case(str(ref_target.get('name', 'Object')))!r}, payload.get({name!r}))"
+    return None
+
+
+def _ref_or_object_decoder_name(object_name: str) -> str:
+    return f"_decode_{_snake_case(object_name)}_ref_or_object"
+
+
+def _payload_decode_expr(type_desc: Dict[str, Any], expr: str, ctx: Dict[str, Any], depth: int = 0) -> str:
+    # Top-level and listed object refs may resolve to an updated_objects snapshot; everything inside
+    # a struct decodes exactly like a request body.
+    kind = str(type_desc.get("kind", ""))
+    if kind == "object_ref":
+        target = ctx["object_by_id"].get(str(type_desc.get("target_object_id", "")))
+        if not isinstance(target, dict):
+            return expr
+        ctx["ref_or_objects"].add(str(target.get("id", "")))
+        return f"{_ref_or_object_decoder_name(_pascal_case(str(target.get('name', 'Object'))))}({expr}, updated_objects)"
+    if kind == "struct":
+        struct = ctx["struct_by_id"].get(str(type_desc.get("target_struct_id", "")))
+        if not isinstance(struct, dict):
+            return expr
+        return f"RequestDecoders.{struct_decoder_name(_pascal_case(str(struct.get('name', 'Struct'))))}({expr})"
+    if kind == "list":
+        element = type_desc.get("element", {}) if isinstance(type_desc.get("element"), dict) else {}
+        item = f"item{depth}"
+        element_expr = _payload_decode_expr(element, item, ctx, depth + 1)
+        if element_expr == item:
+            return expr
+        return f"[{element_expr} for {item} in {expr}] if isinstance({expr}, list) else {expr}"
+    return expr
+
+
+def _payload_decoder_lines(event_name: str, fields: List[Dict[str, Any]], ctx: Dict[str, Any]) -> List[str]:
+    contract = f"EventContracts.{event_name}"
+    lines = [
+        f"def _decode_{_snake_case(event_name)}_payload(value: Any, updated_objects: List[dict[str, object]]) -> {contract}:",
+        "    if not isinstance(value, dict):",
+        f"        raise TypeError('Expected an object for {event_name}')",
+    ]
+    if not fields:
+        lines.append(f"    return {contract}()")
+        lines.append("")
+        return lines
+    lines.append("    kwargs: dict[str, Any] = {}")
+    for field in fields:
+        name = _camel_case(str(field.get("name", "field")))
+        type_desc = field.get("type", {}) if isinstance(field.get("type"), dict) else {}
+        decoded = _payload_decode_expr(type_desc, "field_value", ctx)
+        lines.append(f"    if {name!r} in value:")
+        if decoded.count("field_value") == 1:
+            lines.append(f"        kwargs[{name!r}] = {decoded.replace('field_value', f'value[{name!r}]')}")
+        else:
+            lines.append(f"        field_value = value[{name!r}]")
+            lines.append(f"        kwargs[{name!r}] = {decoded}")
+    lines.append(f"    return {contract}(**kwargs)")
+    lines.append("")
+    return lines
+
+
+def render_event_consumer(ir: Dict[str, Any], *, async_mode: bool) -> str:
+    object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
+    struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
+    ctx: Dict[str, Any] = {"object_by_id": object_by_id, "struct_by_id": struct_by_id, "ref_or_objects": set()}
+    payload_lines: List[str] = []
+    event_specs: List[Dict[str, Any]] = []
+    seen_event_names: set[str] = set()
+    for event in sorted([item for item in ir.get("events", []) if isinstance(item, dict)], key=lambda item: str(item.get("id", ""))):
+        event_name = _pascal_case(str(event.get("name", "Event")))
+        if event_name in seen_event_names:
+            continue
+        seen_event_names.add(event_name)
+        fields = [field for field in event.get("fields", []) if isinstance(field, dict)]
+        payload_lines.extend(_payload_decoder_lines(event_name, fields, ctx))
+        event_specs.append(
+            {
+                "name": event_name,
+                "handler": _camel_case(event_name),
+                "ordering_key": _ordering_key_expr(event, fields, object_by_id),
+            }
+        )
+
+    handler_result = "Awaitable[None]" if async_mode else "None"
+    lines: List[str] = [
+        "# Code generated by prophet-cli. DO NOT EDIT.",
+        "from __future__ import annotations",
+        "",
+        "from dataclasses import dataclass",
+        "from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple",
+        "",
+        "from prophet_events_runtime import EventConsumer",
+        "from prophet_events_runtime import EventWireEnvelope",
+        "from prophet_events_runtime import SNAPSHOT_MODE_ATTRIBUTE",
+        "from prophet_events_runtime import default_ordering_key",
+        "from prophet_events_runtime import object_ordering_key",
+        "",
+        "from . import event_contracts as EventContracts",
+        "from . import request_decoders as RequestDecoders",
+        "from .events import DomainEvent",
+    ]
+    for spec in event_specs:
+        lines.append(f"from .events import {spec['name']}DomainEvent")
+    lines.extend(
+        [
+            "",
+            "def _updated_object_for(object_type: str, object_ref: dict[str, object], updated_objects: List[dict[str, object]]) -> Optional[dict[str, object]]:",
+            "    for updated in updated_objects:",
+            "        if updated.get('object_type') == object_type and updated.get('object_ref') == object_ref:",
+            "            candidate = updated.get('object')",
+            "            return candidate if isinstance(candidate, dict) else None",
+            "    return None",
+            "",
+        ]
+    )
+    if ctx["ref_or_objects"]:
+        lines.append("# A ref whose object has a snapshot in updated_objects decodes to the full object, otherwise to the ref.")
+    for object_id in sorted(ctx["ref_or_objects"]):
+        obj_name = _pascal_case(str(object_by_id[object_id].get("name", "Object")))
+        lines.extend(
+            [
+                f"def {_ref_or_object_decoder_name(obj_name)}(value: Any, updated_objects: List[dict[str, object]]) -> Any:",
+                "    if not isinstance(value, dict):",
+                "        return value",
+                f"    snapshot = _updated_object_for({obj_name!r}, value, updated_objects)",
+                "    if snapshot is not None:",
+                f"        return RequestDecoders.{object_decoder_name(obj_name)}(snapshot)",
+                f"    return RequestDecoders.{object_ref_decoder_name(obj_name)}(value)",
+                "",
+            ]
+        )
+    lines.extend(payload_lines)
+    lines.append("_DOMAIN_EVENT_TYPES: Dict[str, Tuple[type, Callable[[Any, List[dict[str, object]]], Any]]] = {")
+    for spec in event_specs:
+        lines.append(f"    {spec['name']!r}: ({spec['name']}DomainEvent, _decode_{_snake_case(spec['name'])}_payload),")
+    lines.extend(
+        [
+            "}",
+            "",
+            "def decode_domain_event(envelope: EventWireEnvelope) -> DomainEvent:",
+            "    entry = _DOMAIN_EVENT_TYPES.get(envelope.event_type)",
+            "    if entry is None:",
+            "        raise ValueError(f'Unknown event type: {envelope.event_type}')",
+            "    event_type, decode_payload = entry",
+            "    updated_objects = envelope.updated_objects or []",
+            "    if envelope.attributes and envelope.attributes.get(SNAPSHOT_MODE_ATTRIBUTE) == 'changed':",
+            "        # Changed-field snapshots are partial objects, so refs decode as refs.",
+            "        updated_objects = []",
+            "    return event_type(payload=decode_payload(envelope.payload, updated_objects))",
+            "",
+            "def event_ordering_key(envelope: EventWireEnvelope) -> Optional[str]:",
+            "    payload = envelope.payload",
+        ]
+    )
+    for spec in event_specs:
+        if spec["ordering_key"] is None:
+            continue
+        lines.append(f"    if envelope.event_type == {spec['name']!r}:")
+        lines.append(f"        return {spec['ordering_key']}")
+    lines.extend(
+        [
+            "    return default_ordering_key(envelope)",
+            "",
+            "@dataclass(kw_only=True)",
+            "class DomainEventHandlers:",
+        ]
+    )
+    for spec in event_specs:
+        lines.append(
+            f"    {spec['handler']}: Optional[Callable[[{spec['name']}DomainEvent, EventWireEnvelope], {handler_result}]] = None"
+        )
+    if not event_specs:
+        lines.append("    pass")
+    lines.extend(
+        [
+            "",
+            "def build_event_consumer(",
+            "    handlers: DomainEventHandlers,",
+            "    *,",
+            "    concurrency: int = 8,",
+            "    max_pending: int = 10000,",
+            "    dedup_window: int = 10000,",
+            ") -> EventConsumer:",
+            "    consumer = EventConsumer(",
+            "        decode=decode_domain_event,",
+            "        ordering_key=event_ordering_key,",
+            "        concurrency=concurrency,",
+            "        max_pending=max_pending,",
+            "        dedup_window=dedup_window,",
+            "    )",
+        ]
+    )
+    blocking = "" if async_mode else ", blocking=True"
+    for spec in event_specs:
+        lines.append(f"    if handlers.{spec['handler']} is not None:")
+        lines.append(f"        consumer.on({spec['name']!r}, handlers.{spec['handler']}{blocking})")
+    lines.append("    return consumer")
+    return "\n".join(lines).rstrip() + "\n"
@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Set
 
 from ..support import _camel_case
 from ..support import _is_required
+from ..support import _model_class_header_lines
+from ..support import _model_import_line
 from ..support import _pascal_case
 from ..support import _py_type_for_descriptor
 from ..support import _sort_dict_entries
@@ -95,7 +97,7 @@ def _collect_event_object_names_for_type(
     return set()
 
 
-def render_event_contracts(ir: Dict[str, Any]) -> str:
+def render_event_contracts(ir: Dict[str, Any], *, model_style: str = "dataclass") -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
     struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
@@ -118,7 +120,7 @@ def render_event_contracts(ir: Dict[str, Any]) -> str:
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "from dataclasses import dataclass",
+        _model_import_line(model_style),
         "from typing import Optional, List, Union",
         "",
         "from .domain import *",
@@ -132,8 +134,7 @@ def render_event_contracts(ir: Dict[str, Any]) -> str:
 
     for event in _sort_dict_entries([item for item in ir.get("events", []) if isinstance(item, dict)]):
         name = _pascal_case(str(event.get("name", "Event")))
-        lines.append("@dataclass(kw_only=True)")
-        lines.append(f"class {name}:")
+        lines.extend(_model_class_header_lines(name, model_style))
         fields = [field for field in event.get("fields", []) if isinstance(field, dict)]
         if not fields:
             lines.append("    pass")
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..support import _camel_case
+from ..support import _model_asdict_expr
+from ..support import _model_instance_check_expr
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
+from ..support import _py_base_type
 from ..support import _snake_case
 
 
@@ -102,7 +105,210 @@ def _render_py_list(values: List[str]) -> str:
     return f"[{encoded}]"
 
 
-def render_event_emitter(ir: Dict[str, Any], *, async_mode: bool) -> str:
+def _render_ref_bindings_literal(ref_specs: List[Dict[str, Any]], indent: str) -> List[str]:
+    if not ref_specs:
+        return ["[]"]
+    lines = ["["]
+    for ref_spec in ref_specs:
+        object_name = str(ref_spec.get("object_name", "Object"))
+        path_literal = _render_py_list([str(item) for item in ref_spec.get("path", [])])
+        primary_keys_literal = _render_py_list([str(item) for item in ref_spec.get("primary_keys", [])])
+        lines.append(
+            f"{indent}    _RefPathBinding("
+            + f"object_type={repr(object_name)}, "
+            + f"path={path_literal}, "
+            + f"primary_keys={primary_keys_literal}"
+            + "),"
+        )
+    lines.append(f"{indent}]")
+    return lines
+
+
+def _struct_ref_specs(struct_id: str, ctx: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return _collect_event_ref_specs_for_type(
+        {"kind": "struct", "target_struct_id": struct_id},
+        object_by_id=ctx["object_by_id"],
+        struct_by_id=ctx["struct_by_id"],
+        path=[],
+    )
+
+
+def _wire_value_expr(
+    type_desc: Dict[str, Any],
+    expr: str,
+    ctx: Dict[str, Any],
+    *,
+    event_mode: bool,
+    depth: int = 0,
+    in_list: bool = False,
+) -> str:
+    kind = str(type_desc.get("kind", ""))
+    if kind == "base":
+        return expr if _py_base_type(str(type_desc.get("name", "string"))) != "Any" else f"_plain({expr})"
+    if kind == "custom":
+        return expr
+    if kind == "list":
+        element = type_desc.get("element", {}) if isinstance(type_desc.get("element"), dict) else {}
+        item = f"item{depth}"
+        element_expr = _wire_value_expr(element, item, ctx, event_mode=event_mode, depth=depth + 1, in_list=True)
+        if element_expr == item:
+            return f"None if {expr} is None else list({expr})"
+        return f"None if {expr} is None else [{element_expr} for {item} in {expr}]"
+    if kind == "struct":
+        struct_id = str(type_desc.get("target_struct_id", ""))
+        struct = ctx["struct_by_id"].get(struct_id)
+        if not isinstance(struct, dict):
+            return f"_plain({expr})"
+        struct_fn = _snake_case(_pascal_case(str(struct.get("name", "Struct"))))
+        if event_mode and _struct_ref_specs(struct_id, ctx):
+            ctx["struct_wire"].add(struct_id)
+            return f"_{struct_fn}_to_wire({expr}, updated_objects)"
+        ctx["struct_dict"].add(struct_id)
+        return f"_{struct_fn}_to_dict({expr})"
+    if kind == "object_ref":
+        object_id = str(type_desc.get("target_object_id", ""))
+        target = ctx["object_by_id"].get(object_id)
+        if not isinstance(target, dict) or not _object_primary_key_fields(target):
+            return f"_plain({expr})"
+        object_fn = _snake_case(_pascal_case(str(target.get("name", "Object"))))
+        # Ref bindings ending in a list wildcard never normalize their elements, so list items stay plain.
+        if event_mode and not in_list:
+            ctx["ref_wire"].add(object_id)
+            return f"_{object_fn}_ref_to_wire({expr}, updated_objects)"
+        ctx["ref_dict"].add(object_id)
+        return f"_{object_fn}_ref_to_dict({expr})"
+    return f"_plain({expr})"
+
+
+def _wire_dict_literal_lines(
+    fields: List[Dict[str, Any]],
+    source: str,
+    ctx: Dict[str, Any],
+    *,
+    event_mode: bool,
+    extra: List[Tuple[str, str]] | None = None,
+) -> List[str]:
+    entries: List[Tuple[str, str]] = []
+    for field in fields:
+        name = _camel_case(str(field.get("name", "field")))
+        field_type = field.get("type", {}) if isinstance(field.get("type"), dict) else {}
+        entries.append((name, _wire_value_expr(field_type, f"{source}.{name}", ctx, event_mode=event_mode)))
+    entries.extend(extra or [])
+    if not entries:
+        return ["    return {}"]
+    lines = ["    return {"]
+    for name, value_expr in entries:
+        lines.append(f"        {name!r}: {value_expr},")
+    lines.append("    }")
+    return lines
+
+
+def _wire_writer_lines(ctx: Dict[str, Any]) -> List[str]:
+    object_by_id = ctx["object_by_id"]
+    struct_by_id = ctx["struct_by_id"]
+    emitted: set[Tuple[str, str]] = set()
+    lines: List[str] = []
+    while True:
+        pending = sorted(
+            (kind, item_id)
+            for kind in ("ref_wire", "object_dict", "ref_dict", "struct_wire", "struct_dict")
+            for item_id in ctx[kind]
+            if (kind, item_id) not in emitted
+        )
+        if not pending:
+            return lines
+        for kind, item_id in pending:
+            emitted.add((kind, item_id))
+            if kind in ("struct_wire", "struct_dict"):
+                struct = struct_by_id[item_id]
+                struct_name = _pascal_case(str(struct.get("name", "Struct")))
+                struct_fn = _snake_case(struct_name)
+                fields = [field for field in struct.get("fields", []) if isinstance(field, dict)]
+                if kind == "struct_dict":
+                    lines.append(f"def _{struct_fn}_to_dict(value: object) -> object:")
+                    lines.append(f"    if type(value) is not EventContracts.{struct_name}:")
+                    lines.append("        return _plain(value)")
+                    lines.extend(_wire_dict_literal_lines(fields, "value", ctx, event_mode=False))
+                    lines.append("")
+                    continue
+                bindings = _render_ref_bindings_literal(_struct_ref_specs(item_id, ctx), "")
+                lines.append(f"_{struct_fn.upper()}_REF_BINDINGS: List[_RefPathBinding] = {bindings[0]}")
+                lines.extend(bindings[1:])
+                lines.append("")
+                lines.append(f"def _{struct_fn}_to_wire(value: object, updated_objects: List[dict[str, object]]) -> object:")
+                lines.append(f"    if type(value) is not EventContracts.{struct_name}:")
+                lines.append(
+                    f"        return _normalize_value_refs(_plain(value), _{struct_fn.upper()}_REF_BINDINGS, updated_objects)"
+                )
+                lines.extend(_wire_dict_literal_lines(fields, "value", ctx, event_mode=True))
+                lines.append("")
+                continue
+
+            obj = object_by_id[item_id]
+            obj_name = _pascal_case(str(obj.get("name", "Object")))
+            object_fn = _snake_case(obj_name)
+            pk_names = [_camel_case(str(pk.get("name", "id"))) for pk in _object_primary_key_fields(obj)]
+            if kind == "object_dict":
+                fields = [field for field in obj.get("fields", []) if isinstance(field, dict)]
+                extra = [("state", "value.state")] if obj.get("states") else []
+                lines.append(f"def _{object_fn}_to_dict(value: EventContracts.{obj_name}) -> dict[str, object]:")
+                lines.extend(_wire_dict_literal_lines(fields, "value", ctx, event_mode=False, extra=extra))
+                lines.append("")
+                continue
+
+            pk_fields = _object_primary_key_fields(obj)
+            ref_entries = ", ".join(
+                f"{name!r}: {_wire_value_expr(pk.get('type', {}) if isinstance(pk.get('type'), dict) else {}, f'value.{name}', ctx, event_mode=False)}"
+                for name, pk in zip(pk_names, pk_fields)
+            )
+            lines.append(f"def _{object_fn}_ref_to_{'wire' if kind == 'ref_wire' else 'dict'}(value: object{', updated_objects: List[dict[str, object]]' if kind == 'ref_wire' else ''}) -> object:")
+            lines.append("    value_type = type(value)")
+            lines.append(f"    if value_type is EventContracts.{obj_name}Ref:")
+            lines.append(f"        return {{{ref_entries}}}")
+            ctx["object_dict"].add(item_id)
+            if kind == "ref_dict":
+                lines.append(f"    if value_type is EventContracts.{obj_name}:")
+                lines.append(f"        return _{object_fn}_to_dict(value)")
+                lines.append("    return _plain(value)")
+                lines.append("")
+                continue
+            missing_pk = " or ".join(f"candidate[{name!r}] is None" for name in pk_names)
+            object_ref = ", ".join(f"{name!r}: candidate[{name!r}]" for name in pk_names)
+            lines.extend(
+                [
+                    f"    if value_type is EventContracts.{obj_name}:",
+                    f"        candidate = _{object_fn}_to_dict(value)",
+                    f"        if {missing_pk}:",
+                    "            return candidate",
+                    f"        object_ref: dict[str, object] = {{{object_ref}}}",
+                    f"        updated_objects.append({{'object_type': {obj_name!r}, 'object_ref': object_ref, 'object': candidate}})",
+                    "        return object_ref",
+                    f"    return _normalize_ref_value(_plain(value), _{object_fn.upper()}_REF_BINDING, updated_objects)",
+                    "",
+                    f"_{object_fn.upper()}_REF_BINDING = _RefPathBinding(object_type={obj_name!r}, path=[], primary_keys={_render_py_list(pk_names)})",
+                    "",
+                ]
+            )
+
+
+def _render_snapshot_policy(policy: Tuple[str, Optional[int]]) -> str:
+    mode, max_bytes = policy
+    args: List[str] = []
+    if mode != "full":
+        args.append(f"mode={mode!r}")
+    if max_bytes is not None:
+        args.append(f"max_bytes={max_bytes}")
+    return f"SnapshotPolicy({', '.join(args)})"
+
+
+def render_event_emitter(
+    ir: Dict[str, Any],
+    *,
+    async_mode: bool,
+    snapshot_policy: Tuple[str, Optional[int]] = ("full", None),
+    event_snapshot_policies: Optional[Dict[str, Tuple[str, Optional[int]]]] = None,
+    model_style: str = "dataclass",
+) -> str:
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
     struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
     schema_version = str(ir.get("ontology", {}).get("version", "1.0.0"))
@@ -127,6 +333,7 @@ def render_event_emitter(ir: Dict[str, Any], *, async_mode: bool) -> str:
                 "name": event_name,
                 "payload_type": payload_type,
                 "payload_source": payload_source,
+                "fields": fields,
                 "ref_specs": ref_specs,
             }
         )
@@ -135,18 +342,23 @@ def render_event_emitter(ir: Dict[str, Any], *, async_mode: bool) -> str:
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "import dataclasses",
+        "import msgspec" if model_style == "msgspec" else "import dataclasses",
         "",
         "from dataclasses import dataclass",
         "from dataclasses import field",
-        "from typing import Dict, Generic, List, Literal, Optional, Protocol, TypeVar, Union",
+        "from typing import Callable, Dict, Generic, List, Literal, Optional, Protocol, Tuple, TypeVar, Union",
         "",
         "from prophet_events_runtime import EventPublisher",
         "from prophet_events_runtime import EventWireEnvelope",
         "from prophet_events_runtime import NoOpEventPublisher",
+        "from prophet_events_runtime import SnapshotBaselines",
+        "from prophet_events_runtime import SnapshotPolicy",
+        "from prophet_events_runtime import SnapshotStats",
+        "from prophet_events_runtime import apply_snapshot_policy",
         "from prophet_events_runtime import create_event_id",
         "from prophet_events_runtime import now_iso",
         "from prophet_events_runtime import publish_batch_sync",
+        "from prophet_events_runtime import with_snapshot_mode",
         "",
         "from . import event_contracts as EventContracts",
         "",
@@ -157,6 +369,7 @@ def render_event_emitter(ir: Dict[str, Any], *, async_mode: bool) -> str:
         "    trace_id: str",
         "    source: str",
         "    attributes: Optional[dict[str, str]] = None",
+        "    snapshot_baselines: Optional[SnapshotBaselines] = None",
         "",
         "@dataclass(kw_only=True)",
         "class ActionOutcome(Generic[TOutput]):",
@@ -226,8 +439,8 @@ def render_event_emitter(ir: Dict[str, Any], *, async_mode: bool) -> str:
     lines.extend(
         [
             "def _serialize_payload(payload: object) -> dict[str, object]:",
-            "    if dataclasses.is_dataclass(payload):",
-            "        return dataclasses.asdict(payload)",
+            f"    if {_model_instance_check_expr('payload', model_style)}:",
+            f"        return {_model_asdict_expr('payload', model_style)}",
             "    if isinstance(payload, dict):",
             "        return payload",
             "    return {'value': str(payload)}",
@@ -286,47 +499,143 @@ def render_event_emitter(ir: Dict[str, Any], *, async_mode: bool) -> str:
             "        _apply_binding_at_path(payload, binding, 0, updated_objects)",
             "    return updated_objects",
             "",
-            "def _to_event_wire_envelope(event: DomainEvent, metadata: EventPublishMetadata) -> EventWireEnvelope:",
-            "    ref_bindings: List[_RefPathBinding] = []",
+            "def _plain(value: object) -> object:",
+            f"    if {_model_instance_check_expr('value', model_style)} and not isinstance(value, type):",
+            f"        return {_model_asdict_expr('value', model_style)}",
+            "    if isinstance(value, dict):",
+            "        return {str(key): _plain(item) for key, item in value.items()}",
+            "    if isinstance(value, (list, tuple)):",
+            "        return [_plain(item) for item in value]",
+            "    return value",
+            "",
+            "def _serialize_payload_with_bindings(payload: object, bindings: List[_RefPathBinding], updated_objects: List[dict[str, object]]) -> dict[str, object]:",
+            "    serialized = _serialize_payload(_clone_json_like(payload))",
+            "    updated_objects.extend(_normalize_payload_refs(serialized, bindings))",
+            "    return serialized",
+            "",
+            "def _serialize_unbound_payload(payload: object, updated_objects: List[dict[str, object]]) -> dict[str, object]:",
+            "    return _serialize_payload(_clone_json_like(payload))",
+            "",
         ]
     )
 
-    for idx, spec in enumerate(event_specs):
+    ctx: Dict[str, Any] = {
+        "object_by_id": object_by_id,
+        "struct_by_id": struct_by_id,
+        "ref_wire": set(),
+        "ref_dict": set(),
+        "object_dict": set(),
+        "struct_wire": set(),
+        "struct_dict": set(),
+    }
+    serializer_lines: List[str] = []
+    for spec in event_specs:
         event_name = str(spec.get("name", "Event"))
+        event_fn = _snake_case(event_name)
         ref_specs = [item for item in spec.get("ref_specs", []) if isinstance(item, dict)]
-        keyword = "if" if idx == 0 else "elif"
-        lines.append(f"    {keyword} isinstance(event, {event_name}DomainEvent):")
+        bindings_name = "[]"
         if ref_specs:
-            lines.append("        ref_bindings = [")
-            for ref_spec in ref_specs:
-                object_name = str(ref_spec.get("object_name", "Object"))
-                path_literal = _render_py_list([str(item) for item in ref_spec.get("path", [])])
-                primary_keys_literal = _render_py_list([str(item) for item in ref_spec.get("primary_keys", [])])
-                lines.append(
-                    "            _RefPathBinding("
-                    + f"object_type={repr(object_name)}, "
-                    + f"path={path_literal}, "
-                    + f"primary_keys={primary_keys_literal}"
-                    + "),"
-                )
-            lines.append("        ]")
-        else:
-            lines.append("        ref_bindings = []")
+            bindings_name = f"_{event_fn.upper()}_REF_BINDINGS"
+            bindings = _render_ref_bindings_literal(ref_specs, "")
+            serializer_lines.append(f"{bindings_name}: List[_RefPathBinding] = {bindings[0]}")
+            serializer_lines.extend(bindings[1:])
+            serializer_lines.append("")
+        serializer_lines.extend(
+            [
+                f"def _serialize_{event_fn}_payload(payload: object, updated_objects: List[dict[str, object]]) -> dict[str, object]:",
+                f"    if type(payload) is not {spec['payload_source']}.{spec['payload_type']}:",
+                f"        return _serialize_payload_with_bindings(payload, {bindings_name}, updated_objects)",
+            ]
+        )
+        serializer_lines.extend(_wire_dict_literal_lines(list(spec.get("fields", [])), "payload", ctx, event_mode=True))
+        serializer_lines.append("")
+    writer_lines = _wire_writer_lines(ctx)
+    if ctx["struct_wire"]:
+        # Only structs that contain refs fall back to path-based normalization for non-contract values.
+        lines.extend(
+            [
+                "def _normalize_value_refs(value: object, bindings: List[_RefPathBinding], updated_objects: List[dict[str, object]]) -> object:",
+                "    if isinstance(value, dict):",
+                "        updated_objects.extend(_normalize_payload_refs(value, bindings))",
+                "    return value",
+                "",
+            ]
+        )
+    lines.extend(writer_lines)
+    lines.extend(serializer_lines)
+
+    # Baselines use the same wire dicts as extracted snapshots, so `changed` diffs compare like with like.
+    lines.append("_SNAPSHOT_OBJECTS: Dict[type, Tuple[str, List[str], Callable[..., dict[str, object]]]] = {")
+    for object_id in sorted(ctx["ref_wire"]):
+        obj = object_by_id[object_id]
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        pk_names = [_camel_case(str(pk.get("name", "id"))) for pk in _object_primary_key_fields(obj)]
+        lines.append(
+            f"    EventContracts.{obj_name}: ({obj_name!r}, {_render_py_list(pk_names)}, _{_snake_case(obj_name)}_to_dict),"
+        )
+    lines.extend(
+        [
+            "}",
+            "",
+            "# Records `value`'s pre-action state for `changed` snapshots; a no-op when baselines is None.",
+            "def record_snapshot_baseline(baselines: Optional[SnapshotBaselines], value: object) -> None:",
+            "    if baselines is None:",
+            "        return",
+            "    entry = _SNAPSHOT_OBJECTS.get(type(value))",
+            "    if entry is None:",
+            "        raise TypeError(f'Events do not extract snapshots of {type(value).__name__}')",
+            "    object_type, primary_keys, to_dict = entry",
+            "    state = to_dict(value)",
+            "    baselines.record(object_type, {key: state[key] for key in primary_keys}, state)",
+            "",
+            "SNAPSHOT_STATS = SnapshotStats()",
+            f"_DEFAULT_SNAPSHOT_POLICY = {_render_snapshot_policy(snapshot_policy)}",
+            "_SNAPSHOT_POLICIES: Dict[str, SnapshotPolicy] = {",
+        ]
+    )
+    for event_type, policy in sorted((event_snapshot_policies or {}).items()):
+        lines.append(f"    {event_type!r}: {_render_snapshot_policy(policy)},")
+    lines.append("}")
+    lines.append("")
+
+    lines.append("_PAYLOAD_SERIALIZERS: Dict[type, Callable[[object, List[dict[str, object]]], dict[str, object]]] = {")
+    for spec in event_specs:
+        event_name = str(spec.get("name", "Event"))
+        lines.append(f"    {event_name}DomainEvent: _serialize_{_snake_case(event_name)}_payload,")
+    lines.append("}")
+    lines.append("")
 
     lines.extend(
         [
-            "    payload = _serialize_payload(_clone_json_like(getattr(event, 'payload', {})))",
-            "    updated_objects = _normalize_payload_refs(payload, ref_bindings)",
+            "def _payload_serializer_for(event: DomainEvent) -> Callable[[object, List[dict[str, object]]], dict[str, object]]:",
+            "    serializer = _PAYLOAD_SERIALIZERS.get(type(event))",
+            "    if serializer is not None:",
+            "        return serializer",
+            "    for event_type, candidate in _PAYLOAD_SERIALIZERS.items():",
+            "        if isinstance(event, event_type):",
+            "            return candidate",
+            "    return _serialize_unbound_payload",
+            "",
+            "def _to_event_wire_envelope(event: DomainEvent, metadata: EventPublishMetadata) -> EventWireEnvelope:",
+            "    updated_objects: List[dict[str, object]] = []",
+            "    payload = _payload_serializer_for(event)(getattr(event, 'payload', {}), updated_objects)",
+            "    event_type = getattr(event, 'type', 'unknown')",
+            "    policy = _SNAPSHOT_POLICIES.get(event_type, _DEFAULT_SNAPSHOT_POLICY)",
             "    return EventWireEnvelope(",
             "        event_id=create_event_id(),",
             "        trace_id=metadata.trace_id,",
-            "        event_type=getattr(event, 'type', 'unknown'),",
+            "        event_type=event_type,",
             f"        schema_version='{schema_version}',",
             "        occurred_at=now_iso(),",
             "        source=metadata.source,",
             "        payload=payload,",
-            "        attributes=metadata.attributes,",
-            "        updated_objects=updated_objects or None,",
+            "        attributes=with_snapshot_mode(metadata.attributes, policy),",
+            "        updated_objects=apply_snapshot_policy(",
+            "            updated_objects,",
+            "            policy,",
+            "            baselines=metadata.snapshot_baselines,",
+            "            stats=SNAPSHOT_STATS,",
+            "        ),",
             "    )",
             "",
             "async def publish_domain_events(",
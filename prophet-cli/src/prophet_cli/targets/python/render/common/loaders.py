@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from ..support import _camel_case
+from ..support import _has_export
+from ..support import _has_projection
+from ..support import _key_tuple_expr
+from ..support import _object_primary_key_fields
+from ..support import _pascal_case
+from ..support import _sort_dict_entries
+
+
+def _async_batch_loader_lines() -> List[str]:
+    return [
+        "class BatchLoader(Generic[K, V]):",
+        "    def __init__(self, batch_fn: Callable[[List[K]], Awaitable[List[Optional[V]]]], key_fn: Callable[[K], Hashable]):",
+        "        self._batch_fn = batch_fn",
+        "        self._key_fn = key_fn",
+        "        self._futures: Dict[Hashable, asyncio.Future] = {}",
+        "        self._pending: List[Tuple[Hashable, K]] = []",
+        "",
+        "    def load(self, ref: K) -> Awaitable[Optional[V]]:",
+        "        key = self._key_fn(ref)",
+        "        future = self._futures.get(key)",
+        "        if future is not None:",
+        "            return future",
+        "        loop = asyncio.get_running_loop()",
+        "        future = loop.create_future()",
+        "        self._futures[key] = future",
+        "        if not self._pending:",
+        "            loop.call_soon(lambda: loop.create_task(self._dispatch()))",
+        "        self._pending.append((key, ref))",
+        "        return future",
+        "",
+        "    async def load_many(self, refs: List[K]) -> List[Optional[V]]:",
+        "        return list(await asyncio.gather(*[self.load(ref) for ref in refs]))",
+        "",
+        "    def prime(self, ref: K, value: Optional[V]) -> None:",
+        "        key = self._key_fn(ref)",
+        "        if key in self._futures:",
+        "            return",
+        "        future = asyncio.get_running_loop().create_future()",
+        "        future.set_result(value)",
+        "        self._futures[key] = future",
+        "",
+        "    def clear(self, ref: K) -> None:",
+        "        self._futures.pop(self._key_fn(ref), None)",
+        "",
+        "    def clear_all(self) -> None:",
+        "        self._futures.clear()",
+        "",
+        "    async def _dispatch(self) -> None:",
+        "        batch, self._pending = self._pending, []",
+        "        try:",
+        "            values = await self._batch_fn([ref for _, ref in batch])",
+        "        except Exception as exc:",
+        "            for key, _ in batch:",
+        "                future = self._futures.pop(key, None)",
+        "                if future is not None and not future.done():",
+        "                    future.set_exception(exc)",
+        "            return",
+        "        for (key, _), value in zip(batch, values):",
+        "            future = self._futures.get(key)",
+        "            if future is not None and not future.done():",
+        "                future.set_result(value)",
+        "",
+    ]
+
+
+def _sync_batch_loader_lines() -> List[str]:
+    return [
+        "class BatchLoader(Generic[K, V]):",
+        "    def __init__(self, batch_fn: Callable[[List[K]], List[Optional[V]]], key_fn: Callable[[K], Hashable]):",
+        "        self._batch_fn = batch_fn",
+        "        self._key_fn = key_fn",
+        "        self._values: Dict[Hashable, Optional[V]] = {}",
+        "",
+        "    def load(self, ref: K) -> Optional[V]:",
+        "        return self.load_many([ref])[0]",
+        "",
+        "    def load_many(self, refs: List[K]) -> List[Optional[V]]:",
+        "        keys = [self._key_fn(ref) for ref in refs]",
+        "        missing: Dict[Hashable, K] = {}",
+        "        for key, ref in zip(keys, refs):",
+        "            if key not in self._values and key not in missing:",
+        "                missing[key] = ref",
+        "        if missing:",
+        "            values = self._batch_fn(list(missing.values()))",
+        "            self._values.update(zip(missing.keys(), values))",
+        "        return [self._values[key] for key in keys]",
+        "",
+        "    def prime(self, ref: K, value: Optional[V]) -> None:",
+        "        self._values.setdefault(self._key_fn(ref), value)",
+        "",
+        "    def clear(self, ref: K) -> None:",
+        "        self._values.pop(self._key_fn(ref), None)",
+        "",
+        "    def clear_all(self) -> None:",
+        "        self._values.clear()",
+        "",
+    ]
+
+
+def _identity_map_lines(*, async_mode: bool, export: bool, projection: bool) -> List[str]:
+    prefix = "async " if async_mode else ""
+    call = "await " if async_mode else ""
+    iterator = "AsyncIterator" if async_mode else "Iterator"
+    export_lines = [
+        f"    def export(self, *args: Any, **kwargs: Any) -> {iterator}[List[V]]:",
+        "        return self._repository.export(*args, **kwargs)",
+        "",
+    ]
+    # Projected reads return partial objects, so they bypass the identity map.
+    projection_lines = [
+        "        if fields is not None:",
+        f"            return {call}self._repository.get_by_id(id, fields=fields)",
+    ]
+    return [
+        "class IdentityMapRepository(Generic[K, V]):",
+        "    def __init__(self, repository: Any, key_fn: Callable[[Any], Hashable]):",
+        "        self._repository = repository",
+        "        self._key_fn = key_fn",
+        "        self._entries: Dict[Hashable, Optional[V]] = {}",
+        "",
+        f"    {prefix}def list(self, *args: Any, **kwargs: Any) -> Persistence.PagedResult:",
+        f"        return {call}self._repository.list(*args, **kwargs)",
+        "",
+        f"    {prefix}def query(self, *args: Any, **kwargs: Any) -> Persistence.PagedResult:",
+        f"        return {call}self._repository.query(*args, **kwargs)",
+        "",
+        *(export_lines if export else []),
+        f"    {prefix}def get_by_id(self, id: K{', fields: Optional[List[str]] = None' if projection else ''}) -> Optional[V]:",
+        *(projection_lines if projection else []),
+        "        key = self._key_fn(id)",
+        "        if key not in self._entries:",
+        f"            self._entries[key] = {call}self._repository.get_by_id(id)",
+        "        return self._entries[key]",
+        "",
+        f"    {prefix}def get_by_ids(self, ids: List[K]) -> List[Optional[V]]:",
+        "        keys = [self._key_fn(id) for id in ids]",
+        "        missing: Dict[Hashable, K] = {}",
+        "        for key, id in zip(keys, ids):",
+        "            if key not in self._entries and key not in missing:",
+        "                missing[key] = id",
+        "        if missing:",
+        f"            values = {call}self._repository.get_by_ids(list(missing.values()))",
+        "            self._entries.update(zip(missing.keys(), values))",
+        "        return [self._entries[key] for key in keys]",
+        "",
+        f"    {prefix}def save(self, item: V) -> V:",
+        f"        saved = {call}self._repository.save(item)",
+        "        self._entries[self._key_fn(saved)] = saved",
+        "        return saved",
+        "",
+        f"    {prefix}def save_many(self, items: List[V]) -> List[V]:",
+        f"        saved = {call}self._repository.save_many(items)",
+        "        for item in saved:",
+        "            self._entries[self._key_fn(item)] = item",
+        "        return saved",
+        "",
+        "    def clear(self, ref: K) -> None:",
+        "        self._entries.pop(self._key_fn(ref), None)",
+        "",
+        "    def clear_all(self) -> None:",
+        "        self._entries.clear()",
+        "",
+        "class StatefulIdentityMapRepository(IdentityMapRepository[K, V]):",
+        f"    {prefix}def apply_transition(self, id: K, expected_state: str, next_state: str, transition_id: str) -> Union[V, Persistence.TransitionRejected]:",
+        "        self.clear(id)",
+        f"        transitioned = {call}self._repository.apply_transition(id, expected_state, next_state, transition_id)",
+        "        if not isinstance(transitioned, Persistence.TransitionRejected):",
+        "            self._entries[self._key_fn(transitioned)] = transitioned",
+        "        return transitioned",
+        "",
+        f"    {prefix}def apply_transition_many(self, ids: List[K], expected_state: str, next_state: str, transition_id: str) -> List[V]:",
+        "        for id in ids:",
+        "            self.clear(id)",
+        f"        transitioned = {call}self._repository.apply_transition_many(ids, expected_state, next_state, transition_id)",
+        "        for item in transitioned:",
+        "            self._entries[self._key_fn(item)] = item",
+        "        return transitioned",
+        "",
+    ]
+
+
+def render_repository_loaders(ir: Dict[str, Any], *, async_mode: bool) -> str:
+    lines: List[str] = [
+        "# Code generated by prophet-cli. DO NOT EDIT.",
+        "from __future__ import annotations",
+        "",
+    ]
+    export = _has_export(ir)
+    projection = _has_projection(ir)
+    if async_mode:
+        lines.extend(["import asyncio", ""])
+        lines.append(
+            f"from typing import Any, {'AsyncIterator, ' if export else ''}Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar, Union"
+        )
+    else:
+        lines.append(f"from typing import Any, Callable, Dict, Generic, Hashable, {'Iterator, ' if export else ''}List, Optional, TypeVar, Union")
+    lines.extend(
+        [
+            "",
+            "from . import domain as Domain",
+            "from . import persistence as Persistence",
+            "",
+            "K = TypeVar('K')",
+            "V = TypeVar('V')",
+            "",
+        ]
+    )
+    lines.extend(_async_batch_loader_lines() if async_mode else _sync_batch_loader_lines())
+    lines.extend(_identity_map_lines(async_mode=async_mode, export=export, projection=projection))
+
+    objects = _sort_dict_entries([item for item in ir.get("objects", []) if isinstance(item, dict)])
+    for obj in objects:
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        pk_props = [_camel_case(str(pk.get("name", "id"))) for pk in _object_primary_key_fields(obj)]
+        lines.append(f"def _{obj_name.lower()}_key(ref: Domain.{obj_name}Ref | Domain.{obj_name}) -> tuple:")
+        lines.append(f"    return {_key_tuple_expr('ref', pk_props)}")
+        lines.append("")
+
+    lines.append("class RepositoryLoaders:")
+    lines.append("    def __init__(self, repositories: Persistence.Repositories):")
+    if not objects:
+        lines.append("        pass")
+    for obj in objects:
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        prop = _camel_case(obj_name)
+        lines.append(
+            f"        self.{prop}: BatchLoader[Domain.{obj_name}Ref, Domain.{obj_name}] = "
+            f"BatchLoader(repositories.{prop}.get_by_ids, _{obj_name.lower()}_key)"
+        )
+    lines.append("")
+
+    lines.append("class IdentityMapRepositories:")
+    lines.append("    def __init__(self, repositories: Persistence.Repositories):")
+    if not objects:
+        lines.append("        pass")
+    for obj in objects:
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        prop = _camel_case(obj_name)
+        wrapper = "StatefulIdentityMapRepository" if obj.get("states") else "IdentityMapRepository"
+        lines.append(
+            f"        self.{prop}: {wrapper}[Domain.{obj_name}Ref, Domain.{obj_name}] = "
+            f"{wrapper}(repositories.{prop}, _{obj_name.lower()}_key)"
+        )
+    lines.append("")
+    lines.append("    def clear_all(self) -> None:")
+    if not objects:
+        lines.append("        pass")
+    for obj in objects:
+        lines.append(f"        self.{_camel_case(_pascal_case(str(obj.get('name', 'Object'))))}.clear_all()")
+    lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
@@ -3,55 +3,183 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _export_contract
+from ..support import _has_cursor_pagination
+from ..support import _has_export
+from ..support import _has_optional_totals
+from ..support import _has_projection
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
+from ..support import _projection_contract
 from ..support import _sort_dict_entries
+from ..support import _total_count_contract
+
+
+def _cursor_codec_lines() -> List[str]:
+    return [
+        "class InvalidCursorError(ValueError):",
+        "    pass",
+        "",
+        "def encode_cursor(values: List[object]) -> str:",
+        "    payload = json.dumps(values, separators=(',', ':'), default=str).encode('utf-8')",
+        "    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')",
+        "",
+        "def _cursor_value(kind: str, value: object) -> object:",
+        "    if kind == 'int' and isinstance(value, int) and not isinstance(value, bool):",
+        "        return value",
+        "    if kind == 'float' and isinstance(value, (int, float)) and not isinstance(value, bool):",
+        "        return float(value)",
+        "    if kind == 'bool' and isinstance(value, bool):",
+        "        return value",
+        "    if kind == 'str' and isinstance(value, str):",
+        "        return value",
+        "    raise InvalidCursorError('invalid cursor')",
+        "",
+        "def decode_cursor(cursor: str, kinds: Tuple[str, ...]) -> List[object]:",
+        "    try:",
+        "        padded = cursor + '=' * (-len(cursor) % 4)",
+        "        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))",
+        "    except (ValueError, UnicodeError) as exc:",
+        "        raise InvalidCursorError('invalid cursor') from exc",
+        "    if not isinstance(values, list) or len(values) != len(kinds):",
+        "        raise InvalidCursorError('invalid cursor')",
+        "    return [_cursor_value(kind, value) for kind, value in zip(kinds, values)]",
+        "",
+    ]
+
+
+def _field_selection_lines() -> List[str]:
+    return [
+        "class InvalidFieldsError(ValueError):",
+        "    pass",
+        "",
+        "def select_fields(value: Optional[str], allowed: Tuple[str, ...], key_fields: Tuple[str, ...]) -> Optional[List[str]]:",
+        "    if value is None or not value.strip():",
+        "        return None",
+        "    requested = {name.strip() for name in value.split(',') if name.strip()}",
+        "    unknown = sorted(requested.difference(allowed))",
+        "    if unknown:",
+        "        raise InvalidFieldsError(f\"unknown fields: {', '.join(unknown)}\")",
+        "    requested.update(key_fields)",
+        "    return [name for name in allowed if name in requested]",
+        "",
+    ]
 
 
 def render_persistence_contracts(ir: Dict[str, Any], *, async_mode: bool) -> str:
+    cursor_enabled = _has_cursor_pagination(ir)
+    optional_totals = _has_optional_totals(ir)
+    query_contract_by_object_id = {
+        str(item.get("object_id", "")): item
+        for item in ir.get("query_contracts", [])
+        if isinstance(item, dict)
+    }
+    export_iterator = ("AsyncIterator" if async_mode else "Iterator") if _has_export(ir) else ""
+    projection_enabled = _has_projection(ir)
     lines: List[str] = [
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "from dataclasses import dataclass",
-        "from typing import List, Optional, Protocol",
-        "",
-        "from .domain import *",
-        "from .query import *",
-        "",
-        "@dataclass",
-        "class PagedResult:",
-        "    content: List[object]",
-        "    page: int",
-        "    size: int",
-        "    totalElements: int",
-        "    totalPages: int",
-        "",
     ]
+    if cursor_enabled:
+        lines.extend(["import base64", "import json", ""])
+    lines.extend(
+        [
+            "from dataclasses import dataclass",
+            f"from typing import {export_iterator + ', ' if export_iterator else ''}List, Optional, Protocol{', Tuple' if projection_enabled or cursor_enabled else ''}, Union",
+            "",
+            "from .domain import *",
+            "from .query import *",
+            "",
+            "@dataclass",
+            "class PagedResult:",
+            "    content: List[object]",
+            "    page: int",
+            "    size: int",
+        ]
+    )
+    if optional_totals:
+        lines.append("    totalElements: Optional[int] = None")
+        lines.append("    totalPages: Optional[int] = None")
+    else:
+        lines.append("    totalElements: int")
+        lines.append("    totalPages: int")
+    if cursor_enabled:
+        lines.append("    nextCursor: Optional[str] = None")
+    lines.append("")
+    lines.extend(
+        [
+            "@dataclass(frozen=True)",
+            "class TransitionRejected:",
+            "    current_state: Optional[str] = None",
+            "",
+            "    @property",
+            "    def missing(self) -> bool:",
+            "        return self.current_state is None",
+            "",
+        ]
+    )
+    if optional_totals:
+        lines.extend(
+            [
+                "def total_pages(total: Optional[int], size: int) -> Optional[int]:",
+                "    if total is None:",
+                "        return None",
+                "    return (total + size - 1) // size if size > 0 else 0",
+                "",
+            ]
+        )
+    if cursor_enabled:
+        lines.extend(_cursor_codec_lines())
+    if projection_enabled:
+        lines.extend(_field_selection_lines())
 
     for obj in _sort_dict_entries([item for item in ir.get("objects", []) if isinstance(item, dict)]):
         obj_name = _pascal_case(str(obj.get("name", "Object")))
         pk_name = f"{obj_name}Ref"
         query_filter_name = f"{obj_name}QueryFilter"
+        contract = query_contract_by_object_id.get(str(obj.get("id", "")), {})
+        cursor_param = ", cursor: Optional[str] = None" if _cursor_key_fields(contract, obj) else ""
+        total_contract = _total_count_contract(contract)
+        if total_contract is not None:
+            cursor_param += f", include_total: bool = {total_contract['include_by_default']}"
+        fields_param = ", fields: Optional[List[str]] = None" if _projection_contract(contract, obj) is not None else ""
+        cursor_param += fields_param
+        export_contract = _export_contract(contract)
         lines.append(f"class {obj_name}Repository(Protocol):")
         if async_mode:
-            lines.append(f"    async def list(self, page: int, size: int) -> PagedResult: ...")
-            lines.append(f"    async def query(self, filter: {query_filter_name}, page: int, size: int) -> PagedResult: ...")
-            lines.append(f"    async def get_by_id(self, id: {pk_name}) -> Optional[{obj_name}]: ...")
+            lines.append(f"    async def list(self, page: int, size: int{cursor_param}) -> PagedResult: ...")
+            lines.append(f"    async def query(self, filter: {query_filter_name}, page: int, size: int{cursor_param}) -> PagedResult: ...")
+            lines.append(f"    async def get_by_id(self, id: {pk_name}{fields_param}) -> Optional[{obj_name}]: ...")
+            lines.append(f"    async def get_by_ids(self, ids: List[{pk_name}]) -> List[Optional[{obj_name}]]: ...")
             lines.append(f"    async def save(self, item: {obj_name}) -> {obj_name}: ...")
+            lines.append(f"    async def save_many(self, items: List[{obj_name}]) -> List[{obj_name}]: ...")
             if obj.get("states"):
                 lines.append(
-                    f"    async def apply_transition(self, id: {pk_name}, expected_state: {obj_name}State, next_state: {obj_name}State, transition_id: str) -> Optional[{obj_name}]: ..."
+                    f"    async def apply_transition(self, id: {pk_name}, expected_state: {obj_name}State, next_state: {obj_name}State, transition_id: str) -> Union[{obj_name}, TransitionRejected]: ..."
+                )
+                lines.append(
+                    f"    async def apply_transition_many(self, ids: List[{pk_name}], expected_state: {obj_name}State, next_state: {obj_name}State, transition_id: str) -> List[{obj_name}]: ..."
                 )
         else:
-            lines.append(f"    def list(self, page: int, size: int) -> PagedResult: ...")
-            lines.append(f"    def query(self, filter: {query_filter_name}, page: int, size: int) -> PagedResult: ...")
-            lines.append(f"    def get_by_id(self, id: {pk_name}) -> Optional[{obj_name}]: ...")
+            lines.append(f"    def list(self, page: int, size: int{cursor_param}) -> PagedResult: ...")
+            lines.append(f"    def query(self, filter: {query_filter_name}, page: int, size: int{cursor_param}) -> PagedResult: ...")
+            lines.append(f"    def get_by_id(self, id: {pk_name}{fields_param}) -> Optional[{obj_name}]: ...")
+            lines.append(f"    def get_by_ids(self, ids: List[{pk_name}]) -> List[Optional[{obj_name}]]: ...")
             lines.append(f"    def save(self, item: {obj_name}) -> {obj_name}: ...")
+            lines.append(f"    def save_many(self, items: List[{obj_name}]) -> List[{obj_name}]: ...")
             if obj.get("states"):
                 lines.append(
-                    f"    def apply_transition(self, id: {pk_name}, expected_state: {obj_name}State, next_state: {obj_name}State, transition_id: str) -> Optional[{obj_name}]: ..."
+                    f"    def apply_transition(self, id: {pk_name}, expected_state: {obj_name}State, next_state: {obj_name}State, transition_id: str) -> Union[{obj_name}, TransitionRejected]: ..."
+                )
+                lines.append(
+                    f"    def apply_transition_many(self, ids: List[{pk_name}], expected_state: {obj_name}State, next_state: {obj_name}State, transition_id: str) -> List[{obj_name}]: ..."
                 )
+        if export_contract is not None:
+            lines.append(
+                f"    def export(self, filter: {query_filter_name}, chunk_size: int = {export_contract['chunk_size']}) -> {export_iterator}[List[{obj_name}]]: ..."
+            )
         lines.append("")
 
     lines.append("class Repositories(Protocol):")
@@ -4,12 +4,14 @@ from typing import Any, Dict, List
 
 from ..support import _camel_case
 from ..support import _field_index
+from ..support import _model_class_header_lines
+from ..support import _model_import_line
 from ..support import _pascal_case
 from ..support import _py_type_for_descriptor
 from ..support import _sort_dict_entries
 
 
-def render_query_contracts(ir: Dict[str, Any]) -> str:
+def render_query_contracts(ir: Dict[str, Any], *, model_style: str = "dataclass") -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
     struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
@@ -18,7 +20,7 @@ def render_query_contracts(ir: Dict[str, Any]) -> str:
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "from dataclasses import dataclass",
+        _model_import_line(model_style),
         "from typing import List, Optional",
         "",
         "from .domain import *",
@@ -48,8 +50,7 @@ def render_query_contracts(ir: Dict[str, Any]) -> str:
                     struct_by_id=struct_by_id,
                 )
 
-            lines.append("@dataclass(kw_only=True)")
-            lines.append(f"class {class_name}:")
+            lines.extend(_model_class_header_lines(class_name, model_style))
             if "eq" in operators:
                 lines.append(f"    eq: Optional[{field_type}] = None")
             if "in" in operators:
@@ -64,8 +65,7 @@ def render_query_contracts(ir: Dict[str, Any]) -> str:
                 lines.append("    pass")
             lines.append("")
 
-        lines.append("@dataclass(kw_only=True)")
-        lines.append(f"class {obj_name}QueryFilter:")
+        lines.extend(_model_class_header_lines(f"{obj_name}QueryFilter", model_style))
         if not contract.get("filters"):
             lines.append("    pass")
         else:
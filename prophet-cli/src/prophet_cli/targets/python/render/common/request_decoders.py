@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from ..support import _camel_case
+from ..support import _field_index
+from ..support import _has_projection
+from ..support import _object_primary_key_fields
+from ..support import _pascal_case
+from ..support import _projection_contract
+from ..support import _snake_case
+from ..support import _sort_dict_entries
+
+
+def action_input_decoder_name(input_name: str) -> str:
+    return f"decode_{_snake_case(input_name)}"
+
+
+def query_filter_decoder_name(object_name: str) -> str:
+    return f"decode_{_snake_case(object_name)}_query_filter"
+
+
+def object_decoder_name(object_name: str) -> str:
+    return f"decode_{_snake_case(object_name)}"
+
+
+def object_ref_decoder_name(object_name: str) -> str:
+    return f"decode_{_snake_case(object_name)}_ref"
+
+
+def struct_decoder_name(struct_name: str) -> str:
+    return f"decode_{_snake_case(struct_name)}"
+
+
+def fields_decoder_name(object_name: str) -> str:
+    return f"decode_{_snake_case(object_name)}_fields"
+
+
+def _decode_expr(type_desc: Dict[str, Any], expr: str, ctx: Dict[str, Any], depth: int = 0) -> str:
+    # Scalars, custom types, and unknown shapes pass through untouched, as the reflective coercer did.
+    kind = str(type_desc.get("kind", ""))
+    if kind == "struct":
+        struct = ctx["struct_by_id"].get(str(type_desc.get("target_struct_id", "")))
+        if not isinstance(struct, dict):
+            return expr
+        ctx["structs"].add(str(struct.get("id", "")))
+        return f"{struct_decoder_name(_pascal_case(str(struct.get('name', 'Struct'))))}({expr})"
+    if kind == "object_ref":
+        target = ctx["object_by_id"].get(str(type_desc.get("target_object_id", "")))
+        if not isinstance(target, dict):
+            return expr
+        ctx["refs"].add(str(target.get("id", "")))
+        return f"{object_ref_decoder_name(_pascal_case(str(target.get('name', 'Object'))))}({expr})"
+    if kind == "list":
+        element = type_desc.get("element", {}) if isinstance(type_desc.get("element"), dict) else {}
+        item = f"item{depth}"
+        element_expr = _decode_expr(element, item, ctx, depth + 1)
+        if element_expr == item:
+            return expr
+        return f"[{element_expr} for {item} in {expr}] if isinstance({expr}, list) else {expr}"
+    return expr
+
+
+def _decoder_lines(function_name: str, class_name: str, fields: List[Tuple[str, Dict[str, Any]]], ctx: Dict[str, Any]) -> List[str]:
+    lines = [
+        f"def {function_name}(value: Any) -> {class_name}:",
+        "    if not isinstance(value, dict):",
+        "        return value",
+    ]
+    if not fields:
+        lines.append(f"    return {class_name}()")
+        lines.append("")
+        return lines
+    lines.append("    kwargs: dict[str, Any] = {}")
+    for name, type_desc in fields:
+        lines.append(f"    if {name!r} in value:")
+        decoded = _decode_expr(type_desc, "field_value", ctx)
+        if decoded.count("field_value") == 1:
+            lines.append(f"        kwargs[{name!r}] = {decoded.replace('field_value', f'value[{name!r}]')}")
+        else:
+            lines.append(f"        field_value = value[{name!r}]")
+            lines.append(f"        kwargs[{name!r}] = {decoded}")
+    lines.append(f"    return {class_name}(**kwargs)")
+    lines.append("")
+    return lines
+
+
+def _named_fields(fields: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+    return [
+        (
+            _camel_case(str(field.get("name", "field"))),
+            field.get("type", {}) if isinstance(field.get("type"), dict) else {},
+        )
+        for field in fields
+        if isinstance(field, dict)
+    ]
+
+
+def render_request_decoders(ir: Dict[str, Any]) -> str:
+    object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
+    struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
+    # Every ref and struct decoder is emitted so event consumers can reuse them.
+    ctx: Dict[str, Any] = {
+        "object_by_id": object_by_id,
+        "struct_by_id": struct_by_id,
+        "structs": set(struct_by_id),
+        "refs": set(object_by_id),
+    }
+
+    public_lines: List[str] = []
+    for shape in _sort_dict_entries([item for item in ir.get("action_inputs", []) if isinstance(item, dict)]):
+        input_name = _pascal_case(str(shape.get("name", "ActionInput")))
+        fields = _named_fields([field for field in shape.get("fields", []) if isinstance(field, dict)])
+        public_lines.extend(_decoder_lines(action_input_decoder_name(input_name), input_name, fields, ctx))
+
+    for obj in _sort_dict_entries(list(object_by_id.values())):
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        fields = _named_fields([field for field in obj.get("fields", []) if isinstance(field, dict)])
+        if obj.get("states"):
+            fields.append(("state", {}))
+        public_lines.extend(_decoder_lines(object_decoder_name(obj_name), obj_name, fields, ctx))
+
+    for contract in _sort_dict_entries([item for item in ir.get("query_contracts", []) if isinstance(item, dict)]):
+        obj = object_by_id.get(str(contract.get("object_id", "")), {})
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        by_field = _field_index([field for field in obj.get("fields", []) if isinstance(field, dict)])
+        filter_fields: List[Tuple[str, str]] = []
+        for filter_def in sorted([item for item in contract.get("filters", []) if isinstance(item, dict)], key=lambda item: str(item.get("field_name", ""))):
+            class_name = f"{obj_name}{_pascal_case(str(filter_def.get('field_name', 'field')))}Filter"
+            field_id = str(filter_def.get("field_id", ""))
+            field = by_field.get(field_id, {}) if field_id != "__state__" else {}
+            type_desc = field.get("type", {}) if isinstance(field.get("type"), dict) else {}
+            operators = [str(item) for item in filter_def.get("operators", [])]
+            operator_fields: List[Tuple[str, Dict[str, Any]]] = []
+            if "eq" in operators:
+                operator_fields.append(("eq", type_desc))
+            if "in" in operators:
+                operator_fields.append(("inValues", {"kind": "list", "element": type_desc}))
+            if "contains" in operators:
+                operator_fields.append(("contains", {}))
+            if "gte" in operators:
+                operator_fields.append(("gte", type_desc))
+            if "lte" in operators:
+                operator_fields.append(("lte", type_desc))
+            function_name = f"_decode_{_snake_case(class_name)}"
+            public_lines.extend(_decoder_lines(function_name, class_name, operator_fields, ctx))
+            filter_fields.append((_camel_case(str(filter_def.get("field_name", "field"))), function_name))
+        lines = [
+            f"def {query_filter_decoder_name(obj_name)}(value: Any) -> {obj_name}QueryFilter:",
+            "    if not isinstance(value, dict):",
+            "        return value",
+        ]
+        if not filter_fields:
+            lines.append(f"    return {obj_name}QueryFilter()")
+        else:
+            lines.append("    kwargs: dict[str, Any] = {}")
+            for name, function_name in filter_fields:
+                lines.append(f"    if {name!r} in value:")
+                lines.append(f"        kwargs[{name!r}] = {function_name}(value[{name!r}])")
+            lines.append(f"    return {obj_name}QueryFilter(**kwargs)")
+        lines.append("")
+        public_lines.extend(lines)
+
+        projection = _projection_contract(contract, obj)
+        if projection is not None:
+            constant = _snake_case(obj_name).upper()
+            public_lines.extend(
+                [
+                    f"{constant}_PROJECTION_FIELDS = {tuple(projection['fields'])!r}",
+                    f"{constant}_PROJECTION_KEY_FIELDS = {tuple(projection['key_fields'])!r}",
+                    "",
+                    f"def {fields_decoder_name(obj_name)}(value: Optional[str]) -> Optional[List[str]]:",
+                    f"    return select_fields(value, {constant}_PROJECTION_FIELDS, {constant}_PROJECTION_KEY_FIELDS)",
+                    "",
+                ]
+            )
+
+    nested_lines: List[str] = []
+    emitted: set[Tuple[str, str]] = set()
+    while True:
+        pending = sorted(
+            (kind, item_id) for kind in ("refs", "structs") for item_id in ctx[kind] if (kind, item_id) not in emitted
+        )
+        if not pending:
+            break
+        for kind, item_id in pending:
+            emitted.add((kind, item_id))
+            if kind == "structs":
+                struct = struct_by_id[item_id]
+                struct_name = _pascal_case(str(struct.get("name", "Struct")))
+                fields = _named_fields([field for field in struct.get("fields", []) if isinstance(field, dict)])
+                nested_lines.extend(_decoder_lines(struct_decoder_name(struct_name), struct_name, fields, ctx))
+                continue
+            obj = object_by_id[item_id]
+            obj_name = _pascal_case(str(obj.get("name", "Object")))
+            fields = _named_fields(_object_primary_key_fields(obj))
+            nested_lines.extend(_decoder_lines(object_ref_decoder_name(obj_name), f"{obj_name}Ref", fields, ctx))
+
+    projection_enabled = _has_projection(ir)
+    header = [
+        "# Code generated by prophet-cli. DO NOT EDIT.",
+        "from __future__ import annotations",
+        "",
+        "from typing import Any, List, Optional" if projection_enabled else "from typing import Any",
+        "",
+        "from .actions import *",
+        "from .domain import *",
+        *(["from .persistence import select_fields"] if projection_enabled else []),
+        "from .query import *",
+        "",
+        "# Straight-line decoders from JSON to action inputs, query filters, domain objects, refs, and structs,",
+        "# compiled from the IR field types. Known keys are decoded; nested refs and structs become their",
+        "# dataclasses, and values that are not JSON objects pass through unchanged.",
+        "",
+    ]
+    return "\n".join(header + nested_lines + public_lines).rstrip() + "\n"
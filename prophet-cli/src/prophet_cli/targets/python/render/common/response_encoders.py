@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from ..support import _camel_case
+from ..support import _export_contract
+from ..support import _has_cursor_pagination
+from ..support import _is_required
+from ..support import _model_asdict_expr
+from ..support import _model_instance_check_expr
+from ..support import _object_primary_key_fields
+from ..support import _pascal_case
+from ..support import _projection_contract
+from ..support import _py_base_type
+from ..support import _snake_case
+from ..support import _sort_dict_entries
+
+
+def response_encoder_name(type_name: str) -> str:
+    return f"{_snake_case(type_name)}_to_json_bytes"
+
+
+def page_encoder_name(object_name: str) -> str:
+    return f"{_snake_case(object_name)}_page_to_json_bytes"
+
+
+def export_encoder_name(object_name: str) -> str:
+    return f"{_snake_case(object_name)}_export_encoder"
+
+
+def projected_encoder_name(object_name: str) -> str:
+    return f"{_snake_case(object_name)}_to_projected_json_bytes"
+
+
+def projected_page_encoder_name(object_name: str) -> str:
+    return f"{_snake_case(object_name)}_page_to_projected_json_bytes"
+
+
+def _encode_expr(type_desc: Dict[str, Any], expr: str, ctx: Dict[str, Any], depth: int = 0) -> str:
+    kind = str(type_desc.get("kind", ""))
+    if kind == "base":
+        return expr if _py_base_type(str(type_desc.get("name", "string"))) != "Any" else f"_plain({expr})"
+    if kind == "custom":
+        return expr
+    if kind == "list":
+        element = type_desc.get("element", {}) if isinstance(type_desc.get("element"), dict) else {}
+        item = f"item{depth}"
+        element_expr = _encode_expr(element, item, ctx, depth + 1)
+        if element_expr == item:
+            return f"None if {expr} is None else list({expr})"
+        return f"None if {expr} is None else [{element_expr} for {item} in {expr}]"
+    if kind == "struct":
+        struct = ctx["struct_by_id"].get(str(type_desc.get("target_struct_id", "")))
+        if not isinstance(struct, dict):
+            return f"_plain({expr})"
+        ctx["structs"].add(str(struct.get("id", "")))
+        return f"_encode_{_snake_case(_pascal_case(str(struct.get('name', 'Struct'))))}({expr})"
+    if kind == "object_ref":
+        target = ctx["object_by_id"].get(str(type_desc.get("target_object_id", "")))
+        if not isinstance(target, dict) or not _object_primary_key_fields(target):
+            return f"_plain({expr})"
+        ctx["refs"].add(str(target.get("id", "")))
+        return f"_encode_{_snake_case(_pascal_case(str(target.get('name', 'Object'))))}_ref({expr})"
+    return f"_plain({expr})"
+
+
+def _field_entries(fields: List[Dict[str, Any]], ctx: Dict[str, Any]) -> List[Tuple[str, str]]:
+    entries: List[Tuple[str, str]] = []
+    for field in fields:
+        name = _camel_case(str(field.get("name", "field")))
+        field_type = field.get("type", {}) if isinstance(field.get("type"), dict) else {}
+        value_expr = _encode_expr(field_type, f"value.{name}", ctx)
+        if str(field_type.get("kind", "")) == "struct" and value_expr.startswith("_encode_") and not _is_required(field):
+            value_expr = f"None if value.{name} is None else {value_expr}"
+        entries.append((name, value_expr))
+    return entries
+
+
+def _dict_function_lines(signature: str, entries: List[Tuple[str, str]]) -> List[str]:
+    lines = [signature]
+    if not entries:
+        lines.append("    return {}")
+    else:
+        lines.append("    return {")
+        for name, value_expr in entries:
+            lines.append(f"        {name!r}: {value_expr},")
+        lines.append("    }")
+    lines.append("")
+    return lines
+
+
+def _bytes_function_lines(type_name: str, annotation: str, model_style: str) -> List[str]:
+    snake = _snake_case(type_name)
+    # msgspec encodes Struct instances natively, so the bytes path skips the intermediate dict.
+    body = "_JSON_ENCODER.encode(value)" if model_style == "msgspec" else f"dumps_json_bytes({snake}_to_json_dict(value))"
+    return [
+        f"def {snake}_to_json_bytes(value: {annotation}) -> bytes:",
+        f"    return {body}",
+        "",
+    ]
+
+
+def _projected_bytes_function_lines(type_name: str, annotation: str, model_style: str) -> List[str]:
+    snake = _snake_case(type_name)
+    encode = "_JSON_ENCODER.encode" if model_style == "msgspec" else "dumps_json_bytes"
+    return [
+        f"def {snake}_to_projected_json_bytes(value: {annotation}, fields: Optional[List[str]]) -> bytes:",
+        "    if fields is None:",
+        f"        return {snake}_to_json_bytes(value)",
+        f"    return {encode}({snake}_to_projected_json_dict(value, fields))",
+        "",
+    ]
+
+
+def _projection_lines(obj_name: str, entries: List[Tuple[str, str]], model_style: str) -> List[str]:
+    snake = _snake_case(obj_name)
+    lines = [f"_{snake.upper()}_FIELD_ENCODERS: dict[str, Callable[[{obj_name}], object]] = {{"]
+    for name, value_expr in entries:
+        lines.append(f"    {name!r}: lambda value: {value_expr},")
+    lines.extend(
+        [
+            "}",
+            "",
+            f"def {snake}_to_projected_json_dict(value: {obj_name}, fields: List[str]) -> dict[str, object]:",
+            f"    return {{name: _{snake.upper()}_FIELD_ENCODERS[name](value) for name in fields}}",
+            "",
+        ]
+    )
+    lines.extend(_projected_bytes_function_lines(obj_name, obj_name, model_style))
+    return lines
+
+
+def _export_lines(obj_name: str, field_names: List[str], formats: List[str], model_style: str) -> List[str]:
+    snake = _snake_case(obj_name)
+    lines: List[str] = []
+    if "ndjson" in formats:
+        lines.append(f"def {snake}_chunk_to_ndjson(items: List[{obj_name}]) -> bytes:")
+        if model_style == "msgspec":
+            lines.append("    return _JSON_ENCODER.encode_lines(items)")
+        else:
+            lines.append(f"    return b''.join([dumps_json_bytes({snake}_to_json_dict(item)) + b'\\n' for item in items])")
+        lines.append("")
+    if "csv" in formats:
+        lines.append(f"{snake.upper()}_CSV_COLUMNS = {tuple(field_names)!r}")
+        lines.append("")
+        lines.append(f"def {snake}_chunk_to_csv(items: List[{obj_name}]) -> bytes:")
+        lines.append(f"    return _csv_bytes([{snake}_to_json_dict(item).values() for item in items])")
+        lines.append("")
+    lines.append(f"def {export_encoder_name(obj_name)}(export_format: str) -> Optional[Tuple[str, bytes, Callable[[List[{obj_name}]], bytes]]]:")
+    if "ndjson" in formats:
+        lines.append("    if export_format == 'ndjson':")
+        lines.append(f"        return 'application/x-ndjson', b'', {snake}_chunk_to_ndjson")
+    if "csv" in formats:
+        lines.append("    if export_format == 'csv':")
+        lines.append(f"        return 'text/csv; charset=utf-8', _csv_bytes([{snake.upper()}_CSV_COLUMNS]), {snake}_chunk_to_csv")
+    lines.append("    return None")
+    lines.append("")
+    return lines
+
+
+def _csv_helper_lines(model_style: str) -> List[str]:
+    encode_json = "_JSON_ENCODER.encode(value)" if model_style == "msgspec" else "dumps_json_bytes(value)"
+    return [
+        "def _csv_cell(value: object) -> object:",
+        "    if value is None:",
+        "        return ''",
+        "    if isinstance(value, bool):",
+        "        return 'true' if value else 'false'",
+        "    if isinstance(value, (dict, list)):",
+        f"        return {encode_json}.decode('utf-8')",
+        "    return value",
+        "",
+        "def _csv_bytes(rows: Iterable[Iterable[object]]) -> bytes:",
+        "    buffer = io.StringIO()",
+        "    writer = csv.writer(buffer, lineterminator='\\n')",
+        "    for row in rows:",
+        "        writer.writerow([_csv_cell(value) for value in row])",
+        "    return buffer.getvalue().encode('utf-8')",
+        "",
+    ]
+
+
+def render_response_encoders(ir: Dict[str, Any], *, model_style: str = "dataclass") -> str:
+    object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
+    struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
+    event_by_id = {item["id"]: item for item in ir.get("events", []) if isinstance(item, dict) and "id" in item}
+    ctx: Dict[str, Any] = {
+        "object_by_id": object_by_id,
+        "struct_by_id": struct_by_id,
+        "structs": set(),
+        "refs": set(),
+    }
+
+    export_by_object_id = {
+        str(contract.get("object_id", "")): export
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict) and (export := _export_contract(contract)) is not None
+    }
+    csv_export = any("csv" in export["formats"] for export in export_by_object_id.values())
+    projected_object_ids = {
+        str(contract.get("object_id", ""))
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+        and _projection_contract(contract, object_by_id.get(str(contract.get("object_id", "")), {})) is not None
+    }
+
+    public_lines: List[str] = []
+    for obj in _sort_dict_entries(list(object_by_id.values())):
+        obj_name = _pascal_case(str(obj.get("name", "Object")))
+        entries = _field_entries([field for field in obj.get("fields", []) if isinstance(field, dict)], ctx)
+        if obj.get("states"):
+            entries.append(("state", "value.state"))
+        public_lines.extend(_dict_function_lines(f"def {_snake_case(obj_name)}_to_json_dict(value: {obj_name}) -> dict[str, object]:", entries))
+        public_lines.extend(_bytes_function_lines(obj_name, obj_name, model_style))
+        if str(obj.get("id", "")) in projected_object_ids:
+            public_lines.extend(_projection_lines(obj_name, entries, model_style))
+        export = export_by_object_id.get(str(obj.get("id", "")))
+        if export is not None:
+            public_lines.extend(_export_lines(obj_name, [name for name, _ in entries], export["formats"], model_style))
+
+    page_entries = ["'page': value.page", "'size': value.size", "'totalElements': value.totalElements", "'totalPages': value.totalPages"]
+    if _has_cursor_pagination(ir):
+        page_entries.append("'nextCursor': value.nextCursor")
+    for contract in _sort_dict_entries([item for item in ir.get("query_contracts", []) if isinstance(item, dict)]):
+        obj = object_by_id.get(str(contract.get("object_id", "")), {})
+        obj_snake = _snake_case(_pascal_case(str(obj.get("name", "Object"))))
+        public_lines.extend(
+            [
+                f"def {obj_snake}_page_to_json_dict(value: PagedResult) -> dict[str, object]:",
+                "    return {",
+                f"        'content': [{obj_snake}_to_json_dict(item) for item in value.content],",
+                *[f"        {entry}," for entry in page_entries],
+                "    }",
+                "",
+            ]
+        )
+        public_lines.extend(_bytes_function_lines(f"{obj_snake}_page", "PagedResult", model_style))
+        if str(contract.get("object_id", "")) in projected_object_ids:
+            public_lines.extend(
+                [
+                    f"def {obj_snake}_page_to_projected_json_dict(value: PagedResult, fields: List[str]) -> dict[str, object]:",
+                    "    return {",
+                    f"        'content': [{obj_snake}_to_projected_json_dict(item, fields) for item in value.content],",
+                    *[f"        {entry}," for entry in page_entries],
+                    "    }",
+                    "",
+                ]
+            )
+            public_lines.extend(_projected_bytes_function_lines(f"{obj_snake}_page", "PagedResult", model_style))
+
+    output_event_ids = sorted(
+        {str(action.get("output_event_id", "")) for action in ir.get("actions", []) if isinstance(action, dict)}
+    )
+    for event_id in output_event_ids:
+        event = event_by_id.get(event_id)
+        if not isinstance(event, dict):
+            continue
+        event_name = _pascal_case(str(event.get("name", "Event")))
+        entries = _field_entries([field for field in event.get("fields", []) if isinstance(field, dict)], ctx)
+        public_lines.extend(_dict_function_lines(f"def {_snake_case(event_name)}_to_json_dict(value: {event_name}) -> dict[str, object]:", entries))
+        public_lines.extend(_bytes_function_lines(event_name, event_name, model_style))
+
+    nested_lines: List[str] = []
+    emitted: set[Tuple[str, str]] = set()
+    while True:
+        pending = sorted(
+            (kind, item_id) for kind in ("refs", "structs") for item_id in ctx[kind] if (kind, item_id) not in emitted
+        )
+        if not pending:
+            break
+        for kind, item_id in pending:
+            emitted.add((kind, item_id))
+            if kind == "structs":
+                struct = struct_by_id[item_id]
+                struct_name = _pascal_case(str(struct.get("name", "Struct")))
+                entries = _field_entries([field for field in struct.get("fields", []) if isinstance(field, dict)], ctx)
+                nested_lines.extend(_dict_function_lines(f"def _encode_{_snake_case(struct_name)}(value: {struct_name}) -> dict[str, object]:", entries))
+                continue
+            obj = object_by_id[item_id]
+            obj_name = _pascal_case(str(obj.get("name", "Object")))
+            pk_entries = ", ".join(f"{name!r}: {expr}" for name, expr in _field_entries(_object_primary_key_fields(obj), ctx))
+            nested_lines.extend(
+                [
+                    f"def _encode_{_snake_case(obj_name)}_ref(value: object) -> object:",
+                    f"    if isinstance(value, {obj_name}Ref):",
+                    f"        return {{{pk_entries}}}",
+                    f"    if isinstance(value, {obj_name}):",
+                    f"        return {_snake_case(obj_name)}_to_json_dict(value)",
+                    "    return _plain(value)",
+                    "",
+                ]
+            )
+
+    header = [
+        "# Code generated by prophet-cli. DO NOT EDIT.",
+        "from __future__ import annotations",
+        "",
+    ]
+    modules = ["msgspec" if model_style == "msgspec" else "dataclasses"]
+    if csv_export:
+        modules.extend(["csv", "io"])
+    header.extend([*(f"import {module}" for module in sorted(modules)), ""])
+    typing_names = set()
+    if export_by_object_id:
+        typing_names.update({"Callable", "List", "Optional", "Tuple"})
+        if csv_export:
+            typing_names.add("Iterable")
+    if projected_object_ids:
+        typing_names.update({"Callable", "List", "Optional"})
+    if typing_names:
+        header.extend([f"from typing import {', '.join(sorted(typing_names))}", ""])
+    if model_style != "msgspec":
+        header.extend(["from prophet_events_runtime import dumps_json_bytes", ""])
+    header.extend(
+        [
+            "from .domain import *",
+            "from .event_contracts import *",
+            "from .persistence import PagedResult",
+            "",
+        ]
+    )
+    if model_style == "msgspec":
+        header.extend(
+            [
+                "# Per-type response encoders: `<type>_to_json_dict` builds the JSON-ready dict in one pass over",
+                "# the model fields (ref fields holding a full object encode the object), and `<type>_to_json_bytes`",
+                "# encodes the msgspec Structs directly.",
+                "",
+                "_JSON_ENCODER = msgspec.json.Encoder()",
+                "",
+            ]
+        )
+    else:
+        header.extend(
+            [
+                "# Per-type response encoders: `<type>_to_json_dict` builds the JSON-ready dict in one pass over",
+                "# the dataclass fields (ref fields holding a full object encode the object), and `<type>_to_json_bytes`",
+                "# encodes it with dumps_json_bytes (orjson or msgspec when installed, else the stdlib).",
+                "",
+            ]
+        )
+    header.extend(
+        [
+            "def _plain(value: object) -> object:",
+            f"    if {_model_instance_check_expr('value', model_style)} and not isinstance(value, type):",
+            f"        return {_model_asdict_expr('value', model_style)}",
+            "    return value",
+            "",
+        ]
+    )
+    if csv_export:
+        header.extend(_csv_helper_lines(model_style))
+    return "\n".join(header + nested_lines + public_lines).rstrip() + "\n"
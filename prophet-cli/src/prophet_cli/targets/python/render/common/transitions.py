@@ -35,6 +35,7 @@ def render_transition_services(ir: Dict[str, Any], *, async_mode: bool) -> str:
         "from .domain import *",
         "from .event_contracts import *",
         "from .persistence import Repositories",
+        "from .persistence import TransitionRejected",
         "",
     ]
 
@@ -176,7 +177,9 @@ def render_transition_services(ir: Dict[str, Any], *, async_mode: bool) -> str:
             f"    def __init__(self, repository: {object_name}Repository, validator: Optional[{validator_name}] = None):"
         )
         lines.append("        self._repository = repository")
-        lines.append(f"        self._validator = validator if validator is not None else {validator_default_name}()")
+        # The default validator always passes, so without a custom one transitions skip the pre-read
+        # and go straight to the guarded update.
+        lines.append(f"        self._validator = validator if type(validator) is not {validator_default_name} else None")
         lines.append("")
         for method in method_specs:
             method_name = str(method["method_name"])
@@ -195,23 +198,30 @@ def render_transition_services(ir: Dict[str, Any], *, async_mode: bool) -> str:
                 pk_prop = _camel_case(str(pk_field.get("name", "id")))
                 lines.append(f"            {pk_prop}=target.{pk_prop},")
             lines.append("        )")
+            invalid_state_error = (
+                f"RuntimeError(f\"Invalid state transition {object_name}.{transition_name}: expected {from_state} but was {{{{{{state}}}}}}\")"
+            )
+            lines.append("        if self._validator is not None:")
             if async_mode:
-                lines.append("        current = await self._repository.get_by_id(id)")
+                lines.append("            current = await self._repository.get_by_id(id)")
             else:
-                lines.append("        current = self._repository.get_by_id(id)")
-            lines.append("        if current is None:")
+                lines.append("            current = self._repository.get_by_id(id)")
+            lines.append("            if current is None:")
             lines.append(
-                f"            raise RuntimeError(\"{object_name} not found for transition '{transition_name}'\")"
+                f"                raise RuntimeError(\"{object_name} not found for transition '{transition_name}'\")"
             )
             validator_method = f"validate{_pascal_case(method_name)}"
             if async_mode:
-                lines.append(f"        validation = await self._validator.{validator_method}(current)")
+                lines.append(f"            validation = await self._validator.{validator_method}(current)")
             else:
-                lines.append(f"        validation = self._validator.{validator_method}(current)")
-            lines.append("        if not validation.passesValidation:")
+                lines.append(f"            validation = self._validator.{validator_method}(current)")
+            lines.append("            if not validation.passesValidation:")
             lines.append(
-                f"            raise RuntimeError(validation.failureReason or \"Transition validation failed for {object_name}.{transition_name}\")"
+                f"                raise RuntimeError(validation.failureReason or \"Transition validation failed for {object_name}.{transition_name}\")"
             )
+            # The pre-read already shows a wrong state, so fail without attempting the update.
+            lines.append(f"            if current.state != '{from_state}':")
+            lines.append(f"                raise {invalid_state_error.format(state='current.state')}")
             if async_mode:
                 lines.append(
                     f"        transitioned = await self._repository.apply_transition(id, '{from_state}', '{to_state}', '{transition_id}')"
@@ -220,18 +230,13 @@ def render_transition_services(ir: Dict[str, Any], *, async_mode: bool) -> str:
                 lines.append(
                     f"        transitioned = self._repository.apply_transition(id, '{from_state}', '{to_state}', '{transition_id}')"
                 )
-            lines.append("        if transitioned is None:")
-            if async_mode:
-                lines.append("            latest = await self._repository.get_by_id(id)")
-            else:
-                lines.append("            latest = self._repository.get_by_id(id)")
-            lines.append("            if latest is None:")
+            # A rejected update already reports whether the row is missing or in another state.
+            lines.append("        if isinstance(transitioned, TransitionRejected):")
+            lines.append("            if transitioned.missing:")
             lines.append(
                 f"                raise RuntimeError(\"{object_name} not found for transition '{transition_name}'\")"
             )
-            lines.append(
-                f"            raise RuntimeError(f\"Invalid state transition {object_name}.{transition_name}: expected {from_state} but was {{latest.state}}\")"
-            )
+            lines.append(f"            raise {invalid_state_error.format(state='transitioned.current_state')}")
             lines.append("        seed: Dict[str, object] = {}")
             for prop_name in implicit_props:
                 if prop_name == "fromState":
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from ..support import _camel_case
+from ..support import _pascal_case
+from ..support import _snake_case
+from ..support import _sort_dict_entries
+
+
+def _trigger_bindings(ir: Dict[str, Any]) -> List[Tuple[str, str, str, str]]:
+    """(trigger name, envelope event type, action method name, action input class) per trigger."""
+    action_by_id = {item["id"]: item for item in ir.get("actions", []) if isinstance(item, dict) and "id" in item}
+    action_input_by_id = {item["id"]: item for item in ir.get("action_inputs", []) if isinstance(item, dict) and "id" in item}
+    event_by_id = {item["id"]: item for item in ir.get("events", []) if isinstance(item, dict) and "id" in item}
+    bindings: List[Tuple[str, str, str, str]] = []
+    for trigger in _sort_dict_entries([item for item in ir.get("triggers", []) if isinstance(item, dict)]):
+        action = action_by_id.get(str(trigger.get("action_id", "")))
+        event = event_by_id.get(str(trigger.get("event_id", "")))
+        if action is None or event is None:
+            continue
+        input_shape = action_input_by_id.get(str(action.get("input_shape_id", "")), {})
+        bindings.append(
+            (
+                _camel_case(str(trigger.get("name", "trigger"))),
+                _pascal_case(str(event.get("name", "Event"))),
+                _camel_case(str(action.get("name", "action"))),
+                _pascal_case(str(input_shape.get("name", "ActionInput"))),
+            )
+        )
+    return bindings
+
+
+def has_triggers(ir: Dict[str, Any]) -> bool:
+    return bool(_trigger_bindings(ir))
+
+
+def render_trigger_dispatcher(ir: Dict[str, Any], *, async_mode: bool) -> str:
+    bindings = _trigger_bindings(ir)
+    lines: List[str] = [
+        "# Code generated by prophet-cli. DO NOT EDIT.",
+        "from __future__ import annotations",
+        "",
+        "from dataclasses import replace",
+        "from typing import List, Mapping, Optional, Protocol, Tuple",
+        "",
+        "from prophet_events_runtime import EventPublisher",
+        "from prophet_events_runtime import EventWireEnvelope",
+        "from prophet_events_runtime import TriggerBatchError",
+        "from prophet_events_runtime import TriggerBinding",
+        "from prophet_events_runtime import TriggerDispatcher",
+        "from prophet_events_runtime import TriggerPolicy",
+        "",
+        "from .action_handlers import ActionContext",
+        "from .action_service import ActionExecutionService",
+        "from .actions import *",
+        "",
+        "TRIGGER_EVENT_TYPES: dict[str, str] = {",
+    ]
+    for trigger_name, event_type, _, _ in bindings:
+        lines.append(f"    '{trigger_name}': '{event_type}',")
+    lines.extend(
+        [
+            "}",
+            "",
+            "# Builds each triggered action's input from the triggering envelope; returning None skips it.",
+            "class TriggerInputMappers(Protocol):",
+        ]
+    )
+    for trigger_name, _, _, input_name in bindings:
+        lines.append(f"    def {trigger_name}(self, envelope: EventWireEnvelope) -> Optional[{input_name}]: ...")
+        lines.append("")
+
+    lines.extend(
+        [
+            "# Triggered actions publish through the dispatcher, so chains continue in-process and keep the",
+            "# triggering trace id; every envelope is also forwarded to `downstream` (default: context.eventPublisher).",
+            "# A failed envelope is retried on its own; the rest of its batch is not re-run.",
+            "# Use the returned dispatcher as the request ActionContext.eventPublisher to start chains.",
+            "def build_trigger_dispatcher(",
+            "    service: ActionExecutionService,",
+            "    context: ActionContext,",
+            "    inputs: TriggerInputMappers,",
+            "    *,",
+            "    concurrency: int = 4,",
+            "    max_queue_size: int = 10000,",
+            "    policies: Optional[Mapping[str, TriggerPolicy]] = None,",
+            "    downstream: Optional[EventPublisher] = None,",
+            ") -> TriggerDispatcher:",
+            "    configured_policies = dict(policies or {})",
+            "    dispatcher: TriggerDispatcher",
+            "",
+            "    def trigger_context(envelope: EventWireEnvelope) -> ActionContext:",
+            "        return replace(context, eventPublisher=dispatcher, traceId=envelope.trace_id)",
+            "",
+        ]
+    )
+    for trigger_name, _, action_method, _ in bindings:
+        if async_mode:
+            lines.append(f"    async def run_{_snake_case(trigger_name)}(envelopes: List[EventWireEnvelope]) -> None:")
+            call = f"await service.execute_{action_method}(action_input, trigger_context(envelope))"
+        else:
+            lines.append(f"    def run_{_snake_case(trigger_name)}(envelopes: List[EventWireEnvelope]) -> None:")
+            call = f"service.execute_{action_method}(action_input, trigger_context(envelope))"
+        lines.extend(
+            [
+                "        failures: List[Tuple[EventWireEnvelope, BaseException]] = []",
+                "        for envelope in envelopes:",
+                "            try:",
+                f"                action_input = inputs.{trigger_name}(envelope)",
+                "                if action_input is not None:",
+                f"                    {call}",
+                "            except Exception as error:",
+                "                failures.append((envelope, error))",
+                "        if failures:",
+                "            raise TriggerBatchError(failures)",
+                "",
+            ]
+        )
+
+    lines.append("    dispatcher = TriggerDispatcher(")
+    lines.append("        [")
+    for trigger_name, _, _, _ in bindings:
+        lines.extend(
+            [
+                "            TriggerBinding(",
+                f"                name='{trigger_name}',",
+                f"                event_type=TRIGGER_EVENT_TYPES['{trigger_name}'],",
+                f"                invoke=run_{_snake_case(trigger_name)},",
+                f"                policy=configured_policies.get('{trigger_name}', TriggerPolicy()),",
+            ]
+        )
+        if not async_mode:
+            lines.append("                blocking=True,")
+        lines.append("            ),")
+    lines.extend(
+        [
+            "        ],",
+            "        concurrency=concurrency,",
+            "        max_queue_size=max_queue_size,",
+            "        downstream=downstream if downstream is not None else context.eventPublisher,",
+            "    )",
+            "    return dispatcher",
+        ]
+    )
+    return "\n".join(lines).rstrip() + "\n"
@@ -2,72 +2,54 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from ..common.request_decoders import action_input_decoder_name
+from ..common.request_decoders import fields_decoder_name
+from ..common.request_decoders import query_filter_decoder_name
+from ..common.response_encoders import export_encoder_name
+from ..common.response_encoders import page_encoder_name
+from ..common.response_encoders import projected_encoder_name
+from ..common.response_encoders import projected_page_encoder_name
+from ..common.response_encoders import response_encoder_name
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _export_contract
+from ..support import _has_cursor_pagination
+from ..support import _has_export
+from ..support import _has_projection
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
+from ..support import _projection_contract
 from ..support import _sort_dict_entries
+from ..support import _total_count_contract
 
 
 def render_fastapi_routes(ir: Dict[str, Any]) -> str:
     action_input_by_id = {item["id"]: item for item in ir.get("action_inputs", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
+    event_by_id = {item["id"]: item for item in ir.get("events", []) if isinstance(item, dict) and "id" in item}
+    cursor_enabled = _has_cursor_pagination(ir)
+    projection_enabled = _has_projection(ir)
+    persistence_names = [
+        *(["InvalidCursorError"] if cursor_enabled else []),
+        *(["InvalidFieldsError"] if projection_enabled else []),
+        "Repositories",
+    ]
 
     lines: List[str] = [
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "import dataclasses",
-        "import types",
-        "",
-        "from typing import Any, Union, get_args, get_origin, get_type_hints",
-        "",
-        "from fastapi import APIRouter, HTTPException, Query",
+        *(["from typing import Optional", ""] if cursor_enabled or projection_enabled else []),
+        "from fastapi import APIRouter, HTTPException, Query, Response",
+        *(["from fastapi.responses import StreamingResponse"] if _has_export(ir) else []),
         "",
         "from .action_handlers import ActionContext",
         "from .action_service import ActionExecutionService",
         "from .actions import *",
-        "from .persistence import Repositories",
+        f"from .persistence import {', '.join(persistence_names)}",
         "from .query import *",
-        "",
-        "_TYPE_HINT_CACHE: dict[type, dict[str, Any]] = {}",
-        "",
-        "def _coerce_value(expected_type: Any, value: Any) -> Any:",
-        "    if value is None:",
-        "        return None",
-        "    origin = get_origin(expected_type)",
-        "    if origin is list:",
-        "        (item_type,) = get_args(expected_type) or (Any,)",
-        "        if not isinstance(value, list):",
-        "            return value",
-        "        return [_coerce_value(item_type, item) for item in value]",
-        "    if origin is dict:",
-        "        return value",
-        "    if origin in (types.UnionType, Union):",
-        "        args = [item for item in get_args(expected_type) if item is not type(None)]",
-        "        if len(args) == 1:",
-        "            return _coerce_value(args[0], value)",
-        "        for arg in args:",
-        "            try:",
-        "                return _coerce_value(arg, value)",
-        "            except Exception:",
-        "                continue",
-        "        return value",
-        "    if isinstance(expected_type, type) and dataclasses.is_dataclass(expected_type):",
-        "        if isinstance(value, expected_type):",
-        "            return value",
-        "        if not isinstance(value, dict):",
-        "            return value",
-        "        hints = _TYPE_HINT_CACHE.get(expected_type)",
-        "        if hints is None:",
-        "            hints = get_type_hints(expected_type, globalns=globals(), localns=globals())",
-        "            _TYPE_HINT_CACHE[expected_type] = hints",
-        "        kwargs: dict[str, Any] = {}",
-        "        for field in dataclasses.fields(expected_type):",
-        "            if field.name in value:",
-        "                field_type = hints.get(field.name, Any)",
-        "                kwargs[field.name] = _coerce_value(field_type, value[field.name])",
-        "        return expected_type(**kwargs)",
-        "    return value",
+        "from .request_decoders import *",
+        "from .response_encoders import *",
         "",
         "def build_generated_router(service: ActionExecutionService, context: ActionContext, repositories: Repositories) -> APIRouter:",
         "    router = APIRouter()",
@@ -79,11 +61,12 @@ def render_fastapi_routes(ir: Dict[str, Any]) -> str:
         camel = _camel_case(action_name)
         input_shape = action_input_by_id.get(str(action.get("input_shape_id", "")), {})
         input_name = _pascal_case(str(input_shape.get("name", "ActionInput")))
+        output_name = _pascal_case(str(event_by_id.get(str(action.get("output_event_id", "")), {}).get("name", "Event")))
         lines.append(f"    @router.post('/actions/{action_name}')")
         lines.append(f"    async def action_{camel}(payload: dict):")
-        lines.append(f"        input_model = _coerce_value({input_name}, payload or {{}})")
+        lines.append(f"        input_model = {action_input_decoder_name(input_name)}(payload or {{}})")
         lines.append(f"        result = await service.execute_{camel}(input_model, context)")
-        lines.append("        return dataclasses.asdict(result)")
+        lines.append(f"        return Response(content={response_encoder_name(output_name)}(result), media_type='application/json')")
         lines.append("")
 
     for contract in _sort_dict_entries([item for item in ir.get("query_contracts", []) if isinstance(item, dict)]):
@@ -91,41 +74,103 @@ def render_fastapi_routes(ir: Dict[str, Any]) -> str:
         obj = object_by_id.get(object_id, {})
         obj_name = _pascal_case(str(obj.get("name", "Object")))
         repo_name = _camel_case(obj_name)
-        query_filter_name = f"{obj_name}QueryFilter"
         paths = contract.get("paths", {}) if isinstance(contract.get("paths"), dict) else {}
         list_path = str(paths.get("list", f"/{repo_name}s"))
         get_path = str(paths.get("get_by_id", f"/{repo_name}s/{{id}}"))
         typed_path = str(paths.get("typed_query", f"/{repo_name}s/query"))
 
+        has_cursor = bool(_cursor_key_fields(contract, obj))
+        page_param = ", cursor: Optional[str] = Query(default=None)" if has_cursor else ""
+        page_arg = ", cursor" if has_cursor else ""
+        total_contract = _total_count_contract(contract)
+        if total_contract is not None:
+            page_param += f", include_total: bool = Query(default={total_contract['include_by_default']}, alias='includeTotal')"
+            page_arg += ", include_total=include_total"
+        projection = _projection_contract(contract, obj)
+        fields_param = ""
+        fields_arg = ""
+        fields_lines: List[str] = []
+        page_encoder = f"{page_encoder_name(obj_name)}(result)"
+        item_encoder = f"{response_encoder_name(obj_name)}(item)"
+        if projection is not None:
+            fields_param = ", fields: Optional[str] = Query(default=None)"
+            fields_arg = ", fields=projection"
+            fields_lines = [
+                "        try:",
+                f"            projection = {fields_decoder_name(obj_name)}(fields)",
+                "        except InvalidFieldsError:",
+                "            raise HTTPException(status_code=400, detail='invalid_fields')",
+            ]
+            page_encoder = f"{projected_page_encoder_name(obj_name)}(result, projection)"
+            item_encoder = f"{projected_encoder_name(obj_name)}(item, projection)"
+        page_param += fields_param
+        page_arg += fields_arg
+
         lines.append(f"    @router.get('{list_path}')")
-        lines.append(f"    async def list_{repo_name}(page: int = Query(default=0), size: int = Query(default=20)):")
-        lines.append(f"        result = await repositories.{repo_name}.list(page, size)")
-        lines.append("        return dataclasses.asdict(result)")
+        lines.append(f"    async def list_{repo_name}(page: int = Query(default=0), size: int = Query(default=20){page_param}):")
+        lines.extend(fields_lines)
+        if has_cursor:
+            lines.append("        try:")
+            lines.append(f"            result = await repositories.{repo_name}.list(page, size{page_arg})")
+            lines.append("        except InvalidCursorError:")
+            lines.append("            raise HTTPException(status_code=400, detail='invalid_cursor')")
+        else:
+            lines.append(f"        result = await repositories.{repo_name}.list(page, size{page_arg})")
+        lines.append(f"        return Response(content={page_encoder}, media_type='application/json')")
         lines.append("")
 
         pk_fields = _object_primary_key_fields(obj)
         lines.append(f"    @router.get('{get_path}')")
-        lines.append(f"    async def get_{repo_name}(id: str):")
+        lines.append(f"    async def get_{repo_name}(id: str{fields_param}):")
         if len(pk_fields) == 1:
             pk_field = pk_fields[0]
             pk_prop = _camel_case(str(pk_field.get("name", "id")))
-            lines.append(f"        item = await repositories.{repo_name}.get_by_id({obj_name}Ref({pk_prop}=id))")
+            lines.extend(fields_lines)
+            lines.append(f"        item = await repositories.{repo_name}.get_by_id({obj_name}Ref({pk_prop}=id){fields_arg})")
         else:
             lines.append("        raise HTTPException(status_code=501, detail='composite_get_by_id_requires_custom_route')")
             lines.append("")
             continue
         lines.append("        if item is None:")
         lines.append("            raise HTTPException(status_code=404, detail='not_found')")
-        lines.append("        return dataclasses.asdict(item)")
+        lines.append(f"        return Response(content={item_encoder}, media_type='application/json')")
         lines.append("")
 
         lines.append(f"    @router.post('{typed_path}')")
-        lines.append(f"    async def query_{repo_name}(payload: dict, page: int = Query(default=0), size: int = Query(default=20)):")
-        lines.append(f"        filter_model = _coerce_value({query_filter_name}, payload or {{}})")
-        lines.append(f"        result = await repositories.{repo_name}.query(filter_model, page, size)")
-        lines.append("        return dataclasses.asdict(result)")
+        lines.append(f"    async def query_{repo_name}(payload: dict, page: int = Query(default=0), size: int = Query(default=20){page_param}):")
+        lines.extend(fields_lines)
+        lines.append(f"        filter_model = {query_filter_decoder_name(obj_name)}(payload or {{}})")
+        if has_cursor:
+            lines.append("        try:")
+            lines.append(f"            result = await repositories.{repo_name}.query(filter_model, page, size{page_arg})")
+            lines.append("        except InvalidCursorError:")
+            lines.append("            raise HTTPException(status_code=400, detail='invalid_cursor')")
+        else:
+            lines.append(f"        result = await repositories.{repo_name}.query(filter_model, page, size{page_arg})")
+        lines.append(f"        return Response(content={page_encoder}, media_type='application/json')")
         lines.append("")
 
+        export_contract = _export_contract(contract)
+        if export_contract is not None:
+            lines.append(f"    @router.post('{export_contract['path']}')")
+            lines.append(
+                f"    async def export_{repo_name}(payload: dict, export_format: str = Query(default={export_contract['formats'][0]!r}, alias='format')):"
+            )
+            lines.append(f"        encoder = {export_encoder_name(obj_name)}(export_format)")
+            lines.append("        if encoder is None:")
+            lines.append("            raise HTTPException(status_code=400, detail='unsupported_export_format')")
+            lines.append("        media_type, header, encode_chunk = encoder")
+            lines.append(f"        filter_model = {query_filter_decoder_name(obj_name)}(payload or {{}})")
+            lines.append("")
+            lines.append("        async def stream():")
+            lines.append("            if header:")
+            lines.append("                yield header")
+            lines.append(f"            async for chunk in repositories.{repo_name}.export(filter_model):")
+            lines.append("                yield encode_chunk(chunk)")
+            lines.append("")
+            lines.append("        return StreamingResponse(stream(), media_type=media_type)")
+            lines.append("")
+
     lines.append("    return router")
     lines.append("")
     return "\n".join(lines).rstrip() + "\n"
@@ -2,10 +2,26 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from ..common.request_decoders import action_input_decoder_name
+from ..common.request_decoders import fields_decoder_name
+from ..common.request_decoders import query_filter_decoder_name
+from ..common.response_encoders import export_encoder_name
+from ..common.response_encoders import page_encoder_name
+from ..common.response_encoders import projected_encoder_name
+from ..common.response_encoders import projected_page_encoder_name
+from ..common.response_encoders import response_encoder_name
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _export_contract
+from ..support import _has_cursor_pagination
+from ..support import _has_optional_totals
+from ..support import _has_projection
+from ..support import _parse_flag_helper_lines
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
+from ..support import _projection_contract
 from ..support import _sort_dict_entries
+from ..support import _total_count_contract
 
 
 def _flask_path(path: str) -> str:
@@ -15,64 +31,31 @@ def _flask_path(path: str) -> str:
 def render_flask_routes(ir: Dict[str, Any]) -> str:
     action_input_by_id = {item["id"]: item for item in ir.get("action_inputs", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
+    event_by_id = {item["id"]: item for item in ir.get("events", []) if isinstance(item, dict) and "id" in item}
+    persistence_names = [
+        *(["InvalidCursorError"] if _has_cursor_pagination(ir) else []),
+        *(["InvalidFieldsError"] if _has_projection(ir) else []),
+        "Repositories",
+    ]
 
     lines: List[str] = [
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "import dataclasses",
-        "import types",
-        "",
-        "from typing import Any, Union, get_args, get_origin, get_type_hints",
-        "",
-        "from flask import Blueprint, jsonify, request",
+        "from flask import Blueprint, Response, jsonify, request",
         "",
         "from .action_handlers import ActionContext",
         "from .action_service import ActionExecutionService",
         "from .actions import *",
-        "from .persistence import Repositories",
+        f"from .persistence import {', '.join(persistence_names)}",
         "from .query import *",
+        "from .request_decoders import *",
+        "from .response_encoders import *",
         "",
-        "_TYPE_HINT_CACHE: dict[type, dict[str, Any]] = {}",
-        "",
-        "def _coerce_value(expected_type: Any, value: Any) -> Any:",
-        "    if value is None:",
-        "        return None",
-        "    origin = get_origin(expected_type)",
-        "    if origin is list:",
-        "        (item_type,) = get_args(expected_type) or (Any,)",
-        "        if not isinstance(value, list):",
-        "            return value",
-        "        return [_coerce_value(item_type, item) for item in value]",
-        "    if origin is dict:",
-        "        return value",
-        "    if origin in (types.UnionType, Union):",
-        "        args = [item for item in get_args(expected_type) if item is not type(None)]",
-        "        if len(args) == 1:",
-        "            return _coerce_value(args[0], value)",
-        "        for arg in args:",
-        "            try:",
-        "                return _coerce_value(arg, value)",
-        "            except Exception:",
-        "                continue",
-        "        return value",
-        "    if isinstance(expected_type, type) and dataclasses.is_dataclass(expected_type):",
-        "        if isinstance(value, expected_type):",
-        "            return value",
-        "        if not isinstance(value, dict):",
-        "            return value",
-        "        hints = _TYPE_HINT_CACHE.get(expected_type)",
-        "        if hints is None:",
-        "            hints = get_type_hints(expected_type, globalns=globals(), localns=globals())",
-        "            _TYPE_HINT_CACHE[expected_type] = hints",
-        "        kwargs: dict[str, Any] = {}",
-        "        for field in dataclasses.fields(expected_type):",
-        "            if field.name in value:",
-        "                field_type = hints.get(field.name, Any)",
-        "                kwargs[field.name] = _coerce_value(field_type, value[field.name])",
-        "        return expected_type(**kwargs)",
-        "    return value",
-        "",
+    ]
+    if _has_optional_totals(ir):
+        lines.extend(_parse_flag_helper_lines())
+    lines += [
         "def build_generated_blueprint(service: ActionExecutionService, context: ActionContext, repositories: Repositories) -> Blueprint:",
         "    bp = Blueprint('prophet_generated', __name__)",
         "",
@@ -83,12 +66,13 @@ def render_flask_routes(ir: Dict[str, Any]) -> str:
         camel = _camel_case(action_name)
         input_shape = action_input_by_id.get(str(action.get("input_shape_id", "")), {})
         input_name = _pascal_case(str(input_shape.get("name", "ActionInput")))
+        output_name = _pascal_case(str(event_by_id.get(str(action.get("output_event_id", "")), {}).get("name", "Event")))
         lines.append(f"    @bp.post('/actions/{action_name}')")
         lines.append(f"    def action_{camel}():")
         lines.append("        payload = request.get_json(silent=True) or {}")
-        lines.append(f"        input_model = _coerce_value({input_name}, payload)")
+        lines.append(f"        input_model = {action_input_decoder_name(input_name)}(payload)")
         lines.append(f"        result = service.execute_{camel}(input_model, context)")
-        lines.append("        return jsonify(dataclasses.asdict(result))")
+        lines.append(f"        return Response({response_encoder_name(output_name)}(result), mimetype='application/json')")
         lines.append("")
 
     for contract in _sort_dict_entries([item for item in ir.get("query_contracts", []) if isinstance(item, dict)]):
@@ -96,18 +80,48 @@ def render_flask_routes(ir: Dict[str, Any]) -> str:
         obj = object_by_id.get(object_id, {})
         obj_name = _pascal_case(str(obj.get("name", "Object")))
         repo_name = _camel_case(obj_name)
-        query_filter_name = f"{obj_name}QueryFilter"
         paths = contract.get("paths", {}) if isinstance(contract.get("paths"), dict) else {}
         list_path = str(paths.get("list", f"/{repo_name}s"))
         get_path = _flask_path(str(paths.get("get_by_id", f"/{repo_name}s/<id>")))
         typed_path = str(paths.get("typed_query", f"/{repo_name}s/query"))
+        has_cursor = bool(_cursor_key_fields(contract, obj))
+        page_arg = ", cursor" if has_cursor else ""
+        total_contract = _total_count_contract(contract)
+        if total_contract is not None:
+            page_arg += ", include_total=include_total"
+        projection = _projection_contract(contract, obj)
+        fields_arg = ""
+        fields_lines: List[str] = []
+        page_encoder = f"{page_encoder_name(obj_name)}(result)"
+        item_encoder = f"{response_encoder_name(obj_name)}(item)"
+        if projection is not None:
+            fields_arg = ", fields=projection"
+            fields_lines = [
+                "        try:",
+                f"            projection = {fields_decoder_name(obj_name)}(request.args.get({projection['param']!r}))",
+                "        except InvalidFieldsError:",
+                "            return jsonify({'error': 'invalid_fields'}), 400",
+            ]
+            page_encoder = f"{projected_page_encoder_name(obj_name)}(result, projection)"
+            item_encoder = f"{projected_encoder_name(obj_name)}(item, projection)"
+        page_arg += fields_arg
 
         lines.append(f"    @bp.get('{list_path}')")
         lines.append(f"    def list_{repo_name}():")
         lines.append("        page = int(request.args.get('page', 0))")
         lines.append("        size = int(request.args.get('size', 20))")
-        lines.append(f"        result = repositories.{repo_name}.list(page, size)")
-        lines.append("        return jsonify(dataclasses.asdict(result))")
+        lines.extend(fields_lines)
+        if total_contract is not None:
+            lines.append(f"        include_total = _parse_flag(request.args.get('includeTotal'), {total_contract['include_by_default']})")
+        if has_cursor:
+            lines.append("        cursor = request.args.get('cursor')")
+            lines.append("        try:")
+            lines.append(f"            result = repositories.{repo_name}.list(page, size{page_arg})")
+            lines.append("        except InvalidCursorError:")
+            lines.append("            return jsonify({'error': 'invalid_cursor'}), 400")
+        else:
+            lines.append(f"        result = repositories.{repo_name}.list(page, size{page_arg})")
+        lines.append(f"        return Response({page_encoder}, mimetype='application/json')")
         lines.append("")
 
         pk_fields = _object_primary_key_fields(obj)
@@ -116,26 +130,57 @@ def render_flask_routes(ir: Dict[str, Any]) -> str:
         if len(pk_fields) == 1:
             pk_field = pk_fields[0]
             pk_prop = _camel_case(str(pk_field.get("name", "id")))
-            lines.append(f"        item = repositories.{repo_name}.get_by_id({obj_name}Ref({pk_prop}=id))")
+            lines.extend(fields_lines)
+            lines.append(f"        item = repositories.{repo_name}.get_by_id({obj_name}Ref({pk_prop}=id){fields_arg})")
         else:
             lines.append("        return jsonify({'error': 'composite_get_by_id_requires_custom_route'}), 501")
             lines.append("")
             continue
         lines.append("        if item is None:")
         lines.append("            return jsonify({'error': 'not_found'}), 404")
-        lines.append("        return jsonify(dataclasses.asdict(item))")
+        lines.append(f"        return Response({item_encoder}, mimetype='application/json')")
         lines.append("")
 
         lines.append(f"    @bp.post('{typed_path}')")
         lines.append(f"    def query_{repo_name}():")
         lines.append("        page = int(request.args.get('page', 0))")
         lines.append("        size = int(request.args.get('size', 20))")
+        lines.extend(fields_lines)
         lines.append("        payload = request.get_json(silent=True) or {}")
-        lines.append(f"        filter_model = _coerce_value({query_filter_name}, payload)")
-        lines.append(f"        result = repositories.{repo_name}.query(filter_model, page, size)")
-        lines.append("        return jsonify(dataclasses.asdict(result))")
+        lines.append(f"        filter_model = {query_filter_decoder_name(obj_name)}(payload)")
+        if total_contract is not None:
+            lines.append(f"        include_total = _parse_flag(request.args.get('includeTotal'), {total_contract['include_by_default']})")
+        if has_cursor:
+            lines.append("        cursor = request.args.get('cursor')")
+            lines.append("        try:")
+            lines.append(f"            result = repositories.{repo_name}.query(filter_model, page, size{page_arg})")
+            lines.append("        except InvalidCursorError:")
+            lines.append("            return jsonify({'error': 'invalid_cursor'}), 400")
+        else:
+            lines.append(f"        result = repositories.{repo_name}.query(filter_model, page, size{page_arg})")
+        lines.append(f"        return Response({page_encoder}, mimetype='application/json')")
         lines.append("")
 
+        export_contract = _export_contract(contract)
+        if export_contract is not None:
+            lines.append(f"    @bp.post('{export_contract['path']}')")
+            lines.append(f"    def export_{repo_name}():")
+            lines.append(f"        encoder = {export_encoder_name(obj_name)}(request.args.get('format', {export_contract['formats'][0]!r}))")
+            lines.append("        if encoder is None:")
+            lines.append("            return jsonify({'error': 'unsupported_export_format'}), 400")
+            lines.append("        media_type, header, encode_chunk = encoder")
+            lines.append("        payload = request.get_json(silent=True) or {}")
+            lines.append(f"        filter_model = {query_filter_decoder_name(obj_name)}(payload)")
+            lines.append("")
+            lines.append("        def stream():")
+            lines.append("            if header:")
+            lines.append("                yield header")
+            lines.append(f"            for chunk in repositories.{repo_name}.export(filter_model):")
+            lines.append("                yield encode_chunk(chunk)")
+            lines.append("")
+            lines.append("        return Response(stream(), content_type=media_type)")
+            lines.append("")
+
     lines.append("    return bp")
     lines.append("")
     return "\n".join(lines).rstrip() + "\n"
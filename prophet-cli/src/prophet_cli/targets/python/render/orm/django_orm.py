@@ -3,11 +3,28 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _cursor_value_kinds
+from ..support import _export_contract
+from ..support import _has_composite_keys
+from ..support import _has_cursor_pagination
+from ..support import _has_estimated_totals
+from ..support import _has_export
+from ..support import _has_projection
 from ..support import _is_required
+from ..support import _key_tuple_expr
+from ..support import _model_asdict_expr
+from ..support import _model_instance_check_expr
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
+from ..support import _projected_domain_lines
+from ..support import _projection_contract
 from ..support import _py_type_for_descriptor
 from ..support import _sort_dict_entries
+from ..support import _total_count_contract
+from .outbox import _django_outbox_model_lines
+from .outbox import _django_outbox_store_lines
+from .outbox import _outbox_runtime_import_lines
 
 
 def _django_field_for_descriptor(type_desc: Dict[str, Any], type_by_id: Dict[str, Dict[str, Any]], required: bool) -> str:
@@ -34,7 +51,7 @@ def _django_field_for_descriptor(type_desc: Dict[str, Any], type_by_id: Dict[str
     return f"models.CharField(max_length=255, null={nullable}, blank={blank})"
 
 
-def render_django_models(ir: Dict[str, Any]) -> str:
+def render_django_models(ir: Dict[str, Any], *, event_outbox: bool = False) -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
 
     lines: List[str] = [
@@ -114,10 +131,19 @@ def render_django_models(ir: Dict[str, Any]) -> str:
             lines.append(f"        db_table = '{history_table_name}'")
             lines.append("")
 
+    if event_outbox:
+        lines.extend(_django_outbox_model_lines())
+
     return "\n".join(lines).rstrip() + "\n"
 
 
-def render_django_adapters(ir: Dict[str, Any]) -> str:
+def render_django_adapters(
+    ir: Dict[str, Any],
+    *,
+    save_strategy: str = "upsert",
+    event_outbox: bool = False,
+    model_style: str = "dataclass",
+) -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
     struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
@@ -131,23 +157,104 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
-        "import dataclasses",
-        "",
-        "from typing import Optional",
-        "",
-        "from . import django_models as Models",
-        "from . import domain as Domain",
-        "from . import persistence as Persistence",
-        "from . import query as Filters",
-        "",
-        "def _serialize(value):",
-        "    if dataclasses.is_dataclass(value):",
-        "        return dataclasses.asdict(value)",
-        "    if isinstance(value, list):",
-        "        return [_serialize(item) for item in value]",
-        "    return value",
-        "",
     ]
+    if model_style != "msgspec":
+        lines.append("import dataclasses")
+    estimated_totals = _has_estimated_totals(ir)
+    if estimated_totals:
+        lines.append("import json")
+    if model_style == "msgspec":
+        lines.append("import msgspec")
+    lines.append("")
+    if event_outbox:
+        lines.append("from datetime import timedelta")
+    lines.extend([f"from typing import {'Iterator, ' if _has_export(ir) else ''}List, Optional, Union", ""])
+    has_states = any(isinstance(item, dict) and item.get("states") for item in ir.get("objects", []))
+    lines.append("from django.db import connections, router, transaction")
+    if event_outbox:
+        lines.append("from django.db.models import F, Q")
+        lines.append("from django.utils import timezone as django_timezone")
+        lines.extend(_outbox_runtime_import_lines())
+    elif has_states or _has_cursor_pagination(ir) or _has_composite_keys(ir):
+        lines.append("from django.db.models import Q")
+    lines.append("")
+    lines.extend(
+        [
+            "from . import django_models as Models",
+            "from . import domain as Domain",
+            "from . import persistence as Persistence",
+            "from . import query as Filters",
+            "",
+            "_SAVE_MANY_CHUNK_SIZE = 500",
+            "",
+            "def _serialize(value):",
+            f"    if {_model_instance_check_expr('value', model_style)}:",
+            f"        return {_model_asdict_expr('value', model_style)}",
+            "    if isinstance(value, list):",
+            "        return [_serialize(item) for item in value]",
+            "    return value",
+            "",
+        ]
+    )
+    if estimated_totals:
+        lines.extend(
+            [
+                "def _estimated_total(queryset, filtered: bool) -> Optional[int]:",
+                "    connection = connections[queryset.db]",
+                "    if connection.vendor != 'postgresql':",
+                "        return None",
+                "    if filtered:",
+                "        plan = json.loads(queryset.explain(format='json'))",
+                "        estimate = plan[0]['Plan']['Plan Rows'] if plan else None",
+                "    else:",
+                "        with connection.cursor() as cursor:",
+                "            cursor.execute(",
+                "                'SELECT CAST(reltuples AS BIGINT) FROM pg_class WHERE oid = to_regclass(CAST(%s AS TEXT))',",
+                "                [queryset.model._meta.db_table],",
+                "            )",
+                "            row = cursor.fetchone()",
+                "        estimate = row[0] if row else None",
+                "    if estimate is None or estimate < 0:",
+                "        return None",
+                "    return int(estimate)",
+                "",
+            ]
+        )
+    if _has_projection(ir):
+        lines.extend(
+            [
+                "def _projected_queryset(model, fields: Optional[List[str]]):",
+                "    queryset = model.objects.all()",
+                "    return queryset if fields is None else queryset.only(*fields)",
+                "",
+            ]
+        )
+    if has_states:
+        lines.extend(
+            [
+                "def _update_state_returning(model, lookups: List[dict], expected_state: str, next_state: str) -> tuple:",
+                "    alias = router.db_for_write(model)",
+                "    connection = connections[alias]",
+                "    if connection.vendor not in ('postgresql', 'sqlite') or not connection.features.can_return_columns_from_insert:",
+                "        return False, []",
+                "    meta = model._meta",
+                "    quote = connection.ops.quote_name",
+                "    state_column = quote(meta.get_field('state').column)",
+                "    key_conditions = []",
+                "    params = [next_state]",
+                "    for lookup in lookups:",
+                "        key_conditions.append('(' + ' AND '.join(f'{quote(meta.get_field(name).column)} = %s' for name in lookup) + ')')",
+                "        params.extend(lookup.values())",
+                "    params.append(expected_state)",
+                "    returning = ', '.join(quote(field.column) for field in meta.concrete_fields)",
+                "    sql = (",
+                "        f'UPDATE {quote(meta.db_table)} SET {state_column} = %s '",
+                "        f\"WHERE ({' OR '.join(key_conditions)}) AND {state_column} = %s RETURNING {returning}\"",
+                "    )",
+                "    return True, list(model.objects.db_manager(alias).raw(sql, params))",
+                "",
+            ]
+        )
 
     for obj in _sort_dict_entries([item for item in ir.get("objects", []) if isinstance(item, dict)]):
         obj_name = _pascal_case(str(obj.get("name", "Object")))
@@ -163,6 +270,7 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
         lines.append("    }")
         lines.append("")
 
+        domain_start = len(lines)
         lines.append(f"def _{obj_name.lower()}_to_domain(record: Models.{obj_name}Model) -> Domain.{obj_name}:")
         lines.append(f"    return Domain.{obj_name}(")
         for field in fields:
@@ -200,6 +308,13 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
             lines.append("        state=record.state,")
         lines.append("    )")
         lines.append("")
+        contract = query_contract_by_object_id.get(str(obj.get("id", "")), {})
+        projected = _projection_contract(contract, obj) is not None
+        if projected:
+            lines.extend(_projected_domain_lines(obj_name, lines[domain_start + 2 : -2]))
+        to_domain = f"_{obj_name.lower()}_to_projected_domain" if projected else f"_{obj_name.lower()}_to_domain"
+        domain_args = ", fields" if projected else ""
+        all_rows = "_projected_queryset(self._model, fields)" if projected else "self._model.objects.all()"
 
         repo_name = f"{obj_name}DjangoRepository"
         query_filter_name = f"Filters.{obj_name}QueryFilter"
@@ -208,7 +323,6 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
         lines.append("")
 
         lines.append(f"    def _apply_filter(self, queryset, filter: {query_filter_name}):")
-        contract = query_contract_by_object_id.get(str(obj.get("id", "")), {})
         for filter_def in sorted(
             [item for item in contract.get("filters", []) if isinstance(item, dict)],
             key=lambda item: str(item.get("field_name", "")),
@@ -229,47 +343,165 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
         lines.append("        return queryset")
         lines.append("")
 
-        lines.append("    def list(self, page: int, size: int) -> Persistence.PagedResult:")
-        lines.append("        queryset = self._model.objects.all()")
-        lines.append("        total = queryset.count()")
-        lines.append("        rows = list(queryset[page * size : page * size + size])")
-        lines.append(f"        content = [_{obj_name.lower()}_to_domain(row) for row in rows]")
-        lines.append("        total_pages = (total + size - 1) // size if size > 0 else 0")
-        lines.append(
-            "        return Persistence.PagedResult(content=content, page=page, size=size, totalElements=total, totalPages=total_pages)"
-        )
+        cursor_fields = _cursor_key_fields(contract, obj)
+        page_param = ", cursor: Optional[str] = None" if cursor_fields else ""
+        next_cursor_kwarg = ", nextCursor=self._next_cursor(rows, size)" if cursor_fields else ""
+        total_contract = _total_count_contract(contract)
+        if total_contract is not None:
+            page_param += f", include_total: bool = {total_contract['include_by_default']}"
+        fields_param = ", fields: Optional[List[str]] = None" if projected else ""
+        page_param += fields_param
+        if cursor_fields:
+            cursor_props = [_camel_case(str(item.get("name", "field"))) for item in cursor_fields]
+            seek_terms: List[str] = []
+            for idx, prop in enumerate(cursor_props):
+                lookups = [f"{cursor_props[prev]}=values[{prev}]" for prev in range(idx)] + [f"{prop}__gt=values[{idx}]"]
+                seek_terms.append(f"Q({', '.join(lookups)})")
+            lines.append("    def _apply_cursor(self, queryset, cursor: Optional[str]):")
+            lines.append(f"        queryset = queryset.order_by({', '.join(repr(prop) for prop in cursor_props)})")
+            lines.append("        if cursor is None:")
+            lines.append("            return queryset")
+            cursor_kinds = tuple(_cursor_value_kinds(cursor_fields, type_by_id))
+            lines.append(f"        values = Persistence.decode_cursor(cursor, {cursor_kinds!r})")
+            lines.append(f"        return queryset.filter({' | '.join(seek_terms)})")
+            lines.append("")
+            lines.append("    def _next_cursor(self, rows, size: int) -> Optional[str]:")
+            lines.append("        if size <= 0 or len(rows) < size:")
+            lines.append("            return None")
+            lines.append(f"        return Persistence.encode_cursor([{', '.join(f'rows[-1].{prop}' for prop in cursor_props)}])")
+            lines.append("")
+
+        def _page_rows_lines() -> List[str]:
+            if not cursor_fields:
+                return ["        rows = list(queryset[page * size : page * size + size])"]
+            return [
+                "        queryset = self._apply_cursor(queryset, cursor)",
+                "        offset = page * size if cursor is None else 0",
+                "        rows = list(queryset[offset : offset + size])",
+            ]
+
+        def _total_lines(filtered: bool) -> List[str]:
+            if total_contract is None:
+                return ["        total = queryset.count()"]
+            if total_contract["mode"] != "estimated":
+                return ["        total = queryset.count() if include_total else None"]
+            return [
+                "        total = None",
+                "        if include_total:",
+                f"            total = _estimated_total(queryset, filtered={filtered})",
+                "            if total is None:",
+                "                total = queryset.count()",
+            ]
+
+        def _paged_result_lines() -> List[str]:
+            if total_contract is None:
+                return [
+                    "        total_pages = (total + size - 1) // size if size > 0 else 0",
+                    f"        return Persistence.PagedResult(content=content, page=page, size=size, totalElements=total, totalPages=total_pages{next_cursor_kwarg})",
+                ]
+            return [
+                f"        return Persistence.PagedResult(content=content, page=page, size=size, totalElements=total, totalPages=Persistence.total_pages(total, size){next_cursor_kwarg})",
+            ]
+
+        lines.append(f"    def list(self, page: int, size: int{page_param}) -> Persistence.PagedResult:")
+        lines.append(f"        queryset = {all_rows}")
+        lines.extend(_total_lines(filtered=False))
+        lines.extend(_page_rows_lines())
+        lines.append(f"        content = [{to_domain}(row{domain_args}) for row in rows]")
+        lines.extend(_paged_result_lines())
         lines.append("")
 
-        lines.append(f"    def query(self, filter: {query_filter_name}, page: int, size: int) -> Persistence.PagedResult:")
-        lines.append("        queryset = self._apply_filter(self._model.objects.all(), filter)")
-        lines.append("        total = queryset.count()")
-        lines.append("        rows = list(queryset[page * size : page * size + size])")
-        lines.append(f"        content = [_{obj_name.lower()}_to_domain(row) for row in rows]")
-        lines.append("        total_pages = (total + size - 1) // size if size > 0 else 0")
-        lines.append(
-            "        return Persistence.PagedResult(content=content, page=page, size=size, totalElements=total, totalPages=total_pages)"
-        )
+        lines.append(f"    def query(self, filter: {query_filter_name}, page: int, size: int{page_param}) -> Persistence.PagedResult:")
+        lines.append(f"        queryset = self._apply_filter({all_rows}, filter)")
+        lines.extend(_total_lines(filtered=True))
+        lines.extend(_page_rows_lines())
+        lines.append(f"        content = [{to_domain}(row{domain_args}) for row in rows]")
+        lines.extend(_paged_result_lines())
         lines.append("")
 
+        export_contract = _export_contract(contract)
+        if export_contract is not None:
+            lines.append(
+                f"    def export(self, filter: {query_filter_name}, chunk_size: int = {export_contract['chunk_size']}) -> Iterator[List[Domain.{obj_name}]]:"
+            )
+            lines.append("        queryset = self._apply_filter(self._model.objects.all(), filter)")
+            lines.append(f"        chunk: List[Domain.{obj_name}] = []")
+            lines.append("        for row in queryset.iterator(chunk_size=chunk_size):")
+            lines.append(f"            chunk.append(_{obj_name.lower()}_to_domain(row))")
+            lines.append("            if len(chunk) >= chunk_size:")
+            lines.append("                yield chunk")
+            lines.append("                chunk = []")
+            lines.append("        if chunk:")
+            lines.append("            yield chunk")
+            lines.append("")
+
         pk_fields = _object_primary_key_fields(obj)
-        lines.append(f"    def get_by_id(self, id: Domain.{obj_name}Ref) -> Optional[Domain.{obj_name}]:")
+        lines.append(f"    def get_by_id(self, id: Domain.{obj_name}Ref{fields_param}) -> Optional[Domain.{obj_name}]:")
         if pk_fields:
             lines.append("        lookup = {")
             for pk in pk_fields:
                 pk_prop = _camel_case(str(pk.get("name", "id")))
                 lines.append(f"            '{pk_prop}': id.{pk_prop},")
             lines.append("        }")
-            lines.append("        row = self._model.objects.filter(**lookup).first()")
+            lookup_rows = f"{all_rows}.filter(**lookup)" if projected else "self._model.objects.filter(**lookup)"
+            lines.append(f"        row = {lookup_rows}.first()")
             lines.append("        if row is None:")
             lines.append("            return None")
-            lines.append(f"        return _{obj_name.lower()}_to_domain(row)")
+            lines.append(f"        return {to_domain}(row{domain_args})")
         else:
             lines.append("        return None")
         lines.append("")
 
+        pk_props = [_camel_case(str(pk.get("name", "id"))) for pk in pk_fields]
+        lines.append(f"    def get_by_ids(self, ids: List[Domain.{obj_name}Ref]) -> List[Optional[Domain.{obj_name}]]:")
+        if pk_props:
+            lines.append("        if not ids:")
+            lines.append("            return []")
+            if len(pk_props) == 1:
+                lines.append(f"        rows = self._model.objects.filter({pk_props[0]}__in=[id.{pk_props[0]} for id in ids])")
+            else:
+                lookup_items = ", ".join(f"{pk_prop}=id.{pk_prop}" for pk_prop in pk_props)
+                lines.append("        key_condition = Q()")
+                lines.append("        for id in ids:")
+                lines.append(f"            key_condition |= Q({lookup_items})")
+                lines.append("        rows = self._model.objects.filter(key_condition)")
+            lines.append(
+                f"        found = {{{_key_tuple_expr('row', pk_props)}: _{obj_name.lower()}_to_domain(row) for row in rows}}"
+            )
+            lines.append(f"        return [found.get({_key_tuple_expr('id', pk_props)}) for id in ids]")
+        else:
+            lines.append("        return [None for _ in ids]")
+        lines.append("")
+
+        update_fields = [
+            _camel_case(str(field.get("name", "field")))
+            for field in fields
+            if _camel_case(str(field.get("name", "field"))) not in pk_props
+        ]
+        if obj.get("states"):
+            update_fields.append("state")
+        bulk_upsert = bool(pk_props and update_fields)
+        if bulk_upsert:
+            lines.append(f"    def _bulk_upsert(self, records: List[Models.{obj_name}Model]) -> bool:")
+            lines.append("        features = connections[router.db_for_write(self._model)].features")
+            lines.append("        if not features.supports_update_conflicts:")
+            lines.append("            return False")
+            lines.append("        self._model.objects.bulk_create(")
+            lines.append("            records,")
+            lines.append("            batch_size=_SAVE_MANY_CHUNK_SIZE,")
+            lines.append("            update_conflicts=True,")
+            lines.append(f"            unique_fields={pk_props!r} if features.supports_update_conflicts_with_target else None,")
+            lines.append(f"            update_fields={update_fields!r},")
+            lines.append("        )")
+            lines.append("        return True")
+            lines.append("")
+
         lines.append(f"    def save(self, item: Domain.{obj_name}) -> Domain.{obj_name}:")
         lines.append(f"        payload = _{obj_name.lower()}_payload(item)")
         if pk_fields:
+            if bulk_upsert and save_strategy != "merge":
+                lines.append("        if self._bulk_upsert([self._model(**payload)]):")
+                lines.append("            return item")
             lines.append("        lookup = {")
             for pk in pk_fields:
                 pk_prop = _camel_case(str(pk.get("name", "id")))
@@ -281,10 +513,26 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
         lines.append("        return item")
         lines.append("")
 
+        lines.append(f"    def save_many(self, items: List[Domain.{obj_name}]) -> List[Domain.{obj_name}]:")
+        lines.append("        if not items:")
+        lines.append("            return []")
+        lines.append(f"        records = [self._model(**_{obj_name.lower()}_payload(item)) for item in items]")
+        if bulk_upsert:
+            lines.append("        if not self._bulk_upsert(records):")
+            lines.append("            with transaction.atomic(using=router.db_for_write(self._model)):")
+            lines.append("                for item in items:")
+            lines.append("                    self.save(item)")
+        elif pk_props:
+            lines.append("        self._model.objects.bulk_create(records, batch_size=_SAVE_MANY_CHUNK_SIZE, ignore_conflicts=True)")
+        else:
+            lines.append("        self._model.objects.bulk_create(records, batch_size=_SAVE_MANY_CHUNK_SIZE)")
+        lines.append("        return list(items)")
+        lines.append("")
+
         if obj.get("states"):
             history_model_name = f"{obj_name}StateHistoryModel"
             lines.append(
-                f"    def apply_transition(self, id: Domain.{obj_name}Ref, expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> Optional[Domain.{obj_name}]:"
+                f"    def apply_transition(self, id: Domain.{obj_name}Ref, expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> Union[Domain.{obj_name}, Persistence.TransitionRejected]:"
             )
             if pk_fields:
                 lines.append("        lookup = {")
@@ -292,9 +540,16 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
                     pk_prop = _camel_case(str(pk.get("name", "id")))
                     lines.append(f"            '{pk_prop}': id.{pk_prop},")
                 lines.append("        }")
-                lines.append("        updated = self._model.objects.filter(**lookup, state=expected_state).update(state=next_state)")
-                lines.append("        if int(updated or 0) < 1:")
-                lines.append("            return None")
+                lines.append("        returned, records = _update_state_returning(self._model, [lookup], expected_state, next_state)")
+                lines.append("        if returned:")
+                lines.append("            applied = bool(records)")
+                lines.append("        else:")
+                lines.append("            updated = self._model.objects.filter(**lookup, state=expected_state).update(state=next_state)")
+                lines.append("            applied = int(updated or 0) > 0")
+                lines.append("        if not applied:")
+                # Only the rejected path probes, and only for the state column.
+                lines.append("            current_state = self._model.objects.filter(**lookup).values_list('state', flat=True).first()")
+                lines.append("            return Persistence.TransitionRejected(current_state=current_state)")
                 lines.append("        history_payload = {")
                 for pk in pk_fields:
                     pk_prop = _camel_case(str(pk.get("name", "id")))
@@ -304,12 +559,54 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
                 lines.append("            'toState': next_state,")
                 lines.append("        }")
                 lines.append(f"        Models.{history_model_name}.objects.create(**history_payload)")
+                lines.append("        if records:")
+                lines.append(f"            return _{obj_name.lower()}_to_domain(records[0])")
                 lines.append("        row = self._model.objects.filter(**lookup).first()")
                 lines.append("        if row is None:")
-                lines.append("            return None")
+                lines.append("            return Persistence.TransitionRejected()")
                 lines.append(f"        return _{obj_name.lower()}_to_domain(row)")
             else:
-                lines.append("        return None")
+                lines.append("        return Persistence.TransitionRejected()")
+            lines.append("")
+
+            lines.append(
+                f"    def apply_transition_many(self, ids: List[Domain.{obj_name}Ref], expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> List[Domain.{obj_name}]:"
+            )
+            if pk_props:
+                lookup_items = ", ".join(f"'{pk_prop}': id.{pk_prop}" for pk_prop in pk_props)
+                lines.append("        if not ids:")
+                lines.append("            return []")
+                lines.append(f"        lookups = [{{{lookup_items}}} for id in ids]")
+                lines.append("        returned, records = _update_state_returning(self._model, lookups, expected_state, next_state)")
+                lines.append("        if not returned:")
+                lines.append("            key_condition = Q()")
+                lines.append("            for lookup in lookups:")
+                lines.append("                key_condition |= Q(**lookup)")
+                lines.append("            with transaction.atomic(using=router.db_for_write(self._model)):")
+                lines.append(
+                    "                records = list(self._model.objects.select_for_update().filter(key_condition, state=expected_state))"
+                )
+                lines.append("                if records:")
+                lines.append(
+                    "                    self._model.objects.filter(pk__in=[record.pk for record in records], state=expected_state).update(state=next_state)"
+                )
+                lines.append("            for record in records:")
+                lines.append("                record.state = next_state")
+                lines.append(f"        Models.{history_model_name}.objects.bulk_create(")
+                lines.append("            [")
+                lines.append(f"                Models.{history_model_name}(")
+                for pk_prop in pk_props:
+                    lines.append(f"                    {pk_prop}=record.{pk_prop},")
+                lines.append("                    transitionId=transition_id,")
+                lines.append("                    fromState=expected_state,")
+                lines.append("                    toState=next_state,")
+                lines.append("                )")
+                lines.append("                for record in records")
+                lines.append("            ]")
+                lines.append("        )")
+                lines.append(f"        return [_{obj_name.lower()}_to_domain(record) for record in records]")
+            else:
+                lines.append("        return []")
             lines.append("")
 
     lines.append("class DjangoRepositories:")
@@ -320,4 +617,7 @@ def render_django_adapters(ir: Dict[str, Any]) -> str:
         lines.append(f"        self.{prop} = {obj_name}DjangoRepository()")
     lines.append("")
 
+    if event_outbox:
+        lines.extend(_django_outbox_store_lines())
+
     return "\n".join(lines).rstrip() + "\n"
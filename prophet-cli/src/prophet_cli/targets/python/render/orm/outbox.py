@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from typing import List
+
+OUTBOX_TABLE = "prophet_event_outbox"
+OUTBOX_PENDING_INDEX = "idx_prophet_outbox_pending"
+SKIP_LOCKED_DIALECTS = ("mysql", "oracle", "postgresql")
+
+
+def _sqlalchemy_outbox_model_lines() -> List[str]:
+    return [
+        "class EventOutboxModel(Base):",
+        f"    __tablename__ = '{OUTBOX_TABLE}'",
+        f"    __table_args__ = (Index('{OUTBOX_PENDING_INDEX}', 'published_at', 'created_at'),)",
+        "    eventId: Mapped[str] = mapped_column('event_id', String, primary_key=True)",
+        "    eventType: Mapped[str] = mapped_column('event_type', String, nullable=False)",
+        "    traceId: Mapped[str] = mapped_column('trace_id', String, nullable=False)",
+        "    envelope: Mapped[str] = mapped_column('envelope', Text, nullable=False)",
+        "    attempts: Mapped[int] = mapped_column('attempts', Integer, nullable=False, default=0)",
+        "    lastError: Mapped[Optional[str]] = mapped_column('last_error', Text, nullable=True)",
+        "    createdAt: Mapped[object] = mapped_column('created_at', DateTime, nullable=False, server_default=func.now())",
+        "    publishedAt: Mapped[Optional[object]] = mapped_column('published_at', DateTime, nullable=True)",
+        "    lockedUntil: Mapped[Optional[object]] = mapped_column('locked_until', DateTime, nullable=True)",
+        "    parkedAt: Mapped[Optional[object]] = mapped_column('parked_at', DateTime, nullable=True)",
+        "",
+    ]
+
+
+def _sqlmodel_outbox_model_lines() -> List[str]:
+    return [
+        "class EventOutboxModel(SQLModel, table=True):",
+        f"    __tablename__ = '{OUTBOX_TABLE}'",
+        f"    __table_args__ = (Index('{OUTBOX_PENDING_INDEX}', 'published_at', 'created_at'),)",
+        "    eventId: str = Field(sa_column=Column('event_id', String, primary_key=True))",
+        "    eventType: str = Field(sa_column=Column('event_type', String, nullable=False))",
+        "    traceId: str = Field(sa_column=Column('trace_id', String, nullable=False))",
+        "    envelope: str = Field(sa_column=Column('envelope', Text, nullable=False))",
+        "    attempts: int = Field(default=0, sa_column=Column('attempts', Integer, nullable=False, default=0))",
+        "    lastError: Optional[str] = Field(default=None, sa_column=Column('last_error', Text, nullable=True))",
+        "    createdAt: datetime = Field(",
+        "        default_factory=lambda: datetime.now(timezone.utc),",
+        "        sa_column=Column('created_at', DateTime, nullable=False),",
+        "    )",
+        "    publishedAt: Optional[datetime] = Field(default=None, sa_column=Column('published_at', DateTime, nullable=True))",
+        "    lockedUntil: Optional[datetime] = Field(default=None, sa_column=Column('locked_until', DateTime, nullable=True))",
+        "    parkedAt: Optional[datetime] = Field(default=None, sa_column=Column('parked_at', DateTime, nullable=True))",
+        "",
+    ]
+
+
+def _django_outbox_model_lines() -> List[str]:
+    return [
+        "class EventOutboxModel(models.Model):",
+        "    eventId = models.CharField(max_length=255, primary_key=True, db_column='event_id')",
+        "    eventType = models.CharField(max_length=255, db_column='event_type')",
+        "    traceId = models.CharField(max_length=255, db_column='trace_id')",
+        "    envelope = models.TextField(db_column='envelope')",
+        "    attempts = models.IntegerField(default=0, db_column='attempts')",
+        "    lastError = models.TextField(null=True, blank=True, db_column='last_error')",
+        "    createdAt = models.DateTimeField(db_column='created_at')",
+        "    publishedAt = models.DateTimeField(null=True, blank=True, db_column='published_at')",
+        "    lockedUntil = models.DateTimeField(null=True, blank=True, db_column='locked_until')",
+        "    parkedAt = models.DateTimeField(null=True, blank=True, db_column='parked_at')",
+        "",
+        "    class Meta:",
+        "        app_label = 'generated'",
+        f"        db_table = '{OUTBOX_TABLE}'",
+        f"        indexes = [models.Index(fields=['publishedAt', 'createdAt'], name='{OUTBOX_PENDING_INDEX}')]",
+        "",
+    ]
+
+
+def _sqlalchemy_outbox_stdlib_import_lines(*, async_mode: bool) -> List[str]:
+    manager = "asynccontextmanager" if async_mode else "contextmanager"
+    return [
+        f"from contextlib import {manager}",
+        "from contextvars import ContextVar",
+        "from datetime import datetime, timedelta, timezone",
+    ]
+
+
+def _sqlalchemy_outbox_typing_names(*, async_mode: bool) -> List[str]:
+    return ["Any", "AsyncIterator" if async_mode else "Iterator"]
+
+
+def _outbox_runtime_import_lines() -> List[str]:
+    return [
+        "from prophet_events_runtime import EventWireEnvelope",
+        "from prophet_events_runtime import OutboxRecord",
+        "from prophet_events_runtime import envelope_from_json",
+        "from prophet_events_runtime import envelope_to_json",
+    ]
+
+
+def _sqlalchemy_outbox_store_lines(*, prefix: str, session_type: str, async_mode: bool, native_async: bool) -> List[str]:
+    """Session factory that joins one connection-level transaction, plus the outbox store over it."""
+    method_def = "async def" if native_async else "def"
+    session_open = "async with" if native_async else "with"
+    call = "await " if native_async else ""
+    connection_type = "AsyncConnection" if native_async else "Connection"
+    engine_type = "AsyncEngine" if native_async else "Engine"
+    transaction_def = "async def" if async_mode else "def"
+    manager = "asynccontextmanager" if async_mode else "contextmanager"
+    iterator = "AsyncIterator" if async_mode else "Iterator"
+    return [
+        "_OUTBOX = Models.EventOutboxModel.__table__",
+        f"_ACTIVE_CONNECTION: ContextVar[Optional[{connection_type}]] = ContextVar('prophet_active_connection', default=None)",
+        "",
+        f"class {prefix}TransactionalSessionFactory:",
+        f"    def __init__(self, engine: {engine_type}, **session_kwargs: Any):",
+        "        self._engine = engine",
+        "        self._session_kwargs = {'expire_on_commit': False, **session_kwargs}",
+        "        self.kw = {'bind': engine}",
+        "",
+        f"    def __call__(self) -> {session_type}:",
+        "        connection = _ACTIVE_CONNECTION.get()",
+        f"        return {session_type}(bind=connection if connection is not None else self._engine, **self._session_kwargs)",
+        "",
+        f"    @{manager}",
+        f"    {transaction_def} transaction(self) -> {iterator}[None]:",
+        "        if _ACTIVE_CONNECTION.get() is not None:",
+        "            yield",
+        "            return",
+        f"        {session_open} self._engine.begin() as connection:",
+        "            token = _ACTIVE_CONNECTION.set(connection)",
+        "            try:",
+        "                yield",
+        "            finally:",
+        "                _ACTIVE_CONNECTION.reset(token)",
+        "",
+        f"_SKIP_LOCKED_DIALECTS = frozenset({SKIP_LOCKED_DIALECTS!r})",
+        "",
+        f"class {prefix}EventOutboxStore:",
+        f"    def __init__(self, session_factory: Callable[[], {session_type}], *, claim_lease_seconds: float = 60.0):",
+        "        self._session_factory = session_factory",
+        "        self._claim_lease = timedelta(seconds=claim_lease_seconds)",
+        "",
+        f"    {method_def} append(self, envelopes: List[EventWireEnvelope]) -> None:",
+        "        created_at = datetime.now(timezone.utc)",
+        "        rows = [",
+        "            {",
+        "                'event_id': envelope.event_id,",
+        "                'event_type': envelope.event_type,",
+        "                'trace_id': envelope.trace_id,",
+        "                'envelope': envelope_to_json(envelope),",
+        "                'attempts': 0,",
+        "                'created_at': created_at + timedelta(microseconds=index),",
+        "            }",
+        "            for index, envelope in enumerate(envelopes)",
+        "        ]",
+        "        if not rows:",
+        "            return",
+        f"        {session_open} self._session_factory() as session:",
+        f"            {call}session.execute(insert(_OUTBOX), rows)",
+        f"            {call}session.commit()",
+        "",
+        f"    {method_def} claim_batch(self, limit: int) -> List[OutboxRecord]:",
+        "        # Claimed rows are leased so concurrent relays skip them; SKIP LOCKED keeps",
+        "        # relays from blocking on each other's claims where the dialect supports it.",
+        "        now = datetime.now(timezone.utc)",
+        "        stmt = (",
+        "            select(_OUTBOX.c.event_id, _OUTBOX.c.envelope, _OUTBOX.c.attempts)",
+        "            .where(",
+        "                _OUTBOX.c.published_at.is_(None),",
+        "                _OUTBOX.c.parked_at.is_(None),",
+        "                or_(_OUTBOX.c.locked_until.is_(None), _OUTBOX.c.locked_until < now),",
+        "            )",
+        "            .order_by(_OUTBOX.c.created_at, _OUTBOX.c.event_id)",
+        "            .limit(limit)",
+        "        )",
+        f"        {session_open} self._session_factory() as session:",
+        "            if session.get_bind().dialect.name in _SKIP_LOCKED_DIALECTS:",
+        "                stmt = stmt.with_for_update(skip_locked=True)",
+        f"            rows = ({call}session.execute(stmt)).all()",
+        "            if rows:",
+        f"                {call}session.execute(",
+        "                    update(_OUTBOX)",
+        "                    .where(_OUTBOX.c.event_id.in_([row.event_id for row in rows]))",
+        "                    .values(locked_until=now + self._claim_lease)",
+        "                )",
+        f"            {call}session.commit()",
+        "        return [",
+        "            OutboxRecord(event_id=row.event_id, envelope=envelope_from_json(row.envelope), attempts=row.attempts)",
+        "            for row in rows",
+        "        ]",
+        "",
+        f"    {method_def} mark_published(self, event_ids: List[str]) -> None:",
+        f"        {session_open} self._session_factory() as session:",
+        f"            {call}session.execute(",
+        "                update(_OUTBOX).where(_OUTBOX.c.event_id.in_(event_ids)).values(published_at=datetime.now(timezone.utc))",
+        "            )",
+        f"            {call}session.commit()",
+        "",
+        f"    {method_def} mark_failed(self, event_ids: List[str], error: str) -> None:",
+        f"        {session_open} self._session_factory() as session:",
+        f"            {call}session.execute(",
+        "                update(_OUTBOX)",
+        "                .where(_OUTBOX.c.event_id.in_(event_ids))",
+        "                .values(attempts=_OUTBOX.c.attempts + 1, last_error=error, locked_until=None)",
+        "            )",
+        f"            {call}session.commit()",
+        "",
+        f"    {method_def} mark_parked(self, event_ids: List[str], error: str) -> None:",
+        f"        {session_open} self._session_factory() as session:",
+        f"            {call}session.execute(",
+        "                update(_OUTBOX)",
+        "                .where(_OUTBOX.c.event_id.in_(event_ids))",
+        "                .values(",
+        "                    attempts=_OUTBOX.c.attempts + 1,",
+        "                    last_error=error,",
+        "                    locked_until=None,",
+        "                    parked_at=datetime.now(timezone.utc),",
+        "                )",
+        "            )",
+        f"            {call}session.commit()",
+        "",
+    ]
+
+
+def _django_outbox_store_lines() -> List[str]:
+    return [
+        "class DjangoEventOutboxStore:",
+        "    def __init__(self, *, claim_lease_seconds: float = 60.0):",
+        "        self._claim_lease = timedelta(seconds=claim_lease_seconds)",
+        "",
+        "    def transaction(self):",
+        "        return transaction.atomic(using=router.db_for_write(Models.EventOutboxModel))",
+        "",
+        "    def append(self, envelopes: List[EventWireEnvelope]) -> None:",
+        "        created_at = django_timezone.now()",
+        "        Models.EventOutboxModel.objects.bulk_create(",
+        "            [",
+        "                Models.EventOutboxModel(",
+        "                    eventId=envelope.event_id,",
+        "                    eventType=envelope.event_type,",
+        "                    traceId=envelope.trace_id,",
+        "                    envelope=envelope_to_json(envelope),",
+        "                    attempts=0,",
+        "                    createdAt=created_at + timedelta(microseconds=index),",
+        "                )",
+        "                for index, envelope in enumerate(envelopes)",
+        "            ]",
+        "        )",
+        "",
+        "    def claim_batch(self, limit: int) -> List[OutboxRecord]:",
+        "        now = django_timezone.now()",
+        "        using = router.db_for_write(Models.EventOutboxModel)",
+        "        with transaction.atomic(using=using):",
+        "            pending = (",
+        "                Models.EventOutboxModel.objects.using(using)",
+        "                .filter(publishedAt__isnull=True, parkedAt__isnull=True)",
+        "                .filter(Q(lockedUntil__isnull=True) | Q(lockedUntil__lt=now))",
+        "                .order_by('createdAt', 'eventId')",
+        "            )",
+        "            if connections[using].features.has_select_for_update_skip_locked:",
+        "                pending = pending.select_for_update(skip_locked=True)",
+        "            records = list(pending[:limit])",
+        "            if records:",
+        "                Models.EventOutboxModel.objects.using(using).filter(",
+        "                    eventId__in=[record.eventId for record in records]",
+        "                ).update(lockedUntil=now + self._claim_lease)",
+        "        return [",
+        "            OutboxRecord(event_id=record.eventId, envelope=envelope_from_json(record.envelope), attempts=record.attempts)",
+        "            for record in records",
+        "        ]",
+        "",
+        "    def mark_published(self, event_ids: List[str]) -> None:",
+        "        Models.EventOutboxModel.objects.filter(eventId__in=event_ids).update(publishedAt=django_timezone.now())",
+        "",
+        "    def mark_failed(self, event_ids: List[str], error: str) -> None:",
+        "        Models.EventOutboxModel.objects.filter(eventId__in=event_ids).update(",
+        "            attempts=F('attempts') + 1, lastError=error, lockedUntil=None",
+        "        )",
+        "",
+        "    def mark_parked(self, event_ids: List[str], error: str) -> None:",
+        "        Models.EventOutboxModel.objects.filter(eventId__in=event_ids).update(",
+        "            attempts=F('attempts') + 1, lastError=error, lockedUntil=None, parkedAt=django_timezone.now()",
+        "        )",
+        "",
+    ]
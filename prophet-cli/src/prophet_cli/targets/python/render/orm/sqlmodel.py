@@ -2,12 +2,42 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from ..support import _adapter_typing_line
+from ..support import _bulk_upsert_helper_lines
 from ..support import _camel_case
+from ..support import _cursor_key_fields
+from ..support import _cursor_value_kinds
+from ..support import _estimated_total_helper_lines
+from ..support import _export_contract
+from ..support import _export_delegate_lines
+from ..support import _has_cursor_pagination
+from ..support import _has_estimated_totals
+from ..support import _has_export
+from ..support import _has_projection
 from ..support import _is_required
+from ..support import _iterate_blocking_helper_lines
+from ..support import _key_condition_expr
+from ..support import _key_tuple_expr
+from ..support import _model_asdict_expr
+from ..support import _model_instance_check_expr
 from ..support import _object_primary_key_fields
 from ..support import _pascal_case
+from ..support import _projected_domain_lines
+from ..support import _projected_select_helper_lines
+from ..support import _projection_contract
 from ..support import _py_type_for_descriptor
+from ..support import _repository_offload_helper_lines
+from ..support import _seek_condition_expr
 from ..support import _sort_dict_entries
+from ..support import _sqlalchemy_dialect_insert_lines
+from ..support import _sqlalchemy_import_line
+from ..support import _sync_delegate_expr
+from ..support import _total_count_contract
+from .outbox import _outbox_runtime_import_lines
+from .outbox import _sqlalchemy_outbox_stdlib_import_lines
+from .outbox import _sqlalchemy_outbox_store_lines
+from .outbox import _sqlalchemy_outbox_typing_names
+from .outbox import _sqlmodel_outbox_model_lines
 
 
 def _python_type_for_sqlmodel(type_desc: Dict[str, Any], type_by_id: Dict[str, Dict[str, Any]]) -> str:
@@ -37,7 +67,7 @@ def _is_json_descriptor(type_desc: Dict[str, Any]) -> bool:
     return str(type_desc.get("kind", "")) in {"list", "struct", "object_ref"}
 
 
-def render_sqlmodel_models(ir: Dict[str, Any]) -> str:
+def render_sqlmodel_models(ir: Dict[str, Any], *, event_outbox: bool = False) -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
 
     lines: List[str] = [
@@ -47,7 +77,9 @@ def render_sqlmodel_models(ir: Dict[str, Any]) -> str:
         "from datetime import datetime, timezone",
         "from typing import Optional",
         "",
-        "from sqlalchemy import JSON, Column, Integer, String",
+        "from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text"
+        if event_outbox
+        else "from sqlalchemy import JSON, Column, Integer, String",
         "from sqlmodel import Field, SQLModel",
         "",
     ]
@@ -124,10 +156,21 @@ def render_sqlmodel_models(ir: Dict[str, Any]) -> str:
             )
             lines.append("")
 
+    if event_outbox:
+        lines.extend(_sqlmodel_outbox_model_lines())
+
     return "\n".join(lines).rstrip() + "\n"
 
 
-def render_sqlmodel_adapters(ir: Dict[str, Any], *, async_mode: bool) -> str:
+def render_sqlmodel_adapters(
+    ir: Dict[str, Any],
+    *,
+    async_mode: bool,
+    repository_io: str = "inline",
+    save_strategy: str = "upsert",
+    event_outbox: bool = False,
+    model_style: str = "dataclass",
+) -> str:
     type_by_id = {item["id"]: item for item in ir.get("types", []) if isinstance(item, dict) and "id" in item}
     object_by_id = {item["id"]: item for item in ir.get("objects", []) if isinstance(item, dict) and "id" in item}
     struct_by_id = {item["id"]: item for item in ir.get("structs", []) if isinstance(item, dict) and "id" in item}
@@ -137,31 +180,77 @@ def render_sqlmodel_adapters(ir: Dict[str, Any], *, async_mode: bool) -> str:
         if isinstance(item, dict)
     }
 
+    offload = async_mode and repository_io == "thread_offload"
+    estimated_totals = _has_estimated_totals(ir)
+    export = _has_export(ir)
+    projection = _has_projection(ir)
+
     lines: List[str] = [
         "# Code generated by prophet-cli. DO NOT EDIT.",
         "from __future__ import annotations",
         "",
         "import asyncio",
-        "import dataclasses",
-        "",
-        "from typing import Callable, Optional",
-        "",
-        "from sqlalchemy import func, update",
-        "from sqlmodel import Session, select",
-        "",
-        "from . import domain as Domain",
-        "from . import persistence as Persistence",
-        "from . import query as Filters",
-        "from . import sqlmodel_models as Models",
-        "",
-        "def _serialize(value):",
-        "    if dataclasses.is_dataclass(value):",
-        "        return dataclasses.asdict(value)",
-        "    if isinstance(value, list):",
-        "        return [_serialize(item) for item in value]",
-        "    return value",
-        "",
     ]
+    if offload:
+        lines.append("import contextvars")
+    if model_style != "msgspec":
+        lines.append("import dataclasses")
+    if estimated_totals:
+        lines.append("import json")
+    if model_style == "msgspec":
+        lines.append("import msgspec")
+    if offload:
+        lines.append("import threading")
+    lines.append("")
+    if offload:
+        lines.append("from concurrent.futures import Executor, ThreadPoolExecutor")
+    if event_outbox:
+        lines.extend(_sqlalchemy_outbox_stdlib_import_lines(async_mode=async_mode))
+    typing_extra = _sqlalchemy_outbox_typing_names(async_mode=async_mode) if event_outbox else []
+    lines.extend(
+        [
+            _adapter_typing_line(async_mode=async_mode, native_async=False, export=export, extra=typing_extra),
+            "",
+        ]
+    )
+    if event_outbox:
+        lines.extend(_outbox_runtime_import_lines())
+    lines.append(_sqlalchemy_import_line(ir, ["func", "insert", "inspect", "or_", "update"] if event_outbox else ["func", "inspect", "update"]))
+    lines.extend(_sqlalchemy_dialect_insert_lines())
+    if event_outbox:
+        lines.append("from sqlalchemy.engine import Connection, Engine")
+    if estimated_totals:
+        lines.append("from sqlalchemy.ext.compiler import compiles")
+        lines.append("from sqlalchemy.sql.expression import ClauseElement, Executable")
+    if projection:
+        lines.append("from sqlalchemy.orm import load_only")
+    lines.extend(
+        [
+            "from sqlmodel import Session, select",
+            "",
+            "from . import domain as Domain",
+            "from . import persistence as Persistence",
+            "from . import query as Filters",
+            "from . import sqlmodel_models as Models",
+            "",
+            "def _serialize(value):",
+            f"    if {_model_instance_check_expr('value', model_style)}:",
+            f"        return {_model_asdict_expr('value', model_style)}",
+            "    if isinstance(value, list):",
+            "        return [_serialize(item) for item in value]",
+            "    return value",
+            "",
+        ]
+    )
+    lines.extend(_bulk_upsert_helper_lines())
+    if projection:
+        lines.extend(_projected_select_helper_lines())
+    if offload:
+        lines.extend(_repository_offload_helper_lines())
+        if export:
+            lines.extend(_iterate_blocking_helper_lines())
+    if estimated_totals:
+        lines.extend(_estimated_total_helper_lines())
 
     for obj in _sort_dict_entries([item for item in ir.get("objects", []) if isinstance(item, dict)]):
         obj_name = _pascal_case(str(obj.get("name", "Object")))
@@ -177,6 +266,7 @@ def render_sqlmodel_adapters(ir: Dict[str, Any], *, async_mode: bool) -> str:
         lines.append("    )")
         lines.append("")
 
+        domain_start = len(lines)
         lines.append(f"def _{obj_name.lower()}_to_domain(record: Models.{obj_name}Model) -> Domain.{obj_name}:")
         lines.append(f"    return Domain.{obj_name}(")
         for field in fields:
@@ -214,16 +304,26 @@ def render_sqlmodel_adapters(ir: Dict[str, Any], *, async_mode: bool) -> str:
             lines.append("        state=record.state,")
         lines.append("    )")
         lines.append("")
+        contract = query_contract_by_object_id.get(str(obj.get("id", "")), {})
+        projected = _projection_contract(contract, obj) is not None
+        if projected:
+            lines.extend(_projected_domain_lines(obj_name, lines[domain_start + 2 : -2]))
+        to_domain = f"_{obj_name.lower()}_to_projected_domain" if projected else f"_{obj_name.lower()}_to_domain"
+        domain_args = ", fields" if projected else ""
 
         repo_name = f"{obj_name}SqlModelRepository"
         query_filter_name = f"Filters.{obj_name}QueryFilter"
         lines.append(f"class {repo_name}:")
-        lines.append("    def __init__(self, session_factory: Callable[[], Session]):")
-        lines.append("        self._session_factory = session_factory")
+        if offload:
+            lines.append("    def __init__(self, session_factory: Callable[[], Session], executor: Optional[Executor] = None):")
+            lines.append("        self._session_factory = session_factory")
+            lines.append("        self._executor = executor")
+        else:
+            lines.append("    def __init__(self, session_factory: Callable[[], Session]):")
+            lines.append("        self._session_factory = session_factory")
         lines.append("")
 
         lines.append(f"    def _apply_filter(self, stmt, filter: {query_filter_name}):")
-        contract = query_contract_by_object_id.get(str(obj.get("id", "")), {})
         for filter_def in sorted(
             [item for item in contract.get("filters", []) if isinstance(item, dict)],
             key=lambda item: str(item.get("field_name", "")),
@@ -247,38 +347,108 @@ def render_sqlmodel_adapters(ir: Dict[str, Any], *, async_mode: bool) -> str:
         lines.append("        return stmt")
         lines.append("")
 
-        lines.append("    def _list_sync(self, page: int, size: int) -> Persistence.PagedResult:")
+        cursor_fields = _cursor_key_fields(contract, obj)
+        page_param = ", cursor: Optional[str] = None" if cursor_fields else ""
+        page_arg = ", cursor" if cursor_fields else ""
+        next_cursor_kwarg = ", nextCursor=self._next_cursor(rows, size)" if cursor_fields else ""
+        total_contract = _total_count_contract(contract)
+        if total_contract is not None:
+            page_param += f", include_total: bool = {total_contract['include_by_default']}"
+            page_arg += ", include_total"
+        fields_param = ", fields: Optional[List[str]] = None" if projected else ""
+        page_param += fields_param
+        page_arg += domain_args
+        select_expr = f"_projected_select(Models.{obj_name}Model, fields)" if projected else f"select(Models.{obj_name}Model)"
+        if cursor_fields:
+            cursor_columns = [f"Models.{obj_name}Model.{_camel_case(str(item.get('name', 'field')))}" for item in cursor_fields]
+            lines.append("    def _apply_cursor(self, stmt, cursor: Optional[str]):")
+            lines.append(f"        stmt = stmt.order_by({', '.join(cursor_columns)})")
+            lines.append("        if cursor is None:")
+            lines.append("            return stmt")
+            cursor_kinds = tuple(_cursor_value_kinds(cursor_fields, type_by_id))
+            lines.append(f"        values = Persistence.decode_cursor(cursor, {cursor_kinds!r})")
+            lines.append(f"        return stmt.where({_seek_condition_expr(cursor_columns)})")
+            lines.append("")
+            lines.append("    def _next_cursor(self, rows, size: int) -> Optional[str]:")
+            lines.append("        if size <= 0 or len(rows) < size:")
+            lines.append("            return None")
+            cursor_values = ", ".join(f"rows[-1].{_camel_case(str(item.get('name', 'field')))}" for item in cursor_fields)
+            lines.append(f"        return Persistence.encode_cursor([{cursor_values}])")
+            lines.append("")
+
+        def _page_rows_lines() -> List[str]:
+            if not cursor_fields:
+                return ["            rows = list(session.exec(stmt.offset(page * size).limit(size)))"]
+            return [
+                "            stmt = self._apply_cursor(stmt, cursor)",
+                "            if cursor is None:",
+                "                stmt = stmt.offset(page * size)",
+                "            rows = list(session.exec(stmt.limit(size)))",
+            ]
+
+        def _total_lines(count_name: str, estimate_stmt: str) -> List[str]:
+            exact_expr = f"int(session.exec({count_name}).one() or 0)"
+            if total_contract["mode"] != "estimated":
+                return [f"            total = {exact_expr} if include_total else None"]
+            return [
+                "            total = None",
+                "            if include_total:",
+                f"                total = _estimated_total(session, Models.{obj_name}Model, {estimate_stmt})",
+                "                if total is None:",
+                f"                    total = {exact_expr}",
+            ]
+
+        def _paged_result_lines() -> List[str]:
+            if total_contract is None:
+                return [
+                    "            total_pages = (total + size - 1) // size if size > 0 else 0",
+                    f"            return Persistence.PagedResult(content=content, page=page, size=size, totalElements=total, totalPages=total_pages{next_cursor_kwarg})",
+                ]
+            return [
+                f"            return Persistence.PagedResult(content=content, page=page, size=size, totalElements=total, totalPages=Persistence.total_pages(total, size){next_cursor_kwarg})",
+            ]
+
+        lines.append(f"    def _list_sync(self, page: int, size: int{page_param}) -> Persistence.PagedResult:")
         lines.append("        with self._session_factory() as session:")
-        lines.append(f"            stmt = select(Models.{obj_name}Model)")
+        lines.append(f"            stmt = {select_expr}")
         lines.append(f"            total_stmt = select(func.count()).select_from(Models.{obj_name}Model)")
-        lines.append("            total = int(session.exec(total_stmt).one() or 0)")
-        lines.append("            rows = list(session.exec(stmt.offset(page * size).limit(size)))")
-        lines.append(f"            content = [_{obj_name.lower()}_to_domain(row) for row in rows]")
-        lines.append("            total_pages = (total + size - 1) // size if size > 0 else 0")
-        lines.append(
-            "            return Persistence.PagedResult(content=content, page=page, size=size, totalElements=total, totalPages=total_pages)"
-        )
+        if total_contract is None:
+            lines.append("            total = int(session.exec(total_stmt).one() or 0)")
+        else:
+            lines.extend(_total_lines("total_stmt", "None"))
+        lines.extend(_page_rows_lines())
+        lines.append(f"            content = [{to_domain}(row{domain_args}) for row in rows]")
+        lines.extend(_paged_result_lines())
         lines.append("")
 
-        lines.append(f"    def _query_sync(self, filter: {query_filter_name}, page: int, size: int) -> Persistence.PagedResult:")
+        lines.append(f"    def _query_sync(self, filter: {query_filter_name}, page: int, size: int{page_param}) -> Persistence.PagedResult:")
         lines.append("        with self._session_factory() as session:")
-        lines.append(f"            base_stmt = select(Models.{obj_name}Model)")
+        lines.append(f"            base_stmt = {select_expr}")
         lines.append("            stmt = self._apply_filter(base_stmt, filter)")
-        lines.append("            rows = list(session.exec(stmt.offset(page * size).limit(size)))")
+        lines.extend(_page_rows_lines())
         lines.append(f"            count_stmt = self._apply_filter(select(func.count()).select_from(Models.{obj_name}Model), filter)")
-        lines.append("            total = int(session.exec(count_stmt).one() or 0)")
-        lines.append(f"            content = [_{obj_name.lower()}_to_domain(row) for row in rows]")
-        lines.append("            total_pages = (total + size - 1) // size if size > 0 else 0")
-        lines.append(
-            "            return Persistence.PagedResult(content=content, page=page, size=size, totalElements=total, totalPages=total_pages)"
-        )
+        if total_contract is None:
+            lines.append("            total = int(session.exec(count_stmt).one() or 0)")
+        else:
+            lines.extend(_total_lines("count_stmt", "self._apply_filter(base_stmt, filter)"))
+        lines.append(f"            content = [{to_domain}(row{domain_args}) for row in rows]")
+        lines.extend(_paged_result_lines())
         lines.append("")
 
+        export_contract = _export_contract(contract)
+        if export_contract is not None:
+            lines.append(f"    def _export_sync(self, filter: {query_filter_name}, chunk_size: int) -> Iterator[List[Domain.{obj_name}]]:")
+            lines.append("        with self._session_factory() as session:")
+            lines.append(f"            stmt = self._apply_filter(select(Models.{obj_name}Model), filter).execution_options(yield_per=chunk_size)")
+            lines.append("            for rows in session.exec(stmt).partitions():")
+            lines.append(f"                yield [_{obj_name.lower()}_to_domain(row) for row in rows]")
+            lines.append("")
+
         pk_fields = _object_primary_key_fields(obj)
-        lines.append(f"    def _get_by_id_sync(self, id: Domain.{obj_name}Ref) -> Optional[Domain.{obj_name}]:")
+        lines.append(f"    def _get_by_id_sync(self, id: Domain.{obj_name}Ref{fields_param}) -> Optional[Domain.{obj_name}]:")
         lines.append("        with self._session_factory() as session:")
         if pk_fields:
-            lines.append(f"            stmt = select(Models.{obj_name}Model)")
+            lines.append(f"            stmt = {select_expr}")
             for pk in pk_fields:
                 pk_prop = _camel_case(str(pk.get("name", "id")))
                 lines.append(f"            stmt = stmt.where(Models.{obj_name}Model.{pk_prop} == id.{pk_prop})")
@@ -287,21 +457,61 @@ def render_sqlmodel_adapters(ir: Dict[str, Any], *, async_mode: bool) -> str:
             lines.append("            record = None")
         lines.append("            if record is None:")
         lines.append("                return None")
-        lines.append(f"            return _{obj_name.lower()}_to_domain(record)")
+        lines.append(f"            return {to_domain}(record{domain_args})")
+        lines.append("")
+
+        pk_props = [_camel_case(str(pk.get("name", "id"))) for pk in pk_fields]
+        lines.append(f"    def _get_by_ids_sync(self, ids: List[Domain.{obj_name}Ref]) -> List[Optional[Domain.{obj_name}]]:")
+        if pk_props:
+            model_ref = f"Models.{obj_name}Model"
+            lines.append("        if not ids:")
+            lines.append("            return []")
+            lines.append("        with self._session_factory() as session:")
+            lines.append(f"            stmt = select({model_ref}).where({_key_condition_expr(model_ref, pk_props)})")
+            lines.append("            records = session.exec(stmt).all()")
+            lines.append(
+                f"            found = {{{_key_tuple_expr('record', pk_props)}: _{obj_name.lower()}_to_domain(record) for record in records}}"
+            )
+            lines.append(f"            return [found.get({_key_tuple_expr('id', pk_props)}) for id in ids]")
+        else:
+            lines.append("        return [None for _ in ids]")
         lines.append("")
 
         lines.append(f"    def _save_sync(self, item: Domain.{obj_name}) -> Domain.{obj_name}:")
         lines.append("        with self._session_factory() as session:")
         lines.append(f"            model = _{obj_name.lower()}_to_model(item)")
-        lines.append("            session.merge(model)")
+        if save_strategy == "merge":
+            lines.append("            session.merge(model)")
+        else:
+            lines.append(f"            stmt = _upsert_statement(session, Models.{obj_name}Model)")
+            lines.append("            if stmt is None:")
+            lines.append("                session.merge(model)")
+            lines.append("            else:")
+            lines.append("                session.exec(stmt, params=_column_values(model))")
         lines.append("            session.commit()")
         lines.append("        return item")
         lines.append("")
 
+        lines.append(f"    def _save_many_sync(self, items: List[Domain.{obj_name}]) -> List[Domain.{obj_name}]:")
+        lines.append("        if not items:")
+        lines.append("            return []")
+        lines.append("        with self._session_factory() as session:")
+        lines.append(f"            stmt = _upsert_statement(session, Models.{obj_name}Model)")
+        lines.append("            if stmt is None:")
+        lines.append("                for item in items:")
+        lines.append(f"                    session.merge(_{obj_name.lower()}_to_model(item))")
+        lines.append("            else:")
+        lines.append("                for start in range(0, len(items), _SAVE_MANY_CHUNK_SIZE):")
+        lines.append("                    chunk = items[start : start + _SAVE_MANY_CHUNK_SIZE]")
+        lines.append(f"                    session.exec(stmt, params=[_column_values(_{obj_name.lower()}_to_model(item)) for item in chunk])")
+        lines.append("            session.commit()")
+        lines.append("        return list(items)")
+        lines.append("")
+
         if obj.get("states"):
             history_model_name = f"{obj_name}StateHistoryModel"
             lines.append(
-                f"    def _apply_transition_sync(self, id: Domain.{obj_name}Ref, expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> Optional[Domain.{obj_name}]:"
+                f"    def _apply_transition_sync(self, id: Domain.{obj_name}Ref, expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> Union[Domain.{obj_name}, Persistence.TransitionRejected]:"
             )
             lines.append("        with self._session_factory() as session:")
             lines.append(f"            stmt = update(Models.{obj_name}Model).where(Models.{obj_name}Model.state == expected_state)")
@@ -309,9 +519,22 @@ def render_sqlmodel_adapters(ir: Dict[str, Any], *, async_mode: bool) -> str:
                 pk_prop = _camel_case(str(pk.get("name", "id")))
                 lines.append(f"            stmt = stmt.where(Models.{obj_name}Model.{pk_prop} == id.{pk_prop})")
             lines.append("            stmt = stmt.values(state=next_state)")
-            lines.append("            result = session.exec(stmt)")
-            lines.append("            if int(getattr(result, 'rowcount', 0) or 0) < 1:")
-            lines.append("                return None")
+            lines.append("            transitioned = None")
+            lines.append("            if session.get_bind().dialect.update_returning:")
+            lines.append(f"                record = session.scalars(stmt.returning(Models.{obj_name}Model)).first()")
+            lines.append("                if record is not None:")
+            lines.append(f"                    transitioned = _{obj_name.lower()}_to_domain(record)")
+            lines.append("                applied = record is not None")
+            lines.append("            else:")
+            lines.append("                result = session.exec(stmt)")
+            lines.append("                applied = int(getattr(result, 'rowcount', 0) or 0) > 0")
+            lines.append("            if not applied:")
+            # Only the rejected path probes, and only for the state column, inside the update's transaction.
+            lines.append(f"                probe = select(Models.{obj_name}Model.state)")
+            for pk in _object_primary_key_fields(obj):
+                pk_prop = _camel_case(str(pk.get("name", "id")))
+                lines.append(f"                probe = probe.where(Models.{obj_name}Model.{pk_prop} == id.{pk_prop})")
+            lines.append("                return Persistence.TransitionRejected(current_state=session.exec(probe.limit(1)).first())")
             lines.append(f"            history = Models.{history_model_name}(")
             for pk in _object_primary_key_fields(obj):
                 pk_prop = _camel_case(str(pk.get("name", "id")))
@@ -322,60 +545,139 @@ def render_sqlmodel_adapters(ir: Dict[str, Any], *, async_mode: bool) -> str:
             lines.append("            )")
             lines.append("            session.add(history)")
             lines.append("            session.commit()")
+            lines.append("            if transitioned is not None:")
+            lines.append("                return transitioned")
             lines.append(f"            refreshed_stmt = select(Models.{obj_name}Model)")
             for pk in _object_primary_key_fields(obj):
                 pk_prop = _camel_case(str(pk.get("name", "id")))
                 lines.append(f"            refreshed_stmt = refreshed_stmt.where(Models.{obj_name}Model.{pk_prop} == id.{pk_prop})")
             lines.append("            refreshed = session.exec(refreshed_stmt.limit(1)).first()")
             lines.append("            if refreshed is None:")
-            lines.append("                return None")
+            lines.append("                return Persistence.TransitionRejected()")
             lines.append(f"            return _{obj_name.lower()}_to_domain(refreshed)")
             lines.append("")
 
+            lines.append(
+                f"    def _apply_transition_many_sync(self, ids: List[Domain.{obj_name}Ref], expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> List[Domain.{obj_name}]:"
+            )
+            pk_props = [_camel_case(str(pk.get("name", "id"))) for pk in _object_primary_key_fields(obj)]
+            if not pk_props:
+                lines.append("        return []")
+                lines.append("")
+            else:
+                model_ref = f"Models.{obj_name}Model"
+                lines.append("        if not ids:")
+                lines.append("            return []")
+                lines.append("        with self._session_factory() as session:")
+                lines.append(f"            key_condition = {_key_condition_expr(model_ref, pk_props)}")
+                lines.append("            if session.get_bind().dialect.update_returning:")
+                lines.append(
+                    f"                stmt = update({model_ref}).where(key_condition, {model_ref}.state == expected_state).values(state=next_state)"
+                )
+                lines.append(f"                records = session.scalars(stmt.returning({model_ref})).all()")
+                lines.append("            else:")
+                lines.append(
+                    f"                stmt = select({model_ref}).where(key_condition, {model_ref}.state == expected_state).with_for_update()"
+                )
+                lines.append("                records = session.exec(stmt).all()")
+                lines.append("                for record in records:")
+                lines.append("                    record.state = next_state")
+                lines.append("                session.flush()")
+                lines.append(f"            transitioned = [_{obj_name.lower()}_to_domain(record) for record in records]")
+                lines.append("            history = [")
+                lines.append(f"                Models.{history_model_name}(")
+                for pk_prop in pk_props:
+                    lines.append(f"                    {pk_prop}=record.{pk_prop},")
+                lines.append("                    transitionId=transition_id,")
+                lines.append("                    fromState=expected_state,")
+                lines.append("                    toState=next_state,")
+                lines.append("                )")
+                lines.append("                for record in records")
+                lines.append("            ]")
+                lines.append("            session.bulk_save_objects(history)")
+                lines.append("            session.commit()")
+                lines.append("        return transitioned")
+                lines.append("")
+
         if async_mode:
-            lines.append("    async def list(self, page: int, size: int) -> Persistence.PagedResult:")
-            lines.append("        return self._list_sync(page, size)")
+            lines.append(f"    async def list(self, page: int, size: int{page_param}) -> Persistence.PagedResult:")
+            lines.append(f"        return {_sync_delegate_expr('list', f'page, size{page_arg}', offload=offload)}")
+            lines.append("")
+            lines.append(f"    async def query(self, filter: {query_filter_name}, page: int, size: int{page_param}) -> Persistence.PagedResult:")
+            lines.append(f"        return {_sync_delegate_expr('query', f'filter, page, size{page_arg}', offload=offload)}")
             lines.append("")
-            lines.append(f"    async def query(self, filter: {query_filter_name}, page: int, size: int) -> Persistence.PagedResult:")
-            lines.append("        return self._query_sync(filter, page, size)")
+            lines.append(f"    async def get_by_id(self, id: Domain.{obj_name}Ref{fields_param}) -> Optional[Domain.{obj_name}]:")
+            lines.append(f"        return {_sync_delegate_expr('get_by_id', f'id{domain_args}', offload=offload)}")
             lines.append("")
-            lines.append(f"    async def get_by_id(self, id: Domain.{obj_name}Ref) -> Optional[Domain.{obj_name}]:")
-            lines.append("        return self._get_by_id_sync(id)")
+            lines.append(f"    async def get_by_ids(self, ids: List[Domain.{obj_name}Ref]) -> List[Optional[Domain.{obj_name}]]:")
+            lines.append(f"        return {_sync_delegate_expr('get_by_ids', 'ids', offload=offload)}")
             lines.append("")
             lines.append(f"    async def save(self, item: Domain.{obj_name}) -> Domain.{obj_name}:")
-            lines.append("        return self._save_sync(item)")
+            lines.append(f"        return {_sync_delegate_expr('save', 'item', offload=offload)}")
+            lines.append("")
+            lines.append(f"    async def save_many(self, items: List[Domain.{obj_name}]) -> List[Domain.{obj_name}]:")
+            lines.append(f"        return {_sync_delegate_expr('save_many', 'items', offload=offload)}")
             if obj.get("states"):
                 lines.append("")
                 lines.append(
-                    f"    async def apply_transition(self, id: Domain.{obj_name}Ref, expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> Optional[Domain.{obj_name}]:"
+                    f"    async def apply_transition(self, id: Domain.{obj_name}Ref, expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> Union[Domain.{obj_name}, Persistence.TransitionRejected]:"
                 )
-                lines.append("        return self._apply_transition_sync(id, expected_state, next_state, transition_id)")
+                lines.append(f"        return {_sync_delegate_expr('apply_transition', 'id, expected_state, next_state, transition_id', offload=offload)}")
+                lines.append("")
+                lines.append(
+                    f"    async def apply_transition_many(self, ids: List[Domain.{obj_name}Ref], expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> List[Domain.{obj_name}]:"
+                )
+                lines.append(f"        return {_sync_delegate_expr('apply_transition_many', 'ids, expected_state, next_state, transition_id', offload=offload)}")
         else:
-            lines.append("    def list(self, page: int, size: int) -> Persistence.PagedResult:")
-            lines.append("        return self._list_sync(page, size)")
+            lines.append(f"    def list(self, page: int, size: int{page_param}) -> Persistence.PagedResult:")
+            lines.append(f"        return self._list_sync(page, size{page_arg})")
+            lines.append("")
+            lines.append(f"    def query(self, filter: {query_filter_name}, page: int, size: int{page_param}) -> Persistence.PagedResult:")
+            lines.append(f"        return self._query_sync(filter, page, size{page_arg})")
             lines.append("")
-            lines.append(f"    def query(self, filter: {query_filter_name}, page: int, size: int) -> Persistence.PagedResult:")
-            lines.append("        return self._query_sync(filter, page, size)")
+            lines.append(f"    def get_by_id(self, id: Domain.{obj_name}Ref{fields_param}) -> Optional[Domain.{obj_name}]:")
+            lines.append(f"        return self._get_by_id_sync(id{domain_args})")
             lines.append("")
-            lines.append(f"    def get_by_id(self, id: Domain.{obj_name}Ref) -> Optional[Domain.{obj_name}]:")
-            lines.append("        return self._get_by_id_sync(id)")
+            lines.append(f"    def get_by_ids(self, ids: List[Domain.{obj_name}Ref]) -> List[Optional[Domain.{obj_name}]]:")
+            lines.append("        return self._get_by_ids_sync(ids)")
             lines.append("")
             lines.append(f"    def save(self, item: Domain.{obj_name}) -> Domain.{obj_name}:")
             lines.append("        return self._save_sync(item)")
+            lines.append("")
+            lines.append(f"    def save_many(self, items: List[Domain.{obj_name}]) -> List[Domain.{obj_name}]:")
+            lines.append("        return self._save_many_sync(items)")
             if obj.get("states"):
                 lines.append("")
                 lines.append(
-                    f"    def apply_transition(self, id: Domain.{obj_name}Ref, expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> Optional[Domain.{obj_name}]:"
+                    f"    def apply_transition(self, id: Domain.{obj_name}Ref, expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> Union[Domain.{obj_name}, Persistence.TransitionRejected]:"
                 )
                 lines.append("        return self._apply_transition_sync(id, expected_state, next_state, transition_id)")
+                lines.append("")
+                lines.append(
+                    f"    def apply_transition_many(self, ids: List[Domain.{obj_name}Ref], expected_state: Domain.{obj_name}State, next_state: Domain.{obj_name}State, transition_id: str) -> List[Domain.{obj_name}]:"
+                )
+                lines.append("        return self._apply_transition_many_sync(ids, expected_state, next_state, transition_id)")
+        if export_contract is not None:
+            lines.append("")
+            lines.extend(
+                _export_delegate_lines(obj_name, query_filter_name, export_contract["chunk_size"], async_mode=async_mode, offload=offload)
+            )
         lines.append("")
 
     lines.append("class SqlModelRepositories:")
-    lines.append("    def __init__(self, session_factory: Callable[[], Session]):")
+    if offload:
+        lines.append("    def __init__(self, session_factory: Callable[[], Session], executor: Optional[Executor] = None):")
+        lines.append("        executor = executor if executor is not None else _default_executor(session_factory)")
+    else:
+        lines.append("    def __init__(self, session_factory: Callable[[], Session]):")
+    repository_args = "session_factory, executor" if offload else "session_factory"
     for obj in _sort_dict_entries([item for item in ir.get("objects", []) if isinstance(item, dict)]):
         obj_name = _pascal_case(str(obj.get("name", "Object")))
         prop = _camel_case(obj_name)
-        lines.append(f"        self.{prop} = {obj_name}SqlModelRepository(session_factory)")
+        lines.append(f"        self.{prop} = {obj_name}SqlModelRepository({repository_args})")
     lines.append("")
 
+    if event_outbox:
+        lines.extend(_sqlalchemy_outbox_store_lines(prefix="SqlModel", session_type="Session", async_mode=async_mode, native_async=False))
+
     return "\n".join(lines).rstrip() + "\n"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
 
 def _pascal_case(value: str) -> str:
@@ -148,3 +148,353 @@ def _py_id_expr_for_field(field: Dict[str, Any], param_name: str = "id") -> str:
 
 def _sort_dict_entries(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return sorted(items, key=lambda item: str(item.get("id", "")))
+
+
+def _repository_offload_helper_lines() -> List[str]:
+    return [
+        "# One executor per process, sized from the first engine pool seen, so constructing Repositories",
+        "# per request or per test never starts new threads. Pass `executor` to size or own it explicitly.",
+        "_SHARED_EXECUTOR: Optional[ThreadPoolExecutor] = None",
+        "_SHARED_EXECUTOR_LOCK = threading.Lock()",
+        "",
+        "def _default_executor(session_factory) -> Optional[Executor]:",
+        "    global _SHARED_EXECUTOR",
+        "    bind = getattr(session_factory, 'kw', {}).get('bind')",
+        "    pool = getattr(bind, 'pool', None)",
+        "    pool_size = getattr(pool, 'size', None)",
+        "    if not callable(pool_size):",
+        "        return None",
+        "    with _SHARED_EXECUTOR_LOCK:",
+        "        if _SHARED_EXECUTOR is None:",
+        "            _SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=max(int(pool_size()), 1), thread_name_prefix='prophet-repository')",
+        "        return _SHARED_EXECUTOR",
+        "",
+        "async def _run_blocking(executor: Optional[Executor], fn, *args):",
+        "    if executor is None:",
+        "        return await asyncio.to_thread(fn, *args)",
+        "    context = contextvars.copy_context()",
+        "    return await asyncio.get_running_loop().run_in_executor(executor, context.run, fn, *args)",
+        "",
+    ]
+
+
+def _adapter_typing_line(*, async_mode: bool, native_async: bool, export: bool, extra: Sequence[str] = ()) -> str:
+    names = {"Callable", "List", "Optional", "Union", *extra}
+    if export and async_mode:
+        names.add("AsyncIterator")
+    if export and not native_async:
+        names.add("Iterator")
+    return f"from typing import {', '.join(sorted(names))}"
+
+
+def _iterate_blocking_helper_lines() -> List[str]:
+    return [
+        "async def _iterate_blocking(executor: Optional[Executor], iterator: Iterator):",
+        "    try:",
+        "        while True:",
+        "            chunk = await _run_blocking(executor, next, iterator, None)",
+        "            if chunk is None:",
+        "                return",
+        "            yield chunk",
+        "    finally:",
+        "        await _run_blocking(executor, iterator.close)",
+        "",
+    ]
+
+
+def _export_delegate_lines(obj_name: str, query_filter_name: str, chunk_size: int, *, async_mode: bool, offload: bool) -> List[str]:
+    params = f"self, filter: {query_filter_name}, chunk_size: int = {chunk_size}"
+    if not async_mode:
+        return [
+            f"    def export({params}) -> Iterator[List[Domain.{obj_name}]]:",
+            "        return self._export_sync(filter, chunk_size)",
+        ]
+    if offload:
+        return [
+            f"    def export({params}) -> AsyncIterator[List[Domain.{obj_name}]]:",
+            "        return _iterate_blocking(self._executor, self._export_sync(filter, chunk_size))",
+        ]
+    return [
+        f"    async def export({params}) -> AsyncIterator[List[Domain.{obj_name}]]:",
+        "        for chunk in self._export_sync(filter, chunk_size):",
+        "            yield chunk",
+    ]
+
+
+def _sync_delegate_expr(method: str, args: str, *, offload: bool) -> str:
+    if offload:
+        call_args = f", {args}" if args else ""
+        return f"await _run_blocking(self._executor, self._{method}_sync{call_args})"
+    return f"self._{method}_sync({args})"
+
+
+def _cursor_key_fields(contract: Dict[str, Any], obj: Dict[str, Any]) -> List[Dict[str, Any]]:
+    pageable = contract.get("pageable", {}) if isinstance(contract.get("pageable"), dict) else {}
+    cursor = pageable.get("cursor", {}) if isinstance(pageable.get("cursor"), dict) else {}
+    by_id = _field_index(list(obj.get("fields", [])))
+    return [by_id[fid] for fid in cursor.get("key_field_ids", []) if fid in by_id]
+
+
+def _cursor_value_kinds(fields: List[Dict[str, Any]], type_by_id: Dict[str, Dict[str, Any]]) -> List[str]:
+    kinds: List[str] = []
+    for field in fields:
+        type_desc = field.get("type", {}) if isinstance(field.get("type"), dict) else {}
+        if type_desc.get("kind") == "base":
+            base = str(type_desc.get("name", "string"))
+        elif type_desc.get("kind") == "custom":
+            base = _resolve_custom_base(type_by_id, type_desc)
+        else:
+            base = "string"
+        if base == "boolean":
+            kinds.append("bool")
+        elif base in {"int", "long", "short", "byte"}:
+            kinds.append("int")
+        elif base in {"double", "float", "decimal"}:
+            kinds.append("float")
+        else:
+            kinds.append("str")
+    return kinds
+
+
+def _has_cursor_pagination(ir: Dict[str, Any]) -> bool:
+    for contract in ir.get("query_contracts", []):
+        if isinstance(contract, dict) and isinstance(contract.get("pageable", {}).get("cursor"), dict):
+            return True
+    return False
+
+
+def _total_count_contract(contract: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    pageable = contract.get("pageable", {}) if isinstance(contract.get("pageable"), dict) else {}
+    total = pageable.get("total")
+    if not isinstance(total, dict) or total.get("mode") not in {"exact", "estimated"}:
+        return None
+    return {"mode": str(total["mode"]), "include_by_default": bool(total.get("include_by_default", True))}
+
+
+def _has_optional_totals(ir: Dict[str, Any]) -> bool:
+    return any(
+        _total_count_contract(contract) is not None
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+    )
+
+
+def _has_estimated_totals(ir: Dict[str, Any]) -> bool:
+    return any(
+        (_total_count_contract(contract) or {}).get("mode") == "estimated"
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+    )
+
+
+def _export_contract(contract: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    export = contract.get("export")
+    paths = contract.get("paths", {}) if isinstance(contract.get("paths"), dict) else {}
+    if not isinstance(export, dict) or not export.get("formats") or not paths.get("export"):
+        return None
+    return {
+        "path": str(paths["export"]),
+        "formats": [str(item) for item in export["formats"]],
+        "chunk_size": int(export.get("chunk_size", 1000)),
+    }
+
+
+def _has_export(ir: Dict[str, Any]) -> bool:
+    return any(
+        _export_contract(contract) is not None
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+    )
+
+
+def _projection_contract(contract: Dict[str, Any], obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    projection = contract.get("projection")
+    if not isinstance(projection, dict) or not projection.get("fields"):
+        return None
+    by_id = _field_index(list(obj.get("fields", [])))
+    return {
+        "param": str(projection.get("param", "fields")),
+        "fields": [_camel_case(str(item.get("field_name", ""))) for item in projection["fields"] if isinstance(item, dict)],
+        "key_fields": [
+            _camel_case(str(by_id[field_id].get("name", "")))
+            for field_id in projection.get("always_field_ids", [])
+            if field_id in by_id
+        ],
+    }
+
+
+def _has_projection(ir: Dict[str, Any]) -> bool:
+    return any(
+        isinstance(contract.get("projection"), dict) and bool(contract["projection"].get("fields"))
+        for contract in ir.get("query_contracts", [])
+        if isinstance(contract, dict)
+    )
+
+
+def _projected_domain_lines(obj_name: str, argument_lines: List[str]) -> List[str]:
+    # Rewrites the `prop=expr,` arguments of `_<obj>_to_domain` so unselected fields stay None
+    # instead of touching columns the projected query never loaded.
+    lines = [
+        f"def _{obj_name.lower()}_to_projected_domain(record: Models.{obj_name}Model, fields: Optional[List[str]]) -> Domain.{obj_name}:",
+        "    if fields is None:",
+        f"        return _{obj_name.lower()}_to_domain(record)",
+        "    selected = set(fields)",
+        f"    return Domain.{obj_name}(",
+    ]
+    for line in argument_lines:
+        prop, expr = line.strip().rstrip(",").split("=", 1)
+        if expr != f"record.{prop}":
+            expr = f"({expr})"
+        lines.append(f"        {prop}={expr} if {prop!r} in selected else None,")
+    lines.extend(["    )", ""])
+    return lines
+
+
+def _projected_select_helper_lines() -> List[str]:
+    return [
+        "def _projected_select(model, fields: Optional[List[str]]):",
+        "    stmt = select(model)",
+        "    if fields is not None:",
+        "        stmt = stmt.options(load_only(*[getattr(model, name) for name in fields], raiseload=True))",
+        "    return stmt",
+        "",
+    ]
+
+
+def _sqlalchemy_import_line(ir: Dict[str, Any], names: List[str]) -> str:
+    imported = set(names)
+    if _has_cursor_pagination(ir) or _has_composite_keys(ir):
+        imported.update({"and_", "or_"})
+    if _has_estimated_totals(ir):
+        imported.add("text")
+    return f"from sqlalchemy import {', '.join(sorted(imported))}"
+
+
+def _has_composite_keys(ir: Dict[str, Any]) -> bool:
+    return any(isinstance(obj, dict) and len(_object_primary_key_fields(obj)) > 1 for obj in ir.get("objects", []))
+
+
+def _sqlalchemy_dialect_insert_lines() -> List[str]:
+    return [
+        "from sqlalchemy.dialects.mysql import insert as mysql_insert",
+        "from sqlalchemy.dialects.postgresql import insert as postgresql_insert",
+        "from sqlalchemy.dialects.sqlite import insert as sqlite_insert",
+    ]
+
+
+def _bulk_upsert_helper_lines() -> List[str]:
+    return [
+        "_SAVE_MANY_CHUNK_SIZE = 500",
+        "",
+        "def _column_values(record) -> dict:",
+        "    mapper = inspect(type(record))",
+        "    return {attr.columns[0].name: getattr(record, attr.key) for attr in mapper.column_attrs}",
+        "",
+        "def _upsert_statement(session, model):",
+        "    table = model.__table__",
+        "    key_names = [column.name for column in table.primary_key.columns]",
+        "    dialect = session.get_bind().dialect.name",
+        "    if not key_names:",
+        "        return None",
+        "    if dialect in ('postgresql', 'sqlite'):",
+        "        stmt = (postgresql_insert if dialect == 'postgresql' else sqlite_insert)(table)",
+        "        updates = {column.name: stmt.excluded[column.name] for column in table.columns if column.name not in key_names}",
+        "        if not updates:",
+        "            return stmt.on_conflict_do_nothing(index_elements=key_names)",
+        "        return stmt.on_conflict_do_update(index_elements=key_names, set_=updates)",
+        "    if dialect in ('mysql', 'mariadb'):",
+        "        stmt = mysql_insert(table)",
+        "        return stmt.on_duplicate_key_update({column.name: stmt.inserted[column.name] for column in table.columns})",
+        "    return None",
+        "",
+    ]
+
+
+def _key_tuple_expr(name: str, pk_props: List[str]) -> str:
+    values = [f"{name}.{pk_prop}" for pk_prop in pk_props]
+    if len(values) == 1:
+        return f"({values[0]},)"
+    return f"({', '.join(values)})"
+
+
+def _key_condition_expr(model_expr: str, pk_props: List[str], ids_name: str = "ids") -> str:
+    if len(pk_props) == 1:
+        return f"{model_expr}.{pk_props[0]}.in_([id.{pk_props[0]} for id in {ids_name}])"
+    clauses = ", ".join(f"{model_expr}.{prop} == id.{prop}" for prop in pk_props)
+    return f"or_(*[and_({clauses}) for id in {ids_name}])"
+
+
+def _estimated_total_helper_lines(*, native_async: bool = False) -> List[str]:
+    await_ = "await " if native_async else ""
+    return [
+        "class _Explain(Executable, ClauseElement):",
+        "    inherit_cache = False",
+        "",
+        "    def __init__(self, statement):",
+        "        self.statement = statement",
+        "",
+        "@compiles(_Explain)",
+        "def _compile_explain(element, compiler, **kw):",
+        "    return 'EXPLAIN (FORMAT JSON) ' + compiler.process(element.statement, **kw)",
+        "",
+        f"{'async ' if native_async else ''}def _estimated_total(session, model, stmt=None) -> Optional[int]:",
+        "    if session.get_bind().dialect.name != 'postgresql':",
+        "        return None",
+        "    if stmt is None:",
+        f"        estimate = {await_}session.scalar(",
+        "            text('SELECT CAST(reltuples AS BIGINT) FROM pg_class WHERE oid = to_regclass(CAST(:table_name AS TEXT))'),",
+        "            {'table_name': model.__tablename__},",
+        "        )",
+        "    else:",
+        f"        plan = {await_}session.scalar(_Explain(stmt))",
+        "        if isinstance(plan, str):",
+        "            plan = json.loads(plan)",
+        "        estimate = plan[0]['Plan']['Plan Rows'] if plan else None",
+        "    if estimate is None or estimate < 0:",
+        "        return None",
+        "    return int(estimate)",
+        "",
+    ]
+
+
+def _parse_flag_helper_lines() -> List[str]:
+    return [
+        "def _parse_flag(value: str | None, default: bool) -> bool:",
+        "    if value is None:",
+        "        return default",
+        "    return value.strip().lower() not in {'0', 'false', 'no', 'off'}",
+        "",
+    ]
+
+
+def _seek_condition_expr(columns: List[str], *, and_fn: str = "and_", or_fn: str = "or_") -> str:
+    clauses: List[str] = []
+    for idx, column in enumerate(columns):
+        parts = [f"{columns[prev]} == values[{prev}]" for prev in range(idx)] + [f"{column} > values[{idx}]"]
+        clauses.append(parts[0] if len(parts) == 1 else f"{and_fn}({', '.join(parts)})")
+    return clauses[0] if len(clauses) == 1 else f"{or_fn}({', '.join(clauses)})"
+
+
+def _model_import_line(model_style: str) -> str:
+    return "import msgspec" if model_style == "msgspec" else "from dataclasses import dataclass"
+
+
+def _model_class_header_lines(class_name: str, model_style: str) -> List[str]:
+    # Contract classes are keyword-only in every style; `slots` drops the per-instance __dict__.
+    if model_style == "msgspec":
+        return [f"class {class_name}(msgspec.Struct, kw_only=True):"]
+    if model_style == "slots":
+        return ["@dataclass(kw_only=True, slots=True)", f"class {class_name}:"]
+    return ["@dataclass(kw_only=True)", f"class {class_name}:"]
+
+
+def _model_instance_check_expr(expr: str, model_style: str) -> str:
+    if model_style == "msgspec":
+        return f"isinstance({expr}, msgspec.Struct)"
+    return f"dataclasses.is_dataclass({expr})"
+
+
+def _model_asdict_expr(expr: str, model_style: str) -> str:
+    if model_style == "msgspec":
+        return f"msgspec.to_builtins({expr})"
+    return f"dataclasses.asdict({expr})"
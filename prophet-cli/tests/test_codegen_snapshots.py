@@ -20,6 +20,7 @@ from prophet_cli.cli import load_config
 from prophet_cli.cli import parse_ontology
 from prophet_cli.cli import resolve_migration_runtime_modes
 from prophet_cli.cli import validate_ontology
+from prophet_cli.core.compatibility import wire_field_tags
 
 ROOT = PROJECT_ROOT
 EXAMPLE_ROOT = ROOT / "examples" / "java" / "prophet_example_spring"
@@ -249,5 +250,222 @@ dependencies {
         self.assertFalse(any("query operator" in reason for reason in reasons))
 
 
+    def test_event_wire_tags_follow_field_ids_and_flag_moved_tags(self) -> None:
+        cfg = load_config(EXAMPLE_ROOT / "prophet.yaml")
+        ontology = parse_ontology((EXAMPLE_ROOT / "ontology" / "local" / "main.prophet").read_text(encoding="utf-8"))
+        old_ir = build_ir(ontology, cfg)
+        event = next(item for item in old_ir["events"] if len(item.get("fields", [])) > 1)
+        field_ids = [field["id"] for field in event["fields"]]
+        tags = wire_field_tags(field_ids)
+        self.assertEqual(tags, wire_field_tags(list(reversed(field_ids))))
+        self.assertEqual(len(set(tags.values())), len(field_ids))
+        self.assertTrue(all(1 <= tag <= 0xFFFF for tag in tags.values()))
+
+        reordered_ir = copy.deepcopy(old_ir)
+        reordered_event = next(item for item in reordered_ir["events"] if item["id"] == event["id"])
+        reordered_event["fields"] = list(reversed(reordered_event["fields"]))
+        _, reasons = compare_irs(old_ir, reordered_ir)
+        self.assertFalse(any("wire tag" in reason for reason in reasons))
+
+        # A new id that sorts first and hashes onto an existing tag pushes that field to the next tag.
+        moved_id = field_ids[0]
+        colliding_id = next(
+            candidate
+            for candidate in (f"a_{index}" for index in range(1_000_000))
+            if wire_field_tags([candidate])[candidate] == tags[moved_id]
+        )
+        collided_ir = copy.deepcopy(old_ir)
+        collided_event = next(item for item in collided_ir["events"] if item["id"] == event["id"])
+        collided_event["fields"].append({**copy.deepcopy(event["fields"][0]), "id": colliding_id, "name": "colliding"})
+        level, reasons = compare_irs(old_ir, collided_ir)
+        self.assertEqual(level, "breaking")
+        self.assertIn(
+            f"event wire tag changed: event={event['id']} field_id={moved_id} {tags[moved_id]} -> {tags[moved_id] % 0xFFFF + 1}",
+            reasons,
+        )
+
+    def test_query_cursor_pagination_toggle_is_classified(self) -> None:
+        cfg = load_config(EXAMPLE_ROOT / "prophet.yaml")
+        ontology = parse_ontology((EXAMPLE_ROOT / "ontology" / "local" / "main.prophet").read_text(encoding="utf-8"))
+        old_ir = build_ir(ontology, cfg)
+        cursor_cfg = copy.deepcopy(cfg)
+        cursor_cfg.setdefault("generation", {})["query"] = {
+            "cursor_pagination": {"sort_fields": {"Order": "total_amount"}},
+        }
+        new_ir = build_ir(ontology, cursor_cfg)
+
+        contracts = {item["object_id"]: item for item in new_ir["query_contracts"]}
+        self.assertEqual(
+            contracts["obj_order"]["pageable"]["cursor"]["key_field_ids"],
+            ["fld_order_total_amount", "fld_order_order_id"],
+        )
+        self.assertTrue(all("cursor" not in item["pageable"] for item in old_ir["query_contracts"]))
+
+        level, reasons = compare_irs(old_ir, new_ir)
+        self.assertEqual(level, "additive")
+        self.assertTrue(any("query cursor pagination added: object=obj_order" in reason for reason in reasons))
+
+        level, reasons = compare_irs(new_ir, old_ir)
+        self.assertEqual(level, "breaking")
+        self.assertTrue(any("query cursor pagination removed: object=obj_order" in reason for reason in reasons))
+
+    def test_query_cursor_pagination_renders_java_and_openapi(self) -> None:
+        cfg = load_config(EXAMPLE_ROOT / "prophet.yaml")
+        cfg.setdefault("generation", {})["query"] = {"cursor_pagination": True}
+        ontology = parse_ontology((EXAMPLE_ROOT / "ontology" / "local" / "main.prophet").read_text(encoding="utf-8"))
+        with pushd(EXAMPLE_ROOT):
+            ir = build_ir(ontology, cfg)
+            outputs = build_generated_outputs(ir, cfg)
+
+        controller = next(content for path, content in outputs.items() if path.endswith("/OrderQueryController.java"))
+        self.assertIn('@RequestParam(value = "cursor", required = false) String cursor', controller)
+        self.assertIn("repository.findAll(spec.and(cursorSpec(cursor)), cursorPageable(pageable, cursor))", controller)
+        self.assertIn('throw new ResponseStatusException(HttpStatus.BAD_REQUEST, "invalid_cursor", ex);', controller)
+        list_response = next(content for path, content in outputs.items() if path.endswith("/OrderListResponse.java"))
+        self.assertIn("    String nextCursor", list_response)
+        self.assertIn("name: cursor", outputs["gen/openapi/openapi.yaml"])
+        self.assertIn("nextCursor:", outputs["gen/openapi/openapi.yaml"])
+
+    def test_triggers_render_spring_dispatcher_factory(self) -> None:
+        outputs, ir = build_outputs_from_example()
+        self.assertTrue(ir["triggers"])
+
+        factory = next(content for path, content in outputs.items() if path.endswith("/triggers/TriggerDispatcherFactory.java"))
+        self.assertIn('        Map.entry("onPaymentCaptured", "PaymentCaptured")', factory)
+        self.assertIn("        ObjectProvider<ApproveOrderActionHandler> approveOrderHandlerProvider", factory)
+        self.assertIn(
+            "                    ApproveOrderActionService service = new ApproveOrderActionServiceDefault(approveOrderHandlerProvider, dispatcher);",
+            factory,
+        )
+        self.assertIn("                    TriggerBatchException.runEach(envelopes, envelope -> {", factory)
+        self.assertIn('                policies.getOrDefault("onPaymentCaptured", TriggerPolicy.defaults())', factory)
+        mappers = next(content for path, content in outputs.items() if path.endswith("/triggers/TriggerInputMappers.java"))
+        self.assertIn("    ApproveOrderCommand onPaymentCaptured(EventWireEnvelope envelope);", mappers)
+
+        cfg = load_config(EXAMPLE_ROOT / "prophet.yaml")
+        no_trigger_ir = copy.deepcopy(ir)
+        no_trigger_ir["triggers"] = []
+        with pushd(EXAMPLE_ROOT):
+            outputs = build_generated_outputs(no_trigger_ir, cfg)
+        self.assertFalse([path for path in outputs if "/generated/triggers/" in path])
+
+    def test_query_total_count_mode_is_classified(self) -> None:
+        cfg = load_config(EXAMPLE_ROOT / "prophet.yaml")
+        ontology = parse_ontology((EXAMPLE_ROOT / "ontology" / "local" / "main.prophet").read_text(encoding="utf-8"))
+        old_ir = build_ir(ontology, cfg)
+        exact_cfg = copy.deepcopy(cfg)
+        exact_cfg.setdefault("generation", {})["query"] = {"total_count": "exact"}
+        exact_ir = build_ir(ontology, exact_cfg)
+        estimated_cfg = copy.deepcopy(cfg)
+        estimated_cfg.setdefault("generation", {})["query"] = {
+            "total_count": {"mode": "estimated", "include_by_default": False},
+        }
+        estimated_ir = build_ir(ontology, estimated_cfg)
+
+        self.assertTrue(all("total" not in item["pageable"] for item in old_ir["query_contracts"]))
+        contracts = {item["object_id"]: item for item in estimated_ir["query_contracts"]}
+        self.assertEqual(
+            contracts["obj_order"]["pageable"]["total"],
+            {"mode": "estimated", "include_by_default": False},
+        )
+
+        level, reasons = compare_irs(old_ir, exact_ir)
+        self.assertEqual(level, "additive")
+        self.assertTrue(any("query total count contract changed: object=obj_order" in reason for reason in reasons))
+
+        level, reasons = compare_irs(exact_ir, estimated_ir)
+        self.assertEqual(level, "breaking")
+        self.assertTrue(any("query total count no longer exact by default: object=obj_order" in reason for reason in reasons))
+
+    def test_query_total_count_renders_java_and_openapi(self) -> None:
+        cfg = load_config(EXAMPLE_ROOT / "prophet.yaml")
+        cfg.setdefault("generation", {})["query"] = {"total_count": "estimated"}
+        ontology = parse_ontology((EXAMPLE_ROOT / "ontology" / "local" / "main.prophet").read_text(encoding="utf-8"))
+        with pushd(EXAMPLE_ROOT):
+            ir = build_ir(ontology, cfg)
+            outputs = build_generated_outputs(ir, cfg)
+
+        controller = next(content for path, content in outputs.items() if path.endswith("/OrderQueryController.java"))
+        self.assertIn('@RequestParam(value = "includeTotal", required = false) Boolean includeTotal', controller)
+        self.assertIn("List<OrderEntity> rows = fetchPage(spec, pageRequest);", controller)
+        self.assertIn("Long totalElements = withTotal ? estimatedTotal(spec) : null;", controller)
+        self.assertIn("Long totalElements = withTotal ? repository.count(spec) : null;", controller)
+        self.assertIn("to_regclass(CAST(:table AS TEXT))", controller)
+        self.assertNotIn("repository.findAll(spec, pageable)", controller)
+        list_response = next(content for path, content in outputs.items() if path.endswith("/OrderListResponse.java"))
+        self.assertIn("    Long totalElements,", list_response)
+        self.assertIn("    Integer totalPages", list_response)
+        self.assertIn("name: includeTotal", outputs["gen/openapi/openapi.yaml"])
+
+    def test_query_export_is_classified_and_renders_openapi(self) -> None:
+        cfg = load_config(EXAMPLE_ROOT / "prophet.yaml")
+        ontology = parse_ontology((EXAMPLE_ROOT / "ontology" / "local" / "main.prophet").read_text(encoding="utf-8"))
+        old_ir = build_ir(ontology, cfg)
+        export_cfg = copy.deepcopy(cfg)
+        export_cfg.setdefault("generation", {})["query"] = {"export": {"formats": ["csv", "ndjson"], "chunk_size": 500}}
+        export_ir = build_ir(ontology, export_cfg)
+        ndjson_cfg = copy.deepcopy(cfg)
+        ndjson_cfg.setdefault("generation", {})["query"] = {"export": {"formats": ["ndjson"]}}
+        ndjson_ir = build_ir(ontology, ndjson_cfg)
+
+        contracts = {item["object_id"]: item for item in export_ir["query_contracts"]}
+        self.assertEqual(contracts["obj_order"]["paths"]["export"], "/orders/export")
+        self.assertEqual(contracts["obj_order"]["export"], {"formats": ["ndjson", "csv"], "chunk_size": 500})
+        self.assertTrue(all("export" not in item for item in old_ir["query_contracts"]))
+
+        level, reasons = compare_irs(old_ir, export_ir)
+        self.assertEqual(level, "additive")
+        self.assertTrue(any("query path added: object=obj_order" in reason for reason in reasons))
+
+        level, reasons = compare_irs(export_ir, ndjson_ir)
+        self.assertEqual(level, "breaking")
+        self.assertTrue(any("query export format removed: object=obj_order format=csv" in reason for reason in reasons))
+
+        with pushd(EXAMPLE_ROOT):
+            outputs = build_generated_outputs(export_ir, export_cfg)
+        openapi = outputs["gen/openapi/openapi.yaml"]
+        self.assertIn("/orders/export:", openapi)
+        self.assertIn("operationId: exportOrder", openapi)
+        self.assertIn("application/x-ndjson:", openapi)
+        self.assertIn("text/csv:", openapi)
+
+    def test_query_field_projection_is_classified_and_renders_openapi_and_tuple_queries(self) -> None:
+        cfg = load_config(EXAMPLE_ROOT / "prophet.yaml")
+        ontology = parse_ontology((EXAMPLE_ROOT / "ontology" / "local" / "main.prophet").read_text(encoding="utf-8"))
+        old_ir = build_ir(ontology, cfg)
+        projection_cfg = copy.deepcopy(cfg)
+        projection_cfg.setdefault("generation", {})["query"] = {"field_projection": True}
+        projection_ir = build_ir(ontology, projection_cfg)
+
+        contracts = {item["object_id"]: item for item in projection_ir["query_contracts"]}
+        projection = contracts["obj_order"]["projection"]
+        self.assertEqual(projection["param"], "fields")
+        self.assertEqual(projection["always_field_ids"], ["fld_order_order_id"])
+        self.assertIn({"field_id": "__state__", "field_name": "state"}, projection["fields"])
+        self.assertTrue(all("projection" not in item for item in old_ir["query_contracts"]))
+
+        level, reasons = compare_irs(old_ir, projection_ir)
+        self.assertEqual(level, "additive")
+        self.assertTrue(any("query field projection added: object=obj_order" in reason for reason in reasons))
+
+        level, reasons = compare_irs(projection_ir, old_ir)
+        self.assertEqual(level, "breaking")
+        self.assertTrue(any("query field projection removed: object=obj_order" in reason for reason in reasons))
+
+        with pushd(EXAMPLE_ROOT):
+            outputs = build_generated_outputs(projection_ir, projection_cfg)
+        openapi = outputs["gen/openapi/openapi.yaml"]
+        self.assertIn("OrderProjection:", openapi)
+        self.assertIn("name: fields", openapi)
+        self.assertIn("description: Unknown field in fields", openapi)
+
+        controller = next(content for path, content in outputs.items() if path.endswith("/OrderQueryController.java"))
+        self.assertIn("public ResponseEntity<?> list(", controller)
+        self.assertIn('@RequestParam(value = "fields", required = false) String fields', controller)
+        self.assertIn("CriteriaQuery<Tuple> criteria = cb.createTupleQuery();", controller)
+        self.assertIn('case "customer" -> root.get("customer").get("userId");', controller)
+        self.assertIn('throw new ResponseStatusException(HttpStatus.BAD_REQUEST, "invalid_fields");', controller)
+        self.assertTrue(any(path.endswith("/OrderProjectionListResponse.java") for path in outputs))
+
 if __name__ == "__main__":
     unittest.main()
@@ -104,6 +104,226 @@ class NodeTargetTests(unittest.TestCase):
         manifest = json.loads(outputs["gen/manifest/generated-files.json"])
         self.assertEqual(manifest["stack"]["id"], "node_express_mongoose")
 
+    def test_node_cursor_pagination_renders_keyset_seek(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"cursor_pagination": {"sort_fields": {"Order": "total_amount"}}}
+        expected_seeks = {
+            "prisma": ("prisma-adapters.ts", "{ total_amount: values[0], order_id: { gt: values[1] } },"),
+            "typeorm": (
+                "typeorm-adapters.ts",
+                "qb.andWhere('(record.total_amount > :cursor_0 OR (record.total_amount = :cursor_0 AND record.order_id > :cursor_1))'",
+            ),
+            "mongoose": ("mongoose-adapters.ts", "{ totalAmount: values[0], orderId: { $gt: values[1] } },"),
+        }
+        for orm, (adapter_name, seek_line) in expected_seeks.items():
+            cfg["generation"]["stack"] = {"id": f"node_express_{orm}"}
+            cfg["generation"]["targets"] = ["openapi", "node_express", orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-node-{orm}-cursor-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            persistence = outputs["gen/node-express/src/generated/persistence.ts"]
+            self.assertIn("  nextCursor?: string;", persistence)
+            self.assertIn("export class InvalidCursorError extends Error {", persistence)
+            self.assertIn("list(page: number, size: number, cursor?: string): Promise<Page<Domain.Order>>;", persistence)
+            routes = outputs["gen/node-express/src/generated/query-routes.ts"]
+            self.assertIn("await repositories.order.list(page, size, parseCursor(req.query.cursor));", routes)
+            self.assertIn("res.status(400).json({ error: 'invalid_cursor' });", routes)
+            adapters = outputs[f"gen/node-express/src/generated/{adapter_name}"]
+            self.assertIn(seek_line, adapters)
+            self.assertIn("nextCursor: orderNextCursor(rows, normalized.size),", adapters)
+
+    def test_node_total_count_renders_optional_estimated_totals(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"total_count": "estimated"}
+        expected_totals = {
+            "prisma": ("prisma-adapters.ts", "includeTotal ? this.delegate.count({ where }) : undefined,"),
+            "typeorm": (
+                "typeorm-adapters.ts",
+                "const totalElements = includeTotal ? (await estimatedQueryTotal(this.dataSource, qb)) ?? (await qb.getCount()) : undefined;",
+            ),
+            "mongoose": ("mongoose-adapters.ts", "includeTotal ? this.model.estimatedDocumentCount().exec() : undefined,"),
+        }
+        for orm, (adapter_name, total_line) in expected_totals.items():
+            cfg["generation"]["stack"] = {"id": f"node_express_{orm}"}
+            cfg["generation"]["targets"] = ["openapi", "node_express", orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-node-{orm}-total-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            persistence = outputs["gen/node-express/src/generated/persistence.ts"]
+            self.assertIn("  totalElements?: number;", persistence)
+            self.assertIn("list(page: number, size: number, includeTotal?: boolean): Promise<Page<Domain.Order>>;", persistence)
+            routes = outputs["gen/node-express/src/generated/query-routes.ts"]
+            self.assertIn("await repositories.order.list(page, size, parseFlag(req.query.includeTotal, true));", routes)
+            adapters = outputs[f"gen/node-express/src/generated/{adapter_name}"]
+            self.assertIn(total_line, adapters)
+            self.assertIn("totalPages: totalPages(totalElements, normalized.size),", adapters)
+
+    def test_node_query_export_renders_streaming_route_and_chunked_repositories(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"export": {"chunk_size": 250}}
+        expected_exports = {
+            "prisma": ("prisma-adapters.ts", "cursor = orderUniqueWhere(orderIdFromDomain(items[items.length - 1]));"),
+            "typeorm": ("typeorm-adapters.ts", "qb.andWhere('(record.order_id > :export_0)', { export_0: last.orderId });"),
+            "mongoose": (
+                "mongoose-adapters.ts",
+                "const cursor = this.model.find(orderWhere(filter)).sort(orderSort()).lean().batchSize(chunkSize).cursor();",
+            ),
+        }
+        for orm, (adapter_name, export_line) in expected_exports.items():
+            cfg["generation"]["stack"] = {"id": f"node_express_{orm}"}
+            cfg["generation"]["targets"] = ["openapi", "node_express", orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-node-{orm}-export-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            persistence = outputs["gen/node-express/src/generated/persistence.ts"]
+            self.assertIn("export(filter: Filters.OrderQueryFilter, chunkSize?: number): AsyncIterable<Domain.Order[]>;", persistence)
+            routes = outputs["gen/node-express/src/generated/query-routes.ts"]
+            self.assertIn("router.post('/orders/export', async (req: Request, res: Response, next: NextFunction) => {", routes)
+            self.assertIn("const format = parseExportFormat(req.query.format, ['ndjson', 'csv']);", routes)
+            self.assertIn("for await (const chunk of repositories.order.export(filter)) {", routes)
+            self.assertIn("if (!(await writeExportChunk(res, body))) return;", routes)
+            adapters = outputs[f"gen/node-express/src/generated/{adapter_name}"]
+            self.assertIn(
+                "async *export(filter: Filters.OrderQueryFilter, chunkSize = 250): AsyncIterable<Domain.Order[]> {",
+                adapters,
+            )
+            self.assertIn(export_line, adapters)
+            loaders = outputs["gen/node-express/src/generated/loaders.ts"]
+            self.assertIn("return this.repository.export(...args);", loaders)
+
+    def test_node_field_projection_renders_selects_and_validated_routes(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"field_projection": True}
+        expected_selects = {
+            "prisma": ("prisma-adapters.ts", "const row = await this.delegate.findUnique({ where: orderUniqueWhere(id), select: orderSelect(fields) });"),
+            "typeorm": ("typeorm-adapters.ts", "if (select !== undefined) qb.select(select.map((property) => `record.${property}`));"),
+            "mongoose": ("mongoose-adapters.ts", "const row = await this.model.findOne(orderPrimaryFilter(id), orderProjection(fields)).lean().exec();"),
+        }
+        for orm, (adapter_name, select_line) in expected_selects.items():
+            cfg["generation"]["stack"] = {"id": f"node_express_{orm}"}
+            cfg["generation"]["targets"] = ["openapi", "node_express", orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-node-{orm}-projection-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            persistence = outputs["gen/node-express/src/generated/persistence.ts"]
+            self.assertIn("export class InvalidFieldsError extends Error {", persistence)
+            self.assertIn("export const ORDER_KEY_FIELDS: readonly string[] = ['orderId'];", persistence)
+            self.assertIn("getById(id: OrderId, fields?: string[]): Promise<Domain.Order | null>;", persistence)
+            routes = outputs["gen/node-express/src/generated/query-routes.ts"]
+            self.assertIn("const fields = selectFields(req.query.fields, ORDER_FIELDS, ORDER_KEY_FIELDS);", routes)
+            self.assertIn("const result = await repositories.order.list(page, size, fields);", routes)
+            self.assertIn("res.status(400).json({ error: 'invalid_fields' });", routes)
+            adapters = outputs[f"gen/node-express/src/generated/{adapter_name}"]
+            self.assertIn(select_line, adapters)
+            self.assertIn("pickFields(", adapters)
+            loaders = outputs["gen/node-express/src/generated/loaders.ts"]
+            self.assertIn("return fields === undefined ? super.getById(id) : this.repository.getById(id, fields);", loaders)
+
+    def test_node_repositories_render_bulk_save_and_transition(self) -> None:
+        cfg = self._base_cfg()
+        expected_bulk = {
+            "prisma": ("prisma-adapters.ts", "writes.unshift(this.delegate.createMany({ data: created.map(orderDomainToRow) }));", ".createMany({"),
+            "typeorm": ("typeorm-adapters.ts", "await this.repo.upsert(entities as any[], conflictPaths);", ".insert("),
+            "mongoose": ("mongoose-adapters.ts", "await this.model.bulkWrite(", "await this.historyModel.insertMany("),
+        }
+        for orm, (adapter_name, save_line, history_line) in expected_bulk.items():
+            cfg["generation"]["stack"] = {"id": f"node_express_{orm}"}
+            cfg["generation"]["targets"] = ["openapi", "node_express", orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-node-{orm}-bulk-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            persistence = outputs["gen/node-express/src/generated/persistence.ts"]
+            self.assertIn("saveMany(items: Domain.Order[]): Promise<Domain.Order[]>;", persistence)
+            self.assertIn("applyTransitionMany(", persistence)
+            adapters = outputs[f"gen/node-express/src/generated/{adapter_name}"]
+            self.assertIn("async saveMany(items: Domain.Order[]): Promise<Domain.Order[]> {", adapters)
+            self.assertIn("async applyTransitionMany(", adapters)
+            self.assertIn(save_line, adapters)
+            self.assertIn(history_line, adapters)
+
+        cfg["generation"]["stack"] = {"id": "node_express_prisma"}
+        cfg["generation"]["targets"] = ["openapi", "node_express", "prisma", "manifest"]
+        cfg["generation"]["node_express"] = {"prisma": {"provider": "postgresql"}}
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-node-prisma-bulk-postgres-") as tmp:
+            adapters = build_generated_outputs(ir, cfg, root=Path(tmp))["gen/node-express/src/generated/prisma-adapters.ts"]
+        self.assertIn("const SAVE_MANY_CHUNK_SIZE = 500;", adapters)
+        self.assertIn("writes.unshift(this.delegate.createMany({ data: created.map(orderDomainToRow), skipDuplicates: true }));", adapters)
+        self.assertIn("      if (created.length > 0 && Number(results[0]?.count ?? 0) < created.length) {", adapters)
+
+    def test_node_repositories_render_get_by_ids_and_batch_loaders(self) -> None:
+        cfg = self._base_cfg()
+        expected_lookup = {
+            "prisma": ("prisma-adapters.ts", "where: { order_id: { in: ids.map((id) => id.orderId) } }"),
+            "typeorm": ("typeorm-adapters.ts", "this.repo.findBy({ orderId: In(ids.map((id) => id.orderId)) } as any)"),
+            "mongoose": ("mongoose-adapters.ts", "this.model.find({ orderId: { $in: ids.map((id) => id.orderId) } })"),
+        }
+        for orm, (adapter_name, lookup_line) in expected_lookup.items():
+            cfg["generation"]["stack"] = {"id": f"node_express_{orm}"}
+            cfg["generation"]["targets"] = ["openapi", "node_express", orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-node-{orm}-get-by-ids-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            persistence = outputs["gen/node-express/src/generated/persistence.ts"]
+            self.assertIn("getByIds(ids: OrderId[]): Promise<(Domain.Order | null)[]>;", persistence)
+            adapters = outputs[f"gen/node-express/src/generated/{adapter_name}"]
+            self.assertIn(lookup_line, adapters)
+            loaders = outputs["gen/node-express/src/generated/loaders.ts"]
+            self.assertIn("export class BatchLoader<K, V> {", loaders)
+            self.assertIn("(ids) => repositories.order.getByIds(ids),", loaders)
+            index = outputs["gen/node-express/src/generated/index.ts"]
+            self.assertIn("export { BatchLoader, IdentityMapRepositories, createRepositoryLoaders } from './loaders.js';", index)
+
+    def test_node_loaders_render_identity_map_repositories(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "node_express_prisma"}
+        cfg["generation"]["targets"] = ["openapi", "node_express", "prisma", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-node-identity-map-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        loaders = outputs["gen/node-express/src/generated/loaders.ts"]
+        self.assertIn("export class IdentityMapRepository<K, V, R extends CachedRepository<K, V>> {", loaders)
+        self.assertIn("export class OrderIdentityMapRepository", loaders)
+        self.assertIn("  implements Persistence.OrderRepository", loaders)
+        self.assertIn("    super(repository, (id) => JSON.stringify([id.orderId]));", loaders)
+        self.assertIn("    const transitioned = await this.repository.applyTransition(id, expectedState, nextState, transitionId);", loaders)
+        self.assertIn("export class IdentityMapRepositories implements Persistence.Repositories {", loaders)
+        self.assertIn("    this.order = new OrderIdentityMapRepository(repositories.order);", loaders)
+        user_wrapper = loaders.split("export class UserIdentityMapRepository", 1)[1].split("export class IdentityMapRepositories", 1)[0]
+        self.assertNotIn("applyTransition", user_wrapper)
+
+    def test_node_triggers_render_dispatcher_bindings(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "node_express_prisma"}
+        cfg["generation"]["targets"] = ["node_express", "prisma", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        self.assertTrue(ir["triggers"])
+        with tempfile.TemporaryDirectory(prefix="prophet-node-triggers-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        triggers = outputs["gen/node-express/src/generated/triggers.ts"]
+        self.assertIn("import { ActionExecutionService } from './action-service.js';", triggers)
+        self.assertIn("  onPaymentCaptured: 'PaymentCaptured',", triggers)
+        self.assertIn("  onPaymentCaptured(envelope: EventWireEnvelope): Actions.ApproveOrderCommand | null | undefined;", triggers)
+        self.assertIn("        eventType: TRIGGER_EVENT_TYPES.onPaymentCaptured,", triggers)
+        self.assertIn("              await service.approveOrder(input, triggerContext(envelope));", triggers)
+        self.assertIn("    throw new TriggerBatchError(failures);", triggers)
+        self.assertIn("  const service = new ActionExecutionService(handlers, dispatcher);", triggers)
+        self.assertIn("    traceId: envelope.trace_id,", triggers)
+
+        no_trigger_ir = copy.deepcopy(ir)
+        no_trigger_ir["triggers"] = []
+        with tempfile.TemporaryDirectory(prefix="prophet-node-no-triggers-") as tmp:
+            outputs = build_generated_outputs(no_trigger_ir, cfg, root=Path(tmp))
+        self.assertNotIn("gen/node-express/src/generated/triggers.ts", outputs)
+
     def test_node_stack_can_generate_turtle_projection(self) -> None:
         cfg = self._base_cfg()
         cfg["generation"]["stack"] = {"id": "node_express_prisma"}
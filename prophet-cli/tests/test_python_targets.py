@@ -15,6 +15,9 @@ from prophet_cli.cli import build_generated_outputs
 from prophet_cli.cli import build_ir
 from prophet_cli.cli import load_config
 from prophet_cli.cli import parse_ontology
+from prophet_cli.codegen.rendering import pascal_case
+from prophet_cli.core.compatibility import wire_field_tags
+from prophet_cli.core.errors import ProphetError
 from prophet_cli.targets.python.autodetect import apply_python_autodetect
 from prophet_cli.targets.python.autodetect import detect_python_stack
 
@@ -45,8 +48,11 @@ class PythonTargetTests(unittest.TestCase):
         self.assertIn("gen/python/src/generated/sqlalchemy_models.py", outputs)
         self.assertIn("gen/python/src/generated/sqlalchemy_adapters.py", outputs)
         self.assertIn("gen/manifest/generated-files.json", outputs)
-        self.assertIn("input_model = _coerce_value(", outputs["gen/python/src/generated/fastapi_routes.py"])
-        self.assertIn("filter_model = _coerce_value(", outputs["gen/python/src/generated/fastapi_routes.py"])
+        self.assertIn("input_model = decode_", outputs["gen/python/src/generated/fastapi_routes.py"])
+        self.assertIn("filter_model = decode_", outputs["gen/python/src/generated/fastapi_routes.py"])
+        self.assertNotIn("_coerce_value", outputs["gen/python/src/generated/fastapi_routes.py"])
+        self.assertIn("return Response(content=order_page_to_json_bytes(result), media_type='application/json')", outputs["gen/python/src/generated/fastapi_routes.py"])
+        self.assertNotIn("dataclasses.asdict", outputs["gen/python/src/generated/fastapi_routes.py"])
         self.assertNotIn("asyncio.to_thread", outputs["gen/python/src/generated/sqlalchemy_adapters.py"])
         self.assertIn("@dataclass(kw_only=True)", outputs["gen/python/src/generated/domain.py"])
         self.assertNotIn("nullable=false", outputs["gen/python/src/generated/sqlalchemy_models.py"])
@@ -96,8 +102,11 @@ class PythonTargetTests(unittest.TestCase):
         self.assertIn("gen/python/src/generated/flask_routes.py", outputs)
         self.assertIn("gen/python/src/generated/sqlalchemy_models.py", outputs)
         self.assertIn("def action_createOrder", outputs["gen/python/src/generated/flask_routes.py"])
-        self.assertIn("input_model = _coerce_value(", outputs["gen/python/src/generated/flask_routes.py"])
-        self.assertIn("filter_model = _coerce_value(", outputs["gen/python/src/generated/flask_routes.py"])
+        self.assertIn("input_model = decode_", outputs["gen/python/src/generated/flask_routes.py"])
+        self.assertIn("filter_model = decode_", outputs["gen/python/src/generated/flask_routes.py"])
+        self.assertNotIn("_coerce_value", outputs["gen/python/src/generated/flask_routes.py"])
+        self.assertIn("return Response(order_page_to_json_bytes(result), mimetype='application/json')", outputs["gen/python/src/generated/flask_routes.py"])
+        self.assertNotIn("dataclasses.asdict", outputs["gen/python/src/generated/flask_routes.py"])
         self.assertNotIn("nullable=false", outputs["gen/python/src/generated/sqlalchemy_models.py"])
         self.assertIn("nullable=False", outputs["gen/python/src/generated/sqlalchemy_models.py"])
         self.assertIn("def list(self, page: int, size: int)", outputs["gen/python/src/generated/sqlalchemy_adapters.py"])
@@ -137,8 +146,11 @@ class PythonTargetTests(unittest.TestCase):
         self.assertIn("gen/python/src/generated/django_adapters.py", outputs)
         self.assertIn("class DjangoRepositories", outputs["gen/python/src/generated/django_adapters.py"])
         self.assertIn("configure_generated_views", outputs["gen/python/src/generated/django_views.py"])
-        self.assertIn("input_model = _coerce_value(", outputs["gen/python/src/generated/django_views.py"])
-        self.assertIn("filter_model = _coerce_value(", outputs["gen/python/src/generated/django_views.py"])
+        self.assertIn("input_model = decode_", outputs["gen/python/src/generated/django_views.py"])
+        self.assertIn("filter_model = decode_", outputs["gen/python/src/generated/django_views.py"])
+        self.assertNotIn("_coerce_value", outputs["gen/python/src/generated/django_views.py"])
+        self.assertIn("return HttpResponse(order_page_to_json_bytes(result), content_type='application/json')", outputs["gen/python/src/generated/django_views.py"])
+        self.assertNotIn("dataclasses.asdict", outputs["gen/python/src/generated/django_views.py"])
         self.assertNotIn("null=false", outputs["gen/python/src/generated/django_models.py"])
         self.assertIn("null=False", outputs["gen/python/src/generated/django_models.py"])
         django_urls = outputs["gen/python/src/generated/django_urls.py"]
@@ -165,6 +177,715 @@ class PythonTargetTests(unittest.TestCase):
         self.assertIn("prophet:ActionInput", turtle)
         self.assertIn("prophet:EventTrigger", turtle)
 
+    def test_python_fastapi_sqlalchemy_async_session_repository_io(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_fastapi_sqlalchemy"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "fastapi", "sqlalchemy", "manifest"]
+        cfg["generation"]["python"] = {"repository_io": "async_session"}
+
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-fastapi-sa-async-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        adapters = outputs["gen/python/src/generated/sqlalchemy_adapters.py"]
+        self.assertIn("from sqlalchemy.ext.asyncio import AsyncSession", adapters)
+        self.assertIn("def __init__(self, session_factory: Callable[[], AsyncSession]):", adapters)
+        self.assertIn("async with self._session_factory() as session:", adapters)
+        self.assertIn("record = (await session.scalars(stmt.limit(1))).first()", adapters)
+        self.assertIn("await session.commit()", adapters)
+        self.assertNotIn("_sync(", adapters)
+        self.assertIn("sqlalchemy[asyncio]>=2.0,<3.0", outputs["gen/python/pyproject.toml"])
+
+    def test_python_repository_io_rejects_unknown_values_and_unsupported_stacks(self) -> None:
+        cases = (
+            ("python_fastapi_sqlalchemy", ["fastapi", "sqlalchemy"], "threads", "Supported values: inline, async_session, thread_offload"),
+            ("python_flask_sqlalchemy", ["flask", "sqlalchemy"], "async_session", "not supported by stack 'python_flask_sqlalchemy'"),
+            ("python_fastapi_sqlmodel", ["fastapi", "sqlmodel"], "async_session", "not supported by stack 'python_fastapi_sqlmodel'"),
+            ("python_django_django_orm", ["django", "django_orm"], "thread_offload", "not supported by stack 'python_django_django_orm'"),
+        )
+        for stack_id, stack_targets, repository_io, message in cases:
+            cfg = self._base_cfg()
+            cfg["generation"]["stack"] = {"id": stack_id}
+            cfg["generation"]["targets"] = ["sql", "openapi", "python", *stack_targets, "manifest"]
+            cfg["generation"]["python"] = {"repository_io": repository_io}
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix="prophet-python-repository-io-") as tmp:
+                with self.assertRaises(ProphetError) as ctx:
+                    build_generated_outputs(ir, cfg, root=Path(tmp))
+            self.assertIn(message, str(ctx.exception))
+
+    def test_python_fastapi_thread_offload_repository_io(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["python"] = {"repository_io": "thread_offload"}
+        for orm, adapters_name, repositories_name in (
+            ("sqlalchemy", "sqlalchemy_adapters.py", "SqlAlchemyRepositories"),
+            ("sqlmodel", "sqlmodel_adapters.py", "SqlModelRepositories"),
+        ):
+            cfg["generation"]["stack"] = {"id": f"python_fastapi_{orm}"}
+            cfg["generation"]["targets"] = ["sql", "openapi", "python", "fastapi", orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-python-fastapi-{orm}-offload-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            adapters = outputs[f"gen/python/src/generated/{adapters_name}"]
+            self.assertIn("from concurrent.futures import Executor, ThreadPoolExecutor", adapters)
+            self.assertIn("return await asyncio.to_thread(fn, *args)", adapters)
+            self.assertIn("max_workers=max(int(pool_size()), 1)", adapters)
+            self.assertIn("return await _run_blocking(self._executor, self._list_sync, page, size)", adapters)
+            self.assertIn(
+                "return await _run_blocking(self._executor, self._apply_transition_sync, id, expected_state, next_state, transition_id)",
+                adapters,
+            )
+            self.assertIn(f"class {repositories_name}:", adapters)
+            self.assertIn("executor = executor if executor is not None else _default_executor(session_factory)", adapters)
+            self.assertIn("import threading", adapters)
+            self.assertIn("        if _SHARED_EXECUTOR is None:", adapters)
+            self.assertIn("        return _SHARED_EXECUTOR", adapters)
+
+    def test_python_cursor_pagination_renders_keyset_seek(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"cursor_pagination": {"sort_fields": {"Order": "total_amount"}}}
+        cfg["generation"]["stack"] = {"id": "python_fastapi_sqlalchemy"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "fastapi", "sqlalchemy", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-fastapi-cursor-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        persistence = outputs["gen/python/src/generated/persistence.py"]
+        self.assertIn("    nextCursor: Optional[str] = None", persistence)
+        self.assertIn("class InvalidCursorError(ValueError):", persistence)
+        self.assertIn("async def list(self, page: int, size: int, cursor: Optional[str] = None) -> PagedResult: ...", persistence)
+        adapters = outputs["gen/python/src/generated/sqlalchemy_adapters.py"]
+        self.assertIn("stmt = stmt.order_by(Models.OrderModel.totalAmount, Models.OrderModel.orderId)", adapters)
+        self.assertIn(
+            "return stmt.where(or_(Models.OrderModel.totalAmount > values[0], and_(Models.OrderModel.totalAmount == values[0], Models.OrderModel.orderId > values[1])))",
+            adapters,
+        )
+        self.assertIn("return Persistence.encode_cursor([rows[-1].totalAmount, rows[-1].orderId])", adapters)
+        routes = outputs["gen/python/src/generated/fastapi_routes.py"]
+        self.assertIn("cursor: Optional[str] = Query(default=None)", routes)
+        self.assertIn("raise HTTPException(status_code=400, detail='invalid_cursor')", routes)
+
+        cfg["generation"]["stack"] = {"id": "python_django_django_orm"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "django", "django_orm", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-django-cursor-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        adapters = outputs["gen/python/src/generated/django_adapters.py"]
+        self.assertIn("queryset = queryset.order_by('totalAmount', 'orderId')", adapters)
+        self.assertIn(
+            "return queryset.filter(Q(totalAmount__gt=values[0]) | Q(totalAmount=values[0], orderId__gt=values[1]))",
+            adapters,
+        )
+
+    def test_python_cursor_decoding_rejects_forged_values(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"cursor_pagination": {"sort_fields": {"Order": "total_amount"}}}
+        cfg["generation"]["stack"] = {"id": "python_fastapi_sqlalchemy"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "fastapi", "sqlalchemy", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-fastapi-cursor-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        adapters = outputs["gen/python/src/generated/sqlalchemy_adapters.py"]
+        self.assertIn("values = Persistence.decode_cursor(cursor, ('float', 'str'))", adapters)
+        persistence = outputs["gen/python/src/generated/persistence.py"]
+        start = persistence.index("class InvalidCursorError(ValueError):")
+        end = persistence.index("\nclass ", start + 1)
+        namespace: dict = {}
+        exec("import base64\nimport json\nfrom typing import List, Tuple\n" + persistence[start:end], namespace)
+        decode_cursor = namespace["decode_cursor"]
+        encode_cursor = namespace["encode_cursor"]
+        invalid_cursor_error = namespace["InvalidCursorError"]
+
+        self.assertEqual(decode_cursor(encode_cursor([12, "ord-1"]), ("float", "str")), [12.0, "ord-1"])
+        for forged in ("W3t9XQ", encode_cursor([True, "ord-1"]), encode_cursor(["12", "ord-1"]), encode_cursor([1.5, 2]), "!!"):
+            with self.assertRaises(invalid_cursor_error):
+                decode_cursor(forged, ("float", "str"))
+
+    def test_python_total_count_renders_optional_estimated_totals(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"total_count": {"mode": "estimated", "include_by_default": False}}
+        cfg["generation"]["stack"] = {"id": "python_fastapi_sqlalchemy"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "fastapi", "sqlalchemy", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-fastapi-total-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        persistence = outputs["gen/python/src/generated/persistence.py"]
+        self.assertIn("    totalElements: Optional[int] = None", persistence)
+        self.assertIn("async def list(self, page: int, size: int, include_total: bool = False) -> PagedResult: ...", persistence)
+        adapters = outputs["gen/python/src/generated/sqlalchemy_adapters.py"]
+        self.assertIn("def _estimated_total(session, model, stmt=None) -> Optional[int]:", adapters)
+        self.assertIn("total = _estimated_total(session, Models.OrderModel, None)", adapters)
+        self.assertIn("total = _estimated_total(session, Models.OrderModel, self._apply_filter(base_stmt, filter))", adapters)
+        self.assertIn("totalPages=Persistence.total_pages(total, size)", adapters)
+        routes = outputs["gen/python/src/generated/fastapi_routes.py"]
+        self.assertIn("include_total: bool = Query(default=False, alias='includeTotal')", routes)
+
+        cfg["generation"]["stack"] = {"id": "python_django_django_orm"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "django", "django_orm", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-django-total-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        adapters = outputs["gen/python/src/generated/django_adapters.py"]
+        self.assertIn("total = _estimated_total(queryset, filtered=True)", adapters)
+        routes = outputs["gen/python/src/generated/django_views.py"]
+        self.assertIn("include_total = _parse_flag(request.GET.get('includeTotal'), False)", routes)
+
+    def test_python_query_export_renders_streaming_routes_and_chunked_repositories(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"export": {"chunk_size": 250}}
+        cfg["generation"]["stack"] = {"id": "python_fastapi_sqlalchemy"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "fastapi", "sqlalchemy", "manifest"]
+        expected_exports = {
+            "inline": "async def export(self, filter: Filters.OrderQueryFilter, chunk_size: int = 250) -> AsyncIterator[List[Domain.Order]]:",
+            "thread_offload": "return _iterate_blocking(self._executor, self._export_sync(filter, chunk_size))",
+            "async_session": "async for rows in result.partitions():",
+        }
+        for repository_io, export_line in expected_exports.items():
+            cfg["generation"]["python"] = {"repository_io": repository_io}
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-python-fastapi-export-{repository_io}-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            adapters = outputs["gen/python/src/generated/sqlalchemy_adapters.py"]
+            self.assertIn(export_line, adapters)
+            self.assertIn("execution_options(yield_per=chunk_size)", adapters)
+            for name, content in outputs.items():
+                if name.endswith(".py"):
+                    compile(content, name, "exec")
+
+        persistence = outputs["gen/python/src/generated/persistence.py"]
+        self.assertIn("def export(self, filter: OrderQueryFilter, chunk_size: int = 250) -> AsyncIterator[List[Order]]: ...", persistence)
+        encoders = outputs["gen/python/src/generated/response_encoders.py"]
+        self.assertIn("def order_export_encoder(export_format: str) -> Optional[Tuple[str, bytes, Callable[[List[Order]], bytes]]]:", encoders)
+        self.assertIn("return 'text/csv; charset=utf-8', _csv_bytes([ORDER_CSV_COLUMNS]), order_chunk_to_csv", encoders)
+        routes = outputs["gen/python/src/generated/fastapi_routes.py"]
+        self.assertIn("@router.post('/orders/export')", routes)
+        self.assertIn("async for chunk in repositories.order.export(filter_model):", routes)
+        self.assertIn("return StreamingResponse(stream(), media_type=media_type)", routes)
+
+        cfg["generation"].pop("python")
+        cfg["generation"]["stack"] = {"id": "python_django_django_orm"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "django", "django_orm", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-django-export-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        adapters = outputs["gen/python/src/generated/django_adapters.py"]
+        self.assertIn("for row in queryset.iterator(chunk_size=chunk_size):", adapters)
+        views = outputs["gen/python/src/generated/django_views.py"]
+        self.assertIn("return StreamingHttpResponse(stream(), content_type=media_type)", views)
+        urls = outputs["gen/python/src/generated/django_urls.py"]
+        self.assertLess(urls.index("path('orders/export', views.export_order),"), urls.index("path('orders/<str:id>', views.get_order),"))
+
+    def test_python_field_projection_pushes_columns_into_queries_and_encoders(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["query"] = {"field_projection": True}
+        cfg["generation"]["stack"] = {"id": "python_fastapi_sqlalchemy"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "fastapi", "sqlalchemy", "manifest"]
+        for repository_io in ("inline", "thread_offload", "async_session"):
+            cfg["generation"]["python"] = {"repository_io": repository_io}
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-python-fastapi-projection-{repository_io}-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            adapters = outputs["gen/python/src/generated/sqlalchemy_adapters.py"]
+            self.assertIn("stmt = stmt.options(load_only(*[getattr(model, name) for name in fields], raiseload=True))", adapters)
+            self.assertIn("def _order_to_projected_domain(record: Models.OrderModel, fields: Optional[List[str]]) -> Domain.Order:", adapters)
+            for name, content in outputs.items():
+                if name.endswith(".py"):
+                    compile(content, name, "exec")
+
+        persistence = outputs["gen/python/src/generated/persistence.py"]
+        self.assertIn("class InvalidFieldsError(ValueError):", persistence)
+        decoders = outputs["gen/python/src/generated/request_decoders.py"]
+        self.assertIn("return select_fields(value, ORDER_PROJECTION_FIELDS, ORDER_PROJECTION_KEY_FIELDS)", decoders)
+        encoders = outputs["gen/python/src/generated/response_encoders.py"]
+        self.assertIn("def order_page_to_projected_json_bytes(", encoders)
+        routes = outputs["gen/python/src/generated/fastapi_routes.py"]
+        self.assertIn("fields: Optional[str] = Query(default=None)", routes)
+        self.assertIn("return Response(content=order_page_to_projected_json_bytes(result, projection), media_type='application/json')", routes)
+        loaders = outputs["gen/python/src/generated/loaders.py"]
+        self.assertIn("return await self._repository.get_by_id(id, fields=fields)", loaders)
+
+        cfg["generation"].pop("python")
+        cfg["generation"]["stack"] = {"id": "python_django_django_orm"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "django", "django_orm", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-django-projection-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        adapters = outputs["gen/python/src/generated/django_adapters.py"]
+        self.assertIn("return queryset if fields is None else queryset.only(*fields)", adapters)
+        views = outputs["gen/python/src/generated/django_views.py"]
+        self.assertIn("'invalid_fields'", views)
+
+    def test_python_transitions_use_update_returning(self) -> None:
+        cfg = self._base_cfg()
+        stacks = {
+            "python_fastapi_sqlalchemy": ("sqlalchemy", "sqlalchemy_adapters.py", "fastapi"),
+            "python_flask_sqlmodel": ("sqlmodel", "sqlmodel_adapters.py", "flask"),
+        }
+        for stack_id, (orm, adapter_name, framework) in stacks.items():
+            cfg["generation"]["stack"] = {"id": stack_id}
+            cfg["generation"]["targets"] = ["sql", "openapi", "python", framework, orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-python-{orm}-returning-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            adapters = outputs[f"gen/python/src/generated/{adapter_name}"]
+            self.assertIn("if session.get_bind().dialect.update_returning:", adapters)
+            self.assertIn("record = session.scalars(stmt.returning(Models.OrderModel)).first()", adapters)
+            self.assertIn("transitioned = _order_to_domain(record)", adapters)
+            self.assertIn("                probe = select(Models.OrderModel.state)", adapters)
+            self.assertIn("return Persistence.TransitionRejected(current_state=session.", adapters)
+
+        cfg["generation"]["stack"] = {"id": "python_django_django_orm"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "django", "django_orm", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-django-returning-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        adapters = outputs["gen/python/src/generated/django_adapters.py"]
+        self.assertIn("def _update_state_returning(model, lookups: List[dict], expected_state: str, next_state: str) -> tuple:", adapters)
+        self.assertIn("returned, records = _update_state_returning(self._model, [lookup], expected_state, next_state)", adapters)
+        self.assertIn("            current_state = self._model.objects.filter(**lookup).values_list('state', flat=True).first()", adapters)
+
+    def test_python_transition_handlers_skip_pre_read_without_custom_validator(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_flask_sqlalchemy"}
+        cfg["generation"]["targets"] = ["python", "flask", "sqlalchemy"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-transition-pre-read-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        transitions = outputs["gen/python/src/generated/transitions.py"]
+        self.assertIn(
+            "        self._validator = validator if type(validator) is not OrderTransitionValidatorDefault else None",
+            transitions,
+        )
+        self.assertIn(
+            "        if self._validator is not None:\n"
+            "            current = self._repository.get_by_id(id)",
+            transitions,
+        )
+        self.assertIn(
+            "            if current.state != 'created':\n"
+            "                raise RuntimeError(f\"Invalid state transition Order.approve: expected created but was {current.state}\")\n"
+            "        transitioned = self._repository.apply_transition(id, 'created', 'approved', 'trans_order_approve')",
+            transitions,
+        )
+        self.assertIn(
+            "        if isinstance(transitioned, TransitionRejected):\n"
+            "            if transitioned.missing:\n"
+            "                raise RuntimeError(\"Order not found for transition 'approve'\")\n"
+            "            raise RuntimeError(f\"Invalid state transition Order.approve: expected created but was {transitioned.current_state}\")",
+            transitions,
+        )
+        self.assertEqual(transitions.count("self._repository.get_by_id(id)"), 2)
+        self.assertIn("class TransitionRejected:", outputs["gen/python/src/generated/persistence.py"])
+        compile(transitions, "transitions.py", "exec")
+
+    def test_python_repositories_render_bulk_save_and_transition(self) -> None:
+        cfg = self._base_cfg()
+        stacks = {
+            "python_fastapi_sqlalchemy": (
+                "sqlalchemy",
+                "sqlalchemy_adapters.py",
+                "fastapi",
+                "session.execute(insert(Models.OrderStateHistoryModel), history)",
+            ),
+            "python_flask_sqlmodel": ("sqlmodel", "sqlmodel_adapters.py", "flask", "session.bulk_save_objects(history)"),
+        }
+        for stack_id, (orm, adapter_name, framework, history_line) in stacks.items():
+            cfg["generation"]["stack"] = {"id": stack_id}
+            cfg["generation"]["targets"] = ["sql", "openapi", "python", framework, orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-python-{orm}-bulk-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            persistence = outputs["gen/python/src/generated/persistence.py"]
+            self.assertIn("def save_many(self, items: List[Order]) -> List[Order]: ...", persistence)
+            self.assertIn(
+                "def apply_transition_many(self, ids: List[OrderRef], expected_state: OrderState, next_state: OrderState, transition_id: str) -> List[Order]: ...",
+                persistence,
+            )
+            adapters = outputs[f"gen/python/src/generated/{adapter_name}"]
+            self.assertIn("def _upsert_statement(session, model):", adapters)
+            self.assertIn("stmt = _upsert_statement(session, Models.OrderModel)", adapters)
+            self.assertIn("                for start in range(0, len(items), _SAVE_MANY_CHUNK_SIZE):", adapters)
+            self.assertIn(history_line, adapters)
+
+        cfg["generation"]["stack"] = {"id": "python_django_django_orm"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "django", "django_orm", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-django-bulk-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        adapters = outputs["gen/python/src/generated/django_adapters.py"]
+        self.assertIn("def save_many(self, items: List[Domain.Order]) -> List[Domain.Order]:", adapters)
+        self.assertIn("            batch_size=_SAVE_MANY_CHUNK_SIZE,", adapters)
+        self.assertIn("returned, records = _update_state_returning(self._model, lookups, expected_state, next_state)", adapters)
+        self.assertIn("Models.OrderStateHistoryModel.objects.bulk_create(", adapters)
+
+    def test_python_save_uses_dialect_upsert_with_merge_escape_hatch(self) -> None:
+        stacks = {
+            "python_flask_sqlalchemy": ("sqlalchemy", "sqlalchemy_adapters.py", "flask", "session.execute(stmt, _column_values(model))"),
+            "python_flask_sqlmodel": ("sqlmodel", "sqlmodel_adapters.py", "flask", "session.exec(stmt, params=_column_values(model))"),
+            "python_django_django_orm": ("django_orm", "django_adapters.py", "django", "if self._bulk_upsert([self._model(**payload)]):"),
+        }
+        for stack_id, (orm, adapter_name, framework, upsert_line) in stacks.items():
+            for strategy in ("upsert", "merge"):
+                cfg = self._base_cfg()
+                cfg["generation"]["stack"] = {"id": stack_id}
+                cfg["generation"]["targets"] = ["sql", "openapi", "python", framework, orm, "manifest"]
+                cfg["generation"]["python"] = {"save_strategy": strategy}
+                ir = build_ir(self._ontology(), cfg)
+                with tempfile.TemporaryDirectory(prefix=f"prophet-python-{orm}-save-{strategy}-") as tmp:
+                    outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+                adapters = outputs[f"gen/python/src/generated/{adapter_name}"]
+                if strategy == "upsert":
+                    self.assertIn(upsert_line, adapters)
+                else:
+                    self.assertNotIn(upsert_line, adapters)
+
+    def test_python_repositories_render_get_by_ids_and_batch_loaders(self) -> None:
+        stacks = {
+            "python_fastapi_sqlalchemy": ("sqlalchemy", "sqlalchemy_adapters.py", "fastapi", "async def get_by_ids("),
+            "python_flask_sqlmodel": ("sqlmodel", "sqlmodel_adapters.py", "flask", "def _get_by_ids_sync("),
+            "python_django_django_orm": ("django_orm", "django_adapters.py", "django", "self._model.objects.filter(orderId__in=[id.orderId for id in ids])"),
+        }
+        for stack_id, (orm, adapter_name, framework, adapter_line) in stacks.items():
+            cfg = self._base_cfg()
+            cfg["generation"]["stack"] = {"id": stack_id}
+            cfg["generation"]["targets"] = ["sql", "openapi", "python", framework, orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-python-{orm}-get-by-ids-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            persistence = outputs["gen/python/src/generated/persistence.py"]
+            self.assertIn("def get_by_ids(self, ids: List[OrderRef]) -> List[Optional[Order]]: ...", persistence)
+            adapters = outputs[f"gen/python/src/generated/{adapter_name}"]
+            self.assertIn(adapter_line, adapters)
+            self.assertIn("return [found.get((id.orderId,)) for id in ids]", adapters)
+            loaders = outputs["gen/python/src/generated/loaders.py"]
+            self.assertIn("class RepositoryLoaders:", loaders)
+            self.assertIn("BatchLoader(repositories.order.get_by_ids, _order_key)", loaders)
+            if framework == "fastapi":
+                self.assertIn("loop.call_soon(lambda: loop.create_task(self._dispatch()))", loaders)
+            else:
+                self.assertNotIn("asyncio", loaders)
+
+    def test_python_loaders_render_identity_map_repositories(self) -> None:
+        for stack_id, framework, orm, call in (
+            ("python_fastapi_sqlalchemy", "fastapi", "sqlalchemy", "await "),
+            ("python_django_django_orm", "django", "django_orm", ""),
+        ):
+            cfg = self._base_cfg()
+            cfg["generation"]["stack"] = {"id": stack_id}
+            cfg["generation"]["targets"] = ["sql", "openapi", "python", framework, orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-python-{orm}-identity-map-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            loaders = outputs["gen/python/src/generated/loaders.py"]
+            self.assertIn("class IdentityMapRepository(Generic[K, V]):", loaders)
+            self.assertIn("class StatefulIdentityMapRepository(IdentityMapRepository[K, V]):", loaders)
+            self.assertIn(f"            self._entries[key] = {call}self._repository.get_by_id(id)", loaders)
+            self.assertIn(
+                f"        transitioned = {call}self._repository.apply_transition(id, expected_state, next_state, transition_id)",
+                loaders,
+            )
+            self.assertIn("class IdentityMapRepositories:", loaders)
+            self.assertIn("StatefulIdentityMapRepository(repositories.order, _order_key)", loaders)
+
+    def test_python_cache_renders_cached_repositories_with_pluggable_backends(self) -> None:
+        for stack_id, framework, orm, call in (
+            ("python_fastapi_sqlalchemy", "fastapi", "sqlalchemy", "await "),
+            ("python_flask_sqlmodel", "flask", "sqlmodel", ""),
+        ):
+            cfg = self._base_cfg()
+            cfg["generation"]["stack"] = {"id": stack_id}
+            cfg["generation"]["targets"] = ["sql", "openapi", "python", framework, orm, "manifest"]
+            ir = build_ir(self._ontology(), cfg)
+            with tempfile.TemporaryDirectory(prefix=f"prophet-python-{orm}-cache-") as tmp:
+                outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+            cache = outputs["gen/python/src/generated/cache.py"]
+            self.assertIn("class CacheBackend(Protocol):", cache)
+            self.assertIn("class InMemoryCacheBackend:", cache)
+            self.assertIn("        return self._decode(json.loads(cached))", cache)
+            self.assertNotIn("stores_bytes", cache)
+            self.assertIn("                self.stats.evictions += 1", cache)
+            self.assertIn(f"        return list({call}self._client.mget([self._prefix + key for key in keys]))", cache)
+            self.assertIn(f"        {call}self._cache.invalidate([self._cache_key(id)])", cache)
+            self.assertIn(
+                "StatefulCachedRepository(\n            repositories.order,\n            self.cache,\n            'Order',\n"
+                "            _order_key,\n            Encoders.order_to_json_bytes,\n            Decoders.decode_order,\n        )",
+                cache,
+            )
+            self.assertIn("CachedRepository(\n            repositories.user,", cache)
+            self.assertNotIn("pickle", cache)
+            self.assertIn(f"        return bool({call}self._client.eval(_REDIS_FILL_SCRIPT, 1, self._prefix + key, *args))", cache)
+            self.assertIn(f"            {call}self._cache.backend.fill(key, observed, self._dump(value), self._cache.ttl_seconds)", cache)
+            self.assertIn(f"        {call}self.backend.delete(keys, self.invalidation_hold_seconds)", cache)
+            decoders = outputs["gen/python/src/generated/request_decoders.py"]
+            self.assertIn("def decode_order(value: Any) -> Order:", decoders)
+            self.assertIn("        kwargs['shippingAddress'] = decode_address(value['shippingAddress'])", decoders)
+
+    def test_python_events_render_compiled_payload_serializers(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_flask_sqlalchemy"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "flask", "sqlalchemy", "manifest"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-event-serializers-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        events = outputs["gen/python/src/generated/events.py"]
+        self.assertIn("def _serialize_payment_captured_payload(payload: object, updated_objects: List[dict[str, object]]) -> dict[str, object]:", events)
+        self.assertIn("        'order': _order_ref_to_wire(payload.order, updated_objects),", events)
+        self.assertIn("        'packageIds': None if payload.packageIds is None else list(payload.packageIds),", events)
+        self.assertIn("        updated_objects.append({'object_type': 'Order', 'object_ref': object_ref, 'object': candidate})", events)
+        self.assertIn("    PaymentCapturedDomainEvent: _serialize_payment_captured_payload,", events)
+        self.assertIn("    payload = _payload_serializer_for(event)(getattr(event, 'payload', {}), updated_objects)", events)
+        self.assertNotIn("isinstance(event, PaymentCapturedDomainEvent)", events)
+        self.assertNotIn("_normalize_value_refs", events)
+
+        payment_captured = next(event for event in ir["events"] if event["name"] == "PaymentCaptured")
+        payment_captured["fields"].append(
+            {"id": "fld_sig_payment_captured_approval", "name": "approval", "type": {"kind": "struct", "target_struct_id": "struct_approval_context"}}
+        )
+        with tempfile.TemporaryDirectory(prefix="prophet-python-event-serializers-") as tmp:
+            events = build_generated_outputs(ir, cfg, root=Path(tmp))["gen/python/src/generated/events.py"]
+        self.assertIn("        'approval': _approval_context_to_wire(payload.approval, updated_objects),", events)
+        self.assertIn("        return _normalize_value_refs(_plain(value), _APPROVAL_CONTEXT_REF_BINDINGS, updated_objects)", events)
+        compile(events, "events.py", "exec")
+
+    def test_python_event_outbox_renders_table_models_and_transactional_service(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_fastapi_sqlalchemy"}
+        cfg["generation"]["targets"] = ["sql", "openapi", "python", "fastapi", "sqlalchemy", "manifest"]
+        cfg["generation"]["python"] = {"event_outbox": True, "repository_io": "async_session"}
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-outbox-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        schema = outputs["gen/sql/schema.sql"]
+        self.assertIn("create table if not exists prophet_event_outbox (", schema)
+        self.assertIn("create index if not exists idx_prophet_outbox_pending on prophet_event_outbox (published_at, created_at);", schema)
+        self.assertIn("  parked_at timestamptz", schema)
+
+        models = outputs["gen/python/src/generated/sqlalchemy_models.py"]
+        self.assertIn("class EventOutboxModel(Base):", models)
+        self.assertIn("    envelope: Mapped[str] = mapped_column('envelope', Text, nullable=False)", models)
+
+        adapters = outputs["gen/python/src/generated/sqlalchemy_adapters.py"]
+        self.assertIn("class SqlAlchemyTransactionalSessionFactory:", adapters)
+        self.assertIn("    async def transaction(self) -> AsyncIterator[None]:", adapters)
+        self.assertIn("            await session.execute(insert(_OUTBOX), rows)", adapters)
+        self.assertIn("class SqlAlchemyEventOutboxStore:", adapters)
+        self.assertEqual(1, adapters.count("from typing import "))
+        self.assertIn("from typing import Any, AsyncIterator, Callable, List, Optional", adapters)
+        self.assertIn("from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession", adapters)
+        self.assertLess(adapters.index("from datetime import"), adapters.index("from sqlalchemy import"))
+        self.assertIn("                _OUTBOX.c.parked_at.is_(None),", adapters)
+        self.assertIn("            if session.get_bind().dialect.name in _SKIP_LOCKED_DIALECTS:", adapters)
+        self.assertIn("                stmt = stmt.with_for_update(skip_locked=True)", adapters)
+        self.assertIn("    async def mark_parked(self, event_ids: List[str], error: str) -> None:", adapters)
+
+        service = outputs["gen/python/src/generated/action_service.py"]
+        self.assertIn("        self.transaction = transaction if transaction is not None else nullcontext", service)
+        self.assertIn("        async with self.transaction():", service)
+        self.assertIn("            await publish_domain_events(context.eventPublisher, events, metadata)", service)
+
+        cfg["generation"]["stack"] = {"id": "python_django_django_orm"}
+        cfg["generation"]["targets"] = ["sql", "python", "django", "django_orm"]
+        cfg["generation"]["python"] = {"event_outbox": True}
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-outbox-django-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+        self.assertIn("        db_table = 'prophet_event_outbox'", outputs["gen/python/src/generated/django_models.py"])
+        django_adapters = outputs["gen/python/src/generated/django_adapters.py"]
+        self.assertIn("class DjangoEventOutboxStore:", django_adapters)
+        self.assertIn("        return transaction.atomic(using=router.db_for_write(Models.EventOutboxModel))", django_adapters)
+        self.assertIn("                pending = pending.select_for_update(skip_locked=True)", django_adapters)
+        self.assertIn("    def mark_parked(self, event_ids: List[str], error: str) -> None:", django_adapters)
+        self.assertIn("        with self.transaction():", outputs["gen/python/src/generated/action_service.py"])
+
+    def test_python_event_consumer_renders_decoders_ordering_and_handlers(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_flask_sqlalchemy"}
+        cfg["generation"]["targets"] = ["python", "flask", "sqlalchemy"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-event-consumer-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+        consumer = outputs["gen/python/src/generated/event_consumer.py"]
+        self.assertIn("    'PaymentCaptured': (PaymentCapturedDomainEvent, _decode_payment_captured_payload),", consumer)
+        self.assertIn("        kwargs['order'] = _decode_order_ref_or_object(value['order'], updated_objects)", consumer)
+        self.assertIn("        return RequestDecoders.decode_order(snapshot)", consumer)
+        self.assertIn("    return RequestDecoders.decode_order_ref(value)", consumer)
+        self.assertNotIn("get_type_hints", consumer)
+        self.assertNotIn("try:", consumer)
+        self.assertIn("def decode_domain_event(envelope: EventWireEnvelope) -> DomainEvent:", consumer)
+        self.assertIn("        return object_ordering_key('Order', {'orderId': payload.get('orderId')})", consumer)
+        self.assertIn("        return object_ordering_key('Order', payload.get('order'))", consumer)
+        self.assertIn(
+            "    paymentCaptured: Optional[Callable[[PaymentCapturedDomainEvent, EventWireEnvelope], None]] = None",
+            consumer,
+        )
+        self.assertIn("        consumer.on('PaymentCaptured', handlers.paymentCaptured, blocking=True)", consumer)
+        compile(consumer, "event_consumer.py", "exec")
+
+    def test_python_request_decoders_render_straight_line_decoders(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_flask_sqlalchemy"}
+        cfg["generation"]["targets"] = ["python", "flask", "sqlalchemy"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-request-decoders-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+        decoders = outputs["gen/python/src/generated/request_decoders.py"]
+        self.assertIn("def decode_create_order_command(value: Any) -> CreateOrderCommand:", decoders)
+        self.assertIn("        kwargs['customer'] = decode_user_ref(value['customer'])", decoders)
+        self.assertIn("def decode_user_ref(value: Any) -> UserRef:", decoders)
+        self.assertIn("def decode_order_query_filter(value: Any) -> OrderQueryFilter:", decoders)
+        self.assertIn(
+            "        kwargs['inValues'] = [decode_user_ref(item0) for item0 in field_value] if isinstance(field_value, list) else field_value",
+            decoders,
+        )
+        self.assertNotIn("get_type_hints", decoders)
+        self.assertNotIn("try:", decoders)
+        compile(decoders, "request_decoders.py", "exec")
+
+    def test_python_response_encoders_render_per_type_encoders(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_flask_sqlalchemy"}
+        cfg["generation"]["targets"] = ["python", "flask", "sqlalchemy"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-response-encoders-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+        encoders = outputs["gen/python/src/generated/response_encoders.py"]
+        self.assertIn("from prophet_events_runtime import dumps_json_bytes", encoders)
+        self.assertIn("def order_to_json_dict(value: Order) -> dict[str, object]:", encoders)
+        self.assertIn("        'customer': _encode_user_ref(value.customer),", encoders)
+        self.assertIn(
+            "        'shippingAddress': None if value.shippingAddress is None else _encode_address(value.shippingAddress),",
+            encoders,
+        )
+        self.assertIn("        'content': [order_to_json_dict(item) for item in value.content],", encoders)
+        self.assertIn("def create_order_result_to_json_bytes(value: CreateOrderResult) -> bytes:", encoders)
+        self.assertIn("    if isinstance(value, Order):\n        return order_to_json_dict(value)", encoders)
+        compile(encoders, "response_encoders.py", "exec")
+
+    def test_python_model_style_renders_slotted_dataclasses_or_msgspec_structs(self) -> None:
+        stacks = {
+            "python_fastapi_sqlalchemy": ("fastapi", "sqlalchemy", "sqlalchemy_adapters.py"),
+            "python_flask_sqlmodel": ("flask", "sqlmodel", "sqlmodel_adapters.py"),
+            "python_django_django_orm": ("django", "django_orm", "django_adapters.py"),
+        }
+        for stack_id, (framework, orm, adapter_name) in stacks.items():
+            for style in ("slots", "msgspec"):
+                cfg = self._base_cfg()
+                cfg["generation"]["stack"] = {"id": stack_id}
+                cfg["generation"]["targets"] = ["python", framework, orm]
+                cfg["generation"]["python"] = {"model_style": style}
+                ir = build_ir(self._ontology(), cfg)
+                with tempfile.TemporaryDirectory(prefix=f"prophet-python-model-style-{style}-") as tmp:
+                    outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+                domain = outputs["gen/python/src/generated/domain.py"]
+                encoders = outputs["gen/python/src/generated/response_encoders.py"]
+                pyproject = outputs["gen/python/pyproject.toml"]
+                if style == "slots":
+                    self.assertIn("@dataclass(kw_only=True, slots=True)\nclass Order:", domain)
+                    self.assertIn("dumps_json_bytes(order_to_json_dict(value))", encoders)
+                    self.assertNotIn("msgspec", pyproject)
+                else:
+                    self.assertIn("class Order(msgspec.Struct, kw_only=True):", domain)
+                    self.assertNotIn("@dataclass", domain)
+                    self.assertIn("_JSON_ENCODER = msgspec.json.Encoder()", encoders)
+                    self.assertIn("    return _JSON_ENCODER.encode(value)", encoders)
+                    self.assertIn("msgspec.to_builtins(", outputs[f"gen/python/src/generated/{adapter_name}"])
+                    self.assertNotIn("msgspec", outputs["gen/python/src/generated/event_consumer.py"])
+                    self.assertIn('"msgspec>=0.18.6"', pyproject)
+                for path, content in outputs.items():
+                    if path.endswith(".py"):
+                        compile(content, path, "exec")
+
+    def test_python_event_snapshots_config_renders_policies_and_baselines(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_fastapi_sqlalchemy"}
+        cfg["generation"]["targets"] = ["python", "fastapi", "sqlalchemy"]
+        cfg["generation"]["python"] = {
+            "event_snapshots": {
+                "mode": "changed",
+                "max_bytes": 4096,
+                "events": {"PaymentCaptured": "ref_only", "Unknown": "full", "OrderShipTransition": {"mode": "bogus"}},
+            }
+        }
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-event-snapshots-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+        events = outputs["gen/python/src/generated/events.py"]
+        self.assertIn("_DEFAULT_SNAPSHOT_POLICY = SnapshotPolicy(mode='changed', max_bytes=4096)", events)
+        self.assertIn("    'PaymentCaptured': SnapshotPolicy(mode='ref_only', max_bytes=4096),", events)
+        self.assertNotIn("'Unknown'", events)
+        self.assertNotIn("'OrderShipTransition': SnapshotPolicy", events)
+        self.assertIn("    EventContracts.Order: ('Order', ['orderId'], _order_to_dict),", events)
+        compile(events, "events.py", "exec")
+        service = outputs["gen/python/src/generated/action_service.py"]
+        self.assertIn("        context = replace(context, snapshotBaselines=SnapshotBaselines())", service)
+        self.assertIn("            snapshot_baselines=context.snapshotBaselines,", service)
+        compile(service, "action_service.py", "exec")
+
+    def test_python_triggers_render_dispatcher_bindings(self) -> None:
+        cfg = self._base_cfg()
+        ir = build_ir(self._ontology(), cfg)
+        self.assertTrue(ir["triggers"])
+        for stack_id, framework, orm, async_mode in (
+            ("python_fastapi_sqlalchemy", "fastapi", "sqlalchemy", True),
+            ("python_django_django_orm", "django", "django_orm", False),
+        ):
+            cfg["generation"]["stack"] = {"id": stack_id}
+            cfg["generation"]["targets"] = ["python", framework, orm]
+            with tempfile.TemporaryDirectory(prefix="prophet-python-triggers-") as tmp:
+                outputs = build_generated_outputs(build_ir(self._ontology(), cfg), cfg, root=Path(tmp))
+            triggers = outputs["gen/python/src/generated/triggers.py"]
+            self.assertIn("    'onPaymentCaptured': 'PaymentCaptured',", triggers)
+            self.assertIn("    def onPaymentCaptured(self, envelope: EventWireEnvelope) -> Optional[ApproveOrderCommand]: ...", triggers)
+            self.assertIn("        return replace(context, eventPublisher=dispatcher, traceId=envelope.trace_id)", triggers)
+            self.assertIn("                failures.append((envelope, error))", triggers)
+            self.assertIn("            raise TriggerBatchError(failures)", triggers)
+            if async_mode:
+                self.assertIn("                    await service.execute_approveOrder(action_input, trigger_context(envelope))", triggers)
+                self.assertNotIn("blocking=True", triggers)
+            else:
+                self.assertIn("                    service.execute_approveOrder(action_input, trigger_context(envelope))", triggers)
+                self.assertIn("                blocking=True,", triggers)
+            compile(triggers, "triggers.py", "exec")
+
+    def test_wire_schema_target_tags_event_fields_from_field_ids(self) -> None:
+        cfg = self._base_cfg()
+        cfg["generation"]["stack"] = {"id": "python_flask_sqlalchemy"}
+        cfg["generation"]["targets"] = ["python", "flask", "sqlalchemy", "wire_schema"]
+        ir = build_ir(self._ontology(), cfg)
+        with tempfile.TemporaryDirectory(prefix="prophet-python-wire-schema-") as tmp:
+            outputs = build_generated_outputs(ir, cfg, root=Path(tmp))
+
+        document = json.loads(outputs["gen/wire/event-codec.json"])
+        self.assertEqual(1, document["codec_version"])
+        self.assertEqual(ir["ontology"]["version"], document["schema_version"])
+        events = {event["event_type"]: event for event in document["events"]}
+        self.assertTrue(events)
+        for event in ir["events"]:
+            fields = events[pascal_case(event["name"])]["fields"]
+            tags = wire_field_tags([field["id"] for field in event["fields"]])
+            self.assertEqual([tags[field["id"]] for field in event["fields"]], [field["tag"] for field in fields])
+            self.assertEqual([field["id"] for field in event["fields"]], [field["field_id"] for field in fields])
+
     def test_autodetect_selects_python_fastapi_sqlmodel(self) -> None:
         with tempfile.TemporaryDirectory(prefix="prophet-autodetect-python-fastapi-") as tmp:
             root = Path(tmp)
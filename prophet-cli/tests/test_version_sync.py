@@ -1,11 +1,32 @@
 from __future__ import annotations
 
+import copy
+import json
 import re
+import sys
+import tempfile
 import unittest
 from pathlib import Path
 
 THIS_FILE = Path(__file__).resolve()
 PROJECT_ROOT = THIS_FILE.parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "prophet-cli" / "src"))
+
+from prophet_cli.cli import build_generated_outputs
+from prophet_cli.cli import build_ir
+from prophet_cli.cli import load_config
+from prophet_cli.cli import parse_ontology
+from prophet_cli.targets.runtime_versions import DEFAULT_RUNTIME_VERSION
+
+EXAMPLE_ROOT = PROJECT_ROOT / "examples" / "java" / "prophet_example_spring"
+RUNTIME_ROOT = PROJECT_ROOT / "prophet-lib"
+PYTHON_STACKS = {
+    "python_fastapi_sqlalchemy": ("fastapi", "sqlalchemy"),
+    "python_fastapi_sqlmodel": ("fastapi", "sqlmodel"),
+    "python_flask_sqlalchemy": ("flask", "sqlalchemy"),
+    "python_flask_sqlmodel": ("flask", "sqlmodel"),
+    "python_django_django_orm": ("django", "django_orm"),
+}
 
 
 class VersionSyncTests(unittest.TestCase):
@@ -26,5 +47,51 @@ class VersionSyncTests(unittest.TestCase):
         )
 
 
+    def test_runtime_package_versions_match_default_runtime_pin(self) -> None:
+        versions = {
+            "prophet-lib/VERSION": (RUNTIME_ROOT / "VERSION").read_text(encoding="utf-8").strip(),
+        }
+        for relative, pattern in (
+            ("python/pyproject.toml", r'^version\s*=\s*"([^"]+)"\s*$'),
+            ("javascript/package.json", r'^\s*"version"\s*:\s*"([^"]+)"'),
+            ("java/build.gradle.kts", r'^version\s*=\s*"([^"]+)"\s*$'),
+        ):
+            match = re.search(pattern, (RUNTIME_ROOT / relative).read_text(encoding="utf-8"), re.MULTILINE)
+            self.assertIsNotNone(match, f"Unable to find version in prophet-lib/{relative}")
+            versions[f"prophet-lib/{relative}"] = match.group(1)  # type: ignore[union-attr]
+
+        for source, version in versions.items():
+            self.assertEqual(
+                DEFAULT_RUNTIME_VERSION,
+                version,
+                f"{source} and DEFAULT_RUNTIME_VERSION must stay in sync so generated code pins the runtime it uses",
+            )
+
+    def test_generated_python_imports_only_the_pinned_runtime_api(self) -> None:
+        manifest = json.loads((RUNTIME_ROOT / "python" / "public-api.json").read_text(encoding="utf-8"))
+        self.assertIn(DEFAULT_RUNTIME_VERSION, manifest, "public-api.json needs an entry for DEFAULT_RUNTIME_VERSION")
+        pinned_api = set(manifest[DEFAULT_RUNTIME_VERSION])
+        ontology = parse_ontology((EXAMPLE_ROOT / "ontology" / "local" / "main.prophet").read_text(encoding="utf-8"))
+
+        for stack_id, (framework, orm) in PYTHON_STACKS.items():
+            cfg = copy.deepcopy(load_config(EXAMPLE_ROOT / "prophet.yaml"))
+            cfg["generation"]["stack"] = {"id": stack_id}
+            cfg["generation"]["targets"] = ["python", framework, orm]
+            cfg["generation"]["python"] = {"event_outbox": True, "event_snapshots": {"mode": "changed"}}
+            with tempfile.TemporaryDirectory(prefix="prophet-runtime-api-") as tmp:
+                outputs = build_generated_outputs(build_ir(ontology, cfg), cfg, root=Path(tmp))
+
+            imported = set()
+            for path, content in outputs.items():
+                if path.endswith(".py"):
+                    imported.update(re.findall(r"^\s*from prophet_events_runtime import (\w+)", content, re.MULTILINE))
+                    imported.update(re.findall(r"\bprophet_events_runtime\.(\w+)", content))
+            self.assertTrue(imported, stack_id)
+            self.assertEqual(
+                set(),
+                imported - pinned_api,
+                f"{stack_id} imports runtime APIs missing from prophet-events-runtime {DEFAULT_RUNTIME_VERSION}",
+            )
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,7 @@ plugins {
 }
 
 group = "io.github.chainso"
-version = "0.5.0"
+version = "0.6.0"
 
 java {
     toolchain {
@@ -0,0 +1,353 @@
+package io.prophet.events.runtime;
+
+import java.time.Duration;
+import java.util.ArrayDeque;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Objects;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CompletionException;
+import java.util.concurrent.CompletionStage;
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.locks.Condition;
+import java.util.concurrent.locks.ReentrantLock;
+import java.util.function.BiConsumer;
+
+/**
+ * Publisher wrapper that coalesces envelopes from concurrent actions into size- and linger-bounded batches.
+ *
+ * <p>{@link #publish} and {@link #publishBatch} complete once envelopes are queued. A daemon worker thread
+ * forwards batches to the delegate publisher one at a time; failed batches are reported to the error handler
+ * and not retried.
+ */
+public final class BufferedEventPublisher implements EventPublisher, AutoCloseable {
+    /**
+     * Behavior when the bounded queue is full.
+     */
+    public enum OverflowPolicy {
+        /** Wait for the worker to free space. */
+        BLOCK,
+        /** Discard the oldest queued envelope. */
+        DROP_OLDEST,
+        /** Discard the envelope being published. */
+        DROP_NEWEST,
+        /** Fail the publish with {@link RejectedExecutionException}. */
+        REJECT
+    }
+
+    private static final System.Logger LOGGER = System.getLogger(BufferedEventPublisher.class.getName());
+
+    private final EventPublisher delegate;
+    private final int maxBatchSize;
+    private final long lingerNanos;
+    private final int maxQueueSize;
+    private final OverflowPolicy overflow;
+    private final BiConsumer<Throwable, List<EventWireEnvelope>> onError;
+    private final ArrayDeque<EventWireEnvelope> buffer = new ArrayDeque<>();
+    private final ReentrantLock lock = new ReentrantLock();
+    private final Condition changed = lock.newCondition();
+    private final Thread worker;
+    private int inFlight;
+    private int flushRequests;
+    private boolean closed;
+    private long publishedCount;
+    private long failedCount;
+    private long droppedCount;
+
+    /**
+     * Creates a buffered publisher with 100-envelope batches, a 5 ms linger, a 10,000-envelope queue,
+     * and blocking overflow.
+     *
+     * @param delegate publisher that receives coalesced batches
+     */
+    public BufferedEventPublisher(EventPublisher delegate) {
+        this(delegate, 100, Duration.ofMillis(5), 10_000, OverflowPolicy.BLOCK, null);
+    }
+
+    /**
+     * Creates a buffered publisher.
+     *
+     * @param delegate publisher that receives coalesced batches
+     * @param maxBatchSize maximum envelopes per delegate batch
+     * @param linger how long a partial batch waits for more envelopes
+     * @param maxQueueSize maximum queued envelopes before the overflow policy applies
+     * @param overflow behavior when the queue is full
+     * @param onError handler for failed batches, or {@code null} to log them
+     */
+    public BufferedEventPublisher(
+        EventPublisher delegate,
+        int maxBatchSize,
+        Duration linger,
+        int maxQueueSize,
+        OverflowPolicy overflow,
+        BiConsumer<Throwable, List<EventWireEnvelope>> onError
+    ) {
+        if (maxBatchSize < 1) {
+            throw new IllegalArgumentException("maxBatchSize must be >= 1");
+        }
+        if (maxQueueSize < maxBatchSize) {
+            throw new IllegalArgumentException("maxQueueSize must be >= maxBatchSize");
+        }
+        this.delegate = Objects.requireNonNull(delegate, "delegate");
+        this.maxBatchSize = maxBatchSize;
+        this.lingerNanos = Math.max(0L, linger.toNanos());
+        this.maxQueueSize = maxQueueSize;
+        this.overflow = Objects.requireNonNull(overflow, "overflow");
+        this.onError = onError != null
+            ? onError
+            : (error, envelopes) -> LOGGER.log(
+                System.Logger.Level.ERROR,
+                "Buffered event publish failed for " + envelopes.size() + " envelope(s)",
+                error
+            );
+        this.worker = new Thread(this::run, "prophet-event-buffer");
+        this.worker.setDaemon(true);
+        this.worker.start();
+    }
+
+    @Override
+    public CompletionStage<Void> publish(EventWireEnvelope envelope) {
+        return publishBatch(List.of(envelope));
+    }
+
+    @Override
+    public CompletionStage<Void> publishBatch(List<EventWireEnvelope> envelopes) {
+        try {
+            offer(envelopes);
+            return CompletableFuture.completedFuture(null);
+        } catch (InterruptedException error) {
+            Thread.currentThread().interrupt();
+            return CompletableFuture.failedFuture(error);
+        } catch (RuntimeException error) {
+            return CompletableFuture.failedFuture(error);
+        }
+    }
+
+    /**
+     * Waits until every queued envelope has been handed to the delegate.
+     *
+     * @param timeout maximum time to wait
+     * @return {@code true} when the buffer drained before the timeout
+     * @throws InterruptedException when interrupted while waiting
+     */
+    public boolean flush(Duration timeout) throws InterruptedException {
+        long remaining = timeout.toNanos();
+        lock.lock();
+        try {
+            flushRequests++;
+            changed.signalAll();
+            try {
+                while (!buffer.isEmpty() || inFlight > 0) {
+                    if (remaining <= 0L) {
+                        return false;
+                    }
+                    remaining = changed.awaitNanos(remaining);
+                }
+                return true;
+            } finally {
+                flushRequests--;
+            }
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    /**
+     * Stops accepting envelopes, drains the buffer, and stops the worker thread.
+     *
+     * @param timeout maximum time to wait for the drain
+     * @return {@code true} when the buffer drained before the timeout
+     * @throws InterruptedException when interrupted while waiting
+     */
+    public boolean close(Duration timeout) throws InterruptedException {
+        lock.lock();
+        try {
+            closed = true;
+            changed.signalAll();
+        } finally {
+            lock.unlock();
+        }
+        boolean drained = flush(timeout);
+        worker.join(Math.max(1L, TimeUnit.NANOSECONDS.toMillis(timeout.toNanos())));
+        return drained;
+    }
+
+    /**
+     * Stops accepting envelopes and waits up to 30 seconds for the buffer to drain.
+     */
+    @Override
+    public void close() {
+        try {
+            close(Duration.ofSeconds(30));
+        } catch (InterruptedException error) {
+            Thread.currentThread().interrupt();
+        }
+    }
+
+    /**
+     * Returns the number of queued envelopes not yet handed to the delegate.
+     *
+     * @return queued envelope count
+     */
+    public int size() {
+        lock.lock();
+        try {
+            return buffer.size();
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    /**
+     * Returns the number of envelopes the delegate accepted.
+     *
+     * @return published envelope count
+     */
+    public long publishedCount() {
+        lock.lock();
+        try {
+            return publishedCount;
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    /**
+     * Returns the number of envelopes in batches the delegate failed to publish.
+     *
+     * @return failed envelope count
+     */
+    public long failedCount() {
+        lock.lock();
+        try {
+            return failedCount;
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    /**
+     * Returns the number of envelopes discarded by the overflow policy.
+     *
+     * @return dropped envelope count
+     */
+    public long droppedCount() {
+        lock.lock();
+        try {
+            return droppedCount;
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    private void offer(List<EventWireEnvelope> envelopes) throws InterruptedException {
+        lock.lock();
+        try {
+            for (EventWireEnvelope envelope : envelopes) {
+                if (closed) {
+                    throw new IllegalStateException("BufferedEventPublisher is closed");
+                }
+                boolean dropNewest = false;
+                while (buffer.size() >= maxQueueSize && !dropNewest) {
+                    switch (overflow) {
+                        case DROP_OLDEST -> {
+                            buffer.pollFirst();
+                            droppedCount++;
+                        }
+                        case DROP_NEWEST -> dropNewest = true;
+                        case REJECT -> throw new RejectedExecutionException(
+                            "event buffer is full (" + maxQueueSize + " envelopes)"
+                        );
+                        case BLOCK -> {
+                            changed.signalAll();
+                            changed.await();
+                            if (closed) {
+                                throw new IllegalStateException("BufferedEventPublisher is closed");
+                            }
+                        }
+                    }
+                }
+                if (dropNewest) {
+                    droppedCount++;
+                    continue;
+                }
+                buffer.addLast(envelope);
+            }
+            changed.signalAll();
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    private List<EventWireEnvelope> nextBatch() throws InterruptedException {
+        lock.lock();
+        try {
+            while (buffer.isEmpty()) {
+                if (closed) {
+                    return null;
+                }
+                changed.await();
+            }
+            long remaining = lingerNanos;
+            while (buffer.size() < maxBatchSize && !closed && flushRequests == 0 && remaining > 0L) {
+                remaining = changed.awaitNanos(remaining);
+            }
+            int size = Math.min(buffer.size(), maxBatchSize);
+            List<EventWireEnvelope> batch = new ArrayList<>(size);
+            for (int index = 0; index < size; index++) {
+                batch.add(buffer.pollFirst());
+            }
+            inFlight++;
+            changed.signalAll();
+            return batch;
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    private void run() {
+        while (true) {
+            List<EventWireEnvelope> batch;
+            try {
+                batch = nextBatch();
+            } catch (InterruptedException error) {
+                Thread.currentThread().interrupt();
+                return;
+            }
+            if (batch == null) {
+                return;
+            }
+            boolean published = false;
+            try {
+                delegate.publishBatch(batch).toCompletableFuture().join();
+                published = true;
+            } catch (CompletionException error) {
+                reportError(error.getCause() != null ? error.getCause() : error, batch);
+            } catch (RuntimeException error) {
+                reportError(error, batch);
+            } finally {
+                lock.lock();
+                try {
+                    if (published) {
+                        publishedCount += batch.size();
+                    } else {
+                        failedCount += batch.size();
+                    }
+                    inFlight--;
+                    changed.signalAll();
+                } finally {
+                    lock.unlock();
+                }
+            }
+        }
+    }
+
+    private void reportError(Throwable error, List<EventWireEnvelope> batch) {
+        try {
+            onError.accept(error, batch);
+        } catch (RuntimeException handlerError) {
+            LOGGER.log(System.Logger.Level.ERROR, "Buffered event publisher error handler failed", handlerError);
+        }
+    }
+}
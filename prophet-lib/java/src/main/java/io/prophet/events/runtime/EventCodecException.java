@@ -0,0 +1,17 @@
+package io.prophet.events.runtime;
+
+/**
+ * Raised when an envelope cannot be encoded to or decoded from the compact wire codec.
+ */
+public final class EventCodecException extends IllegalArgumentException {
+    private static final long serialVersionUID = 1L;
+
+    /**
+     * Creates a codec exception.
+     *
+     * @param message failure description
+     */
+    public EventCodecException(String message) {
+        super(message);
+    }
+}
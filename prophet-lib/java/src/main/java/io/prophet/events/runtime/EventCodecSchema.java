@@ -0,0 +1,54 @@
+package io.prophet.events.runtime;
+
+import java.util.HashMap;
+import java.util.Map;
+import java.util.Objects;
+
+/**
+ * Payload field tags for one ontology version, as emitted to {@code gen/wire/event-codec.json}.
+ */
+public final class EventCodecSchema {
+    private static final int MAX_TAG = 0xFFFF;
+
+    private final String schemaVersion;
+    private final Map<String, Map<String, Integer>> tagsByEventType = new HashMap<>();
+    private final Map<String, Map<Integer, String>> namesByEventType = new HashMap<>();
+
+    /**
+     * Creates a codec schema from the field tags listed in the generated schema.
+     *
+     * @param schemaVersion ontology schema version the tags apply to
+     * @param fieldTagsByEventType payload field name to tag (1..65535) per event type
+     */
+    public EventCodecSchema(String schemaVersion, Map<String, Map<String, Integer>> fieldTagsByEventType) {
+        this.schemaVersion = Objects.requireNonNull(schemaVersion, "schemaVersion");
+        for (Map.Entry<String, Map<String, Integer>> entry : fieldTagsByEventType.entrySet()) {
+            Map<Integer, String> names = new HashMap<>();
+            for (Map.Entry<String, Integer> field : entry.getValue().entrySet()) {
+                Integer tag = field.getValue();
+                if (tag == null || tag < 1 || tag > MAX_TAG || names.put(tag, field.getKey()) != null) {
+                    throw new EventCodecException("invalid field tags for event '" + entry.getKey() + "'");
+                }
+            }
+            tagsByEventType.put(entry.getKey(), Map.copyOf(entry.getValue()));
+            namesByEventType.put(entry.getKey(), Map.copyOf(names));
+        }
+    }
+
+    /**
+     * Returns the ontology schema version the tags apply to.
+     *
+     * @return schema version
+     */
+    public String schemaVersion() {
+        return schemaVersion;
+    }
+
+    Map<String, Integer> tagsFor(String eventType, String envelopeSchemaVersion) {
+        return schemaVersion.equals(envelopeSchemaVersion) ? tagsByEventType.get(eventType) : null;
+    }
+
+    Map<Integer, String> namesFor(String eventType, String envelopeSchemaVersion) {
+        return schemaVersion.equals(envelopeSchemaVersion) ? namesByEventType.get(eventType) : null;
+    }
+}
@@ -0,0 +1,524 @@
+package io.prophet.events.runtime;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.nio.ByteBuffer;
+import java.nio.charset.CharacterCodingException;
+import java.nio.charset.CodingErrorAction;
+import java.nio.charset.StandardCharsets;
+import java.time.DateTimeException;
+import java.time.Instant;
+import java.time.OffsetDateTime;
+import java.time.ZoneOffset;
+import java.time.format.DateTimeFormatter;
+import java.time.temporal.TemporalAccessor;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collection;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.UUID;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
+
+/**
+ * Compact binary encoding of {@link EventWireEnvelope} (see {@code prophet-lib/specs/wire-compact-codec.md}).
+ */
+public final class EventWireCodec {
+    /**
+     * Codec version written as the first element of every message.
+     */
+    public static final int CODEC_VERSION = 1;
+
+    private static final Pattern UUID_PATTERN =
+        Pattern.compile("^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$");
+    private static final Pattern TIMESTAMP_PATTERN = Pattern.compile(
+        "^(\\d{4})-(\\d{2})-(\\d{2})T(\\d{2}):(\\d{2}):(\\d{2})(?:\\.(\\d{1,9}))?(Z|[+-]\\d{2}:\\d{2})$"
+    );
+    private static final DateTimeFormatter TIMESTAMP_FORMAT =
+        DateTimeFormatter.ofPattern("uuuu-MM-dd'T'HH:mm:ss.SSSSSS'Z'").withZone(ZoneOffset.UTC);
+
+    private EventWireCodec() {}
+
+    /**
+     * Encodes an envelope without payload field tags.
+     *
+     * @param envelope envelope to encode
+     * @return encoded message
+     */
+    public static byte[] encode(EventWireEnvelope envelope) {
+        return encode(envelope, null);
+    }
+
+    /**
+     * Encodes an envelope, replacing top-level payload keys with tags from the schema when it matches.
+     *
+     * @param envelope envelope to encode
+     * @param schema codec schema, or {@code null}
+     * @return encoded message
+     */
+    public static byte[] encode(EventWireEnvelope envelope, EventCodecSchema schema) {
+        Map<String, Integer> tags = schema == null ? null : schema.tagsFor(envelope.eventType(), envelope.schemaVersion());
+        Writer writer = new Writer();
+        writer.header(10, 0x90, 16, -1, 0xdc, 0xdd);
+        writer.integer(CODEC_VERSION);
+        writer.value(encodeId(envelope.eventId()));
+        writer.value(encodeId(envelope.traceId()));
+        writer.string(envelope.eventType());
+        writer.string(envelope.schemaVersion());
+        writer.value(encodeTimestamp(envelope.occurredAt()));
+        writer.string(envelope.source());
+        Map<String, Object> payload = envelope.payload() == null ? Map.of() : envelope.payload();
+        writer.header(payload.size(), 0x80, 16, -1, 0xde, 0xdf);
+        for (Map.Entry<String, Object> entry : payload.entrySet()) {
+            Integer tag = tags == null ? null : tags.get(entry.getKey());
+            if (tag != null) {
+                writer.integer(tag);
+            } else {
+                writer.string(entry.getKey());
+            }
+            writer.value(entry.getValue());
+        }
+        writer.value(envelope.attributes());
+        List<Map<String, Object>> updatedObjects = envelope.updatedObjects();
+        if (updatedObjects == null) {
+            writer.write(0xc0);
+        } else {
+            writer.header(updatedObjects.size(), 0x90, 16, -1, 0xdc, 0xdd);
+            for (Map<String, Object> item : updatedObjects) {
+                writer.value(Arrays.asList(item.get("object_type"), item.get("object_ref"), item.get("object")));
+            }
+        }
+        return writer.toByteArray();
+    }
+
+    /**
+     * Decodes a message whose payload uses string keys only.
+     *
+     * @param data encoded message
+     * @return decoded envelope
+     */
+    public static EventWireEnvelope decode(byte[] data) {
+        return decode(data, null);
+    }
+
+    /**
+     * Decodes a message, mapping payload field tags back to names with the schema.
+     *
+     * @param data encoded message
+     * @param schema codec schema, or {@code null}
+     * @return decoded envelope
+     */
+    public static EventWireEnvelope decode(byte[] data, EventCodecSchema schema) {
+        Reader reader = new Reader(data);
+        Object decoded = reader.value();
+        if (reader.offset != data.length) {
+            throw new EventCodecException("trailing bytes after envelope");
+        }
+        if (!(decoded instanceof List<?> value) || value.size() != 10) {
+            throw new EventCodecException("envelope must be a 10-element array");
+        }
+        if (!Integer.valueOf(CODEC_VERSION).equals(value.get(0))) {
+            throw new EventCodecException("unsupported codec version: " + value.get(0));
+        }
+        String eventType = expectString(value.get(3), "event_type");
+        String schemaVersion = expectString(value.get(4), "schema_version");
+        if (!(value.get(7) instanceof Map<?, ?> rawPayload)) {
+            throw new EventCodecException("payload must be a map");
+        }
+        Map<String, Object> payload = new LinkedHashMap<>();
+        Map<Integer, String> names = null;
+        for (Map.Entry<?, ?> entry : rawPayload.entrySet()) {
+            if (entry.getKey() instanceof Integer tag) {
+                if (names == null) {
+                    names = schema == null ? null : schema.namesFor(eventType, schemaVersion);
+                    if (names == null) {
+                        throw new EventCodecException("no codec schema for " + eventType + " " + schemaVersion);
+                    }
+                }
+                String name = names.get(tag);
+                if (name == null) {
+                    throw new EventCodecException("unknown field tag " + tag + " for " + eventType);
+                }
+                payload.put(name, entry.getValue());
+            } else if (entry.getKey() instanceof String key) {
+                payload.put(key, entry.getValue());
+            } else {
+                throw new EventCodecException("payload keys must be strings or integer tags");
+            }
+        }
+        Map<String, String> attributes = null;
+        if (value.get(8) != null) {
+            if (!(value.get(8) instanceof Map<?, ?> rawAttributes)) {
+                throw new EventCodecException("attributes must be a map");
+            }
+            attributes = new LinkedHashMap<>();
+            for (Map.Entry<?, ?> entry : rawAttributes.entrySet()) {
+                attributes.put(String.valueOf(entry.getKey()), expectString(entry.getValue(), "attribute"));
+            }
+        }
+        List<Map<String, Object>> updatedObjects = null;
+        if (value.get(9) != null) {
+            if (!(value.get(9) instanceof List<?> rawObjects)) {
+                throw new EventCodecException("updated_objects must be an array");
+            }
+            updatedObjects = new ArrayList<>(rawObjects.size());
+            for (Object rawItem : rawObjects) {
+                if (!(rawItem instanceof List<?> item) || item.size() != 3) {
+                    throw new EventCodecException("updated_objects must be an array of [object_type, object_ref, object]");
+                }
+                Map<String, Object> updated = new LinkedHashMap<>();
+                updated.put("object_type", item.get(0));
+                updated.put("object_ref", item.get(1));
+                updated.put("object", item.get(2));
+                updatedObjects.add(updated);
+            }
+        }
+        return new EventWireEnvelope(
+            decodeId(value.get(1)),
+            decodeId(value.get(2)),
+            eventType,
+            schemaVersion,
+            decodeTimestamp(value.get(5)),
+            expectString(value.get(6), "source"),
+            payload,
+            attributes,
+            updatedObjects
+        );
+    }
+
+    private static String expectString(Object value, String name) {
+        if (!(value instanceof String text)) {
+            throw new EventCodecException(name + " must be a string");
+        }
+        return text;
+    }
+
+    private static Object encodeId(String value) {
+        if (!UUID_PATTERN.matcher(value).matches()) {
+            return value;
+        }
+        UUID uuid = UUID.fromString(value);
+        return ByteBuffer.allocate(16)
+            .putLong(uuid.getMostSignificantBits())
+            .putLong(uuid.getLeastSignificantBits())
+            .array();
+    }
+
+    private static String decodeId(Object value) {
+        if (value instanceof byte[] bytes) {
+            if (bytes.length != 16) {
+                throw new EventCodecException("binary ids must be 16 bytes");
+            }
+            ByteBuffer buffer = ByteBuffer.wrap(bytes);
+            return new UUID(buffer.getLong(), buffer.getLong()).toString();
+        }
+        return expectString(value, "id");
+    }
+
+    private static Object encodeTimestamp(String value) {
+        Matcher matcher = TIMESTAMP_PATTERN.matcher(value);
+        if (!matcher.matches()) {
+            return value;
+        }
+        String fraction = matcher.group(7) == null ? "" : matcher.group(7);
+        fraction = (fraction + "000000000").substring(0, 9);
+        if (!fraction.endsWith("000")) {
+            return value;
+        }
+        try {
+            String offset = matcher.group(8);
+            OffsetDateTime moment = OffsetDateTime.of(
+                Integer.parseInt(matcher.group(1)),
+                Integer.parseInt(matcher.group(2)),
+                Integer.parseInt(matcher.group(3)),
+                Integer.parseInt(matcher.group(4)),
+                Integer.parseInt(matcher.group(5)),
+                Integer.parseInt(matcher.group(6)),
+                Integer.parseInt(fraction),
+                "Z".equals(offset) ? ZoneOffset.UTC : ZoneOffset.of(offset)
+            );
+            Instant instant = moment.toInstant();
+            return Math.addExact(Math.multiplyExact(instant.getEpochSecond(), 1_000_000L), instant.getNano() / 1_000L);
+        } catch (DateTimeException | ArithmeticException error) {
+            return value;
+        }
+    }
+
+    private static String decodeTimestamp(Object value) {
+        if (value instanceof Integer || value instanceof Long) {
+            long micros = ((Number) value).longValue();
+            try {
+                Instant instant = Instant.ofEpochSecond(
+                    Math.floorDiv(micros, 1_000_000L),
+                    Math.floorMod(micros, 1_000_000L) * 1_000L
+                );
+                return TIMESTAMP_FORMAT.format(instant);
+            } catch (DateTimeException error) {
+                throw new EventCodecException("occurred_at out of range");
+            }
+        }
+        return expectString(value, "occurred_at");
+    }
+
+    private static final class Writer {
+        private byte[] bytes = new byte[256];
+        private int size;
+
+        void write(int value) {
+            ensure(1);
+            bytes[size++] = (byte) value;
+        }
+
+        void writeBytes(byte[] value) {
+            ensure(value.length);
+            System.arraycopy(value, 0, bytes, size, value.length);
+            size += value.length;
+        }
+
+        void writeUnsigned(long value, int width) {
+            ensure(width);
+            for (int shift = (width - 1) * 8; shift >= 0; shift -= 8) {
+                bytes[size++] = (byte) (value >>> shift);
+            }
+        }
+
+        void header(int length, int fixed, int fixedLimit, int size8, int size16, int size32) {
+            if (fixed >= 0 && length < fixedLimit) {
+                write(fixed | length);
+            } else if (size8 >= 0 && length <= 0xff) {
+                write(size8);
+                writeUnsigned(length, 1);
+            } else if (length <= 0xffff) {
+                write(size16);
+                writeUnsigned(length, 2);
+            } else {
+                write(size32);
+                writeUnsigned(length, 4);
+            }
+        }
+
+        void integer(long value) {
+            if (value >= 0 && value < 0x80) {
+                write((int) value);
+            } else if (value < 0 && value >= -0x20) {
+                write((int) (value & 0xff));
+            } else if (value >= 0 && value <= 0xffL) {
+                write(0xcc);
+                writeUnsigned(value, 1);
+            } else if (value >= 0 && value <= 0xffffL) {
+                write(0xcd);
+                writeUnsigned(value, 2);
+            } else if (value >= 0 && value <= 0xffffffffL) {
+                write(0xce);
+                writeUnsigned(value, 4);
+            } else if (value >= 0) {
+                write(0xcf);
+                writeUnsigned(value, 8);
+            } else if (value >= -0x80) {
+                write(0xd0);
+                writeUnsigned(value, 1);
+            } else if (value >= -0x8000) {
+                write(0xd1);
+                writeUnsigned(value, 2);
+            } else if (value >= -0x80000000L) {
+                write(0xd2);
+                writeUnsigned(value, 4);
+            } else {
+                write(0xd3);
+                writeUnsigned(value, 8);
+            }
+        }
+
+        void string(String value) {
+            byte[] encoded = value.getBytes(StandardCharsets.UTF_8);
+            header(encoded.length, 0xa0, 32, 0xd9, 0xda, 0xdb);
+            writeBytes(encoded);
+        }
+
+        void value(Object value) {
+            if (value == null) {
+                write(0xc0);
+            } else if (value instanceof Boolean flag) {
+                write(flag ? 0xc3 : 0xc2);
+            } else if (value instanceof Byte || value instanceof Short || value instanceof Integer || value instanceof Long) {
+                integer(((Number) value).longValue());
+            } else if (value instanceof BigInteger big) {
+                if (big.signum() >= 0 && big.bitLength() <= 64) {
+                    write(0xcf);
+                    writeUnsigned(big.longValue(), 8);
+                } else if (big.bitLength() <= 63) {
+                    integer(big.longValue());
+                } else {
+                    throw new EventCodecException("integer out of range: " + big);
+                }
+            } else if (value instanceof Float || value instanceof Double) {
+                write(0xcb);
+                writeUnsigned(Double.doubleToLongBits(((Number) value).doubleValue()), 8);
+            } else if (value instanceof BigDecimal decimal) {
+                string(decimal.toPlainString());
+            } else if (value instanceof CharSequence text) {
+                string(text.toString());
+            } else if (value instanceof byte[] binary) {
+                header(binary.length, -1, 0, 0xc4, 0xc5, 0xc6);
+                writeBytes(binary);
+            } else if (value instanceof Collection<?> items) {
+                header(items.size(), 0x90, 16, -1, 0xdc, 0xdd);
+                for (Object item : items) {
+                    value(item);
+                }
+            } else if (value instanceof Map<?, ?> map) {
+                header(map.size(), 0x80, 16, -1, 0xde, 0xdf);
+                for (Map.Entry<?, ?> entry : map.entrySet()) {
+                    string(String.valueOf(entry.getKey()));
+                    value(entry.getValue());
+                }
+            } else if (value instanceof Enum<?> constant) {
+                string(constant.name());
+            } else if (value instanceof TemporalAccessor || value instanceof UUID) {
+                string(value.toString());
+            } else {
+                throw new EventCodecException("cannot encode value of type " + value.getClass().getName());
+            }
+        }
+
+        byte[] toByteArray() {
+            return Arrays.copyOf(bytes, size);
+        }
+
+        private void ensure(int extra) {
+            if (size + extra > bytes.length) {
+                bytes = Arrays.copyOf(bytes, Math.max(bytes.length * 2, size + extra));
+            }
+        }
+    }
+
+    private static final class Reader {
+        private final byte[] bytes;
+        private int offset;
+
+        Reader(byte[] bytes) {
+            this.bytes = bytes;
+        }
+
+        private int take(int size) {
+            if (size < 0 || offset + size > bytes.length) {
+                throw new EventCodecException("truncated message");
+            }
+            int start = offset;
+            offset += size;
+            return start;
+        }
+
+        private long readUnsigned(int width) {
+            int start = take(width);
+            long result = 0;
+            for (int index = 0; index < width; index++) {
+                result = (result << 8) | (bytes[start + index] & 0xffL);
+            }
+            return result;
+        }
+
+        private int length(int width) {
+            long value = readUnsigned(width);
+            if (value > Integer.MAX_VALUE) {
+                throw new EventCodecException("length out of range");
+            }
+            return (int) value;
+        }
+
+        private static Object narrow(long value) {
+            if (value >= Integer.MIN_VALUE && value <= Integer.MAX_VALUE) {
+                return (int) value;
+            }
+            return value;
+        }
+
+        Object value() {
+            int code = bytes[take(1)] & 0xff;
+            if (code <= 0x7f) {
+                return code;
+            }
+            if (code >= 0xe0) {
+                return code - 0x100;
+            }
+            if (code >= 0x80 && code <= 0x8f) {
+                return map(code & 0x0f);
+            }
+            if (code >= 0x90 && code <= 0x9f) {
+                return array(code & 0x0f);
+            }
+            if (code >= 0xa0 && code <= 0xbf) {
+                return string(code & 0x1f);
+            }
+            return switch (code) {
+                case 0xc0 -> null;
+                case 0xc2 -> Boolean.FALSE;
+                case 0xc3 -> Boolean.TRUE;
+                case 0xc4 -> binary(length(1));
+                case 0xc5 -> binary(length(2));
+                case 0xc6 -> binary(length(4));
+                case 0xca -> (double) Float.intBitsToFloat((int) readUnsigned(4));
+                case 0xcb -> Double.longBitsToDouble(readUnsigned(8));
+                case 0xcc -> (int) readUnsigned(1);
+                case 0xcd -> (int) readUnsigned(2);
+                case 0xce -> narrow(readUnsigned(4));
+                case 0xcf -> {
+                    long raw = readUnsigned(8);
+                    yield raw >= 0 ? narrow(raw) : new BigInteger(Long.toUnsignedString(raw));
+                }
+                case 0xd0 -> (int) (byte) readUnsigned(1);
+                case 0xd1 -> (int) (short) readUnsigned(2);
+                case 0xd2 -> (int) readUnsigned(4);
+                case 0xd3 -> narrow(readUnsigned(8));
+                case 0xd9 -> string(length(1));
+                case 0xda -> string(length(2));
+                case 0xdb -> string(length(4));
+                case 0xdc -> array(length(2));
+                case 0xdd -> array(length(4));
+                case 0xde -> map(length(2));
+                case 0xdf -> map(length(4));
+                default -> throw new EventCodecException(String.format("unsupported MessagePack type 0x%02x", code));
+            };
+        }
+
+        private byte[] binary(int size) {
+            int start = take(size);
+            return Arrays.copyOfRange(bytes, start, start + size);
+        }
+
+        private String string(int size) {
+            int start = take(size);
+            try {
+                return StandardCharsets.UTF_8.newDecoder()
+                    .onMalformedInput(CodingErrorAction.REPORT)
+                    .onUnmappableCharacter(CodingErrorAction.REPORT)
+                    .decode(ByteBuffer.wrap(bytes, start, size))
+                    .toString();
+            } catch (CharacterCodingException error) {
+                throw new EventCodecException("invalid UTF-8 string");
+            }
+        }
+
+        private List<Object> array(int size) {
+            List<Object> result = new ArrayList<>(Math.min(size, 1024));
+            for (int index = 0; index < size; index++) {
+                result.add(value());
+            }
+            return result;
+        }
+
+        private Map<Object, Object> map(int size) {
+            Map<Object, Object> result = new LinkedHashMap<>();
+            for (int index = 0; index < size; index++) {
+                Object key = value();
+                if (!(key instanceof String) && !(key instanceof Integer)) {
+                    throw new EventCodecException("map keys must be strings or integer tags");
+                }
+                result.put(key, value());
+            }
+            return result;
+        }
+    }
+}
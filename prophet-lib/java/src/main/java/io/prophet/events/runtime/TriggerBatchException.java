@@ -0,0 +1,62 @@
+package io.prophet.events.runtime;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.function.Consumer;
+
+/**
+ * Thrown by a {@link TriggerBinding.Invoker} when only some envelopes of its batch failed.
+ *
+ * <p>The dispatcher retries just the listed envelopes; the rest of the batch counts as completed.
+ */
+public final class TriggerBatchException extends RuntimeException {
+    /**
+     * One failed envelope and its error.
+     *
+     * @param envelope envelope that failed
+     * @param error failure cause
+     */
+    public record Failure(EventWireEnvelope envelope, Throwable error) {}
+
+    private final List<Failure> failures;
+
+    /**
+     * Creates a batch failure.
+     *
+     * @param failures failed envelopes with their errors
+     */
+    public TriggerBatchException(List<Failure> failures) {
+        super(failures.size() + " trigger envelope(s) failed");
+        this.failures = List.copyOf(failures);
+    }
+
+    /**
+     * Returns the failed envelopes with their errors.
+     *
+     * @return failures
+     */
+    public List<Failure> failures() {
+        return failures;
+    }
+
+    /**
+     * Runs {@code action} for every envelope and throws once for all envelopes that failed.
+     *
+     * @param envelopes envelopes of the batch
+     * @param action per-envelope work
+     * @throws TriggerBatchException when at least one envelope failed
+     */
+    public static void runEach(List<EventWireEnvelope> envelopes, Consumer<EventWireEnvelope> action) {
+        List<Failure> failures = new ArrayList<>();
+        for (EventWireEnvelope envelope : envelopes) {
+            try {
+                action.accept(envelope);
+            } catch (RuntimeException error) {
+                failures.add(new Failure(envelope, error));
+            }
+        }
+        if (!failures.isEmpty()) {
+            throw new TriggerBatchException(failures);
+        }
+    }
+}
@@ -0,0 +1,49 @@
+package io.prophet.events.runtime;
+
+import java.util.List;
+import java.util.Objects;
+
+/**
+ * Binds one event type to the code that runs the triggered action for a batch of envelopes.
+ *
+ * @param name trigger name used in logs and failure reports
+ * @param eventType envelope event type that fires the trigger
+ * @param invoker runs the triggered action for a batch
+ * @param policy batching and retry settings
+ */
+public record TriggerBinding(String name, String eventType, Invoker invoker, TriggerPolicy policy) {
+    /**
+     * Runs a triggered action for a batch of envelopes.
+     */
+    @FunctionalInterface
+    public interface Invoker {
+        /**
+         * Handles a batch; throw {@link TriggerBatchException} to report which envelopes failed.
+         *
+         * @param envelopes envelopes of the batch
+         * @param dispatcher the dispatcher, so triggered actions can publish back into it
+         */
+        void invoke(List<EventWireEnvelope> envelopes, EventPublisher dispatcher);
+    }
+
+    /**
+     * Validates the binding.
+     */
+    public TriggerBinding {
+        Objects.requireNonNull(name, "name");
+        Objects.requireNonNull(eventType, "eventType");
+        Objects.requireNonNull(invoker, "invoker");
+        Objects.requireNonNull(policy, "policy");
+    }
+
+    /**
+     * Creates a binding with {@link TriggerPolicy#defaults()}.
+     *
+     * @param name trigger name
+     * @param eventType envelope event type that fires the trigger
+     * @param invoker runs the triggered action for a batch
+     */
+    public TriggerBinding(String name, String eventType, Invoker invoker) {
+        this(name, eventType, invoker, TriggerPolicy.defaults());
+    }
+}
@@ -0,0 +1,451 @@
+package io.prophet.events.runtime;
+
+import java.time.Duration;
+import java.util.ArrayDeque;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.IdentityHashMap;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CompletionException;
+import java.util.concurrent.CompletionStage;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.locks.Condition;
+import java.util.concurrent.locks.ReentrantLock;
+
+/**
+ * Publisher that runs trigger-bound actions in-process for the envelopes published through it.
+ *
+ * <p>Every published envelope is first forwarded to the downstream publisher (when set), then routed by
+ * {@code eventType} to every matching binding. Each binding groups its envelopes into batches of up to
+ * {@code policy.batchSize()}, waiting up to {@code policy.linger()} for a batch to fill, and at most
+ * {@code concurrency} batches run at once on a pool of daemon worker threads. Failed envelopes are retried with
+ * exponential backoff up to {@code policy.maxAttempts()} and then passed to the failure handler. An invoker that
+ * throws {@link TriggerBatchException} has only the envelopes it lists retried; any other exception retries every
+ * envelope still pending in the batch. Delivery is at-least-once.
+ */
+public final class TriggerDispatcher implements EventPublisher, AutoCloseable {
+    /**
+     * Receives envelopes that still failed after a binding's last attempt.
+     */
+    @FunctionalInterface
+    public interface FailureHandler {
+        /**
+         * Handles a final failure.
+         *
+         * @param binding binding whose invocation failed
+         * @param error last failure cause
+         * @param envelopes envelopes that failed with {@code error}
+         */
+        void onFailure(TriggerBinding binding, Throwable error, List<EventWireEnvelope> envelopes);
+    }
+
+    /**
+     * Snapshot of dispatcher counters.
+     *
+     * @param dispatched envelopes queued for a binding (once per matching binding)
+     * @param completed envelopes a binding handled successfully
+     * @param retried batch retries
+     * @param failed envelopes reported to the failure handler
+     * @param batches batches started
+     */
+    public record Stats(long dispatched, long completed, long retried, long failed, long batches) {}
+
+    private static final System.Logger LOGGER = System.getLogger(TriggerDispatcher.class.getName());
+
+    private static final class Lane {
+        private final TriggerBinding binding;
+        private final ArrayDeque<EventWireEnvelope> queue = new ArrayDeque<>();
+        private long firstQueuedAt;
+
+        private Lane(TriggerBinding binding) {
+            this.binding = binding;
+        }
+
+        private long readyAt() {
+            TriggerPolicy policy = binding.policy();
+            if (queue.size() >= policy.batchSize()) {
+                return firstQueuedAt;
+            }
+            return firstQueuedAt + Math.max(0L, policy.linger().toNanos());
+        }
+    }
+
+    private final List<TriggerBinding> bindings;
+    private final List<Lane> lanes = new ArrayList<>();
+    private final Map<String, List<Lane>> lanesByEventType = new LinkedHashMap<>();
+    private final int concurrency;
+    private final int maxQueueSize;
+    private final EventPublisher downstream;
+    private final FailureHandler onFailure;
+    private final ReentrantLock lock = new ReentrantLock();
+    private final Condition changed = lock.newCondition();
+    private final ExecutorService workers;
+    private final Thread scheduler;
+    private int nextLane;
+    private int active;
+    private int unfinished;
+    private boolean closed;
+    private long dispatchedCount;
+    private long completedCount;
+    private long retriedCount;
+    private long failedCount;
+    private long batchCount;
+
+    /**
+     * Creates a dispatcher with a concurrency of 4 and a 10,000-envelope queue per binding.
+     *
+     * @param bindings trigger bindings
+     * @param downstream publisher that receives every envelope, or {@code null}
+     */
+    public TriggerDispatcher(List<TriggerBinding> bindings, EventPublisher downstream) {
+        this(bindings, 4, 10_000, downstream, null);
+    }
+
+    /**
+     * Creates a dispatcher.
+     *
+     * @param bindings trigger bindings
+     * @param concurrency maximum batches running at once across all bindings
+     * @param maxQueueSize maximum queued envelopes per binding before publishes block
+     * @param downstream publisher that receives every envelope, or {@code null}
+     * @param onFailure handler for envelopes that exhausted their attempts, or {@code null} to log them
+     */
+    public TriggerDispatcher(
+        List<TriggerBinding> bindings,
+        int concurrency,
+        int maxQueueSize,
+        EventPublisher downstream,
+        FailureHandler onFailure
+    ) {
+        if (concurrency < 1) {
+            throw new IllegalArgumentException("concurrency must be >= 1");
+        }
+        if (maxQueueSize < 1) {
+            throw new IllegalArgumentException("maxQueueSize must be >= 1");
+        }
+        this.bindings = List.copyOf(bindings);
+        for (TriggerBinding binding : this.bindings) {
+            Lane lane = new Lane(binding);
+            lanes.add(lane);
+            lanesByEventType.computeIfAbsent(binding.eventType(), ignored -> new ArrayList<>()).add(lane);
+        }
+        this.concurrency = concurrency;
+        this.maxQueueSize = maxQueueSize;
+        this.downstream = downstream;
+        this.onFailure = onFailure != null
+            ? onFailure
+            : (binding, error, envelopes) -> LOGGER.log(
+                System.Logger.Level.ERROR,
+                "Trigger " + binding.name() + " failed for " + envelopes.size() + " envelope(s) after "
+                    + binding.policy().maxAttempts() + " attempt(s)",
+                error
+            );
+        AtomicInteger workerIndex = new AtomicInteger();
+        this.workers = Executors.newFixedThreadPool(concurrency, runnable -> {
+            Thread thread = new Thread(runnable, "prophet-trigger-worker-" + workerIndex.incrementAndGet());
+            thread.setDaemon(true);
+            return thread;
+        });
+        this.scheduler = new Thread(this::schedule, "prophet-trigger-dispatcher");
+        this.scheduler.setDaemon(true);
+        this.scheduler.start();
+    }
+
+    /**
+     * Returns the bindings this dispatcher routes to.
+     *
+     * @return trigger bindings
+     */
+    public List<TriggerBinding> bindings() {
+        return bindings;
+    }
+
+    @Override
+    public CompletionStage<Void> publish(EventWireEnvelope envelope) {
+        return publishBatch(List.of(envelope));
+    }
+
+    @Override
+    public CompletionStage<Void> publishBatch(List<EventWireEnvelope> envelopes) {
+        List<EventWireEnvelope> batch = List.copyOf(envelopes);
+        CompletionStage<Void> forwarded = downstream != null
+            ? downstream.publishBatch(batch)
+            : CompletableFuture.completedFuture(null);
+        return forwarded.thenRun(() -> {
+            try {
+                offer(batch);
+            } catch (InterruptedException error) {
+                Thread.currentThread().interrupt();
+                throw new CompletionException(error);
+            }
+        });
+    }
+
+    /**
+     * Waits until every dispatched envelope, including ones published by triggered actions, is handled.
+     *
+     * @param timeout maximum time to wait
+     * @return {@code true} when the dispatcher went idle before the timeout
+     * @throws InterruptedException when interrupted while waiting
+     */
+    public boolean drain(Duration timeout) throws InterruptedException {
+        long remaining = timeout.toNanos();
+        lock.lock();
+        try {
+            while (unfinished > 0) {
+                if (remaining <= 0L) {
+                    return false;
+                }
+                remaining = changed.awaitNanos(remaining);
+            }
+            return true;
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    /**
+     * Drains (up to {@code timeout}), then drops queued envelopes and stops the dispatcher's threads.
+     *
+     * @param timeout maximum time to wait for the drain
+     * @return {@code true} when the dispatcher drained before the timeout
+     * @throws InterruptedException when interrupted while waiting
+     */
+    public boolean close(Duration timeout) throws InterruptedException {
+        boolean drained = drain(timeout);
+        lock.lock();
+        try {
+            closed = true;
+            for (Lane lane : lanes) {
+                unfinished -= lane.queue.size();
+                lane.queue.clear();
+            }
+            changed.signalAll();
+        } finally {
+            lock.unlock();
+        }
+        scheduler.join();
+        workers.shutdownNow();
+        workers.awaitTermination(Math.max(1L, timeout.toMillis()), TimeUnit.MILLISECONDS);
+        return drained;
+    }
+
+    /**
+     * Drains for up to 30 seconds and stops the dispatcher.
+     */
+    @Override
+    public void close() {
+        try {
+            close(Duration.ofSeconds(30));
+        } catch (InterruptedException error) {
+            Thread.currentThread().interrupt();
+        }
+    }
+
+    /**
+     * Returns the number of dispatched envelopes not yet handled.
+     *
+     * @return unfinished envelope count
+     */
+    public int size() {
+        lock.lock();
+        try {
+            return unfinished;
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    /**
+     * Returns a snapshot of the dispatcher counters.
+     *
+     * @return counters
+     */
+    public Stats stats() {
+        lock.lock();
+        try {
+            return new Stats(dispatchedCount, completedCount, retriedCount, failedCount, batchCount);
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    private void offer(List<EventWireEnvelope> envelopes) throws InterruptedException {
+        lock.lock();
+        try {
+            for (EventWireEnvelope envelope : envelopes) {
+                for (Lane lane : lanesByEventType.getOrDefault(envelope.eventType(), List.of())) {
+                    while (lane.queue.size() >= maxQueueSize && !closed) {
+                        changed.await();
+                    }
+                    if (closed) {
+                        throw new IllegalStateException("TriggerDispatcher is closed");
+                    }
+                    if (lane.queue.isEmpty()) {
+                        lane.firstQueuedAt = System.nanoTime();
+                    }
+                    lane.queue.addLast(envelope);
+                    unfinished++;
+                    dispatchedCount++;
+                }
+            }
+            changed.signalAll();
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    private void schedule() {
+        try {
+            while (true) {
+                TriggerBinding binding;
+                List<EventWireEnvelope> batch;
+                lock.lock();
+                try {
+                    Lane ready = null;
+                    while (ready == null) {
+                        if (closed) {
+                            return;
+                        }
+                        long now = System.nanoTime();
+                        long waitNanos = Long.MAX_VALUE;
+                        if (active < concurrency) {
+                            for (int offset = 0; offset < lanes.size(); offset++) {
+                                int index = (nextLane + offset) % lanes.size();
+                                Lane candidate = lanes.get(index);
+                                if (candidate.queue.isEmpty()) {
+                                    continue;
+                                }
+                                long readyAt = candidate.readyAt();
+                                if (readyAt - now <= 0L) {
+                                    ready = candidate;
+                                    nextLane = index + 1;
+                                    break;
+                                }
+                                waitNanos = Math.min(waitNanos, readyAt - now);
+                            }
+                        }
+                        if (ready == null) {
+                            if (waitNanos == Long.MAX_VALUE) {
+                                changed.await();
+                            } else {
+                                changed.awaitNanos(waitNanos);
+                            }
+                        }
+                    }
+                    int size = Math.min(ready.queue.size(), ready.binding.policy().batchSize());
+                    batch = new ArrayList<>(size);
+                    for (int index = 0; index < size; index++) {
+                        batch.add(ready.queue.pollFirst());
+                    }
+                    ready.firstQueuedAt = System.nanoTime();
+                    binding = ready.binding;
+                    active++;
+                    batchCount++;
+                    changed.signalAll();
+                } finally {
+                    lock.unlock();
+                }
+                workers.execute(() -> run(binding, batch));
+            }
+        } catch (InterruptedException error) {
+            Thread.currentThread().interrupt();
+        }
+    }
+
+    private void run(TriggerBinding binding, List<EventWireEnvelope> batch) {
+        TriggerPolicy policy = binding.policy();
+        List<EventWireEnvelope> pending = batch;
+        try {
+            for (int attempt = 1; ; attempt++) {
+                List<TriggerBatchException.Failure> failures = invoke(binding, pending);
+                Set<EventWireEnvelope> failed = Collections.newSetFromMap(new IdentityHashMap<>());
+                for (TriggerBatchException.Failure failure : failures) {
+                    failed.add(failure.envelope());
+                }
+                List<EventWireEnvelope> retry = new ArrayList<>(failed.size());
+                for (EventWireEnvelope envelope : pending) {
+                    if (failed.contains(envelope)) {
+                        retry.add(envelope);
+                    }
+                }
+                boolean lastAttempt = failures.isEmpty() || attempt >= policy.maxAttempts();
+                lock.lock();
+                try {
+                    completedCount += pending.size() - retry.size();
+                    if (!failures.isEmpty()) {
+                        if (lastAttempt) {
+                            failedCount += failures.size();
+                        } else {
+                            retriedCount++;
+                        }
+                    }
+                } finally {
+                    lock.unlock();
+                }
+                if (lastAttempt) {
+                    reportFailures(binding, failures);
+                    return;
+                }
+                pending = retry;
+                double delayMillis = policy.backoff().toMillis() * Math.pow(2, attempt - 1);
+                Thread.sleep((long) Math.min(delayMillis, policy.maxBackoff().toMillis()));
+            }
+        } catch (InterruptedException error) {
+            Thread.currentThread().interrupt();
+        } finally {
+            lock.lock();
+            try {
+                active--;
+                unfinished -= batch.size();
+                changed.signalAll();
+            } finally {
+                lock.unlock();
+            }
+        }
+    }
+
+    private List<TriggerBatchException.Failure> invoke(TriggerBinding binding, List<EventWireEnvelope> envelopes) {
+        try {
+            binding.invoker().invoke(envelopes, this);
+            return List.of();
+        } catch (TriggerBatchException error) {
+            return error.failures();
+        } catch (RuntimeException error) {
+            List<TriggerBatchException.Failure> failures = new ArrayList<>(envelopes.size());
+            for (EventWireEnvelope envelope : envelopes) {
+                failures.add(new TriggerBatchException.Failure(envelope, error));
+            }
+            return failures;
+        }
+    }
+
+    private void reportFailures(TriggerBinding binding, List<TriggerBatchException.Failure> failures) {
+        // Envelopes that failed with the same exception are reported together.
+        Map<Throwable, List<EventWireEnvelope>> grouped = new IdentityHashMap<>();
+        List<Throwable> order = new ArrayList<>();
+        for (TriggerBatchException.Failure failure : failures) {
+            List<EventWireEnvelope> envelopes = grouped.get(failure.error());
+            if (envelopes == null) {
+                envelopes = new ArrayList<>();
+                grouped.put(failure.error(), envelopes);
+                order.add(failure.error());
+            }
+            envelopes.add(failure.envelope());
+        }
+        for (Throwable error : order) {
+            try {
+                onFailure.onFailure(binding, error, grouped.get(error));
+            } catch (RuntimeException handlerError) {
+                LOGGER.log(System.Logger.Level.ERROR, "Trigger failure handler raised for " + binding.name(), handlerError);
+            }
+        }
+    }
+}
@@ -0,0 +1,50 @@
+package io.prophet.events.runtime;
+
+import java.time.Duration;
+import java.util.Objects;
+
+/**
+ * Batching and retry settings for one {@link TriggerBinding}.
+ *
+ * @param batchSize maximum envelopes handed to one invocation
+ * @param linger how long a partial batch waits for more envelopes
+ * @param maxAttempts attempts per envelope before it is reported as failed
+ * @param backoff delay before the first retry; doubled for every further retry
+ * @param maxBackoff upper bound for the retry delay
+ */
+public record TriggerPolicy(int batchSize, Duration linger, int maxAttempts, Duration backoff, Duration maxBackoff) {
+    /**
+     * Validates the policy.
+     */
+    public TriggerPolicy {
+        if (batchSize < 1) {
+            throw new IllegalArgumentException("batchSize must be >= 1");
+        }
+        if (maxAttempts < 1) {
+            throw new IllegalArgumentException("maxAttempts must be >= 1");
+        }
+        Objects.requireNonNull(linger, "linger");
+        Objects.requireNonNull(backoff, "backoff");
+        Objects.requireNonNull(maxBackoff, "maxBackoff");
+    }
+
+    /**
+     * Returns the default policy: unbatched, three attempts, 100 ms backoff capped at 5 s.
+     *
+     * @return default policy
+     */
+    public static TriggerPolicy defaults() {
+        return new TriggerPolicy(1, Duration.ZERO, 3, Duration.ofMillis(100), Duration.ofSeconds(5));
+    }
+
+    /**
+     * Returns a copy of this policy with different batching.
+     *
+     * @param batchSize maximum envelopes handed to one invocation
+     * @param linger how long a partial batch waits for more envelopes
+     * @return updated policy
+     */
+    public TriggerPolicy withBatching(int batchSize, Duration linger) {
+        return new TriggerPolicy(batchSize, linger, maxAttempts, backoff, maxBackoff);
+    }
+}
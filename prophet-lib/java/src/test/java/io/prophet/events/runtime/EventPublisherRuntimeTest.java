@@ -1,11 +1,21 @@
 package io.prophet.events.runtime;
 
+import static org.junit.jupiter.api.Assertions.assertEquals;
 import static org.junit.jupiter.api.Assertions.assertFalse;
 import static org.junit.jupiter.api.Assertions.assertNull;
+import static org.junit.jupiter.api.Assertions.assertThrows;
 import static org.junit.jupiter.api.Assertions.assertTrue;
 
+import java.time.Duration;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.HexFormat;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CompletionException;
+import java.util.concurrent.CompletionStage;
 import org.junit.jupiter.api.Test;
 
 class EventPublisherRuntimeTest {
@@ -49,4 +59,166 @@ class EventPublisherRuntimeTest {
         assertFalse(failed.passesValidation());
         assertTrue("blocked".equals(failed.failureReason()));
     }
+
+    @Test
+    void bufferedPublisherCoalescesBatches() throws Exception {
+        List<Integer> batchSizes = Collections.synchronizedList(new ArrayList<>());
+        EventPublisher recording = new EventPublisher() {
+            @Override
+            public CompletionStage<Void> publish(EventWireEnvelope envelope) {
+                return publishBatch(List.of(envelope));
+            }
+
+            @Override
+            public CompletionStage<Void> publishBatch(List<EventWireEnvelope> envelopes) {
+                batchSizes.add(envelopes.size());
+                return CompletableFuture.completedFuture(null);
+            }
+        };
+        BufferedEventPublisher publisher = new BufferedEventPublisher(
+            recording,
+            4,
+            Duration.ofSeconds(5),
+            16,
+            BufferedEventPublisher.OverflowPolicy.BLOCK,
+            null
+        );
+
+        for (int index = 0; index < 6; index++) {
+            publisher.publish(envelope()).toCompletableFuture().join();
+        }
+
+        assertTrue(publisher.close(Duration.ofSeconds(5)));
+        assertEquals(List.of(4, 2), batchSizes);
+        assertEquals(6L, publisher.publishedCount());
+    }
+
+    @Test
+    void triggerDispatcherBatchesAndRetriesOnlyFailedEnvelopes() throws Exception {
+        List<Integer> forwarded = Collections.synchronizedList(new ArrayList<>());
+        EventPublisher downstream = new EventPublisher() {
+            @Override
+            public CompletionStage<Void> publish(EventWireEnvelope envelope) {
+                return publishBatch(List.of(envelope));
+            }
+
+            @Override
+            public CompletionStage<Void> publishBatch(List<EventWireEnvelope> envelopes) {
+                forwarded.add(envelopes.size());
+                return CompletableFuture.completedFuture(null);
+            }
+        };
+        List<List<String>> attempts = Collections.synchronizedList(new ArrayList<>());
+        List<String> failures = Collections.synchronizedList(new ArrayList<>());
+        TriggerBinding binding = new TriggerBinding(
+            "onExample",
+            "Example",
+            (envelopes, dispatcher) -> {
+                attempts.add(envelopes.stream().map(EventWireEnvelope::eventId).toList());
+                TriggerBatchException.runEach(envelopes, envelope -> {
+                    if (!"evt-1".equals(envelope.eventId())) {
+                        throw new IllegalStateException("bad " + envelope.eventId());
+                    }
+                });
+            },
+            new TriggerPolicy(2, Duration.ofSeconds(5), 2, Duration.ofMillis(1), Duration.ofMillis(1))
+        );
+        TriggerDispatcher dispatcher = new TriggerDispatcher(
+            List.of(binding),
+            4,
+            100,
+            downstream,
+            (failed, error, envelopes) -> failures.add(failed.name() + ":" + error.getMessage() + ":" + envelopes.size())
+        );
+
+        dispatcher.publishBatch(List.of(envelope("evt-1"), envelope("evt-2"))).toCompletableFuture().join();
+
+        assertTrue(dispatcher.drain(Duration.ofSeconds(5)));
+        assertEquals(List.of(List.of("evt-1", "evt-2"), List.of("evt-2")), attempts);
+        assertEquals(List.of("onExample:bad evt-2:1"), failures);
+        assertEquals(List.of(2), forwarded);
+        assertEquals(new TriggerDispatcher.Stats(2, 1, 1, 1, 1), dispatcher.stats());
+        assertTrue(dispatcher.close(Duration.ofSeconds(5)));
+        assertThrows(
+            CompletionException.class,
+            () -> dispatcher.publish(envelope("evt-3")).toCompletableFuture().join()
+        );
+    }
+
+    @Test
+    void triggerDispatcherDrainsChainedPublishes() throws Exception {
+        TriggerBinding first = new TriggerBinding(
+            "onExample",
+            "Example",
+            (envelopes, dispatcher) -> dispatcher.publishBatch(
+                envelopes.stream().map(envelope -> envelope("chained-" + envelope.eventId(), "Chained")).toList()
+            ).toCompletableFuture().join()
+        );
+        List<String> chained = Collections.synchronizedList(new ArrayList<>());
+        TriggerBinding second = new TriggerBinding(
+            "onChained",
+            "Chained",
+            (envelopes, dispatcher) -> envelopes.forEach(envelope -> chained.add(envelope.eventId()))
+        );
+        try (TriggerDispatcher dispatcher = new TriggerDispatcher(List.of(first, second), null)) {
+            dispatcher.publish(envelope("evt-1")).toCompletableFuture().join();
+            assertTrue(dispatcher.drain(Duration.ofSeconds(5)));
+            assertEquals(List.of("chained-evt-1"), chained);
+            assertEquals(0, dispatcher.size());
+        }
+        assertThrows(IllegalArgumentException.class, () -> TriggerPolicy.defaults().withBatching(0, Duration.ZERO));
+    }
+
+    @Test
+    void compactCodecMatchesSpecVector() {
+        EventCodecSchema schema = new EventCodecSchema("1.0.0", Map.of("OrderShipped", Map.of("orderId", 52495, "carrier", 53652)));
+        Map<String, Object> payload = new LinkedHashMap<>();
+        payload.put("orderId", "ord-1");
+        payload.put("carrier", "ups");
+        payload.put("weightKg", 1.5);
+        EventWireEnvelope envelope = new EventWireEnvelope(
+            "0190a6b4-5c2e-7cc1-8e4f-6b1a2d3c4e5f",
+            "trace-1",
+            "OrderShipped",
+            "1.0.0",
+            "2024-07-01T12:00:00.250000Z",
+            "orders",
+            payload,
+            null,
+            null
+        );
+
+        byte[] encoded = EventWireCodec.encode(envelope, schema);
+
+        assertEquals(
+            "9a01c4100190a6b45c2e7cc18e4f6b1a2d3c4e5fa774726163652d31ac4f7264657253686970706564a5312e302e30"
+                + "cf00061c2e562ee090a66f726465727383cdcd0fa56f72642d31cdd194a3757073a87765696768744b67cb3ff8000000000000c0c0",
+            HexFormat.of().formatHex(encoded)
+        );
+        assertEquals(envelope, EventWireCodec.decode(encoded, schema));
+        assertThrows(EventCodecException.class, () -> EventWireCodec.decode(encoded));
+        assertThrows(EventCodecException.class, () -> new EventCodecSchema("1.0.0", Map.of("OrderShipped", Map.of("orderId", 65536))));
+    }
+
+    private static EventWireEnvelope envelope() {
+        return envelope(EventIds.createEventId());
+    }
+
+    private static EventWireEnvelope envelope(String eventId) {
+        return envelope(eventId, "Example");
+    }
+
+    private static EventWireEnvelope envelope(String eventId, String eventType) {
+        return new EventWireEnvelope(
+            eventId,
+            "trace-1",
+            eventType,
+            "1.0.0",
+            EventTime.nowIso(),
+            "tests",
+            Map.of(),
+            Map.of(),
+            List.of()
+        );
+    }
 }
@@ -36,3 +36,116 @@ export declare class TransitionValidationResult {
   static passed(): TransitionValidationResult;
   static failed(failureReason: string): TransitionValidationResult;
 }
+
+export type BufferOverflowPolicy = 'block' | 'dropOldest' | 'dropNewest' | 'reject';
+
+export interface BufferedEventPublisherOptions {
+  maxBatchSize?: number;
+  lingerMs?: number;
+  maxQueueSize?: number;
+  overflow?: BufferOverflowPolicy;
+  onError?: (error: unknown, envelopes: EventWireEnvelope[]) => void;
+}
+
+export interface BufferedPublisherStats {
+  enqueued: number;
+  published: number;
+  failed: number;
+  dropped: number;
+  batches: number;
+}
+
+export declare class EventBufferFullError extends Error {
+  constructor(maxQueueSize: number);
+}
+
+export declare class BufferedEventPublisher implements EventPublisher {
+  readonly stats: BufferedPublisherStats;
+  readonly size: number;
+  constructor(inner: EventPublisher, options?: BufferedEventPublisherOptions);
+  publish(envelope: EventWireEnvelope): Promise<void>;
+  publishBatch(envelopes: EventWireEnvelope[]): Promise<void>;
+  flush(): Promise<void>;
+  close(): Promise<void>;
+}
+
+export interface TriggerPolicy {
+  batchSize?: number;
+  lingerMs?: number;
+  maxAttempts?: number;
+  backoffMs?: number;
+  maxBackoffMs?: number;
+}
+
+export interface TriggerBinding {
+  name: string;
+  eventType: string;
+  invoke: (envelopes: EventWireEnvelope[]) => Promise<void> | void;
+  policy?: TriggerPolicy;
+}
+
+export interface ResolvedTriggerBinding extends TriggerBinding {
+  readonly policy: Required<TriggerPolicy>;
+}
+
+export interface TriggerFailure {
+  envelope: EventWireEnvelope;
+  error: unknown;
+}
+
+export interface TriggerDispatcherOptions {
+  concurrency?: number;
+  maxQueueSize?: number;
+  downstream?: EventPublisher | null;
+  onFailure?: (binding: ResolvedTriggerBinding, error: unknown, envelopes: EventWireEnvelope[]) => void;
+}
+
+export interface TriggerDispatcherStats {
+  dispatched: number;
+  completed: number;
+  retried: number;
+  failed: number;
+  batches: number;
+}
+
+export declare class TriggerBatchError extends Error {
+  readonly failures: TriggerFailure[];
+  constructor(failures: TriggerFailure[]);
+}
+
+export declare class TriggerDispatcher implements EventPublisher {
+  readonly bindings: ResolvedTriggerBinding[];
+  readonly stats: TriggerDispatcherStats;
+  readonly size: number;
+  constructor(bindings: TriggerBinding[], options?: TriggerDispatcherOptions);
+  publish(envelope: EventWireEnvelope): Promise<void>;
+  publishBatch(envelopes: EventWireEnvelope[]): Promise<void>;
+  drain(): Promise<void>;
+  stop(timeoutMs?: number): Promise<boolean>;
+}
+
+export declare const CODEC_VERSION: 1;
+
+export interface EventCodecSchemaDocument {
+  codec_version: 1;
+  ontology?: string;
+  schema_version: string;
+  events: Array<{
+    event_type: string;
+    id?: string;
+    fields: Array<{ tag: number; name: string; field_id: string }>;
+  }>;
+}
+
+export declare class EventCodecError extends Error {
+  constructor(message: string);
+}
+
+export declare class EventCodecSchema {
+  readonly schemaVersion: string;
+  constructor(schemaVersion: string, events: Record<string, Record<number, string>>);
+  static fromJSON(document: EventCodecSchemaDocument): EventCodecSchema;
+}
+
+export declare function encodeEnvelope(envelope: EventWireEnvelope, schema?: EventCodecSchema): Uint8Array;
+export declare function decodeEnvelope(data: Uint8Array | ArrayBuffer, schema?: EventCodecSchema): EventWireEnvelope;
@@ -32,3 +32,926 @@ export class TransitionValidationResult {
     return new TransitionValidationResult(false, failureReason);
   }
 }
+
+const OVERFLOW_POLICIES = ['block', 'dropOldest', 'dropNewest', 'reject'];
+
+export class EventBufferFullError extends Error {
+  constructor(maxQueueSize) {
+    super(`event buffer is full (${maxQueueSize} envelopes)`);
+    this.name = 'EventBufferFullError';
+  }
+}
+
+export class BufferedEventPublisher {
+  constructor(inner, options = {}) {
+    const {
+      maxBatchSize = 100,
+      lingerMs = 5,
+      maxQueueSize = 10000,
+      overflow = 'block',
+      onError = (error, envelopes) => {
+        console.error(`Buffered event publish failed for ${envelopes.length} envelope(s)`, error);
+      },
+    } = options;
+    if (maxBatchSize < 1) {
+      throw new RangeError('maxBatchSize must be >= 1');
+    }
+    if (maxQueueSize < maxBatchSize) {
+      throw new RangeError('maxQueueSize must be >= maxBatchSize');
+    }
+    if (!OVERFLOW_POLICIES.includes(overflow)) {
+      throw new RangeError(`overflow must be one of ${OVERFLOW_POLICIES.join(', ')}`);
+    }
+    this.inner = inner;
+    this.maxBatchSize = maxBatchSize;
+    this.lingerMs = Math.max(lingerMs, 0);
+    this.maxQueueSize = maxQueueSize;
+    this.overflow = overflow;
+    this.onError = onError;
+    this.buffer = [];
+    this.spaceWaiters = [];
+    this.timer = null;
+    this.inFlight = null;
+    this.closed = false;
+    this.stats = { enqueued: 0, published: 0, failed: 0, dropped: 0, batches: 0 };
+  }
+
+  get size() {
+    return this.buffer.length;
+  }
+
+  async publish(envelope) {
+    await this.publishBatch([envelope]);
+  }
+
+  async publishBatch(envelopes) {
+    for (const envelope of envelopes) {
+      if (this.closed) {
+        throw new Error('BufferedEventPublisher is closed');
+      }
+      while (this.buffer.length >= this.maxQueueSize) {
+        if (this.overflow === 'dropOldest') {
+          this.buffer.shift();
+          this.stats.dropped += 1;
+        } else if (this.overflow === 'dropNewest') {
+          break;
+        } else if (this.overflow === 'reject') {
+          throw new EventBufferFullError(this.maxQueueSize);
+        } else {
+          await new Promise((resolve) => this.spaceWaiters.push(resolve));
+          if (this.closed) {
+            throw new Error('BufferedEventPublisher is closed');
+          }
+        }
+      }
+      if (this.buffer.length >= this.maxQueueSize) {
+        this.stats.dropped += 1;
+        continue;
+      }
+      this.buffer.push(envelope);
+      this.stats.enqueued += 1;
+    }
+    this.schedule();
+  }
+
+  async flush() {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    while (this.buffer.length > 0 || this.inFlight) {
+      if (!this.inFlight) {
+        this.dispatch();
+      }
+      await this.inFlight;
+    }
+  }
+
+  async close() {
+    this.closed = true;
+    await this.flush();
+    for (const resolve of this.spaceWaiters.splice(0)) {
+      resolve();
+    }
+  }
+
+  schedule() {
+    if (this.inFlight || this.buffer.length === 0) {
+      return;
+    }
+    if (this.closed || this.buffer.length >= this.maxBatchSize || this.lingerMs === 0) {
+      if (this.timer) {
+        clearTimeout(this.timer);
+        this.timer = null;
+      }
+      this.dispatch();
+      return;
+    }
+    if (!this.timer) {
+      this.timer = setTimeout(() => {
+        this.timer = null;
+        this.dispatch();
+      }, this.lingerMs);
+    }
+  }
+
+  dispatch() {
+    if (this.inFlight || this.buffer.length === 0) {
+      return;
+    }
+    const batch = this.buffer.splice(0, this.maxBatchSize);
+    for (const resolve of this.spaceWaiters.splice(0, batch.length)) {
+      resolve();
+    }
+    this.inFlight = (async () => {
+      try {
+        await this.inner.publishBatch(batch);
+        this.stats.published += batch.length;
+      } catch (error) {
+        this.stats.failed += batch.length;
+        try {
+          this.onError(error, batch);
+        } catch {
+          // error handlers must not stop the buffer from draining
+        }
+      } finally {
+        this.stats.batches += 1;
+        this.inFlight = null;
+        this.schedule();
+      }
+    })();
+  }
+}
+
+const DEFAULT_TRIGGER_POLICY = Object.freeze({
+  batchSize: 1,
+  lingerMs: 0,
+  maxAttempts: 3,
+  backoffMs: 100,
+  maxBackoffMs: 5000,
+});
+
+function resolveTriggerPolicy(policy = {}) {
+  const resolved = { ...DEFAULT_TRIGGER_POLICY, ...policy };
+  if (resolved.batchSize < 1) {
+    throw new RangeError('batchSize must be >= 1');
+  }
+  if (resolved.maxAttempts < 1) {
+    throw new RangeError('maxAttempts must be >= 1');
+  }
+  return Object.freeze(resolved);
+}
+
+export class TriggerBatchError extends Error {
+  constructor(failures) {
+    super(`${failures.length} trigger envelope(s) failed`);
+    this.name = 'TriggerBatchError';
+    this.failures = failures;
+  }
+}
+
+export class TriggerDispatcher {
+  constructor(bindings, options = {}) {
+    const {
+      concurrency = 4,
+      maxQueueSize = 10000,
+      downstream = null,
+      onFailure = (binding, error, envelopes) => {
+        console.error(
+          `Trigger ${binding.name} failed for ${envelopes.length} envelope(s) after ${binding.policy.maxAttempts} attempt(s)`,
+          error,
+        );
+      },
+    } = options;
+    if (concurrency < 1) {
+      throw new RangeError('concurrency must be >= 1');
+    }
+    if (maxQueueSize < 1) {
+      throw new RangeError('maxQueueSize must be >= 1');
+    }
+    this.bindings = bindings.map((binding) => Object.freeze({ ...binding, policy: resolveTriggerPolicy(binding.policy) }));
+    this.concurrency = concurrency;
+    this.maxQueueSize = maxQueueSize;
+    this.downstream = downstream;
+    this.onFailure = onFailure;
+    this.lanes = [];
+    this.lanesByEventType = new Map();
+    for (const binding of this.bindings) {
+      const lane = { binding, queue: [], spaceWaiters: [], timer: null, ready: false };
+      this.lanes.push(lane);
+      if (!this.lanesByEventType.has(binding.eventType)) {
+        this.lanesByEventType.set(binding.eventType, []);
+      }
+      this.lanesByEventType.get(binding.eventType).push(lane);
+    }
+    this.active = 0;
+    this.unfinished = 0;
+    this.idleWaiters = [];
+    this.stats = { dispatched: 0, completed: 0, retried: 0, failed: 0, batches: 0 };
+  }
+
+  get size() {
+    return this.unfinished;
+  }
+
+  async publish(envelope) {
+    await this.publishBatch([envelope]);
+  }
+
+  async publishBatch(envelopes) {
+    const batch = [...envelopes];
+    if (this.downstream) {
+      await this.downstream.publishBatch(batch);
+    }
+    for (const envelope of batch) {
+      for (const lane of this.lanesByEventType.get(envelope.event_type) ?? []) {
+        while (lane.queue.length >= this.maxQueueSize) {
+          await new Promise((resolve) => lane.spaceWaiters.push(resolve));
+        }
+        lane.queue.push(envelope);
+        this.unfinished += 1;
+        this.stats.dispatched += 1;
+        this.arm(lane);
+      }
+    }
+    this.pump();
+  }
+
+  async drain() {
+    if (this.unfinished === 0) {
+      return;
+    }
+    await new Promise((resolve) => this.idleWaiters.push(resolve));
+  }
+
+  async stop(timeoutMs) {
+    let drained = true;
+    if (timeoutMs === undefined) {
+      await this.drain();
+    } else {
+      let timer = null;
+      drained = await Promise.race([
+        this.drain().then(() => true),
+        new Promise((resolve) => {
+          timer = setTimeout(() => resolve(false), Math.max(timeoutMs, 0));
+        }),
+      ]);
+      clearTimeout(timer);
+    }
+    for (const lane of this.lanes) {
+      if (lane.timer) {
+        clearTimeout(lane.timer);
+        lane.timer = null;
+      }
+      lane.ready = false;
+      this.settle(lane.queue.splice(0).length);
+      for (const resolve of lane.spaceWaiters.splice(0)) {
+        resolve();
+      }
+    }
+    return drained;
+  }
+
+  arm(lane) {
+    const { batchSize, lingerMs } = lane.binding.policy;
+    if (lane.queue.length === 0 || lane.ready) {
+      return;
+    }
+    if (batchSize === 1 || lingerMs <= 0 || lane.queue.length >= batchSize) {
+      if (lane.timer) {
+        clearTimeout(lane.timer);
+        lane.timer = null;
+      }
+      lane.ready = true;
+      return;
+    }
+    if (!lane.timer) {
+      lane.timer = setTimeout(() => {
+        lane.timer = null;
+        lane.ready = true;
+        this.pump();
+      }, lingerMs);
+    }
+  }
+
+  pump() {
+    let progressed = true;
+    while (progressed && this.active < this.concurrency) {
+      progressed = false;
+      for (const lane of this.lanes) {
+        if (this.active >= this.concurrency) {
+          break;
+        }
+        if (!lane.ready || lane.queue.length === 0) {
+          continue;
+        }
+        const batch = lane.queue.splice(0, lane.binding.policy.batchSize);
+        for (const resolve of lane.spaceWaiters.splice(0, batch.length)) {
+          resolve();
+        }
+        lane.ready = false;
+        this.arm(lane);
+        this.active += 1;
+        progressed = true;
+        void this.run(lane.binding, batch);
+      }
+    }
+  }
+
+  async run(binding, batch) {
+    const { policy } = binding;
+    this.stats.batches += 1;
+    let pending = batch;
+    try {
+      for (let attempt = 1; attempt <= policy.maxAttempts; attempt += 1) {
+        let failures;
+        try {
+          await binding.invoke(pending);
+          failures = [];
+        } catch (error) {
+          failures = error instanceof TriggerBatchError
+            ? error.failures
+            : pending.map((envelope) => ({ envelope, error }));
+        }
+        const failed = new Set(failures.map((failure) => failure.envelope));
+        this.stats.completed += pending.filter((envelope) => !failed.has(envelope)).length;
+        if (failures.length === 0) {
+          return;
+        }
+        if (attempt === policy.maxAttempts) {
+          this.stats.failed += failures.length;
+          this.reportFailures(binding, failures);
+          return;
+        }
+        pending = pending.filter((envelope) => failed.has(envelope));
+        this.stats.retried += 1;
+        const delayMs = Math.min(policy.backoffMs * 2 ** (attempt - 1), policy.maxBackoffMs);
+        await new Promise((resolve) => setTimeout(resolve, delayMs));
+      }
+    } finally {
+      this.active -= 1;
+      this.settle(batch.length);
+      this.pump();
+    }
+  }
+
+  settle(count) {
+    this.unfinished -= count;
+    if (this.unfinished === 0) {
+      for (const resolve of this.idleWaiters.splice(0)) {
+        resolve();
+      }
+    }
+  }
+
+  reportFailures(binding, failures) {
+    // Envelopes that failed with the same error are reported together.
+    const grouped = new Map();
+    for (const { envelope, error } of failures) {
+      if (!grouped.has(error)) {
+        grouped.set(error, []);
+      }
+      grouped.get(error).push(envelope);
+    }
+    for (const [error, envelopes] of grouped) {
+      try {
+        this.onFailure(binding, error, envelopes);
+      } catch {
+        // failure handlers must not stop the dispatcher from draining
+      }
+    }
+  }
+}
+
+export const CODEC_VERSION = 1;
+const MAX_FIELD_TAG = 0xffff;
+
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/;
+const TIMESTAMP_PATTERN = /^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?(Z|[+-]\d{2}:\d{2})$/;
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder('utf-8', { fatal: true });
+
+export class EventCodecError extends Error {
+  constructor(message) {
+    super(message);
+    this.name = 'EventCodecError';
+  }
+}
+
+export class EventCodecSchema {
+  constructor(schemaVersion, events) {
+    this.schemaVersion = schemaVersion;
+    this.events = new Map();
+    for (const [eventType, names] of Object.entries(events)) {
+      const byTag = new Map();
+      const byName = new Map();
+      for (const [tag, name] of Object.entries(names)) {
+        const numericTag = Number(tag);
+        if (!Number.isInteger(numericTag) || numericTag < 1 || numericTag > MAX_FIELD_TAG || byName.has(name)) {
+          throw new EventCodecError(`invalid field tags for event '${eventType}'`);
+        }
+        byTag.set(numericTag, name);
+        byName.set(name, numericTag);
+      }
+      this.events.set(eventType, { byTag, byName });
+    }
+  }
+
+  static fromJSON(document) {
+    if (document.codec_version !== CODEC_VERSION) {
+      throw new EventCodecError(`unsupported codec_version: ${document.codec_version}`);
+    }
+    const events = {};
+    for (const event of document.events ?? []) {
+      events[event.event_type] = Object.fromEntries(event.fields.map((field) => [field.tag, field.name]));
+    }
+    return new EventCodecSchema(String(document.schema_version), events);
+  }
+
+  fieldsFor(eventType, schemaVersion) {
+    if (schemaVersion !== this.schemaVersion) {
+      return undefined;
+    }
+    return this.events.get(eventType);
+  }
+}
+
+export function encodeEnvelope(envelope, schema) {
+  const fields = schema?.fieldsFor(envelope.event_type, envelope.schema_version);
+  const writer = new MessagePackWriter();
+  writer.byte(0x9a);
+  writer.int(CODEC_VERSION);
+  writer.value(encodeId(envelope.event_id));
+  writer.value(encodeId(envelope.trace_id));
+  writer.str(envelope.event_type);
+  writer.str(envelope.schema_version);
+  writer.value(encodeTimestamp(envelope.occurred_at));
+  writer.str(envelope.source);
+  const payloadEntries = Object.entries(envelope.payload ?? {});
+  writer.header(payloadEntries.length, 0x80, 16, [null, 0xde, 0xdf]);
+  for (const [key, value] of payloadEntries) {
+    const tag = fields?.byName.get(key);
+    if (tag !== undefined) {
+      writer.int(tag);
+    } else {
+      writer.str(key);
+    }
+    writer.value(value);
+  }
+  writer.value(envelope.attributes ?? null);
+  if (envelope.updated_objects == null) {
+    writer.byte(0xc0);
+  } else {
+    writer.header(envelope.updated_objects.length, 0x90, 16, [null, 0xdc, 0xdd]);
+    for (const item of envelope.updated_objects) {
+      writer.value([item.object_type, item.object_ref, item.object]);
+    }
+  }
+  return writer.finish();
+}
+
+export function decodeEnvelope(data, schema) {
+  const reader = new MessagePackReader(data);
+  const value = reader.value();
+  if (reader.offset !== reader.bytes.length) {
+    throw new EventCodecError('trailing bytes after envelope');
+  }
+  if (!Array.isArray(value) || value.length !== 10) {
+    throw new EventCodecError('envelope must be a 10-element array');
+  }
+  if (value[0] !== CODEC_VERSION) {
+    throw new EventCodecError(`unsupported codec version: ${value[0]}`);
+  }
+  const eventType = expectString(value[3], 'event_type');
+  const schemaVersion = expectString(value[4], 'schema_version');
+  const rawPayload = value[7];
+  if (!(rawPayload instanceof Map)) {
+    throw new EventCodecError('payload must be a map');
+  }
+  const payload = {};
+  let fields;
+  for (const [key, item] of rawPayload) {
+    if (typeof key === 'number') {
+      fields ??= schema?.fieldsFor(eventType, schemaVersion);
+      if (fields === undefined) {
+        throw new EventCodecError(`no codec schema for ${eventType} ${schemaVersion}`);
+      }
+      const name = fields.byTag.get(key);
+      if (name === undefined) {
+        throw new EventCodecError(`unknown field tag ${key} for ${eventType}`);
+      }
+      payload[name] = toPlain(item);
+    } else {
+      payload[key] = toPlain(item);
+    }
+  }
+  const envelope = {
+    event_id: decodeId(value[1]),
+    trace_id: decodeId(value[2]),
+    event_type: eventType,
+    schema_version: schemaVersion,
+    occurred_at: decodeTimestamp(value[5]),
+    source: expectString(value[6], 'source'),
+    payload,
+  };
+  if (value[8] !== null) {
+    if (!(value[8] instanceof Map)) {
+      throw new EventCodecError('attributes must be a map');
+    }
+    envelope.attributes = toPlain(value[8]);
+  }
+  if (value[9] !== null) {
+    if (!Array.isArray(value[9]) || value[9].some((item) => !Array.isArray(item) || item.length !== 3)) {
+      throw new EventCodecError('updated_objects must be an array of [object_type, object_ref, object]');
+    }
+    envelope.updated_objects = value[9].map(([objectType, objectRef, object]) => ({
+      object_type: objectType,
+      object_ref: toPlain(objectRef),
+      object: toPlain(object),
+    }));
+  }
+  return envelope;
+}
+
+function expectString(value, name) {
+  if (typeof value !== 'string') {
+    throw new EventCodecError(`${name} must be a string`);
+  }
+  return value;
+}
+
+function toPlain(value) {
+  if (value instanceof Map) {
+    const result = {};
+    for (const [key, item] of value) {
+      result[key] = toPlain(item);
+    }
+    return result;
+  }
+  if (Array.isArray(value)) {
+    return value.map(toPlain);
+  }
+  return value;
+}
+
+function encodeId(value) {
+  if (!UUID_PATTERN.test(value)) {
+    return value;
+  }
+  return Uint8Array.from(value.replaceAll('-', '').match(/../g), (pair) => parseInt(pair, 16));
+}
+
+function decodeId(value) {
+  if (value instanceof Uint8Array) {
+    if (value.length !== 16) {
+      throw new EventCodecError('binary ids must be 16 bytes');
+    }
+    const hex = Array.from(value, (byte) => byte.toString(16).padStart(2, '0')).join('');
+    return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`;
+  }
+  return expectString(value, 'id');
+}
+
+function encodeTimestamp(value) {
+  const match = TIMESTAMP_PATTERN.exec(value);
+  if (match === null) {
+    return value;
+  }
+  const [, year, month, day, hour, minute, second, rawFraction = '', offset] = match;
+  const fraction = rawFraction.padEnd(9, '0');
+  if (fraction.slice(6) !== '000') {
+    return value;
+  }
+  const parts = [year, month, day, hour, minute, second].map(Number);
+  const date = new Date(0);
+  date.setUTCFullYear(parts[0], parts[1] - 1, parts[2]);
+  date.setUTCHours(parts[3], parts[4], parts[5], 0);
+  if (
+    date.getUTCFullYear() !== parts[0] ||
+    date.getUTCMonth() !== parts[1] - 1 ||
+    date.getUTCDate() !== parts[2] ||
+    date.getUTCHours() !== parts[3] ||
+    date.getUTCMinutes() !== parts[4] ||
+    date.getUTCSeconds() !== parts[5]
+  ) {
+    return value;
+  }
+  let offsetMinutes = 0;
+  if (offset !== 'Z') {
+    const offsetHours = Number(offset.slice(1, 3));
+    const offsetMins = Number(offset.slice(4, 6));
+    if (offsetHours > 23 || offsetMins > 59) {
+      return value;
+    }
+    offsetMinutes = (offset[0] === '-' ? -1 : 1) * (offsetHours * 60 + offsetMins);
+  }
+  return (date.getTime() - offsetMinutes * 60_000) * 1000 + Number(fraction.slice(0, 6));
+}
+
+function decodeTimestamp(value) {
+  if (typeof value === 'number' && Number.isInteger(value)) {
+    const millis = Math.floor(value / 1000);
+    const micros = value - millis * 1000;
+    const date = new Date(millis);
+    if (Number.isNaN(date.getTime())) {
+      throw new EventCodecError('occurred_at out of range');
+    }
+    return `${date.toISOString().slice(0, -1)}${String(micros).padStart(3, '0')}Z`;
+  }
+  return expectString(value, 'occurred_at');
+}
+
+class MessagePackWriter {
+  constructor() {
+    this.bytes = new Uint8Array(256);
+    this.view = new DataView(this.bytes.buffer);
+    this.offset = 0;
+  }
+
+  reserve(size) {
+    if (this.offset + size <= this.bytes.length) {
+      return;
+    }
+    let capacity = this.bytes.length * 2;
+    while (capacity < this.offset + size) {
+      capacity *= 2;
+    }
+    const next = new Uint8Array(capacity);
+    next.set(this.bytes.subarray(0, this.offset));
+    this.bytes = next;
+    this.view = new DataView(next.buffer);
+  }
+
+  byte(value) {
+    this.reserve(1);
+    this.bytes[this.offset++] = value;
+  }
+
+  header(length, fixed, fixedLimit, sizes) {
+    if (fixed !== null && length < fixedLimit) {
+      this.byte(fixed | length);
+    } else if (sizes[0] !== null && length <= 0xff) {
+      this.byte(sizes[0]);
+      this.byte(length);
+    } else if (length <= 0xffff) {
+      this.byte(sizes[1]);
+      this.reserve(2);
+      this.view.setUint16(this.offset, length);
+      this.offset += 2;
+    } else {
+      this.byte(sizes[2]);
+      this.reserve(4);
+      this.view.setUint32(this.offset, length);
+      this.offset += 4;
+    }
+  }
+
+  int(value) {
+    if (typeof value === 'bigint') {
+      this.bigint(value);
+      return;
+    }
+    if (value >= 0 && value < 0x80) {
+      this.byte(value);
+    } else if (value < 0 && value >= -0x20) {
+      this.byte(value & 0xff);
+    } else if (value >= 0 && value <= 0xff) {
+      this.byte(0xcc);
+      this.byte(value);
+    } else if (value >= 0 && value <= 0xffff) {
+      this.byte(0xcd);
+      this.reserve(2);
+      this.view.setUint16(this.offset, value);
+      this.offset += 2;
+    } else if (value >= 0 && value <= 0xffffffff) {
+      this.byte(0xce);
+      this.reserve(4);
+      this.view.setUint32(this.offset, value);
+      this.offset += 4;
+    } else if (value < 0 && value >= -0x80) {
+      this.byte(0xd0);
+      this.reserve(1);
+      this.view.setInt8(this.offset, value);
+      this.offset += 1;
+    } else if (value < 0 && value >= -0x8000) {
+      this.byte(0xd1);
+      this.reserve(2);
+      this.view.setInt16(this.offset, value);
+      this.offset += 2;
+    } else if (value < 0 && value >= -0x80000000) {
+      this.byte(0xd2);
+      this.reserve(4);
+      this.view.setInt32(this.offset, value);
+      this.offset += 4;
+    } else {
+      this.bigint(BigInt(value));
+    }
+  }
+
+  bigint(value) {
+    this.reserve(9);
+    if (value >= 0n && value <= 0xffffffffffffffffn) {
+      this.bytes[this.offset++] = 0xcf;
+      this.view.setBigUint64(this.offset, value);
+    } else if (value < 0n && value >= -0x8000000000000000n) {
+      this.bytes[this.offset++] = 0xd3;
+      this.view.setBigInt64(this.offset, value);
+    } else {
+      throw new EventCodecError(`integer out of range: ${value}`);
+    }
+    this.offset += 8;
+  }
+
+  str(value) {
+    const encoded = textEncoder.encode(value);
+    this.header(encoded.length, 0xa0, 32, [0xd9, 0xda, 0xdb]);
+    this.raw(encoded);
+  }
+
+  raw(bytes) {
+    this.reserve(bytes.length);
+    this.bytes.set(bytes, this.offset);
+    this.offset += bytes.length;
+  }
+
+  value(value) {
+    if (value === null || value === undefined) {
+      this.byte(0xc0);
+    } else if (value === true) {
+      this.byte(0xc3);
+    } else if (value === false) {
+      this.byte(0xc2);
+    } else if (typeof value === 'number') {
+      if (Number.isSafeInteger(value)) {
+        this.int(value);
+      } else {
+        this.byte(0xcb);
+        this.reserve(8);
+        this.view.setFloat64(this.offset, value);
+        this.offset += 8;
+      }
+    } else if (typeof value === 'bigint') {
+      this.bigint(value);
+    } else if (typeof value === 'string') {
+      this.str(value);
+    } else if (value instanceof Uint8Array) {
+      this.header(value.length, null, 0, [0xc4, 0xc5, 0xc6]);
+      this.raw(value);
+    } else if (Array.isArray(value)) {
+      this.header(value.length, 0x90, 16, [null, 0xdc, 0xdd]);
+      for (const item of value) {
+        this.value(item);
+      }
+    } else if (value instanceof Date) {
+      this.str(value.toISOString());
+    } else if (typeof value === 'object') {
+      const entries = Object.entries(value).filter(([, item]) => item !== undefined);
+      this.header(entries.length, 0x80, 16, [null, 0xde, 0xdf]);
+      for (const [key, item] of entries) {
+        this.str(key);
+        this.value(item);
+      }
+    } else {
+      throw new EventCodecError(`cannot encode value of type ${typeof value}`);
+    }
+  }
+
+  finish() {
+    return this.bytes.slice(0, this.offset);
+  }
+}
+
+class MessagePackReader {
+  constructor(data) {
+    this.bytes = data instanceof Uint8Array ? data : new Uint8Array(data);
+    this.view = new DataView(this.bytes.buffer, this.bytes.byteOffset, this.bytes.byteLength);
+    this.offset = 0;
+  }
+
+  take(size) {
+    if (this.offset + size > this.bytes.length) {
+      throw new EventCodecError('truncated message');
+    }
+    const start = this.offset;
+    this.offset += size;
+    return start;
+  }
+
+  length(size) {
+    const start = this.take(size);
+    if (size === 1) {
+      return this.view.getUint8(start);
+    }
+    return size === 2 ? this.view.getUint16(start) : this.view.getUint32(start);
+  }
+
+  value() {
+    const code = this.view.getUint8(this.take(1));
+    if (code <= 0x7f) {
+      return code;
+    }
+    if (code >= 0xe0) {
+      return code - 0x100;
+    }
+    if (code >= 0x80 && code <= 0x8f) {
+      return this.map(code & 0x0f);
+    }
+    if (code >= 0x90 && code <= 0x9f) {
+      return this.array(code & 0x0f);
+    }
+    if (code >= 0xa0 && code <= 0xbf) {
+      return this.str(code & 0x1f);
+    }
+    switch (code) {
+      case 0xc0:
+        return null;
+      case 0xc2:
+        return false;
+      case 0xc3:
+        return true;
+      case 0xc4:
+        return this.bin(this.length(1));
+      case 0xc5:
+        return this.bin(this.length(2));
+      case 0xc6:
+        return this.bin(this.length(4));
+      case 0xca:
+        return this.view.getFloat32(this.take(4));
+      case 0xcb:
+        return this.view.getFloat64(this.take(8));
+      case 0xcc:
+        return this.view.getUint8(this.take(1));
+      case 0xcd:
+        return this.view.getUint16(this.take(2));
+      case 0xce:
+        return this.view.getUint32(this.take(4));
+      case 0xcf:
+        return narrowBigInt(this.view.getBigUint64(this.take(8)));
+      case 0xd0:
+        return this.view.getInt8(this.take(1));
+      case 0xd1:
+        return this.view.getInt16(this.take(2));
+      case 0xd2:
+        return this.view.getInt32(this.take(4));
+      case 0xd3:
+        return narrowBigInt(this.view.getBigInt64(this.take(8)));
+      case 0xd9:
+        return this.str(this.length(1));
+      case 0xda:
+        return this.str(this.length(2));
+      case 0xdb:
+        return this.str(this.length(4));
+      case 0xdc:
+        return this.array(this.length(2));
+      case 0xdd:
+        return this.array(this.length(4));
+      case 0xde:
+        return this.map(this.length(2));
+      case 0xdf:
+        return this.map(this.length(4));
+      default:
+        throw new EventCodecError(`unsupported MessagePack type 0x${code.toString(16).padStart(2, '0')}`);
+    }
+  }
+
+  bin(size) {
+    const start = this.take(size);
+    return this.bytes.slice(start, start + size);
+  }
+
+  str(size) {
+    const start = this.take(size);
+    try {
+      return textDecoder.decode(this.bytes.subarray(start, start + size));
+    } catch {
+      throw new EventCodecError('invalid UTF-8 string');
+    }
+  }
+
+  array(size) {
+    const result = [];
+    for (let index = 0; index < size; index += 1) {
+      result.push(this.value());
+    }
+    return result;
+  }
+
+  map(size) {
+    const result = new Map();
+    for (let index = 0; index < size; index += 1) {
+      const key = this.value();
+      if (typeof key !== 'string' && !(typeof key === 'number' && Number.isInteger(key))) {
+        throw new EventCodecError('map keys must be strings or integer tags');
+      }
+      result.set(key, this.value());
+    }
+    return result;
+  }
+}
+
+function narrowBigInt(value) {
+  if (value >= BigInt(Number.MIN_SAFE_INTEGER) && value <= BigInt(Number.MAX_SAFE_INTEGER)) {
+    return Number(value);
+  }
+  return value;
+}
@@ -1,7 +1,20 @@
 import test from 'node:test';
 import assert from 'node:assert/strict';
 
-import { NoOpEventPublisher, TransitionValidationResult, createEventId, nowIso } from '../dist/index.js';
+import {
+  BufferedEventPublisher,
+  EventBufferFullError,
+  EventCodecError,
+  EventCodecSchema,
+  NoOpEventPublisher,
+  TransitionValidationResult,
+  TriggerBatchError,
+  TriggerDispatcher,
+  createEventId,
+  decodeEnvelope,
+  encodeEnvelope,
+  nowIso,
+} from '../dist/index.js';
 
 test('createEventId returns non-empty id', () => {
   const id = createEventId();
@@ -44,3 +57,208 @@ test('TransitionValidationResult helper factories shape values', () => {
   assert.equal(failed.passesValidation, false);
   assert.equal(failed.failureReason, 'blocked');
 });
+
+function envelope(eventId) {
+  return {
+    event_id: eventId,
+    trace_id: 'trace-1',
+    event_type: 'Example',
+    schema_version: '1.0.0',
+    occurred_at: nowIso(),
+    source: 'test',
+    payload: {},
+  };
+}
+
+class RecordingPublisher {
+  constructor(failures = 0) {
+    this.failures = failures;
+    this.batches = [];
+  }
+
+  async publish(value) {
+    await this.publishBatch([value]);
+  }
+
+  async publishBatch(values) {
+    if (this.failures > 0) {
+      this.failures -= 1;
+      throw new Error('broker unavailable');
+    }
+    this.batches.push(values.map((value) => value.event_id));
+  }
+}
+
+test('BufferedEventPublisher coalesces concurrent publishes into batches', async () => {
+  const broker = new RecordingPublisher();
+  const publisher = new BufferedEventPublisher(broker, { maxBatchSize: 4, lingerMs: 1000 });
+  await Promise.all([0, 1, 2, 3, 4, 5].map((index) => publisher.publish(envelope(`evt-${index}`))));
+  await publisher.close();
+  assert.deepEqual(broker.batches, [
+    ['evt-0', 'evt-1', 'evt-2', 'evt-3'],
+    ['evt-4', 'evt-5'],
+  ]);
+  assert.equal(publisher.stats.published, 6);
+  await assert.rejects(publisher.publish(envelope('evt-6')), /closed/);
+});
+
+test('BufferedEventPublisher applies overflow policies and reports failures', async () => {
+  const dropping = new BufferedEventPublisher(new RecordingPublisher(), {
+    maxBatchSize: 1,
+    maxQueueSize: 2,
+    lingerMs: 1000,
+    overflow: 'dropOldest',
+  });
+  dropping.buffer.push(envelope('queued-1'), envelope('queued-2'));
+  await dropping.publishBatch([envelope('evt-1')]);
+  assert.equal(dropping.stats.dropped, 1);
+  await dropping.close();
+
+  const rejecting = new BufferedEventPublisher(new RecordingPublisher(), { maxBatchSize: 1, maxQueueSize: 1, overflow: 'reject' });
+  rejecting.buffer.push(envelope('queued-1'));
+  await assert.rejects(rejecting.publish(envelope('evt-1')), EventBufferFullError);
+  await rejecting.close();
+
+  const failures = [];
+  const failing = new BufferedEventPublisher(new RecordingPublisher(1), {
+    lingerMs: 0,
+    onError: (error, envelopes) => failures.push([error.message, envelopes.length]),
+  });
+  await failing.publishBatch([envelope('evt-1'), envelope('evt-2')]);
+  await failing.flush();
+  assert.deepEqual(failures, [['broker unavailable', 2]]);
+  assert.equal(failing.stats.failed, 2);
+});
+
+test('TriggerDispatcher batches matching envelopes and forwards everything downstream', async () => {
+  const broker = new RecordingPublisher();
+  const batches = [];
+  const dispatcher = new TriggerDispatcher(
+    [
+      {
+        name: 'onExample',
+        eventType: 'Example',
+        invoke: async (envelopes) => {
+          batches.push(envelopes.map((value) => value.event_id));
+        },
+        policy: { batchSize: 3, lingerMs: 1000 },
+      },
+    ],
+    { downstream: broker },
+  );
+  await dispatcher.publishBatch([envelope('evt-1'), envelope('evt-2'), { ...envelope('other'), event_type: 'Other' }]);
+  await dispatcher.publish(envelope('evt-3'));
+  await dispatcher.publish(envelope('evt-4'));
+  assert.equal(await dispatcher.stop(10), false);
+  assert.deepEqual(batches, [['evt-1', 'evt-2', 'evt-3']]);
+  assert.deepEqual(broker.batches, [['evt-1', 'evt-2', 'other'], ['evt-3'], ['evt-4']]);
+  assert.equal(dispatcher.size, 0);
+  assert.equal(dispatcher.stats.dispatched, 4);
+  assert.equal(dispatcher.stats.completed, 3);
+});
+
+test('TriggerDispatcher retries only the failed envelopes of a batch', async () => {
+  const attempts = [];
+  const failures = [];
+  const dispatcher = new TriggerDispatcher(
+    [
+      {
+        name: 'onExample',
+        eventType: 'Example',
+        invoke: (envelopes) => {
+          attempts.push(envelopes.map((value) => value.event_id));
+          const failed = envelopes.filter((value) => value.event_id !== 'evt-1');
+          if (failed.length > 0) {
+            throw new TriggerBatchError(failed.map((value) => ({ envelope: value, error: new Error(`bad ${value.event_id}`) })));
+          }
+        },
+        policy: { batchSize: 2, maxAttempts: 2, backoffMs: 1 },
+      },
+    ],
+    { onFailure: (binding, error, envelopes) => failures.push([binding.name, error.message, envelopes.length]) },
+  );
+  await dispatcher.publishBatch([envelope('evt-1'), envelope('evt-2')]);
+  await dispatcher.drain();
+  assert.deepEqual(attempts, [['evt-1', 'evt-2'], ['evt-2']]);
+  assert.deepEqual(failures, [['onExample', 'bad evt-2', 1]]);
+  assert.deepEqual(
+    { ...dispatcher.stats },
+    { dispatched: 2, completed: 1, retried: 1, failed: 1, batches: 1 },
+  );
+});
+
+test('TriggerDispatcher caps concurrent batches and drains chained publishes', async () => {
+  let running = 0;
+  let peak = 0;
+  let dispatcher;
+  dispatcher = new TriggerDispatcher(
+    [
+      {
+        name: 'onExample',
+        eventType: 'Example',
+        invoke: async (envelopes) => {
+          running += 1;
+          peak = Math.max(peak, running);
+          await new Promise((resolve) => setTimeout(resolve, 5));
+          running -= 1;
+          await dispatcher.publishBatch(envelopes.map((value) => ({ ...value, event_type: 'Chained' })));
+        },
+      },
+      { name: 'onChained', eventType: 'Chained', invoke: () => {} },
+    ],
+    { concurrency: 2 },
+  );
+  await dispatcher.publishBatch([0, 1, 2, 3, 4].map((index) => envelope(`evt-${index}`)));
+  await dispatcher.drain();
+  assert.equal(peak, 2);
+  assert.equal(dispatcher.stats.completed, 10);
+  assert.throws(() => new TriggerDispatcher([], { concurrency: 0 }), RangeError);
+  assert.throws(() => new TriggerDispatcher([{ name: 'x', eventType: 'X', invoke: () => {}, policy: { batchSize: 0 } }]), RangeError);
+});
+
+const CODEC_VECTOR_HEX =
+  '9a01c4100190a6b45c2e7cc18e4f6b1a2d3c4e5fa774726163652d31ac4f7264657253686970706564a5312e302e30' +
+  'cf00061c2e562ee090a66f726465727383cdcd0fa56f72642d31cdd194a3757073a87765696768744b67cb3ff8000000000000c0c0';
+
+test('compact codec matches the spec test vector', () => {
+  const schema = EventCodecSchema.fromJSON({
+    codec_version: 1,
+    schema_version: '1.0.0',
+    events: [
+      {
+        event_type: 'OrderShipped',
+        fields: [
+          { tag: 52495, name: 'orderId', field_id: 'evt_order_shipped__order_id' },
+          { tag: 53652, name: 'carrier', field_id: 'evt_order_shipped__carrier' },
+        ],
+      },
+    ],
+  });
+  const wire = {
+    event_id: '0190a6b4-5c2e-7cc1-8e4f-6b1a2d3c4e5f',
+    trace_id: 'trace-1',
+    event_type: 'OrderShipped',
+    schema_version: '1.0.0',
+    occurred_at: '2024-07-01T12:00:00.250000Z',
+    source: 'orders',
+    payload: { orderId: 'ord-1', carrier: 'ups', weightKg: 1.5 },
+  };
+  const encoded = encodeEnvelope(wire, schema);
+  assert.equal(Buffer.from(encoded).toString('hex'), CODEC_VECTOR_HEX);
+  assert.deepEqual(decodeEnvelope(encoded, schema), wire);
+  assert.throws(() => decodeEnvelope(encoded), EventCodecError);
+  assert.throws(() => new EventCodecSchema('1.0.0', { OrderShipped: { 65536: 'orderId' } }), EventCodecError);
+});
+
+test('compact codec round-trips envelopes without a schema', () => {
+  const wire = {
+    ...envelope(createEventId()),
+    occurred_at: '2024-07-01T14:00:00.5+02:00',
+    attributes: { tenant: 't-1' },
+    payload: { items: [1, -40, 70000, 2 ** 40, null, true, { sku: 'a'.repeat(40) }], price: '12.50' },
+    updated_objects: [{ object_type: 'Order', object_ref: { orderId: 'ord-1' }, object: { orderId: 'ord-1' } }],
+  };
+  const decoded = decodeEnvelope(encodeEnvelope(wire));
+  assert.equal(decoded.occurred_at, '2024-07-01T12:00:00.500000Z');
+  assert.deepEqual({ ...decoded, occurred_at: wire.occurred_at }, wire);
+});
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from benchmark_stats import summarize  # noqa: E402
+from prophet_events_runtime import EventWireEnvelope  # noqa: E402
+from prophet_events_runtime import create_event_id  # noqa: E402
+from prophet_events_runtime import now_iso  # noqa: E402
+
+
+@dataclass(kw_only=True)
+class _LegacyEnvelope:
+    # Mirrors the pre-slots envelope: same fields, per-instance __dict__.
+    event_id: str
+    trace_id: str
+    event_type: str
+    schema_version: str
+    occurred_at: str
+    source: str
+    payload: Dict[str, object]
+    attributes: Optional[Dict[str, str]] = None
+    updated_objects: Optional[List[Dict[str, object]]] = None
+
+
+def _legacy_event_id() -> str:
+    return str(uuid4())
+
+
+def _legacy_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _time_calls(fn: Callable[[], object], iterations: int, rounds: int = 20) -> Dict[str, float]:
+    per_round = max(1, iterations // rounds)
+    durations: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(per_round):
+            fn()
+        durations.append((time.perf_counter() - start) / per_round)
+    return summarize(durations, "ns")
+
+
+def _envelope_factory(envelope_type: type, event_id: Callable[[], str], clock: Callable[[], str]) -> Callable[[], object]:
+    payload = {"orderId": "order-1", "carrier": "UPS"}
+
+    def build() -> object:
+        return envelope_type(
+            event_id=event_id(),
+            trace_id="trace-1",
+            event_type="OrderShipTransition",
+            schema_version="1.0.0",
+            occurred_at=clock(),
+            source="orders",
+            payload=payload,
+        )
+
+    return build
+
+
+def _retained_bytes_per_envelope(build: Callable[[], object], count: int) -> float:
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.take_snapshot()
+        retained = [build() for _ in range(count)]
+        current = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    total = sum(stat.size_diff for stat in current.compare_to(baseline, "filename"))
+    del retained
+    return total / count
+
+
+def _compare(legacy: Dict[str, float], current: Dict[str, float]) -> Dict[str, object]:
+    return {
+        "legacy": legacy,
+        "current": current,
+        "speedup_factor_mean": legacy["mean_ns"] / current["mean_ns"] if current["mean_ns"] else 0.0,
+    }
+
+
+def main() -> int:
+    iterations = 200000
+    if len(sys.argv) > 1:
+        iterations = int(sys.argv[1])
+        if iterations < 1:
+            raise ValueError("iterations must be >= 1")
+
+    legacy_build = _envelope_factory(_LegacyEnvelope, _legacy_event_id, _legacy_now_iso)
+    current_build = _envelope_factory(EventWireEnvelope, create_event_id, now_iso)
+    memory_sample = min(iterations, 50000)
+
+    payload = {
+        "benchmark": "event_envelope_creation",
+        "iterations": iterations,
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+        },
+        "results": {
+            "event_id": _compare(_time_calls(_legacy_event_id, iterations), _time_calls(create_event_id, iterations)),
+            "timestamp": _compare(_time_calls(_legacy_now_iso, iterations), _time_calls(now_iso, iterations)),
+            "envelope": _compare(_time_calls(legacy_build, iterations), _time_calls(current_build, iterations)),
+            "retained_bytes_per_envelope": {
+                "legacy": _retained_bytes_per_envelope(legacy_build, memory_sample),
+                "current": _retained_bytes_per_envelope(current_build, memory_sample),
+            },
+        },
+    }
+    print(json.dumps(payload, indent=2, sort_keys=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
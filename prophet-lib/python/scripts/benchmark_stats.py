@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import statistics
+from typing import Dict, List
+
+_UNIT_SCALES = {
+    "ms": 1_000.0,
+    "us": 1_000_000.0,
+    "ns": 1_000_000_000.0,
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    weight = rank - lower
+    return ordered[lower] * (1.0 - weight) + ordered[upper] * weight
+
+
+def summarize(values: List[float], unit: str = "us") -> Dict[str, float]:
+    """Summarize durations measured in seconds, reported in `unit` (`ms`, `us`, or `ns`)."""
+    scale = _UNIT_SCALES[unit]
+    return {
+        "count": float(len(values)),
+        f"mean_{unit}": statistics.mean(values) * scale,
+        f"median_{unit}": statistics.median(values) * scale,
+        f"p95_{unit}": percentile(values, 0.95) * scale,
+        f"min_{unit}": min(values) * scale,
+        f"max_{unit}": max(values) * scale,
+    }
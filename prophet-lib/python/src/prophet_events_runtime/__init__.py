@@ -1,19 +1,89 @@
+from .codec import EventCodecError
+from .codec import EventCodecSchema
+from .codec import decode_envelope
+from .codec import encode_envelope
+from .consumer import DedupWindow
+from .consumer import EventConsumer
+from .consumer import EventConsumerStats
+from .consumer import InMemoryEventBroker
+from .consumer import default_ordering_key
+from .consumer import object_ordering_key
+from .ids import create_event_id
+from .ids import now_iso
+from .json_encoding import JSON_BACKEND
+from .json_encoding import dumps_json_bytes
+from .outbox import InMemoryOutboxStore
+from .outbox import OutboxEventPublisher
+from .outbox import OutboxRecord
+from .outbox import OutboxRelay
+from .outbox import OutboxStore
+from .outbox import envelope_from_json
+from .outbox import envelope_to_json
+from .publisher import BufferedEventPublisher
+from .publisher import BufferedPublisherStats
+from .publisher import EventBufferFullError
 from .publisher import EventPublisher
 from .publisher import NoOpEventPublisher
-from .publisher import create_event_id
-from .publisher import now_iso
+from .publisher import SyncEventPublisher
 from .publisher import publish_batch_sync
 from .publisher import publish_sync
+from .publisher import shutdown_publish_loop
+from .snapshots import SNAPSHOT_MODE_ATTRIBUTE
+from .snapshots import SnapshotBaselines
+from .snapshots import SnapshotPolicy
+from .snapshots import SnapshotStats
+from .snapshots import apply_snapshot_policy
+from .snapshots import with_snapshot_mode
+from .triggers import TriggerBatchError
+from .triggers import TriggerBinding
+from .triggers import TriggerDispatcher
+from .triggers import TriggerDispatcherStats
+from .triggers import TriggerPolicy
 from .validation import TransitionValidationResult
 from .wire import EventWireEnvelope
 
 __all__ = [
+    "JSON_BACKEND",
+    "SNAPSHOT_MODE_ATTRIBUTE",
+    "BufferedEventPublisher",
+    "BufferedPublisherStats",
+    "DedupWindow",
+    "EventBufferFullError",
+    "EventCodecError",
+    "EventCodecSchema",
+    "EventConsumer",
+    "EventConsumerStats",
     "EventPublisher",
     "EventWireEnvelope",
+    "InMemoryEventBroker",
+    "InMemoryOutboxStore",
     "NoOpEventPublisher",
+    "OutboxEventPublisher",
+    "OutboxRecord",
+    "OutboxRelay",
+    "OutboxStore",
+    "SnapshotBaselines",
+    "SnapshotPolicy",
+    "SnapshotStats",
+    "SyncEventPublisher",
     "TransitionValidationResult",
+    "TriggerBatchError",
+    "TriggerBinding",
+    "TriggerDispatcher",
+    "TriggerDispatcherStats",
+    "TriggerPolicy",
+    "apply_snapshot_policy",
     "create_event_id",
+    "decode_envelope",
+    "default_ordering_key",
+    "dumps_json_bytes",
+    "encode_envelope",
+    "envelope_from_json",
+    "envelope_to_json",
     "now_iso",
+    "object_ordering_key",
     "publish_sync",
     "publish_batch_sync",
+    "shutdown_publish_loop",
+    "with_snapshot_mode",
 ]
@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import datetime as _dt
+import enum
+import json
+import re
+import struct
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple, Union
+from uuid import UUID
+
+from .wire import EventWireEnvelope
+
+CODEC_VERSION = 1
+_MAX_FIELD_TAG = 0xFFFF
+
+_UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+_TIMESTAMP_PATTERN = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?(Z|[+-]\d{2}:\d{2})$"
+)
+_EPOCH = _dt.datetime(1970, 1, 1, tzinfo=_dt.timezone.utc)
+
+
+class EventCodecError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class _EventFields:
+    tags: Dict[str, int]
+    names: Dict[int, str]
+
+
+class EventCodecSchema:
+    """Field tags for one ontology version, as emitted to `gen/wire/event-codec.json`."""
+
+    def __init__(self, schema_version: str, events: Mapping[str, Mapping[int, str]]) -> None:
+        self.schema_version = schema_version
+        self._events: Dict[str, _EventFields] = {}
+        for event_type, names in events.items():
+            tags = {name: tag for tag, name in names.items()}
+            if len(tags) != len(names) or any(tag < 1 or tag > _MAX_FIELD_TAG for tag in names):
+                raise EventCodecError(f"invalid field tags for event '{event_type}'")
+            self._events[event_type] = _EventFields(tags=tags, names=dict(names))
+
+    @classmethod
+    def from_dict(cls, document: Mapping[str, object]) -> "EventCodecSchema":
+        if document.get("codec_version") != CODEC_VERSION:
+            raise EventCodecError(f"unsupported codec_version: {document.get('codec_version')!r}")
+        events: Dict[str, Dict[int, str]] = {}
+        for event in document.get("events", []):  # type: ignore[union-attr]
+            events[str(event["event_type"])] = {int(field["tag"]): str(field["name"]) for field in event["fields"]}
+        return cls(str(document["schema_version"]), events)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "EventCodecSchema":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def _fields_for(self, event_type: str, schema_version: str) -> Optional[_EventFields]:
+        if schema_version != self.schema_version:
+            return None
+        return self._events.get(event_type)
+
+
+def encode_envelope(envelope: EventWireEnvelope, schema: Optional[EventCodecSchema] = None) -> bytes:
+    fields = schema._fields_for(envelope.event_type, envelope.schema_version) if schema is not None else None
+    out = bytearray(b"\x9a")
+    _pack_int(CODEC_VERSION, out)
+    _pack(_encode_id(envelope.event_id), out)
+    _pack(_encode_id(envelope.trace_id), out)
+    _pack_str(envelope.event_type, out)
+    _pack_str(envelope.schema_version, out)
+    _pack(_encode_timestamp(envelope.occurred_at), out)
+    _pack_str(envelope.source, out)
+    _pack_header(len(envelope.payload), out, fixed=0x80, sizes=(None, 0xDE, 0xDF))
+    for key, value in envelope.payload.items():
+        tag = fields.tags.get(key) if fields is not None else None
+        if tag is not None:
+            _pack_int(tag, out)
+        else:
+            _pack_str(str(key), out)
+        _pack(value, out)
+    _pack(envelope.attributes, out)
+    if envelope.updated_objects is None:
+        out.append(0xC0)
+    else:
+        _pack_header(len(envelope.updated_objects), out, fixed=0x90, sizes=(None, 0xDC, 0xDD))
+        for item in envelope.updated_objects:
+            _pack([item.get("object_type"), item.get("object_ref"), item.get("object")], out)
+    return bytes(out)
+
+
+def decode_envelope(data: bytes, schema: Optional[EventCodecSchema] = None) -> EventWireEnvelope:
+    unpacker = _Unpacker(data)
+    value = unpacker.unpack()
+    if unpacker.offset != len(data):
+        raise EventCodecError("trailing bytes after envelope")
+    if not isinstance(value, list) or len(value) != 10:
+        raise EventCodecError("envelope must be a 10-element array")
+    if value[0] != CODEC_VERSION:
+        raise EventCodecError(f"unsupported codec version: {value[0]!r}")
+    event_type, schema_version = _expect_str(value[3], "event_type"), _expect_str(value[4], "schema_version")
+    raw_payload = value[7]
+    if not isinstance(raw_payload, dict):
+        raise EventCodecError("payload must be a map")
+    payload: Dict[str, object] = {}
+    fields: Optional[_EventFields] = None
+    for key, item in raw_payload.items():
+        if isinstance(key, int):
+            if fields is None:
+                fields = schema._fields_for(event_type, schema_version) if schema is not None else None
+                if fields is None:
+                    raise EventCodecError(f"no codec schema for {event_type} {schema_version}")
+            name = fields.names.get(key)
+            if name is None:
+                raise EventCodecError(f"unknown field tag {key} for {event_type}")
+            payload[name] = item
+        else:
+            payload[key] = item
+    attributes = value[8]
+    if attributes is not None and not isinstance(attributes, dict):
+        raise EventCodecError("attributes must be a map")
+    updated_objects = None
+    if value[9] is not None:
+        if not isinstance(value[9], list) or any(not isinstance(item, list) or len(item) != 3 for item in value[9]):
+            raise EventCodecError("updated_objects must be an array of [object_type, object_ref, object]")
+        updated_objects = [
+            {"object_type": item[0], "object_ref": item[1], "object": item[2]} for item in value[9]
+        ]
+    return EventWireEnvelope(
+        event_id=_decode_id(value[1]),
+        trace_id=_decode_id(value[2]),
+        event_type=event_type,
+        schema_version=schema_version,
+        occurred_at=_decode_timestamp(value[5]),
+        source=_expect_str(value[6], "source"),
+        payload=payload,
+        attributes=attributes,
+        updated_objects=updated_objects,
+    )
+
+
+def _expect_str(value: object, name: str) -> str:
+    if not isinstance(value, str):
+        raise EventCodecError(f"{name} must be a string")
+    return value
+
+
+def _encode_id(value: str) -> Union[str, bytes]:
+    if _UUID_PATTERN.match(value):
+        return UUID(value).bytes
+    return value
+
+
+def _decode_id(value: object) -> str:
+    if isinstance(value, bytes):
+        if len(value) != 16:
+            raise EventCodecError("binary ids must be 16 bytes")
+        return str(UUID(bytes=value))
+    return _expect_str(value, "id")
+
+
+def _encode_timestamp(value: str) -> Union[str, int]:
+    match = _TIMESTAMP_PATTERN.match(value)
+    if match is None:
+        return value
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    fraction = (fraction or "").ljust(9, "0")
+    if fraction[6:] != "000":
+        return value
+    try:
+        tz = _dt.timezone.utc
+        if offset != "Z":
+            sign = -1 if offset[0] == "-" else 1
+            tz = _dt.timezone(sign * _dt.timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6])))
+        moment = _dt.datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second), int(fraction[:6]), tzinfo=tz
+        )
+    except ValueError:
+        return value
+    delta = moment - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _decode_timestamp(value: object) -> str:
+    if isinstance(value, int) and not isinstance(value, bool):
+        try:
+            moment = _EPOCH + _dt.timedelta(microseconds=value)
+        except OverflowError as exc:
+            raise EventCodecError("occurred_at out of range") from exc
+        return (
+            f"{moment.year:04d}-{moment.month:02d}-{moment.day:02d}"
+            f"T{moment.hour:02d}:{moment.minute:02d}:{moment.second:02d}.{moment.microsecond:06d}Z"
+        )
+    return _expect_str(value, "occurred_at")
+
+
+def _pack(value: object, out: bytearray) -> None:
+    if value is None:
+        out.append(0xC0)
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, int) and not isinstance(value, enum.Enum):
+        _pack_int(value, out)
+    elif isinstance(value, float):
+        out.append(0xCB)
+        out += struct.pack(">d", value)
+    elif isinstance(value, str):
+        _pack_str(value, out)
+    elif isinstance(value, (bytes, bytearray)):
+        _pack_header(len(value), out, fixed=None, sizes=(0xC4, 0xC5, 0xC6))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        _pack_header(len(value), out, fixed=0x90, sizes=(None, 0xDC, 0xDD))
+        for item in value:
+            _pack(item, out)
+    elif isinstance(value, dict):
+        _pack_header(len(value), out, fixed=0x80, sizes=(None, 0xDE, 0xDF))
+        for key, item in value.items():
+            _pack_str(str(key), out)
+            _pack(item, out)
+    elif isinstance(value, enum.Enum):
+        _pack(value.value, out)
+    elif isinstance(value, (Decimal, UUID)):
+        _pack_str(str(value), out)
+    elif isinstance(value, (_dt.datetime, _dt.date, _dt.time)):
+        _pack_str(value.isoformat(), out)
+    else:
+        raise EventCodecError(f"cannot encode value of type {type(value).__name__}")
+
+
+def _pack_int(value: int, out: bytearray) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -0x20 <= value < 0:
+        out.append(value & 0xFF)
+    elif 0 <= value <= 0xFF:
+        out += b"\xcc" + struct.pack(">B", value)
+    elif 0 <= value <= 0xFFFF:
+        out += b"\xcd" + struct.pack(">H", value)
+    elif 0 <= value <= 0xFFFFFFFF:
+        out += b"\xce" + struct.pack(">I", value)
+    elif 0 <= value <= 0xFFFFFFFFFFFFFFFF:
+        out += b"\xcf" + struct.pack(">Q", value)
+    elif -0x80 <= value:
+        out += b"\xd0" + struct.pack(">b", value)
+    elif -0x8000 <= value:
+        out += b"\xd1" + struct.pack(">h", value)
+    elif -0x80000000 <= value:
+        out += b"\xd2" + struct.pack(">i", value)
+    elif -0x8000000000000000 <= value:
+        out += b"\xd3" + struct.pack(">q", value)
+    else:
+        raise EventCodecError(f"integer out of range: {value}")
+
+
+def _pack_str(value: str, out: bytearray) -> None:
+    encoded = value.encode("utf-8")
+    _pack_header(len(encoded), out, fixed=0xA0, sizes=(0xD9, 0xDA, 0xDB))
+    out += encoded
+
+
+def _pack_header(length: int, out: bytearray, *, fixed: Optional[int], sizes: Tuple[Optional[int], int, int]) -> None:
+    fixed_limit = 32 if fixed == 0xA0 else 16
+    if fixed is not None and length < fixed_limit:
+        out.append(fixed | length)
+    elif sizes[0] is not None and length <= 0xFF:
+        out += struct.pack(">BB", sizes[0], length)
+    elif length <= 0xFFFF:
+        out += struct.pack(">BH", sizes[1], length)
+    else:
+        out += struct.pack(">BI", sizes[2], length)
+
+
+class _Unpacker:
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def _take(self, size: int) -> memoryview:
+        end = self.offset + size
+        if end > len(self.data):
+            raise EventCodecError("truncated message")
+        chunk = self.data[self.offset : end]
+        self.offset = end
+        return chunk
+
+    def _read(self, fmt: str) -> int:
+        return struct.unpack(fmt, self._take(struct.calcsize(fmt)))[0]
+
+    def unpack(self) -> object:
+        code = self._take(1)[0]
+        if code <= 0x7F:
+            return code
+        if code >= 0xE0:
+            return code - 0x100
+        if 0x80 <= code <= 0x8F:
+            return self._map(code & 0x0F)
+        if 0x90 <= code <= 0x9F:
+            return [self.unpack() for _ in range(code & 0x0F)]
+        if 0xA0 <= code <= 0xBF:
+            return self._str(code & 0x1F)
+        if code == 0xC0:
+            return None
+        if code == 0xC2:
+            return False
+        if code == 0xC3:
+            return True
+        reader = _FIXED_READERS.get(code)
+        if reader is not None:
+            return self._read(reader)
+        if code in (0xC4, 0xC5, 0xC6):
+            return bytes(self._take(self._read(_LENGTH_FORMATS[code])))
+        if code in (0xD9, 0xDA, 0xDB):
+            return self._str(self._read(_LENGTH_FORMATS[code]))
+        if code in (0xDC, 0xDD):
+            return [self.unpack() for _ in range(self._read(_LENGTH_FORMATS[code]))]
+        if code in (0xDE, 0xDF):
+            return self._map(self._read(_LENGTH_FORMATS[code]))
+        raise EventCodecError(f"unsupported MessagePack type 0x{code:02x}")
+
+    def _str(self, length: int) -> str:
+        try:
+            return str(self._take(length), "utf-8")
+        except UnicodeDecodeError as exc:
+            raise EventCodecError("invalid UTF-8 string") from exc
+
+    def _map(self, length: int) -> Dict[object, object]:
+        result: Dict[object, object] = {}
+        for _ in range(length):
+            key = self.unpack()
+            if not isinstance(key, (str, int)) or isinstance(key, bool):
+                raise EventCodecError("map keys must be strings or integer tags")
+            result[key] = self.unpack()
+        return result
+
+
+_FIXED_READERS: Dict[int, str] = {
+    0xCA: ">f",
+    0xCB: ">d",
+    0xCC: ">B",
+    0xCD: ">H",
+    0xCE: ">I",
+    0xCF: ">Q",
+    0xD0: ">b",
+    0xD1: ">h",
+    0xD2: ">i",
+    0xD3: ">q",
+}
+_LENGTH_FORMATS: Dict[int, str] = {
+    0xC4: ">B",
+    0xC5: ">H",
+    0xC6: ">I",
+    0xD9: ">B",
+    0xDA: ">H",
+    0xDB: ">I",
+    0xDC: ">H",
+    0xDD: ">I",
+    0xDE: ">H",
+    0xDF: ">I",
+}
+
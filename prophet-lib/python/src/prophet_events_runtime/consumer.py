@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Protocol, Set
+
+from .wire import EventWireEnvelope
+
+_LOGGER = logging.getLogger(__name__)
+
+EventHandler = Callable[[Any, EventWireEnvelope], Any]
+
+
+class EnvelopeReceiver(Protocol):
+    async def receive_batch(self, envelopes: Iterable[EventWireEnvelope]) -> None: ...
+
+
+@dataclass
+class EventConsumerStats:
+    received: int = 0
+    handled: int = 0
+    failed: int = 0
+    duplicates: int = 0
+    unrouted: int = 0
+    lag_samples: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    total_lag_ms: float = 0.0
+
+    @property
+    def mean_lag_ms(self) -> float:
+        return self.total_lag_ms / self.lag_samples if self.lag_samples else 0.0
+
+    def record_lag(self, lag_ms: float) -> None:
+        self.lag_samples += 1
+        self.last_lag_ms = lag_ms
+        self.total_lag_ms += lag_ms
+        if lag_ms > self.max_lag_ms:
+            self.max_lag_ms = lag_ms
+
+
+class DedupWindow:
+    """Remembers the most recent `capacity` event ids (least recently seen evicted first)."""
+
+    def __init__(self, capacity: int = 10000) -> None:
+        if capacity < 0:
+            raise ValueError("capacity must be >= 0")
+        self._capacity = capacity
+        self._seen: OrderedDict[str, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._seen
+
+    def check_and_add(self, event_id: str) -> bool:
+        """Record `event_id`; returns True when it was already in the window."""
+        if event_id in self._seen:
+            self._seen.move_to_end(event_id)
+            return True
+        if self._capacity:
+            self._seen[event_id] = None
+            if len(self._seen) > self._capacity:
+                self._seen.popitem(last=False)
+        return False
+
+    def discard(self, event_id: str) -> None:
+        self._seen.pop(event_id, None)
+
+
+def object_ordering_key(object_type: str, object_ref: object) -> Optional[str]:
+    if not isinstance(object_ref, dict) or not object_ref or any(value is None for value in object_ref.values()):
+        return None
+    return object_type + ":" + json.dumps(object_ref, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def default_ordering_key(envelope: EventWireEnvelope) -> Optional[str]:
+    for updated in envelope.updated_objects or ():
+        key = object_ordering_key(str(updated.get("object_type", "")), updated.get("object_ref"))
+        if key is not None:
+            return key
+    return None
+
+
+def _occurred_at_seconds(occurred_at: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(occurred_at.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+def _log_handler_error(error: BaseException, envelope: EventWireEnvelope) -> None:
+    _LOGGER.error("Event handler failed for %s %s", envelope.event_type, envelope.event_id, exc_info=error)
+
+
+@dataclass(frozen=True)
+class _Route:
+    handler: EventHandler
+    blocking: bool
+
+
+class EventConsumer:
+    """Routes received envelopes to handlers with per-aggregate ordering and bounded concurrency.
+
+    Envelopes with the same ordering key (by default the first `updated_objects` entry's
+    `object_type` and `object_ref`) are handled one at a time in arrival order; envelopes
+    without a key run independently. At most `concurrency` handlers run at once, and
+    `receive_batch` waits while `max_pending` envelopes are queued or running.
+
+    Envelopes whose `event_id` is in the dedup window are skipped. A failed envelope is
+    reported to `on_error` and dropped from the window so a broker redelivery is handled.
+    Lag (handler start time minus `occurred_at`) is tracked in `stats`.
+    Use one consumer from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        decode: Callable[[EventWireEnvelope], Any] = lambda envelope: envelope,
+        ordering_key: Callable[[EventWireEnvelope], Optional[str]] = default_ordering_key,
+        concurrency: int = 8,
+        max_pending: int = 10000,
+        dedup_window: int = 10000,
+        on_error: Callable[[BaseException, EventWireEnvelope], None] = _log_handler_error,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self._decode = decode
+        self._ordering_key = ordering_key
+        self._slots = asyncio.Semaphore(concurrency)
+        self._capacity = asyncio.Semaphore(max_pending)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._on_error = on_error
+        self._clock = clock
+        self._routes: Dict[str, _Route] = {}
+        self._lanes: Dict[str, Deque[EventWireEnvelope]] = {}
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self._pending = 0
+        self.dedup = DedupWindow(dedup_window)
+        self.stats = EventConsumerStats()
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def on(self, event_type: str, handler: EventHandler, *, blocking: bool = False) -> None:
+        """Route `event_type` to `handler(decoded_event, envelope)`; `blocking` handlers run on a worker thread."""
+        self._routes[event_type] = _Route(handler, blocking)
+
+    async def receive(self, envelope: EventWireEnvelope) -> None:
+        await self.receive_batch([envelope])
+
+    async def receive_batch(self, envelopes: Iterable[EventWireEnvelope]) -> None:
+        for envelope in envelopes:
+            self.stats.received += 1
+            if envelope.event_type not in self._routes:
+                self.stats.unrouted += 1
+                continue
+            if self.dedup.check_and_add(envelope.event_id):
+                self.stats.duplicates += 1
+                continue
+            await self._capacity.acquire()
+            self._pending += 1
+            self._idle.clear()
+            key = self._ordering_key(envelope)
+            if key is None:
+                self._spawn(self._run_one(envelope))
+            elif key in self._lanes:
+                self._lanes[key].append(envelope)
+            else:
+                self._lanes[key] = deque([envelope])
+                self._spawn(self._run_lane(key))
+
+    async def drain(self) -> None:
+        await self._idle.wait()
+
+    async def stop(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to `timeout` seconds for queued envelopes, then cancel the rest; returns whether it drained."""
+        try:
+            await asyncio.wait_for(self.drain(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            return False
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_lane(self, key: str) -> None:
+        lane = self._lanes[key]
+        try:
+            while lane:
+                await self._run_one(lane.popleft())
+        finally:
+            self._lanes.pop(key, None)
+            for _ in range(len(lane)):
+                self._finish()
+
+    async def _run_one(self, envelope: EventWireEnvelope) -> None:
+        route = self._routes[envelope.event_type]
+        try:
+            async with self._slots:
+                occurred = _occurred_at_seconds(envelope.occurred_at)
+                if occurred is not None:
+                    self.stats.record_lag(max(0.0, (self._clock() - occurred) * 1000.0))
+                try:
+                    event = self._decode(envelope)
+                    if route.blocking:
+                        await asyncio.to_thread(route.handler, event, envelope)
+                    else:
+                        result = route.handler(event, envelope)
+                        if inspect.isawaitable(result):
+                            await result
+                except Exception as error:
+                    self.stats.failed += 1
+                    self.dedup.discard(envelope.event_id)
+                    self._report(error, envelope)
+                else:
+                    self.stats.handled += 1
+        finally:
+            self._finish()
+
+    def _finish(self) -> None:
+        self._pending -= 1
+        self._capacity.release()
+        if self._pending == 0:
+            self._idle.set()
+
+    def _report(self, error: BaseException, envelope: EventWireEnvelope) -> None:
+        try:
+            self._on_error(error, envelope)
+        except Exception:
+            _LOGGER.exception("Event consumer error handler raised for %s", envelope.event_id)
+
+
+class InMemoryEventBroker:
+    """`EventPublisher` stand-in that records envelopes and delivers them to subscribed consumers in-process."""
+
+    def __init__(self) -> None:
+        self._subscribers: List[EnvelopeReceiver] = []
+        self.published: List[EventWireEnvelope] = []
+
+    def subscribe(self, consumer: EnvelopeReceiver) -> None:
+        self._subscribers.append(consumer)
+
+    async def publish(self, envelope: EventWireEnvelope) -> None:
+        await self.publish_batch([envelope])
+
+    async def publish_batch(self, envelopes: Iterable[EventWireEnvelope]) -> None:
+        batch = list(envelopes)
+        self.published.extend(batch)
+        for subscriber in list(self._subscribers):
+            await subscriber.receive_batch(batch)
+
+    async def redeliver(self, start: int = 0) -> None:
+        """Deliver already-published envelopes again (from index `start`), as a broker would after a consumer restart."""
+        batch = self.published[start:]
+        for subscriber in list(self._subscribers):
+            await subscriber.receive_batch(batch)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Tuple
+
+# UUIDv7 layout (RFC 9562): 48-bit Unix ms | ver 7 | 12-bit rand_a | var 0b10 | 62-bit rand_b.
+# rand_a plus the top 30 bits of rand_b hold a 42-bit counter that is seeded randomly each
+# millisecond and incremented within it, so ids from one process sort in creation order.
+_COUNTER_BITS = 42
+_COUNTER_SEED_BITS = 41
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+_TAIL_BITS = 32
+_VERSION_BITS = 0x7 << 76
+_VARIANT_BITS = 0x2 << 62
+# Random bits come from os.urandom, read in blocks so most ids skip the syscall.
+_ENTROPY_BYTES = 4096
+
+_id_lock = threading.Lock()
+_entropy = b""
+_entropy_pos = 0
+_last_ms = 0
+_counter = 0
+
+
+def _random_bits(bits: int) -> int:
+    """Return `bits` bits from the buffered urandom block; callers hold `_id_lock`."""
+    global _entropy, _entropy_pos
+    size = (bits + 7) // 8
+    start = _entropy_pos
+    if start + size > len(_entropy):
+        _entropy = os.urandom(_ENTROPY_BYTES)
+        start = 0
+    _entropy_pos = start + size
+    return int.from_bytes(_entropy[start : start + size], "big") >> (size * 8 - bits)
+
+
+def _reset_after_fork() -> None:
+    # The child must not replay the parent's buffered entropy.
+    global _id_lock, _entropy, _entropy_pos, _last_ms, _counter
+    _id_lock = threading.Lock()
+    _entropy = b""
+    _entropy_pos = 0
+    _last_ms = 0
+    _counter = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def create_event_id() -> str:
+    """Return a time-ordered UUIDv7 string; ids from one process are strictly increasing."""
+    global _last_ms, _counter
+    now_ms = time.time_ns() // 1_000_000
+    with _id_lock:
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = _random_bits(_COUNTER_SEED_BITS)
+        elif _counter < _COUNTER_MAX:
+            # Same millisecond, or the clock stepped back: keep the last timestamp and count up.
+            _counter += 1
+        else:
+            # Counter exhausted: borrow the next millisecond.
+            _last_ms += 1
+            _counter = _random_bits(_COUNTER_SEED_BITS)
+        timestamp_ms = _last_ms
+        counter = _counter
+        tail = _random_bits(_TAIL_BITS)
+    value = (
+        (timestamp_ms << 80)
+        | _VERSION_BITS
+        | ((counter >> 30) << 64)
+        | _VARIANT_BITS
+        | ((counter & 0x3FFFFFFF) << _TAIL_BITS)
+        | tail
+    )
+    text = "%032x" % value
+    return f"{text[:8]}-{text[8:12]}-{text[12:16]}-{text[16:20]}-{text[20:]}"
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last formatted second; replaced atomically.
+_clock_cache: Tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+    """Return the current UTC time as RFC3339 with microseconds, e.g. `2024-07-01T12:00:00.250000+00:00`.
+
+    The date/time prefix is formatted once per second and reused, so most calls only format
+    the microsecond fraction.
+    """
+    global _clock_cache
+    seconds, micros = divmod(time.time_ns() // 1_000, 1_000_000)
+    cached_second, prefix = _clock_cache
+    if cached_second != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _clock_cache = (seconds, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime as _dt
+import json
+from decimal import Decimal
+from typing import Callable, Tuple
+
+
+def _default(value: object) -> object:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (_dt.datetime, _dt.date, _dt.time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(value: object) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def _load_backend() -> Tuple[str, Callable[[object], bytes]]:
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        option = orjson.OPT_NON_STR_KEYS
+        return "orjson", lambda value: orjson.dumps(value, default=_default, option=option)
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        encoder = msgspec.json.Encoder(enc_hook=_default, decimal_format="number")
+        return "msgspec", encoder.encode
+    return "json", _stdlib_dumps
+
+
+JSON_BACKEND, _dumps = _load_backend()
+
+
+def dumps_json_bytes(value: object) -> bytes:
+    """Encode `value` as compact UTF-8 JSON with orjson or msgspec when installed, else the stdlib.
+
+    `JSON_BACKEND` names the encoder in use. Dates and times become ISO strings and decimals
+    become numbers on every backend.
+    """
+    return _dumps(value)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import threading
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
+
+from .publisher import EventPublisher
+from .publisher import _run_async
+from .wire import EventWireEnvelope
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True)
+class OutboxRecord:
+    event_id: str
+    envelope: EventWireEnvelope
+    attempts: int = 0
+
+
+class OutboxStore(Protocol):
+    def append(self, envelopes: List[EventWireEnvelope]) -> Any: ...
+
+    def claim_batch(self, limit: int) -> Any: ...
+
+    def mark_published(self, event_ids: List[str]) -> Any: ...
+
+    def mark_failed(self, event_ids: List[str], error: str) -> Any: ...
+
+    def mark_parked(self, event_ids: List[str], error: str) -> Any: ...
+
+
+def envelope_to_json(envelope: EventWireEnvelope) -> str:
+    return json.dumps(asdict(envelope), separators=(",", ":"), default=str)
+
+
+def envelope_from_json(value: str) -> EventWireEnvelope:
+    data: Dict[str, Any] = json.loads(value)
+    return EventWireEnvelope(**data)
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _call_store(method: Callable[..., Any], *args: Any) -> Any:
+    # Sync stores (Django ORM, blocking sessions) run on a worker thread so the relay loop stays free.
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+    return await _maybe_await(await asyncio.to_thread(method, *args))
+
+
+class OutboxEventPublisher:
+    """Event publisher that appends envelopes to an outbox store instead of a broker.
+
+    Store methods may be sync or async; the sync entry points are used by
+    `publish_sync` / `publish_batch_sync` so sync ORMs are never driven from a
+    running event loop.
+    """
+
+    def __init__(self, store: OutboxStore) -> None:
+        self._store = store
+
+    async def publish(self, envelope: EventWireEnvelope) -> None:
+        await _maybe_await(self._store.append([envelope]))
+
+    async def publish_batch(self, envelopes: Iterable[EventWireEnvelope]) -> None:
+        batch = list(envelopes)
+        if batch:
+            await _maybe_await(self._store.append(batch))
+
+    def publish_sync(self, envelope: EventWireEnvelope) -> None:
+        self.publish_batch_sync([envelope])
+
+    def publish_batch_sync(self, envelopes: Iterable[EventWireEnvelope]) -> None:
+        batch = list(envelopes)
+        if not batch:
+            return
+        result = self._store.append(batch)
+        if inspect.isawaitable(result):
+            _run_async(result)
+
+
+class OutboxRelay:
+    """Drains outbox rows to a downstream publisher with at-least-once delivery.
+
+    Rows are only marked published after the downstream `publish_batch` call
+    returns, so a crash or broker failure leaves them in place for the next drain.
+    A row that fails `max_attempts` times is parked instead; `claim_batch` skips
+    parked rows so one poison event cannot stall the rows queued behind it.
+    """
+
+    def __init__(
+        self,
+        store: OutboxStore,
+        publisher: EventPublisher,
+        *,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: Optional[int] = 10,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if max_attempts is not None and max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self._store = store
+        self._publisher = publisher
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    async def drain_once(self) -> int:
+        records: List[OutboxRecord] = list(await _call_store(self._store.claim_batch, self._batch_size))
+        if not records:
+            return 0
+        event_ids = [record.event_id for record in records]
+        try:
+            await self._publisher.publish_batch([record.envelope for record in records])
+        except Exception as error:
+            await self._record_failure(records, repr(error))
+            raise
+        await _call_store(self._store.mark_published, event_ids)
+        return len(records)
+
+    async def _record_failure(self, records: List[OutboxRecord], error: str) -> None:
+        if self._max_attempts is None:
+            await _call_store(self._store.mark_failed, [record.event_id for record in records], error)
+            return
+        parked = [record.event_id for record in records if record.attempts + 1 >= self._max_attempts]
+        retried = [record.event_id for record in records if record.attempts + 1 < self._max_attempts]
+        if retried:
+            await _call_store(self._store.mark_failed, retried, error)
+        if parked:
+            _LOGGER.warning("Parking %d outbox event(s) after %d failed attempts: %s", len(parked), self._max_attempts, parked)
+            await _call_store(self._store.mark_parked, parked, error)
+
+    async def drain(self) -> int:
+        total = 0
+        while True:
+            published = await self.drain_once()
+            total += published
+            if published < self._batch_size:
+                return total
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        while not self._stop.is_set() and (stop is None or not stop.is_set()):
+            try:
+                await self.drain()
+            except Exception:
+                _LOGGER.exception("Outbox relay drain failed; retrying after poll interval")
+            await asyncio.sleep(self._poll_interval)
+
+    def start(self) -> threading.Thread:
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        self._stop.clear()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self.run()), name="prophet-outbox-relay", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+class InMemoryOutboxStore:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: Dict[str, OutboxRecord] = {}
+        self.published: List[EventWireEnvelope] = []
+        self.parked: Dict[str, OutboxRecord] = {}
+        self.last_errors: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def append(self, envelopes: List[EventWireEnvelope]) -> None:
+        with self._lock:
+            for envelope in envelopes:
+                if envelope.event_id not in self.parked:
+                    self._pending.setdefault(envelope.event_id, OutboxRecord(event_id=envelope.event_id, envelope=envelope))
+
+    def claim_batch(self, limit: int) -> List[OutboxRecord]:
+        with self._lock:
+            return list(self._pending.values())[:limit]
+
+    def mark_published(self, event_ids: List[str]) -> None:
+        with self._lock:
+            for event_id in event_ids:
+                record = self._pending.pop(event_id, None)
+                if record is not None:
+                    self.published.append(record.envelope)
+
+    def mark_failed(self, event_ids: List[str], error: str) -> None:
+        with self._lock:
+            for event_id in event_ids:
+                record = self._pending.get(event_id)
+                if record is not None:
+                    record.attempts += 1
+                    self.last_errors[event_id] = error
+
+    def mark_parked(self, event_ids: List[str], error: str) -> None:
+        with self._lock:
+            for event_id in event_ids:
+                record = self._pending.pop(event_id, None)
+                if record is not None:
+                    record.attempts += 1
+                    self.parked[event_id] = record
+                    self.last_errors[event_id] = error
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
-from typing import Iterable, Protocol
-from uuid import uuid4
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, List, Optional, Protocol, Union
 
+from .ids import create_event_id as create_event_id
+from .ids import now_iso as now_iso
 from .wire import EventWireEnvelope
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class EventPublisher(Protocol):
     async def publish(self, envelope: EventWireEnvelope) -> None: ...
@@ -21,27 +31,440 @@ class NoOpEventPublisher:
     async def publish_batch(self, envelopes: Iterable[EventWireEnvelope]) -> None:
         return None
 
+    def publish_sync(self, envelope: EventWireEnvelope) -> None:
+        return None
+
+    def publish_batch_sync(self, envelopes: Iterable[EventWireEnvelope]) -> None:
+        return None
+
+
+class SyncEventPublisher(Protocol):
+    def publish_sync(self, envelope: EventWireEnvelope) -> None: ...
+
+    def publish_batch_sync(self, envelopes: Iterable[EventWireEnvelope]) -> None: ...
+
+
+class _PublishLoop:
+    """Event loop on a daemon thread that runs async publishers for the sync helpers.
+
+    The loop is created on first use and recreated after `os.fork()`, so pre-forking
+    servers get one loop per worker process instead of one per publish call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def run(self, coro: object) -> object:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()  # type: ignore[arg-type]
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            loop, thread, pid = self._loop, self._thread, self._pid
+            self._loop = self._thread = self._pid = None
+        if loop is None or thread is None or pid != os.getpid():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if (
+                self._loop is not None
+                and self._thread is not None
+                and self._pid == os.getpid()
+                and self._thread.is_alive()
+            ):
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(target=self._serve, args=(loop, ready), name="prophet-publish-loop", daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            return loop
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
 
-def create_event_id() -> str:
-    return str(uuid4())
 
+_PUBLISH_LOOP = _PublishLoop()
+atexit.register(_PUBLISH_LOOP.stop, 5.0)
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
 
 
 def _run_async(coro: object) -> None:
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        asyncio.run(coro)  # type: ignore[arg-type]
+        _PUBLISH_LOOP.run(coro)
         return
+    coro.close()  # type: ignore[attr-defined]
     raise RuntimeError("Cannot use sync publish helper while an event loop is running")
 
 
+def shutdown_publish_loop(timeout: Optional[float] = None) -> None:
+    """Stop the background loop used by `publish_sync` / `publish_batch_sync`; it restarts on next use."""
+    _PUBLISH_LOOP.stop(timeout)
+
+
 def publish_sync(publisher: EventPublisher, envelope: EventWireEnvelope) -> None:
+    native = getattr(publisher, "publish_sync", None)
+    if callable(native):
+        native(envelope)
+        return
     _run_async(publisher.publish(envelope))
 
 
 def publish_batch_sync(publisher: EventPublisher, envelopes: Iterable[EventWireEnvelope]) -> None:
+    native = getattr(publisher, "publish_batch_sync", None)
+    if callable(native):
+        native(envelopes)
+        return
     _run_async(publisher.publish_batch(envelopes))
+
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest", "raise")
+
+
+class EventBufferFullError(RuntimeError):
+    pass
+
+
+@dataclass
+class BufferedPublisherStats:
+    enqueued: int = 0
+    published: int = 0
+    failed: int = 0
+    dropped: int = 0
+    batches: int = 0
+
+
+def _log_publish_error(error: BaseException, envelopes: List[EventWireEnvelope]) -> None:
+    _LOGGER.error("Buffered event publish failed for %d envelope(s)", len(envelopes), exc_info=error)
+
+
+class BufferedEventPublisher:
+    """Coalesces envelopes from concurrent actions into size- and linger-bounded batches.
+
+    `publish`/`publish_batch` return once envelopes are queued and batches are forwarded
+    to the wrapped publisher one at a time. Publishers with `publish_batch_sync` are fed
+    from a daemon worker thread; async-only publishers are fed from a flusher task on the
+    event loop that first publishes (or on the shared sync-helper loop when envelopes
+    arrive from plain threads). Failed batches are reported to `on_error` and not retried.
+    """
+
+    def __init__(
+        self,
+        inner: EventPublisher,
+        *,
+        max_batch_size: int = 100,
+        linger_ms: float = 5.0,
+        max_queue_size: int = 10000,
+        overflow: str = "block",
+        on_error: Callable[[BaseException, List[EventWireEnvelope]], None] = _log_publish_error,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_queue_size < max_batch_size:
+            raise ValueError("max_queue_size must be >= max_batch_size")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+        native = getattr(inner, "publish_batch_sync", None)
+        self._inner = inner
+        self._inner_sync: Optional[Callable[[List[EventWireEnvelope]], None]] = native if callable(native) else None
+        self._max_batch_size = max_batch_size
+        self._linger = max(linger_ms, 0.0) / 1000.0
+        self._max_queue_size = max_queue_size
+        self._overflow = overflow
+        self._on_error = on_error
+        self._buffer: Deque[EventWireEnvelope] = deque()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._in_flight_batch: Optional[List[EventWireEnvelope]] = None
+        self._flush_requests = 0
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+        self._flusher: Optional[Union[asyncio.Task, concurrent.futures.Future]] = None
+        self._flusher_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup = asyncio.Event()
+        self._progress = asyncio.Event()
+        self.stats = BufferedPublisherStats()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    async def publish(self, envelope: EventWireEnvelope) -> None:
+        await self.publish_batch([envelope])
+
+    async def publish_batch(self, envelopes: Iterable[EventWireEnvelope]) -> None:
+        batch = list(envelopes)
+        if not self._offer(batch, block=False):
+            await asyncio.to_thread(self._offer, batch, block=True)
+
+    def publish_sync(self, envelope: EventWireEnvelope) -> None:
+        self._offer([envelope], block=True)
+
+    def publish_batch_sync(self, envelopes: Iterable[EventWireEnvelope]) -> None:
+        self._offer(list(envelopes), block=True)
+
+    def flush_sync(self, timeout: Optional[float] = None) -> bool:
+        if self._on_flusher_loop():
+            raise RuntimeError("flush_sync() would block the loop running the flusher; await flush() instead")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if self._buffer:
+                self._ensure_flusher(detached=True)
+            self._flush_requests += 1
+            self._condition.notify_all()
+            self._wake()
+            try:
+                while self._buffer or self._in_flight:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                return True
+            finally:
+                self._flush_requests -= 1
+
+    def close_sync(self, timeout: Optional[float] = None) -> bool:
+        self._mark_closed()
+        drained = self.flush_sync(timeout)
+        if self._worker is not None:
+            self._worker.join(timeout)
+        return drained
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        if self._inner_sync is None:
+            with self._condition:
+                if self._buffer:
+                    self._ensure_flusher()
+            if self._on_flusher_loop():
+                return await self._flush_on_loop(timeout)
+        return await asyncio.to_thread(self.flush_sync, timeout)
+
+    async def close(self, timeout: Optional[float] = None) -> bool:
+        self._mark_closed()
+        drained = await self.flush(timeout)
+        if self._worker is not None:
+            await asyncio.to_thread(self._worker.join, timeout)
+        return drained
+
+    def _mark_closed(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            self._wake()
+
+    def _offer(self, batch: List[EventWireEnvelope], *, block: bool) -> bool:
+        # Consumes `batch` from the front so a non-blocking attempt can be resumed without duplicates.
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BufferedEventPublisher is closed")
+            if self._overflow == "raise" and len(self._buffer) + len(batch) > self._max_queue_size:
+                # Rejects the whole batch so callers never see a partially enqueued one.
+                raise EventBufferFullError(f"event buffer is full ({self._max_queue_size} envelopes)")
+            self._ensure_flusher()
+            while batch:
+                if len(self._buffer) >= self._max_queue_size:
+                    if self._overflow == "drop_oldest":
+                        self._buffer.popleft()
+                        self.stats.dropped += 1
+                    elif self._overflow == "drop_newest":
+                        batch.pop(0)
+                        self.stats.dropped += 1
+                        continue
+                    elif not block:
+                        return False
+                    elif self._on_flusher_loop():
+                        raise EventBufferFullError("event buffer is full and the flusher runs on this event loop")
+                    else:
+                        self._condition.notify_all()
+                        self._wake()
+                        self._condition.wait()
+                        if self._closed:
+                            raise RuntimeError("BufferedEventPublisher is closed")
+                        continue
+                self._buffer.append(batch.pop(0))
+                self.stats.enqueued += 1
+            self._condition.notify_all()
+            self._wake()
+        return True
+
+    def _ensure_flusher(self, *, detached: bool = False) -> None:
+        # Caller holds `self._condition`.
+        if self._inner_sync is not None:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="prophet-event-buffer", daemon=True)
+                self._worker.start()
+            return
+        loop = self._flusher_loop
+        if self._flusher is not None and not self._flusher.done() and loop is not None and not loop.is_closed():
+            return
+        if self._in_flight_batch is not None:
+            # The previous flusher's loop went away mid-publish; deliver that batch again.
+            self._requeue_locked(self._in_flight_batch)
+        running = None if detached else _running_loop()
+        self._wakeup = asyncio.Event()
+        self._progress = asyncio.Event()
+        if running is None:
+            loop = _PUBLISH_LOOP._ensure_loop()
+            self._flusher = asyncio.run_coroutine_threadsafe(self._drain(), loop)
+        else:
+            loop = running
+            self._flusher = loop.create_task(self._drain())
+        self._flusher_loop = loop
+
+    def _on_flusher_loop(self) -> bool:
+        return self._flusher_loop is not None and _running_loop() is self._flusher_loop
+
+    def _wake(self) -> None:
+        loop = self._flusher_loop
+        if loop is None or self._inner_sync is not None:
+            return
+        if _running_loop() is loop:
+            self._wakeup.set()
+            return
+        try:
+            loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            pass  # loop already closed; the next publish starts a new flusher
+
+    def _take_batch_locked(self) -> List[EventWireEnvelope]:
+        size = min(len(self._buffer), self._max_batch_size)
+        batch = [self._buffer.popleft() for _ in range(size)]
+        self._in_flight += 1
+        self._in_flight_batch = batch
+        self._condition.notify_all()
+        return batch
+
+    def _requeue_locked(self, batch: List[EventWireEnvelope]) -> None:
+        self._buffer.extendleft(reversed(batch))
+        self._in_flight -= 1
+        self._in_flight_batch = None
+        self._condition.notify_all()
+
+    def _complete(self, batch: List[EventWireEnvelope], error: Optional[BaseException]) -> None:
+        if error is not None:
+            try:
+                self._on_error(error, batch)
+            except Exception:
+                _LOGGER.exception("Buffered event publisher error handler failed")
+        with self._condition:
+            # Stats share the buffer lock with `_offer`, which callers run on their own threads.
+            if error is None:
+                self.stats.published += len(batch)
+            else:
+                self.stats.failed += len(batch)
+            self.stats.batches += 1
+            self._in_flight -= 1
+            self._in_flight_batch = None
+            self._condition.notify_all()
+
+    def _next_batch(self) -> Optional[List[EventWireEnvelope]]:
+        with self._condition:
+            while not self._buffer:
+                if self._closed:
+                    return None
+                self._condition.wait()
+            deadline = time.monotonic() + self._linger
+            while len(self._buffer) < self._max_batch_size and not self._closed and not self._flush_requests:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            return self._take_batch_locked()
+
+    def _run(self) -> None:
+        publish_batch = self._inner_sync
+        assert publish_batch is not None
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                publish_batch(batch)
+            except Exception as error:
+                self._complete(batch, error)
+            else:
+                self._complete(batch, None)
+
+    async def _next_batch_async(self) -> Optional[List[EventWireEnvelope]]:
+        wakeup = self._wakeup
+        while True:
+            with self._condition:
+                wakeup.clear()
+                if self._buffer:
+                    break
+                if self._closed:
+                    return None
+            await wakeup.wait()
+        deadline = time.monotonic() + self._linger
+        while True:
+            with self._condition:
+                wakeup.clear()
+                if len(self._buffer) >= self._max_batch_size or self._closed or self._flush_requests:
+                    break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        with self._condition:
+            return self._take_batch_locked()
+
+    async def _drain(self) -> None:
+        while True:
+            batch = await self._next_batch_async()
+            if batch is None:
+                return
+            try:
+                await self._inner.publish_batch(batch)
+            except asyncio.CancelledError:
+                # The owning loop is shutting down; keep the batch for the next flusher.
+                with self._condition:
+                    self._requeue_locked(batch)
+                raise
+            except Exception as error:
+                self._complete(batch, error)
+            else:
+                self._complete(batch, None)
+            self._progress.set()
+
+    async def _flush_on_loop(self, timeout: Optional[float]) -> bool:
+        with self._condition:
+            self._flush_requests += 1
+            self._wake()
+        try:
+            await asyncio.wait_for(self._wait_idle(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._condition:
+                self._flush_requests -= 1
+
+    async def _wait_idle(self) -> None:
+        while True:
+            with self._condition:
+                if not self._buffer and not self._in_flight:
+                    return
+                self._progress.clear()
+            await self._progress.wait()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import fields
+from typing import Dict, List, Mapping, Optional, Tuple
+
+SNAPSHOT_MODES = ("full", "changed", "ref_only")
+SNAPSHOT_MODE_ATTRIBUTE = "prophet.snapshot_mode"
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class SnapshotPolicy:
+    """How an envelope's `updated_objects` snapshots are emitted.
+
+    `full` keeps whole objects, `changed` keeps primary keys plus the fields that differ
+    from the recorded pre-action baseline (objects without a baseline are sent whole), and
+    `ref_only` sends no snapshots (refs stay in the payload). `max_bytes` caps the
+    compact-JSON size of all snapshots in one envelope; snapshots past the cap are dropped.
+    """
+
+    mode: str = "full"
+    max_bytes: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.mode not in SNAPSHOT_MODES:
+            raise ValueError(f"mode must be one of {', '.join(SNAPSHOT_MODES)}")
+        if self.max_bytes is not None and self.max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+
+    @property
+    def measures(self) -> bool:
+        return self.mode != "full" or self.max_bytes is not None
+
+
+@dataclass
+class SnapshotStats:
+    """Snapshot counters; byte counts are only measured for non-`full` or capped policies."""
+
+    emitted: int = 0
+    shared: int = 0
+    diffed: int = 0
+    omitted: int = 0
+    dropped: int = 0
+    bytes_emitted: int = 0
+    bytes_saved: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def add(self, other: "SnapshotStats") -> None:
+        """Fold `other`'s counts in under a lock so concurrent publishers can share one instance."""
+        with self._lock:
+            for counter in _COUNTERS:
+                setattr(self, counter, getattr(self, counter) + getattr(other, counter))
+
+
+_COUNTERS = tuple(item.name for item in fields(SnapshotStats) if not item.name.startswith("_"))
+_ONE_EMITTED = SnapshotStats(emitted=1)
+
+
+def _object_key(object_type: str, object_ref: object) -> Tuple[str, str]:
+    return object_type, json.dumps(object_ref, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _json_size(value: object) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+class SnapshotBaselines:
+    """Pre-action object state, keyed by object type and ref, that `changed` snapshots diff against."""
+
+    def __init__(self) -> None:
+        self._states: Dict[Tuple[str, str], Dict[str, object]] = {}
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def record(self, object_type: str, object_ref: Mapping[str, object], state: Mapping[str, object]) -> None:
+        """Record `state` as the baseline for the object unless one was already recorded."""
+        self._states.setdefault(_object_key(object_type, dict(object_ref)), dict(state))
+
+    def get(self, object_type: str, object_ref: Mapping[str, object]) -> Optional[Dict[str, object]]:
+        return self._states.get(_object_key(object_type, dict(object_ref)))
+
+    def clear(self) -> None:
+        self._states.clear()
+
+
+def apply_snapshot_policy(
+    updated_objects: List[Dict[str, object]],
+    policy: SnapshotPolicy,
+    *,
+    baselines: Optional[SnapshotBaselines] = None,
+    stats: Optional[SnapshotStats] = None,
+) -> Optional[List[Dict[str, object]]]:
+    """Apply `policy` to extracted snapshots; returns the entries to emit, or None when there are none.
+
+    Snapshots of the same object are emitted once, sharing the first extracted entry.
+    """
+    if not updated_objects:
+        return None
+    if not policy.measures and len(updated_objects) == 1:
+        if stats is not None:
+            stats.add(_ONE_EMITTED)
+        return updated_objects
+    if stats is None:
+        return _apply_snapshot_policy(updated_objects, policy, baselines, None)
+    counts = SnapshotStats()
+    kept = _apply_snapshot_policy(updated_objects, policy, baselines, counts)
+    stats.add(counts)
+    return kept
+
+
+def _apply_snapshot_policy(
+    updated_objects: List[Dict[str, object]],
+    policy: SnapshotPolicy,
+    baselines: Optional[SnapshotBaselines],
+    stats: Optional[SnapshotStats],
+) -> Optional[List[Dict[str, object]]]:
+    seen: set[Tuple[str, str]] = set()
+    kept: List[Dict[str, object]] = []
+    budget = policy.max_bytes
+    for entry in updated_objects:
+        object_type = str(entry.get("object_type", ""))
+        object_ref = entry.get("object_ref")
+        key = _object_key(object_type, object_ref)
+        if key in seen:
+            if stats is not None:
+                stats.shared += 1
+                if policy.measures:
+                    stats.bytes_saved += _json_size(entry.get("object"))
+            continue
+        seen.add(key)
+        if not policy.measures:
+            kept.append(entry)
+            if stats is not None:
+                stats.emitted += 1
+            continue
+        snapshot = entry.get("object")
+        full_size = _json_size(snapshot)
+        if policy.mode == "ref_only":
+            if stats is not None:
+                stats.omitted += 1
+                stats.bytes_saved += full_size
+            continue
+        size = full_size
+        if policy.mode == "changed" and baselines is not None and isinstance(snapshot, dict) and isinstance(object_ref, dict):
+            baseline = baselines.get(object_type, object_ref)
+            if baseline is not None:
+                changed = {
+                    name: value
+                    for name, value in snapshot.items()
+                    if name in object_ref or baseline.get(name, _MISSING) != value
+                }
+                if len(changed) == len(object_ref):
+                    if stats is not None:
+                        stats.omitted += 1
+                        stats.bytes_saved += full_size
+                    continue
+                snapshot = changed
+                size = _json_size(snapshot)
+                entry = {"object_type": object_type, "object_ref": object_ref, "object": snapshot}
+                if stats is not None:
+                    stats.diffed += 1
+        if budget is not None:
+            if size > budget:
+                if stats is not None:
+                    stats.dropped += 1
+                    stats.bytes_saved += full_size
+                continue
+            budget -= size
+        kept.append(entry)
+        if stats is not None:
+            stats.emitted += 1
+            stats.bytes_emitted += size
+            stats.bytes_saved += full_size - size
+    return kept or None
+
+
+def with_snapshot_mode(attributes: Optional[Dict[str, str]], policy: SnapshotPolicy) -> Optional[Dict[str, str]]:
+    """Mark `changed`-mode envelopes so consumers merge partial snapshots instead of replacing objects."""
+    if policy.mode != "changed":
+        return attributes
+    marked = dict(attributes or {})
+    marked[SNAPSHOT_MODE_ATTRIBUTE] = "changed"
+    return marked
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from .publisher import EventPublisher
+from .wire import EventWireEnvelope
+
+_LOGGER = logging.getLogger(__name__)
+
+TriggerInvoke = Callable[[List[EventWireEnvelope]], Union[Awaitable[None], None]]
+
+
+@dataclass(frozen=True)
+class TriggerPolicy:
+    batch_size: int = 1
+    linger_ms: float = 0.0
+    max_attempts: int = 3
+    backoff_ms: float = 100.0
+    max_backoff_ms: float = 5000.0
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+
+
+@dataclass(frozen=True)
+class TriggerBinding:
+    """Binds one event type to a callable that runs the triggered action for a batch of envelopes.
+
+    `blocking` invokes run on a worker thread (for sync action services) instead of the loop.
+    """
+
+    name: str
+    event_type: str
+    invoke: TriggerInvoke
+    policy: TriggerPolicy = field(default_factory=TriggerPolicy)
+    blocking: bool = False
+
+
+class TriggerBatchError(RuntimeError):
+    """Raised by a trigger's `invoke` when only some envelopes of its batch failed.
+
+    The dispatcher retries just the listed envelopes; the rest of the batch counts as completed.
+    """
+
+    def __init__(self, failures: Sequence[Tuple[EventWireEnvelope, BaseException]]) -> None:
+        super().__init__(f"{len(failures)} trigger envelope(s) failed")
+        self.failures = list(failures)
+
+
+@dataclass
+class TriggerDispatcherStats:
+    dispatched: int = 0
+    completed: int = 0
+    retried: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+def _log_trigger_failure(binding: TriggerBinding, error: BaseException, envelopes: List[EventWireEnvelope]) -> None:
+    _LOGGER.error(
+        "Trigger %s failed for %d envelope(s) after %d attempt(s)",
+        binding.name,
+        len(envelopes),
+        binding.policy.max_attempts,
+        exc_info=error,
+    )
+
+
+class _TriggerLane:
+    def __init__(self, binding: TriggerBinding, max_queue_size: int) -> None:
+        self.binding = binding
+        self.queue: asyncio.Queue[EventWireEnvelope] = asyncio.Queue(max_queue_size)
+
+
+class TriggerDispatcher:
+    """Runs trigger-bound actions for published envelopes on an in-process asyncio queue.
+
+    Envelopes are routed by `event_type` to every matching binding. Each binding groups
+    its envelopes into batches of up to `policy.batch_size` (waiting up to
+    `policy.linger_ms` for a batch to fill), and at most `concurrency` batches run at
+    once across all bindings. Failed envelopes are retried with exponential backoff up to
+    `policy.max_attempts` and then passed to `on_failure`. An `invoke` that raises
+    `TriggerBatchError` has only the envelopes it lists retried; any other exception retries
+    every envelope still pending in the batch. Delivery is at-least-once.
+
+    The dispatcher lives on the event loop it starts on (explicitly via `start()` or on
+    first publish); publishes from other loops or threads are handed off to that loop.
+    When `downstream` is set, every published envelope is forwarded to it before triggers run.
+    """
+
+    def __init__(
+        self,
+        bindings: Iterable[TriggerBinding],
+        *,
+        concurrency: int = 4,
+        max_queue_size: int = 10000,
+        downstream: Optional[EventPublisher] = None,
+        on_failure: Callable[[TriggerBinding, BaseException, List[EventWireEnvelope]], None] = _log_trigger_failure,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be >= 1")
+        self._bindings = list(bindings)
+        self._event_types = frozenset(binding.event_type for binding in self._bindings)
+        self._concurrency = concurrency
+        self._max_queue_size = max_queue_size
+        self._downstream = downstream
+        self._on_failure = on_failure
+        self._start_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lanes_by_event_type: Dict[str, List[_TriggerLane]] = {}
+        self._collectors: List[asyncio.Task[None]] = []
+        self._running: Set[asyncio.Task[None]] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._unfinished = 0
+        self.stats = TriggerDispatcherStats()
+
+    def __len__(self) -> int:
+        return self._unfinished
+
+    @property
+    def bindings(self) -> List[TriggerBinding]:
+        return list(self._bindings)
+
+    async def start(self) -> None:
+        self._start_on(asyncio.get_running_loop())
+
+    async def publish(self, envelope: EventWireEnvelope) -> None:
+        await self.publish_batch([envelope])
+
+    async def publish_batch(self, envelopes: Iterable[EventWireEnvelope]) -> None:
+        batch = list(envelopes)
+        if self._downstream is not None:
+            await self._downstream.publish_batch(batch)
+        if any(envelope.event_type in self._event_types for envelope in batch):
+            await self._on_own_loop(self._enqueue, batch)
+
+    async def drain(self) -> None:
+        """Wait until every dispatched envelope, including ones published by triggered actions, is handled."""
+        if self._loop is not None:
+            await self._on_own_loop(self._wait_idle)
+
+    async def stop(self, timeout: Optional[float] = None) -> bool:
+        """Drain (up to `timeout` seconds), then cancel the dispatcher's tasks; returns whether it drained."""
+        if self._loop is None:
+            return True
+        return bool(await self._on_own_loop(self._shutdown, timeout))
+
+    def _start_on(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            self._slots = asyncio.Semaphore(self._concurrency)
+            self._idle = asyncio.Event()
+            self._idle.set()
+            lanes_by_event_type: Dict[str, List[_TriggerLane]] = {}
+            for binding in self._bindings:
+                lane = _TriggerLane(binding, self._max_queue_size)
+                lanes_by_event_type.setdefault(binding.event_type, []).append(lane)
+                self._collectors.append(loop.create_task(self._collect(lane), name=f"prophet-trigger-{binding.name}"))
+            self._lanes_by_event_type = lanes_by_event_type
+            self._loop = loop
+
+    async def _on_own_loop(self, fn: Callable[..., Awaitable[object]], *args: object) -> object:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._start_on(loop)
+        if loop is self._loop:
+            return await fn(*args)
+        assert self._loop is not None
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(fn(*args), self._loop))
+
+    async def _enqueue(self, envelopes: List[EventWireEnvelope]) -> None:
+        assert self._idle is not None
+        for envelope in envelopes:
+            for lane in self._lanes_by_event_type.get(envelope.event_type, ()):
+                self._unfinished += 1
+                self._idle.clear()
+                self.stats.dispatched += 1
+                await lane.queue.put(envelope)
+
+    async def _wait_idle(self) -> None:
+        assert self._idle is not None
+        await self._idle.wait()
+
+    async def _shutdown(self, timeout: Optional[float]) -> bool:
+        drained = True
+        try:
+            await asyncio.wait_for(self._wait_idle(), timeout)
+        except asyncio.TimeoutError:
+            drained = False
+        tasks = [*self._collectors, *self._running]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        with self._start_lock:
+            self._collectors.clear()
+            self._lanes_by_event_type = {}
+            self._unfinished = 0
+            self._loop = None
+        return drained
+
+    async def _collect(self, lane: _TriggerLane) -> None:
+        assert self._slots is not None
+        policy = lane.binding.policy
+        while True:
+            batch = [await lane.queue.get()]
+            if policy.batch_size > 1 and policy.linger_ms > 0 and lane.queue.qsize() < policy.batch_size - 1:
+                await asyncio.sleep(policy.linger_ms / 1000.0)
+            while len(batch) < policy.batch_size and not lane.queue.empty():
+                batch.append(lane.queue.get_nowait())
+            await self._slots.acquire()
+            task = asyncio.get_running_loop().create_task(self._run(lane.binding, batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, binding: TriggerBinding, batch: List[EventWireEnvelope]) -> None:
+        assert self._slots is not None and self._idle is not None
+        policy = binding.policy
+        self.stats.batches += 1
+        pending = batch
+        try:
+            for attempt in range(1, policy.max_attempts + 1):
+                try:
+                    if binding.blocking:
+                        await asyncio.to_thread(binding.invoke, pending)
+                    else:
+                        await binding.invoke(pending)  # type: ignore[misc]
+                except TriggerBatchError as error:
+                    failures = error.failures
+                except Exception as error:
+                    failures = [(envelope, error) for envelope in pending]
+                else:
+                    failures = []
+                failed_ids = {id(envelope) for envelope, _ in failures}
+                self.stats.completed += sum(1 for envelope in pending if id(envelope) not in failed_ids)
+                if not failures:
+                    return
+                if attempt == policy.max_attempts:
+                    self.stats.failed += len(failures)
+                    self._report_failures(binding, failures)
+                    return
+                pending = [envelope for envelope in pending if id(envelope) in failed_ids]
+                self.stats.retried += 1
+                await asyncio.sleep(min(policy.backoff_ms * 2 ** (attempt - 1), policy.max_backoff_ms) / 1000.0)
+        finally:
+            self._slots.release()
+            self._unfinished -= len(batch)
+            if self._unfinished == 0:
+                self._idle.set()
+
+    def _report_failures(self, binding: TriggerBinding, failures: List[Tuple[EventWireEnvelope, BaseException]]) -> None:
+        # Envelopes that failed with the same exception are reported together.
+        grouped: Dict[int, Tuple[BaseException, List[EventWireEnvelope]]] = {}
+        for envelope, error in failures:
+            grouped.setdefault(id(error), (error, []))[1].append(envelope)
+        for error, envelopes in grouped.values():
+            self._report_failure(binding, error, envelopes)
+
+    def _report_failure(self, binding: TriggerBinding, error: BaseException, batch: List[EventWireEnvelope]) -> None:
+        try:
+            self._on_failure(binding, error, batch)
+        except Exception:
+            _LOGGER.exception("Trigger failure handler raised for %s", binding.name)
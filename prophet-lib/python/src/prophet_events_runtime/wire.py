@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EventWireEnvelope:
     event_id: str
     trace_id: str
@@ -1,14 +1,121 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import re
+import threading
+import time
 import unittest
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
 
+import prophet_events_runtime
+
+from prophet_events_runtime import BufferedEventPublisher
+from prophet_events_runtime import DedupWindow
+from prophet_events_runtime import EventBufferFullError
+from prophet_events_runtime import EventCodecError
+from prophet_events_runtime import EventCodecSchema
+from prophet_events_runtime import EventConsumer
 from prophet_events_runtime import EventWireEnvelope
+from prophet_events_runtime import InMemoryEventBroker
+from prophet_events_runtime import InMemoryOutboxStore
+from prophet_events_runtime import JSON_BACKEND
 from prophet_events_runtime import NoOpEventPublisher
+from prophet_events_runtime import OutboxEventPublisher
+from prophet_events_runtime import OutboxRelay
+from prophet_events_runtime import SnapshotBaselines
+from prophet_events_runtime import SnapshotPolicy
+from prophet_events_runtime import SnapshotStats
 from prophet_events_runtime import TransitionValidationResult
+from prophet_events_runtime import TriggerBatchError
+from prophet_events_runtime import TriggerBinding
+from prophet_events_runtime import TriggerDispatcher
+from prophet_events_runtime import TriggerPolicy
+from prophet_events_runtime import apply_snapshot_policy
 from prophet_events_runtime import create_event_id
+from prophet_events_runtime import decode_envelope
+from prophet_events_runtime import dumps_json_bytes
+from prophet_events_runtime import encode_envelope
+from prophet_events_runtime import envelope_from_json
+from prophet_events_runtime import envelope_to_json
 from prophet_events_runtime import now_iso
 from prophet_events_runtime import publish_batch_sync
 from prophet_events_runtime import publish_sync
+from prophet_events_runtime import shutdown_publish_loop
+from prophet_events_runtime import with_snapshot_mode
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _envelope(event_id: str) -> EventWireEnvelope:
+    return EventWireEnvelope(
+        event_id=event_id,
+        trace_id="trace-1",
+        event_type="Example",
+        schema_version="1.0.0",
+        occurred_at=now_iso(),
+        source="tests",
+        payload={"orderId": "ord-1"},
+    )
+
+
+async def _call_sync_helper_inside_loop(publisher: object) -> None:
+    publish_sync(publisher, _envelope("evt-x"))  # type: ignore[arg-type]
+
+
+CODEC_VECTOR_HEX = (
+    "9a01c4100190a6b45c2e7cc18e4f6b1a2d3c4e5fa774726163652d31ac4f7264657253686970706564a5312e302e30"
+    "cf00061c2e562ee090a66f726465727383cdcd0fa56f72642d31cdd194a3757073a87765696768744b67cb3ff8000000000000c0c0"
+)
+
+
+def _codec_schema() -> EventCodecSchema:
+    return EventCodecSchema.from_dict(
+        {
+            "codec_version": 1,
+            "schema_version": "1.0.0",
+            "events": [
+                {
+                    "event_type": "OrderShipped",
+                    "fields": [
+                        {"tag": 52495, "name": "orderId", "field_id": "evt_order_shipped__order_id"},
+                        {"tag": 53652, "name": "carrier", "field_id": "evt_order_shipped__carrier"},
+                    ],
+                }
+            ],
+        }
+    )
+
+
+class RecordingPublisher:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.batches: list = []
+
+    async def publish(self, envelope: EventWireEnvelope) -> None:
+        await self.publish_batch([envelope])
+
+    async def publish_batch(self, envelopes) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker unavailable")
+        self.batches.append([envelope.event_id for envelope in envelopes])
+
+
+class GatedPublisher(RecordingPublisher):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = threading.Event()
+
+    async def publish_batch(self, envelopes) -> None:
+        await asyncio.to_thread(self.gate.wait)
+        await super().publish_batch(envelopes)
 
 
 class RuntimeTests(unittest.TestCase):
@@ -16,10 +123,49 @@ class RuntimeTests(unittest.TestCase):
         value = create_event_id()
         self.assertTrue(value)
 
+    def test_create_event_id_is_time_ordered_uuid7(self) -> None:
+        before_ms = time.time_ns() // 1_000_000
+        values = [create_event_id() for _ in range(2000)]
+        parsed = uuid.UUID(values[0])
+        self.assertEqual(parsed.version, 7)
+        self.assertEqual(parsed.variant, uuid.RFC_4122)
+        self.assertEqual(str(parsed), values[0])
+        self.assertGreaterEqual(parsed.int >> 80, before_ms)
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(len(set(values)), len(values))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_create_event_id_does_not_share_entropy_with_forked_child(self) -> None:
+        create_event_id()
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_end, create_event_id()[-8:].encode())
+            os._exit(0)
+        os.close(write_end)
+        parent_tail = create_event_id()[-8:]
+        os.waitpid(pid, 0)
+        with os.fdopen(read_end) as pipe:
+            self.assertNotEqual(parent_tail, pipe.read())
+
     def test_now_iso(self) -> None:
         value = now_iso()
         self.assertIn("T", value)
 
+    def test_now_iso_matches_datetime_clock(self) -> None:
+        before = datetime.now(timezone.utc)
+        value = datetime.fromisoformat(now_iso())
+        after = datetime.now(timezone.utc)
+        self.assertRegex(now_iso(), r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}\+00:00$")
+        self.assertLessEqual(before, value)
+        self.assertLessEqual(value, after)
+
+    def test_envelope_is_slotted(self) -> None:
+        envelope = _envelope("evt-1")
+        self.assertFalse(hasattr(envelope, "__dict__"))
+        with self.assertRaises(AttributeError):
+            envelope.extra = True  # type: ignore[attr-defined]
+
     def test_sync_helpers(self) -> None:
         publisher = NoOpEventPublisher()
         envelope = EventWireEnvelope(
@@ -41,6 +187,465 @@ class RuntimeTests(unittest.TestCase):
         publish_sync(publisher, envelope)
         publish_batch_sync(publisher, [envelope])
 
+    def test_sync_helpers_reuse_one_background_loop(self) -> None:
+        class LoopRecordingPublisher:
+            def __init__(self) -> None:
+                self.loops: list = []
+
+            async def publish(self, envelope: EventWireEnvelope) -> None:
+                self.loops.append(asyncio.get_running_loop())
+
+            async def publish_batch(self, envelopes) -> None:
+                self.loops.append(asyncio.get_running_loop())
+
+        publisher = LoopRecordingPublisher()
+        publish_sync(publisher, _envelope("evt-1"))
+        publish_batch_sync(publisher, [_envelope("evt-2")])
+        publish_sync(publisher, _envelope("evt-3"))
+        self.assertEqual(3, len(publisher.loops))
+        self.assertEqual(1, len({id(loop) for loop in publisher.loops}))
+
+        shutdown_publish_loop(timeout=5)
+        publish_sync(publisher, _envelope("evt-4"))
+        self.assertIsNot(publisher.loops[0], publisher.loops[-1])
+        with self.assertRaises(RuntimeError):
+            asyncio.run(_call_sync_helper_inside_loop(publisher))
+
+    def test_compact_codec_matches_spec_vector(self) -> None:
+        envelope = EventWireEnvelope(
+            event_id="0190a6b4-5c2e-7cc1-8e4f-6b1a2d3c4e5f",
+            trace_id="trace-1",
+            event_type="OrderShipped",
+            schema_version="1.0.0",
+            occurred_at="2024-07-01T12:00:00.250000Z",
+            source="orders",
+            payload={"orderId": "ord-1", "carrier": "ups", "weightKg": 1.5},
+        )
+        encoded = encode_envelope(envelope, _codec_schema())
+        self.assertEqual(CODEC_VECTOR_HEX, encoded.hex())
+        self.assertEqual(envelope, decode_envelope(encoded, _codec_schema()))
+        with self.assertRaises(EventCodecError):
+            decode_envelope(encoded)
+        with self.assertRaises(EventCodecError):
+            EventCodecSchema("1.0.0", {"OrderShipped": {65536: "orderId"}})
+
+    def test_compact_codec_round_trips_without_schema(self) -> None:
+        envelope = _envelope(create_event_id())
+        envelope.occurred_at = "2024-07-01T14:00:00.5+02:00"
+        envelope.attributes = {"tenant": "t-1"}
+        envelope.payload = {"items": [1, -40, 70000, 2**40, None, True, {"sku": "a" * 40}], "price": "12.50"}
+        envelope.updated_objects = [
+            {"object_type": "Order", "object_ref": {"orderId": "ord-1"}, "object": {"orderId": "ord-1"}}
+        ]
+        decoded = decode_envelope(encode_envelope(envelope))
+        self.assertEqual("2024-07-01T12:00:00.500000Z", decoded.occurred_at)
+        decoded.occurred_at = envelope.occurred_at
+        self.assertEqual(envelope, decoded)
+
+        envelope.occurred_at = "not-a-timestamp"
+        self.assertEqual("not-a-timestamp", decode_envelope(encode_envelope(envelope)).occurred_at)
+
+    def test_outbox_publisher_appends_without_event_loop(self) -> None:
+        store = InMemoryOutboxStore()
+        publisher = OutboxEventPublisher(store)
+        publish_batch_sync(publisher, [_envelope("evt-1"), _envelope("evt-2")])
+        publish_sync(publisher, _envelope("evt-1"))
+        asyncio.run(publisher.publish(_envelope("evt-3")))
+        self.assertEqual(3, len(store))
+
+    def test_outbox_relay_drains_in_batches_at_least_once(self) -> None:
+        store = InMemoryOutboxStore()
+        store.append([_envelope(f"evt-{index}") for index in range(5)])
+        broker = RecordingPublisher(failures=1)
+        relay = OutboxRelay(store, broker, batch_size=2)
+
+        with self.assertRaises(ConnectionError):
+            asyncio.run(relay.drain())
+        self.assertEqual(5, len(store))
+        self.assertEqual(1, store.claim_batch(1)[0].attempts)
+
+        self.assertEqual(5, asyncio.run(relay.drain()))
+        self.assertEqual([["evt-0", "evt-1"], ["evt-2", "evt-3"], ["evt-4"]], broker.batches)
+        self.assertEqual(0, len(store))
+
+    def test_outbox_relay_parks_records_after_max_attempts(self) -> None:
+        store = InMemoryOutboxStore()
+        store.append([_envelope("evt-0"), _envelope("evt-1")])
+        broker = RecordingPublisher(failures=2)
+        relay = OutboxRelay(store, broker, batch_size=1, max_attempts=2)
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                asyncio.run(relay.drain())
+        self.assertEqual(["evt-0"], list(store.parked))
+        self.assertEqual(2, store.parked["evt-0"].attempts)
+        self.assertEqual(["evt-1"], [record.event_id for record in store.claim_batch(10)])
+
+        self.assertEqual(1, asyncio.run(relay.drain()))
+        self.assertEqual(["evt-1"], [envelope.event_id for envelope in store.published])
+        self.assertEqual(0, len(store))
+
+    def test_outbox_envelope_json_round_trip(self) -> None:
+        envelope = _envelope("evt-1")
+        self.assertEqual(envelope, envelope_from_json(envelope_to_json(envelope)))
+
+    def test_buffered_publisher_coalesces_concurrent_publishes(self) -> None:
+        broker = RecordingPublisher()
+        publisher = BufferedEventPublisher(broker, max_batch_size=4, linger_ms=200.0)
+
+        async def publish_concurrently() -> None:
+            await asyncio.gather(*(publisher.publish(_envelope(f"evt-{index}")) for index in range(6)))
+
+        asyncio.run(publish_concurrently())
+        publish_batch_sync(publisher, [_envelope("evt-6")])
+        self.assertTrue(publisher.close_sync(timeout=5.0))
+        self.assertEqual([4, 3], [len(batch) for batch in broker.batches])
+        self.assertEqual(7, publisher.stats.published)
+        with self.assertRaises(RuntimeError):
+            publisher.publish_sync(_envelope("evt-7"))
+
+    def test_buffered_publisher_stats_are_exact_under_threaded_publishes(self) -> None:
+        delivered: list = []
+
+        class SyncBroker(RecordingPublisher):
+            def publish_batch_sync(self, envelopes) -> None:
+                delivered.extend(envelopes)
+
+        publisher = BufferedEventPublisher(SyncBroker(), max_batch_size=8, linger_ms=0.0)
+
+        def publish_many(worker: int) -> None:
+            for index in range(250):
+                publisher.publish_sync(_envelope(f"evt-{worker}-{index}"))
+
+        threads = [threading.Thread(target=publish_many, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(publisher.close_sync(timeout=5.0))
+        self.assertEqual(2000, len(delivered))
+        self.assertEqual(2000, publisher.stats.enqueued)
+        self.assertEqual(2000, publisher.stats.published)
+        self.assertEqual(0, publisher.stats.failed)
+
+    def test_buffered_publisher_overflow_policies(self) -> None:
+        broker = GatedPublisher()
+        publisher = BufferedEventPublisher(broker, max_batch_size=1, linger_ms=0.0, max_queue_size=2, overflow="drop_oldest")
+        publisher.publish_sync(_envelope("evt-0"))
+        while len(publisher):
+            pass
+        for index in range(1, 5):
+            publisher.publish_sync(_envelope(f"evt-{index}"))
+        self.assertEqual(2, publisher.stats.dropped)
+        broker.gate.set()
+        self.assertTrue(publisher.close_sync(timeout=5.0))
+        self.assertEqual([["evt-0"], ["evt-3"], ["evt-4"]], broker.batches)
+
+        gated = GatedPublisher()
+        rejecting = BufferedEventPublisher(gated, max_batch_size=1, max_queue_size=1, overflow="raise")
+        rejecting.publish_sync(_envelope("evt-0"))
+        while len(rejecting):
+            pass
+        rejecting.publish_sync(_envelope("evt-1"))
+        with self.assertRaises(EventBufferFullError):
+            rejecting.publish_sync(_envelope("evt-2"))
+        self.assertFalse(rejecting.flush_sync(timeout=0.05))
+        gated.gate.set()
+        self.assertTrue(rejecting.close_sync(timeout=5.0))
+
+    def test_buffered_publisher_flushes_async_publishers_on_calling_loop(self) -> None:
+        class LoopRecordingPublisher(RecordingPublisher):
+            async def publish_batch(self, envelopes) -> None:
+                self.loop = asyncio.get_running_loop()
+                await super().publish_batch(envelopes)
+
+        broker = LoopRecordingPublisher()
+        publisher = BufferedEventPublisher(broker, max_batch_size=2, linger_ms=50.0)
+
+        async def publish_and_flush() -> asyncio.AbstractEventLoop:
+            await publisher.publish_batch([_envelope(f"evt-{index}") for index in range(3)])
+            self.assertTrue(await publisher.flush(timeout=5.0))
+            self.assertTrue(await publisher.close(timeout=5.0))
+            return asyncio.get_running_loop()
+
+        self.assertIs(asyncio.run(publish_and_flush()), broker.loop)
+        self.assertEqual([["evt-0", "evt-1"], ["evt-2"]], broker.batches)
+        self.assertNotIn("prophet-event-buffer", [thread.name for thread in threading.enumerate()])
+
+    def test_buffered_publisher_rejects_whole_batch_when_full(self) -> None:
+        gated = GatedPublisher()
+        publisher = BufferedEventPublisher(gated, max_batch_size=1, max_queue_size=2, overflow="raise")
+        publisher.publish_sync(_envelope("evt-0"))
+        while len(publisher):
+            pass
+        publisher.publish_sync(_envelope("evt-1"))
+        with self.assertRaises(EventBufferFullError):
+            publisher.publish_batch_sync([_envelope("evt-2"), _envelope("evt-3")])
+        self.assertEqual(1, len(publisher))
+        self.assertEqual(2, publisher.stats.enqueued)
+        gated.gate.set()
+        self.assertTrue(publisher.close_sync(timeout=5.0))
+        self.assertEqual([["evt-0"], ["evt-1"]], gated.batches)
+
+    def test_buffered_publisher_reports_failed_batches(self) -> None:
+        failures: list = []
+        publisher = BufferedEventPublisher(
+            RecordingPublisher(failures=1),
+            linger_ms=0.0,
+            on_error=lambda error, envelopes: failures.append((type(error), len(envelopes))),
+        )
+        publisher.publish_batch_sync([_envelope("evt-0"), _envelope("evt-1")])
+        self.assertTrue(publisher.flush_sync(timeout=5.0))
+        self.assertEqual([(ConnectionError, 2)], failures)
+        self.assertEqual(2, publisher.stats.failed)
+        self.assertTrue(asyncio.run(publisher.close()))
+
+    def test_trigger_dispatcher_batches_retries_and_chains(self) -> None:
+        broker = RecordingPublisher()
+        handled: list = []
+        chained: list = []
+        failures = [1]
+        dispatcher: TriggerDispatcher
+
+        async def on_example(envelopes) -> None:
+            if failures[0]:
+                failures[0] -= 1
+                raise ConnectionError("handler unavailable")
+            handled.append([envelope.event_id for envelope in envelopes])
+            for envelope in envelopes:
+                follow_up = _envelope(f"{envelope.event_id}-next")
+                follow_up.event_type = "Chained"
+                await dispatcher.publish(follow_up)
+
+        def on_chained(envelopes) -> None:
+            chained.extend(envelope.event_id for envelope in envelopes)
+
+        dispatcher = TriggerDispatcher(
+            [
+                TriggerBinding(
+                    name="onExample",
+                    event_type="Example",
+                    invoke=on_example,
+                    policy=TriggerPolicy(batch_size=3, linger_ms=50.0, backoff_ms=1.0),
+                ),
+                TriggerBinding(name="onChained", event_type="Chained", invoke=on_chained, blocking=True),
+            ],
+            concurrency=2,
+            downstream=broker,
+        )
+
+        async def run() -> bool:
+            await dispatcher.publish_batch([_envelope(f"evt-{index}") for index in range(3)])
+            await dispatcher.publish(_envelope("evt-3"))
+            await dispatcher.drain()
+            return await dispatcher.stop(timeout=5.0)
+
+        self.assertTrue(asyncio.run(run()))
+        self.assertEqual([["evt-0", "evt-1", "evt-2"], ["evt-3"]], handled)
+        self.assertEqual(["evt-0-next", "evt-1-next", "evt-2-next", "evt-3-next"], sorted(chained))
+        self.assertEqual(8, sum(len(batch) for batch in broker.batches))
+        self.assertEqual(1, dispatcher.stats.retried)
+        self.assertEqual(8, dispatcher.stats.completed)
+
+    def test_trigger_dispatcher_reports_exhausted_retries_and_accepts_sync_publishes(self) -> None:
+        failures: list = []
+
+        async def always_fails(envelopes) -> None:
+            raise ValueError("bad input")
+
+        dispatcher = TriggerDispatcher(
+            [TriggerBinding(name="onExample", event_type="Example", invoke=always_fails, policy=TriggerPolicy(max_attempts=2, backoff_ms=1.0))],
+            on_failure=lambda binding, error, envelopes: failures.append((binding.name, type(error), len(envelopes))),
+        )
+        publish_sync(dispatcher, _envelope("evt-0"))
+
+        async def drain_from_another_loop() -> bool:
+            await dispatcher.drain()
+            return await dispatcher.stop()
+
+        self.assertTrue(asyncio.run(drain_from_another_loop()))
+        self.assertEqual([("onExample", ValueError, 1)], failures)
+        self.assertEqual(1, dispatcher.stats.failed)
+
+    def test_trigger_dispatcher_retries_only_failed_envelopes(self) -> None:
+        attempts: dict = {}
+        failures: list = []
+
+        def on_example(envelopes) -> None:
+            failed = []
+            for envelope in envelopes:
+                attempts[envelope.event_id] = attempts.get(envelope.event_id, 0) + 1
+                if envelope.event_id == "evt-1" or (envelope.event_id == "evt-2" and attempts["evt-2"] == 1):
+                    failed.append((envelope, ValueError(envelope.event_id)))
+            if failed:
+                raise TriggerBatchError(failed)
+
+        dispatcher = TriggerDispatcher(
+            [
+                TriggerBinding(
+                    name="onExample",
+                    event_type="Example",
+                    invoke=on_example,
+                    policy=TriggerPolicy(batch_size=3, linger_ms=50.0, max_attempts=3, backoff_ms=1.0),
+                    blocking=True,
+                )
+            ],
+            on_failure=lambda binding, error, envelopes: failures.append((str(error), [envelope.event_id for envelope in envelopes])),
+        )
+
+        async def run() -> bool:
+            await dispatcher.publish_batch([_envelope(f"evt-{index}") for index in range(3)])
+            await dispatcher.drain()
+            return await dispatcher.stop(timeout=5.0)
+
+        self.assertTrue(asyncio.run(run()))
+        self.assertEqual({"evt-0": 1, "evt-1": 3, "evt-2": 2}, attempts)
+        self.assertEqual([("evt-1", ["evt-1"])], failures)
+        self.assertEqual(2, dispatcher.stats.completed)
+        self.assertEqual(1, dispatcher.stats.failed)
+        self.assertEqual(2, dispatcher.stats.retried)
+
+    def test_event_consumer_orders_per_aggregate_and_bounds_concurrency(self) -> None:
+        running = [0, 0]
+        handled: list = []
+        failures: list = []
+        attempts: dict = {}
+
+        async def on_example(event, envelope) -> None:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+            await asyncio.sleep(0.01 if envelope.payload["seq"] == 0 else 0)
+            running[0] -= 1
+            attempts[envelope.event_id] = attempts.get(envelope.event_id, 0) + 1
+            if envelope.event_id == "evt-b1" and attempts[envelope.event_id] == 1:
+                raise ValueError("transient")
+            handled.append((envelope.payload["orderId"], envelope.payload["seq"]))
+
+        consumer = EventConsumer(
+            concurrency=2,
+            ordering_key=lambda envelope: str(envelope.payload["orderId"]),
+            on_error=lambda error, envelope: failures.append(envelope.event_id),
+            clock=lambda: 4102444800.0,
+        )
+        consumer.on("Example", on_example)
+        broker = InMemoryEventBroker()
+        broker.subscribe(consumer)
+
+        def envelope(order_id: str, seq: int) -> EventWireEnvelope:
+            value = _envelope(f"evt-{order_id}{seq}")
+            value.payload = {"orderId": order_id, "seq": seq}
+            value.occurred_at = "2099-12-31T23:59:59.000000+00:00"
+            return value
+
+        async def run() -> None:
+            await broker.publish_batch([envelope(order_id, seq) for seq in range(3) for order_id in ("a", "b", "c")])
+            unrouted = envelope("a", 5)
+            unrouted.event_type = "Other"
+            await broker.publish_batch([envelope("a", 0), unrouted])
+            await consumer.drain()
+            await broker.redeliver()
+            await consumer.drain()
+
+        asyncio.run(run())
+        for order_id in ("a", "c"):
+            self.assertEqual([0, 1, 2], [seq for key, seq in handled if key == order_id])
+        self.assertEqual([0, 2, 1], [seq for key, seq in handled if key == "b"])
+        self.assertEqual(9, len(handled))
+        self.assertEqual(["evt-b1"], failures)
+        self.assertEqual(2, attempts["evt-b1"])
+        self.assertLessEqual(running[1], 2)
+        self.assertEqual(1, consumer.stats.failed)
+        self.assertEqual(9, consumer.stats.handled)
+        self.assertEqual(10, consumer.stats.duplicates)
+        self.assertEqual(2, consumer.stats.unrouted)
+        self.assertEqual(1000.0, consumer.stats.max_lag_ms)
+
+    def test_dedup_window_evicts_least_recently_seen(self) -> None:
+        window = DedupWindow(capacity=2)
+        self.assertFalse(window.check_and_add("evt-1"))
+        self.assertFalse(window.check_and_add("evt-2"))
+        self.assertTrue(window.check_and_add("evt-1"))
+        self.assertFalse(window.check_and_add("evt-3"))
+        self.assertNotIn("evt-2", window)
+        self.assertIn("evt-1", window)
+
+    def test_snapshot_policy_shares_diffs_omits_and_caps_snapshots(self) -> None:
+        def snapshots() -> list[dict[str, object]]:
+            order = {"orderId": "o-1", "state": "approved", "lines": ["x" * 40]}
+            return [
+                {"object_type": "Order", "object_ref": {"orderId": "o-1"}, "object": order},
+                {"object_type": "Order", "object_ref": {"orderId": "o-1"}, "object": dict(order)},
+                {"object_type": "User", "object_ref": {"userId": "u-1"}, "object": {"userId": "u-1", "name": "Ada"}},
+            ]
+
+        stats = SnapshotStats()
+        full = apply_snapshot_policy(snapshots(), SnapshotPolicy(), stats=stats)
+        self.assertEqual(["Order", "User"], [item["object_type"] for item in full or []])
+        self.assertEqual(1, stats.shared)
+        self.assertIsNone(apply_snapshot_policy(snapshots(), SnapshotPolicy(mode="ref_only")))
+
+        baselines = SnapshotBaselines()
+        baselines.record("Order", {"orderId": "o-1"}, {"orderId": "o-1", "state": "created", "lines": ["x" * 40]})
+        baselines.record("User", {"userId": "u-1"}, {"userId": "u-1", "name": "Ada"})
+        stats = SnapshotStats()
+        changed = apply_snapshot_policy(snapshots(), SnapshotPolicy(mode="changed"), baselines=baselines, stats=stats)
+        self.assertEqual([{"orderId": "o-1", "state": "approved"}], [item["object"] for item in changed or []])
+        self.assertEqual((1, 1, 1), (stats.diffed, stats.omitted, stats.emitted))
+        self.assertGreater(stats.bytes_saved, stats.bytes_emitted)
+
+        stats = SnapshotStats()
+        capped = apply_snapshot_policy(snapshots(), SnapshotPolicy(max_bytes=40), stats=stats)
+        self.assertEqual(["User"], [item["object_type"] for item in capped or []])
+        self.assertEqual(1, stats.dropped)
+        self.assertEqual(stats.bytes_emitted, len('{"userId":"u-1","name":"Ada"}'))
+
+        shared_stats = SnapshotStats()
+
+        def apply_many() -> None:
+            for _ in range(200):
+                apply_snapshot_policy(snapshots(), SnapshotPolicy(), stats=shared_stats)
+
+        workers = [threading.Thread(target=apply_many) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual((1600, 800), (shared_stats.emitted, shared_stats.shared))
+
+        self.assertEqual({"k": "v"}, with_snapshot_mode({"k": "v"}, SnapshotPolicy()))
+        self.assertEqual(
+            {"k": "v", "prophet.snapshot_mode": "changed"},
+            with_snapshot_mode({"k": "v"}, SnapshotPolicy(mode="changed")),
+        )
+        with self.assertRaises(ValueError):
+            SnapshotPolicy(mode="partial")
+
+    def test_dumps_json_bytes_encodes_compact_utf8_on_any_backend(self) -> None:
+        @dataclass
+        class Line:
+            sku: str
+            qty: int
+
+        encoded = dumps_json_bytes(
+            {
+                "name": "caf\u00e9",
+                "amount": Decimal("12.5"),
+                "day": date(2024, 7, 1),
+                "line": Line(sku="a", qty=2),
+                "tags": ["x", None],
+            }
+        )
+        self.assertIn(JSON_BACKEND, ("orjson", "msgspec", "json"))
+        self.assertIsInstance(encoded, bytes)
+        self.assertNotIn(b": ", encoded)
+        self.assertIn("caf\u00e9".encode("utf-8"), encoded)
+        self.assertEqual(
+            {"name": "caf\u00e9", "amount": 12.5, "day": "2024-07-01", "line": {"sku": "a", "qty": 2}, "tags": ["x", None]},
+            json.loads(encoded),
+        )
+        with self.assertRaises(TypeError):
+            dumps_json_bytes({"value": object()})
+
     def test_transition_validation_result_helpers(self) -> None:
         passed = TransitionValidationResult.passed()
         self.assertTrue(passed.passesValidation)
@@ -51,5 +656,24 @@ class RuntimeTests(unittest.TestCase):
         self.assertEqual("blocked", failed.failureReason)
 
 
+    def test_public_api_matches_the_manifest_for_the_package_version(self) -> None:
+        pyproject_text = (PACKAGE_ROOT / "pyproject.toml").read_text(encoding="utf-8")
+        version_match = re.search(r'^version\s*=\s*"([^"]+)"\s*$', pyproject_text, re.MULTILINE)
+        self.assertIsNotNone(version_match, "Unable to find [project].version in pyproject.toml")
+        version = version_match.group(1)  # type: ignore[union-attr]
+        manifest = json.loads((PACKAGE_ROOT / "public-api.json").read_text(encoding="utf-8"))
+
+        self.assertIn(version, manifest, "public-api.json needs an entry for the package version")
+        self.assertEqual(
+            sorted(manifest[version]),
+            sorted(prophet_events_runtime.__all__),
+            "runtime public API changed: bump the runtime version and record the new API in public-api.json",
+        )
+        for name in prophet_events_runtime.__all__:
+            self.assertTrue(hasattr(prophet_events_runtime, name), name)
+        released = [manifest[key] for key in manifest if key != version]
+        for names in released:
+            self.assertFalse(set(names) - set(manifest[version]), "released runtime API names must not be removed")
+
 if __name__ == "__main__":
     unittest.main()